@@ -0,0 +1,30 @@
+"""add wdk_fingerprint to stream_projections
+
+Revision ID: c6d4e5f7a8b9
+Revises: b4e2f3a5d6c7
+Create Date: 2026-10-18 00:00:00.000000
+
+Adds wdk_fingerprint column holding a hash of the WDK list summary last
+applied to the projection, so sync-wdk only rewrites strategies that changed.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "c6d4e5f7a8b9"
+down_revision: str | Sequence[str] | None = "b4e2f3a5d6c7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "stream_projections",
+        sa.Column("wdk_fingerprint", sa.String(40), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("stream_projections", "wdk_fingerprint")
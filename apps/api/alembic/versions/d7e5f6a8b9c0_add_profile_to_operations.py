@@ -0,0 +1,28 @@
+"""add profile to operations
+
+Revision ID: d7e5f6a8b9c0
+Revises: c6d4e5f7a8b9
+Create Date: 2026-10-18 00:00:00.000000
+
+Adds a nullable JSON profile column holding the call counts and latencies
+(per WDK endpoint, model, store and experiment phase) captured when an
+operation finished.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d7e5f6a8b9c0"
+down_revision: str | Sequence[str] | None = "c6d4e5f7a8b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("operations", sa.Column("profile", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("operations", "profile")
@@ -0,0 +1,87 @@
+"""store JSON documents as JSONB and index the filtered keys
+
+Revision ID: e8f6a7b9c0d1
+Revises: d7e5f6a8b9c0
+Create Date: 2026-10-18 00:00:00.000000
+
+Converts every JSON column to JSONB so documents can be updated in place
+(``jsonb_set``) and filtered in SQL, then adds the indexes those filters
+use: GIN on control set tags, (user_id, status) on experiments and an
+expression index on the experiment config's searchName.
+
+JSONB does not preserve object key order (keys are stored sorted by
+length, then bytes) or duplicate keys.  After this migration, documents
+such as ``plan`` and gene set ``parameters`` read back with their keys
+reordered.  Code that hashes these documents already sorts keys first;
+places that display them as JSON (such as @-mention context) will show
+keys in the new order.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "e8f6a7b9c0d1"
+down_revision: str | Sequence[str] | None = "d7e5f6a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, server default) for every JSON column.
+_JSON_COLUMNS: tuple[tuple[str, str, str | None], ...] = (
+    ("control_sets", "positive_ids", "[]"),
+    ("control_sets", "negative_ids", "[]"),
+    ("control_sets", "tags", "[]"),
+    ("experiments", "data", "{}"),
+    ("stream_projections", "plan", "{}"),
+    ("stream_projections", "steps", "[]"),
+    ("gene_sets", "gene_ids", "[]"),
+    ("gene_sets", "parameters", None),
+    ("gene_sets", "parent_set_ids", "[]"),
+    ("operations", "profile", None),
+)
+
+
+def _convert(type_: sa.types.TypeEngine[object], cast: str) -> None:
+    # The old default can't be cast along with the column, so drop it first.
+    for table, column, default in _JSON_COLUMNS:
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=type_,
+            postgresql_using=f"{column}::{cast}",
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
+
+
+def upgrade() -> None:
+    _convert(postgresql.JSONB(), "jsonb")
+
+    op.create_index(
+        "ix_control_sets_tags",
+        "control_sets",
+        ["tags"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_experiments_user_status",
+        "experiments",
+        ["user_id", "status"],
+    )
+    op.create_index(
+        "ix_experiments_search_name",
+        "experiments",
+        [sa.text("(data -> 'config' ->> 'searchName')")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_experiments_search_name", table_name="experiments")
+    op.drop_index("ix_experiments_user_status", table_name="experiments")
+    op.drop_index("ix_control_sets_tags", table_name="control_sets")
+
+    _convert(sa.JSON(), "json")
@@ -5,12 +5,13 @@ import json
 from typing import Annotated, cast
 from uuid import UUID
 
-from kani import AIParam, ChatMessage, Kani, ai_function
+from kani import AIParam, ChatMessage, ai_function
 from kani.ai_function import AIFunction
 from kani.engines.base import BaseEngine
 from kani.internal import FunctionCallResult
 from kani.models import FunctionCall
 
+from veupath_chatbot.ai.agents.traced import TracedKani
 from veupath_chatbot.ai.orchestration.subkani.orchestrator import (
     delegate_strategy_subtasks as subkani_delegate_strategy_subtasks,
 )
@@ -22,6 +23,7 @@ from veupath_chatbot.ai.tools.example_plans_rag_tools import ExamplePlansRagTool
 from veupath_chatbot.ai.tools.execution_tools import ExecutionTools
 from veupath_chatbot.ai.tools.result_tools import ResultTools
 from veupath_chatbot.ai.tools.strategy_tools import StrategyTools
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.ai.tools.unified_registry import UnifiedToolRegistryMixin
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONArray, JSONObject
@@ -53,7 +55,7 @@ def _merge_auto_build(original_text: str | None, extra: JSONObject) -> str:
     return json.dumps(parsed)
 
 
-class PathfinderAgent(UnifiedToolRegistryMixin, Kani):
+class PathfinderAgent(UnifiedToolRegistryMixin, TracedKani):
     """Unified VEuPathDB Strategy Agent — research, planning, and execution.
 
     Combines executor (graph building, delegation, WDK execution) and
@@ -141,12 +143,16 @@ class PathfinderAgent(UnifiedToolRegistryMixin, Kani):
         After any graph-mutating tool, if the graph has exactly one root
         and hasn't been pushed to WDK yet, build it. The result (or error)
         is appended to the tool's return message so the model sees it.
+        Graph-mutating tools also drop the user's cached step results.
         """
         result = await super().do_function_call(call, tool_call_id)
 
         if call.name not in self._GRAPH_MUTATING_TOOLS:
             return result
 
+        # The strategy changed: cached step counts and records may be stale.
+        await invalidate_user_tool_results(self.user_id)
+
         graph = self.strategy_session.get_graph(None)
         if not graph:
             return result
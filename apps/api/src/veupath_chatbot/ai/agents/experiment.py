@@ -7,9 +7,10 @@ parameter configuration, control gene discovery, run configuration).
 
 from typing import Annotated, cast
 
-from kani import AIParam, ChatMessage, Kani, ai_function
+from kani import AIParam, ChatMessage, ai_function
 from kani.engines.base import BaseEngine
 
+from veupath_chatbot.ai.agents.traced import TracedKani
 from veupath_chatbot.ai.tools.catalog_tools import CatalogTools
 from veupath_chatbot.ai.tools.research_registry import ResearchToolsMixin
 from veupath_chatbot.platform.types import JSONObject
@@ -20,7 +21,7 @@ from veupath_chatbot.services.research import (
 )
 
 
-class ExperimentAssistantAgent(ResearchToolsMixin, Kani):
+class ExperimentAssistantAgent(ResearchToolsMixin, TracedKani):
     """Scoped assistant for experiment wizard steps.
 
     Has access to:
@@ -1,12 +1,21 @@
-"""Factory helpers for constructing the agent and its engine."""
+"""Factory helpers for constructing the agent and its engine.
+
+Engines are built per turn, but their provider SDK clients come from
+:mod:`veupath_chatbot.ai.engines.client_pool`, so connections stay warm
+across turns and sub-kanis.
+"""
 
 from typing import cast
 from uuid import UUID
 
 from kani import ChatMessage
 from kani.engines.base import BaseEngine
-from kani.engines.openai import OpenAIEngine
 
+from veupath_chatbot.ai.engines.client_pool import (
+    get_anthropic_client,
+    get_google_client,
+    get_openai_client,
+)
 from veupath_chatbot.ai.engines.responses_openai import ResponsesOpenAIEngine
 from veupath_chatbot.ai.models.catalog import (
     ModelProvider,
@@ -42,7 +51,7 @@ def _create_openai_engine(
     if max_context_size is not None:
         kwargs["max_context_size"] = max_context_size
     return ResponsesOpenAIEngine(
-        api_key=settings.openai_api_key,
+        client=get_openai_client(settings.openai_api_key),
         model=model,
         **kwargs,
         **(hyperparams or {}),
@@ -86,7 +95,7 @@ def _create_anthropic_engine(
         kwargs["top_p"] = top_p
 
     return CachedAnthropicEngine(
-        api_key=settings.anthropic_api_key,
+        client=get_anthropic_client(settings.anthropic_api_key),
         model=model,
         temperature=temperature,
         **kwargs,
@@ -103,13 +112,13 @@ def _create_google_engine(
     max_context_size: int | None = None,
 ) -> BaseEngine:
     settings = get_settings()
-    from kani.engines.google import GoogleAIEngine
+    from veupath_chatbot.ai.engines.cached_google import CachedGoogleEngine
 
     kwargs: dict[str, object] = {}
     if max_context_size is not None:
         kwargs["max_context_size"] = max_context_size
-    return GoogleAIEngine(
-        api_key=settings.gemini_api_key,
+    return CachedGoogleEngine(
+        client=get_google_client(settings.gemini_api_key),
         model=model,
         temperature=temperature,
         top_p=top_p,
@@ -130,10 +139,10 @@ def _create_ollama_engine(
     kwargs: dict[str, object] = {}
     if max_context_size is not None:
         kwargs["max_context_size"] = max_context_size
-    return OpenAIEngine(
-        api_key="ollama",
+    return ResponsesOpenAIEngine(
+        client=get_openai_client("ollama", settings.ollama_base_url),
         model=model,
-        api_base=settings.ollama_base_url,
+        api_type="chat",
         temperature=temperature,
         top_p=top_p,
         **kwargs,
@@ -2,9 +2,10 @@
 
 from pathlib import Path
 
-from kani import ChatMessage, Kani
+from kani import ChatMessage
 from kani.engines.base import BaseEngine
 
+from veupath_chatbot.ai.agents.traced import TracedKani
 from veupath_chatbot.ai.tools.catalog_rag_tools import CatalogRagTools
 from veupath_chatbot.ai.tools.catalog_tools import CatalogTools
 from veupath_chatbot.ai.tools.conversation_tools import ConversationTools
@@ -21,7 +22,7 @@ def _load_subtask_system_prompt() -> str:
     return prompt_path.read_text()
 
 
-class SubtaskAgent(AgentToolRegistryMixin, Kani):
+class SubtaskAgent(AgentToolRegistryMixin, TracedKani):
     """Sub-kani agent for search discovery and parameter lookup."""
 
     def __init__(
@@ -0,0 +1,64 @@
+"""Kani base class that records a span for every model call."""
+
+import time
+from collections.abc import AsyncIterable
+from typing import Any
+
+from kani import Kani
+from kani.engines.base import BaseCompletion
+
+from veupath_chatbot.platform.tracing import Span, span, start_span
+
+
+def _model_name(agent: Kani) -> str:
+    return str(getattr(agent.engine, "model", None) or type(agent.engine).__name__)
+
+
+def _record_usage(current: Span, completion: BaseCompletion) -> None:
+    if completion.prompt_tokens is not None:
+        current.set_attribute("prompt_tokens", completion.prompt_tokens)
+    if completion.completion_tokens is not None:
+        current.set_attribute("completion_tokens", completion.completion_tokens)
+
+
+class TracedKani(Kani):
+    """Kani that times each engine request as an ``llm`` span.
+
+    Streaming calls also record the time to the first token.
+    """
+
+    async def get_model_completion(
+        self, include_functions: bool = True, **kwargs: Any
+    ) -> BaseCompletion:
+        with span(
+            "llm.completion", category="llm", endpoint=_model_name(self)
+        ) as current:
+            completion = await super().get_model_completion(include_functions, **kwargs)
+            _record_usage(current, completion)
+            return completion
+
+    async def get_model_stream(
+        self, include_functions: bool = True, **kwargs: Any
+    ) -> AsyncIterable[str | BaseCompletion]:
+        # Not a ``with span(...)`` block: the consumer may stop iterating
+        # and close this generator from another context.
+        current = start_span("llm.stream", category="llm", endpoint=_model_name(self))
+        started = time.perf_counter()
+        error: Exception | None = None
+        first_token = True
+        try:
+            async for elem in super().get_model_stream(include_functions, **kwargs):
+                if isinstance(elem, BaseCompletion):
+                    _record_usage(current, elem)
+                elif first_token:
+                    first_token = False
+                    current.set_attribute(
+                        "first_token_ms",
+                        round((time.perf_counter() - started) * 1000, 1),
+                    )
+                yield elem
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            current.end(error)
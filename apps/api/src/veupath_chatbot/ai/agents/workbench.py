@@ -6,9 +6,10 @@ research, catalog, analysis, refinement, gene, and workbench tool mixins.
 
 from uuid import UUID
 
-from kani import ChatMessage, Kani
+from kani import ChatMessage
 from kani.engines.base import BaseEngine
 
+from veupath_chatbot.ai.agents.traced import TracedKani
 from veupath_chatbot.ai.tools.catalog_rag_tools import CatalogRagTools
 from veupath_chatbot.ai.tools.catalog_registry import CatalogToolsMixin
 from veupath_chatbot.ai.tools.catalog_tools import CatalogTools
@@ -32,7 +33,7 @@ class WorkbenchAgent(
     WorkbenchToolsMixin,
     CatalogToolsMixin,
     ResearchToolsMixin,
-    Kani,
+    TracedKani,
 ):
     """Conversational AI agent for the workbench.
 
@@ -10,11 +10,55 @@ from kani.engines.anthropic.parts import AnthropicThinkingPart, AnthropicUnknown
 from kani.engines.base import Completion
 from kani.models import FunctionCall, MessagePart, ToolCall
 
+from veupath_chatbot.ai.engines.prompt_cache import (
+    split_system_prompt,
+    stable_functions,
+)
+
+_EPHEMERAL: dict[str, str] = {"type": "ephemeral"}
+
+# Content blocks that may carry a cache_control breakpoint.
+_CACHEABLE_BLOCK_TYPES = frozenset(
+    {"text", "image", "document", "tool_use", "tool_result"}
+)
+
+
+def _mark_last_message(translated: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return *translated* with a cache breakpoint on the final message.
+
+    Marking the newest message lets the next request (the next tool-loop
+    step or the next turn) read the whole conversation so far from cache.
+    The input list and its messages are not mutated.
+    """
+    if len(translated) < 2:
+        return translated
+    last = translated[-1]
+    content = last.get("content")
+    if isinstance(content, str):
+        if not content:
+            return translated
+        blocks: list[Any] = [
+            {"type": "text", "text": content, "cache_control": _EPHEMERAL}
+        ]
+    elif isinstance(content, list) and content:
+        tail = content[-1]
+        if not isinstance(tail, dict) or tail.get("type") not in _CACHEABLE_BLOCK_TYPES:
+            return translated
+        if tail.get("type") == "text" and not tail.get("text"):
+            return translated
+        blocks = [*content[:-1], {**tail, "cache_control": _EPHEMERAL}]
+    else:
+        return translated
+    return [*translated[:-1], {**last, "content": blocks}]
+
 
 class CachedAnthropicEngine(AnthropicEngine):
     """AnthropicEngine subclass that adds prompt caching and fixes thinking blocks.
 
-    - Anthropic's prompt caching reduces cache-hit costs by 90%.
+    - Anthropic's prompt caching reduces cache-hit costs by 90%.  The static
+      system prompt (and the tool definitions before it) and the newest
+      message each get a breakpoint; per-turn system context is sent as a
+      separate, un-cached block so it doesn't invalidate the prefix.
     - Wraps single-MessagePart content in a list to prevent Pydantic validation
       errors when the response is a bare thinking block.
     """
@@ -27,19 +71,23 @@ class CachedAnthropicEngine(AnthropicEngine):
         intent: str = "create",
     ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
         kwargs, translated = AnthropicEngine._prepare_request(
-            messages, functions, intent=intent
+            messages, stable_functions(functions), intent=intent
         )
         # Wrap the system prompt (a plain string) with cache_control.
         system_text = kwargs.get("system")
         if isinstance(system_text, str) and system_text:
-            kwargs["system"] = [
+            static, dynamic = split_system_prompt(system_text)
+            blocks: list[dict[str, Any]] = [
                 {
                     "type": "text",
-                    "text": system_text,
-                    "cache_control": {"type": "ephemeral"},
+                    "text": static,
+                    "cache_control": _EPHEMERAL,
                 }
             ]
-        return kwargs, translated
+            if dynamic:
+                blocks.append({"type": "text", "text": dynamic})
+            kwargs["system"] = blocks
+        return kwargs, _mark_last_message(translated)
 
     def _translate_anthropic_message(self, message: Any) -> Completion:
         """Translate an Anthropic Message, fixing the bare-MessagePart bug.
@@ -88,8 +136,16 @@ class CachedAnthropicEngine(AnthropicEngine):
         self.set_cached_message_len(kani_msg, message.usage.output_tokens)
         kani_msg.extra["anthropic_message"] = message
 
+        # ``input_tokens`` only counts tokens after the last cache hit;
+        # report the full prompt so cached-token pricing stays consistent.
+        usage = message.usage
+        prompt_tokens = (
+            usage.input_tokens
+            + (getattr(usage, "cache_read_input_tokens", None) or 0)
+            + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+        )
         return Completion(
             message=kani_msg,
-            prompt_tokens=message.usage.input_tokens,
-            completion_tokens=message.usage.output_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=usage.output_tokens,
         )
@@ -0,0 +1,48 @@
+"""Gemini engine that keeps the request prefix stable for implicit caching."""
+
+from collections.abc import AsyncIterable
+from typing import Any
+
+from kani import AIFunction, ChatMessage
+from kani.engines.base import BaseCompletion
+from kani.engines.google import GoogleAIEngine
+
+from veupath_chatbot.ai.engines.prompt_cache import (
+    stable_functions,
+    strip_leading_boundary,
+)
+
+
+class CachedGoogleEngine(GoogleAIEngine):
+    """GoogleAIEngine that sends tools in name order and strips cache markers.
+
+    Gemini caches repeated request prefixes implicitly (system instruction,
+    then tools, then contents), so the engine only has to keep that prefix
+    byte-stable across turns.  The system prompt is kept in one piece
+    because Gemini takes it as a single system instruction.
+    """
+
+    async def predict(
+        self,
+        messages: list[ChatMessage],
+        functions: list[AIFunction] | None = None,
+        **hyperparams: Any,
+    ) -> BaseCompletion:
+        return await super().predict(
+            strip_leading_boundary(messages),
+            stable_functions(functions) or None,
+            **hyperparams,
+        )
+
+    async def stream(
+        self,
+        messages: list[ChatMessage],
+        functions: list[AIFunction] | None = None,
+        **hyperparams: Any,
+    ) -> AsyncIterable[str | BaseCompletion]:
+        async for chunk in super().stream(
+            strip_leading_boundary(messages),
+            stable_functions(functions) or None,
+            **hyperparams,
+        ):
+            yield chunk
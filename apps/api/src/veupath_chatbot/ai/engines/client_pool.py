@@ -0,0 +1,146 @@
+"""Process-wide pool of provider SDK clients shared by kani engines.
+
+Kani engines are cheap Python objects, but each one normally builds its
+own provider SDK client -- and with it a fresh HTTP connection pool --
+so every chat turn and sub-kani used to pay a new TLS handshake before
+its first token.  Engines are still created per turn (they carry the
+per-turn model, sampling and reasoning hyperparameters, which kani sends
+as request options), but they now borrow a long-lived SDK client from
+this pool.
+
+Clients are keyed by ``(provider, credential fingerprint, base URL)``
+per event loop, since an SDK client's connections belong to the loop that
+opened them.  Clients of loops that have since closed are dropped the
+next time the pool grows, and :func:`close_llm_clients` closes every
+pooled client at shutdown -- including those owned by other live loops,
+which are closed on their own loop.
+
+Engines built on a pooled client must not close it themselves.
+"""
+
+import asyncio
+import hashlib
+from typing import Any
+
+from veupath_chatbot.platform.logging import get_logger
+
+logger = get_logger(__name__)
+
+type _ClientKey = tuple[str, str, str | None]
+
+#: Retry budgets mirror the defaults kani applies when it builds clients.
+_OPENAI_MAX_RETRIES = 5
+_ANTHROPIC_MAX_RETRIES = 2
+
+type _Owner = asyncio.AbstractEventLoop | None
+
+_clients: dict[tuple[_Owner, _ClientKey], Any] = {}
+
+
+def _fingerprint(secret: str) -> str:
+    """Return a short, non-reversible key for a credential."""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _evict_closed_loops() -> None:
+    """Forget clients whose event loop has closed (their transports died with it)."""
+    for owner, key in list(_clients):
+        if owner is not None and owner.is_closed():
+            del _clients[(owner, key)]
+            logger.debug("Dropped LLM client from a closed event loop", provider=key[0])
+
+
+def _pooled(key: _ClientKey, build: Any) -> Any:
+    loop = _current_loop()
+    client = _clients.get((loop, key))
+    if client is not None:
+        return client
+    if loop is not None:
+        # A client built outside any loop is adopted by the first loop to use it.
+        client = _clients.pop((None, key), None)
+    if client is None:
+        _evict_closed_loops()
+        client = build()
+        logger.debug("Created pooled LLM client", provider=key[0], base_url=key[2])
+    _clients[(loop, key)] = client
+    return client
+
+
+def get_openai_client(api_key: str, base_url: str | None = None) -> Any:
+    """Return the shared ``AsyncOpenAI`` client for *api_key* / *base_url*.
+
+    Also used for OpenAI-compatible servers such as Ollama.
+    """
+    from openai import AsyncOpenAI
+
+    def _build() -> Any:
+        return AsyncOpenAI(
+            api_key=api_key, base_url=base_url, max_retries=_OPENAI_MAX_RETRIES
+        )
+
+    return _pooled(("openai", _fingerprint(api_key), base_url), _build)
+
+
+def get_anthropic_client(api_key: str, base_url: str | None = None) -> Any:
+    """Return the shared ``AsyncAnthropic`` client for *api_key* / *base_url*."""
+    from anthropic import AsyncAnthropic
+
+    def _build() -> Any:
+        return AsyncAnthropic(
+            api_key=api_key, base_url=base_url, max_retries=_ANTHROPIC_MAX_RETRIES
+        )
+
+    return _pooled(("anthropic", _fingerprint(api_key), base_url), _build)
+
+
+def get_google_client(api_key: str) -> Any:
+    """Return the shared ``google.genai`` client for *api_key*."""
+    from google import genai
+
+    def _build() -> Any:
+        return genai.Client(api_key=api_key)
+
+    return _pooled(("google", _fingerprint(api_key), None), _build)
+
+
+async def _close_client(client: Any) -> None:
+    aio = getattr(client, "aio", None)
+    closer = getattr(client, "close", None)
+    if aio is not None and hasattr(aio, "aclose"):
+        closer = aio.aclose
+    if closer is None:
+        return
+    result = closer()
+    if asyncio.iscoroutine(result):
+        await result
+
+
+async def _close_on(owner: _Owner, client: Any) -> None:
+    """Close *client* on the loop that owns its connections."""
+    current = _current_loop()
+    if owner is None or owner is current:
+        await _close_client(client)
+    elif owner.is_running():
+        future = asyncio.run_coroutine_threadsafe(_close_client(client), owner)
+        await asyncio.wrap_future(future)
+    # A loop that is closed (or stopped for good) took the transports with it.
+
+
+async def close_llm_clients() -> None:
+    """Close every pooled SDK client (call during app shutdown)."""
+    entries = list(_clients.items())
+    _clients.clear()
+    for (owner, (provider, _, _)), client in entries:
+        try:
+            await _close_on(owner, client)
+        except Exception as exc:
+            logger.debug(
+                "Failed to close LLM client", provider=provider, error=str(exc)
+            )
@@ -0,0 +1,112 @@
+"""Provider-agnostic helpers for prompt-prefix caching.
+
+Every provider we use caches (or bills more cheaply for) a request
+prefix it has seen recently -- but only if that prefix is byte-identical.
+Our prompts start with a large static block (``system.md`` plus tool
+schemas) followed by per-turn context (selected nodes, @-mentions), so
+two details decide whether caching works:
+
+- **Ordering.**  Prompt builders mark where the static system prompt
+  ends with :data:`PROMPT_CACHE_BOUNDARY`.  Engines split on it: the
+  static part stays at the head of the request and the per-turn part is
+  moved after the stable conversation history (OpenAI) or into its own
+  un-cached block (Anthropic).  The marker never reaches the model.
+- **Determinism.**  Tool definitions are sent sorted by name, so the
+  tool block doesn't change with registration order.
+
+Each engine then applies its provider's mechanism: Anthropic
+``cache_control`` breakpoints, OpenAI ``prompt_cache_key`` routing, and
+Gemini implicit caching of the stable prefix.  Cache hits are reported
+through the token usage the engines attach to each message.
+"""
+
+from collections.abc import Sequence
+
+from kani import AIFunction, ChatMessage
+from kani.models import ChatRole
+
+from veupath_chatbot.platform.cache import cache_key
+
+#: Separates the static system prompt from per-turn context.
+PROMPT_CACHE_BOUNDARY = "\n\n<!-- prompt-cache-boundary -->\n\n"
+
+
+def split_system_prompt(text: str) -> tuple[str, str]:
+    """Split *text* into ``(static_prefix, dynamic_suffix)``.
+
+    Without a boundary marker the whole prompt is treated as static.
+    """
+    static, sep, dynamic = text.partition(PROMPT_CACHE_BOUNDARY)
+    if not sep:
+        return text, ""
+    return static, dynamic.replace(PROMPT_CACHE_BOUNDARY, "\n\n")
+
+
+def strip_boundary(text: str) -> str:
+    """Remove boundary markers, keeping the surrounding text intact."""
+    return text.replace(PROMPT_CACHE_BOUNDARY, "\n\n")
+
+
+def stable_functions(functions: Sequence[AIFunction] | None) -> list[AIFunction]:
+    """Return *functions* in a deterministic (name) order."""
+    return sorted(functions or [], key=lambda f: f.name)
+
+
+def _split_leading_system(
+    messages: list[ChatMessage],
+) -> tuple[ChatMessage | None, str]:
+    if not messages or messages[0].role != ChatRole.SYSTEM:
+        return None, ""
+    content = messages[0].content
+    if not isinstance(content, str) or PROMPT_CACHE_BOUNDARY not in content:
+        return None, ""
+    static, dynamic = split_system_prompt(content)
+    return messages[0].copy_with(content=static), dynamic
+
+
+def relocate_dynamic_context(messages: list[ChatMessage]) -> list[ChatMessage]:
+    """Move per-turn system context after the stable conversation history.
+
+    The leading system message keeps only its static prefix; the dynamic
+    suffix becomes a system message placed just before the latest user
+    message, so the system prompt and all earlier turns form a stable,
+    cacheable prefix.
+    """
+    static_msg, dynamic = _split_leading_system(messages)
+    if static_msg is None:
+        return messages
+    out = [static_msg, *messages[1:]]
+    if not dynamic.strip():
+        return out
+    insert_at = len(out)
+    for i in range(len(out) - 1, 0, -1):
+        if out[i].role == ChatRole.USER:
+            insert_at = i
+            break
+    out.insert(insert_at, ChatMessage.system(dynamic))
+    return out
+
+
+def strip_leading_boundary(messages: list[ChatMessage]) -> list[ChatMessage]:
+    """Drop the boundary marker but keep the system prompt in one piece."""
+    if not messages or messages[0].role != ChatRole.SYSTEM:
+        return messages
+    content = messages[0].content
+    if not isinstance(content, str) or PROMPT_CACHE_BOUNDARY not in content:
+        return messages
+    return [messages[0].copy_with(content=strip_boundary(content)), *messages[1:]]
+
+
+def static_system_prefix(messages: list[ChatMessage]) -> str:
+    """Return the static part of the leading system message (or ``""``)."""
+    if not messages or messages[0].role != ChatRole.SYSTEM:
+        return ""
+    content = messages[0].content
+    return split_system_prompt(content)[0] if isinstance(content, str) else ""
+
+
+def prompt_cache_key(
+    model: str, static_prefix: str, functions: Sequence[AIFunction]
+) -> str:
+    """Return a routing key shared by requests with the same static prefix."""
+    return "pf-" + cache_key(model, static_prefix, [f.name for f in functions])
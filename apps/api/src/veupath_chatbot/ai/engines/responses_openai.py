@@ -3,6 +3,11 @@
 Kani's OpenAIEngine unconditionally adds ``include=["reasoning.encrypted_content"]``
 for all Responses API calls, but non-reasoning models (gpt-4.1, gpt-4.1-mini,
 gpt-4.1-nano) reject this parameter.  This subclass strips it for those models.
+
+It also lays requests out for OpenAI's automatic prefix caching: tools in
+name order, the static system prompt first, per-turn context after the
+conversation history, and a ``prompt_cache_key`` derived from the static
+prefix so requests sharing it are routed to the same cache.
 """
 
 from typing import Any
@@ -10,6 +15,14 @@ from typing import Any
 from kani import AIFunction, ChatMessage
 from kani.engines.openai import OpenAIEngine
 
+from veupath_chatbot.ai.engines.prompt_cache import (
+    prompt_cache_key,
+    relocate_dynamic_context,
+    stable_functions,
+    static_system_prefix,
+    strip_leading_boundary,
+)
+
 # Models whose prefix indicates they support reasoning encrypted content.
 _REASONING_PREFIXES = ("o1", "o3", "o4", "gpt-5")
 
@@ -34,9 +47,28 @@ class ResponsesOpenAIEngine(OpenAIEngine):
         functions: list[AIFunction],
         **kwargs: Any,
     ) -> tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any] | None]:
+        functions = stable_functions(functions)
+        static_prefix = static_system_prefix(messages)
+        responses_api = getattr(self, "api_type", "responses") == "responses"
+        # OpenAI accepts system messages anywhere; OpenAI-compatible local
+        # servers (chat API) may not, so there the prompt stays in one piece.
+        messages = (
+            relocate_dynamic_context(messages)
+            if responses_api
+            else strip_leading_boundary(messages)
+        )
         kwargs, translated, tools = super()._prepare_request(
             messages, functions, **kwargs
         )
+        if responses_api:
+            # Sent via extra_body so older SDKs that lack the typed
+            # parameter still forward it.
+            extra_body = dict(kwargs.get("extra_body") or {})
+            extra_body.setdefault(
+                "prompt_cache_key",
+                prompt_cache_key(self.model, static_prefix, functions),
+            )
+            kwargs["extra_body"] = extra_body
         if not self._supports_reasoning:
             include = kwargs.get("include")
             if isinstance(include, list) and "reasoning.encrypted_content" in include:
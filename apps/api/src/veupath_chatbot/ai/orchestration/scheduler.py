@@ -1,8 +1,27 @@
-"""Run delegation graph nodes respecting dependency ordering."""
+"""Run delegation graph nodes respecting dependency ordering.
+
+Ready nodes are started longest-remaining-chain first, so the critical
+path of a delegation plan is never stuck behind short side branches.
+Combine nodes only create one boolean step from finished inputs, so they
+start as soon as both inputs finish, without waiting for a sub-agent slot.
+
+Sub-agents are expensive, so every delegation on a worker draws its slots
+from one :class:`FairShareBudget`.  A freed slot goes to the waiting owner
+(user) currently holding the fewest slots, so one user's large plan cannot
+starve another user's small one.  With a cluster cap configured, slots are
+additionally leased through Redis so the cap holds across workers.
+"""
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import heapq
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
+from veupath_chatbot.platform.admission import AdmissionController
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.tool_errors import tool_error
 from veupath_chatbot.platform.types import (
@@ -14,6 +33,140 @@ from veupath_chatbot.platform.types import (
 
 logger = get_logger(__name__)
 
+_CLUSTER_RUNNING_KEY = "subagents:running"
+
+
+class FairShareBudget:
+    """Sub-agent slots shared by all delegations, granted max-min fair per owner."""
+
+    def __init__(
+        self, capacity: int, *, cluster: AdmissionController | None = None
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self._cluster = cluster
+        self._held: dict[str, int] = {}
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._seq = itertools.count()
+        self._enqueued_at: dict[asyncio.Future[None], int] = {}
+
+    @property
+    def in_use(self) -> int:
+        """Slots currently held on this worker."""
+        return sum(self._held.values())
+
+    def held_by(self, owner: str) -> int:
+        """Slots currently held by *owner* on this worker."""
+        return self._held.get(owner, 0)
+
+    def _grant(self, owner: str) -> None:
+        self._held[owner] = self._held.get(owner, 0) + 1
+
+    def _release(self, owner: str) -> None:
+        held = self._held.get(owner, 0) - 1
+        if held > 0:
+            self._held[owner] = held
+        else:
+            self._held.pop(owner, None)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.in_use < self.capacity:
+            candidates = [
+                (self.held_by(owner), self._enqueued_at[queue[0]], owner)
+                for owner, queue in self._waiters.items()
+                if queue
+            ]
+            if not candidates:
+                return
+            _, _, owner = min(candidates)
+            future = self._waiters[owner].popleft()
+            if not self._waiters[owner]:
+                del self._waiters[owner]
+            self._enqueued_at.pop(future, None)
+            if future.done():
+                continue
+            self._grant(owner)
+            future.set_result(None)
+
+    async def _acquire(self, owner: str) -> None:
+        if self.in_use < self.capacity and not self._waiters:
+            self._grant(owner)
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._enqueued_at[future] = next(self._seq)
+        self._waiters.setdefault(owner, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation landed; hand it on.
+                self._release(owner)
+            else:
+                self._enqueued_at.pop(future, None)
+                queue = self._waiters.get(owner)
+                if queue and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del self._waiters[owner]
+            raise
+
+    @asynccontextmanager
+    async def slot(self, owner: str) -> AsyncIterator[None]:
+        """Hold one sub-agent slot for *owner*, waiting for a fair turn."""
+        await self._acquire(owner)
+        try:
+            if self._cluster is None:
+                yield
+            else:
+                async with self._cluster.slot("subagent", user_id=owner):
+                    yield
+        finally:
+            self._release(owner)
+
+
+@lru_cache
+def get_subagent_budget() -> FairShareBudget:
+    """Return the worker-wide sub-agent budget configured from settings."""
+    settings = get_settings()
+    cluster = None
+    if settings.subkani_cluster_max_concurrency > 0:
+        cluster = AdmissionController(
+            max_running=settings.subkani_cluster_max_concurrency,
+            max_running_per_user=settings.subkani_max_concurrency,
+            max_wdk_inflight=settings.admission_max_wdk_inflight,
+            cpu_load=lambda: 0.0,
+            running_key=_CLUSTER_RUNNING_KEY,
+        )
+    return FairShareBudget(settings.subkani_max_concurrency, cluster=cluster)
+
+
+def critical_path_lengths(
+    node_ids: set[str], dependents: dict[str, list[str]]
+) -> dict[str, int]:
+    """Return, per node, the number of nodes on its longest downstream chain.
+
+    A node with no dependents has length 1.  Edges that close a cycle are
+    ignored, so cyclic plans still get a (finite) ordering.
+    """
+    lengths: dict[str, int] = {}
+    visiting: set[str] = set()
+
+    def visit(node_id: str) -> int:
+        if node_id in lengths:
+            return lengths[node_id]
+        visiting.add(node_id)
+        longest = 0
+        for child in dependents.get(node_id, []):
+            if child in node_ids and child not in visiting:
+                longest = max(longest, visit(child))
+        visiting.discard(node_id)
+        lengths[node_id] = longest + 1
+        return longest + 1
+
+    for node_id in node_ids:
+        visit(node_id)
+    return lengths
+
 
 async def run_nodes_with_dependencies(
     *,
@@ -23,9 +176,21 @@ async def run_nodes_with_dependencies(
     run_node: Callable[[str, JSONObject, str | None], Awaitable[JSONObject]],
     format_dependency_context: Callable[..., str | None],
     results_by_id: dict[str, JSONObject] | None = None,
+    budget: FairShareBudget | None = None,
+    owner: str = "anonymous",
 ) -> tuple[JSONArray, dict[str, JSONObject]]:
-    """Execute nodes concurrently while honoring their depends_on edges."""
+    """Execute nodes concurrently while honoring their depends_on edges.
+
+    :param max_concurrency: Cap on nodes running at once for this call.
+    :param budget: Shared slot budget each running node must also hold.
+    :param owner: Budget owner (usually the user) for fair sharing.
+
+    Combine nodes (``kind == "combine"``) are exempt from both the cap and
+    the budget.
+    """
     node_ids = set(nodes_by_id.keys())
+    order = {node_id: index for index, node_id in enumerate(nodes_by_id)}
+    chain = critical_path_lengths(node_ids, dependents)
 
     remaining_deps: dict[str, set[str]] = {}
     for node_id, node in nodes_by_id.items():
@@ -40,23 +205,43 @@ async def run_nodes_with_dependencies(
     # Detect cycles: nodes that can never become ready
     all_scheduled: set[str] = set()
 
-    ready = [node_id for node_id, deps in remaining_deps.items() if not deps]
+    ready: list[tuple[int, int, str]] = []
+
+    def push_ready(node_id: str) -> None:
+        heapq.heappush(ready, (-chain[node_id], order[node_id], node_id))
+
+    for node_id, deps in remaining_deps.items():
+        if not deps:
+            push_ready(node_id)
     running: dict[asyncio.Task[JSONObject], str] = {}
     results: JSONArray = []
     if results_by_id is None:
         results_by_id = {}
 
-    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    limit = max(1, int(max_concurrency))
+
+    def is_combine(node_id: str) -> bool:
+        return nodes_by_id[node_id].get("kind") == "combine"
 
     async def guarded_run(
         node_id: str, node: JSONObject, dependency_context: str | None
     ) -> JSONObject:
-        async with semaphore:
+        if budget is None or is_combine(node_id):
+            return await run_node(node_id, node, dependency_context)
+        async with budget.slot(owner):
             return await run_node(node_id, node, dependency_context)
 
     while ready or running:
-        while ready and len(running) < max(1, int(max_concurrency)):
-            node_id = ready.pop()
+        capped = sum(1 for node_id in running.values() if not is_combine(node_id))
+        deferred: list[tuple[int, int, str]] = []
+        while ready:
+            entry = heapq.heappop(ready)
+            node_id = entry[2]
+            if not is_combine(node_id):
+                if capped >= limit:
+                    deferred.append(entry)
+                    continue
+                capped += 1
             all_scheduled.add(node_id)
             node = nodes_by_id[node_id]
             dependency_context = format_dependency_context(
@@ -68,6 +253,8 @@ async def run_nodes_with_dependencies(
                 guarded_run(node_id, node, dependency_context)
             )
             running[running_task] = node_id
+        for entry in deferred:
+            heapq.heappush(ready, entry)
 
         if not running:
             break
@@ -84,7 +271,7 @@ async def run_nodes_with_dependencies(
             for child in dependents.get(finished_id, []):
                 remaining_deps[child].discard(finished_id)
                 if not remaining_deps[child]:
-                    ready.append(child)
+                    push_ready(child)
 
     # Report any nodes that were never scheduled (circular dependency)
     unscheduled = node_ids - all_scheduled
@@ -14,6 +14,7 @@ from kani.models import ChatMessage, ChatRole
 from shared_py.defaults import DEFAULT_STREAM_NAME
 
 from veupath_chatbot.ai.agents.subtask import SubtaskAgent
+from veupath_chatbot.ai.engines.client_pool import get_openai_client
 from veupath_chatbot.ai.engines.responses_openai import ResponsesOpenAIEngine
 from veupath_chatbot.ai.models.pricing import estimate_cost as _estimate_subkani_cost
 from veupath_chatbot.ai.orchestration.delegation import (
@@ -21,6 +22,7 @@ from veupath_chatbot.ai.orchestration.delegation import (
     build_delegation_plan,
 )
 from veupath_chatbot.ai.orchestration.scheduler import (
+    get_subagent_budget,
     partition_task_results,
     run_nodes_with_dependencies,
 )
@@ -36,6 +38,7 @@ from veupath_chatbot.ai.tools.strategy_tools import StrategyTools
 from veupath_chatbot.domain.strategy.metadata import derive_graph_metadata
 from veupath_chatbot.domain.strategy.session import StrategySession
 from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.context import user_id_ctx
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.tool_errors import tool_error
 from veupath_chatbot.platform.types import JSONArray, JSONObject, JSONValue
@@ -62,6 +65,21 @@ def _derive_model_id(engine: BaseEngine) -> str:
     return model
 
 
+def _build_subkani_engine(
+    engine_factory: Callable[[], BaseEngine] | None = None,
+) -> BaseEngine:
+    """Build the engine a sub-kani runs on."""
+    if engine_factory is not None:
+        return engine_factory()
+    settings = get_settings()
+    return ResponsesOpenAIEngine(
+        client=get_openai_client(settings.openai_api_key),
+        model=settings.subkani_model,
+        temperature=settings.subkani_temperature,
+        top_p=settings.subkani_top_p,
+    )
+
+
 async def run_subkani_task(
     *,
     task: str,
@@ -75,16 +93,7 @@ async def run_subkani_task(
     subkani_timeout_seconds: int,
     engine_factory: Callable[[], BaseEngine] | None = None,
 ) -> JSONObject:
-    settings = get_settings()
-    if engine_factory is not None:
-        engine = engine_factory()
-    else:
-        engine = ResponsesOpenAIEngine(
-            api_key=settings.openai_api_key,
-            model=settings.subkani_model,
-            temperature=settings.subkani_temperature,
-            top_p=settings.subkani_top_p,
-        )
+    engine = _build_subkani_engine(engine_factory)
     subkani_model_id = _derive_model_id(engine)
 
     if not graph_id:
@@ -493,6 +502,8 @@ async def delegate_strategy_subtasks(
         run_node=run_node,
         format_dependency_context=format_dependency_context,
         results_by_id=results_by_id,
+        budget=get_subagent_budget(),
+        owner=str(user_id_ctx.get() or "anonymous"),
     )
     task_results: JSONArray = [
         cast(JSONValue, r)
@@ -2,6 +2,7 @@
 
 import json
 
+from veupath_chatbot.ai.engines.prompt_cache import PROMPT_CACHE_BOUNDARY
 from veupath_chatbot.ai.prompts.loader import load_system_prompt
 from veupath_chatbot.platform.types import JSONObject
 
@@ -17,7 +18,8 @@ def build_agent_system_prompt(
     :param site_id: VEuPathDB site identifier.
     :param selected_nodes: Selected graph nodes (default: None).
     :param mentioned_context: Rich context from @-mentioned entities (default: None).
-    :returns: Full system prompt string.
+    :returns: Full system prompt string; per-turn context follows
+        :data:`~veupath_chatbot.ai.engines.prompt_cache.PROMPT_CACHE_BOUNDARY`.
     """
     base_prompt = load_system_prompt()
     site_context = (
@@ -41,4 +43,9 @@ def build_agent_system_prompt(
             "to understand their question and provide relevant answers.\n\n"
             "```\n" + mentioned_context + "\n```"
         )
-    return base_prompt + site_context + node_context + mention_block
+    # Per-turn context goes after the cache boundary so the (large) static
+    # prompt stays a stable, cacheable prefix.
+    dynamic = (node_context + mention_block).lstrip("\n")
+    if not dynamic:
+        return base_prompt + site_context
+    return base_prompt + site_context + PROMPT_CACHE_BOUNDARY + dynamic
@@ -22,6 +22,10 @@ class CatalogRagTools:
         self._disabled = disabled
         self._svc = RagSearchService(site_id=site_id)
 
+    @property
+    def disabled(self) -> bool:
+        return self._disabled
+
     async def rag_get_record_types(
         self,
         query: str | None = None,
@@ -12,6 +12,7 @@ from veupath_chatbot.ai.tools.query_validation import (
     record_type_query_error,
     search_query_error,
 )
+from veupath_chatbot.ai.tools.tool_cache import CATALOG_TTL, cached_tool
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.catalog.rag_search import RagSearchService
 
@@ -24,6 +25,9 @@ class CatalogToolsMixin:
     - catalog_tools: CatalogTools
     - catalog_rag_tools: CatalogRagTools
     - example_plans_rag_tools: ExamplePlansRagTools
+
+    Lookups that depend only on their arguments and the site are cached
+    across turns and users (see :mod:`~veupath_chatbot.ai.tools.tool_cache`).
     """
 
     site_id: str = ""
@@ -34,6 +38,7 @@ class CatalogToolsMixin:
     )
 
     @ai_function()
+    @cached_tool(keys=(), ttl_seconds=CATALOG_TTL)
     async def list_sites(self) -> JSONObject:
         """List all available VEuPathDB sites."""
         sites = await self.catalog_tools.list_sites()
@@ -45,6 +50,10 @@ class CatalogToolsMixin:
         )
 
     @ai_function()
+    @cached_tool(
+        keys=("self.site_id", "self.catalog_rag_tools.disabled", "query", "limit"),
+        ttl_seconds=CATALOG_TTL,
+    )
     async def get_record_types(
         self,
         query: Annotated[
@@ -80,6 +89,10 @@ class CatalogToolsMixin:
         )
 
     @ai_function()
+    @cached_tool(
+        keys=("self.site_id", "self.catalog_rag_tools.disabled", "record_type_id"),
+        ttl_seconds=CATALOG_TTL,
+    )
     async def get_record_type_details(
         self,
         record_type_id: Annotated[
@@ -99,6 +112,7 @@ class CatalogToolsMixin:
         )
 
     @ai_function()
+    @cached_tool(keys=("self.site_id", "record_type"), ttl_seconds=CATALOG_TTL)
     async def list_searches(
         self,
         record_type: Annotated[str, AIParam(desc="Record type to list searches for")],
@@ -113,6 +127,15 @@ class CatalogToolsMixin:
         )
 
     @ai_function()
+    @cached_tool(
+        keys=(
+            "self.site_id",
+            "self.catalog_rag_tools.disabled",
+            "record_type",
+            "search_name",
+        ),
+        ttl_seconds=CATALOG_TTL,
+    )
     async def get_search_parameters(
         self,
         record_type: Annotated[str, AIParam(desc="Record type that owns the search")],
@@ -138,6 +161,10 @@ class CatalogToolsMixin:
         )
 
     @ai_function()
+    @cached_tool(
+        keys=("self.site_id", "query", "keywords", "record_type", "limit"),
+        ttl_seconds=CATALOG_TTL,
+    )
     async def search_for_searches(
         self,
         query: Annotated[
@@ -182,6 +209,7 @@ class CatalogToolsMixin:
         return results
 
     @ai_function()
+    @cached_tool(keys=("self.site_id", "query", "record_type"), ttl_seconds=CATALOG_TTL)
     async def lookup_phyletic_codes(
         self,
         query: Annotated[
@@ -295,6 +323,15 @@ class CatalogToolsMixin:
             )
 
     @ai_function()
+    @cached_tool(
+        keys=(
+            "self.site_id",
+            "self.example_plans_rag_tools.disabled",
+            "query",
+            "limit",
+        ),
+        ttl_seconds=CATALOG_TTL,
+    )
     async def search_example_plans(
         self,
         query: Annotated[
@@ -18,6 +18,10 @@ class ExamplePlansRagTools:
         self._disabled = disabled
         self._svc = RagSearchService(site_id=site_id)
 
+    @property
+    def disabled(self) -> bool:
+        return self._disabled
+
     async def rag_search_example_plans(
         self,
         query: str,
@@ -4,6 +4,7 @@ from typing import Annotated
 
 from kani import AIParam, ai_function
 
+from veupath_chatbot.ai.tools.tool_cache import STEP_TTL, cached_tool
 from veupath_chatbot.platform.errors import ErrorCode
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.tool_errors import tool_error
@@ -20,6 +21,11 @@ class ExecutionTools(ValidationMixin):
     """Tools for retrieving strategy execution results."""
 
     @ai_function()
+    @cached_tool(
+        keys=("self.session.site_id", "wdk_step_id", "wdk_strategy_id"),
+        ttl_seconds=STEP_TTL,
+        per_user=True,
+    )
     async def get_result_count(
         self,
         wdk_step_id: Annotated[int, AIParam(desc="WDK step ID")],
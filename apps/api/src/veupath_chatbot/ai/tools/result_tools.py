@@ -4,6 +4,7 @@ from typing import Annotated, cast
 
 from kani import AIParam, ai_function
 
+from veupath_chatbot.ai.tools.tool_cache import STEP_TTL, cached_tool
 from veupath_chatbot.ai.tools.wdk_error_handler import handle_wdk_step_error
 from veupath_chatbot.domain.strategy.session import StrategySession
 from veupath_chatbot.platform.errors import ErrorCode, WDKError
@@ -115,6 +116,11 @@ class ResultTools:
             )
 
     @ai_function()
+    @cached_tool(
+        keys=("self.session.site_id", "wdk_step_id", "limit"),
+        ttl_seconds=STEP_TTL,
+        per_user=True,
+    )
     async def get_sample_records(
         self,
         wdk_step_id: Annotated[int, AIParam(desc="WDK step ID")],
@@ -0,0 +1,174 @@
+"""Declarative caching of deterministic agent tool results.
+
+Models repeat tool calls -- within a turn, across turns and across users
+asking about the same searches -- and each repeat re-runs the same WDK
+and catalog lookups.  A tool whose result depends only on its arguments
+(and a few instance attributes such as the site) is marked with
+:func:`cached_tool`, naming exactly what it keys on::
+
+    @ai_function()
+    @cached_tool(keys=("self.site_id", "record_type"), ttl_seconds=CATALOG_TTL)
+    async def list_searches(self, record_type: str) -> JSONObject: ...
+
+Results live in a :class:`~veupath_chatbot.platform.cache.LayeredCache`
+(memory first, shared through Redis).  Error payloads (``"ok": False``)
+are never cached.
+
+Tools that read the user's own WDK steps pass ``per_user=True``: entries
+are keyed by the current user and a per-user generation that
+:func:`invalidate_user_tool_results` bumps whenever the user's strategy
+changes, so a step's count or records are never served from before an
+edit.  Without a current user such tools are not cached.
+"""
+
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from veupath_chatbot.platform.cache import LayeredCache, cache_key
+from veupath_chatbot.platform.context import user_id_ctx
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.platform.types import JSONValue
+
+logger = get_logger(__name__)
+
+CATALOG_TTL = 3600
+"""Catalog metadata and RAG lookups only change with a site release."""
+
+STEP_TTL = 600
+"""Step counts and records; edits outside the agent surface within this."""
+
+_GENERATION_KEY = "tool_cache:gen:{}"
+_GENERATION_TTL = 24 * 3600
+
+# Generations used when Redis is not initialized.
+_local_generations: dict[str, int] = {}
+
+type ToolMethod = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class ToolCachePolicy:
+    """How a tool's results are cached (exposed as ``__tool_cache__``).
+
+    :param keys: Argument names, or ``self.<attr>`` paths, keying the result.
+    :param ttl_seconds: Lifetime of a cached result.
+    :param per_user: Key on the current user and their strategy generation.
+    """
+
+    keys: tuple[str, ...]
+    ttl_seconds: float
+    per_user: bool
+
+
+class _ToolDecorator(Protocol):
+    def __call__[F: ToolMethod](self, func: F, /) -> F: ...
+
+
+def _key_part(policy_key: str, arguments: dict[str, object]) -> object:
+    if not policy_key.startswith("self."):
+        return arguments[policy_key]
+    value: object = arguments["self"]
+    for attr in policy_key.removeprefix("self.").split("."):
+        value = getattr(value, attr)
+    return value
+
+
+def _cacheable(result: object) -> bool:
+    return not (isinstance(result, dict) and result.get("ok") is False)
+
+
+async def _user_generation(user: str) -> int:
+    try:
+        redis = get_redis()
+    except RuntimeError:
+        return _local_generations.get(user, 0)
+    try:
+        raw = await redis.get(_GENERATION_KEY.format(user))
+    except RedisError as exc:
+        logger.debug("Tool cache generation read failed", error=str(exc))
+        return _local_generations.get(user, 0)
+    return int(raw or 0)
+
+
+async def invalidate_user_tool_results(user_id: UUID | str | None) -> None:
+    """Drop *user_id*'s cached ``per_user`` tool results (call on strategy edits)."""
+    if user_id is None:
+        return
+    user = str(user_id)
+    _local_generations[user] = _local_generations.get(user, 0) + 1
+    try:
+        redis = get_redis()
+    except RuntimeError:
+        return
+    key = _GENERATION_KEY.format(user)
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, _GENERATION_TTL)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Tool cache invalidation failed", error=str(exc))
+
+
+def cached_tool(
+    *,
+    keys: Sequence[str],
+    ttl_seconds: float,
+    per_user: bool = False,
+) -> _ToolDecorator:
+    """Cache an async tool method's JSON result.
+
+    Apply beneath ``@ai_function()``.  Cached results are shared, so
+    callers must not mutate them.
+
+    :param keys: Argument names, or ``self.<attr>`` paths such as
+        ``"self.site_id"``, whose values the result depends on.
+    :param ttl_seconds: Lifetime of a cached result.
+    :param per_user: Key on the current user and drop entries on
+        :func:`invalidate_user_tool_results` -- for tools reading the
+        user's WDK steps.
+    """
+    policy = ToolCachePolicy(
+        keys=tuple(keys), ttl_seconds=ttl_seconds, per_user=per_user
+    )
+
+    def decorate[F: ToolMethod](func: F) -> F:
+        signature = inspect.signature(func)
+        cache: LayeredCache[JSONValue] = LayeredCache(
+            f"tool:{func.__qualname__}",
+            encode=lambda value: value,
+            decode=lambda value: value,
+            ttl_seconds=ttl_seconds,
+            max_entries=512,
+        )
+
+        @functools.wraps(func)
+        async def wrapper(*args: object, **kwargs: object) -> object:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = [_key_part(k, bound.arguments) for k in policy.keys]
+            if policy.per_user:
+                user = user_id_ctx.get()
+                if user is None:
+                    return await func(*args, **kwargs)
+                parts += [str(user), await _user_generation(str(user))]
+            key = cache_key(*parts)
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached
+            result = await func(*args, **kwargs)
+            if _cacheable(result):
+                await cache.set(key, result)
+            return result
+
+        wrapper.__tool_cache__ = policy  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
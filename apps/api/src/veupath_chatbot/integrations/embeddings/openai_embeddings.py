@@ -1,6 +1,11 @@
 import asyncio
+import base64
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
 
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.errors import InternalError
@@ -33,6 +38,13 @@ def _resolve_embeddings_config() -> tuple[str, str | None]:
     return "ollama", settings.ollama_base_url
 
 
+def _decode_embedding(data: object) -> NDArray[np.float32]:
+    """Read one embedding; base64 payloads are viewed in place as float32."""
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+    return np.asarray(data, dtype=np.float32)
+
+
 @dataclass(frozen=True)
 class OpenAIEmbeddings:
     """Wrapper around OpenAI-compatible embeddings with batching.
@@ -44,9 +56,14 @@ class OpenAIEmbeddings:
     batch_size: int = 128
     base_url: str | None = field(default=None)
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str]) -> NDArray[np.float32]:
+        """Embed *texts* as a ``(len(texts), dim)`` float32 matrix.
+
+        Embeddings are requested base64-encoded and decoded straight into
+        the matrix, never as Python float lists.
+        """
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
         try:
             from openai import AsyncOpenAI
         except Exception as exc:  # pragma: no cover
@@ -59,18 +76,22 @@ class OpenAIEmbeddings:
         effective_base = self.base_url or resolved_base
 
         async with AsyncOpenAI(api_key=api_key, base_url=effective_base) as client:
-            vectors: list[list[float]] = []
+            vectors: list[NDArray[np.float32]] = []
             for batch in _chunks(texts, size=self.batch_size):
-                resp = await client.embeddings.create(model=self.model, input=batch)
-                vectors.extend([d.embedding for d in resp.data])
+                resp = await client.embeddings.create(
+                    model=self.model, input=batch, encoding_format="base64"
+                )
+                vectors.extend(
+                    _decode_embedding(cast(object, d.embedding)) for d in resp.data
+                )
                 await asyncio.sleep(0)
 
             if len(vectors) != len(texts):  # pragma: no cover (SDK contract)
                 raise InternalError(title="Embedding count mismatch")
-            return vectors
+            return np.vstack(vectors)
 
 
-async def embed_one(*, text: str, model: str) -> list[float]:
+async def embed_one(*, text: str, model: str) -> NDArray[np.float32]:
     """Convenience helper for one-off vector size detection."""
     embedder = OpenAIEmbeddings(model=model, batch_size=1)
     return (await embedder.embed_texts([text]))[0]
@@ -7,3 +7,4 @@ WDK_RECORD_TYPES_V1 = "wdk_record_types_v1"
 WDK_SEARCHES_V1 = "wdk_searches_v1"
 WDK_DEPENDENT_VOCAB_CACHE_V1 = "wdk_dependent_vocab_cache_v1"
 EXAMPLE_PLANS_V1 = "example_plans_v1"
+WDK_INGEST_MANIFESTS_V1 = "wdk_ingest_manifests_v1"
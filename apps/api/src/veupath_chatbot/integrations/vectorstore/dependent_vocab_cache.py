@@ -16,7 +16,7 @@ from veupath_chatbot.integrations.veupathdb.client import (
 from veupath_chatbot.integrations.veupathdb.factory import get_wdk_client
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.errors import WDKError
-from veupath_chatbot.platform.types import JSONObject, JSONValue
+from veupath_chatbot.platform.types import JSONObject
 
 
 async def ensure_dependent_vocab_collection(store: QdrantStore) -> None:
@@ -90,10 +90,8 @@ async def get_dependent_vocab_authoritative_cached(
         text=f"{site_id} {record_type} {search_name} {param_name}",
         model=get_settings().embeddings_model,
     )
-    # Convert list[float] to list[JSONValue] for type compatibility
-    vec_json: list[JSONValue] = [float(x) for x in vec]
     await store.upsert(
         collection=WDK_DEPENDENT_VOCAB_CACHE_V1,
-        points=[{"id": pid, "vector": vec_json, "payload": payload}],
+        points=[{"id": pid, "vector": vec, "payload": payload}],
     )
     return {"cache": "miss", **payload}
@@ -0,0 +1,125 @@
+"""Content-hash manifests for incremental WDK catalog ingestion.
+
+Each site has one manifest point in :data:`WDK_INGEST_MANIFESTS_V1`
+recording, per target collection, the content hash of every document
+that was embedded and upserted, plus a fingerprint of the whole catalog.
+Ingest compares freshly fetched documents against it to embed only new or
+changed documents, delete removed ones, and skip a site outright when its
+fingerprint is unchanged.
+"""
+
+from dataclasses import dataclass, field
+
+from veupath_chatbot.integrations.vectorstore.collections import (
+    WDK_INGEST_MANIFESTS_V1,
+)
+from veupath_chatbot.integrations.vectorstore.qdrant_store import (
+    QdrantStore,
+    point_uuid,
+    sha256_hex,
+    stable_json_dumps,
+)
+from veupath_chatbot.platform.types import JSONObject
+
+MANIFEST_VERSION = 1
+
+# Manifest points carry no meaningful vector; Qdrant still requires one.
+_MANIFEST_VECTOR = [1.0]
+
+
+def content_hash(value: object) -> str:
+    """Stable SHA256 of a JSON-serialisable value."""
+    return sha256_hex(stable_json_dumps(value))
+
+
+def catalog_fingerprint(hashes_by_collection: dict[str, dict[str, str]]) -> str:
+    """Fingerprint a whole site catalog from its per-document hashes."""
+    return content_hash(
+        {
+            collection: sorted(hashes.items())
+            for collection, hashes in hashes_by_collection.items()
+        }
+    )
+
+
+@dataclass
+class SiteManifest:
+    """Document hashes (per collection) last ingested for one site."""
+
+    site_id: str
+    fingerprint: str | None = None
+    hashes: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    @property
+    def point_id(self) -> str:
+        return point_uuid(f"wdk-ingest-manifest:{self.site_id}")
+
+    def collection_hashes(self, collection: str) -> dict[str, str]:
+        return self.hashes.setdefault(collection, {})
+
+    def changed(self, collection: str, current: dict[str, str]) -> list[str]:
+        """Return IDs in *current* whose hash differs from the manifest."""
+        known = self.hashes.get(collection, {})
+        return [pid for pid, h in current.items() if known.get(pid) != h]
+
+    def removed(self, collection: str, current: dict[str, str]) -> list[str]:
+        """Return manifest IDs that are no longer in *current*."""
+        return [pid for pid in self.hashes.get(collection, {}) if pid not in current]
+
+    def to_payload(self) -> JSONObject:
+        return {
+            "siteId": self.site_id,
+            "version": MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "hashes": {
+                collection: dict(hashes) for collection, hashes in self.hashes.items()
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, site_id: str, payload: JSONObject) -> SiteManifest | None:
+        if payload.get("version") != MANIFEST_VERSION:
+            return None
+        hashes_raw = payload.get("hashes")
+        hashes: dict[str, dict[str, str]] = {}
+        if isinstance(hashes_raw, dict):
+            for collection, entries in hashes_raw.items():
+                if isinstance(entries, dict):
+                    hashes[collection] = {
+                        str(pid): str(h) for pid, h in entries.items() if h
+                    }
+        fingerprint = payload.get("fingerprint")
+        return cls(
+            site_id=site_id,
+            fingerprint=fingerprint if isinstance(fingerprint, str) else None,
+            hashes=hashes,
+        )
+
+
+async def ensure_manifest_collection(store: QdrantStore) -> None:
+    await store.ensure_collection(
+        name=WDK_INGEST_MANIFESTS_V1, vector_size=len(_MANIFEST_VECTOR)
+    )
+
+
+async def load_manifest(store: QdrantStore, site_id: str) -> SiteManifest | None:
+    """Return the stored manifest for *site_id*, or ``None`` if there is none."""
+    empty = SiteManifest(site_id=site_id)
+    point = await store.get(collection=WDK_INGEST_MANIFESTS_V1, point_id=empty.point_id)
+    payload = point.get("payload") if point else None
+    if not isinstance(payload, dict):
+        return None
+    return SiteManifest.from_payload(site_id, payload)
+
+
+async def save_manifest(store: QdrantStore, manifest: SiteManifest) -> None:
+    await store.upsert(
+        collection=WDK_INGEST_MANIFESTS_V1,
+        points=[
+            {
+                "id": manifest.point_id,
+                "vector": list(_MANIFEST_VECTOR),
+                "payload": manifest.to_payload(),
+            }
+        ],
+    )
@@ -1,6 +1,5 @@
 from collections.abc import Sequence
 from itertools import batched
-from typing import Any, cast
 
 from qdrant_client import AsyncQdrantClient
 
@@ -82,10 +81,7 @@ async def embed_and_upsert(
     await store.upsert(
         collection=collection,
         points=[
-            cast(
-                Any,
-                {"id": pid, "vector": v, "payload": payload},
-            )
+            {"id": pid, "vector": v, "payload": payload}
             for pid, v, payload in zip(ids, vectors, payloads, strict=True)
         ],
     )
@@ -8,30 +8,44 @@ from veupath_chatbot.domain.parameters.specs import unwrap_search_data
 from veupath_chatbot.integrations.embeddings.openai_embeddings import OpenAIEmbeddings
 from veupath_chatbot.integrations.vectorstore.bootstrap import get_embedding_dim
 from veupath_chatbot.integrations.vectorstore.collections import (
+    WDK_INGEST_MANIFESTS_V1,
     WDK_RECORD_TYPES_V1,
     WDK_SEARCHES_V1,
 )
-from veupath_chatbot.integrations.vectorstore.ingest.utils import parse_sites
+from veupath_chatbot.integrations.vectorstore.ingest.manifest import (
+    SiteManifest,
+    catalog_fingerprint,
+    content_hash,
+    ensure_manifest_collection,
+    load_manifest,
+    save_manifest,
+)
+from veupath_chatbot.integrations.vectorstore.ingest.utils import (
+    existing_point_ids,
+    parse_sites,
+)
 from veupath_chatbot.integrations.vectorstore.ingest.wdk_fetch import (
     fetch_record_types_and_searches,
     fetch_search_details,
 )
 from veupath_chatbot.integrations.vectorstore.ingest.wdk_index import (
-    filter_existing_record_types,
-    filter_existing_searches,
     run_search_indexing_pipeline,
     upsert_record_type_docs,
 )
 from veupath_chatbot.integrations.vectorstore.ingest.wdk_transform import (
     build_record_type_doc,
     build_search_doc,
+    search_summary_hash,
+)
+from veupath_chatbot.integrations.vectorstore.qdrant_store import (
+    QdrantStore,
+    point_uuid,
 )
-from veupath_chatbot.integrations.vectorstore.qdrant_store import QdrantStore
 from veupath_chatbot.integrations.veupathdb.param_utils import wdk_entity_name
 from veupath_chatbot.integrations.veupathdb.site_router import get_site_router
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.platform.types import JSONArray, JSONObject
+from veupath_chatbot.platform.types import JSONObject
 
 logger = get_logger(__name__)
 
@@ -46,54 +60,153 @@ async def ingest_site(
     batch_size: int,
     skip_existing: bool,
 ) -> None:
+    """Bring one site's catalog documents in Qdrant up to date.
+
+    With *skip_existing* the site's manifest decides what to do: unchanged
+    catalogs are skipped outright, and otherwise only new or changed
+    documents are fetched, embedded and upserted.  Documents that left the
+    catalog are deleted either way.  Without a manifest (first run after
+    upgrading), documents already in Qdrant are adopted as current.
+
+    A failed listing is not a removal: an empty or malformed record-type
+    listing skips the site, and a failed search listing for any record
+    type skips search deletions for this run.
+    """
     router = get_site_router()
     client = router.get_client(site_id)
 
-    raw_record_types, searches_to_fetch = await fetch_record_types_and_searches(client)
+    (
+        raw_record_types,
+        searches_to_fetch,
+        failed_record_types,
+    ) = await fetch_record_types_and_searches(client)
+    if not raw_record_types:
+        logger.warning("WDK listed no record types; skipping site", siteId=site_id)
+        return
 
-    record_type_docs: JSONArray = []
+    record_type_docs: dict[str, JSONObject] = {}
     for rt in raw_record_types:
         doc = build_record_type_doc(site_id, rt)
         if doc is not None:
-            record_type_docs.append(doc)
+            record_type_docs[str(doc["id"])] = doc
+    rt_hashes = {
+        pid: content_hash({"text": doc.get("text"), "payload": doc.get("payload")})
+        for pid, doc in record_type_docs.items()
+    }
 
-    if skip_existing:
-        record_type_docs = await filter_existing_record_types(
-            qdrant_client, record_type_docs, site_id
-        )
-        searches_to_fetch = await filter_existing_searches(
-            qdrant_client, searches_to_fetch, site_id
-        )
+    searches_by_id: dict[str, tuple[str, JSONObject]] = {}
+    search_hashes: dict[str, str] = {}
+    for rt_name, s in searches_to_fetch:
+        summary_hash = search_summary_hash(rt_name, s)
+        if summary_hash is None:
+            continue
+        pid = point_uuid(f"{site_id}:{rt_name}:{wdk_entity_name(s)}")
+        searches_by_id[pid] = (rt_name, s)
+        search_hashes[pid] = summary_hash
+
+    current = {WDK_RECORD_TYPES_V1: rt_hashes, WDK_SEARCHES_V1: search_hashes}
+    fingerprint = catalog_fingerprint(current)
+
+    stored = await load_manifest(store, site_id)
+    if skip_existing and stored is not None and stored.fingerprint == fingerprint:
+        logger.info("WDK catalog unchanged; skipping site", siteId=site_id)
+        return
 
-    await upsert_record_type_docs(store, embedder, record_type_docs)
+    manifest = SiteManifest(site_id=site_id)
+    if skip_existing and stored is not None:
+        manifest.hashes = stored.hashes
+    elif skip_existing:
+        for collection, hashes in current.items():
+            existing = await existing_point_ids(
+                qdrant_client=qdrant_client, collection=collection, ids=list(hashes)
+            )
+            manifest.collection_hashes(collection).update(
+                {pid: hashes[pid] for pid in existing}
+            )
+    elif stored is not None:
+        # Full rebuild: forget the hashes but keep the IDs so removed
+        # documents are still deleted.
+        manifest.hashes = {
+            collection: dict.fromkeys(hashes, "")
+            for collection, hashes in stored.hashes.items()
+        }
 
-    async def make_doc(rt_name: str, s: JSONObject) -> tuple[JSONObject | None, bool]:
-        if not isinstance(s, dict):
-            return None, False
-        if s.get("isInternal", False):
-            return None, False
-        search_name = wdk_entity_name(s)
-        if not search_name:
-            return None, False
+    try:
+        deletable = [WDK_RECORD_TYPES_V1]
+        if failed_record_types:
+            # The manifest doesn't know which record type a stored search
+            # belongs to, so none can be told apart from a failed listing.
+            logger.warning(
+                "Search listing incomplete; keeping removed searches",
+                siteId=site_id,
+                recordTypes=sorted(failed_record_types),
+            )
+        else:
+            deletable.append(WDK_SEARCHES_V1)
+        for collection in deletable:
+            removed = manifest.removed(collection, current[collection])
+            if removed:
+                await store.delete(collection=collection, point_ids=removed)
+                recorded = manifest.collection_hashes(collection)
+                for pid in removed:
+                    recorded.pop(pid, None)
 
-        summary_unwrapped = unwrap_search_data(s if isinstance(s, dict) else {}) or {}
-        details_unwrapped, details_error = await fetch_search_details(
-            client, rt_name, search_name, summary_unwrapped
+        changed_rts = manifest.changed(WDK_RECORD_TYPES_V1, rt_hashes)
+        await upsert_record_type_docs(
+            store, embedder, [record_type_docs[pid] for pid in changed_rts]
         )
-        doc = build_search_doc(
-            site_id, rt_name, s, details_unwrapped, details_error, client.base_url
+        manifest.collection_hashes(WDK_RECORD_TYPES_V1).update(
+            {pid: rt_hashes[pid] for pid in changed_rts}
         )
-        return doc, details_error is not None
 
-    await run_search_indexing_pipeline(
-        searches_to_fetch=searches_to_fetch,
-        make_doc=make_doc,
-        store=store,
-        embedder=embedder,
-        concurrency=concurrency,
-        batch_size=batch_size,
-        site_id=site_id,
-    )
+        changed_searches = manifest.changed(WDK_SEARCHES_V1, search_hashes)
+        logger.info(
+            "WDK catalog changes",
+            siteId=site_id,
+            recordTypes=len(changed_rts),
+            searches=len(changed_searches),
+            unchangedSearches=len(search_hashes) - len(changed_searches),
+        )
+
+        async def make_doc(
+            rt_name: str, s: JSONObject
+        ) -> tuple[JSONObject | None, bool]:
+            search_name = wdk_entity_name(s)
+            summary_unwrapped = unwrap_search_data(s) or {}
+            details_unwrapped, details_error = await fetch_search_details(
+                client, rt_name, search_name, summary_unwrapped
+            )
+            doc = build_search_doc(
+                site_id, rt_name, s, details_unwrapped, details_error, client.base_url
+            )
+            return doc, details_error is not None
+
+        def record_flushed(batch: list[JSONObject]) -> None:
+            recorded = manifest.collection_hashes(WDK_SEARCHES_V1)
+            for doc in batch:
+                pid = str(doc.get("id"))
+                payload = doc.get("payload")
+                # Docs built without details are retried on the next run.
+                if isinstance(payload, dict) and payload.get("detailsError"):
+                    recorded.pop(pid, None)
+                elif pid in search_hashes:
+                    recorded[pid] = search_hashes[pid]
+
+        await run_search_indexing_pipeline(
+            searches_to_fetch=[searches_by_id[pid] for pid in changed_searches],
+            make_doc=make_doc,
+            store=store,
+            embedder=embedder,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            site_id=site_id,
+            on_flushed=record_flushed,
+        )
+    finally:
+        # Only a fully ingested catalog earns the fingerprint fast path.
+        if all(manifest.hashes.get(c, {}) == h for c, h in current.items()):
+            manifest.fingerprint = fingerprint
+        await save_manifest(store, manifest)
 
 
 async def ingest_wdk_catalog(
@@ -111,10 +224,13 @@ async def ingest_wdk_catalog(
     dim = await get_embedding_dim(settings.embeddings_model)
 
     if reset:
-        await store.reset_collections(WDK_SEARCHES_V1, WDK_RECORD_TYPES_V1)
+        await store.reset_collections(
+            WDK_SEARCHES_V1, WDK_RECORD_TYPES_V1, WDK_INGEST_MANIFESTS_V1
+        )
 
     await store.ensure_collection(name=WDK_RECORD_TYPES_V1, vector_size=dim)
     await store.ensure_collection(name=WDK_SEARCHES_V1, vector_size=dim)
+    await ensure_manifest_collection(store)
 
     embedder = OpenAIEmbeddings(model=settings.embeddings_model)
     concurrency = min(40, max(1, int(os.cpu_count() or 1) * 10))
@@ -179,7 +295,7 @@ async def _cli_async(argv: list[str] | None = None) -> None:
         "--skip-existing",
         action=argparse.BooleanOptionalAction,
         default=True,
-        help="Skip record types/searches that already exist in Qdrant (default: true).",
+        help="Only re-embed record types/searches that changed since the last ingest (default: true).",
     )
     parser.add_argument("--batch-size", type=int, default=64)
     args = parser.parse_args(argv)
@@ -9,7 +9,13 @@ logger = get_logger(__name__)
 
 async def fetch_record_types_and_searches(
     client: VEuPathDBClient,
-) -> tuple[JSONArray, list[tuple[str, JSONObject]]]:
+) -> tuple[JSONArray, list[tuple[str, JSONObject]], set[str]]:
+    """List a site's record types and their searches.
+
+    :returns: Record types, ``(record type, search)`` pairs, and the record
+        types whose search listing failed (their searches are missing from
+        the pairs, not removed from the catalog).
+    """
     raw_record_types = await client.get_record_types(expanded=True)
     if isinstance(raw_record_types, dict):
         raw_record_types = (
@@ -21,6 +27,7 @@ async def fetch_record_types_and_searches(
 
     record_types: JSONArray = []
     searches_to_fetch: list[tuple[str, JSONObject]] = []
+    failed: set[str] = set()
 
     for rt in raw_record_types or []:
         searches: JSONArray = []
@@ -46,13 +53,17 @@ async def fetch_record_types_and_searches(
             try:
                 searches_raw = await client.get_searches(rt_name)
                 searches = searches_raw if isinstance(searches_raw, list) else []
-            except Exception:
+            except Exception as exc:
+                logger.warning(
+                    "Failed to list WDK searches", recordType=rt_name, error=str(exc)
+                )
+                failed.add(rt_name)
                 searches = []
             for s in searches or []:
                 if isinstance(s, dict):
                     searches_to_fetch.append((rt_name, s))
 
-    return record_types, searches_to_fetch
+    return record_types, searches_to_fetch, failed
 
 
 async def fetch_search_details(
@@ -270,6 +270,35 @@ def _build_search_text(
     ).strip()
 
 
+def search_summary_hash(rt_name: str, s: JSONObject) -> str | None:
+    """Hash the catalog-listing fields a search document is built from.
+
+    Covers the search name, display text and parameter summary, so a
+    search whose listing is unchanged need not be re-fetched or re-embedded.
+    Returns ``None`` for searches that are not indexed.
+    """
+    if s.get("isInternal", False):
+        return None
+    search_name = wdk_entity_name(s)
+    if not search_name:
+        return None
+    summary_unwrapped = unwrap_search_data(s) or {}
+    return sha256_hex(
+        stable_json_dumps(
+            {
+                "recordType": rt_name,
+                "searchName": search_name,
+                "displayName": summary_unwrapped.get("displayName"),
+                "shortDisplayName": summary_unwrapped.get("shortDisplayName"),
+                "description": summary_unwrapped.get("description"),
+                "summary": summary_unwrapped.get("summary"),
+                "paramNames": summary_unwrapped.get("paramNames"),
+                "parameters": summary_unwrapped.get("parameters"),
+            }
+        )
+    )
+
+
 def build_search_doc(
     site_id: str,
     rt_name: str,
@@ -2,10 +2,12 @@ import hashlib
 import json
 import threading
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
+import numpy as np
+from numpy.typing import NDArray
 from qdrant_client import AsyncQdrantClient
 
 from veupath_chatbot.platform.config import get_settings
@@ -45,11 +47,46 @@ def point_uuid(key: str) -> str:
     return str(uuid.uuid5(_POINT_ID_NAMESPACE, key))
 
 
+type Vector = Sequence[float] | NDArray[np.float32]
+"""A dense vector: a float sequence or a 1-D float32 array."""
+
+_JSON_FLOAT_BYTES = 12
+"""Upper estimate of one float's size in a REST (JSON) request body."""
+
+
+def batch_by_bytes[T](
+    items: Sequence[T], sizes: Sequence[int], *, max_bytes: int
+) -> Iterator[list[T]]:
+    """Split *items* into consecutive batches of at most *max_bytes*.
+
+    :param items: Items to batch, in order.
+    :param sizes: Estimated size of each item in bytes.
+    :param max_bytes: Batch size limit; an item larger than this on its
+        own gets a batch to itself.
+    """
+    batch: list[T] = []
+    batch_bytes = 0
+    for item, size in zip(items, sizes, strict=True):
+        if batch and batch_bytes + size > max_bytes:
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(item)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
 @dataclass
 class QdrantStore:
     url: str
     api_key: str | None = None
     timeout_seconds: float = 10.0
+    prefer_grpc: bool = False
+    grpc_port: int = 6334
+    max_connections: int = 20
+    keepalive_seconds: float = 30.0
+    upsert_max_bytes: int = 8 * 1024 * 1024
     _shared_client: AsyncQdrantClient | None = field(
         default=None, init=False, repr=False
     )
@@ -59,6 +96,11 @@ class QdrantStore:
 
     @classmethod
     def from_settings(cls) -> QdrantStore:
+        """Return the process-wide store for the configured Qdrant server.
+
+        Stores are registered by URL, credentials and connection options, so
+        every caller with the same settings shares one client and its pool.
+        """
         s = get_settings()
         api_key = s.qdrant_api_key
         if api_key is not None and not str(api_key).strip():
@@ -67,19 +109,59 @@ class QdrantStore:
             url=s.qdrant_url,
             api_key=api_key,
             timeout_seconds=float(s.qdrant_timeout_seconds),
+            prefer_grpc=s.qdrant_prefer_grpc,
+            grpc_port=s.qdrant_grpc_port,
+            max_connections=s.qdrant_max_connections,
+            keepalive_seconds=s.qdrant_keepalive_seconds,
+            upsert_max_bytes=s.qdrant_upsert_max_bytes,
+        )
+        with _stores_lock:
+            return _stores.setdefault(store.registry_key, store)
+
+    @property
+    def registry_key(self) -> tuple[object, ...]:
+        return (
+            self.url,
+            self.api_key,
+            self.timeout_seconds,
+            self.prefer_grpc,
+            self.grpc_port,
+            self.max_connections,
+            self.keepalive_seconds,
+            self.upsert_max_bytes,
         )
-        _active_stores.append(store)
-        return store
 
     def _create_client(self) -> AsyncQdrantClient:
+        import httpx
         from qdrant_client import AsyncQdrantClient
 
+        timeout = (
+            int(self.timeout_seconds) if self.timeout_seconds is not None else None
+        )
+        if self.prefer_grpc:
+            keepalive_ms = int(self.keepalive_seconds * 1000)
+            return AsyncQdrantClient(
+                url=self.url,
+                api_key=self.api_key,
+                timeout=timeout,
+                prefer_grpc=True,
+                grpc_port=self.grpc_port,
+                grpc_options={
+                    "grpc.keepalive_time_ms": keepalive_ms,
+                    "grpc.keepalive_permit_without_calls": 1,
+                },
+            )
+        # qdrant-client disables keep-alive for localhost by default; keep
+        # connections open so RAG lookups skip the TCP handshake.
         return AsyncQdrantClient(
             url=self.url,
             api_key=self.api_key,
-            timeout=int(self.timeout_seconds)
-            if self.timeout_seconds is not None
-            else None,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_seconds,
+            ),
         )
 
     def _get_client(self) -> AsyncQdrantClient:
@@ -159,52 +241,67 @@ class QdrantStore:
         self,
         *,
         collection: str,
-        points: JSONArray,
+        points: Sequence[object],
     ) -> None:
-        """Upsert points.\n\n        Each point dict: {\"id\": str|int, \"vector\": list[float], \"payload\": dict}\n"""
-        from qdrant_client.models import PointStruct
+        """Upsert points in batches of at most ``upsert_max_bytes``.
 
-        from veupath_chatbot.platform.types import as_json_object
+        Each point is a mapping ``{"id": str|int, "vector": Vector,
+        "payload": dict}``; vectors are converted to float32 arrays in one
+        step.  Points without an ID or a numeric 1-D vector are skipped.
+        """
+        from qdrant_client.models import PointStruct
 
         q_points: list[PointStruct] = []
-        for p_value in points:
-            if not isinstance(p_value, dict):
+        sizes: list[int] = []
+        float_bytes = 4 if self.prefer_grpc else _JSON_FLOAT_BYTES
+        for p in points:
+            if not isinstance(p, Mapping):
                 continue
-            p = as_json_object(p_value)
             point_id = p.get("id")
             vector_value = p.get("vector")
             payload_value = p.get("payload")
 
             if point_id is None or vector_value is None:
                 continue
-
-            # Ensure vector is list[float]
-            if not isinstance(vector_value, list):
+            try:
+                vector = np.asarray(vector_value, dtype=np.float32)
+            except TypeError, ValueError:
                 continue
-            vector: list[float] = []
-            for v in vector_value:
-                if isinstance(v, (int, float)):
-                    vector.append(float(v))
-                else:
-                    break
-            else:
-                # Only create PointStruct if vector is valid
-                payload: JSONObject = {}
-                if isinstance(payload_value, dict):
-                    payload = {str(k): v for k, v in payload_value.items()}
-                q_points.append(
-                    PointStruct(
-                        id=point_id
-                        if isinstance(point_id, (str, int))
-                        else str(point_id),
-                        vector=vector,
-                        payload=payload,
-                    )
+            if vector.ndim != 1:
+                continue
+
+            payload: JSONObject = {}
+            if isinstance(payload_value, dict):
+                payload = {str(k): v for k, v in payload_value.items()}
+            q_points.append(
+                PointStruct(
+                    id=point_id if isinstance(point_id, (str, int)) else str(point_id),
+                    vector=vector.tolist(),
+                    payload=payload,
                 )
+            )
+            sizes.append(
+                vector.size * float_bytes + len(json.dumps(payload, default=str))
+            )
         if not q_points:
             return
         async with self.connect() as client:
-            await client.upsert(collection_name=collection, points=q_points)
+            for batch in batch_by_bytes(
+                q_points, sizes, max_bytes=self.upsert_max_bytes
+            ):
+                await client.upsert(collection_name=collection, points=batch)
+
+    async def delete(self, *, collection: str, point_ids: list[str]) -> None:
+        """Delete points by ID (missing IDs are ignored)."""
+        from qdrant_client.models import PointIdsList
+
+        if not point_ids:
+            return
+        async with self.connect() as client:
+            await client.delete(
+                collection_name=collection,
+                points_selector=PointIdsList(points=list(point_ids)),
+            )
 
     async def get(self, *, collection: str, point_id: str) -> JSONObject | None:
         async with self.connect() as client:
@@ -226,7 +323,7 @@ class QdrantStore:
         # p.vector is either None or list[float].
         vector: JSONValue = None
         if isinstance(p.vector, list):
-            vector = [float(v) for v in p.vector if isinstance(v, (int, float))]
+            vector = np.asarray(p.vector, dtype=np.float64).tolist()
         return {
             "id": str(p.id),
             "payload": p.payload or {},
@@ -237,7 +334,7 @@ class QdrantStore:
         self,
         *,
         collection: str,
-        query_vector: list[float],
+        query_vector: Vector,
         limit: int = 10,
         must: JSONArray | None = None,
         must_not: JSONArray | None = None,
@@ -312,7 +409,7 @@ class QdrantStore:
             try:
                 hits = await client.query_points(
                     collection_name=collection,
-                    query=query_vector,
+                    query=np.asarray(query_vector, dtype=np.float32),
                     query_filter=f,
                     limit=max(int(limit), 1),
                     with_payload=True,
@@ -332,7 +429,8 @@ class QdrantStore:
             ]
 
 
-_active_stores: list[QdrantStore] = []
+_stores: dict[tuple[object, ...], QdrantStore] = {}
+_stores_lock = threading.Lock()
 
 
 async def close_all_qdrant_stores() -> None:
@@ -340,9 +438,11 @@ async def close_all_qdrant_stores() -> None:
 
     Called during application shutdown to release all Qdrant connection pools.
     """
-    for store in list(_active_stores):
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
         await store.close()
-    _active_stores.clear()
 
 
 def _maybe_log_qdrant_error(op: str, *, collection: str, error: Exception) -> None:
@@ -0,0 +1,363 @@
+"""Adaptive, multiplexed status polling for WDK step analyses.
+
+WDK step analyses finish anywhere from a few hundred milliseconds (small
+word enrichments) to several minutes (GO enrichment on a large boolean
+step).  A fixed poll interval either wastes seconds on short analyses or
+floods WDK with status calls on long ones.
+
+:class:`AnalysisPoller` runs **one** poll loop per site.  Every pending
+analysis registers an entry with its own adaptive schedule (fast first
+check, exponential growth, jitter, capped at the site's maximum) and a
+future that is resolved as soon as that analysis reaches a terminal
+status.  The loop sleeps until the earliest entry is due, starts a check
+task for each due entry (so one slow status call doesn't hold up the
+others), and exits when nothing is pending.  Waiters on the same analysis
+share one entry.
+"""
+
+import asyncio
+import contextlib
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from veupath_chatbot.integrations.veupathdb.client import VEuPathDBClient
+from veupath_chatbot.platform.errors import InternalError
+from veupath_chatbot.platform.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: Delay before the first status check of a new analysis (seconds).
+DEFAULT_INITIAL_INTERVAL = 0.25
+#: Multiplier applied to the interval after each non-terminal poll.
+DEFAULT_GROWTH = 1.6
+#: Relative jitter (``±``) applied to each scheduled delay.
+DEFAULT_JITTER = 0.2
+#: Upper bound on the interval between polls of one analysis (seconds).
+DEFAULT_MAX_INTERVAL = 5.0
+#: Floor on every delay, so a zero interval cannot turn polling into a hot loop.
+MIN_INTERVAL = 0.01
+#: Extra seconds past ``max_wait`` a waiter allows for an in-flight status call.
+DEFAULT_DEADLINE_GRACE = 30.0
+
+_TERMINAL_FAILURE_STATUSES = frozenset({"EXPIRED", "INTERRUPTED"})
+_RETRIABLE_STATUSES = frozenset({"ERROR", "OUT_OF_DATE", "STEP_REVISED"})
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    initial: float = DEFAULT_INITIAL_INTERVAL,
+    growth: float = DEFAULT_GROWTH,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    jitter: float = DEFAULT_JITTER,
+) -> float:
+    """Return the jittered delay for the *attempt*-th wait (0-based).
+
+    The un-jittered delay is ``initial * growth**attempt`` capped at
+    *max_interval*; jitter spreads concurrent waiters so they don't poll
+    WDK in lock-step.  *initial* (and so every delay) is clamped to at
+    least :data:`MIN_INTERVAL`.
+    """
+    initial = max(MIN_INTERVAL, initial)
+    max_interval = max(MIN_INTERVAL, max_interval)
+    base = min(max_interval, initial * (growth ** max(0, attempt)))
+    if jitter <= 0:
+        return base
+    delay = min(max_interval, base * random.uniform(1 - jitter, 1 + jitter))
+    return max(MIN_INTERVAL, delay)
+
+
+def _mark_retrieved(future: asyncio.Future[None]) -> None:
+    # Waiters read the outcome through shields that may have been dropped
+    # (timed out or cancelled) by the time it is set.
+    if not future.cancelled():
+        future.exception()
+
+
+@dataclass
+class _PendingAnalysis:
+    """Book-keeping for one analysis awaiting completion."""
+
+    client: VEuPathDBClient
+    user_id: str
+    step_id: int
+    analysis_id: int
+    initial_interval: float
+    deadline: float
+    max_wait: float
+    max_retries: int
+    future: asyncio.Future[None]
+    on_exhausted: Callable[[], None] | None = None
+    attempt: int = 0
+    retries: int = 0
+    next_poll_at: float = field(default=0.0)
+    waiters: int = 0
+    checking: bool = False
+
+
+class AnalysisPoller:
+    """Single poll loop shared by every pending analysis on one site."""
+
+    def __init__(
+        self,
+        *,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        growth: float = DEFAULT_GROWTH,
+        jitter: float = DEFAULT_JITTER,
+        deadline_grace: float = DEFAULT_DEADLINE_GRACE,
+    ) -> None:
+        self.max_interval = max_interval
+        self.growth = growth
+        self.jitter = jitter
+        self.deadline_grace = deadline_grace
+        self._pending: dict[tuple[str, int, int], _PendingAnalysis] = {}
+        self._checks: set[asyncio.Task[None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of analyses currently awaiting a terminal status."""
+        return len(self._pending)
+
+    def _delay(self, entry: _PendingAnalysis) -> float:
+        return backoff_delay(
+            entry.attempt,
+            initial=entry.initial_interval,
+            growth=self.growth,
+            max_interval=max(self.max_interval, entry.initial_interval),
+            jitter=self.jitter,
+        )
+
+    def _ensure_loop(self) -> None:
+        """Start the poll loop on the running event loop if it isn't alive."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done():
+            if self._task.get_loop() is loop:
+                return
+            # A loop from a previous event loop (e.g. a closed test loop)
+            # can never resolve its futures; drop it and start fresh.
+            self._pending.clear()
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="wdk-analysis-poller")
+
+    async def wait(
+        self,
+        client: VEuPathDBClient,
+        user_id: str,
+        step_id: int,
+        analysis_id: int,
+        *,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_wait: float = 300.0,
+        max_retries: int = 3,
+        on_exhausted: Callable[[], None] | None = None,
+    ) -> None:
+        """Wait until *analysis_id* completes, re-running on retriable statuses.
+
+        A second wait on an analysis that is already pending joins the
+        first one's entry (and its schedule, deadline and retries).
+
+        :param client: Site client used for status and re-run calls.
+        :param user_id: Resolved WDK user ID.
+        :param step_id: WDK step ID the analysis belongs to.
+        :param analysis_id: Analysis instance ID.
+        :param initial_interval: Delay before the first status check.
+        :param max_wait: Maximum seconds to wait before giving up.
+        :param max_retries: Maximum re-run attempts for retriable statuses.
+        :param on_exhausted: Called once retries are exhausted, before raising.
+        :raises InternalError: If the analysis fails, expires, or times out.
+        """
+        self._ensure_loop()
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        key = (user_id, step_id, analysis_id)
+        entry = self._pending.get(key)
+        if entry is None or entry.future.done():
+            entry = _PendingAnalysis(
+                client=client,
+                user_id=user_id,
+                step_id=step_id,
+                analysis_id=analysis_id,
+                initial_interval=max(MIN_INTERVAL, initial_interval),
+                deadline=now + max_wait,
+                max_wait=max_wait,
+                max_retries=max_retries,
+                future=loop.create_future(),
+                on_exhausted=on_exhausted,
+            )
+            entry.future.add_done_callback(_mark_retrieved)
+            entry.next_poll_at = now + self._delay(entry)
+            self._pending[key] = entry
+            if self._wake is not None:
+                self._wake.set()
+        entry.waiters += 1
+        try:
+            # The shield keeps one waiter's cancellation or timeout from
+            # resolving the entry other waiters still share; the timeout
+            # covers a status call that never returns.
+            await asyncio.wait_for(
+                asyncio.shield(entry.future),
+                timeout=max(0.0, entry.deadline - now) + self.deadline_grace,
+            )
+        except TimeoutError:
+            exc = InternalError(
+                title="Step analysis timed out",
+                detail=(
+                    f"Analysis {entry.analysis_id} did not complete "
+                    f"within {entry.max_wait}s"
+                ),
+            )
+            self._finish(entry, exc)
+            raise exc from None
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.future.done():
+                entry.future.cancel()
+                self._finish(entry, None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            now = loop.time()
+            idle = [e for e in self._pending.values() if not e.checking]
+            due = [e for e in idle if e.next_poll_at <= now]
+            if not due:
+                timeout = (
+                    min(e.next_poll_at for e in idle) - now
+                    if idle
+                    else self.max_interval
+                )
+                wake = self._wake
+                if wake is None:
+                    await asyncio.sleep(timeout)
+                    continue
+                wake.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wake.wait(), timeout=timeout)
+                continue
+            for entry in due:
+                entry.checking = True
+                task = loop.create_task(self._check(entry))
+                self._checks.add(task)
+                task.add_done_callback(self._check_done)
+
+    def _check_done(self, task: asyncio.Task[None]) -> None:
+        self._checks.discard(task)
+        if self._wake is not None:
+            self._wake.set()
+
+    def _finish(self, entry: _PendingAnalysis, exc: BaseException | None) -> None:
+        key = (entry.user_id, entry.step_id, entry.analysis_id)
+        if self._pending.get(key) is entry:
+            del self._pending[key]
+        if entry.future.done():
+            return
+        if exc is None:
+            entry.future.set_result(None)
+        else:
+            entry.future.set_exception(exc)
+
+    async def _check(self, entry: _PendingAnalysis) -> None:
+        """Poll one analysis and resolve or reschedule it."""
+        try:
+            await self._poll(entry)
+        finally:
+            entry.checking = False
+
+    async def _poll(self, entry: _PendingAnalysis) -> None:
+        if entry.future.done():
+            self._finish(entry, None)
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            status_resp = await entry.client.get_analysis_status(
+                entry.user_id, entry.step_id, entry.analysis_id
+            )
+            status = (
+                str(status_resp.get("status", ""))
+                if isinstance(status_resp, dict)
+                else ""
+            )
+            logger.debug(
+                "Analysis status poll",
+                analysis_id=entry.analysis_id,
+                status=status,
+                attempt=entry.attempt,
+            )
+
+            if status == "COMPLETE":
+                self._finish(entry, None)
+                return
+            if status in _TERMINAL_FAILURE_STATUSES:
+                raise InternalError(
+                    title="Step analysis failed",
+                    detail=f"Analysis {entry.analysis_id} ended with status: {status}",
+                )
+            if status in _RETRIABLE_STATUSES:
+                entry.retries += 1
+                logger.warning(
+                    "Analysis returned retriable status",
+                    analysis_id=entry.analysis_id,
+                    status=status,
+                    status_response=status_resp,
+                    retry=entry.retries,
+                )
+                if entry.retries > entry.max_retries:
+                    if entry.on_exhausted is not None:
+                        entry.on_exhausted()
+                    raise InternalError(
+                        title="Analysis unavailable",
+                        detail=(
+                            f"VEuPathDB could not complete this analysis "
+                            f"(returned {status} after {entry.retries} attempts). "
+                            f"This typically happens when the gene set is too "
+                            f"small or lacks the required annotations."
+                        ),
+                    )
+                # WDK's requiresRerun flag means re-running the same instance
+                # resets it to PENDING and re-executes automatically.  The
+                # re-run starts from a fresh schedule.
+                await entry.client.run_analysis_instance(
+                    entry.user_id, entry.step_id, entry.analysis_id
+                )
+                entry.attempt = 0
+            else:
+                entry.attempt += 1
+        except Exception as exc:
+            self._finish(entry, exc)
+            return
+
+        now = loop.time()
+        if now >= entry.deadline:
+            self._finish(
+                entry,
+                InternalError(
+                    title="Step analysis timed out",
+                    detail=(
+                        f"Analysis {entry.analysis_id} did not complete "
+                        f"within {entry.max_wait}s"
+                    ),
+                ),
+            )
+            return
+        entry.next_poll_at = min(now + self._delay(entry), entry.deadline)
+
+
+_pollers: dict[str, AnalysisPoller] = {}
+
+
+def get_analysis_poller(client: VEuPathDBClient) -> AnalysisPoller:
+    """Return the shared poller for the site served by *client*.
+
+    Pollers are keyed by the client's base URL so every ``StrategyAPI``
+    instance for a site shares one poll loop; the site's
+    ``analysis_poll_max_interval`` caps its schedule.
+    """
+    key = client.base_url
+    poller = _pollers.get(key)
+    if poller is None:
+        poller = AnalysisPoller(max_interval=client.analysis_poll_max_interval)
+        _pollers[key] = poller
+    return poller
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import re
 from collections.abc import Mapping, Sequence
 from typing import cast
 
@@ -14,14 +15,31 @@ from tenacity import (
     wait_exponential,
 )
 
+from veupath_chatbot.integrations.veupathdb.shared_lookups import (
+    current_shared_lookups,
+)
+from veupath_chatbot.platform.admission import get_admission_controller
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.context import veupathdb_auth_token_ctx
 from veupath_chatbot.platform.errors import WDKError
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.tracing import span
 from veupath_chatbot.platform.types import JSONArray, JSONObject, JSONValue
 
 logger = get_logger(__name__)
 
+# Path segments that identify one object (step/strategy/dataset IDs).
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(method: str, path: str) -> str:
+    """Collapse object IDs in *path* so calls group by endpoint.
+
+    ``GET /users/current/steps/123/reports/standard`` becomes
+    ``GET /users/current/steps/{id}/reports/standard``.
+    """
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path.split('?', 1)[0])}"
+
 
 def encode_context_param_values_for_wdk(context: JSONObject) -> JSONObject:
     """Encode contextParamValues in the format WDK expects.
@@ -94,10 +112,12 @@ class VEuPathDBClient:
         *,
         max_connections: int = 1000,
         max_keepalive_connections: int = 200,
+        analysis_poll_max_interval: float = 5.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.auth_token = auth_token
+        self.analysis_poll_max_interval = float(analysis_poll_max_interval)
         self.max_connections = int(max_connections)
         self.max_keepalive_connections = int(max_keepalive_connections)
         self._client: httpx.AsyncClient | None = None
@@ -248,7 +268,20 @@ class VEuPathDBClient:
         so callers only need to handle domain errors.
         """
         try:
-            return await self._request_attempt(method, path, params=params, json=json)
+            with (
+                span(
+                    "wdk.request",
+                    category="wdk",
+                    endpoint=endpoint_template(method, path),
+                    method=method,
+                    path=path,
+                    base_url=self.base_url,
+                ),
+                get_admission_controller().track_wdk_request(),
+            ):
+                return await self._request_attempt(
+                    method, path, params=params, json=json
+                )
         except RetryError as e:
             last = e.last_attempt.exception()
             status = 502
@@ -305,15 +338,28 @@ class VEuPathDBClient:
         search_name: str,
         expand_params: bool = True,
     ) -> JSONObject:
-        """Get detailed search configuration including parameters."""
+        """Get detailed search configuration including parameters.
+
+        Shared with concurrent callers inside a
+        :func:`~veupath_chatbot.integrations.veupathdb.shared_lookups.shared_lookups`
+        block.
+        """
         params: JSONObject | None = {"expandParams": "true"} if expand_params else None
-        return cast(
-            JSONObject,
-            await self.get(
-                f"/record-types/{record_type}/searches/{search_name}",
-                params=params,
-            ),
-        )
+
+        async def _fetch() -> JSONObject:
+            return cast(
+                JSONObject,
+                await self.get(
+                    f"/record-types/{record_type}/searches/{search_name}",
+                    params=params,
+                ),
+            )
+
+        memo = current_shared_lookups()
+        if memo is None:
+            return await _fetch()
+        key = ("search-details", self.base_url, record_type, search_name, expand_params)
+        return await memo.get(key, _fetch)
 
     async def get_search_details_with_params(
         self,
@@ -322,17 +368,35 @@ class VEuPathDBClient:
         context: JSONObject,
         expand_params: bool = True,
     ) -> JSONObject:
-        """Get detailed search configuration using provided parameters."""
+        """Get detailed search configuration using provided parameters.
+
+        Shared like :meth:`get_search_details`, keyed by the encoded context.
+        """
         params: JSONObject | None = {"expandParams": "true"} if expand_params else None
         encoded_context = encode_context_param_values_for_wdk(context or {})
-        return cast(
-            JSONObject,
-            await self.post(
-                f"/record-types/{record_type}/searches/{search_name}",
-                json={"contextParamValues": encoded_context},
-                params=params,
-            ),
+
+        async def _fetch() -> JSONObject:
+            return cast(
+                JSONObject,
+                await self.post(
+                    f"/record-types/{record_type}/searches/{search_name}",
+                    json={"contextParamValues": encoded_context},
+                    params=params,
+                ),
+            )
+
+        memo = current_shared_lookups()
+        if memo is None:
+            return await _fetch()
+        key = (
+            "search-details",
+            self.base_url,
+            record_type,
+            search_name,
+            expand_params,
+            json.dumps(encoded_context, sort_keys=True),
         )
+        return await memo.get(key, _fetch)
 
     async def get_refreshed_dependent_params(
         self,
@@ -2,6 +2,7 @@
 
 import asyncio
 import threading
+from collections.abc import Sequence
 
 from veupath_chatbot.integrations.veupathdb.client import VEuPathDBClient
 from veupath_chatbot.integrations.veupathdb.param_utils import (
@@ -207,18 +208,35 @@ class DiscoveryService:
             expand_params=expand_params,
         )
 
-    async def preload_all(self) -> None:
-        """Preload catalogs for all sites."""
-        router = get_site_router()
-        sites = router.list_sites()
+    async def preload(self, site_ids: Sequence[str], *, concurrency: int = 4) -> None:
+        """Load catalogs for *site_ids*, at most *concurrency* at a time.
 
-        async def load_site(site_id: str) -> None:
-            try:
-                await self.get_catalog(site_id)
-            except Exception as e:
-                logger.warning("Failed to preload site", site_id=site_id, error=str(e))
+        Sites start in the given order; a site that fails to load is logged
+        and left to load lazily on first use.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        await asyncio.gather(*[load_site(s.id) for s in sites])
+        async def load_site(site_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.get_catalog(site_id)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to preload site", site_id=site_id, error=str(e)
+                    )
+
+        await asyncio.gather(*[load_site(site_id) for site_id in site_ids])
+
+    async def preload_all(
+        self, *, first: Sequence[str] = (), concurrency: int = 4
+    ) -> None:
+        """Preload catalogs for all sites, loading *first* before the rest."""
+        router = get_site_router()
+        priority = [site_id for site_id in first if site_id]
+        if priority:
+            await self.preload(priority, concurrency=concurrency)
+        rest = [s.id for s in router.list_sites() if s.id not in priority]
+        await self.preload(rest, concurrency=concurrency)
 
 
 # Global discovery service
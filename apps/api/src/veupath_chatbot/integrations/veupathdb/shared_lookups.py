@@ -0,0 +1,82 @@
+"""Share identical WDK metadata lookups across concurrent work.
+
+A batch experiment runs the same search for many organisms at once; each
+run fetches the same search details (with expanded vocabularies) and
+resolves the same controls parameter type.  Inside a
+:func:`shared_lookups` block, :class:`VEuPathDBClient` routes those reads
+through one :class:`SharedLookups` memo, so each distinct lookup hits WDK
+once however many tasks ask for it concurrently.
+
+The memo lives in a ContextVar: tasks spawned inside the block (e.g. via
+``asyncio.gather``) inherit it, and nothing outside the block sees it.
+"""
+
+import asyncio
+import copy
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from veupath_chatbot.platform.types import JSONObject
+
+
+class SharedLookups:
+    """Memo of in-flight and finished lookups, keyed by request identity."""
+
+    def __init__(self) -> None:
+        self._futures: dict[Hashable, asyncio.Future[JSONObject]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, key: Hashable, fetch: Callable[[], Awaitable[JSONObject]]
+    ) -> JSONObject:
+        """Return the result for *key*, calling *fetch* only for the first caller.
+
+        Concurrent callers wait on the same request.  Failures are not
+        memoized, so a later caller retries.  Each caller gets its own
+        copy, since callers may mutate what they receive.
+        """
+        future = self._futures.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.ensure_future(fetch())
+            self._futures[key] = future
+            future.add_done_callback(lambda f: self._forget_failure(key, f))
+        else:
+            self.hits += 1
+        # Shielded so one cancelled waiter doesn't cancel the shared request.
+        return copy.deepcopy(await asyncio.shield(future))
+
+    def _forget_failure(
+        self, key: Hashable, future: asyncio.Future[JSONObject]
+    ) -> None:
+        if (future.cancelled() or future.exception() is not None) and (
+            self._futures.get(key) is future
+        ):
+            del self._futures[key]
+
+
+_current: ContextVar[SharedLookups | None] = ContextVar(
+    "veupathdb_shared_lookups", default=None
+)
+
+
+def current_shared_lookups() -> SharedLookups | None:
+    """Return the memo of the enclosing :func:`shared_lookups` block, if any."""
+    return _current.get()
+
+
+@contextmanager
+def shared_lookups() -> Iterator[SharedLookups]:
+    """Share WDK metadata lookups made inside the block (nested blocks reuse it)."""
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+    memo = SharedLookups()
+    token = _current.set(memo)
+    try:
+        yield memo
+    finally:
+        _current.reset(token)
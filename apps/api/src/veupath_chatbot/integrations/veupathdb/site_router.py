@@ -28,6 +28,7 @@ class SiteConfig(BaseModel):
     base_url: str = ""
     project_id: str = ""
     is_portal: bool = False
+    analysis_poll_max_interval: float | None = None
 
 
 class RoutingConfig(BaseModel):
@@ -35,6 +36,7 @@ class RoutingConfig(BaseModel):
 
     portal_timeout: float = 120.0
     component_timeout: float = 30.0
+    analysis_poll_max_interval: float = 5.0
 
 
 class SitesConfig(BaseModel):
@@ -202,10 +204,17 @@ class SiteRouter:
                     if site.is_portal
                     else routing.component_timeout
                 )
+                site_cfg = self._config.sites.get(site_id)
+                poll_cap = (
+                    site_cfg.analysis_poll_max_interval
+                    if site_cfg and site_cfg.analysis_poll_max_interval is not None
+                    else routing.analysis_poll_max_interval
+                )
                 self._clients[site_id] = VEuPathDBClient(
                     base_url=site.service_url,
                     timeout=float(timeout),
                     auth_token=settings.veupathdb_auth_token,
+                    analysis_poll_max_interval=float(poll_cap),
                 )
             return self._clients[site_id]
 
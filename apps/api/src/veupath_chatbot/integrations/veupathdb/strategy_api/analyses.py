@@ -6,6 +6,10 @@ create, run, poll, and retrieve step analysis results.
 
 import asyncio
 
+from veupath_chatbot.integrations.veupathdb.analysis_poller import (
+    DEFAULT_INITIAL_INTERVAL,
+    get_analysis_poller,
+)
 from veupath_chatbot.integrations.veupathdb.strategy_api.base import StrategyAPIBase
 from veupath_chatbot.platform.errors import InternalError
 from veupath_chatbot.platform.logging import get_logger
@@ -17,8 +21,6 @@ logger = get_logger(__name__)
 class AnalysisMixin(StrategyAPIBase):
     """Mixin providing step analysis lifecycle methods."""
 
-    _RETRIABLE_STATUSES = frozenset({"ERROR", "OUT_OF_DATE", "STEP_REVISED"})
-
     async def list_analysis_types(self, step_id: int) -> JSONArray:
         """List available analysis types for a step."""
         await self._ensure_session()
@@ -100,78 +102,31 @@ class AnalysisMixin(StrategyAPIBase):
         max_wait: float,
         max_retries: int,
     ) -> None:
-        """Poll an analysis instance until completion, retrying on transient errors.
+        """Wait for an analysis instance to complete, retrying on transient errors.
+
+        Registers the analysis with the site's shared
+        :class:`~veupath_chatbot.integrations.veupathdb.analysis_poller.AnalysisPoller`,
+        which checks it on an adaptive schedule (starting at *poll_interval*,
+        growing exponentially with jitter up to the site cap) alongside every
+        other pending analysis on the site.
 
         :param step_id: WDK step ID.
         :param analysis_id: Analysis instance ID.
-        :param poll_interval: Seconds between status polls.
+        :param poll_interval: Delay before the first status poll.
         :param max_wait: Maximum seconds to wait before giving up.
         :param max_retries: Maximum re-run attempts for retriable statuses.
         :raises InternalError: If the analysis fails, expires, or times out.
         """
-        elapsed = 0.0
-        retries = 0
-        while elapsed < max_wait:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-
-            status_resp = await self.client.get_analysis_status(
-                self.user_id, step_id, analysis_id
-            )
-            status = (
-                str(status_resp.get("status", ""))
-                if isinstance(status_resp, dict)
-                else ""
-            )
-            logger.debug(
-                "Analysis status poll",
-                analysis_id=analysis_id,
-                status=status,
-                elapsed=elapsed,
-            )
-
-            if status == "COMPLETE":
-                return
-            if status in ("EXPIRED", "INTERRUPTED"):
-                raise InternalError(
-                    title="Step analysis failed",
-                    detail=f"Analysis {analysis_id} ended with status: {status}",
-                )
-            if status in self._RETRIABLE_STATUSES:
-                retries += 1
-                logger.warning(
-                    "Analysis returned retriable status",
-                    analysis_id=analysis_id,
-                    status=status,
-                    status_response=status_resp,
-                    retry=retries,
-                )
-                if retries > max_retries:
-                    self._log_analysis_failure(step_id, analysis_id)
-                    raise InternalError(
-                        title="Analysis unavailable",
-                        detail=(
-                            f"VEuPathDB could not complete this analysis "
-                            f"(returned {status} after {retries} attempts). "
-                            f"This typically happens when the gene set is too "
-                            f"small or lacks the required annotations."
-                        ),
-                    )
-                # WDK's requiresRerun flag means re-running the same instance
-                # resets it to PENDING and re-executes automatically.
-                logger.warning(
-                    "Re-running same analysis instance",
-                    analysis_id=analysis_id,
-                    status=status,
-                    retry=retries,
-                )
-                await self.client.run_analysis_instance(
-                    self.user_id, step_id, analysis_id
-                )
-
-        raise InternalError(
-            title="Step analysis timed out",
-            detail=f"Analysis {analysis_id} did not complete within {max_wait}s",
+        poller = get_analysis_poller(self.client)
+        await poller.wait(
+            self.client,
+            self.user_id,
+            step_id,
+            analysis_id,
+            initial_interval=poll_interval,
+            max_wait=max_wait,
+            max_retries=max_retries,
+            on_exhausted=lambda: self._log_analysis_failure(step_id, analysis_id),
         )
 
     def _log_analysis_failure(self, step_id: int, analysis_id: int) -> None:
@@ -220,7 +175,7 @@ class AnalysisMixin(StrategyAPIBase):
         analysis_type: str,
         parameters: JSONObject | None = None,
         custom_name: str | None = None,
-        poll_interval: float = 2.0,
+        poll_interval: float = DEFAULT_INITIAL_INTERVAL,
         max_wait: float = 300.0,
         max_retries: int = 3,
     ) -> JSONObject:
@@ -243,7 +198,8 @@ class AnalysisMixin(StrategyAPIBase):
         :param analysis_type: Analysis plugin name (e.g. ``go-enrichment``).
         :param parameters: Analysis parameters.
         :param custom_name: Optional display name.
-        :param poll_interval: Seconds between status polls.
+        :param poll_interval: Delay before the first status poll; later polls
+            back off adaptively up to the site's cap.
         :param max_wait: Maximum seconds to wait before giving up.
         :param max_retries: Maximum re-run attempts for retriable statuses.
         :returns: Analysis result JSON.
@@ -8,10 +8,13 @@ from veupath_chatbot.integrations.vectorstore.ingest.wdk_catalog import (
     ingest_wdk_catalog,
 )
 from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.health import set_subsystem_state
 from veupath_chatbot.platform.logging import get_logger
 
 logger = get_logger(__name__)
 
+RAG_INGEST = "rag_ingest"
+
 _startup_task: asyncio.Task[None] | None = None
 _startup_lock = asyncio.Lock()
 
@@ -27,11 +30,13 @@ async def start_rag_startup_ingestion_background() -> None:
 
     settings = get_settings()
     if not settings.rag_enabled:
+        set_subsystem_state(RAG_INGEST, "disabled")
         return
     if not settings.openai_api_key:
         logger.warning(
             "RAG enabled but OPENAI_API_KEY not set; skipping startup ingestion"
         )
+        set_subsystem_state(RAG_INGEST, "disabled", "OPENAI_API_KEY not set")
         return
 
     async with _startup_lock:
@@ -56,7 +61,8 @@ async def start_rag_startup_ingestion_background() -> None:
                 publicStrategiesLlmModel=llm_model,
             )
             try:
-                # 1) WDK catalog (record types + searches)
+                # 1) WDK catalog (record types + searches); only documents
+                #    that changed since the last ingest are re-embedded.
                 await ingest_wdk_catalog(sites=None, reset=False, skip_existing=True)
 
                 # 2) Example plans from public strategies
@@ -75,8 +81,11 @@ async def start_rag_startup_ingestion_background() -> None:
                     error=str(exc),
                     errorType=type(exc).__name__,
                 )
+                set_subsystem_state(RAG_INGEST, "failed", str(exc))
                 return
 
             logger.info("RAG startup ingestion complete")
+            set_subsystem_state(RAG_INGEST, "ready")
 
+        set_subsystem_state(RAG_INGEST, "warming")
         _startup_task = asyncio.create_task(_run())
@@ -0,0 +1,89 @@
+"""Background warmup run after the API starts serving.
+
+Startup only blocks on the core dependencies (database, Redis).  Everything
+slower is warmed here, in priority order, while requests are already being
+served:
+
+1. vector store collections and the default site's WDK catalog;
+2. RAG ingestion (itself a background job);
+3. optionally, the catalogs of every other site.
+
+Each step reports its state via :func:`set_subsystem_state`, which the
+readiness probe exposes.  Anything not yet warm loads lazily on first use.
+"""
+
+import asyncio
+
+from veupath_chatbot.integrations.vectorstore.bootstrap import ensure_rag_collections
+from veupath_chatbot.integrations.veupathdb.discovery import get_discovery_service
+from veupath_chatbot.integrations.veupathdb.site_router import get_site_router
+from veupath_chatbot.jobs.rag_startup import start_rag_startup_ingestion_background
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.health import set_subsystem_state
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.tasks import spawn
+
+logger = get_logger(__name__)
+
+VECTORSTORE = "vectorstore"
+CATALOG = "catalog"
+CATALOG_ALL_SITES = "catalog_all_sites"
+
+
+async def _warm_vectorstore() -> None:
+    if not get_settings().rag_enabled:
+        set_subsystem_state(VECTORSTORE, "disabled")
+        return
+    set_subsystem_state(VECTORSTORE, "warming")
+    try:
+        await ensure_rag_collections()
+    except Exception as exc:
+        # RAG lookups degrade to empty results; the API keeps serving.
+        logger.warning("Failed to ensure RAG collections", error=str(exc))
+        set_subsystem_state(VECTORSTORE, "failed", str(exc))
+        return
+    set_subsystem_state(VECTORSTORE, "ready")
+
+
+async def _warm_default_catalog() -> None:
+    set_subsystem_state(CATALOG, "warming")
+    try:
+        site_id = get_site_router().get_default_site().id
+        await get_discovery_service().get_catalog(site_id)
+    except Exception as exc:
+        logger.warning("Failed to warm default site catalog", error=str(exc))
+        set_subsystem_state(CATALOG, "failed", str(exc))
+        return
+    set_subsystem_state(CATALOG, "ready", site_id)
+
+
+async def _warm_other_catalogs() -> None:
+    settings = get_settings()
+    if not settings.catalog_preload_all_sites:
+        set_subsystem_state(CATALOG_ALL_SITES, "disabled", "loaded on first use")
+        return
+    set_subsystem_state(CATALOG_ALL_SITES, "warming")
+    await get_discovery_service().preload_all(
+        first=[get_site_router().get_default_site().id],
+        concurrency=settings.catalog_preload_concurrency,
+    )
+    set_subsystem_state(CATALOG_ALL_SITES, "ready")
+
+
+async def run_startup_warmup() -> None:
+    """Warm subsystems in priority order; never raises."""
+    await asyncio.gather(_warm_vectorstore(), _warm_default_catalog())
+    try:
+        await start_rag_startup_ingestion_background()
+    except Exception as exc:
+        logger.warning("Failed to start RAG startup ingestion", error=str(exc))
+    try:
+        await _warm_other_catalogs()
+    except Exception as exc:
+        logger.warning("Failed to preload site catalogs", error=str(exc))
+        set_subsystem_state(CATALOG_ALL_SITES, "failed", str(exc))
+
+
+def start_background_warmup() -> None:
+    """Schedule :func:`run_startup_warmup` without blocking startup."""
+    spawn(run_startup_warmup(), name="startup-warmup")
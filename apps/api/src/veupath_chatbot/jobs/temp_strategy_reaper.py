@@ -0,0 +1,44 @@
+"""Background reaper for leaked temporary WDK strategies.
+
+Every worker runs one.  Each pass deletes, in batches, the temp strategies
+still recorded in the ledger past their expiry -- e.g. left behind by a
+worker that crashed mid-evaluation.  See
+:mod:`veupath_chatbot.services.wdk.temp_strategies` for how concurrent
+reapers split the work.
+"""
+
+import asyncio
+
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.tasks import spawn
+from veupath_chatbot.services.wdk.temp_strategies import reap_expired_temp_strategies
+
+logger = get_logger(__name__)
+
+
+async def reap_once() -> int:
+    """Reap every expired entry, batch by batch; return how many were claimed."""
+    batch_size = max(1, get_settings().temp_strategy_reaper_batch_size)
+    total = 0
+    while True:
+        claimed = await reap_expired_temp_strategies(batch_size=batch_size)
+        total += claimed
+        if claimed < batch_size:
+            return total
+
+
+async def run_temp_strategy_reaper() -> None:
+    """Reap expired temp strategies every ``temp_strategy_reaper_interval_seconds``."""
+    interval = get_settings().temp_strategy_reaper_interval_seconds
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reap_once()
+        except Exception as exc:
+            logger.warning("Temp strategy reaper pass failed", error=str(exc))
+
+
+def start_temp_strategy_reaper() -> asyncio.Task[None] | None:
+    """Schedule :func:`run_temp_strategy_reaper` in the background."""
+    return spawn(run_temp_strategy_reaper(), name="temp-strategy-reaper")
@@ -1,24 +1,25 @@
 """FastAPI application entrypoint."""
 
+import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import cast
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi.errors import RateLimitExceeded
 from starlette.requests import Request as StarletteRequest
 from starlette.responses import Response
 
 from veupath_chatbot import __version__
-from veupath_chatbot.integrations.vectorstore.bootstrap import ensure_rag_collections
+from veupath_chatbot.ai.engines.client_pool import close_llm_clients
 from veupath_chatbot.integrations.vectorstore.qdrant_store import (
     close_all_qdrant_stores,
 )
 from veupath_chatbot.integrations.veupathdb.factory import close_all_clients
 from veupath_chatbot.integrations.veupathdb.site_search import close_site_search_client
-from veupath_chatbot.jobs.rag_startup import start_rag_startup_ingestion_background
+from veupath_chatbot.jobs.startup_warmup import start_background_warmup
+from veupath_chatbot.jobs.temp_strategy_reaper import start_temp_strategy_reaper
 from veupath_chatbot.persistence.session import close_db, init_db
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.context import (
@@ -33,7 +34,7 @@ from veupath_chatbot.platform.errors import (
 )
 from veupath_chatbot.platform.logging import get_logger, setup_logging
 from veupath_chatbot.platform.redis import close_redis, init_redis
-from veupath_chatbot.platform.security import limiter
+from veupath_chatbot.platform.tracing import configure_tracing, shutdown_tracing
 from veupath_chatbot.transport.http.routers import (
     chat,
     control_sets,
@@ -60,6 +61,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     # Startup
     setup_logging()
+    configure_tracing(settings.tracing_export_path)
     logger.info(
         "Starting Pathfinder API",
         version=__version__,
@@ -89,25 +91,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         if orphaned:
             await session.commit()
 
-    try:
-        await ensure_rag_collections()
-    except Exception as exc:  # pragma: no cover
-        # Do not fail API startup if Qdrant is unavailable or misconfigured.
-        logger.warning("Failed to ensure RAG collections", error=str(exc))
-    try:
-        await start_rag_startup_ingestion_background()
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Failed to start RAG startup ingestion", error=str(exc))
+    # Vector store, catalogs and RAG ingestion warm in the background; the
+    # readiness probe reports their progress without waiting for them.
+    start_background_warmup()
+    # Deletes temp WDK strategies leaked by crashed or cancelled runs.
+    reaper = start_temp_strategy_reaper()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Pathfinder API")
+    if reaper is not None:
+        reaper.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper
     await close_all_qdrant_stores()
     await close_all_clients()
     await close_site_search_client()
+    await close_llm_clients()
     await close_redis()
     await close_db()
+    shutdown_tracing()
 
 
 def _wire_ai_dependencies() -> None:
@@ -219,9 +223,6 @@ def create_app() -> FastAPI:
         ],
     )
 
-    # Rate limiter (slowapi)
-    app.state.limiter = limiter
-
     # Request ID middleware
     @app.middleware("http")
     async def add_request_id(
@@ -261,17 +262,6 @@ def create_app() -> FastAPI:
             http_exception_handler,
         ),
     )
-    app.add_exception_handler(
-        RateLimitExceeded,
-        cast(
-            Callable[[StarletteRequest, Exception], Awaitable[Response]],
-            lambda request, exc: Response(
-                content=str(exc.detail),
-                status_code=429,
-                headers={"Retry-After": "60"},
-            ),
-        ),
-    )
 
     # Routers
     app.include_router(health.router)
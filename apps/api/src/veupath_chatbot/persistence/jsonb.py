@@ -0,0 +1,44 @@
+"""In-place JSONB document updates.
+
+Builds ``jsonb_set`` expressions so a statement can change a few keys of a
+stored document without sending (or rewriting from Python) the whole value.
+"""
+
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Text, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql.elements import ColumnElement
+
+from veupath_chatbot.platform.types import JSONValue
+
+
+def jsonb_set_keys(
+    document: ColumnElement[Any] | Any,
+    values: Mapping[str, JSONValue],
+    *,
+    prefix: Sequence[str] = (),
+) -> ColumnElement[Any]:
+    """Return *document* with each key of *values* set via nested ``jsonb_set``.
+
+    :param document: JSONB column (or expression) to update.
+    :param values: Keys to set and their new JSON values.
+    :param prefix: Path of the object that holds the keys (top level by default).
+        The object must already exist; ``jsonb_set`` leaves the document
+        unchanged when an intermediate path element is missing.
+    :returns: SQL expression usable as an ``UPDATE ... SET`` value.
+    """
+    expr = document
+    for key, value in values.items():
+        expr = func.jsonb_set(
+            expr,
+            literal([*prefix, key], ARRAY(Text)),
+            # Serialized here: a bare None would bind as SQL NULL, and
+            # jsonb_set(..., NULL) nulls the whole document.
+            literal(json.dumps(value), Text).cast(JSONB),
+            True,
+            type_=JSONB,
+        )
+    return expr
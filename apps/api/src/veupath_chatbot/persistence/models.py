@@ -4,7 +4,6 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     DateTime,
     ForeignKey,
@@ -13,9 +12,12 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    literal,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.types import CHAR, TypeDecorator, TypeEngine
 
 from veupath_chatbot.platform.types import JSONArray, JSONObject
@@ -58,8 +60,8 @@ class Base(DeclarativeBase):
     """Base class for all models."""
 
     type_annotation_map = {
-        JSONObject: JSON,
-        JSONArray: JSON,
+        JSONObject: JSONB,
+        JSONArray: JSONB,
         UUID: GUID,
     }
 
@@ -93,10 +95,10 @@ class ControlSet(Base):
     name: Mapped[str] = mapped_column(String(255))
     site_id: Mapped[str] = mapped_column(String(100))
     record_type: Mapped[str] = mapped_column(String(100))
-    positive_ids: Mapped[JSONArray] = mapped_column(JSON, default=list)
-    negative_ids: Mapped[JSONArray] = mapped_column(JSON, default=list)
+    positive_ids: Mapped[JSONArray] = mapped_column(JSONB, default=list)
+    negative_ids: Mapped[JSONArray] = mapped_column(JSONB, default=list)
     source: Mapped[str | None] = mapped_column(String(50))
-    tags: Mapped[JSONArray] = mapped_column(JSON, default=list)
+    tags: Mapped[JSONArray] = mapped_column(JSONB, default=list)
     provenance_notes: Mapped[str | None] = mapped_column(Text)
     version: Mapped[int] = mapped_column(Integer, default=1)
     is_public: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -107,6 +109,8 @@ class ControlSet(Base):
     __table_args__ = (
         Index("ix_control_sets_site_id", "site_id"),
         Index("ix_control_sets_user_id", "user_id"),
+        # Serves the ``tags ?| array[...]`` filter in list_by_site.
+        Index("ix_control_sets_tags", "tags", postgresql_using="gin"),
     )
 
 
@@ -120,7 +124,7 @@ class ExperimentRow(Base):
     user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     name: Mapped[str] = mapped_column(String(255), default="")
     status: Mapped[str] = mapped_column(String(20), default="pending")
-    data: Mapped[JSONObject] = mapped_column(JSON, default=dict)
+    data: Mapped[JSONObject] = mapped_column(JSONB, default=dict)
     batch_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
     benchmark_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -135,9 +139,23 @@ class ExperimentRow(Base):
         Index("ix_experiments_user_id", "user_id"),
         Index("ix_experiments_batch_id", "batch_id"),
         Index("ix_experiments_benchmark_id", "benchmark_id"),
+        Index("ix_experiments_user_status", "user_id", "status"),
     )
 
 
+def _inline(key: str) -> ColumnElement[str]:
+    return literal(key, Text, literal_execute=True)
+
+
+# ``data -> 'config' ->> 'searchName'``.  Keys are rendered inline (not as
+# bind parameters) so filters on it can use the expression index below.
+experiment_search_name: ColumnElement[str] = ExperimentRow.data.op("->")(
+    _inline("config")
+).op("->>", return_type=Text)(_inline("searchName"))
+
+Index("ix_experiments_search_name", experiment_search_name)
+
+
 class Stream(Base):
     """A conversation stream — the identity of a chat conversation.
 
@@ -184,8 +202,8 @@ class StreamProjection(Base):
     model_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     message_count: Mapped[int] = mapped_column(Integer, default=0)
     step_count: Mapped[int] = mapped_column(Integer, default=0)
-    plan: Mapped[JSONObject] = mapped_column(JSON, default=dict)
-    steps: Mapped[JSONArray] = mapped_column(JSON, default=list)
+    plan: Mapped[JSONObject] = mapped_column(JSONB, default=dict)
+    steps: Mapped[JSONArray] = mapped_column(JSONB, default=list)
     root_step_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     result_count: Mapped[int | None] = mapped_column(nullable=True)
     last_event_id: Mapped[str | None] = mapped_column(String(30), nullable=True)
@@ -195,6 +213,8 @@ class StreamProjection(Base):
     dismissed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Fingerprint of the WDK list summary last applied by sync-wdk.
+    wdk_fingerprint: Mapped[str | None] = mapped_column(String(40), nullable=True)
 
     site_id: Mapped[str] = mapped_column(String(50), default="")
 
@@ -227,14 +247,14 @@ class GeneSetRow(Base):
     user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     site_id: Mapped[str] = mapped_column(String(100))
     name: Mapped[str] = mapped_column(String(255), default="")
-    gene_ids: Mapped[JSONArray] = mapped_column(JSON, default=list)
+    gene_ids: Mapped[JSONArray] = mapped_column(JSONB, default=list)
     source: Mapped[str] = mapped_column(String(20), default="paste")
     wdk_strategy_id: Mapped[int | None] = mapped_column(nullable=True)
     wdk_step_id: Mapped[int | None] = mapped_column(nullable=True)
     search_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     record_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    parameters: Mapped[JSONObject | None] = mapped_column(JSON, nullable=True)
-    parent_set_ids: Mapped[JSONArray] = mapped_column(JSON, default=list)
+    parameters: Mapped[JSONObject | None] = mapped_column(JSONB, nullable=True)
+    parent_set_ids: Mapped[JSONArray] = mapped_column(JSONB, default=list)
     operation: Mapped[str | None] = mapped_column(String(20), nullable=True)
     step_count: Mapped[int] = mapped_column(Integer, default=1)
     created_at: Mapped[datetime] = mapped_column(
@@ -265,6 +285,8 @@ class Operation(Base):
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Call profile (span counts and latencies) captured when the operation ended.
+    profile: Mapped[JSONObject | None] = mapped_column(JSONB, nullable=True)
 
     stream: Mapped[Stream] = relationship()
 
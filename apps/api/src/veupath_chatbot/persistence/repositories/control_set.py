@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import Text, or_, select
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from veupath_chatbot.persistence.models import ControlSet
@@ -25,7 +26,11 @@ class ControlSetRepository:
         tags: list[str] | None = None,
         limit: int = 100,
     ) -> list[ControlSet]:
-        """List control sets for a site, including public ones and user-owned."""
+        """List control sets for a site, including public ones and user-owned.
+
+        When *tags* is given, only sets carrying at least one of them are
+        returned (``tags ?| array[...]``, served by the GIN index on tags).
+        """
         conditions = [ControlSet.site_id == site_id]
         if user_id is not None:
             conditions.append(
@@ -33,6 +38,8 @@ class ControlSetRepository:
             )
         else:
             conditions.append(ControlSet.is_public.is_(True))
+        if tags:
+            conditions.append(ControlSet.tags.has_any(array(tags, type_=Text)))
 
         stmt = (
             select(ControlSet)
@@ -41,16 +48,7 @@ class ControlSetRepository:
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        rows = list(result.scalars().all())
-
-        if tags:
-            tag_set = set(tags)
-            rows = [
-                r
-                for r in rows
-                if tag_set.intersection(r.tags if isinstance(r.tags, list) else [])
-            ]
-        return rows
+        return list(result.scalars().all())
 
     async def create(
         self,
@@ -1,18 +1,33 @@
 """Repository for stream (conversation) identity + projections."""
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
 from shared_py.defaults import DEFAULT_STREAM_NAME
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from veupath_chatbot.persistence.jsonb import jsonb_set_keys
 from veupath_chatbot.persistence.models import Operation, Stream, StreamProjection
+from veupath_chatbot.platform.tracing import get_operation_profile
 from veupath_chatbot.platform.types import JSONObject
 
 
+def unique_name(name: str, existing: Collection[str]) -> str:
+    """Return ``name``, or ``name (1)``, ``name (2)``, ... if already taken."""
+    if name not in existing:
+        return name
+
+    i = 1
+    while f"{name} ({i})" in existing:
+        i += 1
+    return f"{name} ({i})"
+
+
 class StreamRepository:
     """Data access for conversation streams and their projections."""
 
@@ -41,14 +56,7 @@ class StreamRepository:
             query = query.where(StreamProjection.stream_id != exclude_stream_id)
         result = await self.session.execute(query)
         existing: set[str] = {row[0] for row in result.all() if row[0]}
-
-        if name not in existing:
-            return name
-
-        i = 1
-        while f"{name} ({i})" in existing:
-            i += 1
-        return f"{name} ({i})"
+        return unique_name(name, existing)
 
     # ── Identity ──
 
@@ -116,6 +124,19 @@ class StreamRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_projections(
+        self, stream_ids: Collection[UUID]
+    ) -> dict[UUID, StreamProjection]:
+        """Return the projections of *stream_ids* that exist, in one query."""
+        if not stream_ids:
+            return {}
+        result = await self.session.execute(
+            select(StreamProjection)
+            .options(joinedload(StreamProjection.stream))
+            .where(StreamProjection.stream_id.in_(stream_ids))
+        )
+        return {p.stream_id: p for p in result.unique().scalars().all()}
+
     async def list_projections(
         self,
         user_id: UUID,
@@ -161,6 +182,7 @@ class StreamRepository:
         is_saved: bool | None = None,
         is_saved_set: bool = False,
         plan: JSONObject | None = None,
+        plan_patch: JSONObject | None = None,
         step_count: int | None = None,
         result_count: int | None = None,
         result_count_set: bool = False,
@@ -171,7 +193,10 @@ class StreamRepository:
         """Dynamically update a StreamProjection based on provided kwargs.
 
         Steps and root_step_id are derived from plan at read time; only plan
-        and a denormalized step_count are persisted on write.
+        and a denormalized step_count are persisted on write.  ``plan``
+        replaces the whole document; ``plan_patch`` sets only its top-level
+        keys in place (``jsonb_set``) and is ignored when ``plan`` is given.
+        A rename touches only the name column.
         """
         values: dict[str, Any] = {"updated_at": datetime.now(UTC)}
         if name is not None:
@@ -193,6 +218,8 @@ class StreamRepository:
             values["is_saved"] = bool(is_saved)
         if plan is not None:
             values["plan"] = plan
+        elif plan_patch:
+            values["plan"] = jsonb_set_keys(StreamProjection.plan, plan_patch)
         if step_count is not None:
             values["step_count"] = step_count
         if result_count_set:
@@ -251,6 +278,93 @@ class StreamRepository:
         result = await self.session.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def list_site_projections(
+        self, user_id: UUID, site_id: str
+    ) -> list[StreamProjection]:
+        """Return every projection (dismissed included) for a user + site."""
+        result = await self.session.execute(
+            select(StreamProjection)
+            .join(Stream)
+            .where(Stream.user_id == user_id, Stream.site_id == site_id)
+        )
+        return list(result.scalars().all())
+
+    async def bulk_create_wdk_projections(
+        self,
+        user_id: UUID,
+        site_id: str,
+        rows: list[dict[str, Any]],
+    ) -> int:
+        """Create a stream + projection per row in two INSERT statements.
+
+        Each row holds projection column values and must include
+        ``wdk_strategy_id``.  Names are stored as given (callers deduplicate).
+        Rows whose WDK strategy is already linked elsewhere are skipped via
+        ``ON CONFLICT DO NOTHING`` and their streams removed again.
+
+        Returns the number of projections created.
+        """
+        if not rows:
+            return 0
+        stream_ids = [uuid4() for _ in rows]
+        await self.session.execute(
+            insert(Stream),
+            [
+                {"id": stream_id, "user_id": user_id, "site_id": site_id}
+                for stream_id in stream_ids
+            ],
+        )
+        stmt = (
+            pg_insert(StreamProjection)
+            .values(
+                [
+                    {
+                        "plan": {},
+                        "steps": [],
+                        "message_count": 0,
+                        "gene_set_auto_imported": False,
+                        **row,
+                        "stream_id": stream_id,
+                        "site_id": site_id,
+                    }
+                    for stream_id, row in zip(stream_ids, rows, strict=True)
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[StreamProjection.wdk_strategy_id],
+                index_where=StreamProjection.wdk_strategy_id.isnot(None),
+            )
+            .returning(StreamProjection.stream_id)
+        )
+        result = await self.session.execute(stmt)
+        created = {row[0] for row in result.all()}
+        skipped = [stream_id for stream_id in stream_ids if stream_id not in created]
+        if skipped:
+            await self.session.execute(delete(Stream).where(Stream.id.in_(skipped)))
+        await self.session.flush()
+        return len(created)
+
+    async def bulk_update_projections(self, rows: list[dict[str, Any]]) -> None:
+        """Apply per-projection column values in one executemany UPDATE.
+
+        Each row must include ``stream_id`` and the same set of columns.
+        Unlike :meth:`update_projection`, names are stored as given.
+        """
+        if not rows:
+            return
+        now = datetime.now(UTC)
+        await self.session.execute(
+            update(StreamProjection),
+            [{**row, "updated_at": now} for row in rows],
+        )
+        # Bulk UPDATE by primary key doesn't refresh loaded instances.
+        for row in rows:
+            key = self.session.identity_key(StreamProjection, row["stream_id"])
+            loaded = self.session.identity_map.get(key)
+            if loaded is not None:
+                self.session.expire(loaded)
+        await self.session.flush()
+
     async def prune_wdk_orphans(
         self,
         user_id: UUID,
@@ -304,10 +418,19 @@ class StreamRepository:
         return op
 
     async def _set_operation_status(self, operation_id: str, status: str) -> None:
+        values: dict[str, object] = {
+            "status": status,
+            "completed_at": datetime.now(UTC),
+        }
+        # Store the call profile if the operation ran under one in this process.
+        profile = get_operation_profile(operation_id)
+        if profile is not None:
+            profile.finish()
+            values["profile"] = profile.to_json()
         await self.session.execute(
             update(Operation)
             .where(Operation.operation_id == operation_id)
-            .values(status=status, completed_at=datetime.now(UTC))
+            .values(**values)
         )
         await self.session.flush()
 
@@ -320,6 +443,12 @@ class StreamRepository:
     async def cancel_operation(self, operation_id: str) -> None:
         await self._set_operation_status(operation_id, "cancelled")
 
+    async def get_operation_status(self, operation_id: str) -> str | None:
+        result = await self.session.execute(
+            select(Operation.status).where(Operation.operation_id == operation_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_active_operations(self, stream_id: UUID) -> list[Operation]:
         result = await self.session.execute(
             select(Operation)
@@ -0,0 +1,333 @@
+"""Admission control for expensive work.
+
+Experiments, benchmarks, enrichment and report exports can each keep WDK
+and the CPU busy for minutes.  Rate limits bound how often one user may
+*start* such work; the admission controller bounds how much of it runs
+at once so chat and other cheap requests keep their latency.
+
+Work runs inside :meth:`AdmissionController.slot`, which waits (queues)
+until:
+
+- fewer than ``max_running`` jobs hold a slot cluster-wide, and fewer
+  than ``max_running_per_user`` for the same user;
+- this worker is not saturated: in-flight WDK requests are below
+  ``max_wdk_inflight`` and the worker process's own CPU use (in cores,
+  from its CPU time) is below ``max_cpu_load``.  The process's CPU time
+  is used rather than the host load average, which also counts every
+  other process and container on the host.
+
+Slots are leases in a Redis sorted set (member ``"<user>|<lease>"``,
+score = expiry) renewed while the job runs, so a crashed worker's slots
+expire on their own.  Without Redis the slots are tracked per process.
+
+Routes call :meth:`AdmissionController.check` to shed new work with a
+503 when the worker is saturated and its local queue is already full.
+
+An admitted job that fans out into several experiment runs (a
+multi-organism batch) bounds them with :func:`site_budget`, a per-site
+semaphore shared by every such job on the worker.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
+from functools import lru_cache
+from uuid import uuid4
+from weakref import WeakValueDictionary
+
+from redis.exceptions import RedisError
+
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.errors import ServiceBusyError
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.redis import get_redis
+
+logger = get_logger(__name__)
+
+_RUNNING_KEY = "admission:running"
+
+# KEYS[1] = running zset; ARGV = now, expiry, member, max total, max per user,
+# user prefix.  Drops expired leases, then adds the member if under both caps.
+_ACQUIRE_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+local members = redis.call('ZRANGE', KEYS[1], 0, -1)
+if #members >= tonumber(ARGV[4]) then
+  return 0
+end
+local prefix = ARGV[6]
+local mine = 0
+for _, m in ipairs(members) do
+  if string.sub(m, 1, #prefix) == prefix then
+    mine = mine + 1
+  end
+end
+if mine >= tonumber(ARGV[5]) then
+  return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+return 1
+"""
+
+
+class ProcessCpuLoad:
+    """CPU used by this process, in cores, averaged since the previous sample.
+
+    Calls closer together than *window* seconds return the last sample, so
+    the value tracks sustained load rather than a single busy tick.
+    """
+
+    def __init__(self, window: float = 1.0) -> None:
+        self._window = window
+        self._wall = time.monotonic()
+        self._cpu = time.process_time()
+        self._load = 0.0
+
+    def __call__(self) -> float:
+        wall = time.monotonic()
+        elapsed = wall - self._wall
+        if elapsed >= self._window:
+            cpu = time.process_time()
+            self._load = (cpu - self._cpu) / elapsed
+            self._wall, self._cpu = wall, cpu
+        return self._load
+
+
+class AdmissionController:
+    """Bounds concurrent expensive work across workers."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_running: int = 8,
+        max_running_per_user: int = 2,
+        max_queued: int = 16,
+        max_wdk_inflight: int = 200,
+        max_cpu_load: float = 0.9,
+        lease_seconds: float = 90.0,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 5.0,
+        cpu_load: Callable[[], float] | None = None,
+        running_key: str = _RUNNING_KEY,
+    ) -> None:
+        self.enabled = enabled
+        self.max_running = max(1, max_running)
+        self.max_running_per_user = max(1, max_running_per_user)
+        self.max_queued = max(0, max_queued)
+        self.max_wdk_inflight = max(1, max_wdk_inflight)
+        self.max_cpu_load = max_cpu_load
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._cpu_load = cpu_load or ProcessCpuLoad()
+        self.running_key = running_key
+        self._wdk_inflight = 0
+        self._queued = 0
+        self._local_leases: dict[str, str] = {}
+
+    # ── Saturation signals ──
+
+    @property
+    def wdk_inflight(self) -> int:
+        """WDK requests currently in flight from this worker."""
+        return self._wdk_inflight
+
+    @property
+    def queued(self) -> int:
+        """Jobs on this worker waiting for a slot."""
+        return self._queued
+
+    @contextmanager
+    def track_wdk_request(self) -> Iterator[None]:
+        """Count a WDK request as in flight for the duration of the block."""
+        self._wdk_inflight += 1
+        try:
+            yield
+        finally:
+            self._wdk_inflight -= 1
+
+    def saturation(self) -> str | None:
+        """Return why this worker is saturated (``"wdk"``/``"cpu"``), or ``None``."""
+        if self._wdk_inflight >= self.max_wdk_inflight:
+            return "wdk"
+        if self._cpu_load() >= self.max_cpu_load:
+            return "cpu"
+        return None
+
+    def check(self, kind: str) -> None:
+        """Shed new *kind* work if the worker is saturated and its queue is full.
+
+        :raises ServiceBusyError: When the work should be retried later.
+        """
+        if not self.enabled:
+            return
+        reason = self.saturation()
+        if reason is not None and self._queued >= self.max_queued:
+            logger.warning(
+                "Shedding expensive work",
+                kind=kind,
+                reason=reason,
+                queued=self._queued,
+                wdk_inflight=self._wdk_inflight,
+            )
+            raise ServiceBusyError(
+                detail=f"The server is busy; retry the {kind} request shortly."
+            )
+
+    # ── Slots ──
+
+    async def _try_acquire(self, user: str, lease: str) -> bool:
+        member = f"{user}|{lease}"
+        now = time.time()
+        try:
+            redis = get_redis()
+        except RuntimeError:
+            return self._try_acquire_local(user, lease)
+        try:
+            result = redis.eval(
+                _ACQUIRE_LUA,
+                1,
+                self.running_key,
+                now,
+                now + self.lease_seconds,
+                member,
+                self.max_running,
+                self.max_running_per_user,
+                f"{user}|",
+            )
+            if isinstance(result, Awaitable):
+                result = await result
+        except RedisError as exc:
+            logger.warning("Admission check fell back to local slots", error=str(exc))
+            return self._try_acquire_local(user, lease)
+        return bool(int(result))
+
+    def _try_acquire_local(self, user: str, lease: str) -> bool:
+        if len(self._local_leases) >= self.max_running:
+            return False
+        mine = sum(1 for owner in self._local_leases.values() if owner == user)
+        if mine >= self.max_running_per_user:
+            return False
+        self._local_leases[lease] = user
+        return True
+
+    async def _renew(self, user: str, lease: str) -> None:
+        member = f"{user}|{lease}"
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            with suppress(RuntimeError, RedisError):
+                await get_redis().zadd(
+                    self.running_key,
+                    {member: time.time() + self.lease_seconds},
+                    xx=True,
+                )
+
+    async def _release(self, user: str, lease: str) -> None:
+        if self._local_leases.pop(lease, None) is not None:
+            return
+        try:
+            await get_redis().zrem(self.running_key, f"{user}|{lease}")
+        except (RuntimeError, RedisError) as exc:
+            logger.warning("Failed to release admission slot", error=str(exc))
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        kind: str,
+        *,
+        user_id: object = None,
+        timeout: float | None = None,
+        on_queued: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold a slot for one unit of *kind* work, waiting until admitted.
+
+        :param kind: Work label for logs (``"experiment"``, ``"enrichment"``...).
+        :param user_id: Owner of the work; ``None`` shares an anonymous quota.
+        :param timeout: Maximum seconds to wait for a slot (``None`` = forever).
+        :param on_queued: Awaited once if the work has to wait for a slot.
+        :raises ServiceBusyError: If no slot frees up within *timeout*.
+        """
+        if not self.enabled:
+            yield
+            return
+        user = str(user_id) if user_id is not None else "anonymous"
+        lease = uuid4().hex
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = self.poll_interval
+        self._queued += 1
+        try:
+            while self.saturation() is not None or not await self._try_acquire(
+                user, lease
+            ):
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    raise ServiceBusyError(
+                        retry_after=delay,
+                        detail=f"Timed out waiting to start {kind}; retry shortly.",
+                    )
+                if on_queued is not None:
+                    await on_queued()
+                    on_queued = None
+                await asyncio.sleep(delay)
+                delay = min(self.max_poll_interval, delay * 2)
+        finally:
+            self._queued -= 1
+
+        renew = asyncio.create_task(self._renew(user, lease))
+        try:
+            yield
+        finally:
+            renew.cancel()
+            with suppress(asyncio.CancelledError):
+                await renew
+            await self._release(user, lease)
+
+
+# Alive while any job holds one; see site_budget.
+_site_budgets: WeakValueDictionary[str, asyncio.Semaphore] = WeakValueDictionary()
+
+
+def site_budget(site_id: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent experiment runs on *site_id*.
+
+    Jobs running against the same site on this worker share one semaphore
+    of ``admission_max_runs_per_site`` permits.  Hold a reference for as
+    long as the runs need it; unreferenced budgets are dropped.
+    """
+    budget = _site_budgets.get(site_id)
+    if budget is None:
+        budget = asyncio.Semaphore(max(1, get_settings().admission_max_runs_per_site))
+        _site_budgets[site_id] = budget
+    return budget
+
+
+async def run_admitted(
+    kind: str,
+    run: Callable[[], Awaitable[None]],
+    *,
+    user_id: object = None,
+    timeout: float | None = None,
+    on_queued: Callable[[], Awaitable[None]] | None = None,
+) -> None:
+    """Run background *kind* work once the admission controller admits it.
+
+    :raises ServiceBusyError: If no slot frees up within *timeout*.
+    """
+    async with get_admission_controller().slot(
+        kind, user_id=user_id, timeout=timeout, on_queued=on_queued
+    ):
+        await run()
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide controller configured from settings."""
+    settings = get_settings()
+    return AdmissionController(
+        enabled=settings.admission_enabled,
+        max_running=settings.admission_max_running,
+        max_running_per_user=settings.admission_max_running_per_user,
+        max_queued=settings.admission_max_queued,
+        max_wdk_inflight=settings.admission_max_wdk_inflight,
+        max_cpu_load=settings.admission_max_cpu_load,
+    )
@@ -0,0 +1,222 @@
+"""In-process + Redis caching primitives.
+
+:class:`TTLCache` is a bounded, per-process LRU with per-entry expiry.
+:class:`LayeredCache` puts a :class:`TTLCache` in front of Redis so that
+hot keys are served from memory while other workers (and restarts) still
+share results through Redis.  Redis is optional: if it has not been
+initialized, or a Redis call fails, the layered cache silently degrades
+to memory only.
+
+Keys are built with :func:`cache_key`, which hashes arbitrary JSON-able
+parts into a short, stable digest.
+"""
+
+import hashlib
+import json
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from veupath_chatbot.platform.logging import get_logger
+
+logger = get_logger(__name__)
+
+_REDIS_PREFIX = "cache:"
+
+_all_caches: weakref.WeakSet[TTLCache[Any]] = weakref.WeakSet()
+
+
+def stable_hash(value: object) -> str:
+    """Return a SHA-256 hex digest of *value*'s canonical JSON form.
+
+    Dict keys are sorted so logically equal inputs hash identically;
+    non-JSON values fall back to ``str()``.
+    """
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(*parts: object) -> str:
+    """Build a compact cache key from *parts* (order-sensitive)."""
+    return stable_hash(list(parts))[:40]
+
+
+class TTLCache[V]:
+    """Bounded LRU cache whose entries expire after a TTL.
+
+    Besides *max_entries*, a cache built with *weigh* also keeps the summed
+    weight of its entries at or below *max_weight* (e.g. total list
+    lengths), evicting least recently used entries to make room.  A value
+    heavier than *max_weight* on its own is not stored.
+
+    Not thread-safe; intended for use from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        max_weight: int | None = None,
+        weigh: Callable[[V], int] | None = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.max_weight = max_weight
+        self._weigh = weigh
+        self._weight = 0
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        _all_caches.add(self)
+
+    @property
+    def weight(self) -> int:
+        """Summed weight of the cached entries (0 without *weigh*)."""
+        return self._weight
+
+    def _entry_weight(self, value: V) -> int:
+        return self._weigh(value) if self._weigh is not None else 0
+
+    def _pop(self, key: Hashable) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._weight -= self._entry_weight(item[1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value, or ``None`` if absent or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, *, ttl_seconds: float | None = None) -> None:
+        """Store *value*, evicting least recently used entries if full."""
+        self._pop(key)
+        weight = self._entry_weight(value)
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._weight += weight
+        while len(self._data) > self.max_entries or (
+            self.max_weight is not None and self._weight > self.max_weight
+        ):
+            self._pop(next(iter(self._data)))
+
+    def delete(self, key: Hashable) -> None:
+        self._pop(key)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches *predicate*; return the count."""
+        doomed = [k for k in self._data if predicate(k)]
+        for k in doomed:
+            self._pop(k)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._weight = 0
+
+
+class LayeredCache[V]:
+    """Memory-first cache with an optional shared Redis tier.
+
+    :param namespace: Redis key namespace (e.g. ``"enrichment"``).
+    :param encode: Converts a value to a JSON-able object for Redis.
+    :param decode: Rebuilds a value from its JSON-able form.
+    :param ttl_seconds: Expiry for both tiers.
+    :param max_entries: Capacity of the in-process tier.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        encode: Callable[[V], Any],
+        decode: Callable[[Any], V],
+        ttl_seconds: float = 3600,
+        max_entries: int = 1024,
+    ) -> None:
+        self.namespace = namespace
+        self._encode = encode
+        self._decode = decode
+        self.ttl_seconds = ttl_seconds
+        self.local: TTLCache[V] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def _redis_key(self, key: str) -> str:
+        return f"{_REDIS_PREFIX}{self.namespace}:{key}"
+
+    @staticmethod
+    def _redis() -> Any:
+        from veupath_chatbot.platform.redis import get_redis
+
+        try:
+            return get_redis()
+        except RuntimeError:
+            return None
+
+    async def get(self, key: str) -> V | None:
+        """Return the value for *key* from memory, then Redis."""
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        redis = self._redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(self._redis_key(key))
+            if raw is None:
+                return None
+            value = self._decode(json.loads(raw))
+        except Exception as exc:
+            logger.debug("Cache read failed", namespace=self.namespace, error=str(exc))
+            return None
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: V) -> None:
+        """Store *value* in memory and (best-effort) in Redis."""
+        self.local.set(key, value)
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            payload = json.dumps(self._encode(value), separators=(",", ":"))
+            await redis.set(
+                self._redis_key(key), payload.encode("utf-8"), ex=int(self.ttl_seconds)
+            )
+        except Exception as exc:
+            logger.debug("Cache write failed", namespace=self.namespace, error=str(exc))
+
+    async def delete(self, key: str) -> None:
+        """Remove *key* from both tiers."""
+        self.local.delete(key)
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self._redis_key(key))
+        except Exception as exc:
+            logger.debug(
+                "Cache delete failed", namespace=self.namespace, error=str(exc)
+            )
+
+
+def clear_all_caches() -> None:
+    """Empty every in-process :class:`TTLCache` (Redis entries are untouched).
+
+    Used by tests for isolation and by operators to force fresh WDK reads.
+    """
+    for cache in list(_all_caches):
+        cache.clear()
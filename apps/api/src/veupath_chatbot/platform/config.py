@@ -127,6 +127,13 @@ class Settings(BaseSettings):
     qdrant_url: str = "http://localhost:6333"
     qdrant_api_key: str | None = None
     qdrant_timeout_seconds: float = 10.0
+    # gRPC (port qdrant_grpc_port) instead of REST; both keep connections alive.
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+    qdrant_max_connections: int = 20
+    qdrant_keepalive_seconds: float = 30.0
+    # Upserts are split into requests of at most this many bytes.
+    qdrant_upsert_max_bytes: int = 8 * 1024 * 1024
 
     # RAG ingestion (startup background job)
     rag_startup_max_strategies_per_site: int | None = None
@@ -144,7 +151,11 @@ class Settings(BaseSettings):
     subkani_model: str = "gpt-4.1-mini"
     subkani_temperature: float = 0.0
     subkani_top_p: float = 1.0
+    # Sub-agent slots shared by every delegation on this worker; a single
+    # delegation may also be capped lower via its own max_concurrency.
     subkani_max_concurrency: int = 6
+    # When > 0, also cap running sub-agents across all workers via Redis.
+    subkani_cluster_max_concurrency: int = 0
     subkani_timeout_seconds: int = 120
 
     # Unified model defaults (applies to both planning and execution modes)
@@ -158,9 +169,62 @@ class Settings(BaseSettings):
         description="Optional path to a YAML file for site list and base URLs; defaults to bundled sites.yaml if unset.",
     )
     veupathdb_cache_ttl: int = 3600
+    # Startup warmup loads the default site's catalog in the background;
+    # other sites load on first use unless preloading them is enabled.
+    catalog_preload_all_sites: bool = False
+    catalog_preload_concurrency: int = 2
     veupathdb_auth_token: str | None = None
     veupathdb_oauth_url: str | None = None
     veupathdb_oauth_client_id: str | None = None
+    # Temporary internal WDK strategies are recorded in a Redis ledger; a
+    # background reaper deletes any still recorded after their TTL.  The
+    # creating worker renews the TTL while it runs; deletions that keep
+    # failing are abandoned after ``temp_strategy_max_reap_attempts``.
+    temp_strategy_ttl_seconds: int = 3600
+    temp_strategy_reaper_interval_seconds: float = 60.0
+    temp_strategy_reaper_batch_size: int = 50
+    temp_strategy_max_reap_attempts: int = 5
+
+    # Rate limiting: per-user token buckets shared across workers via Redis.
+    # Routes spend a declared cost per request from a bucket of
+    # ``rate_limit_burst`` tokens refilled at ``rate_limit_refill_per_second``.
+    rate_limit_enabled: bool = True
+    rate_limit_burst: float = 120.0
+    rate_limit_refill_per_second: float = 2.0
+
+    # Admission control for expensive work (experiments, enrichment, exports)
+    admission_enabled: bool = True
+    admission_max_running: int = 8
+    admission_max_running_per_user: int = 2
+    admission_max_queued: int = 16
+    admission_max_wdk_inflight: int = 200
+    # CPU the worker process may be using (in cores, e.g. 0.9 = 90% of one
+    # core) before it holds new work.
+    admission_max_cpu_load: float = 0.9
+    admission_queue_timeout_seconds: float = 60.0
+    # How long a background job (experiment, batch, benchmark) may wait for
+    # a slot before it is failed with a "retry later" error.
+    admission_job_queue_timeout_seconds: float = 900.0
+    # Experiment runs one admitted job (e.g. a batch) may have in flight
+    # against the same site at once, per worker.
+    admission_max_runs_per_site: int = 4
+    # Control-set runs one benchmark keeps in flight.  Below the per-site
+    # budget, so a large benchmark leaves room for other users' runs.
+    benchmark_max_concurrent_runs: int = 2
+    # How long a benchmark's plan is kept for resuming its remaining runs.
+    benchmark_checkpoint_ttl_seconds: int = 7 * 24 * 3600
+    # Ordered result IDs an experiment fetches once for rank metrics and
+    # robustness: at most this many records.
+    experiment_result_set_max_records: int = 100_000
+
+    # Time budget for loading one @-mentioned strategy or experiment before
+    # the turn starts; slower lookups are replaced by a compact summary.
+    chat_mention_timeout_seconds: float = 1.5
+
+    # Assistant tokens are merged into one assistant_delta event until this
+    # much text is buffered or the oldest buffered token is this old.
+    chat_delta_flush_bytes: int = 256
+    chat_delta_flush_ms: int = 50
 
     # Chat provider (set to "mock" for deterministic offline E2E testing)
     chat_provider: str = Field(default="default", alias="PATHFINDER_CHAT_PROVIDER")
@@ -169,6 +233,10 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: Literal["json", "console"] = "json"
 
+    # Tracing: spans always feed per-operation profiles; when a path is set,
+    # every finished span is also appended there as an OTLP/JSON line.
+    tracing_export_path: str = ""
+
     # CORS
     cors_origins: list[str] = ["http://localhost:3000"]
     cors_origin_regex: str | None = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
@@ -1,5 +1,6 @@
 """Typed error model with problem+json responses."""
 
+import math
 from enum import StrEnum
 
 from fastapi import HTTPException, Request
@@ -19,6 +20,8 @@ class ErrorCode(StrEnum):
     UNAUTHORIZED = "UNAUTHORIZED"
     FORBIDDEN = "FORBIDDEN"
     RATE_LIMITED = "RATE_LIMITED"
+    SERVICE_BUSY = "SERVICE_BUSY"
+    CONFLICT = "CONFLICT"
 
     # VEuPathDB
     SITE_NOT_FOUND = "SITE_NOT_FOUND"
@@ -59,12 +62,14 @@ class AppError(Exception):
         status: int = 400,
         detail: str | None = None,
         errors: JSONArray | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.code = code
         self.title = title
         self.status = status
         self.detail = detail
         self.errors = errors
+        self.headers = headers
         msg = f"{title}: {detail}" if detail else title
         super().__init__(msg)
 
@@ -139,6 +144,64 @@ class ValidationError(AppError):
         )
 
 
+class ConflictError(AppError):
+    """The request conflicts with work already in progress."""
+
+    def __init__(
+        self,
+        title: str = "Conflict",
+        detail: str | None = None,
+    ) -> None:
+        super().__init__(
+            code=ErrorCode.CONFLICT,
+            title=title,
+            status=409,
+            detail=detail,
+        )
+
+
+def _retry_after_header(seconds: float) -> dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+class RateLimitedError(AppError):
+    """Too many requests; the client should retry after ``retry_after`` seconds."""
+
+    def __init__(
+        self,
+        retry_after: float,
+        title: str = "Too many requests",
+        detail: str | None = None,
+    ) -> None:
+        super().__init__(
+            code=ErrorCode.RATE_LIMITED,
+            title=title,
+            status=429,
+            detail=detail,
+            headers=_retry_after_header(retry_after),
+        )
+        self.retry_after = retry_after
+
+
+class ServiceBusyError(AppError):
+    """Expensive work was shed because the service is saturated."""
+
+    def __init__(
+        self,
+        retry_after: float = 30.0,
+        title: str = "Service busy",
+        detail: str | None = None,
+    ) -> None:
+        super().__init__(
+            code=ErrorCode.SERVICE_BUSY,
+            title=title,
+            status=503,
+            detail=detail,
+            headers=_retry_after_header(retry_after),
+        )
+        self.retry_after = retry_after
+
+
 class WDKError(AppError):
     """Error from VEuPathDB WDK service."""
 
@@ -166,6 +229,7 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
         status_code=exc.status,
         content=problem.model_dump(exclude_none=True),
         media_type="application/problem+json",
+        headers=exc.headers,
     )
 
 
@@ -1,11 +1,14 @@
 """Event sourcing core: emit events to Redis + project to PostgreSQL."""
 
+import asyncio
+import contextlib
 import json
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from datetime import UTC, datetime
 from typing import cast
 
 from redis.asyncio import Redis
+from redis.typing import EncodableT, FieldT
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -163,18 +166,9 @@ async def emit(
     Returns the Redis entry ID (e.g. '1709234567890-0').
     """
     entry_id_bytes: bytes = await redis.xadd(
-        f"stream:{stream_id}",
-        {
-            "op": (operation_id or "").encode(),
-            "type": event_type.encode(),
-            "data": json.dumps(event_data, default=str).encode(),
-        },
-    )
-    entry_id = (
-        entry_id_bytes.decode()
-        if isinstance(entry_id_bytes, bytes)
-        else str(entry_id_bytes)
+        f"stream:{stream_id}", _entry_fields(operation_id, event_type, event_data)
     )
+    entry_id = _decode_entry_id(entry_id_bytes)
 
     if session:
         await _project_event(session, stream_id, event_type, event_data, entry_id)
@@ -184,6 +178,111 @@ async def emit(
     return entry_id
 
 
+async def emit_batch(
+    redis: Redis,
+    stream_id: str,
+    operation_id: str | None,
+    events: Sequence[tuple[str, JSONObject]],
+    *,
+    session: AsyncSession | None = None,
+) -> list[str]:
+    """Append several ``(event_type, event_data)`` events in one round trip.
+
+    The XADDs are pipelined (not transactional); events are then projected
+    in order exactly as :func:`emit` would.  Returns the entry IDs.
+    """
+    if not events:
+        return []
+    key = f"stream:{stream_id}"
+    async with redis.pipeline(transaction=False) as pipe:
+        for event_type, event_data in events:
+            pipe.xadd(key, _entry_fields(operation_id, event_type, event_data))
+        raw_ids: list[bytes] = await pipe.execute()
+    entry_ids = [_decode_entry_id(raw) for raw in raw_ids]
+
+    if session:
+        for (event_type, event_data), entry_id in zip(events, entry_ids, strict=True):
+            await _project_event(session, stream_id, event_type, event_data, entry_id)
+            if event_type in _COMMIT_AFTER:
+                await session.commit()
+
+    return entry_ids
+
+
+# Most events one pipelined write carries.
+_MAX_EMIT_BATCH = 128
+
+
+async def forward_events(
+    redis: Redis,
+    stream_id: str,
+    operation_id: str | None,
+    events: AsyncIterator[object],
+    *,
+    session: AsyncSession | None = None,
+) -> None:
+    """Emit every ``{"type": ..., "data": ...}`` event from *events*.
+
+    *events* is read in a task of its own; whatever queues up while one
+    batch is being written goes out as the next :func:`emit_batch`.  A
+    quiet stream is written event by event, a burst in a few round trips.
+    Non-dict items are skipped.  An error raised by *events* propagates
+    after the events read before it are written.
+    """
+    pending: asyncio.Queue[tuple[str, JSONObject] | None] = asyncio.Queue()
+
+    async def _read() -> None:
+        try:
+            async for value in events:
+                if not isinstance(value, dict):
+                    continue
+                event_type = value.get("type", "")
+                event_data = value.get("data")
+                pending.put_nowait(
+                    (
+                        event_type if isinstance(event_type, str) else "",
+                        event_data if isinstance(event_data, dict) else {},
+                    )
+                )
+        finally:
+            pending.put_nowait(None)
+
+    reader = asyncio.create_task(_read())
+    try:
+        done = False
+        while not done:
+            batch: list[tuple[str, JSONObject]] = []
+            item = await pending.get()
+            while item is not None:
+                batch.append(item)
+                if pending.empty() or len(batch) >= _MAX_EMIT_BATCH:
+                    break
+                item = pending.get_nowait()
+            done = item is None
+            if batch:
+                await emit_batch(redis, stream_id, operation_id, batch, session=session)
+        await reader
+    finally:
+        if not reader.done():
+            reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader
+
+
+def _entry_fields(
+    operation_id: str | None, event_type: str, event_data: JSONObject
+) -> dict[FieldT, EncodableT]:
+    return {
+        "op": (operation_id or "").encode(),
+        "type": event_type.encode(),
+        "data": json.dumps(event_data, default=str).encode(),
+    }
+
+
+def _decode_entry_id(entry_id: bytes | str) -> str:
+    return entry_id.decode() if isinstance(entry_id, bytes) else str(entry_id)
+
+
 # ---------------------------------------------------------------------------
 # PostgreSQL projection — per-type handlers
 # ---------------------------------------------------------------------------
@@ -1,10 +1,15 @@
-"""Health-check probes for external dependencies."""
+"""Health-check probes for external dependencies and warmup readiness."""
+
+from dataclasses import dataclass
+from typing import Literal
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from veupath_chatbot.platform.cache import TTLCache
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.types import JSONObject
 
 logger = get_logger(__name__)
 
@@ -15,18 +20,90 @@ async def check_database(session: AsyncSession) -> bool:
     return True
 
 
+#: Probe timeout; a readiness check should not hang on a stalled Qdrant.
+_QDRANT_PROBE_TIMEOUT_SECONDS = 2
+
+# Last Qdrant probe result, reused so frequent readiness polls don't each
+# open a connection.
+_qdrant_probe: TTLCache[bool] = TTLCache(max_entries=1, ttl_seconds=10)
+
+
 async def check_qdrant() -> bool:
-    """Return ``True`` if Qdrant is reachable and lists collections."""
+    """Return ``True`` if Qdrant is reachable and lists collections.
+
+    The probe result is cached for a few seconds.  Failures are logged
+    and reported as ``False``.
+    """
+    cached = _qdrant_probe.get("qdrant")
+    if cached is not None:
+        return cached
+
     settings = get_settings()
     from qdrant_client import AsyncQdrantClient
 
     client = AsyncQdrantClient(
         url=settings.qdrant_url,
         api_key=settings.qdrant_api_key,
-        timeout=5,
+        timeout=_QDRANT_PROBE_TIMEOUT_SECONDS,
     )
     try:
         await client.get_collections()
-        return True
+        ok = True
+    except Exception as exc:
+        logger.error("Readiness check: Qdrant unreachable", error=str(exc))
+        ok = False
     finally:
         await client.close()
+    _qdrant_probe.set("qdrant", ok)
+    return ok
+
+
+# ── Subsystem readiness ──
+#
+# The API serves traffic as soon as its core dependencies (database, Redis)
+# are up.  Slower warmup work -- vector store collections, RAG ingestion,
+# WDK catalog preloads -- runs in the background and reports its progress
+# here, so readiness probes can show it without waiting for it.
+
+SubsystemState = Literal["pending", "warming", "ready", "failed", "disabled"]
+
+
+@dataclass
+class SubsystemStatus:
+    """Warmup state of one subsystem."""
+
+    state: SubsystemState = "pending"
+    detail: str | None = None
+
+    def to_json(self) -> JSONObject:
+        out: JSONObject = {"state": self.state}
+        if self.detail:
+            out["detail"] = self.detail
+        return out
+
+
+_subsystems: dict[str, SubsystemStatus] = {}
+
+
+def set_subsystem_state(
+    name: str, state: SubsystemState, detail: str | None = None
+) -> None:
+    """Record the warmup *state* of subsystem *name*."""
+    _subsystems[name] = SubsystemStatus(state=state, detail=detail)
+    logger.info("Subsystem state", subsystem=name, state=state, detail=detail)
+
+
+def get_subsystem_state(name: str) -> SubsystemState | None:
+    """Return the recorded state of *name*, or ``None`` if never reported."""
+    status = _subsystems.get(name)
+    return status.state if status else None
+
+
+def subsystem_report() -> JSONObject:
+    """Return ``{name: {"state": ..., "detail": ...}}`` for every subsystem."""
+    return {name: status.to_json() for name, status in sorted(_subsystems.items())}
+
+
+def reset_subsystems() -> None:
+    """Forget all recorded subsystem states (used by tests)."""
+    _subsystems.clear()
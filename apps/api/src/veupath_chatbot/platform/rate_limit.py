@@ -0,0 +1,125 @@
+"""Cost-aware token-bucket rate limiting shared across workers.
+
+Each caller (a user, or a remote address for anonymous requests) owns a
+bucket of ``burst`` tokens that refills at ``refill_per_second``.  Routes
+declare how many tokens a request costs, so a cheap GET and an endpoint
+that launches a long experiment draw down the same budget at different
+rates.
+
+Buckets live in Redis and are updated by a single Lua script, so limits
+hold across every API worker and use Redis server time.  When Redis is
+unavailable (not initialized, or erroring) the limiter falls back to
+per-process buckets rather than failing requests.
+"""
+
+import time
+from collections.abc import Awaitable
+from functools import lru_cache
+
+from redis.exceptions import RedisError
+
+from veupath_chatbot.platform.cache import TTLCache
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.redis import get_redis
+
+logger = get_logger(__name__)
+
+# KEYS[1] = bucket key; ARGV = burst, refill/s, cost.
+# Returns the wait in seconds (as a string, to keep the fraction) before
+# ``cost`` tokens are available; "0" means the tokens were taken.
+_TOKEN_BUCKET_LUA = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = burst
+  ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by caller, stored in Redis with a local fallback."""
+
+    def __init__(
+        self,
+        *,
+        burst: float,
+        refill_per_second: float,
+        prefix: str = "ratelimit",
+        max_local_buckets: int = 10_000,
+    ) -> None:
+        self.burst = max(1.0, burst)
+        self.refill_per_second = max(1e-6, refill_per_second)
+        self.prefix = prefix
+        self._local: TTLCache[tuple[float, float]] = TTLCache(
+            max_entries=max_local_buckets,
+            ttl_seconds=self.burst / self.refill_per_second + 1,
+        )
+
+    async def acquire(self, key: str, cost: float = 1.0) -> float:
+        """Take *cost* tokens from *key*'s bucket.
+
+        :param key: Caller identity, e.g. ``"user:<uuid>"``.
+        :param cost: Tokens this request costs (capped at the burst size).
+        :returns: ``0.0`` if the tokens were taken, otherwise the number of
+            seconds until enough tokens will be available.
+        """
+        cost = min(max(cost, 0.0), self.burst)
+        try:
+            redis = get_redis()
+        except RuntimeError:
+            return self._acquire_local(key, cost)
+        try:
+            result = redis.eval(
+                _TOKEN_BUCKET_LUA,
+                1,
+                f"{self.prefix}:{key}",
+                self.burst,
+                self.refill_per_second,
+                cost,
+            )
+            if isinstance(result, Awaitable):
+                result = await result
+        except RedisError as exc:
+            logger.warning("Rate limit check fell back to local bucket", error=str(exc))
+            return self._acquire_local(key, cost)
+        return float(result.decode() if isinstance(result, bytes) else str(result))
+
+    def _acquire_local(self, key: str, cost: float) -> float:
+        now = time.monotonic()
+        tokens, ts = self._local.get(key) or (self.burst, now)
+        tokens = min(self.burst, tokens + (now - ts) * self.refill_per_second)
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / self.refill_per_second
+        self._local.set(key, (tokens, now))
+        return wait
+
+
+@lru_cache
+def get_rate_limiter() -> TokenBucketLimiter:
+    """Return the process-wide limiter configured from settings."""
+    settings = get_settings()
+    return TokenBucketLimiter(
+        burst=settings.rate_limit_burst,
+        refill_per_second=settings.rate_limit_refill_per_second,
+    )
@@ -1,19 +1,22 @@
 """Authentication, authorization, and rate limiting."""
 
+import base64
+import hashlib
 import time
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 from uuid import UUID
 
 import jwt
+from cryptography.fernet import Fernet, InvalidToken
 from fastapi import Depends, Request
 from fastapi.security import APIKeyCookie
 from jwt.types import Options
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.context import user_id_ctx
-from veupath_chatbot.platform.errors import UnauthorizedError
+from veupath_chatbot.platform.errors import RateLimitedError, UnauthorizedError
+from veupath_chatbot.platform.rate_limit import get_rate_limiter
 
 _JWT_ALGORITHM = "HS256"
 _JWT_DECODE_OPTIONS: Options = {"require": ["exp", "sub"]}
@@ -23,9 +26,6 @@ _JWT_DECODE_OPTIONS: Options = {"require": ["exp", "sub"]}
 # internal tooling, but OpenAPI should reflect cookies.
 auth_cookie = APIKeyCookie(name="pathfinder-auth", auto_error=False)
 
-# Rate limiter (slowapi). Import and attach to the FastAPI app where needed.
-limiter = Limiter(key_func=get_remote_address)
-
 
 def _extract_token(cookie_token: str | None, request: Request) -> str | None:
     """Extract the raw JWT string from a cookie or Authorization header."""
@@ -89,3 +89,55 @@ def create_user_token(user_id: UUID, expires_in: int = 86400) -> str:
         "exp": int(time.time()) + expires_in,
     }
     return jwt.encode(payload, settings.api_secret_key, algorithm=_JWT_ALGORITHM)
+
+
+def _secret_box() -> Fernet:
+    digest = hashlib.sha256(
+        b"pathfinder-secret-box:" + get_settings().api_secret_key.encode()
+    ).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def encrypt_secret(value: str) -> str:
+    """Encrypt *value* for storage outside the process (e.g. in Redis).
+
+    The key is derived from ``api_secret_key``; rotating it makes stored
+    ciphertexts unreadable.
+    """
+    return _secret_box().encrypt(value.encode()).decode()
+
+
+def decrypt_secret(ciphertext: str | bytes) -> str | None:
+    """Decrypt a value from :func:`encrypt_secret`; ``None`` if unreadable."""
+    try:
+        return _secret_box().decrypt(ciphertext).decode()
+    except InvalidToken, ValueError:
+        return None
+
+
+def rate_limit(cost: float = 1.0) -> Callable[..., Awaitable[None]]:
+    """Build a route dependency that spends *cost* tokens per request.
+
+    Buckets are keyed by the authenticated user, falling back to the remote
+    address for anonymous requests.  Use as
+    ``dependencies=[Depends(rate_limit(cost=...))]`` on the route.
+
+    :param cost: Tokens the route costs (see ``rate_limit_*`` settings).
+    :raises RateLimitedError: When the caller's bucket is empty.
+    """
+
+    async def _check(
+        request: Request,
+        user_id: Annotated[UUID | None, Depends(get_optional_user)],
+    ) -> None:
+        if not get_settings().rate_limit_enabled:
+            return
+        if user_id is not None:
+            key = f"user:{user_id}"
+        else:
+            key = f"ip:{request.client.host if request.client else 'unknown'}"
+        retry_after = await get_rate_limiter().acquire(key, cost)
+        if retry_after > 0:
+            raise RateLimitedError(retry_after=retry_after)
+
+    return _check
@@ -14,14 +14,18 @@ The base class derives persist / load / delete from those, eliminating the
 boilerplate that was previously duplicated across every concrete store.
 """
 
+import asyncio
 from collections.abc import Callable
 from typing import Any, Protocol, cast
+from weakref import WeakValueDictionary
 
 from sqlalchemy import delete as sa_delete
+from sqlalchemy import update as sa_update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.tasks import spawn
+from veupath_chatbot.platform.tracing import span
 
 logger = get_logger(__name__)
 
@@ -43,6 +47,10 @@ class WriteThruStore[T: Identifiable]:
     * ``_from_row`` — ``(row) -> T`` to reconstruct the entity from a DB row
 
     Every entity must satisfy the ``Identifiable`` protocol (have ``id: str``).
+
+    Writes for the same entity are applied in the order they were issued:
+    each background write holds a per-entity lock, and waiters acquire it
+    first-come first-served.
     """
 
     _model: Any = None  # SQLAlchemy ORM model class — set by subclass
@@ -53,6 +61,18 @@ class WriteThruStore[T: Identifiable]:
 
     def __init__(self) -> None:
         self._cache: dict[str, T] = {}
+        # Entries disappear once no pending write holds the lock.
+        self._write_locks: WeakValueDictionary[str, asyncio.Lock] = (
+            WeakValueDictionary()
+        )
+
+    def _write_lock(self, entity_id: str) -> asyncio.Lock:
+        """Return the lock that serializes DB writes for *entity_id*."""
+        lock = self._write_locks.get(entity_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._write_locks[entity_id] = lock
+        return lock
 
     # -- DB helpers (derived from _model / _to_row / _from_row) ----------------
 
@@ -70,9 +90,16 @@ class WriteThruStore[T: Identifiable]:
                     set_={k: v for k, v in vals.items() if k != "id"},
                 )
             )
-            async with async_session_factory() as session:
-                await session.execute(stmt)
-                await session.commit()
+            async with self._write_lock(entity.id):
+                with span(
+                    "store.save",
+                    category="db",
+                    endpoint=f"save {self._model.__tablename__}",
+                    entity_id=entity.id,
+                ):
+                    async with async_session_factory() as session:
+                        await session.execute(stmt)
+                        await session.commit()
         except Exception:
             logger.exception(
                 "Failed to persist entity to DB",
@@ -80,6 +107,31 @@ class WriteThruStore[T: Identifiable]:
                 entity_id=entity.id,
             )
 
+    async def _update(self, entity_id: str, values: dict[str, object]) -> None:
+        """Apply column *values* to an existing entity row."""
+        from veupath_chatbot.persistence.session import async_session_factory
+
+        stmt = (
+            sa_update(self._model).where(self._model.id == entity_id).values(**values)
+        )
+        try:
+            async with self._write_lock(entity_id):
+                with span(
+                    "store.update",
+                    category="db",
+                    endpoint=f"update {self._model.__tablename__}",
+                    entity_id=entity_id,
+                ):
+                    async with async_session_factory() as session:
+                        await session.execute(stmt)
+                        await session.commit()
+        except Exception:
+            logger.exception(
+                "Failed to update entity in DB",
+                entity_type=self._model.__tablename__,
+                entity_id=entity_id,
+            )
+
     async def _load(self, entity_id: str) -> T | None:
         """Load a single entity from the database by primary key."""
         from veupath_chatbot.persistence.session import async_session_factory
@@ -95,7 +147,7 @@ class WriteThruStore[T: Identifiable]:
         from veupath_chatbot.persistence.session import async_session_factory
 
         stmt = sa_delete(self._model).where(self._model.id == entity_id)
-        async with async_session_factory() as session:
+        async with self._write_lock(entity_id), async_session_factory() as session:
             await session.execute(stmt)
             await session.commit()
 
@@ -105,6 +157,16 @@ class WriteThruStore[T: Identifiable]:
         self._cache[entity.id] = entity
         spawn(self._persist(entity), name=f"persist-{entity.id}")
 
+    def save_partial(self, entity: T, values: dict[str, object]) -> None:
+        """Cache *entity* and write only *values* to its existing row.
+
+        *values* maps column names to new values or SQL expressions.  Use
+        after a full :meth:`save` when a change touches few columns; the
+        row must already exist (a missing row is left missing).
+        """
+        self._cache[entity.id] = entity
+        spawn(self._update(entity.id, values), name=f"persist-{entity.id}")
+
     def get(self, entity_id: str) -> T | None:
         return self._cache.get(entity_id)
 
@@ -0,0 +1,319 @@
+"""Lightweight timing spans and per-operation call profiles.
+
+Spans follow the OpenTelemetry data model (128-bit trace IDs, 64-bit span
+IDs, parent links, attributes and an OK/ERROR status) without requiring
+the OpenTelemetry SDK.  Every finished span is:
+
+* aggregated into the :class:`OperationProfile` of the operation it ran
+  under (call counts and latency percentiles per category and endpoint),
+  which the operations API serves and which is stored on the operation
+  row when it finishes;
+* appended to the JSON-lines file configured by ``tracing_export_path``,
+  using OTLP/JSON field names, when a file exporter is configured.
+
+Usage::
+
+    with span("wdk.request", category="wdk", endpoint="GET /record-types"):
+        ...
+
+    with profile_operation(operation_id):
+        ...  # spans started here (and in tasks spawned here) are profiled
+"""
+
+import json
+import math
+import secrets
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.types import JSONObject, JSONValue
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed unit of work."""
+
+    name: str
+    category: str
+    endpoint: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, JSONValue] = field(default_factory=dict)
+    error: str | None = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _duration_ms: float = field(default=0.0, repr=False)
+
+    @property
+    def duration_ms(self) -> float:
+        return self._duration_ms
+
+    def set_attribute(self, key: str, value: JSONValue) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: BaseException | None = None) -> None:
+        """Close the span and hand it to the profile and exporter."""
+        if self.end_ns:
+            return
+        self._duration_ms = (time.perf_counter() - self._started) * 1000
+        self.end_ns = self.start_ns + int(self._duration_ms * 1_000_000)
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(self)
+        if _exporter is not None:
+            _exporter.export(self)
+
+    def to_otlp(self) -> JSONObject:
+        """Span in OTLP/JSON field naming (attributes as a flat object)."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": "SPAN_KIND_CLIENT"
+            if self.category in ("wdk", "llm", "db")
+            else "SPAN_KIND_INTERNAL",
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": {
+                "category": self.category,
+                "endpoint": self.endpoint,
+                **self.attributes,
+            },
+            "status": (
+                {"code": "STATUS_CODE_ERROR", "message": self.error}
+                if self.error
+                else {"code": "STATUS_CODE_OK"}
+            ),
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_current_profile: ContextVar[OperationProfile | None] = ContextVar(
+    "current_profile", default=None
+)
+
+
+def start_span(
+    name: str,
+    *,
+    category: str = "internal",
+    endpoint: str | None = None,
+    **attributes: JSONValue,
+) -> Span:
+    """Start a span as a child of the current one, without activating it.
+
+    Use this where the work does not fit a ``with`` block in a single task
+    (e.g. around an async generator) and call :meth:`Span.end` when done.
+    """
+    parent = _current_span.get()
+    return Span(
+        name=name,
+        category=category,
+        endpoint=endpoint or name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=dict(attributes),
+    )
+
+
+@contextmanager
+def span(
+    name: str,
+    *,
+    category: str = "internal",
+    endpoint: str | None = None,
+    **attributes: JSONValue,
+) -> Iterator[Span]:
+    """Time the enclosed block as a span; nested spans become its children.
+
+    :param name: Span name (e.g. ``"wdk.request"``).
+    :param category: Profile bucket: ``wdk``, ``llm``, ``db``, ``phase`` or
+        ``internal``.
+    :param endpoint: Profile key within the category (defaults to *name*);
+        keep it low-cardinality, e.g. a path template rather than a URL.
+    """
+    current = start_span(name, category=category, endpoint=endpoint, **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.end(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+
+
+# ---------------------------------------------------------------------------
+# Per-operation profiles
+# ---------------------------------------------------------------------------
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class OperationProfile:
+    """Call counts and latencies of the spans finished under one operation.
+
+    Durations of concurrent spans overlap, so category totals can exceed
+    the operation's wall time; compare them with each other, not with it.
+    """
+
+    def __init__(self, operation_id: str) -> None:
+        self.operation_id = operation_id
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._durations: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+        self._errors: Counter[tuple[str, str]] = Counter()
+
+    def record(self, finished: Span) -> None:
+        key = (finished.category, finished.endpoint)
+        self._durations[key].append(finished.duration_ms)
+        if finished.error:
+            self._errors[key] += 1
+
+    def finish(self) -> None:
+        """Stop the wall clock; spans finished later are still recorded."""
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+    def to_json(self) -> JSONObject:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        categories: dict[str, dict[str, float]] = {}
+        rows: list[tuple[float, JSONObject]] = []
+        for (category, endpoint), durations in self._durations.items():
+            ordered = sorted(durations)
+            total = sum(ordered)
+            bucket = categories.setdefault(category, {"count": 0, "totalMs": 0.0})
+            bucket["count"] += len(ordered)
+            bucket["totalMs"] += total
+            rows.append(
+                (
+                    total,
+                    {
+                        "category": category,
+                        "endpoint": endpoint,
+                        "count": len(ordered),
+                        "errors": self._errors[(category, endpoint)],
+                        "totalMs": round(total, 1),
+                        "meanMs": round(total / len(ordered), 1),
+                        "p50Ms": round(_percentile(ordered, 50), 1),
+                        "p95Ms": round(_percentile(ordered, 95), 1),
+                        "p99Ms": round(_percentile(ordered, 99), 1),
+                        "maxMs": round(ordered[-1], 1),
+                    },
+                )
+            )
+        rows.sort(key=lambda row: row[0], reverse=True)
+        return {
+            "operationId": self.operation_id,
+            "wallMs": round((end - self._started) * 1000, 1),
+            "categories": {
+                name: {"count": int(b["count"]), "totalMs": round(b["totalMs"], 1)}
+                for name, b in sorted(categories.items())
+            },
+            "endpoints": [row for _, row in rows],
+        }
+
+
+_active_profiles: dict[str, OperationProfile] = {}
+
+
+@contextmanager
+def profile_operation(operation_id: str) -> Iterator[OperationProfile]:
+    """Collect a profile of every span finished inside the block.
+
+    Tasks spawned inside the block inherit the profile through the copied
+    context.  While the block runs the profile is available to
+    :func:`get_operation_profile`.
+    """
+    profile = OperationProfile(operation_id)
+    _active_profiles[operation_id] = profile
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+        profile.finish()
+        _active_profiles.pop(operation_id, None)
+
+
+async def profiled[T](operation_id: str, work: Awaitable[T]) -> T:
+    """Await *work* inside :func:`profile_operation` (for background tasks)."""
+    with profile_operation(operation_id):
+        return await work
+
+
+def get_operation_profile(operation_id: str) -> OperationProfile | None:
+    """Return the live profile of an operation running in this process."""
+    return _active_profiles.get(operation_id)
+
+
+# ---------------------------------------------------------------------------
+# File exporter
+# ---------------------------------------------------------------------------
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file as OTLP/JSON lines.
+
+    Writes go through a buffered file handle, so a span costs a string
+    append until the buffer fills; :meth:`close` flushes the rest.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._file: IO[str] | None = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, finished: Span) -> None:
+        line = json.dumps(finished.to_otlp(), separators=(",", ":"), default=str)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_exporter: FileSpanExporter | None = None
+
+
+def configure_tracing(export_path: str) -> None:
+    """Install the file exporter when *export_path* is set (idempotent)."""
+    global _exporter
+    if not export_path or _exporter is not None:
+        return
+    _exporter = FileSpanExporter(Path(export_path))
+    logger.info("Span export enabled", path=export_path)
+
+
+def shutdown_tracing() -> None:
+    """Flush and remove the file exporter."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+        _exporter = None
@@ -72,7 +72,8 @@ def _threshold_and_limit(
 class RagSearchService:
     """Stateless service encapsulating all Qdrant-backed lookups.
 
-    Constructed with a *site_id*; owns its own ``QdrantStore`` instance.
+    Constructed with a *site_id*; uses the process-wide ``QdrantStore``
+    unless one is passed in.
     """
 
     def __init__(self, *, site_id: str, store: QdrantStore | None = None) -> None:
@@ -3,69 +3,168 @@
 When a user @-mentions a strategy or experiment in chat, we load the full
 entity and format a human-readable context block that gets appended to the
 system prompt so the model has complete information from the start.
+
+Mentions are resolved concurrently before the turn starts: all strategy
+projections in one query, each experiment in its own lookup.  Every lookup
+gets ``chat_mention_timeout_seconds``; one that is slower (or fails) is
+rendered as a compact summary from the mention itself instead of delaying
+the model.  Rendered strategy blocks are cached per projection version
+(``updated_at`` and ``last_event_id``), so a strategy mentioned again in
+later turns is only re-rendered after it changes.  Experiment blocks are
+rendered every time: experiments have no version stamp, and their metrics
+are replaced in place by re-evaluation and refinement.
 """
 
+import asyncio
 import json
+from collections.abc import Awaitable
 from typing import Literal
+from uuid import UUID
 
+from veupath_chatbot.persistence.models import StreamProjection
 from veupath_chatbot.persistence.repositories.stream import StreamRepository
+from veupath_chatbot.platform.cache import TTLCache, cache_key
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.services.experiment.store import get_experiment_store
-from veupath_chatbot.services.experiment.types import ExperimentMetrics
+from veupath_chatbot.services.experiment.types import Experiment, ExperimentMetrics
 
 logger = get_logger(__name__)
 
 MentionType = Literal["strategy", "experiment"]
 
+# Rendered strategy blocks keyed by stream ID and projection version.
+_rendered: TTLCache[str] = TTLCache(max_entries=512, ttl_seconds=3600)
+
+
+class _Unavailable:
+    """Marker for a lookup that timed out or failed."""
+
+
+_UNAVAILABLE = _Unavailable()
+
 
-async def build_mention_context(
-    mentions: list[dict[str, str]],
-    stream_repo: StreamRepository,
-) -> str:
+async def build_mention_context(mentions: list[dict[str, str]]) -> str:
     """Build concatenated context blocks for all mentions.
 
     :param mentions: List of ``{"type": ..., "id": ..., "displayName": ...}`` dicts.
-    :param stream_repo: Repository for loading stream projections.
     :returns: Markdown context string (empty if no mentions resolved).
     """
-    blocks: list[str] = []
-
+    strategy_ids: dict[str, UUID] = {}
+    experiment_ids: list[str] = []
     for m in mentions:
         m_type = m.get("type")
         m_id = m.get("id", "")
-
         if m_type == "strategy":
-            block = await _build_strategy_context(m_id, stream_repo)
-            if block:
-                blocks.append(block)
+            try:
+                strategy_ids[m_id] = UUID(m_id)
+            except ValueError:
+                logger.warning("Invalid strategy mention ID", strategy_id=m_id)
         elif m_type == "experiment":
-            block = await _build_experiment_context(m_id)
-            if block:
-                blocks.append(block)
+            experiment_ids.append(m_id)
         else:
             logger.debug("Unknown mention type", mention_type=m_type, mention_id=m_id)
 
-    return "\n\n".join(blocks)
+    budget = get_settings().chat_mention_timeout_seconds
+    store = get_experiment_store()
+    async with asyncio.TaskGroup() as tg:
+        projections_task = tg.create_task(
+            _within(budget, _load_projections(set(strategy_ids.values())))
+        )
+        experiment_tasks = {
+            eid: tg.create_task(_within(budget, store.aget(eid)))
+            for eid in dict.fromkeys(experiment_ids)
+        }
+    projections = projections_task.result()
+
+    blocks: list[str] = []
+    seen: set[tuple[str, str]] = set()
+    for m in mentions:
+        m_type = m.get("type", "")
+        m_id = m.get("id", "")
+        if (m_type, m_id) in seen:
+            continue
+        seen.add((m_type, m_id))
+
+        block: str | None = None
+        if m_type == "strategy" and m_id in strategy_ids:
+            if isinstance(projections, _Unavailable):
+                block = _summary_block("Strategy", m)
+            else:
+                block = _strategy_block(projections.get(strategy_ids[m_id]), m_id)
+        elif m_type == "experiment":
+            experiment = experiment_tasks[m_id].result()
+            if isinstance(experiment, _Unavailable):
+                block = _summary_block("Experiment", m)
+            else:
+                block = _experiment_block(experiment, m_id)
+        if block:
+            blocks.append(block)
 
+    return "\n\n".join(blocks)
 
-async def _build_strategy_context(
-    strategy_id: str,
-    stream_repo: StreamRepository,
-) -> str | None:
-    """Load a stream projection and format a rich context block."""
-    from uuid import UUID
 
+async def _within[T](budget: float, lookup: Awaitable[T]) -> T | _Unavailable:
+    """Await *lookup* for at most *budget* seconds."""
     try:
-        sid = UUID(strategy_id)
-    except ValueError:
-        logger.warning("Invalid strategy mention ID", strategy_id=strategy_id)
-        return None
+        return await asyncio.wait_for(lookup, budget)
+    except TimeoutError:
+        logger.info("Mention lookup timed out", budget_seconds=budget)
+    except Exception as exc:
+        logger.warning("Mention lookup failed", error=str(exc))
+    return _UNAVAILABLE
+
 
-    projection = await stream_repo.get_projection(sid)
-    if not projection:
+async def _load_projections(stream_ids: set[UUID]) -> dict[UUID, StreamProjection]:
+    """Load projections in a session of their own.
+
+    A lookup cut short by its time budget is cancelled mid-query, which
+    must not leave the request's session unusable.
+    """
+    if not stream_ids:
+        return {}
+    from veupath_chatbot.persistence.session import async_session_factory
+
+    async with async_session_factory() as session:
+        return await StreamRepository(session).get_projections(stream_ids)
+
+
+def _summary_block(kind: str, mention: dict[str, str]) -> str:
+    """Compact block for a mention whose entity could not be loaded in time."""
+    m_id = mention.get("id", "")
+    name = mention.get("displayName") or m_id
+    return (
+        f'## Referenced {kind}: "{name}"\n'
+        f"- **ID**: {m_id}\n"
+        f"- Details could not be loaded in time; look them up with tools if needed."
+    )
+
+
+def _strategy_block(
+    projection: StreamProjection | None, strategy_id: str
+) -> str | None:
+    if projection is None:
         logger.warning("Mentioned strategy not found", strategy_id=strategy_id)
         return None
+    key = cache_key(
+        "strategy", strategy_id, projection.updated_at, projection.last_event_id
+    )
+    block = _rendered.get(key)
+    if block is None:
+        block = _format_strategy(projection)
+        _rendered.set(key, block)
+    return block
+
+
+def _experiment_block(experiment: Experiment | None, experiment_id: str) -> str | None:
+    if experiment is None:
+        logger.warning("Mentioned experiment not found", experiment_id=experiment_id)
+        return None
+    return _format_experiment(experiment)
 
+
+def _format_strategy(projection: StreamProjection) -> str:
+    """Format a stream projection as a rich context block."""
     lines: list[str] = [
         f'## Referenced Strategy: "{projection.name}"',
         f"- **ID**: {projection.stream_id}",
@@ -125,14 +224,8 @@ async def _build_strategy_context(
     return "\n".join(lines)
 
 
-async def _build_experiment_context(experiment_id: str) -> str | None:
-    """Load an experiment and format a rich context block."""
-    store = get_experiment_store()
-    experiment = await store.aget(experiment_id)
-    if not experiment:
-        logger.warning("Mentioned experiment not found", experiment_id=experiment_id)
-        return None
-
+def _format_experiment(experiment: Experiment) -> str:
+    """Format an experiment as a rich context block."""
     cfg = experiment.config
     lines: list[str] = [
         f'## Referenced Experiment: "{cfg.name or experiment.id}"',
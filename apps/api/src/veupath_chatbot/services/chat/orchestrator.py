@@ -21,9 +21,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from veupath_chatbot.persistence.models import Stream, StreamProjection
 from veupath_chatbot.persistence.repositories import StreamRepository, UserRepository
 from veupath_chatbot.persistence.session import async_session_factory
-from veupath_chatbot.platform.events import emit, read_stream_messages
+from veupath_chatbot.platform.events import emit, forward_events, read_stream_messages
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.platform.tracing import profiled
 from veupath_chatbot.platform.types import JSONObject, ModelProvider, ReasoningEffort
 from veupath_chatbot.services.chat.streaming import stream_chat
 from veupath_chatbot.services.chat.utils import parse_selected_nodes
@@ -167,24 +168,27 @@ async def start_chat_stream(
 
     # Launch the background producer as an asyncio task.
     task = asyncio.create_task(
-        _chat_producer(
-            stream_id_str=stream_id_str,
-            operation_id=operation_id,
-            site_id=site_id,
-            user_id=user_id,
-            model_message=model_message,
-            selected_nodes=selected_nodes,
-            provider_override=provider_override,
-            model_override=model_override,
-            reasoning_effort=reasoning_effort,
-            mentions=mentions,
-            disable_rag=disable_rag,
-            disabled_tools=disabled_tools,
-            temperature=temperature,
-            seed=seed,
-            context_size=context_size,
-            response_tokens=response_tokens,
-            reasoning_budget=reasoning_budget,
+        profiled(
+            operation_id,
+            _chat_producer(
+                stream_id_str=stream_id_str,
+                operation_id=operation_id,
+                site_id=site_id,
+                user_id=user_id,
+                model_message=model_message,
+                selected_nodes=selected_nodes,
+                provider_override=provider_override,
+                model_override=model_override,
+                reasoning_effort=reasoning_effort,
+                mentions=mentions,
+                disable_rag=disable_rag,
+                disabled_tools=disabled_tools,
+                temperature=temperature,
+                seed=seed,
+                context_size=context_size,
+                response_tokens=response_tokens,
+                reasoning_budget=reasoning_budget,
+            ),
         )
     )
     _active_tasks[operation_id] = task
@@ -205,7 +209,6 @@ async def _build_agent_context(
     reasoning_effort: ReasoningEffort | None,
     mentions: list[dict[str, str]] | None,
     projection: StreamProjection,
-    stream_repo: StreamRepository | None = None,
     # Thesis experiment controls
     disable_rag: bool = False,
     temperature: float | None = None,
@@ -230,12 +233,12 @@ async def _build_agent_context(
 
     # Build rich context from @-mentions.
     mentioned_context: str | None = None
-    if mentions and stream_repo is not None:
+    if mentions:
         from veupath_chatbot.services.chat.mention_context import (
             build_mention_context,
         )
 
-        mentioned_context = await build_mention_context(mentions, stream_repo) or None
+        mentioned_context = await build_mention_context(mentions) or None
 
     # Build chat history from Redis (not from DB).
     history = await _build_chat_history_from_redis(stream_id_str)
@@ -292,7 +295,8 @@ async def _run_stream_loop(
     """Emit message_start, iterate the stream, and mark completion.
 
     Emits a ``message_start`` event with strategy context, then forwards
-    every event from the stream iterator to Redis/PostgreSQL via ``emit()``.
+    every event from the stream iterator to Redis/PostgreSQL via
+    ``forward_events()``, which pipelines bursts.
     """
     # Extract description from plan metadata when available.
     plan = projection.plan if isinstance(projection.plan, dict) else {}
@@ -335,22 +339,9 @@ async def _run_stream_loop(
         session=session,
     )
 
-    async for event_value in stream_iter:
-        if not isinstance(event_value, dict):
-            continue
-        event_type_raw = event_value.get("type", "")
-        event_type = event_type_raw if isinstance(event_type_raw, str) else ""
-        event_data_raw = event_value.get("data")
-        event_data = event_data_raw if isinstance(event_data_raw, dict) else {}
-
-        await emit(
-            redis,
-            stream_id_str,
-            operation_id,
-            event_type,
-            event_data,
-            session=session,
-        )
+    await forward_events(
+        redis, stream_id_str, operation_id, stream_iter, session=session
+    )
 
     await stream_repo.complete_operation(operation_id)
 
@@ -459,7 +450,6 @@ async def _chat_producer(
             reasoning_effort=reasoning_effort,
             mentions=mentions,
             projection=projection,
-            stream_repo=bg_stream_repo,
             disable_rag=disable_rag,
             temperature=temperature,
             seed=seed,
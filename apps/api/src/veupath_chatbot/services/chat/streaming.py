@@ -10,6 +10,7 @@ from kani import Kani
 from kani.models import ChatRole
 
 from veupath_chatbot.ai.models.pricing import estimate_cost
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.errors import ErrorCode
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.parsing import parse_jsonish
@@ -115,6 +116,65 @@ def _accumulate_subkani_metrics(
     metrics["subkani_calls"] += int(lc) if isinstance(lc, (int, float)) else 0
 
 
+class _DeltaCoalescer:
+    """Merge streamed assistant tokens into fewer ``assistant_delta`` events.
+
+    Every event costs a Redis write and an SSE frame per subscriber, so
+    tokens are held until *max_bytes* of text is buffered or *max_delay*
+    seconds have passed since the oldest held token.  The first text of a
+    message goes out at once; :meth:`flush` sends the rest at tool and
+    message boundaries.  A slow model therefore still streams token by
+    token, while a fast one produces one event per buffer.
+    """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue[JSONObject],
+        message_id: str,
+        *,
+        max_bytes: int,
+        max_delay: float,
+    ) -> None:
+        self._queue = queue
+        self._message_id = message_id
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._started = False
+
+    def add(self, token: str) -> None:
+        self._parts.append(token)
+        self._size += len(token.encode())
+        if not self._started or self._size >= self._max_bytes:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self.flush
+            )
+
+    def flush(self) -> None:
+        """Emit any held text as one ``assistant_delta`` event."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._parts:
+            return
+        delta = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._started = True
+        self._queue.put_nowait(
+            {
+                "type": "assistant_delta",
+                "data": AssistantDeltaEventData(
+                    messageId=self._message_id, delta=delta
+                ).model_dump(by_alias=True),
+            }
+        )
+
+
 async def stream_chat(
     agent: Kani, message: str, *, model_id: str = ""
 ) -> AsyncIterator[JSONObject]:
@@ -146,6 +206,13 @@ async def stream_chat(
         # all assistant text + tool calls as one logical message.
         message_id = str(uuid4())
         accumulated_text_parts: list[str] = []
+        settings = get_settings()
+        deltas = _DeltaCoalescer(
+            queue,
+            message_id,
+            max_bytes=settings.chat_delta_flush_bytes,
+            max_delay=settings.chat_delta_flush_ms / 1000,
+        )
 
         try:
             async for stream in agent.full_round_stream(message):
@@ -157,14 +224,8 @@ async def stream_chat(
                         if not token:
                             continue
                         saw_assistant_message = True
-                        await queue.put(
-                            {
-                                "type": "assistant_delta",
-                                "data": AssistantDeltaEventData(
-                                    messageId=message_id, delta=token
-                                ).model_dump(by_alias=True),
-                            }
-                        )
+                        deltas.add(token)
+                    deltas.flush()
 
                     msg = await stream.message()
                     completion = await stream.completion()
@@ -299,6 +360,7 @@ async def stream_chat(
                 }
             )
         except Exception as e:  # pragma: no cover
+            deltas.flush()
             logger.error(
                 "Stream error",
                 exc_info=True,
@@ -312,12 +374,22 @@ async def stream_chat(
                 }
             )
         finally:
+            deltas.flush()
             estimated_cost = estimate_cost(
                 model_id,
                 prompt_tokens=total_prompt_tokens,
                 completion_tokens=total_completion_tokens,
                 cached_tokens=cached_tokens,
             )
+            if total_prompt_tokens:
+                logger.info(
+                    "Prompt cache usage",
+                    model_id=model_id,
+                    prompt_tokens=total_prompt_tokens,
+                    cached_tokens=cached_tokens,
+                    cache_hit_ratio=round(cached_tokens / total_prompt_tokens, 3),
+                    llm_calls=llm_call_count,
+                )
             await queue.put(
                 {
                     "type": "message_end",
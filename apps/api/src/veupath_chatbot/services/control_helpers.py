@@ -1,12 +1,15 @@
 """Formatting and parsing utilities for control-test evaluation."""
 
-from veupath_chatbot.integrations.veupathdb.strategy_api import (
-    StrategyAPI,
-    is_internal_wdk_strategy_name,
-    strip_internal_wdk_strategy_name,
-)
+from veupath_chatbot.domain.strategy.ast import StepTreeNode
+from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.services.experiment.helpers import extract_wdk_id
 from veupath_chatbot.services.experiment.types import ControlValueFormat
+from veupath_chatbot.services.wdk.temp_strategies import (
+    end_temp_strategy_lease,
+    forget_temp_strategy,
+    record_temp_strategy,
+)
 
 logger = get_logger(__name__)
 
@@ -23,14 +26,43 @@ def _encode_id_list(ids: list[str], fmt: ControlValueFormat) -> str:
     return json.dumps(cleaned)
 
 
+async def create_temp_strategy(
+    api: StrategyAPI,
+    *,
+    step_tree: StepTreeNode,
+    name: str,
+    description: str | None = None,
+) -> int | None:
+    """Create an internal WDK strategy for temporary use and record it.
+
+    The strategy is recorded in the temp-strategy ledger, so the background
+    reaper deletes it if :func:`delete_temp_strategy` never runs.  *name*
+    should be one of ``temp_strategies.TEMP_STRATEGY_NAMES``.
+
+    :returns: The WDK strategy ID, or None if WDK returned none.
+    """
+    created = await api.create_strategy(
+        step_tree=step_tree,
+        name=name,
+        description=description,
+        is_internal=True,
+    )
+    strategy_id = extract_wdk_id(created)
+    if strategy_id is not None:
+        await record_temp_strategy(api, strategy_id, step_tree)
+    return strategy_id
+
+
 async def delete_temp_strategy(api: StrategyAPI, strategy_id: int | None) -> None:
     """Best-effort deletion of a temporary WDK strategy.
 
     Silently logs and swallows errors — callers should use this in
-    ``finally`` blocks to avoid masking the original exception.
+    ``finally`` blocks to avoid masking the original exception.  A
+    strategy that fails to delete stays in the ledger for the reaper.
     """
     if strategy_id is None:
         return
+    end_temp_strategy_lease(api, strategy_id)
     try:
         await api.delete_strategy(strategy_id)
     except Exception as exc:
@@ -39,6 +71,8 @@ async def delete_temp_strategy(api: StrategyAPI, strategy_id: int | None) -> Non
             temp_strategy_id=strategy_id,
             error=str(exc),
         )
+        return
+    await forget_temp_strategy(api, strategy_id)
 
 
 async def _get_total_count_for_step(api: StrategyAPI, step_id: int) -> int | None:
@@ -50,45 +84,3 @@ async def _get_total_count_for_step(api: StrategyAPI, step_id: int) -> int | Non
             "Failed to get total count for step", step_id=step_id, error=str(exc)
         )
         return None
-
-
-async def cleanup_internal_control_test_strategies(
-    api: StrategyAPI,
-    wdk_items: object,
-    *,
-    site_id: str = "",
-) -> None:
-    """Delete leaked internal control-test strategies from a WDK item list.
-
-    Callers fetch the item list themselves (via ``api.list_strategies()``),
-    then pass it here for cleanup.
-    """
-    if not isinstance(wdk_items, list):
-        return
-    for item in wdk_items:
-        if not isinstance(item, dict):
-            continue
-        name_raw = item.get("name")
-        name = name_raw if isinstance(name_raw, str) else None
-        if not isinstance(name, str) or not is_internal_wdk_strategy_name(name):
-            continue
-        display_name = strip_internal_wdk_strategy_name(name)
-        if not display_name.startswith("Pathfinder control test"):
-            continue
-        wdk_id = item.get("strategyId")
-        if not isinstance(wdk_id, int):
-            continue
-        try:
-            await api.delete_strategy(wdk_id)
-            logger.info(
-                "Deleted leaked internal control-test WDK strategy",
-                site_id=site_id,
-                wdk_strategy_id=wdk_id,
-            )
-        except Exception as e:
-            logger.warning(
-                "Failed to delete leaked internal control-test strategy",
-                site_id=site_id,
-                wdk_strategy_id=wdk_id,
-                error=str(e),
-            )
@@ -2,24 +2,42 @@
 
 These helpers run *temporary* WDK steps/strategies to evaluate whether known
 positive controls are returned and known negative controls are excluded.
+
+Two evaluation paths produce the same payload shape:
+
+- **WDK combine** — per control set, a target step, a controls step and an
+  intersect step in a temp strategy; WDK counts the overlap.
+- **Local intersection** (``local_intersection=True``) — the target's full
+  record-ID set is fetched once per configuration, in pages, and cached by
+  configuration hash; each control set is resolved to canonical record IDs
+  once (also cached) and intersected in-process.  Repeated evaluations of
+  the same configuration or controls cost no WDK round trips.  Falls back to
+  WDK combine whenever IDs need server-side resolution the local path can't
+  mirror (custom ``id_field``, controls of another record type, results
+  larger than :data:`LOCAL_INTERSECTION_MAX_RESULTS`) or on any error.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TypedDict, cast
 
 from veupath_chatbot.domain.strategy.ast import StepTreeNode
 from veupath_chatbot.domain.strategy.ops import DEFAULT_COMBINE_OPERATOR
 from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
+from veupath_chatbot.platform.cache import TTLCache, cache_key
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.errors import InternalError
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject, JSONValue, as_json_object
 from veupath_chatbot.services.control_helpers import (
     _encode_id_list,
     _get_total_count_for_step,
-    cleanup_internal_control_test_strategies,
+    create_temp_strategy,
     delete_temp_strategy,
 )
-from veupath_chatbot.services.experiment.helpers import coerce_step_id, extract_wdk_id
+from veupath_chatbot.services.experiment.helpers import coerce_step_id
 from veupath_chatbot.services.experiment.types import ControlValueFormat
 from veupath_chatbot.services.wdk.helpers import extract_record_ids
 
@@ -36,15 +54,37 @@ def _require_step_id(raw: JSONObject | None, label: str) -> int:
 
 
 __all__ = [
+    "cached_target_record_ids",
     "resolve_controls_param_type",
-    "_extract_intersection_data",
+    "extract_intersection_data",
     "_run_intersection_control",
-    "_cleanup_internal_control_test_strategies",
     "run_positive_negative_controls",
 ]
 
 logger = get_logger(__name__)
 
+LOCAL_INTERSECTION_MAX_RESULTS = 100_000
+"""Largest result whose IDs are fetched for local intersection."""
+
+_ID_PAGE_SIZE = 10_000
+
+_RECORD_ID_CACHE_MAX_IDS = 1_000_000
+"""Total record IDs held across all cached entries (tens of MB)."""
+
+# Record IDs of materialized target and controls searches, keyed by
+# configuration hash.  Entries expire with the WDK metadata TTL; the cache
+# is bounded by the total number of IDs, not just the entry count.
+_RECORD_ID_CACHE: TTLCache[tuple[str, ...]] = TTLCache(
+    max_entries=256, max_weight=_RECORD_ID_CACHE_MAX_IDS, weigh=len
+)
+# Fetches in progress, so concurrent evaluations of one configuration
+# share a single WDK materialization.
+_record_id_inflight: dict[str, asyncio.Task[tuple[str, ...]]] = {}
+
+
+class _LocalIntersectionUnavailableError(Exception):
+    """The local path can't reproduce WDK's answer; use the combine path."""
+
 
 class _IntersectionKwargs(TypedDict):
     """Common kwargs shared between positive and negative control runs."""
@@ -98,6 +138,34 @@ async def resolve_controls_param_type(
     return None
 
 
+async def _build_controls_parameters(
+    api: StrategyAPI,
+    *,
+    controls_rt: str,
+    controls_search_name: str,
+    controls_param_name: str,
+    controls_ids: list[str],
+    controls_value_format: ControlValueFormat,
+    controls_extra_parameters: JSONObject | None,
+) -> JSONObject:
+    """Build the controls search parameters for a list of control IDs."""
+    # Determine whether the controls parameter is an input-dataset type.
+    # If so, upload the IDs as a WDK dataset and pass the dataset ID.
+    param_type = await resolve_controls_param_type(
+        api, controls_rt, controls_search_name, controls_param_name
+    )
+
+    controls_params = dict(controls_extra_parameters or {})
+    if param_type == "input-dataset":
+        dataset_id = await api.create_dataset(controls_ids)
+        controls_params[controls_param_name] = str(dataset_id)
+    else:
+        controls_params[controls_param_name] = _encode_id_list(
+            controls_ids, controls_value_format
+        )
+    return controls_params
+
+
 async def _run_intersection_control(
     *,
     site_id: str,
@@ -142,21 +210,16 @@ async def _run_intersection_control(
     )
     target_step_id = _require_step_id(target_step, "target step")
 
-    # Determine whether the controls parameter is an input-dataset type.
-    # If so, upload the IDs as a WDK dataset and pass the dataset ID.
-    param_type = await resolve_controls_param_type(
-        api, controls_rt, controls_search_name, controls_param_name
+    controls_params = await _build_controls_parameters(
+        api,
+        controls_rt=controls_rt,
+        controls_search_name=controls_search_name,
+        controls_param_name=controls_param_name,
+        controls_ids=controls_ids,
+        controls_value_format=controls_value_format,
+        controls_extra_parameters=controls_extra_parameters,
     )
 
-    controls_params = dict(controls_extra_parameters or {})
-    if param_type == "input-dataset":
-        dataset_id = await api.create_dataset(controls_ids)
-        controls_params[controls_param_name] = str(dataset_id)
-    else:
-        controls_params[controls_param_name] = _encode_id_list(
-            controls_ids, controls_value_format
-        )
-
     controls_step = await api.create_step(
         record_type=controls_rt,
         search_name=controls_search_name,
@@ -183,13 +246,9 @@ async def _run_intersection_control(
     )
     temp_strategy_id: int | None = None
     try:
-        created = await api.create_strategy(
-            step_tree=root,
-            name="Pathfinder control test",
-            description=None,
-            is_internal=True,
+        temp_strategy_id = await create_temp_strategy(
+            api, step_tree=root, name="Pathfinder control test"
         )
-        temp_strategy_id = extract_wdk_id(created)
 
         # Now the steps ARE part of a strategy → we can query them.
         target_total = await _get_total_count_for_step(api, target_step_id)
@@ -224,24 +283,193 @@ async def _run_intersection_control(
         await delete_temp_strategy(api, temp_strategy_id)
 
 
-async def _cleanup_internal_control_test_strategies(api: StrategyAPI) -> None:
-    """Best-effort cleanup of leaked internal control-test strategies.
+async def _fetch_all_record_ids(
+    api: StrategyAPI,
+    *,
+    record_type: str,
+    search_name: str,
+    parameters: JSONObject,
+    custom_name: str,
+) -> list[str]:
+    """Materialize one search in a temp strategy and read every record ID.
+
+    IDs are read page by page; the strategy is deleted before returning.
 
-    Control-test runs create temporary WDK strategies under the current user
-    account. They are deleted at the end of each run, but interrupted requests
-    (tab close, timeout, network errors) can leave internal drafts behind.
+    :raises _LocalIntersectionUnavailableError: If the result exceeds
+        :data:`LOCAL_INTERSECTION_MAX_RESULTS`.
     """
+    step = await api.create_step(
+        record_type=record_type,
+        search_name=search_name,
+        parameters=parameters,
+        custom_name=custom_name,
+    )
+    step_id = _require_step_id(step, f"{custom_name.lower()} step")
+    temp_strategy_id: int | None = None
     try:
-        strategies = await api.list_strategies()
-    except Exception as exc:
-        logger.warning(
-            "Failed to list strategies for control-test cleanup", error=str(exc)
+        temp_strategy_id = await create_temp_strategy(
+            api, step_tree=StepTreeNode(step_id), name="Pathfinder control test"
         )
-        return
-    await cleanup_internal_control_test_strategies(api, strategies)
+
+        total = await _get_total_count_for_step(api, step_id)
+        if total > LOCAL_INTERSECTION_MAX_RESULTS:
+            raise _LocalIntersectionUnavailableError(
+                f"{custom_name} has {total} results; local limit is "
+                f"{LOCAL_INTERSECTION_MAX_RESULTS}"
+            )
+        ids: list[str] = []
+        for offset in range(0, total, _ID_PAGE_SIZE):
+            answer = await api.get_step_answer(
+                step_id,
+                pagination={"offset": offset, "numRecords": _ID_PAGE_SIZE},
+            )
+            ids.extend(extract_record_ids((answer or {}).get("records")))
+        return ids
+    finally:
+        await delete_temp_strategy(api, temp_strategy_id)
+
+
+async def _fetch_and_cache_ids(
+    key: str, fetch: Callable[[], Awaitable[list[str]]]
+) -> tuple[str, ...]:
+    try:
+        ids = tuple(await fetch())
+        _RECORD_ID_CACHE.set(key, ids, ttl_seconds=get_settings().veupathdb_cache_ttl)
+        return ids
+    finally:
+        _record_id_inflight.pop(key, None)
+
+
+async def _cached_record_ids(
+    key: str, fetch: Callable[[], Awaitable[list[str]]]
+) -> tuple[str, ...]:
+    ids = _RECORD_ID_CACHE.get(key)
+    if ids is not None:
+        return ids
+    task = _record_id_inflight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_fetch_and_cache_ids(key, fetch))
+        _record_id_inflight[key] = task
+    # Shield so one cancelled caller doesn't abort the fetch for the others.
+    return await asyncio.shield(task)
+
+
+async def cached_target_record_ids(
+    *,
+    site_id: str,
+    record_type: str,
+    search_name: str,
+    parameters: JSONObject,
+) -> list[str] | None:
+    """Return a target's record IDs if a local-intersection run cached them.
+
+    The IDs are in WDK's default answer order.  Never calls WDK for the
+    IDs themselves; ``None`` means they were not fetched (or expired).
+    """
+    from veupath_chatbot.services.catalog.searches import find_record_type_for_search
+
+    target_rt = await find_record_type_for_search(site_id, record_type, search_name)
+    ids = _RECORD_ID_CACHE.get(
+        cache_key("target", site_id, target_rt, search_name, parameters)
+    )
+    return list(ids) if ids is not None else None
+
+
+async def _run_local_intersections(
+    *,
+    site_id: str,
+    record_type: str,
+    target_search_name: str,
+    target_parameters: JSONObject,
+    controls_search_name: str,
+    controls_param_name: str,
+    controls_value_format: ControlValueFormat,
+    controls_extra_parameters: JSONObject | None,
+    control_sets: dict[str, list[str]],
+) -> dict[str, JSONObject]:
+    """Intersect each control set with the cached target ID set in-process.
+
+    Returns one payload per *control_sets* key, shaped like
+    :func:`_run_intersection_control` output (``targetStepId`` is ``None``:
+    no target step outlives the fetch).  Control IDs are first resolved to
+    canonical record IDs through the controls search, so aliases and
+    gene-to-transcript expansion match what a WDK intersect would count.
+
+    :raises _LocalIntersectionUnavailableError: If the configuration needs
+        the WDK combine path.
+    """
+    from veupath_chatbot.services.catalog.searches import find_record_type_for_search
+
+    api = get_strategy_api(site_id)
+    target_rt = await find_record_type_for_search(
+        site_id, record_type, target_search_name
+    )
+    controls_rt = await find_record_type_for_search(
+        site_id, record_type, controls_search_name
+    )
+    if target_rt != controls_rt:
+        raise _LocalIntersectionUnavailableError(
+            f"Controls are {controls_rt} records; target is {target_rt}"
+        )
+
+    target_ids = await _cached_record_ids(
+        cache_key("target", site_id, target_rt, target_search_name, target_parameters),
+        lambda: _fetch_all_record_ids(
+            api,
+            record_type=target_rt,
+            search_name=target_search_name,
+            parameters=target_parameters or {},
+            custom_name="Target",
+        ),
+    )
+
+    async def _resolve_controls(controls_ids: list[str]) -> list[str]:
+        params = await _build_controls_parameters(
+            api,
+            controls_rt=controls_rt,
+            controls_search_name=controls_search_name,
+            controls_param_name=controls_param_name,
+            controls_ids=controls_ids,
+            controls_value_format=controls_value_format,
+            controls_extra_parameters=controls_extra_parameters,
+        )
+        return await _fetch_all_record_ids(
+            api,
+            record_type=controls_rt,
+            search_name=controls_search_name,
+            parameters=params,
+            custom_name="Controls",
+        )
+
+    payloads: dict[str, JSONObject] = {}
+    for label, controls_ids in control_sets.items():
+        resolved = set(
+            await _cached_record_ids(
+                cache_key(
+                    "controls",
+                    site_id,
+                    controls_rt,
+                    controls_search_name,
+                    controls_param_name,
+                    controls_extra_parameters,
+                    sorted(set(controls_ids)),
+                ),
+                partial(_resolve_controls, controls_ids),
+            )
+        )
+        hits = [rid for rid in target_ids if rid in resolved]
+        payloads[label] = {
+            "controlsCount": len(controls_ids),
+            "intersectionCount": len(hits),
+            "intersectionIdsSample": cast(JSONValue, hits[:50]),
+            "intersectionIds": cast(JSONValue, hits),
+            "targetStepId": None,
+            "targetResultCount": len(target_ids),
+        }
+    return payloads
 
 
-def _extract_intersection_data(
+def extract_intersection_data(
     payload: JSONObject,
 ) -> tuple[int, set[str], bool]:
     """Extract intersection count and ID set from a control-test payload.
@@ -273,7 +501,7 @@ async def run_positive_negative_controls(
     controls_value_format: ControlValueFormat = "newline",
     controls_extra_parameters: JSONObject | None = None,
     id_field: str | None = None,
-    skip_cleanup: bool = False,
+    local_intersection: bool = False,
 ) -> JSONObject:
     """Run positive + negative controls against a single WDK question configuration.
 
@@ -282,13 +510,10 @@ async def run_positive_negative_controls(
     strategy is deleted, so a shared target step would be invalidated after
     the first control run's cleanup.
 
-    :param skip_cleanup: When ``True``, skip the upfront strategy cleanup.
-        Useful when the caller already performed cleanup (e.g. batch sweeps).
+    :param local_intersection: Intersect controls in-process against the
+        cached target ID set instead of building WDK intersect steps.
+        Falls back to the WDK combine path when the local path can't be used.
     """
-    if not skip_cleanup:
-        cleanup_api = get_strategy_api(site_id)
-        await _cleanup_internal_control_test_strategies(cleanup_api)
-
     # Common kwargs passed to _run_intersection_control for both control sets.
     common_kwargs: _IntersectionKwargs = {
         "site_id": site_id,
@@ -319,17 +544,43 @@ async def run_positive_negative_controls(
     pos = [str(x).strip() for x in (positive_controls or []) if str(x).strip()]
     neg = [str(x).strip() for x in (negative_controls or []) if str(x).strip()]
 
+    local_payloads: dict[str, JSONObject] = {}
+    if local_intersection and id_field is None and (pos or neg):
+        control_sets = {
+            label: ids for label, ids in (("positive", pos), ("negative", neg)) if ids
+        }
+        try:
+            local_payloads = await _run_local_intersections(
+                site_id=site_id,
+                record_type=record_type,
+                target_search_name=target_search_name,
+                target_parameters=target_parameters,
+                controls_search_name=controls_search_name,
+                controls_param_name=controls_param_name,
+                controls_value_format=controls_value_format,
+                controls_extra_parameters=controls_extra_parameters,
+                control_sets=control_sets,
+            )
+        except Exception as exc:
+            logger.info(
+                "Local control intersection unavailable; using WDK combine",
+                search=target_search_name,
+                error=str(exc),
+            )
+
     if pos:
-        pos_payload = await _run_intersection_control(
-            **common_kwargs,
-            controls_ids=pos,
+        pos_payload = local_payloads.get("positive") or (
+            await _run_intersection_control(
+                **common_kwargs,
+                controls_ids=pos,
+            )
         )
         # Capture target info from the first successful run.
         target = as_json_object(result["target"])
         target["stepId"] = pos_payload.get("targetStepId")
         target["resultCount"] = pos_payload.get("targetResultCount")
 
-        pos_count, found_ids, has_ids = _extract_intersection_data(pos_payload)
+        pos_count, found_ids, has_ids = extract_intersection_data(pos_payload)
         missing = [x for x in pos if x not in found_ids] if has_ids else []
         missing_sample = cast(JSONValue, missing[:50])
         result["positive"] = {
@@ -339,17 +590,19 @@ async def run_positive_negative_controls(
         }
 
     if neg:
-        neg_payload = await _run_intersection_control(
-            **common_kwargs,
-            controls_ids=neg,
+        neg_payload = local_payloads.get("negative") or (
+            await _run_intersection_control(
+                **common_kwargs,
+                controls_ids=neg,
+            )
         )
         # Fill target info if not set yet (e.g. no positive controls).
         target = as_json_object(result["target"])
-        if target.get("stepId") is None:
+        if target.get("resultCount") is None:
             target["stepId"] = neg_payload.get("targetStepId")
             target["resultCount"] = neg_payload.get("targetResultCount")
 
-        neg_count, hit_ids, _ = _extract_intersection_data(neg_payload)
+        neg_count, hit_ids, _ = extract_intersection_data(neg_payload)
         unexpected_sample = cast(JSONValue, list(hit_ids)[:50] if hit_ids else [])
         result["negative"] = {
             **neg_payload,
@@ -27,20 +27,17 @@ from veupath_chatbot.services.experiment.types.core import DEFAULT_STEP_ANALYSIS
 from veupath_chatbot.services.experiment.types.json_codec import from_json
 
 
-def experiment_from_json(d: dict[str, Any]) -> Experiment:
-    """Reconstruct an :class:`Experiment` from its JSON representation.
+def config_from_json(cfg: dict[str, Any]) -> ExperimentConfig:
+    """Reconstruct an :class:`ExperimentConfig` from its JSON representation.
 
-    :param d: Dict produced by :func:`experiment_to_json`.
-    :returns: Fully hydrated Experiment dataclass.
+    :param cfg: Dict produced by :func:`config_to_json`.
     """
-    cfg = d["config"]
-
     opt_specs = None
     raw_specs = cfg.get("optimizationSpecs")
     if raw_specs and isinstance(raw_specs, list):
         opt_specs = [from_json(s, OptimizationSpec) for s in raw_specs]
 
-    config = ExperimentConfig(
+    return ExperimentConfig(
         site_id=cfg["siteId"],
         record_type=cfg["recordType"],
         search_name=cfg.get("searchName", ""),
@@ -91,6 +88,15 @@ def experiment_from_json(d: dict[str, Any]) -> Experiment:
         parent_experiment_id=cfg.get("parentExperimentId"),
     )
 
+
+def experiment_from_json(d: dict[str, Any]) -> Experiment:
+    """Reconstruct an :class:`Experiment` from its JSON representation.
+
+    :param d: Dict produced by :func:`experiment_to_json`.
+    :returns: Fully hydrated Experiment dataclass.
+    """
+    config = config_from_json(d["config"])
+
     exp = Experiment(
         id=d["id"],
         config=config,
@@ -4,6 +4,7 @@ Utility functions for extracting WDK record data, classifying genes,
 searching records, and fetching result IDs.
 """
 
+import asyncio
 from typing import cast
 
 from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
@@ -103,40 +104,43 @@ async def fetch_group_records(
     gene_ids: list[str],
     limit: int = 20,
     site_id: str | None = None,
+    concurrency: int = 5,
 ) -> list[JSONObject]:
-    """Fetch records for a list of gene IDs.
+    """Fetch records for a list of gene IDs, a few at a time.
 
     :param api: Strategy API instance.
     :param record_type: WDK record type.
     :param gene_ids: Gene IDs to fetch.
     :param limit: Max number of genes to fetch.
     :param site_id: Site ID for PK completion (fills project_id etc.).
-    :returns: List of dicts with ``geneId`` and ``attributes``.
+    :param concurrency: Max single-record requests in flight.
+    :returns: List of dicts with ``geneId`` and ``attributes``, in input
+        order; genes that fail to load are skipped.
     """
-    results: list[JSONObject] = []
-    for gene_id in gene_ids[:limit]:
-        try:
-            if site_id:
-                pk = await build_primary_key(api, site_id, record_type, gene_id)
-            else:
-                pk = cast(
-                    list[JSONObject],
-                    [{"name": "source_id", "value": gene_id}],
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch(gene_id: str) -> JSONObject | None:
+        async with semaphore:
+            try:
+                if site_id:
+                    pk = await build_primary_key(api, site_id, record_type, gene_id)
+                else:
+                    pk = cast(
+                        list[JSONObject],
+                        [{"name": "source_id", "value": gene_id}],
+                    )
+                rec = await api.get_single_record(
+                    record_type=record_type,
+                    primary_key=pk,
                 )
-            rec = await api.get_single_record(
-                record_type=record_type,
-                primary_key=pk,
-            )
-            if isinstance(rec, dict):
-                results.append(
-                    {
-                        "geneId": gene_id,
-                        "attributes": rec.get("attributes", {}),
-                    }
-                )
-        except Exception:
-            continue
-    return results
+            except Exception:
+                return None
+        if not isinstance(rec, dict):
+            return None
+        return {"geneId": gene_id, "attributes": rec.get("attributes", {})}
+
+    fetched = await asyncio.gather(*(_fetch(g) for g in gene_ids[:limit]))
+    return [r for r in fetched if r is not None]
 
 
 async def collect_all_result_ids(api: StrategyAPI, step_id: int) -> set[str]:
@@ -10,6 +10,7 @@ so that the services layer never needs a static import from
 is injected at startup.
 """
 
+import asyncio
 from typing import Annotated, Any, cast
 
 from kani import AIParam, ChatMessage, Kani, ai_function
@@ -31,6 +32,10 @@ from veupath_chatbot.services.experiment.types import (
     Experiment,
 )
 from veupath_chatbot.services.wdk.helpers import extract_pk
+from veupath_chatbot.services.wdk.step_results import (
+    cached_result_table,
+    get_result_table,
+)
 
 # ── Injected base class ─────────────────────────────────────────────
 # Set once at startup via configure().
@@ -81,37 +86,61 @@ class _AnalysisToolsMixin:
             return {"error": "Experiment has no WDK strategy"}
 
         api = get_strategy_api(self.site_id)
-        sorting: list[JSONObject] | None = None
-        if sort_attribute:
-            sorting = [{"attributeName": sort_attribute, "direction": sort_direction}]
-
-        answer = await api.get_step_records(
-            step_id=exp.wdk_step_id,
-            pagination={"offset": offset, "numRecords": min(limit, 50)},
-            sorting=sorting,
-        )
-
+        limit = min(limit, 50)
         tp_ids, fp_ids, fn_ids, tn_ids = exp.classification_id_sets()
 
-        records = answer.get("records", [])
-        classified: list[JSONObject] = []
-        if isinstance(records, list):
-            for rec in records:
-                if not isinstance(rec, dict):
-                    continue
-                gene_id = extract_pk(rec)
-                classification = classify_gene(gene_id, tp_ids, fp_ids, fn_ids, tn_ids)
-                attrs = rec.get("attributes", {})
-                classified.append(
-                    {
-                        "geneId": gene_id,
-                        "classification": classification,
-                        "attributes": attrs,
-                    }
+        # Serve from an already-loaded result table when it covers the
+        # request (any page of a full result, or unsorted leading pages).
+        # A single page never justifies loading the table, so a miss goes
+        # straight to WDK.
+        table = cached_result_table(self.site_id, exp.wdk_step_id)
+        if table is not None and (
+            not table.truncated or (not sort_attribute and offset + limit <= len(table))
+        ):
+            rows = [
+                table.row(i)
+                for i in table.select(
+                    sort=sort_attribute,
+                    descending=sort_direction.upper() == "DESC",
+                    offset=offset,
+                    limit=limit,
                 )
+            ]
+            total = table.total_count
+        else:
+            sorting: list[JSONObject] | None = None
+            if sort_attribute:
+                sorting = [
+                    {"attributeName": sort_attribute, "direction": sort_direction}
+                ]
+            answer = await api.get_step_records(
+                step_id=exp.wdk_step_id,
+                pagination={"offset": offset, "numRecords": limit},
+                sorting=sorting,
+            )
+            records = answer.get("records", [])
+            rows = [
+                {"geneId": extract_pk(rec), "attributes": rec.get("attributes", {})}
+                for rec in (records if isinstance(records, list) else [])
+                if isinstance(rec, dict)
+            ]
+            meta = answer.get("meta", {})
+            total = meta.get("totalCount", 0) if isinstance(meta, dict) else 0
+
+        classified: list[JSONObject] = []
+        for row in rows:
+            gene_id = row.get("geneId")
+            gene_id = gene_id if isinstance(gene_id, str) else None
+            classified.append(
+                {
+                    "geneId": gene_id,
+                    "classification": classify_gene(
+                        gene_id, tp_ids, fp_ids, fn_ids, tn_ids
+                    ),
+                    "attributes": row.get("attributes", {}),
+                }
+            )
 
-        meta = answer.get("meta", {})
-        total = meta.get("totalCount", 0) if isinstance(meta, dict) else 0
         return cast(
             JSONObject,
             {
@@ -183,17 +212,37 @@ class _AnalysisToolsMixin:
         """Compare attributes of two groups of genes to find distinguishing features.
 
         Fetches records for both groups and identifies attribute differences.
+        Genes already loaded from the result set are not fetched again.
         """
         exp = await self._get_experiment()
         if not exp or not exp.wdk_step_id:
             return {"error": "Experiment has no WDK strategy"}
 
         api = get_strategy_api(self.site_id)
-        group_a_attrs = await fetch_group_records(
-            api, exp.config.record_type, group_a_ids, site_id=self.site_id
-        )
-        group_b_attrs = await fetch_group_records(
-            api, exp.config.record_type, group_b_ids, site_id=self.site_id
+        table = cached_result_table(self.site_id, exp.wdk_step_id)
+
+        async def _group(gene_ids: list[str]) -> list[JSONObject]:
+            wanted = gene_ids[:20]
+            known: dict[str, JSONObject] = {}
+            if table is not None:
+                for gene_id in wanted:
+                    idx = table.find(gene_id)
+                    if idx is not None:
+                        known[gene_id] = table.row(idx)
+            fetched = await fetch_group_records(
+                api,
+                exp.config.record_type,
+                [g for g in wanted if g not in known],
+                site_id=self.site_id,
+            )
+            for rec in fetched:
+                gene_id = rec.get("geneId")
+                if isinstance(gene_id, str):
+                    known[gene_id] = rec
+            return [known[g] for g in wanted if g in known]
+
+        group_a_attrs, group_b_attrs = await asyncio.gather(
+            _group(group_a_ids), _group(group_b_ids)
         )
 
         return cast(
@@ -217,46 +266,28 @@ class _AnalysisToolsMixin:
     ) -> JSONObject:
         """Search through result records for a text pattern.
 
-        Iterates through result pages looking for records whose attributes
-        match the query string.
+        Scans the leading result records (loaded once and cached for
+        follow-up calls) for attributes that match the query string.
         """
         exp = await self._get_experiment()
         if not exp or not exp.wdk_step_id:
             return {"error": "Experiment has no WDK strategy"}
 
         api = get_strategy_api(self.site_id)
-        matches: list[JSONObject] = []
+        table = await get_result_table(
+            api, site_id=self.site_id, step_id=exp.wdk_step_id
+        )
         query_lower = query.lower()
-        total_scanned = 0
-
-        for page_offset in range(0, 500, 100):
-            answer = await api.get_step_records(
-                step_id=exp.wdk_step_id,
-                pagination={"offset": page_offset, "numRecords": 100},
-            )
-            records = answer.get("records", [])
-            if not isinstance(records, list) or not records:
-                break
-            total_scanned = page_offset + len(records)
-
-            for rec in records:
-                if not isinstance(rec, dict):
-                    continue
-                attrs = rec.get("attributes", {})
-                if not isinstance(attrs, dict):
-                    continue
-
-                if record_matches(attrs, query_lower, attribute):
-                    gene_id = extract_pk(rec)
-                    matches.append({"geneId": gene_id, "attributes": attrs})
-                    if len(matches) >= 20:
-                        return cast(
-                            JSONObject,
-                            {
-                                "matches": matches,
-                                "totalScanned": total_scanned,
-                            },
-                        )
+        matches: list[JSONObject] = []
+        total_scanned = len(table)
+
+        for i in range(len(table)):
+            attrs = table.attributes(i)
+            if record_matches(attrs, query_lower, attribute):
+                matches.append({"geneId": table.ids[i], "attributes": attrs})
+                if len(matches) >= 20:
+                    total_scanned = i + 1
+                    break
 
         return cast(JSONObject, {"matches": matches, "totalScanned": total_scanned})
 
@@ -9,6 +9,7 @@ from typing import Annotated, cast
 
 from kani import AIParam, ai_function
 
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.domain.strategy.ast import StepTreeNode
 from veupath_chatbot.domain.strategy.ops import (
     BOOLEAN_OPERATOR_OPTIONS_DESC,
@@ -224,6 +225,7 @@ class RefinementToolsMixin:
             secondary_input=StepTreeNode(new_step_id),
         )
         await api.update_strategy(exp.wdk_strategy_id, step_tree=new_tree)
+        await invalidate_user_tool_results(exp.user_id)
 
         exp.wdk_step_id = combined_id
         store = get_experiment_store()
@@ -6,21 +6,39 @@ Events are persisted to Redis Streams. Operations are registered in PostgreSQL.
 import asyncio
 import copy
 import json
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import cast
 from uuid import UUID, uuid4
 
+from redis.exceptions import RedisError, WatchError
+
+from veupath_chatbot.integrations.veupathdb.shared_lookups import shared_lookups
 from veupath_chatbot.persistence.repositories.stream import StreamRepository
 from veupath_chatbot.persistence.repositories.user import UserRepository
 from veupath_chatbot.persistence.session import async_session_factory
+from veupath_chatbot.platform.admission import run_admitted, site_budget
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.errors import (
+    ConflictError,
+    NotFoundError,
+    ServiceBusyError,
+)
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.redis import get_redis
 from veupath_chatbot.platform.tasks import spawn
+from veupath_chatbot.platform.tracing import profiled
 from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.experiment._deserialize import config_from_json
 from veupath_chatbot.services.experiment.helpers import ProgressCallback
 from veupath_chatbot.services.experiment.service import run_experiment
 from veupath_chatbot.services.experiment.types import (
     BatchExperimentConfig,
+    BatchOrganismTarget,
     Experiment,
     ExperimentConfig,
+    config_to_json,
     experiment_to_json,
 )
 
@@ -98,6 +116,65 @@ async def _register_experiment_operation(operation_id: str, op_type: str) -> Non
         await session.commit()
 
 
+def _spawn_admitted(
+    operation_id: str,
+    kind: str,
+    run: Callable[[], Awaitable[None]],
+    *,
+    user_id: str | None,
+    error_event: str,
+    end_event: str | None = None,
+) -> None:
+    """Spawn *run* once the admission controller admits it.
+
+    While the job waits for a slot it reports a ``queued`` progress phase.
+    *run* finalizes the operation itself; if it never starts -- the wait
+    times out or the task is cancelled while queued -- the operation is
+    finalized as failed here, after an *error_event* (and *end_event*).
+    """
+    started = False
+
+    async def _start() -> None:
+        nonlocal started
+        started = True
+        await run()
+
+    async def _queued() -> None:
+        with suppress(RuntimeError, RedisError):
+            await _emit_to_redis(
+                operation_id,
+                "experiment_progress",
+                {"phase": "queued", "message": f"Waiting to start {kind}..."},
+            )
+
+    async def _admit() -> None:
+        try:
+            await run_admitted(
+                kind,
+                _start,
+                user_id=user_id,
+                timeout=get_settings().admission_job_queue_timeout_seconds,
+                on_queued=_queued,
+            )
+        except ServiceBusyError as exc:
+            logger.warning(
+                "Background job timed out waiting for admission",
+                kind=kind,
+                operation_id=operation_id,
+            )
+            with suppress(RuntimeError, RedisError):
+                await _emit_to_redis(
+                    operation_id, error_event, {"error": exc.detail or exc.title}
+                )
+                if end_event is not None:
+                    await _emit_to_redis(operation_id, end_event, {})
+        finally:
+            if not started:
+                await _finalize_operation(operation_id, failed=True)
+
+    spawn(profiled(operation_id, _admit()))
+
+
 async def start_experiment(
     config: ExperimentConfig, *, user_id: str | None = None
 ) -> str:
@@ -126,87 +203,162 @@ async def start_experiment(
             await _emit_to_redis(operation_id, "experiment_end", {})
             await _finalize_operation(operation_id, failed=failed)
 
-    spawn(_run())
+    _spawn_admitted(
+        operation_id,
+        "experiment",
+        _run,
+        user_id=user_id,
+        error_event="experiment_error",
+        end_event="experiment_end",
+    )
     return operation_id
 
 
+class _RunProgress:
+    """Progress callback for one run of a multi-run job (batch, benchmark).
+
+    Tags every event with *tags* and the job-wide ``batchProgress`` counts
+    (``completed``/``failed``/``total``), counting the run once when it
+    reaches a terminal phase.
+    """
+
+    def __init__(
+        self, emit: ProgressCallback, counts: dict[str, int], tags: JSONObject
+    ) -> None:
+        self._emit = emit
+        self._counts = counts
+        self._tags = tags
+        self.finished = False
+
+    async def __call__(self, evt: JSONObject) -> None:
+        data = evt.get("data")
+        if not isinstance(data, dict):
+            await self._emit(evt)
+            return
+        phase = data.get("phase")
+        if phase in ("completed", "error") and not self.finished:
+            self.finished = True
+            self._counts["completed" if phase == "completed" else "failed"] += 1
+        await self._emit(
+            {
+                **evt,
+                "data": {
+                    **data,
+                    **self._tags,
+                    "batchProgress": cast(JSONObject, dict(self._counts)),
+                },
+            }
+        )
+
+    async def fail(self, exc: Exception) -> None:
+        """Report a run that raised before emitting its own error phase."""
+        if not self.finished:
+            await self(
+                {
+                    "type": "experiment_progress",
+                    "data": {"phase": "error", "error": str(exc)},
+                }
+            )
+
+
+def _organism_config(
+    batch_config: BatchExperimentConfig, target: BatchOrganismTarget
+) -> ExperimentConfig:
+    """Derive one organism's experiment config from the batch's base config."""
+    base = batch_config.base_config
+    params = dict(base.parameters)
+    params[batch_config.organism_param_name] = target.organism
+
+    return ExperimentConfig(
+        site_id=base.site_id,
+        record_type=base.record_type,
+        search_name=base.search_name,
+        parameters=params,
+        positive_controls=target.positive_controls
+        if target.positive_controls is not None
+        else list(base.positive_controls),
+        negative_controls=target.negative_controls
+        if target.negative_controls is not None
+        else list(base.negative_controls),
+        controls_search_name=base.controls_search_name,
+        controls_param_name=base.controls_param_name,
+        controls_value_format=base.controls_value_format,
+        enable_cross_validation=base.enable_cross_validation,
+        k_folds=base.k_folds,
+        enrichment_types=list(base.enrichment_types),
+        name=f"{base.name} ({target.organism})",
+        description=base.description,
+        optimization_specs=(
+            copy.deepcopy(base.optimization_specs) if base.optimization_specs else None
+        ),
+        optimization_budget=base.optimization_budget,
+        optimization_objective=base.optimization_objective,
+        parameter_display_values=(
+            dict(base.parameter_display_values)
+            if base.parameter_display_values
+            else None
+        ),
+    )
+
+
 async def start_batch_experiment(
     batch_config: BatchExperimentConfig, *, user_id: str | None = None
 ) -> str:
-    """Launch a batch experiment as a background task. Returns operation ID."""
+    """Launch a batch experiment as a background task. Returns operation ID.
+
+    Organisms run concurrently, at most ``admission_max_runs_per_site`` at
+    a time per site, and share WDK search-metadata lookups (see
+    :func:`~veupath_chatbot.integrations.veupathdb.shared_lookups.shared_lookups`).
+    Progress events are tagged with their ``organism`` and the batch-wide
+    ``batchProgress`` counts.
+    """
     from veupath_chatbot.services.experiment.store import get_experiment_store
 
     operation_id = f"op_{uuid4().hex[:12]}"
-    batch_id = f"batch_{int(asyncio.get_running_loop().time() * 1000)}"
+    batch_id = f"batch_{uuid4().hex[:12]}"
     await _register_experiment_operation(operation_id, "batch")
 
     async def _run() -> None:
         failed = False
         try:
-            base = batch_config.base_config
-            org_param = batch_config.organism_param_name
-            results: list[Experiment] = []
+            targets = batch_config.target_organisms
             store = get_experiment_store()
-
-            for target in batch_config.target_organisms:
-                params = dict(base.parameters)
-                params[org_param] = target.organism
-
-                org_config = ExperimentConfig(
-                    site_id=base.site_id,
-                    record_type=base.record_type,
-                    search_name=base.search_name,
-                    parameters=params,
-                    positive_controls=target.positive_controls
-                    if target.positive_controls is not None
-                    else list(base.positive_controls),
-                    negative_controls=target.negative_controls
-                    if target.negative_controls is not None
-                    else list(base.negative_controls),
-                    controls_search_name=base.controls_search_name,
-                    controls_param_name=base.controls_param_name,
-                    controls_value_format=base.controls_value_format,
-                    enable_cross_validation=base.enable_cross_validation,
-                    k_folds=base.k_folds,
-                    enrichment_types=list(base.enrichment_types),
-                    name=f"{base.name} ({target.organism})",
-                    description=base.description,
-                    optimization_specs=(
-                        copy.deepcopy(base.optimization_specs)
-                        if base.optimization_specs
-                        else None
-                    ),
-                    optimization_budget=base.optimization_budget,
-                    optimization_objective=base.optimization_objective,
-                    parameter_display_values=(
-                        dict(base.parameter_display_values)
-                        if base.parameter_display_values
-                        else None
-                    ),
-                )
-
-                try:
-                    exp = await run_experiment(
-                        org_config,
-                        user_id=user_id,
-                        progress_callback=_make_progress_callback(operation_id),
-                    )
-                    exp.batch_id = batch_id
-                    store.save(exp)
-                    results.append(exp)
-                except Exception as exc:
-                    logger.error(
-                        "Batch organism experiment failed",
-                        organism=target.organism,
-                        error=str(exc),
-                    )
+            budget = site_budget(batch_config.base_config.site_id)
+            emit = _make_progress_callback(operation_id)
+            counts = {"completed": 0, "failed": 0, "total": len(targets)}
+
+            async def _run_one(target: BatchOrganismTarget) -> Experiment | None:
+                progress = _RunProgress(emit, counts, {"organism": target.organism})
+                async with budget:
+                    try:
+                        exp = await run_experiment(
+                            _organism_config(batch_config, target),
+                            user_id=user_id,
+                            progress_callback=progress,
+                        )
+                    except Exception as exc:
+                        logger.error(
+                            "Batch organism experiment failed",
+                            organism=target.organism,
+                            error=str(exc),
+                        )
+                        await progress.fail(exc)
+                        return None
+                exp.batch_id = batch_id
+                store.save(exp)
+                return exp
+
+            with shared_lookups():
+                results = await asyncio.gather(*(_run_one(t) for t in targets))
 
             await _emit_to_redis(
                 operation_id,
                 "batch_complete",
                 {
                     "batchId": batch_id,
-                    "experiments": [experiment_to_json(e) for e in results],
+                    "experiments": [
+                        experiment_to_json(e) for e in results if e is not None
+                    ],
                 },
             )
         except Exception as exc:
@@ -216,72 +368,234 @@ async def start_batch_experiment(
         finally:
             await _finalize_operation(operation_id, failed=failed)
 
-    spawn(_run())
+    _spawn_admitted(
+        operation_id, "batch", _run, user_id=user_id, error_event="batch_error"
+    )
     return operation_id
 
 
-async def start_benchmark(
-    base_config: ExperimentConfig,
-    control_sets: list[tuple[str, list[str], list[str], str | None, bool]],
-    *,
-    user_id: str | None = None,
+type BenchmarkControlSet = tuple[str, list[str], list[str], str | None, bool]
+"""``(label, positive controls, negative controls, control set ID, is primary)``."""
+
+_BENCHMARK_PLAN_KEY = "benchmark:{}:plan"
+_BENCHMARK_RUN_KEY = "benchmark:{}:run"
+
+
+@dataclass(frozen=True, slots=True)
+class _BenchmarkPlan:
+    """Checkpoint of a benchmark: enough to re-run its remaining control sets."""
+
+    user_id: str | None
+    base_config: ExperimentConfig
+    control_sets: list[BenchmarkControlSet]
+
+
+async def _save_benchmark_plan(benchmark_id: str, plan: _BenchmarkPlan) -> None:
+    """Checkpoint *plan* in Redis (best effort; without it, no resume)."""
+    payload = {
+        "userId": plan.user_id,
+        "config": config_to_json(plan.base_config),
+        "controlSets": [
+            {
+                "label": label,
+                "positiveControls": positives,
+                "negativeControls": negatives,
+                "controlSetId": control_set_id,
+                "isPrimary": is_primary,
+            }
+            for label, positives, negatives, control_set_id, is_primary in (
+                plan.control_sets
+            )
+        ],
+    }
+    try:
+        await get_redis().set(
+            _BENCHMARK_PLAN_KEY.format(benchmark_id),
+            json.dumps(payload),
+            ex=get_settings().benchmark_checkpoint_ttl_seconds,
+        )
+    except (RuntimeError, RedisError) as exc:
+        logger.warning(
+            "Failed to checkpoint benchmark", benchmark_id=benchmark_id, error=str(exc)
+        )
+
+
+async def _load_benchmark_plan(benchmark_id: str) -> _BenchmarkPlan | None:
+    raw = await get_redis().get(_BENCHMARK_PLAN_KEY.format(benchmark_id))
+    if raw is None:
+        return None
+    payload = json.loads(raw)
+    return _BenchmarkPlan(
+        user_id=payload.get("userId"),
+        base_config=config_from_json(payload["config"]),
+        control_sets=[
+            (
+                cs["label"],
+                cs["positiveControls"],
+                cs["negativeControls"],
+                cs.get("controlSetId"),
+                bool(cs.get("isPrimary")),
+            )
+            for cs in payload["controlSets"]
+        ],
+    )
+
+
+async def _operation_active(operation_id: str) -> bool:
+    async with async_session_factory() as session:
+        status = await StreamRepository(session).get_operation_status(operation_id)
+    return status == "active"
+
+
+async def _claim_benchmark_run(benchmark_id: str, operation_id: str) -> bool:
+    """Make *operation_id* the one live run of *benchmark_id*.
+
+    The claim is a Redis ``SET NX``.  A claim held by an operation that is
+    no longer active (it ended, or its worker died and startup marked it
+    failed) is taken over, under ``WATCH`` so two resumes can't both win.
+
+    :returns: False if another active operation holds the benchmark.
+    """
+    key = _BENCHMARK_RUN_KEY.format(benchmark_id)
+    ttl = get_settings().benchmark_checkpoint_ttl_seconds
+    redis = get_redis()
+    if await redis.set(key, operation_id, nx=True, ex=ttl):
+        return True
+    async with redis.pipeline(transaction=True) as pipe:
+        await pipe.watch(key)
+        holder = await pipe.get(key)
+        if holder is not None and await _operation_active(holder.decode()):
+            return False
+        pipe.multi()
+        pipe.set(key, operation_id, ex=ttl)
+        try:
+            await pipe.execute()
+        except WatchError:
+            return False
+    return True
+
+
+async def _release_benchmark_run(benchmark_id: str, operation_id: str) -> None:
+    """Drop *operation_id*'s claim on *benchmark_id*, if it still holds it."""
+    key = _BENCHMARK_RUN_KEY.format(benchmark_id)
+    with suppress(RuntimeError, RedisError, WatchError):
+        async with get_redis().pipeline(transaction=True) as pipe:
+            await pipe.watch(key)
+            if await pipe.get(key) == operation_id.encode():
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+
+
+async def _launch_benchmark(
+    benchmark_id: str, plan: _BenchmarkPlan, *, done: list[Experiment]
 ) -> str:
-    """Launch a benchmark suite as a background task. Returns operation ID."""
+    """Spawn the runs of *plan* that aren't in *done*. Returns operation ID.
+
+    Pending control sets (primary first) go on a queue drained by
+    ``benchmark_max_concurrent_runs`` workers.  Each run also holds a
+    permit of the site budget shared with batches, and the whole benchmark
+    holds one admission slot, so a large benchmark takes its fair share of
+    WDK rather than all of it.  Every finished experiment is saved as it
+    completes, so an interrupted benchmark keeps its partial results and
+    :func:`resume_benchmark` picks up the rest.
+
+    :raises ConflictError: If another operation is still running the
+        benchmark.
+    """
     from veupath_chatbot.services.experiment.store import get_experiment_store
 
     operation_id = f"op_{uuid4().hex[:12]}"
-    benchmark_id = f"bench_{int(asyncio.get_running_loop().time() * 1000)}"
     await _register_experiment_operation(operation_id, "benchmark")
+    try:
+        claimed = await _claim_benchmark_run(benchmark_id, operation_id)
+    except (RuntimeError, RedisError) as exc:
+        # Without Redis there is no checkpoint to resume from either.
+        logger.warning(
+            "Benchmark run claim unavailable",
+            benchmark_id=benchmark_id,
+            error=str(exc),
+        )
+        claimed = True
+    if not claimed:
+        await _finalize_operation(operation_id, failed=True)
+        raise ConflictError(
+            title="Benchmark already running",
+            detail="This benchmark is still running; wait for it to finish.",
+        )
+    base_config = plan.base_config
+    user_id = plan.user_id
 
     async def _run() -> None:
         failed = False
         try:
-
-            async def _run_one(
-                label: str,
-                positives: list[str],
-                negatives: list[str],
-                control_set_id: str | None,
-                is_primary: bool,
-            ) -> Experiment | None:
+            store = get_experiment_store()
+            budget = site_budget(base_config.site_id)
+            emit = _make_progress_callback(operation_id)
+            finished_labels = {e.control_set_label for e in done}
+            pending: asyncio.Queue[BenchmarkControlSet] = asyncio.Queue()
+            for control_set in sorted(plan.control_sets, key=lambda cs: not cs[4]):
+                if control_set[0] not in finished_labels:
+                    pending.put_nowait(control_set)
+            total = len(plan.control_sets)
+            counts = {
+                "completed": total - pending.qsize(),
+                "failed": 0,
+                "total": total,
+            }
+            results = list(done)
+
+            async def _run_one(control_set: BenchmarkControlSet) -> None:
+                label, positives, negatives, control_set_id, is_primary = control_set
                 cfg = copy.deepcopy(base_config)
                 cfg.positive_controls = positives
                 cfg.negative_controls = negatives
                 cfg.name = f"{base_config.name} [{label}]"
                 cfg.control_set_id = control_set_id
-
-                try:
-                    exp = await run_experiment(
-                        cfg,
-                        user_id=user_id,
-                        progress_callback=_make_progress_callback(operation_id),
-                    )
-                    exp.benchmark_id = benchmark_id
-                    exp.control_set_label = label
-                    exp.is_primary_benchmark = is_primary
-                    store = get_experiment_store()
-                    store.save(exp)
-                    return exp
-                except Exception as exc:
-                    logger.error(
-                        "Benchmark experiment failed",
-                        label=label,
-                        error=str(exc),
-                    )
-                    return None
-
-            tasks = [
-                _run_one(label, pos, neg, csid, primary)
-                for label, pos, neg, csid, primary in control_sets
-            ]
-            results = await asyncio.gather(*tasks)
-            completed = [r for r in results if r is not None]
+                progress = _RunProgress(emit, counts, {"controlSetLabel": label})
+
+                async with budget:
+                    try:
+                        exp = await run_experiment(
+                            cfg, user_id=user_id, progress_callback=progress
+                        )
+                    except Exception as exc:
+                        logger.error(
+                            "Benchmark experiment failed",
+                            label=label,
+                            error=str(exc),
+                        )
+                        await progress.fail(exc)
+                        return
+                exp.benchmark_id = benchmark_id
+                exp.control_set_label = label
+                exp.is_primary_benchmark = is_primary
+                store.save(exp)
+                results.append(exp)
+
+            async def _worker() -> None:
+                while not pending.empty():
+                    await _run_one(pending.get_nowait())
+
+            workers = min(
+                max(1, get_settings().benchmark_max_concurrent_runs), pending.qsize()
+            )
+            with shared_lookups():
+                await asyncio.gather(*(_worker() for _ in range(workers)))
+
+            order = {cs[0]: i for i, cs in enumerate(plan.control_sets)}
+            results.sort(
+                key=lambda e: (
+                    not e.is_primary_benchmark,
+                    order.get(e.control_set_label or "", total),
+                )
+            )
             await _emit_to_redis(
                 operation_id,
                 "benchmark_complete",
                 {
                     "benchmarkId": benchmark_id,
-                    "experiments": [experiment_to_json(e) for e in completed],
+                    "experiments": [experiment_to_json(e) for e in results],
                 },
             )
         except Exception as exc:
@@ -289,7 +603,57 @@ async def start_benchmark(
             logger.error("Benchmark suite failed", error=str(exc), exc_info=True)
             await _emit_to_redis(operation_id, "benchmark_error", {"error": str(exc)})
         finally:
+            await _release_benchmark_run(benchmark_id, operation_id)
             await _finalize_operation(operation_id, failed=failed)
 
-    spawn(_run())
+    _spawn_admitted(
+        operation_id, "benchmark", _run, user_id=user_id, error_event="benchmark_error"
+    )
     return operation_id
+
+
+async def start_benchmark(
+    base_config: ExperimentConfig,
+    control_sets: list[BenchmarkControlSet],
+    *,
+    user_id: str | None = None,
+) -> str:
+    """Launch a benchmark suite as a background task. Returns operation ID.
+
+    The plan is checkpointed under the benchmark ID for
+    :func:`resume_benchmark`.  Progress events are tagged with their
+    ``controlSetLabel`` and the suite-wide ``batchProgress`` counts.
+    """
+    benchmark_id = f"bench_{uuid4().hex[:12]}"
+    plan = _BenchmarkPlan(
+        user_id=user_id, base_config=base_config, control_sets=control_sets
+    )
+    await _save_benchmark_plan(benchmark_id, plan)
+    return await _launch_benchmark(benchmark_id, plan, done=[])
+
+
+async def resume_benchmark(benchmark_id: str, *, user_id: str | None = None) -> str:
+    """Re-run the control sets of a benchmark that have no completed experiment.
+
+    Completed experiments already saved under *benchmark_id* are kept and
+    reported again in ``benchmark_complete``.  Returns operation ID.
+
+    :raises NotFoundError: If the benchmark's checkpoint expired or belongs
+        to another user.
+    :raises ConflictError: If the benchmark is still running (started or
+        resumed by an operation that hasn't ended).
+    """
+    from veupath_chatbot.services.experiment.store import get_experiment_store
+
+    plan = await _load_benchmark_plan(benchmark_id)
+    if plan is None or plan.user_id != user_id:
+        raise NotFoundError(
+            title="Benchmark not found",
+            detail="No resumable benchmark with this ID.",
+        )
+    done = [
+        e
+        for e in await get_experiment_store().alist_by_benchmark(benchmark_id)
+        if e.status == "completed"
+    ]
+    return await _launch_benchmark(benchmark_id, plan, done=done)
@@ -282,6 +282,7 @@ async def run_cross_validation(
                 positive_controls=pos,
                 negative_controls=neg,
                 controls_value_format=controls_value_format,
+                local_intersection=True,
             )
 
         evaluator = _evaluate_single
@@ -19,19 +19,23 @@ Parameters are fetched from the WDK analysis form defaults so required
 fields like ``organism`` and ``pValueCutoff`` are always populated.
 """
 
+import asyncio
 import json
 import re
 
 from veupath_chatbot.domain.parameters.specs import unwrap_search_data
 from veupath_chatbot.domain.strategy.ast import StepTreeNode
+from veupath_chatbot.integrations.veupathdb.analysis_poller import backoff_delay
 from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject, JSONValue
-from veupath_chatbot.services.control_helpers import delete_temp_strategy
+from veupath_chatbot.services.control_helpers import (
+    create_temp_strategy,
+    delete_temp_strategy,
+)
 from veupath_chatbot.services.experiment.helpers import (
     coerce_step_id,
-    extract_wdk_id,
     safe_float,
     safe_int,
 )
@@ -428,16 +432,55 @@ def _extract_default_params(form_meta: JSONValue) -> JSONObject:
     return defaults
 
 
+def wdk_analysis_name(analysis_type: EnrichmentAnalysisType) -> str | None:
+    """Return the WDK analysis plugin name for *analysis_type*, if any."""
+    return _ANALYSIS_TYPE_MAP.get(analysis_type)
+
+
+def requested_analysis_params(analysis_type: EnrichmentAnalysisType) -> JSONObject:
+    """Return the params Pathfinder overrides on top of the WDK form defaults.
+
+    Everything else comes from the analysis form, whose defaults are a
+    function of the site and the step's answer — so these overrides plus
+    the answer identify the merged parameter set.
+    """
+    if analysis_type in _GO_ONTOLOGY_MAP:
+        return {
+            "goAssociationsOntologies": json.dumps([_GO_ONTOLOGY_MAP[analysis_type]])
+        }
+    return {}
+
+
+async def fetch_analysis_form(
+    api: StrategyAPI,
+    step_id: int,
+    wdk_analysis_type: str,
+) -> JSONValue:
+    """Fetch WDK analysis form metadata, returning ``None`` on failure."""
+    try:
+        return await api.get_analysis_type(step_id, wdk_analysis_type)
+    except Exception as exc:
+        logger.warning(
+            "Could not fetch analysis form metadata, using empty params",
+            analysis_type=wdk_analysis_type,
+            step_id=step_id,
+            error=str(exc),
+        )
+        return None
+
+
 async def _execute_analysis(
     api: StrategyAPI,
     step_id: int,
     analysis_type: EnrichmentAnalysisType,
+    *,
+    form_meta: JSONValue = None,
 ) -> EnrichmentResult:
     """Shared logic: run analysis on a step, parse results, return EnrichmentResult.
 
-    Fetches the analysis form metadata from WDK to discover correct
-    parameter names and defaults, then overrides only the GO ontology
-    parameter when applicable.
+    Uses the analysis form metadata (fetched from WDK unless the caller
+    already has it) to discover correct parameter names and defaults,
+    then overrides only the GO ontology parameter when applicable.
     """
     wdk_analysis_type = _ANALYSIS_TYPE_MAP.get(analysis_type)
     if not wdk_analysis_type:
@@ -449,23 +492,14 @@ async def _execute_analysis(
         )
 
     # Fetch form metadata so we use correct parameter names and defaults.
-    analysis_params: JSONObject = {}
-    form_meta: JSONValue = None
-    try:
-        form_meta = await api.get_analysis_type(step_id, wdk_analysis_type)
-        analysis_params = _extract_default_params(form_meta)
-        logger.debug(
-            "Fetched analysis form defaults",
-            analysis_type=wdk_analysis_type,
-            param_names=list(analysis_params.keys()),
-        )
-    except Exception as exc:
-        logger.warning(
-            "Could not fetch analysis form metadata, using empty params",
-            analysis_type=wdk_analysis_type,
-            step_id=step_id,
-            error=str(exc),
-        )
+    if form_meta is None:
+        form_meta = await fetch_analysis_form(api, step_id, wdk_analysis_type)
+    analysis_params = _extract_default_params(form_meta)
+    logger.debug(
+        "Resolved analysis form defaults",
+        analysis_type=wdk_analysis_type,
+        param_names=list(analysis_params.keys()),
+    )
 
     # For GO enrichment, set the ontology parameter — but only if the
     # requested ontology is actually available on this site.  Different
@@ -489,7 +523,7 @@ async def _execute_analysis(
                 background_size=0,
             )
 
-        analysis_params["goAssociationsOntologies"] = json.dumps([requested_ontology])
+        analysis_params.update(requested_analysis_params(analysis_type))
 
     logger.info(
         "Running enrichment analysis",
@@ -500,8 +534,8 @@ async def _execute_analysis(
     )
 
     # Retry on WDK 500s — the step analysis endpoint is flaky under load.
-    import asyncio as _asyncio
-
+    # The HTTP client already retries individual 5xx calls, so the
+    # analysis-level back-off only needs to be short and jittered.
     last_err: Exception | None = None
     for attempt in range(3):
         try:
@@ -521,7 +555,7 @@ async def _execute_analysis(
                     analysis_type=wdk_analysis_type,
                     error=err_str,
                 )
-                await _asyncio.sleep(2**attempt)
+                await asyncio.sleep(backoff_delay(attempt, initial=0.5))
                 continue
             raise
     else:
@@ -568,13 +602,9 @@ async def run_enrichment_analysis(
     strategy_id: int | None = None
 
     try:
-        created = await api.create_strategy(
-            step_tree=root,
-            name="Pathfinder enrichment analysis",
-            description=None,
-            is_internal=True,
+        strategy_id = await create_temp_strategy(
+            api, step_tree=root, name="Pathfinder enrichment analysis"
         )
-        strategy_id = extract_wdk_id(created)
 
         return await _execute_analysis(api, step_id, analysis_type)
 
@@ -12,10 +12,23 @@ from collections.abc import AsyncIterator
 from veupath_chatbot.platform.errors import ValidationError
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject
-from veupath_chatbot.services.control_tests import run_positive_negative_controls
-from veupath_chatbot.services.experiment.helpers import extract_and_enrich_genes
+from veupath_chatbot.services.control_tests import (
+    extract_intersection_data,
+    run_positive_negative_controls,
+)
+from veupath_chatbot.services.experiment.helpers import (
+    extract_and_enrich_genes,
+    safe_int,
+)
 from veupath_chatbot.services.experiment.metrics import metrics_from_control_result
 from veupath_chatbot.services.experiment.store import get_experiment_store
+from veupath_chatbot.services.experiment.threshold_sweep import (
+    SinglePassUnavailableError,
+    ThresholdDirection,
+    fetch_attribute_values,
+    local_control_results,
+    loosest_threshold,
+)
 from veupath_chatbot.services.experiment.types import (
     Experiment,
     ExperimentMetrics,
@@ -78,6 +91,7 @@ async def re_evaluate(exp: Experiment) -> JSONObject:
             positive_controls=exp.config.positive_controls or None,
             negative_controls=exp.config.negative_controls or None,
             controls_value_format=exp.config.controls_value_format,
+            local_intersection=True,
         )
 
     metrics = metrics_from_control_result(result)
@@ -230,7 +244,7 @@ async def run_sweep_point(
                     positive_controls=exp.config.positive_controls or None,
                     negative_controls=exp.config.negative_controls or None,
                     controls_value_format=exp.config.controls_value_format,
-                    skip_cleanup=True,
+                    local_intersection=True,
                 ),
                 timeout=SWEEP_POINT_TIMEOUT_S,
             )
@@ -290,23 +304,85 @@ async def _run_sweep_point_tree(
     )
 
 
-async def cleanup_before_sweep(site_id: str) -> None:
-    """Best-effort cleanup of leaked internal control-test strategies."""
-    from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
-    from veupath_chatbot.services.control_helpers import (
-        cleanup_internal_control_test_strategies,
-    )
-
-    try:
-        api = get_strategy_api(site_id)
-        strategies = await api.list_strategies()
-        await cleanup_internal_control_test_strategies(api, strategies)
-    except Exception as exc:
-        logger.warning(
-            "Pre-sweep cleanup of leaked control-test strategies failed",
-            site_id=site_id,
-            error=str(exc),
+async def run_single_pass_sweep(
+    *,
+    exp: Experiment,
+    param_name: str,
+    sweep_values: list[str],
+    attribute_name: str,
+    direction: ThresholdDirection,
+) -> list[JSONObject]:
+    """Score a monotone numeric sweep from one materialization.
+
+    Runs the controls once at the loosest threshold (to learn which
+    controls the search can return at all) while fetching that result's
+    *attribute_name* values, then computes every point locally with
+    :func:`~veupath_chatbot.services.experiment.threshold_sweep.local_control_results`.
+
+    :returns: Sweep points in *sweep_values* order.
+    :raises SinglePassUnavailableError: When the sweep must be evaluated per point.
+    """
+    thresholds = [float(v) for v in sweep_values]
+    loosest = sweep_values[thresholds.index(loosest_threshold(thresholds, direction))]
+    params = dict(exp.config.parameters)
+    params[param_name] = loosest
+
+    # A TaskGroup cancels the sibling when either call fails or times out.
+    async with asyncio.timeout(SWEEP_POINT_TIMEOUT_S), asyncio.TaskGroup() as tg:
+        controls_task = tg.create_task(
+            run_positive_negative_controls(
+                site_id=exp.config.site_id,
+                record_type=exp.config.record_type,
+                target_search_name=exp.config.search_name,
+                target_parameters=params,
+                controls_search_name=exp.config.controls_search_name,
+                controls_param_name=exp.config.controls_param_name,
+                positive_controls=exp.config.positive_controls or None,
+                negative_controls=exp.config.negative_controls or None,
+                controls_value_format=exp.config.controls_value_format,
+                local_intersection=True,
+            )
+        )
+        records_task = tg.create_task(
+            fetch_attribute_values(
+                site_id=exp.config.site_id,
+                record_type=exp.config.record_type,
+                search_name=exp.config.search_name,
+                parameters=params,
+                attribute_name=attribute_name,
+            )
         )
+    controls, records = controls_task.result(), records_task.result()
+
+    hits: dict[str, tuple[set[str], int]] = {}
+    for key in ("positive", "negative"):
+        payload = controls.get(key)
+        if not isinstance(payload, dict):
+            hits[key] = (set(), 0)
+            continue
+        _, ids, has_ids = extract_intersection_data(payload)
+        if not has_ids:
+            raise SinglePassUnavailableError(
+                f"Too many {key} controls to list their hits"
+            )
+        hits[key] = (ids, safe_int(payload.get("controlsCount"), 0))
+
+    results = local_control_results(
+        records,
+        thresholds,
+        direction,
+        positive_hits=hits["positive"][0],
+        negative_hits=hits["negative"][0],
+        positive_count=hits["positive"][1],
+        negative_count=hits["negative"][1],
+    )
+    return [
+        {
+            "value": threshold,
+            "metrics": format_metrics_dict(metrics_from_control_result(result)),
+        }
+        for threshold, result in zip(thresholds, results, strict=True)
+    ]
 
 
 async def generate_sweep_events(
@@ -315,21 +391,59 @@ async def generate_sweep_events(
     param_name: str,
     sweep_type: str,
     sweep_values: list[str],
+    attribute_name: str | None = None,
+    threshold_direction: ThresholdDirection | None = None,
 ) -> AsyncIterator[str]:
     """Run the full sweep and yield SSE-formatted events.
 
     Yields ``sweep_point`` events as each point completes, then a final
     ``sweep_complete`` event with all sorted results.
+
+    A numeric sweep of a single-step experiment that names the result
+    attribute carrying the threshold (and its direction) is scored in one
+    pass by :func:`run_single_pass_sweep`; if that isn't possible, every
+    point is evaluated against WDK.
     """
     is_categorical = sweep_type == "categorical"
     total_points = len(sweep_values)
 
-    await cleanup_before_sweep(exp.config.site_id)
-
-    semaphore = asyncio.Semaphore(SWEEP_CONCURRENCY)
     completed_count = 0
     all_points: list[JSONObject] = []
 
+    if (
+        not is_categorical
+        and not exp.config.is_tree_mode
+        and attribute_name
+        and threshold_direction is not None
+    ):
+        try:
+            all_points = await run_single_pass_sweep(
+                exp=exp,
+                param_name=param_name,
+                sweep_values=sweep_values,
+                attribute_name=attribute_name,
+                direction=threshold_direction,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Single-pass threshold sweep unavailable; evaluating each point",
+                param=param_name,
+                attribute=attribute_name,
+                error=str(exc),
+            )
+        for point in all_points:
+            completed_count += 1
+            event_data = json_mod.dumps(
+                {
+                    "point": point,
+                    "completedCount": completed_count,
+                    "totalCount": total_points,
+                }
+            )
+            yield f"event: sweep_point\ndata: {event_data}\n\n"
+
+    semaphore = asyncio.Semaphore(SWEEP_CONCURRENCY)
+
     async def _bounded_point(val: str) -> JSONObject:
         async with semaphore:
             return await run_sweep_point(
@@ -339,7 +453,8 @@ async def generate_sweep_events(
                 is_categorical=is_categorical,
             )
 
-    tasks = {asyncio.ensure_future(_bounded_point(v)): v for v in sweep_values}
+    pending = [] if all_points else sweep_values
+    tasks = {asyncio.ensure_future(_bounded_point(v)): v for v in pending}
 
     try:
         async with asyncio.timeout(SWEEP_TIMEOUT_S):
@@ -5,9 +5,12 @@ classifiers, which better matches how researchers use strategy results
 ("how many known positives are in my top K?").
 """
 
+from bisect import bisect_left
+from collections.abc import Sequence
+
 from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.platform.types import JSONObject, JSONValue
 from veupath_chatbot.services.experiment.types import (
     DEFAULT_K_VALUES,
     RankMetrics,
@@ -16,6 +19,7 @@ from veupath_chatbot.services.experiment.types import (
 logger = get_logger(__name__)
 
 _PR_CURVE_SAMPLE_POINTS = 50
+_ID_PAGE_SIZE = 5_000
 
 
 def compute_rank_metrics(
@@ -35,60 +39,81 @@ def compute_rank_metrics(
     :param k_values: List sizes at which to compute P@K / R@K / E@K.
     :returns: Rank metrics object.
     """
-    if k_values is None:
-        k_values = DEFAULT_K_VALUES
-
     # Deduplicate while preserving order — duplicate IDs would inflate
     # cumulative_hits and produce recall > 1.0.
     result_ids = list(dict.fromkeys(result_ids))
+    return rank_metrics_from_hits(
+        [i for i, gene_id in enumerate(result_ids) if gene_id in positive_ids],
+        total=len(result_ids),
+        total_positives=len(positive_ids),
+        k_values=k_values,
+    )
 
-    total = len(result_ids)
-    total_pos = len(positive_ids)
-    if total == 0 or total_pos == 0:
-        return RankMetrics(total_results=total)
 
-    random_precision = total_pos / total if total > 0 else 0.0
+def rank_metrics_from_hits(
+    hit_ranks: Sequence[int],
+    *,
+    total: int,
+    total_positives: int,
+    k_values: list[int] | None = None,
+) -> RankMetrics:
+    """Compute rank-based metrics from the positions of the positive hits.
 
-    precision_at_k: dict[int, float] = {}
-    recall_at_k: dict[int, float] = {}
-    enrichment_at_k: dict[int, float] = {}
+    Equivalent to :func:`compute_rank_metrics` on a deduplicated result
+    list, but costs ``O(hits + k)`` instead of a pass over every result --
+    callers that score many control sets against one result list (e.g.
+    bootstrap resampling) map IDs to ranks once and reuse the mapping.
 
-    cumulative_hits = 0
-    pr_curve: list[tuple[float, float]] = []
-    list_size_vs_recall: list[tuple[int, float]] = []
+    :param hit_ranks: Sorted 0-based ranks of the positives in the result.
+    :param total: Number of distinct results.
+    :param total_positives: Size of the positive control set.
+    :param k_values: List sizes at which to compute P@K / R@K / E@K.
+    :returns: Rank metrics object.
+    """
+    if k_values is None:
+        k_values = DEFAULT_K_VALUES
 
-    sample_step = max(1, total // _PR_CURVE_SAMPLE_POINTS)
+    if total == 0 or total_positives == 0:
+        return RankMetrics(total_results=total)
 
-    for i, gene_id in enumerate(result_ids):
-        k = i + 1
-        if gene_id in positive_ids:
-            cumulative_hits += 1
+    random_precision = total_positives / total
 
-        prec = cumulative_hits / k
-        rec = cumulative_hits / total_pos
+    def _hits_before(end: int) -> int:
+        # Positives among result_ids[:end], with slice semantics for end.
+        if end < 0:
+            end = max(total + end, 0)
+        return bisect_left(hit_ranks, end)
 
-        if k in k_values:
-            precision_at_k[k] = prec
-            recall_at_k[k] = rec
-            enrichment_at_k[k] = (
-                (prec / random_precision) if random_precision > 0 else 0.0
-            )
+    precision_at_k: dict[int, float] = {}
+    recall_at_k: dict[int, float] = {}
+    enrichment_at_k: dict[int, float] = {}
 
-        if k % sample_step == 0 or k == total:
-            pr_curve.append((prec, rec))
-            list_size_vs_recall.append((k, rec))
+    for k in sorted({kv for kv in k_values if 1 <= kv <= total}):
+        prec = _hits_before(k) / k
+        precision_at_k[k] = prec
+        recall_at_k[k] = _hits_before(k) / total_positives
+        enrichment_at_k[k] = prec / random_precision
 
     for kv in k_values:
         if kv not in precision_at_k:
             effective_k = min(kv, total)
-            hits_at_k = sum(
-                1 for gid in result_ids[:effective_k] if gid in positive_ids
-            )
+            hits_at_k = _hits_before(effective_k)
             precision_at_k[kv] = hits_at_k / effective_k if effective_k > 0 else 0.0
-            recall_at_k[kv] = hits_at_k / total_pos if total_pos > 0 else 0.0
-            enrichment_at_k[kv] = (
-                (precision_at_k[kv] / random_precision) if random_precision > 0 else 0.0
-            )
+            recall_at_k[kv] = hits_at_k / total_positives
+            enrichment_at_k[kv] = precision_at_k[kv] / random_precision
+
+    sample_step = max(1, total // _PR_CURVE_SAMPLE_POINTS)
+    sample_sizes = list(range(sample_step, total + 1, sample_step))
+    if sample_sizes[-1] != total:
+        sample_sizes.append(total)
+
+    pr_curve: list[tuple[float, float]] = []
+    list_size_vs_recall: list[tuple[int, float]] = []
+    for k in sample_sizes:
+        hits = _hits_before(k)
+        rec = hits / total_positives
+        pr_curve.append((hits / k, rec))
+        list_size_vs_recall.append((k, rec))
 
     return RankMetrics(
         precision_at_k=precision_at_k,
@@ -112,6 +137,8 @@ async def fetch_ordered_result_ids(
     When *sort_attribute* is provided the results are sorted by
     ``reportConfig.sorting`` via :meth:`get_step_records`; otherwise
     the default WDK ordering is used (via :meth:`get_step_answer`).
+    IDs are read in pages of at most ``5000`` records until the answer
+    runs out or *max_results* is reached.
 
     :param site_id: VEuPathDB site ID.
     :param step_id: WDK step ID.
@@ -126,24 +153,34 @@ async def fetch_ordered_result_ids(
     if sort_attribute:
         sorting = [{"attributeName": sort_attribute, "direction": sort_direction}]
 
-    if sorting is not None:
-        answer: JSONObject = await api.get_step_records(
-            step_id=step_id,
-            attributes=[],
-            pagination={"offset": 0, "numRecords": max_results},
-            sorting=sorting,
-        )
-    else:
-        answer = await api.get_step_answer(
-            step_id=step_id,
-            attributes=[],
-            pagination={"offset": 0, "numRecords": max_results},
-        )
-
-    records = answer.get("records", [])
-    if not isinstance(records, list):
-        return []
+    ids: list[str] = []
+    for offset in range(0, max_results, _ID_PAGE_SIZE):
+        page_size = min(_ID_PAGE_SIZE, max_results - offset)
+        pagination: JSONObject = {"offset": offset, "numRecords": page_size}
+        if sorting is not None:
+            answer: JSONObject = await api.get_step_records(
+                step_id=step_id,
+                attributes=[],
+                pagination=pagination,
+                sorting=sorting,
+            )
+        else:
+            answer = await api.get_step_answer(
+                step_id=step_id,
+                attributes=[],
+                pagination=pagination,
+            )
+        records = answer.get("records", [])
+        if not isinstance(records, list):
+            break
+        ids.extend(_record_ids(records))
+        if len(records) < page_size:
+            break
+    return ids
+
 
+def _record_ids(records: list[JSONValue]) -> list[str]:
+    """Primary key values of one answer page, in order."""
     ids: list[str] = []
     for rec in records:
         if not isinstance(rec, dict):
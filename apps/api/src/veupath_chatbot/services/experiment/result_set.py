@@ -0,0 +1,85 @@
+"""Per-experiment result-set artifact.
+
+An experiment's ordered result IDs are the largest WDK payload it reads.
+Rank metrics and robustness both consume them; :class:`ExperimentResultSet`
+fetches them once -- in pages, sorted by the configured attribute if any
+-- and hands the same list to every consumer.
+
+IDs are deduplicated in rank order, so a record's position is its integer
+code: consumers score control sets from the ranks of their hits (see
+:func:`~veupath_chatbot.services.experiment.rank_metrics.rank_metrics_from_hits`)
+instead of rescanning the strings.  The list is capped at
+``experiment_result_set_max_records``.
+
+When the experiment needs no particular order, the target IDs the
+evaluation fetched for local control intersection are reused without a
+WDK call.  Gene-set experiments always read their step: WDK resolves the
+configured gene IDs (aliases, genes to transcripts), so they are not the
+result IDs.
+"""
+
+import asyncio
+
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.services.experiment.types import ExperimentConfig
+
+
+class ExperimentResultSet:
+    """Ordered result IDs of one experiment, fetched at most once.
+
+    :param config: Experiment configuration (site, search, sort order).
+    :param step_id: Persisted WDK step whose answer is the result.
+    """
+
+    def __init__(self, config: ExperimentConfig, step_id: int) -> None:
+        self._config = config
+        self._step_id = step_id
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._ids: list[str] = []
+        self.total = 0
+
+    async def ids(self) -> list[str]:
+        """Return the distinct result IDs in rank order, fetching on first use.
+
+        A failed fetch is retried by the next call.
+        """
+        async with self._lock:
+            if not self._loaded:
+                self._ids = list(dict.fromkeys(await self._fetch()))
+                self.total = len(self._ids)
+                self._loaded = True
+        return self._ids
+
+    async def _fetch(self) -> list[str]:
+        from veupath_chatbot.services.control_tests import cached_target_record_ids
+        from veupath_chatbot.services.experiment.rank_metrics import (
+            fetch_ordered_result_ids,
+        )
+
+        config = self._config
+        max_records = get_settings().experiment_result_set_max_records
+        if (
+            config.sort_attribute is None
+            and not config.is_tree_mode
+            and not config.target_gene_ids
+        ):
+            cached = await cached_target_record_ids(
+                site_id=config.site_id,
+                record_type=config.record_type,
+                search_name=config.search_name,
+                parameters=config.parameters,
+            )
+            if cached is not None:
+                return cached[:max_records]
+        return await fetch_ordered_result_ids(
+            site_id=config.site_id,
+            step_id=self._step_id,
+            max_results=max_records,
+            sort_attribute=config.sort_attribute,
+            sort_direction=config.sort_direction,
+        )
+
+    def close(self) -> None:
+        """Release the IDs."""
+        self._ids = []
@@ -2,18 +2,23 @@
 
 Resamples control sets with replacement and recomputes rank metrics
 to derive confidence intervals and stability scores — all pure Python,
-no additional WDK API calls required.
+no additional WDK API calls required.  The result list is indexed once;
+each iteration only looks up the resampled controls.
 """
 
 import random
 from collections import defaultdict
+from collections.abc import Collection
 
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.services.experiment.metrics import (
     compute_confusion_matrix,
     compute_metrics,
 )
-from veupath_chatbot.services.experiment.rank_metrics import compute_rank_metrics
+from veupath_chatbot.services.experiment.rank_metrics import (
+    compute_rank_metrics,
+    rank_metrics_from_hits,
+)
 from veupath_chatbot.services.experiment.types import (
     DEFAULT_K_VALUES,
     BootstrapResult,
@@ -61,17 +66,21 @@ def compute_robustness(
     pos_list = list(positive_ids)
     neg_list = list(negative_ids)
 
+    # Rank of each distinct result ID: positives map to hit ranks without
+    # rescanning the result list every iteration.
+    rank_of = {gid: i for i, gid in enumerate(dict.fromkeys(result_ids))}
+    result_set = rank_of.keys()
+
     for _ in range(n_bootstrap):
         boot_pos = _resample(pos_list, rng)
         boot_neg = _resample(neg_list, rng)
 
+        boot_pos_set = set(boot_pos)
         if include_rank_metrics:
-            boot_pos_set = set(boot_pos)
-            boot_neg_set = set(boot_neg)
-            rm = compute_rank_metrics(
-                result_ids=result_ids,
-                positive_ids=boot_pos_set,
-                negative_ids=boot_neg_set,
+            rm = rank_metrics_from_hits(
+                sorted(rank_of[gid] for gid in boot_pos_set if gid in rank_of),
+                total=len(rank_of),
+                total_positives=len(boot_pos_set),
                 k_values=k_values,
             )
 
@@ -95,7 +104,7 @@ def compute_robustness(
             top_k_sets.append(boot_relevant)
 
         _collect_classification_metrics(
-            result_ids, set(boot_pos), set(boot_neg), metric_samples
+            result_set, boot_pos_set, set(boot_neg), metric_samples
         )
 
     metric_cis = {k: _ci_from_samples(v) for k, v in metric_samples.items()}
@@ -138,17 +147,20 @@ def _resample(items: list[str], rng: random.Random) -> list[str]:
 
 
 def _collect_classification_metrics(
-    result_ids: list[str],
+    result_ids: Collection[str],
     pos_set: set[str],
     neg_set: set[str],
     samples: dict[str, list[float]],
 ) -> None:
-    """Compute binary classification metrics and accumulate into samples dict."""
-    result_set = set(result_ids)
+    """Compute binary classification metrics and accumulate into samples dict.
+
+    *result_ids* is best passed as a set (or dict keys), which makes the
+    intersections proportional to the control sets rather than the result.
+    """
     cm = compute_confusion_matrix(
-        positive_hits=len(pos_set & result_set),
+        positive_hits=sum(1 for gid in pos_set if gid in result_ids),
         total_positives=len(pos_set),
-        negative_hits=len(neg_set & result_set),
+        negative_hits=sum(1 for gid in neg_set if gid in result_ids),
         total_negatives=len(neg_set),
     )
     m = compute_metrics(cm)
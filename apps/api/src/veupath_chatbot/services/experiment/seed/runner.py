@@ -3,8 +3,10 @@
 Creates real WDK strategies (visible in the sidebar) and curated control sets
 (available in the Experiments tab) across multiple VEuPathDB sites.
 
-Seeds are processed concurrently across sites using ``asyncio.TaskGroup``,
-with a semaphore to cap the number of parallel WDK requests.
+Seeds are streamed from the on-disk corpus and processed concurrently
+across sites using ``asyncio.TaskGroup``, with a semaphore to cap the number
+of parallel WDK requests.  A seed is only decoded once a slot is free for
+it, so at most ``_MAX_CONCURRENT_SEEDS`` seeds are held in memory.
 """
 
 import asyncio
@@ -15,10 +17,8 @@ from uuid import UUID
 
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject
-from veupath_chatbot.services.experiment.seed.seeds import (
-    get_all_seeds,
-    get_seeds_for_site,
-)
+from veupath_chatbot.services.experiment.seed.seeds import count_seeds, iter_seeds
+from veupath_chatbot.services.experiment.seed.types import SeedDef
 
 logger = get_logger(__name__)
 
@@ -51,8 +51,7 @@ async def run_seed(
         sync_to_projection,
     )
 
-    seeds = get_seeds_for_site(site_id) if site_id else get_all_seeds()
-    total = len(seeds)
+    total = count_seeds(site_id)
     yield {
         "type": "seed_progress",
         "data": {
@@ -64,10 +63,14 @@ async def run_seed(
     semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEEDS)
     queue: asyncio.Queue[JSONObject | None] = asyncio.Queue()
 
-    async def _seed_one(i: int, seed: Any) -> tuple[bool, bool]:
-        """Process a single seed. Returns (strategy_ok, control_set_ok)."""
+    async def _seed_one(i: int, seed: SeedDef) -> tuple[bool, bool]:
+        """Process a single seed. Returns (strategy_ok, control_set_ok).
+
+        The caller acquires a semaphore slot before scheduling; it is
+        released here when the seed finishes.
+        """
         idx = i + 1
-        async with semaphore:
+        try:
             await queue.put(
                 {
                     "type": "seed_progress",
@@ -161,15 +164,18 @@ async def run_seed(
                     }
                 )
                 return (False, False)
+        finally:
+            semaphore.release()
 
     async def _run_all() -> list[tuple[bool, bool]]:
-        """Launch all seeds concurrently, signal completion via sentinel."""
+        """Stream seeds into the TaskGroup, signal completion via sentinel."""
         results: list[tuple[bool, bool]] = []
         try:
             async with asyncio.TaskGroup() as tg:
-                tasks = [
-                    tg.create_task(_seed_one(i, seed)) for i, seed in enumerate(seeds)
-                ]
+                tasks = []
+                for i, seed in enumerate(iter_seeds(site_id)):
+                    await semaphore.acquire()
+                    tasks.append(tg.create_task(_seed_one(i, seed)))
             results = [t.result() for t in tasks]
         except BaseException:
             # TaskGroup re-raises child exceptions; individual seeds already
@@ -1,38 +1,52 @@
-"""Per-database seed definitions."""
-
-import contextlib
-from importlib import import_module
-from typing import Any
-
-# Available seed databases
-SEED_DATABASES: list[str] = [
-    "plasmodb",
-    "toxodb",
-    "cryptodb",
-    "piroplasmadb",
-    "tritrypdb",
-    "fungidb",
-    "vectorbase",
-    "giardiadb",
-    "amoebadb",
-    "microsporidiadb",
-    "hostdb",
-    "veupathdb",
-    "orthomcl",
-]
-
-
-def get_seeds_for_site(site_id: str) -> list[Any]:
-    """Import and return SEEDS for a specific site."""
-    mod = import_module(f".{site_id}", package=__name__)
-    seeds: list[Any] = mod.SEEDS
-    return seeds
-
-
-def get_all_seeds() -> list[Any]:
+"""Per-database seed definitions.
+
+The corpus itself is data (``data/<site>.jsonl.gz`` plus ``manifest.json``);
+see :mod:`veupath_chatbot.services.experiment.seed.store` for the format.
+Only the manifest is read at import time.
+"""
+
+from collections.abc import Iterator
+
+from veupath_chatbot.services.experiment.seed.store import (
+    iter_site_seeds,
+    load_manifest,
+)
+from veupath_chatbot.services.experiment.seed.types import SeedDef
+
+# Available seed databases, in seeding order
+SEED_DATABASES: list[str] = list(load_manifest().sites)
+
+
+def iter_seeds(site_id: str | None = None) -> Iterator[SeedDef]:
+    """Stream seeds for *site_id*, or for every database when ``None``."""
+    for sid in [site_id] if site_id else SEED_DATABASES:
+        yield from iter_site_seeds(sid)
+
+
+def count_seeds(site_id: str | None = None) -> int:
+    """Return how many seeds :func:`iter_seeds` yields, from the manifest."""
+    sites = load_manifest().sites
+    if site_id:
+        entry = sites.get(site_id)
+        if entry is None:
+            raise ValueError(f"No seeds for site '{site_id}'")
+        return len(entry.names)
+    return sum(len(entry.names) for entry in sites.values())
+
+
+def load_seed(name: str) -> SeedDef | None:
+    """Load a single seed by name, decoding only its database's file."""
+    site_id = load_manifest().find_site(name)
+    if site_id is None:
+        return None
+    return next((s for s in iter_site_seeds(site_id) if s.name == name), None)
+
+
+def get_seeds_for_site(site_id: str) -> list[SeedDef]:
+    """Return all seeds for a specific site."""
+    return list(iter_seeds(site_id))
+
+
+def get_all_seeds() -> list[SeedDef]:
     """Get seeds for all available sites."""
-    all_seeds: list[Any] = []
-    for site_id in SEED_DATABASES:
-        with contextlib.suppress(ImportError, AttributeError):
-            all_seeds.extend(get_seeds_for_site(site_id))
-    return all_seeds
+    return list(iter_seeds())
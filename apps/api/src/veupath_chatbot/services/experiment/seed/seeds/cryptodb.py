@@ -1,1457 +0,0 @@
-"""Seed definitions for CryptoDB."""
-
-from veupath_chatbot.services.experiment.seed.helpers import (
-    ec_search_params,
-    go_search_params,
-    signal_peptide_params,
-    text_search_params,
-    transmembrane_params,
-)
-from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
-
-# ---------------------------------------------------------------------------
-# Organism constants
-# ---------------------------------------------------------------------------
-CP_ORG = "Cryptosporidium parvum Iowa II"
-CP_EC_SOURCES = [
-    "KEGG_Enzyme",
-    "GenBank",
-    "computationally inferred from Orthology",
-    "Uniprot",
-    "KissingerLab",
-]
-
-
-# ---------------------------------------------------------------------------
-# Gene ID lists
-# ---------------------------------------------------------------------------
-
-# Kinases (GO:0004672 - protein kinase activity) -- 87 genes
-CRYPTO_KINASES = [
-    "cgd1_1220",
-    "cgd1_1490",
-    "cgd1_2110",
-    "cgd1_2630",
-    "cgd1_2850",
-    "cgd1_2960",
-    "cgd1_3230",
-    "cgd1_400",
-    "cgd1_60",
-    "cgd1_810",
-    "cgd1_890",
-    "cgd2_1060",
-    "cgd2_1300",
-    "cgd2_1610",
-    "cgd2_1830",
-    "cgd2_1880",
-    "cgd2_1960",
-    "cgd2_2310",
-    "cgd2_3190",
-    "cgd2_3340",
-    "cgd2_3890",
-    "cgd2_4340",
-    "cgd2_910",
-    "cgd3_1510",
-    "cgd3_1810",
-    "cgd3_260",
-    "cgd3_2900",
-    "cgd3_3030",
-    "cgd3_3040",
-    "cgd3_3180",
-    "cgd3_3230",
-    "cgd3_40",
-    "cgd3_4310",
-    "cgd3_920",
-    "cgd4_1610",
-    "cgd4_240",
-    "cgd4_3330",
-    "cgd4_3710",
-    "cgd4_990",
-    "cgd5_2000",
-    "cgd5_2270",
-    "cgd5_2400",
-    "cgd5_250",
-    "cgd5_2510",
-    "cgd5_3180",
-    "cgd5_4390",
-    "cgd5_820",
-    "cgd6_1420",
-    "cgd6_3400",
-    "cgd6_4960",
-    "cgd6_5060",
-    "cgd6_520",
-    "cgd6_5240",
-    "cgd6_540",
-    "cgd6_620",
-    "cgd6_650",
-    "cgd6_970",
-    "cgd7_1190",
-    "cgd7_1260",
-    "cgd7_1320",
-    "cgd7_1330",
-    "cgd7_1840",
-    "cgd7_2000",
-    "cgd7_280",
-    "cgd7_3050",
-    "cgd7_3080",
-    "cgd7_3430",
-    "cgd7_3760",
-    "cgd7_3890",
-    "cgd7_40",
-    "cgd7_430",
-    "cgd7_440",
-    "cgd7_4850",
-    "cgd7_5050",
-    "cgd7_583",
-    "cgd8_1230",
-    "cgd8_1660",
-    "cgd8_2180",
-    "cgd8_2430",
-    "cgd8_2440",
-    "cgd8_3070",
-    "cgd8_3250",
-    "cgd8_4700",
-    "cgd8_5120",
-    "cgd8_5180",
-    "cgd8_5323",
-    "cgd8_750",
-]
-
-# Proteases (GO:0008233 - peptidase activity) -- 82 genes
-CRYPTO_PROTEASES = [
-    "cgd1_1100",
-    "cgd1_1170",
-    "cgd1_220",
-    "cgd1_2240",
-    "cgd1_2490",
-    "cgd1_2700",
-    "cgd1_290",
-    "cgd1_3360",
-    "cgd1_340",
-    "cgd1_3690",
-    "cgd1_370",
-    "cgd1_420",
-    "cgd1_440",
-    "cgd1_740",
-    "cgd2_2480",
-    "cgd2_3320",
-    "cgd2_3450",
-    "cgd2_3560",
-    "cgd2_3660",
-    "cgd2_530",
-    "cgd2_710",
-    "cgd2_860",
-    "cgd2_930",
-    "cgd3_2170",
-    "cgd3_2190",
-    "cgd3_2200",
-    "cgd3_2390",
-    "cgd3_2530",
-    "cgd3_2920",
-    "cgd3_3240",
-    "cgd3_3610",
-    "cgd3_3680",
-    "cgd3_4260",
-    "cgd3_4270",
-    "cgd3_680",
-    "cgd3_770",
-    "cgd3_980",
-    "cgd4_2110",
-    "cgd4_2190",
-    "cgd4_250",
-    "cgd4_2910",
-    "cgd4_620",
-    "cgd5_1820",
-    "cgd5_1950",
-    "cgd5_2350",
-    "cgd5_2500",
-    "cgd5_2600",
-    "cgd5_2810",
-    "cgd5_3220",
-    "cgd5_4210",
-    "cgd5_4370",
-    "cgd5_460",
-    "cgd6_2750",
-    "cgd6_3270",
-    "cgd6_3730",
-    "cgd6_3820",
-    "cgd6_4550",
-    "cgd6_4840",
-    "cgd6_4880",
-    "cgd6_4990",
-    "cgd6_5510",
-    "cgd6_660",
-    "cgd6_70",
-    "cgd6_760",
-    "cgd6_840",
-    "cgd6_900",
-    "cgd6_920",
-    "cgd7_1080",
-    "cgd7_1930",
-    "cgd7_2080",
-    "cgd7_2760",
-    "cgd7_2850",
-    "cgd7_2900",
-    "cgd7_3020",
-    "cgd7_4560",
-    "cgd7_4900",
-    "cgd8_1320",
-    "cgd8_1530",
-    "cgd8_2720",
-    "cgd8_3200",
-    "cgd8_3430",
-    "cgd8_4340",
-]
-
-# Transporters (GO:0005215 - transporter activity) -- 84 genes
-CRYPTO_TRANSPORTERS = [
-    "Cgd7_260",
-    "cgd1_1350",
-    "cgd1_2190",
-    "cgd1_2550",
-    "cgd1_2560",
-    "cgd1_3050",
-    "cgd1_520",
-    "cgd1_540",
-    "cgd1_700",
-    "cgd2_1360",
-    "cgd2_1450",
-    "cgd2_2400",
-    "cgd2_250",
-    "cgd2_2660",
-    "cgd2_2670",
-    "cgd2_310",
-    "cgd2_3870",
-    "cgd2_3960",
-    "cgd2_590",
-    "cgd2_60",
-    "cgd2_630",
-    "cgd2_70",
-    "cgd2_80",
-    "cgd2_800",
-    "cgd2_90",
-    "cgd3_2080",
-    "cgd3_2730",
-    "cgd3_3100",
-    "cgd3_4070",
-    "cgd3_410",
-    "cgd3_490",
-    "cgd3_500",
-    "cgd3_550",
-    "cgd3_690",
-    "cgd4_1390",
-    "cgd4_1470",
-    "cgd4_2870",
-    "cgd4_3110",
-    "cgd4_3723",
-    "cgd4_380",
-    "cgd4_4050",
-    "cgd4_4440",
-    "cgd4_540",
-    "cgd5_1020",
-    "cgd5_2150",
-    "cgd5_3340",
-    "cgd5_3550",
-    "cgd5_3580",
-    "cgd5_3590",
-    "cgd5_530",
-    "cgd5_850",
-    "cgd6_130",
-    "cgd6_140",
-    "cgd6_1490",
-    "cgd6_2140",
-    "cgd6_2520",
-    "cgd6_320",
-    "cgd6_3880",
-    "cgd6_470",
-    "cgd6_4700",
-    "cgd6_4890",
-    "cgd6_490",
-    "cgd6_5450",
-    "cgd6_610",
-    "cgd7_1380",
-    "cgd7_1390",
-    "cgd7_1760",
-    "cgd7_2510",
-    "cgd7_2730",
-    "cgd7_3450",
-    "cgd7_4210",
-    "cgd7_4290",
-    "cgd7_4510",
-    "cgd7_4520",
-    "cgd7_5000",
-    "cgd7_90",
-    "cgd8_1210",
-    "cgd8_1370",
-    "cgd8_1440",
-    "cgd8_1600",
-    "cgd8_360",
-    "cgd8_3910",
-    "cgd8_4790",
-    "cgd8_5270",
-]
-
-# Ribosomal proteins (GO:0003735 - structural constituent of ribosome) -- 70 genes
-CRYPTO_RIBOSOMAL = [
-    "Cgd2_2990",
-    "cgd1_1660",
-    "cgd1_2270",
-    "cgd1_300",
-    "cgd1_3000",
-    "cgd1_850",
-    "cgd2_120",
-    "cgd2_130",
-    "cgd2_170",
-    "cgd2_2200",
-    "cgd2_280",
-    "cgd2_2870",
-    "cgd2_3000",
-    "cgd2_350",
-    "cgd2_4260",
-    "cgd3_1250",
-    "cgd3_1300",
-    "cgd3_2090",
-    "cgd3_2250",
-    "cgd3_2440",
-    "cgd3_3790",
-    "cgd3_3930",
-    "cgd3_830",
-    "cgd4_1230",
-    "cgd4_2400",
-    "cgd4_3080",
-    "cgd4_3160",
-    "cgd4_4020",
-    "cgd4_470",
-    "cgd5_1580",
-    "cgd5_2210",
-    "cgd5_2370",
-    "cgd5_3040",
-    "cgd5_3720",
-    "cgd5_3740",
-    "cgd5_970",
-    "cgd6_1390",
-    "cgd6_2170",
-    "cgd6_2460",
-    "cgd6_3180",
-    "cgd6_3190",
-    "cgd6_3340",
-    "cgd6_3710",
-    "cgd6_4190",
-    "cgd6_4320",
-    "cgd6_4620",
-    "cgd6_4630",
-    "cgd6_570",
-    "cgd7_130",
-    "cgd7_1460",
-    "cgd7_1873",
-    "cgd7_2110",
-    "cgd7_2250",
-    "cgd7_2280",
-    "cgd7_2420",
-    "cgd7_2540",
-    "cgd7_320",
-    "cgd7_4050",
-    "cgd7_4460",
-    "cgd7_4760",
-    "cgd7_5060",
-    "cgd8_1840",
-    "cgd8_2870",
-    "cgd8_3450",
-    "cgd8_3480",
-    "cgd8_400",
-    "cgd8_4050",
-    "cgd8_4360",
-    "cgd8_440",
-    "cgd8_650",
-]
-
-# Signal peptide genes (GenesWithSignalPeptide) -- 100 representative genes
-CRYPTO_SIGNAL_PEPTIDE = [
-    "Cgd5_40",
-    "Cgd7_2213",
-    "cgd1_110",
-    "cgd1_1160",
-    "cgd1_120",
-    "cgd1_1230",
-    "cgd1_1260",
-    "cgd1_130",
-    "cgd1_140",
-    "cgd1_1433",
-    "cgd1_1450",
-    "cgd1_150",
-    "cgd1_1510",
-    "cgd1_1680",
-    "cgd1_1730",
-    "cgd1_1870",
-    "cgd1_2020",
-    "cgd1_2030",
-    "cgd1_2240",
-    "cgd1_2390",
-    "cgd1_2400",
-    "cgd1_2440",
-    "cgd1_260",
-    "cgd1_2870",
-    "cgd1_3250",
-    "cgd1_3500",
-    "cgd1_3510",
-    "cgd1_3640",
-    "cgd1_3650",
-    "cgd1_3740",
-    "cgd1_3780",
-    "cgd1_3830",
-    "cgd1_3850",
-    "cgd1_400",
-    "cgd1_430",
-    "cgd1_590",
-    "cgd1_640",
-    "cgd1_650",
-    "cgd1_660",
-    "cgd1_670",
-    "cgd1_730",
-    "cgd1_800",
-    "cgd1_870",
-    "cgd1_950",
-    "cgd1_990",
-    "cgd2_1650",
-    "cgd2_1780",
-    "cgd2_1840",
-    "cgd2_2100",
-    "cgd2_2160",
-    "cgd2_2450",
-    "cgd2_2510",
-    "cgd2_2523",
-    "cgd2_2530",
-    "cgd2_2550",
-    "cgd2_2560",
-    "cgd2_2570",
-    "cgd2_2850",
-    "cgd2_30",
-    "cgd2_3030",
-    "cgd2_3060",
-    "cgd2_3090",
-    "cgd2_3110",
-    "cgd2_3230",
-    "cgd2_3270",
-    "cgd2_3290",
-    "cgd2_3320",
-    "cgd2_3330",
-    "cgd2_3360",
-    "cgd2_340",
-    "cgd2_3520",
-    "cgd2_3660",
-    "cgd2_3730",
-    "cgd2_3740",
-    "cgd2_3780",
-    "cgd2_3790",
-    "cgd2_390",
-    "cgd2_3913",
-    "cgd2_3990",
-    "cgd2_410",
-    "cgd2_420",
-    "cgd2_430",
-    "cgd2_4320",
-    "cgd2_450",
-    "cgd2_490",
-    "cgd2_640",
-    "cgd2_850",
-    "cgd2_940",
-    "cgd3_10",
-    "cgd3_1140",
-    "cgd3_1170",
-    "cgd3_1330",
-    "cgd3_1540",
-    "cgd3_1690",
-    "cgd3_1700",
-    "cgd3_1710",
-    "cgd3_1730",
-    "cgd3_1750",
-    "cgd3_1760",
-    "cgd3_1770",
-]
-
-# Transmembrane domain genes (1+ TM) -- 100 representative genes
-CRYPTO_TRANSMEMBRANE = [
-    "Cgd2_140",
-    "Cgd5_1900",
-    "Cgd5_40",
-    "Cgd6_280",
-    "Cgd7_260",
-    "cgd1_10",
-    "cgd1_1050",
-    "cgd1_110",
-    "cgd1_1100",
-    "cgd1_1110",
-    "cgd1_1250",
-    "cgd1_1290",
-    "cgd1_1350",
-    "cgd1_1380",
-    "cgd1_1450",
-    "cgd1_1470",
-    "cgd1_1480",
-    "cgd1_150",
-    "cgd1_1520",
-    "cgd1_160",
-    "cgd1_1750",
-    "cgd1_1760",
-    "cgd1_1770",
-    "cgd1_1790",
-    "cgd1_1820",
-    "cgd1_1830",
-    "cgd1_1870",
-    "cgd1_1890",
-    "cgd1_1970",
-    "cgd1_20",
-    "cgd1_2020",
-    "cgd1_2030",
-    "cgd1_2080",
-    "cgd1_210",
-    "cgd1_2100",
-    "cgd1_2190",
-    "cgd1_220",
-    "cgd1_230",
-    "cgd1_2300",
-    "cgd1_2370",
-    "cgd1_2390",
-    "cgd1_2450",
-    "cgd1_2510",
-    "cgd1_2550",
-    "cgd1_2610",
-    "cgd1_2620",
-    "cgd1_2780",
-    "cgd1_280",
-    "cgd1_2830",
-    "cgd1_2920",
-    "cgd1_2970",
-    "cgd1_2990",
-    "cgd1_30",
-    "cgd1_3010",
-    "cgd1_3050",
-    "cgd1_3200",
-    "cgd1_3250",
-    "cgd1_3290",
-    "cgd1_3380",
-    "cgd1_3410",
-    "cgd1_3430",
-    "cgd1_3490",
-    "cgd1_3500",
-    "cgd1_3510",
-    "cgd1_3580",
-    "cgd1_3583",
-    "cgd1_3590",
-    "cgd1_3610",
-    "cgd1_3680",
-    "cgd1_3690",
-    "cgd1_370",
-    "cgd1_3720",
-    "cgd1_3740",
-    "cgd1_3770",
-    "cgd1_3790",
-    "cgd1_380",
-    "cgd1_3810",
-    "cgd1_3820",
-    "cgd1_3850",
-    "cgd1_3860",
-    "cgd1_40",
-    "cgd1_430",
-    "cgd1_440",
-    "cgd1_470",
-    "cgd1_520",
-    "cgd1_540",
-    "cgd1_550",
-    "cgd1_570",
-    "cgd1_620",
-    "cgd1_700",
-    "cgd1_780",
-    "cgd1_80",
-    "cgd1_820",
-    "cgd1_890",
-    "cgd1_900",
-    "cgd1_940",
-    "cgd1_950",
-    "cgd1_990",
-    "cgd2_1030",
-    "cgd2_1050",
-]
-
-# Thrombospondin/TRAP family (invasion) -- 9 genes
-CRYPTO_TRAP_TSP = [
-    "cgd1_3500",
-    "cgd8_150",
-    "cgd8_540",
-    "cgd6_1300",
-    "cgd6_1660",
-    "cgd1_3510",
-    "cgd5_4470",
-    "cgd6_780",
-    "cgd6_800",
-]
-
-# Oocyst wall proteins -- 6 genes
-CRYPTO_OOCYST_WALL = [
-    "cgd4_3090",
-    "cgd4_500",
-    "cgd4_670",
-    "cgd6_200",
-    "cgd6_210",
-    "cgd8_3350",
-]
-
-# Mucins and surface glycoproteins -- key genes
-CRYPTO_SURFACE_GLYCOPROTEINS = [
-    "cgd3_720",
-    "cgd7_4020",  # mucins
-    "cgd6_1080",  # GP40
-    "cgd7_4330",  # glycoprotein putative
-    "cgd4_3620",  # immunodominant antigen
-    "cgd1_3220",  # erythrocyte membrane-associated antigen
-]
-
-# Heat shock proteins
-CRYPTO_HEAT_SHOCK = [
-    "cgd2_20",
-    "cgd3_3440",
-    "cgd7_360",
-    "cgd7_3670",
-    "cgd7_3770",
-]
-
-# MEDLE family secretory proteins (exported into host cell)
-CRYPTO_MEDLE = [
-    "cgd5_4580",
-    "cgd5_4590",
-    "cgd5_4600",
-    "cgd5_4610",
-    "cgd6_5480",
-    "cgd6_5490",
-]
-
-# Insulinase-like proteases (subtelomeric, expanded in Cryptosporidium)
-CRYPTO_INSULINASES = [
-    "cgd1_1680",
-    "cgd2_2760",
-    "cgd2_920",
-    "cgd2_930",
-    "cgd3_4260",
-    "cgd3_4270",
-    "cgd4_4240",
-    "cgd8_2720",
-    "cgd2_4270",
-    "cgd3_4170",
-    "cgd3_4180",
-    "cgd3_4240",
-    "cgd3_4280",
-    "cgd5_3400",
-    "cgd1_3840",
-    "cgd7_2080",
-    "cgd3_4190",
-    "cgd3_4200",
-    "cgd3_4210",
-    "cgd3_4220",
-]
-
-# Secreted proteins (diverse) -- 50 representative
-CRYPTO_SECRETED = [
-    "cgd5_2020",
-    "cgd7_4310",
-    "Cgd5_40",
-    "cgd1_2400",
-    "cgd5_10",
-    "cgd5_1480",
-    "cgd5_1490",
-    "cgd5_20",
-    "cgd5_2720",
-    "cgd5_340",
-    "cgd5_50",
-    "cgd6_1100",
-    "cgd6_1110",
-    "cgd6_1180",
-    "cgd6_5400",
-    "cgd6_5410",
-    "cgd6_710",
-    "cgd6_820",
-    "cgd7_4340",
-    "cgd7_4500",
-    "cgd7_5510",
-    "cgd8_1160",
-    "cgd8_1750",
-    "cgd8_1770",
-    "cgd8_3520",
-    "cgd8_3610",
-    "cgd8_3670",
-    "cgd8_3750",
-    "cgd8_5290",
-    "cgd8_5300",
-    "cgd8_5310",
-    "cgd8_5340",
-    "cgd8_700",
-    "cgd2_4270",
-    "cgd3_4170",
-    "cgd3_4280",
-    "cgd5_3960",
-    "cgd6_4880",
-    "cgd2_2610",
-    "cgd4_3550",
-    "cgd5_3570",
-    "cgd6_660",
-    "cgd7_5500",
-    "cgd8_1420",
-    "cgd8_1740",
-    "cgd1_1250",
-    "cgd1_1290",
-    "cgd1_140",
-    "cgd1_150",
-    "cgd1_160",
-]
-
-# Ubiquitin system -- 50 genes
-CRYPTO_UBIQUITIN = [
-    "cgd5_2550",
-    "cgd1_290",
-    "cgd2_240",
-    "cgd2_4110",
-    "cgd3_1180",
-    "cgd3_2220",
-    "cgd4_570",
-    "cgd6_2490",
-    "cgd7_4550",
-    "cgd1_1170",
-    "cgd1_2790",
-    "cgd1_410",
-    "cgd1_860",
-    "cgd2_3450",
-    "cgd3_1350",
-    "cgd3_2670",
-    "cgd4_210",
-    "cgd4_2300",
-    "cgd6_3270",
-    "cgd6_4180",
-    "cgd7_1080",
-    "cgd7_2800",
-    "cgd7_3310",
-    "cgd7_4900",
-    "cgd8_160",
-    "cgd8_1730",
-    "cgd8_220",
-    "cgd8_3850",
-    "cgd8_580",
-    "cgd2_1200",
-    "cgd2_3150",
-    "cgd3_3990",
-    "cgd4_1200",
-    "cgd7_1770",
-    "cgd7_3873",
-    "cgd7_3990",
-    "cgd8_1760",
-    "cgd3_2410",
-    "cgd4_40",
-    "cgd5_2120",
-    "cgd5_2350",
-    "cgd5_2500",
-    "cgd6_3690",
-    "cgd8_3200",
-    "cgd8_3630",
-    "cgd5_480",
-    "Cgd8_1200",
-    "cgd3_1173",
-    "cgd7_4410",
-    "cgd3_2190",
-]
-
-# Translation machinery (GO:0006412) -- 80 genes
-CRYPTO_TRANSLATION = [
-    "Cgd2_2990",
-    "cgd1_1660",
-    "cgd1_2130",
-    "cgd1_2270",
-    "cgd1_300",
-    "cgd1_3000",
-    "cgd1_3480",
-    "cgd1_850",
-    "cgd2_1160",
-    "cgd2_120",
-    "cgd2_130",
-    "cgd2_170",
-    "cgd2_2200",
-    "cgd2_270",
-    "cgd2_280",
-    "cgd2_2870",
-    "cgd2_3000",
-    "cgd2_350",
-    "cgd2_360",
-    "cgd2_3950",
-    "cgd2_4260",
-    "cgd2_820",
-    "cgd3_1250",
-    "cgd3_1300",
-    "cgd3_2090",
-    "cgd3_2250",
-    "cgd3_2440",
-    "cgd3_3320",
-    "cgd3_3790",
-    "cgd3_3840",
-    "cgd3_3880",
-    "cgd3_3930",
-    "cgd3_830",
-    "cgd4_1030",
-    "cgd4_1230",
-    "cgd4_2370",
-    "cgd4_2400",
-    "cgd4_3080",
-    "cgd4_3160",
-    "cgd4_3770",
-    "cgd4_4020",
-    "cgd4_470",
-    "cgd4_70",
-    "cgd5_1580",
-    "cgd5_2210",
-    "cgd5_2370",
-    "cgd5_3040",
-    "cgd5_3720",
-    "cgd5_3740",
-    "cgd5_4400",
-    "cgd5_610",
-    "cgd5_880",
-    "cgd5_970",
-    "cgd6_1020",
-    "cgd6_1390",
-    "cgd6_2170",
-    "cgd6_2460",
-    "cgd6_2970",
-    "cgd6_3180",
-    "cgd6_3190",
-    "cgd6_3340",
-    "cgd6_3380",
-    "cgd6_3710",
-    "cgd6_3990",
-    "cgd6_4190",
-    "cgd6_4320",
-    "cgd6_4400",
-    "cgd6_4620",
-    "cgd6_4630",
-    "cgd6_560",
-    "cgd6_570",
-    "cgd6_960",
-    "cgd7_1080",
-    "cgd7_130",
-    "cgd7_1460",
-    "cgd7_1490",
-    "cgd7_1540",
-    "cgd7_1710",
-    "cgd7_1873",
-    "cgd7_2110",
-]
-
-# DNA binding (GO:0003677) -- 80 genes
-CRYPTO_DNA_BINDING = [
-    "Cgd3_2720",
-    "cgd1_1560",
-    "cgd1_1700",
-    "cgd1_2770",
-    "cgd1_2870",
-    "cgd1_310",
-    "cgd1_3420",
-    "cgd1_3520",
-    "cgd1_3530",
-    "cgd1_840",
-    "cgd1_910",
-    "cgd2_1100",
-    "cgd2_1250",
-    "cgd2_1540",
-    "cgd2_1550",
-    "cgd2_1600",
-    "cgd2_2500",
-    "cgd2_3070",
-    "cgd2_3180",
-    "cgd2_3440",
-    "cgd2_3490",
-    "cgd2_40",
-    "cgd2_4070",
-    "cgd2_700",
-    "cgd2_730",
-    "cgd2_980",
-    "cgd3_1450",
-    "cgd3_2540",
-    "cgd3_2620",
-    "cgd3_2770",
-    "cgd3_3170",
-    "cgd3_3470",
-    "cgd3_3750",
-    "cgd3_3820",
-    "cgd3_4290",
-    "cgd4_110",
-    "cgd4_1110",
-    "cgd4_140",
-    "cgd4_1590",
-    "cgd4_2030",
-    "cgd4_2053",
-    "cgd4_2220",
-    "cgd4_2950",
-    "cgd4_2960",
-    "cgd4_3220",
-    "cgd4_3260",
-    "cgd4_440",
-    "cgd4_600",
-    "cgd4_630",
-    "cgd4_780",
-    "cgd4_970",
-    "cgd5_1180",
-    "cgd5_2560",
-    "cgd5_2930",
-    "cgd5_3010",
-    "cgd5_3170",
-    "cgd5_410",
-    "cgd5_730",
-    "cgd5_940",
-    "cgd5_990",
-    "cgd6_1430",
-    "cgd6_1530",
-    "cgd6_1710",
-    "cgd6_1940",
-    "cgd6_2390",
-    "cgd6_240",
-    "cgd6_2610",
-    "cgd6_2660",
-    "cgd6_3290",
-    "cgd6_4410",
-    "cgd6_4510",
-    "cgd6_5320",
-    "cgd7_1050",
-    "cgd7_1690",
-    "cgd7_1700",
-    "cgd7_1720",
-    "cgd7_1790",
-    "cgd7_2140",
-    "cgd7_2920",
-    "cgd7_3240",
-]
-
-# Oxidoreductases (EC 1.*.*.*) -- 50 representative
-CRYPTO_OXIDOREDUCTASES = [
-    "cgd1_1350",
-    "cgd1_1670",
-    "cgd1_190",
-    "cgd1_2410",
-    "cgd1_2710",
-    "cgd1_280",
-    "cgd1_3440",
-    "cgd1_360",
-    "cgd1_40",
-    "cgd1_530",
-    "cgd1_700",
-    "cgd1_820",
-    "cgd1_980",
-    "cgd1_990",
-    "cgd2_1040",
-    "cgd2_160",
-    "cgd2_1600",
-    "cgd2_210",
-    "cgd2_2120",
-    "cgd2_2540",
-    "cgd2_2750",
-    "cgd2_2770",
-    "cgd2_3070",
-    "cgd2_3260",
-    "cgd2_3270",
-    "cgd2_3330",
-    "cgd2_3400",
-    "cgd2_3570",
-    "cgd2_4320",
-    "cgd2_70",
-    "cgd2_790",
-    "cgd2_90",
-    "cgd3_2180",
-    "cgd3_2370",
-    "cgd3_2530",
-    "cgd3_2690",
-    "cgd3_2880",
-    "cgd3_3120",
-    "cgd3_330",
-    "cgd3_3430",
-    "cgd3_3440",
-    "cgd3_3820",
-    "cgd3_3850",
-    "cgd3_3910",
-    "cgd3_4070",
-    "cgd3_410",
-    "cgd3_460",
-    "cgd3_990",
-    "cgd4_1070",
-    "cgd4_1330",
-]
-
-
-# ---------------------------------------------------------------------------
-# Parameter helpers
-# ---------------------------------------------------------------------------
-def _ec_wildcard(organism: str, ec_sources: list[str], wildcard: str) -> dict[str, str]:
-    """Build GenesByEcNumber with hardcoded ec_number="2.7.11.1".
-
-    Unique to CryptoDB: ec_number is always "2.7.11.1" while the ec_wildcard
-    parameter carries the actual EC class pattern (e.g. "1.*.*.*").
-    Cannot be replaced by the shared ec_search_params helper.
-    """
-    return ec_search_params(
-        organism, ec_number="2.7.11.1", ec_sources=ec_sources, ec_wildcard=wildcard
-    )
-
-
-# ---------------------------------------------------------------------------
-# Seeds
-# ---------------------------------------------------------------------------
-SEEDS: list[SeedDef] = [
-    # === Strategy 1: CpIowaII Surface Invasion Machinery (10 nodes) ===
-    SeedDef(
-        name="CpIowaII Surface Invasion Machinery",
-        description=(
-            "10-node strategy modeling the molecular toolkit C. parvum Iowa II "
-            "sporozoites use to invade intestinal epithelial cells. Combines "
-            "secreted proteins with enzymatic activity (kinases + proteases), "
-            "surface-anchored transmembrane proteins, thrombospondin-related "
-            "adhesive proteins (TRAP/TSP family), and mucin-like glycoproteins. "
-            "These are prime vaccine and drug targets for cryptosporidiosis."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "root_union",
-            "displayName": "Surface Invasion Machinery",
-            "operator": "UNION",
-            "primaryInput": {
-                "id": "secreted_surface",
-                "displayName": "Secreted + Surface-anchored Enzymes",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "secreted_w_activity",
-                    "displayName": "Secreted Proteins with Enzymatic Activity",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "leaf_signal_peptide",
-                        "displayName": "Signal Peptide (Secreted)",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(CP_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "enzyme_union",
-                        "displayName": "Kinases + Proteases",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_kinases",
-                            "displayName": "Protein Kinase Activity",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(CP_ORG, "GO:0004672"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_proteases",
-                            "displayName": "Peptidase Activity",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(CP_ORG, "GO:0008233"),
-                        },
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_tm_low",
-                    "displayName": "Surface-anchored (1-3 TM domains)",
-                    "searchName": "GenesByTransmembraneDomains",
-                    "parameters": transmembrane_params(CP_ORG, "1", "3"),
-                },
-            },
-            "secondaryInput": {
-                "id": "adhesins_surface",
-                "displayName": "Adhesins + Surface Glycoproteins",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "leaf_trap",
-                    "displayName": "Thrombospondin/TRAP Family",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(CP_ORG, "thrombospondin"),
-                },
-                "secondaryInput": {
-                    "id": "leaf_surface_glyco",
-                    "displayName": "Mucins + Glycoproteins + Surface Antigens",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(
-                        CP_ORG,
-                        "mucin OR glycoprotein OR surface antigen",
-                    ),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Surface Invasion Controls",
-            positive_ids=(
-                CRYPTO_TRAP_TSP[:6]
-                + CRYPTO_SURFACE_GLYCOPROTEINS[:4]
-                + CRYPTO_PROTEASES[:5]
-            ),
-            negative_ids=CRYPTO_RIBOSOMAL[:15],
-            provenance_notes=(
-                "Positive: TRAP/TSP family adhesins, surface glycoproteins, "
-                "and secreted proteases involved in invasion. "
-                "Negative: ribosomal proteins (GO:0003735, housekeeping). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=[
-                "invasion",
-                "TRAP",
-                "mucin",
-                "glycoprotein",
-                "surface-antigen",
-                "vaccine-target",
-                "sporozoite",
-            ],
-        ),
-    ),
-    # === Strategy 2: CpIowaII Drug Target Enzymes (8 nodes) ===
-    SeedDef(
-        name="CpIowaII Drug Target Enzymes",
-        description=(
-            "8-node strategy to find parasite-specific enzyme drug targets in "
-            "C. parvum Iowa II. Cryptosporidium has a remarkably reduced "
-            "metabolome (no functional mitochondria, uses a mitosome; lacks "
-            "the apicoplast found in other apicomplexans). This makes its "
-            "unique enzymes especially attractive as drug targets. Combines "
-            "oxidoreductases, transferases, hydrolases, and ligases, then "
-            "subtracts translation machinery to focus on metabolic enzymes "
-            "divergent from host."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "root_minus",
-            "displayName": "Parasite-specific Enzymes (Drug Targets)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "all_enzymes",
-                "displayName": "All EC-annotated Enzymes",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "oxido_transfer",
-                    "displayName": "Oxidoreductases + Transferases",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_oxidoreductases",
-                        "displayName": "Oxidoreductases (EC 1.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "1.*.*.*"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_transferases",
-                        "displayName": "Transferases (EC 2.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "2.*.*.*"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "hydro_ligase",
-                    "displayName": "Hydrolases + Ligases",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_hydrolases",
-                        "displayName": "Hydrolases (EC 3.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "3.*.*.*"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_ligases",
-                        "displayName": "Ligases (EC 6.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "6.*.*.*"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_translation",
-                "displayName": "Translation Machinery (housekeeping)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(CP_ORG, "GO:0006412"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Drug Target Enzyme Controls",
-            positive_ids=CRYPTO_OXIDOREDUCTASES[:10] + CRYPTO_PROTEASES[:5],
-            negative_ids=CRYPTO_RIBOSOMAL[:10] + CRYPTO_TRANSLATION[:5],
-            provenance_notes=(
-                "Positive: oxidoreductases and proteases with EC annotations "
-                "(parasite-specific metabolic enzymes). "
-                "Negative: ribosomal (GO:0003735) + translation (GO:0006412). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=[
-                "drug-target",
-                "enzyme",
-                "oxidoreductase",
-                "transferase",
-                "hydrolase",
-                "ligase",
-                "metabolic",
-                "mitosome",
-            ],
-        ),
-    ),
-    # === Strategy 3: CpIowaII Oocyst Development Program (7 nodes) ===
-    SeedDef(
-        name="CpIowaII Oocyst Development Program",
-        description=(
-            "7-node strategy probing the oocyst development program in "
-            "C. parvum Iowa II. Oocysts are the chlorine-resistant "
-            "environmental transmission stage -- understanding their wall "
-            "formation is critical for water treatment and public health. "
-            "Combines oocyst wall proteins (COWPs), cysteine-rich secreted "
-            "proteins, transcriptional regulators (DNA binding), and stress "
-            "response (heat shock proteins) that orchestrate oocyst maturation."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "root_union",
-            "displayName": "Oocyst Development Program",
-            "operator": "UNION",
-            "primaryInput": {
-                "id": "wall_cysteine",
-                "displayName": "Wall Proteins + Cysteine-rich Secreted",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "leaf_oocyst_wall",
-                    "displayName": "Oocyst Wall Proteins",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(CP_ORG, "oocyst wall"),
-                },
-                "secondaryInput": {
-                    "id": "cysteine_secreted",
-                    "displayName": "Cysteine-rich + Secreted",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "leaf_cysteine",
-                        "displayName": "COWP / Cysteine-rich Proteins",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(
-                            CP_ORG, "COWP OR cysteine-rich"
-                        ),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_signal_oocyst",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(CP_ORG),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "stage_regulators",
-                "displayName": "Stage-specific Regulators",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "leaf_dna_binding",
-                    "displayName": "DNA Binding / Transcription Factors",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(CP_ORG, "GO:0003677"),
-                },
-                "secondaryInput": {
-                    "id": "leaf_heat_shock",
-                    "displayName": "Heat Shock / Stress Response",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(CP_ORG, "heat shock"),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Oocyst Development Controls",
-            positive_ids=(
-                CRYPTO_OOCYST_WALL + CRYPTO_HEAT_SHOCK + CRYPTO_DNA_BINDING[:5]
-            ),
-            negative_ids=CRYPTO_TRANSPORTERS[:15],
-            provenance_notes=(
-                "Positive: oocyst wall proteins (COWPs), heat shock chaperones, "
-                "and DNA-binding transcriptional regulators. "
-                "Negative: transporters (GO:0005215, not involved in oocyst wall). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=[
-                "oocyst",
-                "COWP",
-                "cysteine-rich",
-                "wall-formation",
-                "heat-shock",
-                "transcription-factor",
-                "transmission",
-                "water-treatment",
-                "public-health",
-            ],
-        ),
-    ),
-    # === Strategy 4: CpIowaII Metabolic Enzyme Landscape (6 nodes) ===
-    SeedDef(
-        name="CpIowaII Metabolic Enzyme Landscape",
-        description=(
-            "6-node strategy mapping the metabolic enzyme landscape of "
-            "C. parvum Iowa II. This obligate intracellular parasite has a "
-            "drastically reduced metabolome -- it lacks a functional "
-            "mitochondrion (uses a mitosome for FeS cluster assembly) and "
-            "lacks the apicoplast organelle found in Plasmodium and Toxoplasma. "
-            "Intersects EC-annotated metabolic enzymes (transferases, hydrolases, "
-            "oxidoreductases) with transporter genes to identify nutrient salvage "
-            "pathways critical for parasite survival."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "root_intersect",
-            "displayName": "Metabolic Enzymes with Transport Function",
-            "operator": "INTERSECT",
-            "primaryInput": {
-                "id": "all_metabolic",
-                "displayName": "All Metabolic Enzymes",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "transfer_hydro",
-                    "displayName": "Transferases + Hydrolases",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_transferases",
-                        "displayName": "Transferases (EC 2.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "2.*.*.*"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_hydrolases",
-                        "displayName": "Hydrolases (EC 3.*)",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "3.*.*.*"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_oxidoreductases",
-                    "displayName": "Oxidoreductases (EC 1.*)",
-                    "searchName": "GenesByEcNumber",
-                    "parameters": _ec_wildcard(CP_ORG, CP_EC_SOURCES, "1.*.*.*"),
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_transporters",
-                "displayName": "Transporter Activity",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(CP_ORG, "GO:0005215"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Metabolic Enzyme Controls",
-            positive_ids=CRYPTO_TRANSPORTERS[:10] + CRYPTO_OXIDOREDUCTASES[:5],
-            negative_ids=CRYPTO_RIBOSOMAL[:15],
-            provenance_notes=(
-                "Positive: transporters with EC annotations (nutrient salvage "
-                "enzymes), oxidoreductases (metabolic). "
-                "Negative: ribosomal proteins (GO:0003735, housekeeping). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=[
-                "metabolic",
-                "nutrient-salvage",
-                "transporter",
-                "oxidoreductase",
-                "mitosome",
-                "reduced-metabolism",
-            ],
-        ),
-    ),
-    # === Strategy 5: CpIowaII Secreted Effector Repertoire (5 nodes) ===
-    SeedDef(
-        name="CpIowaII Secreted Effector Repertoire",
-        description=(
-            "5-node strategy identifying the secreted effector repertoire of "
-            "C. parvum Iowa II. Cryptosporidium exports proteins into the host "
-            "cell cytoplasm to subvert host defenses and manipulate cell signaling. "
-            "Key families include MEDLE proteins, insulinase-like proteases "
-            "(expanded in subtelomeric regions), secreted GGC proteins, and "
-            "cysteine proteases (cryptopains). Filters for signal peptide plus "
-            "effector annotations, then removes ribosomal housekeeping genes."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "root_minus",
-            "displayName": "Secreted Effectors (non-housekeeping)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "secreted_effectors",
-                "displayName": "Secreted Effector Candidates",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "leaf_signal",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(CP_ORG),
-                },
-                "secondaryInput": {
-                    "id": "effector_families",
-                    "displayName": "Effector Families + Proteases",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_effector_text",
-                        "displayName": "MEDLE / Insulinase / Secreted families",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(
-                            CP_ORG,
-                            "secreted OR MEDLE OR insulinase",
-                        ),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_peptidase",
-                        "displayName": "Peptidase Activity",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(CP_ORG, "GO:0008233"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_ribosomal",
-                "displayName": "Ribosomal Proteins (housekeeping)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(CP_ORG, "GO:0003735"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Secreted Effector Controls",
-            positive_ids=(CRYPTO_MEDLE + CRYPTO_INSULINASES[:6] + CRYPTO_SECRETED[:3]),
-            negative_ids=CRYPTO_RIBOSOMAL[:15],
-            provenance_notes=(
-                "Positive: MEDLE family effectors, insulinase-like proteases, "
-                "and diverse secreted proteins. "
-                "Negative: ribosomal proteins (GO:0003735, housekeeping). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=[
-                "effector",
-                "MEDLE",
-                "insulinase",
-                "secreted",
-                "host-manipulation",
-                "cryptopain",
-                "signal-peptide",
-            ],
-        ),
-    ),
-    # === Strategy 6: CpIowaII Baseline Kinases (1 node) ===
-    SeedDef(
-        name="CpIowaII Baseline Kinases",
-        description=(
-            "Simple 1-node baseline strategy: all protein kinase activity "
-            "(GO:0004672) genes in C. parvum Iowa II. Serves as a reference "
-            "for comparison with more complex multi-step strategies. "
-            "Includes calcium-dependent protein kinases (CDPKs), "
-            "cyclin-dependent kinases, MAP kinases, and other Ser/Thr kinases."
-        ),
-        site_id="cryptodb",
-        step_tree={
-            "id": "leaf_kinases_baseline",
-            "displayName": "All Kinases (GO:0004672)",
-            "searchName": "GenesByGoTerm",
-            "parameters": go_search_params(CP_ORG, "GO:0004672"),
-        },
-        control_set=ControlSetDef(
-            name="Baseline Kinase Controls",
-            positive_ids=CRYPTO_KINASES[:20],
-            negative_ids=CRYPTO_RIBOSOMAL[:20],
-            provenance_notes=(
-                "Positive: protein kinases (GO:0004672, CDPKs and others). "
-                "Negative: ribosomal proteins (GO:0003735, housekeeping). "
-                "All gene IDs verified against live CryptoDB API March 2026."
-            ),
-            tags=["kinase", "CDPK", "baseline", "cryptosporidium"],
-        ),
-    ),
-]
@@ -1,1880 +0,0 @@
-"""Seed definitions for PlasmoDB."""
-
-from veupath_chatbot.services.experiment.seed.helpers import (
-    ec_search_params,
-    go_search_params,
-    org,
-    signal_peptide_params,
-    text_search_params,
-    transmembrane_params,
-)
-from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
-
-# ---------------------------------------------------------------------------
-# Organism constants
-# ---------------------------------------------------------------------------
-PF_ORG = "Plasmodium falciparum 3D7"
-
-PF_EC_SOURCES: list[str] = [
-    "GeneDB",
-    "MPMP",
-    "KEGG_Enzyme",
-    "GenBank",
-    "computationally inferred from Orthology",
-    "Uniprot",
-    "Sanger",
-]
-
-PF_GO_EVIDENCE: list[str] = ["Curated", "Computed"]
-
-
-# ---------------------------------------------------------------------------
-# Gene ID lists
-# ---------------------------------------------------------------------------
-
-# Protein kinases - GO:0004672 (protein kinase activity)
-# 106 genes from GenesByGoTerm search
-PF_KINASES: list[str] = [
-    "PF3D7_0102600",
-    "PF3D7_0107600",
-    "PF3D7_0203100",
-    "PF3D7_0211700",
-    "PF3D7_0213400",
-    "PF3D7_0214600",
-    "PF3D7_0217500",
-    "PF3D7_0301200",
-    "PF3D7_0302100",
-    "PF3D7_0309200",
-    "PF3D7_0310100",
-    "PF3D7_0311400",
-    "PF3D7_0312400",
-    "PF3D7_0317200",
-    "PF3D7_0321400",
-    "PF3D7_0415300",
-    "PF3D7_0417800",
-    "PF3D7_0420100",
-    "PF3D7_0424500",
-    "PF3D7_0424700",
-    "PF3D7_0500900",
-    "PF3D7_0503500",
-    "PF3D7_0525900",
-    "PF3D7_0605300",
-    "PF3D7_0610600",
-    "PF3D7_0615500",
-    "PF3D7_0623800",
-    "PF3D7_0628200",
-    "PF3D7_0704500",
-    "PF3D7_0708300",
-    "PF3D7_0715300",
-    "PF3D7_0717500",
-    "PF3D7_0718100",
-    "PF3D7_0719200",
-    "PF3D7_0724000",
-    "PF3D7_0724600",
-    "PF3D7_0726200",
-    "PF3D7_0805700",
-    "PF3D7_0821100",
-    "PF3D7_0823000",
-    "PF3D7_0902000",
-    "PF3D7_0902100",
-    "PF3D7_0902200",
-    "PF3D7_0902300",
-    "PF3D7_0902400",
-    "PF3D7_0902500",
-    "PF3D7_0902600",
-    "PF3D7_0926000",
-    "PF3D7_0926100",
-    "PF3D7_0926300",
-    "PF3D7_0928800",
-    "PF3D7_0934800",
-    "PF3D7_1014400",
-    "PF3D7_1016400",
-    "PF3D7_1039000",
-    "PF3D7_1103700",
-    "PF3D7_1104900",
-    "PF3D7_1106800",
-    "PF3D7_1108400",
-    "PF3D7_1112100",
-    "PF3D7_1113900",
-    "PF3D7_1114700",
-    "PF3D7_1121300",
-    "PF3D7_1121900",
-    "PF3D7_1122800",
-    "PF3D7_1123100",
-    "PF3D7_1136500",
-    "PF3D7_1145200",
-    "PF3D7_1148000",
-    "PF3D7_1149300",
-    "PF3D7_1200800",
-    "PF3D7_1201600",
-    "PF3D7_1223100",
-    "PF3D7_1228300",
-    "PF3D7_1230900",
-    "PF3D7_1238900",
-    "PF3D7_1241200",
-    "PF3D7_1246900",
-    "PF3D7_1247500",
-    "PF3D7_1305500",
-    "PF3D7_1315100",
-    "PF3D7_1316000",
-    "PF3D7_1321100",
-    "PF3D7_1331000",
-    "PF3D7_1337100",
-    "PF3D7_1337800",
-    "PF3D7_1338900",
-    "PF3D7_1349300",
-    "PF3D7_1352600",
-    "PF3D7_1356800",
-    "PF3D7_1356900",
-    "PF3D7_1371700",
-    "PF3D7_1423600",
-    "PF3D7_1428500",
-    "PF3D7_1431500",
-    "PF3D7_1433900",
-    "PF3D7_1436600",
-    "PF3D7_1441300",
-    "PF3D7_1443000",
-    "PF3D7_1444500",
-    "PF3D7_1445400",
-    "PF3D7_1450000",
-    "PF3D7_1454300",
-    "PF3D7_1463700",
-    "PF3D7_1474700",
-]
-
-# Proteases / peptidases - GO:0008233 (peptidase activity)
-# 146 genes (deduplicated) from GenesByGoTerm search
-PF_PROTEASES: list[str] = [
-    "PF3D7_0104300",
-    "PF3D7_0108000",
-    "PF3D7_0207300",
-    "PF3D7_0207400",
-    "PF3D7_0207500",
-    "PF3D7_0207600",
-    "PF3D7_0207700",
-    "PF3D7_0207800",
-    "PF3D7_0207900",
-    "PF3D7_0208000",
-    "PF3D7_0307400",
-    "PF3D7_0311700",
-    "PF3D7_0317000",
-    "PF3D7_0320700",
-    "PF3D7_0321500",
-    "PF3D7_0403500",
-    "PF3D7_0404700",
-    "PF3D7_0413600",
-    "PF3D7_0413900",
-    "PF3D7_0420200",
-    "PF3D7_0506900",
-    "PF3D7_0507200",
-    "PF3D7_0507500",
-    "PF3D7_0515100",
-    "PF3D7_0516700",
-    "PF3D7_0518300",
-    "PF3D7_0523100",
-    "PF3D7_0527200",
-    "PF3D7_0527300",
-    "PF3D7_0608500",
-    "PF3D7_0618600",
-    "PF3D7_0627500",
-    "PF3D7_0628400",
-    "PF3D7_0630600",
-    "PF3D7_0722300",
-    "PF3D7_0726500",
-    "PF3D7_0727400",
-    "PF3D7_0801700",
-    "PF3D7_0803500",
-    "PF3D7_0803800",
-    "PF3D7_0804400",
-    "PF3D7_0807500",
-    "PF3D7_0807700",
-    "PF3D7_0808200",
-    "PF3D7_0809600",
-    "PF3D7_0812200",
-    "PF3D7_0828000",
-    "PF3D7_0902800",
-    "PF3D7_0904400",
-    "PF3D7_0904600",
-    "PF3D7_0907400",
-    "PF3D7_0912900",
-    "PF3D7_0913500",
-    "PF3D7_0918300",
-    "PF3D7_0919200",
-    "PF3D7_0923100",
-    "PF3D7_0931800",
-    "PF3D7_0932300",
-    "PF3D7_0933600",
-    "PF3D7_1005700",
-    "PF3D7_1006900",
-    "PF3D7_1008400",
-    "PF3D7_1009500",
-    "PF3D7_1011400",
-    "PF3D7_1015300",
-    "PF3D7_1017900",
-    "PF3D7_1030500",
-    "PF3D7_1031400",
-    "PF3D7_1033800",
-    "PF3D7_1111900",
-    "PF3D7_1114100",
-    "PF3D7_1115300",
-    "PF3D7_1115400",
-    "PF3D7_1115700",
-    "PF3D7_1116700",
-    "PF3D7_1117100",
-    "PF3D7_1118300",
-    "PF3D7_1119600",
-    "PF3D7_1121800",
-    "PF3D7_1122100",
-    "PF3D7_1128700",
-    "PF3D7_1129200",
-    "PF3D7_1130400",
-    "PF3D7_1136900",
-    "PF3D7_1141700",
-    "PF3D7_1202100",
-    "PF3D7_1226800",
-    "PF3D7_1230400",
-    "PF3D7_1233900",
-    "PF3D7_1235800",
-    "PF3D7_1236300",
-    "PF3D7_1239700",
-    "PF3D7_1247800",
-    "PF3D7_1248900",
-    "PF3D7_1305600",
-    "PF3D7_1306400",
-    "PF3D7_1311500",
-    "PF3D7_1311800",
-    "PF3D7_1317000",
-    "PF3D7_1319100",
-    "PF3D7_1320100",
-    "PF3D7_1320400",
-    "PF3D7_1323500",
-    "PF3D7_1328100",
-    "PF3D7_1331300",
-    "PF3D7_1337000",
-    "PF3D7_1345200",
-    "PF3D7_1353800",
-    "PF3D7_1353900",
-    "PF3D7_1354800",
-    "PF3D7_1358300",
-    "PF3D7_1360800",
-    "PF3D7_1362400",
-    "PF3D7_1368100",
-    "PF3D7_1401300",
-    "PF3D7_1402300",
-    "PF3D7_1406600",
-    "PF3D7_1407800",
-    "PF3D7_1407900",
-    "PF3D7_1408000",
-    "PF3D7_1408100",
-    "PF3D7_1408700",
-    "PF3D7_1409300",
-    "PF3D7_1411200",
-    "PF3D7_1414700",
-    "PF3D7_1414900",
-    "PF3D7_1416200",
-    "PF3D7_1417300",
-    "PF3D7_1421600",
-    "PF3D7_1428300",
-    "PF3D7_1430200",
-    "PF3D7_1433600",
-    "PF3D7_1434600",
-    "PF3D7_1436800",
-    "PF3D7_1438400",
-    "PF3D7_1440200",
-    "PF3D7_1441700",
-    "PF3D7_1446200",
-    "PF3D7_1454400",
-    "PF3D7_1457000",
-    "PF3D7_1458000",
-    "PF3D7_1460400",
-    "PF3D7_1464900",
-    "PF3D7_1465700",
-    "PF3D7_1466300",
-    "PF3D7_1470900",
-    "PF3D7_1472400",
-    "PF3D7_1474800",
-]
-
-# Transporters - GO:0055085 (transmembrane transport)
-# 46 genes from GenesByGoTerm search
-PF_TRANSPORTERS: list[str] = [
-    "PF3D7_0112200",
-    "PF3D7_0204700",
-    "PF3D7_0206200",
-    "PF3D7_0210300",
-    "PF3D7_0212800",
-    "PF3D7_0302600",
-    "PF3D7_0312500",
-    "PF3D7_0316600",
-    "PF3D7_0319700",
-    "PF3D7_0407500",
-    "PF3D7_0516500",
-    "PF3D7_0523000",
-    "PF3D7_0603500",
-    "PF3D7_0609100",
-    "PF3D7_0614300",
-    "PF3D7_0617000",
-    "PF3D7_0715900",
-    "PF3D7_0721900",
-    "PF3D7_0810400",
-    "PF3D7_0908800",
-    "PF3D7_0914700",
-    "PF3D7_0916000",
-    "PF3D7_0919500",
-    "PF3D7_0926400",
-    "PF3D7_1004800",
-    "PF3D7_1022300",
-    "PF3D7_1037300",
-    "PF3D7_1104800",
-    "PF3D7_1107900",
-    "PF3D7_1113300",
-    "PF3D7_1132400",
-    "PF3D7_1132800",
-    "PF3D7_1145500",
-    "PF3D7_1209900",
-    "PF3D7_1229100",
-    "PF3D7_1303500",
-    "PF3D7_1304200",
-    "PF3D7_1339900",
-    "PF3D7_1352100",
-    "PF3D7_1368700",
-    "PF3D7_1428200",
-    "PF3D7_1431900",
-    "PF3D7_1432100",
-    "PF3D7_1440800",
-    "PF3D7_1447900",
-]
-
-# Signal peptide proteins - GenesWithSignalPeptide search
-# First 100 of 609 total genes
-PF_SIGNAL_PEPTIDE: list[str] = [
-    "PF3D7_0100600",
-    "PF3D7_0100800",
-    "PF3D7_0100900",
-    "PF3D7_0101000",
-    "PF3D7_0101800",
-    "PF3D7_0101900",
-    "PF3D7_0102300",
-    "PF3D7_0102500",
-    "PF3D7_0102700",
-    "PF3D7_0103900",
-    "PF3D7_0104500",
-    "PF3D7_0105400",
-    "PF3D7_0106600",
-    "PF3D7_0107300",
-    "PF3D7_0107900",
-    "PF3D7_0108700",
-    "PF3D7_0109100",
-    "PF3D7_0112100",
-    "PF3D7_0113000",
-    "PF3D7_0113900",
-    "PF3D7_0114200",
-    "PF3D7_0114500",
-    "PF3D7_0114700",
-    "PF3D7_0115300",
-    "PF3D7_0115400",
-    "PF3D7_0115600",
-    "PF3D7_0200200",
-    "PF3D7_0200400",
-    "PF3D7_0200500",
-    "PF3D7_0200600",
-    "PF3D7_0201000",
-    "PF3D7_0201200",
-    "PF3D7_0201300",
-    "PF3D7_0201400",
-    "PF3D7_0203900",
-    "PF3D7_0204100",
-    "PF3D7_0204600",
-    "PF3D7_0207400",
-    "PF3D7_0207500",
-    "PF3D7_0207600",
-    "PF3D7_0207700",
-    "PF3D7_0207800",
-    "PF3D7_0207900",
-    "PF3D7_0208000",
-    "PF3D7_0208500",
-    "PF3D7_0209000",
-    "PF3D7_0209300",
-    "PF3D7_0212600",
-    "PF3D7_0214900",
-    "PF3D7_0215000",
-    "PF3D7_0215300",
-    "PF3D7_0216600",
-    "PF3D7_0220300",
-    "PF3D7_0220500",
-    "PF3D7_0220800",
-    "PF3D7_0221000",
-    "PF3D7_0221200",
-    "PF3D7_0221400",
-    "PF3D7_0222500",
-    "PF3D7_0222700",
-    "PF3D7_0222800",
-    "PF3D7_0223200",
-    "PF3D7_0223400",
-    "PF3D7_0300400",
-    "PF3D7_0300500",
-    "PF3D7_0300700",
-    "PF3D7_0300800",
-    "PF3D7_0300900",
-    "PF3D7_0301000",
-    "PF3D7_0302200",
-    "PF3D7_0302500",
-    "PF3D7_0303900",
-    "PF3D7_0304600",
-    "PF3D7_0305000",
-    "PF3D7_0307400",
-    "PF3D7_0309100",
-    "PF3D7_0310400",
-    "PF3D7_0311200",
-    "PF3D7_0311600",
-    "PF3D7_0311700",
-    "PF3D7_0313100",
-    "PF3D7_0313300",
-    "PF3D7_0314000",
-    "PF3D7_0314300",
-    "PF3D7_0315200",
-    "PF3D7_0315900",
-    "PF3D7_0316300",
-    "PF3D7_0316400",
-    "PF3D7_0317100",
-    "PF3D7_0318000",
-    "PF3D7_0318800",
-    "PF3D7_0318900",
-    "PF3D7_0320200",
-    "PF3D7_0320400",
-    "PF3D7_0323400",
-    "PF3D7_0324400",
-    "PF3D7_0324500",
-    "PF3D7_0324600",
-    "PF3D7_0324800",
-    "PF3D7_0400800",
-]
-
-# Transmembrane domain proteins (min=1 TM domain)
-# First 100 of many from GenesByTransmembraneDomains search
-PF_TRANSMEMBRANE: list[str] = [
-    "PF3D7_0100200",
-    "PF3D7_0100400",
-    "PF3D7_0100600",
-    "PF3D7_0100800",
-    "PF3D7_0100900",
-    "PF3D7_0101000",
-    "PF3D7_0101100",
-    "PF3D7_0101200",
-    "PF3D7_0101300",
-    "PF3D7_0101600",
-    "PF3D7_0101800",
-    "PF3D7_0101900",
-    "PF3D7_0102500",
-    "PF3D7_0102600",
-    "PF3D7_0102800",
-    "PF3D7_0103200",
-    "PF3D7_0103500",
-    "PF3D7_0103600",
-    "PF3D7_0103900",
-    "PF3D7_0104000",
-    "PF3D7_0104100",
-    "PF3D7_0104400",
-    "PF3D7_0104700",
-    "PF3D7_0104800",
-    "PF3D7_0105400",
-    "PF3D7_0105600",
-    "PF3D7_0106300",
-    "PF3D7_0107300",
-    "PF3D7_0107400",
-    "PF3D7_0107500",
-    "PF3D7_0107600",
-    "PF3D7_0107700",
-    "PF3D7_0108400",
-    "PF3D7_0108600",
-    "PF3D7_0108700",
-    "PF3D7_0109300",
-    "PF3D7_0109850",
-    "PF3D7_0109950",
-    "PF3D7_0110000",
-    "PF3D7_0111500",
-    "PF3D7_0112100",
-    "PF3D7_0112200",
-    "PF3D7_0112800",
-    "PF3D7_0112900",
-    "PF3D7_0113000",
-    "PF3D7_0113100",
-    "PF3D7_0113200",
-    "PF3D7_0113300",
-    "PF3D7_0113400",
-    "PF3D7_0113700",
-    "PF3D7_0113900",
-    "PF3D7_0114000",
-    "PF3D7_0114100",
-    "PF3D7_0114200",
-    "PF3D7_0114500",
-    "PF3D7_0114700",
-    "PF3D7_0114800",
-    "PF3D7_0115000",
-    "PF3D7_0115100",
-    "PF3D7_0115200",
-    "PF3D7_0115300",
-    "PF3D7_0115400",
-    "PF3D7_0115600",
-    "PF3D7_0200200",
-    "PF3D7_0200300",
-    "PF3D7_0200400",
-    "PF3D7_0200500",
-    "PF3D7_0200600",
-    "PF3D7_0200700",
-    "PF3D7_0201000",
-    "PF3D7_0201200",
-    "PF3D7_0201300",
-    "PF3D7_0201400",
-    "PF3D7_0201500",
-    "PF3D7_0201600",
-    "PF3D7_0201700",
-    "PF3D7_0201800",
-    "PF3D7_0201900",
-    "PF3D7_0202100",
-    "PF3D7_0202200",
-    "PF3D7_0202300",
-    "PF3D7_0202500",
-    "PF3D7_0202900",
-    "PF3D7_0203600",
-    "PF3D7_0204200",
-    "PF3D7_0204600",
-    "PF3D7_0204700",
-    "PF3D7_0206100",
-    "PF3D7_0206200",
-    "PF3D7_0206900",
-    "PF3D7_0207000",
-    "PF3D7_0207400",
-    "PF3D7_0208300",
-    "PF3D7_0208400",
-    "PF3D7_0208800",
-    "PF3D7_0208900",
-    "PF3D7_0209300",
-    "PF3D7_0209600",
-    "PF3D7_0210000",
-    "PF3D7_0210300",
-]
-
-# Ribosomal proteins - GO:0003735 (structural constituent of ribosome)
-# 100 of 162 genes from GenesByGoTerm search
-PF_RIBOSOMAL: list[str] = [
-    "PF3D7_0210100",
-    "PF3D7_0210400",
-    "PF3D7_0212200",
-    "PF3D7_0214200",
-    "PF3D7_0217800",
-    "PF3D7_0219200",
-    "PF3D7_0304400",
-    "PF3D7_0306900",
-    "PF3D7_0307100",
-    "PF3D7_0307200",
-    "PF3D7_0309600",
-    "PF3D7_0312800",
-    "PF3D7_0315500",
-    "PF3D7_0316100",
-    "PF3D7_0316800",
-    "PF3D7_0317600",
-    "PF3D7_0322900",
-    "PF3D7_0406800",
-    "PF3D7_0412100",
-    "PF3D7_0413800",
-    "PF3D7_0415900",
-    "PF3D7_0419800",
-    "PF3D7_0422400",
-    "PF3D7_0503000",
-    "PF3D7_0503800",
-    "PF3D7_0506100",
-    "PF3D7_0507100",
-    "PF3D7_0516200",
-    "PF3D7_0516900",
-    "PF3D7_0517000",
-    "PF3D7_0519100",
-    "PF3D7_0519400",
-    "PF3D7_0520000",
-    "PF3D7_0522500",
-    "PF3D7_0524600",
-    "PF3D7_0531200",
-    "PF3D7_0604200",
-    "PF3D7_0605000",
-    "PF3D7_0610000",
-    "PF3D7_0610900",
-    "PF3D7_0611700",
-    "PF3D7_0613400",
-    "PF3D7_0614500",
-    "PF3D7_0618300",
-    "PF3D7_0626900",
-    "PF3D7_0705700",
-    "PF3D7_0706400",
-    "PF3D7_0710600",
-    "PF3D7_0710900",
-    "PF3D7_0713600",
-    "PF3D7_0718400",
-    "PF3D7_0719600",
-    "PF3D7_0719700",
-    "PF3D7_0721600",
-    "PF3D7_0810100",
-    "PF3D7_0811900",
-    "PF3D7_0813900",
-    "PF3D7_0814000",
-    "PF3D7_0821700",
-    "PF3D7_0822000",
-    "PF3D7_0827500",
-    "PF3D7_0903900",
-    "PF3D7_0907800",
-    "PF3D7_0918200",
-    "PF3D7_0932600",
-    "PF3D7_0934600",
-    "PF3D7_1003500",
-    "PF3D7_1004000",
-    "PF3D7_1010000",
-    "PF3D7_1010800",
-    "PF3D7_1019400",
-    "PF3D7_1026800",
-    "PF3D7_1027800",
-    "PF3D7_1034200",
-    "PF3D7_1103100",
-    "PF3D7_1105400",
-    "PF3D7_1106100",
-    "PF3D7_1109900",
-    "PF3D7_1110600",
-    "PF3D7_1123700",
-    "PF3D7_1124900",
-    "PF3D7_1126200",
-    "PF3D7_1130100",
-    "PF3D7_1130200",
-    "PF3D7_1132700",
-    "PF3D7_1137100",
-    "PF3D7_1137500",
-    "PF3D7_1142500",
-    "PF3D7_1142600",
-    "PF3D7_1144000",
-    "PF3D7_1144100",
-    "PF3D7_1144300",
-    "PF3D7_1208000",
-    "PF3D7_1210000",
-    "PF3D7_1211500",
-    "PF3D7_1223900",
-    "PF3D7_1239100",
-    "PF3D7_1242700",
-    "PF3D7_1245400",
-    "PF3D7_1302800",
-]
-
-# Protein folding / chaperones - GO:0006457 (protein folding)
-# 90 genes (deduplicated) from GenesByGoTerm search
-PF_CHAPERONES: list[str] = [
-    "PF3D7_0109400",
-    "PF3D7_0113700",
-    "PF3D7_0201800",
-    "PF3D7_0213100",
-    "PF3D7_0214000",
-    "PF3D7_0306200",
-    "PF3D7_0306700",
-    "PF3D7_0306800",
-    "PF3D7_0308200",
-    "PF3D7_0308600",
-    "PF3D7_0314000",
-    "PF3D7_0320300",
-    "PF3D7_0322000",
-    "PF3D7_0409400",
-    "PF3D7_0501100",
-    "PF3D7_0510200",
-    "PF3D7_0512000",
-    "PF3D7_0527500",
-    "PF3D7_0528700",
-    "PF3D7_0529300",
-    "PF3D7_0608700",
-    "PF3D7_0621800",
-    "PF3D7_0627500",
-    "PF3D7_0629200",
-    "PF3D7_0708000",
-    "PF3D7_0708400",
-    "PF3D7_0708800",
-    "PF3D7_0718500",
-    "PF3D7_0804800",
-    "PF3D7_0811200",
-    "PF3D7_0813200",
-    "PF3D7_0816500",
-    "PF3D7_0818900",
-    "PF3D7_0823800",
-    "PF3D7_0827900",
-    "PF3D7_0831700",
-    "PF3D7_0904500",
-    "PF3D7_0917900",
-    "PF3D7_0919400",
-    "PF3D7_0927000",
-    "PF3D7_1015600",
-    "PF3D7_1015700",
-    "PF3D7_1108700",
-    "PF3D7_1115600",
-    "PF3D7_1116300",
-    "PF3D7_1118200",
-    "PF3D7_1124000",
-    "PF3D7_1124700",
-    "PF3D7_1127500",
-    "PF3D7_1128100",
-    "PF3D7_1132200",
-    "PF3D7_1134000",
-    "PF3D7_1134100",
-    "PF3D7_1136800",
-    "PF3D7_1143200",
-    "PF3D7_1202400",
-    "PF3D7_1211100",
-    "PF3D7_1214400",
-    "PF3D7_1215200",
-    "PF3D7_1215300",
-    "PF3D7_1222300",
-    "PF3D7_1229500",
-    "PF3D7_1232100",
-    "PF3D7_1242000",
-    "PF3D7_1247400",
-    "PF3D7_1251000",
-    "PF3D7_1253000",
-    "PF3D7_1304500",
-    "PF3D7_1318800",
-    "PF3D7_1320900",
-    "PF3D7_1333000",
-    "PF3D7_1336800",
-    "PF3D7_1356700",
-    "PF3D7_1357800",
-    "PF3D7_1360200",
-    "PF3D7_1410000",
-    "PF3D7_1413900",
-    "PF3D7_1416900",
-    "PF3D7_1420200",
-    "PF3D7_1420300",
-    "PF3D7_1423200",
-    "PF3D7_1427000",
-    "PF3D7_1435400",
-    "PF3D7_1437900",
-    "PF3D7_1438900",
-    "PF3D7_1443900",
-    "PF3D7_1452100",
-    "PF3D7_1453700",
-    "PF3D7_1470100",
-    "PF3D7_1472600",
-]
-
-# DNA replication - GO:0006260 (DNA replication)
-# 46 genes from GenesByGoTerm search
-PF_DNA_REPLICATION: list[str] = [
-    "PF3D7_0111300",
-    "PF3D7_0215800",
-    "PF3D7_0218000",
-    "PF3D7_0219600",
-    "PF3D7_0308000",
-    "PF3D7_0317200",
-    "PF3D7_0317400",
-    "PF3D7_0408500",
-    "PF3D7_0409600",
-    "PF3D7_0411900",
-    "PF3D7_0419600",
-    "PF3D7_0508800",
-    "PF3D7_0510500",
-    "PF3D7_0517400",
-    "PF3D7_0625300",
-    "PF3D7_0630300",
-    "PF3D7_0705300",
-    "PF3D7_0705400",
-    "PF3D7_0717500",
-    "PF3D7_0726300",
-    "PF3D7_0914800",
-    "PF3D7_1015800",
-    "PF3D7_1017000",
-    "PF3D7_1029900",
-    "PF3D7_1111100",
-    "PF3D7_1112600",
-    "PF3D7_1127100",
-    "PF3D7_1211300",
-    "PF3D7_1211700",
-    "PF3D7_1215900",
-    "PF3D7_1234300",
-    "PF3D7_1241700",
-    "PF3D7_1317100",
-    "PF3D7_1334100",
-    "PF3D7_1335500",
-    "PF3D7_1355100",
-    "PF3D7_1361900",
-    "PF3D7_1411400",
-    "PF3D7_1417800",
-    "PF3D7_1429900",
-    "PF3D7_1437200",
-    "PF3D7_1441400",
-    "PF3D7_1442100",
-    "PF3D7_1463200",
-    "PF3D7_1463300",
-    "PF3D7_1467500",
-]
-
-# Exported proteins (ExportPred score >= 1.5, includes PEXEL-containing)
-# First 100 of 400+ from GenesByExportPrediction search
-PF_EXPORTED: list[str] = [
-    "PF3D7_0100100",
-    "PF3D7_0100600",
-    "PF3D7_0100800",
-    "PF3D7_0100900",
-    "PF3D7_0101000",
-    "PF3D7_0101100",
-    "PF3D7_0101200",
-    "PF3D7_0101300",
-    "PF3D7_0101600",
-    "PF3D7_0101800",
-    "PF3D7_0101900",
-    "PF3D7_0102300",
-    "PF3D7_0102600",
-    "PF3D7_0104400",
-    "PF3D7_0107700",
-    "PF3D7_0112100",
-    "PF3D7_0112800",
-    "PF3D7_0112900",
-    "PF3D7_0113000",
-    "PF3D7_0113200",
-    "PF3D7_0113300",
-    "PF3D7_0113400",
-    "PF3D7_0113700",
-    "PF3D7_0113900",
-    "PF3D7_0114000",
-    "PF3D7_0114100",
-    "PF3D7_0114200",
-    "PF3D7_0114500",
-    "PF3D7_0114700",
-    "PF3D7_0114800",
-    "PF3D7_0115100",
-    "PF3D7_0115200",
-    "PF3D7_0115300",
-    "PF3D7_0115400",
-    "PF3D7_0115600",
-    "PF3D7_0115700",
-    "PF3D7_0200100",
-    "PF3D7_0200200",
-    "PF3D7_0200400",
-    "PF3D7_0200500",
-    "PF3D7_0200600",
-    "PF3D7_0200700",
-    "PF3D7_0201000",
-    "PF3D7_0201200",
-    "PF3D7_0201300",
-    "PF3D7_0201400",
-    "PF3D7_0201500",
-    "PF3D7_0201600",
-    "PF3D7_0201700",
-    "PF3D7_0201800",
-    "PF3D7_0201900",
-    "PF3D7_0202000",
-    "PF3D7_0202100",
-    "PF3D7_0202200",
-    "PF3D7_0207000",
-    "PF3D7_0219800",
-    "PF3D7_0219900",
-    "PF3D7_0220100",
-    "PF3D7_0220200",
-    "PF3D7_0220300",
-    "PF3D7_0220600",
-    "PF3D7_0220700",
-    "PF3D7_0221200",
-    "PF3D7_0221400",
-    "PF3D7_0222100",
-    "PF3D7_0222200",
-    "PF3D7_0222500",
-    "PF3D7_0222700",
-    "PF3D7_0222800",
-    "PF3D7_0223100",
-    "PF3D7_0223400",
-    "PF3D7_0223500",
-    "PF3D7_0300100",
-    "PF3D7_0300400",
-    "PF3D7_0300500",
-    "PF3D7_0300700",
-    "PF3D7_0300800",
-    "PF3D7_0300900",
-    "PF3D7_0301200",
-    "PF3D7_0301300",
-    "PF3D7_0301400",
-    "PF3D7_0301500",
-    "PF3D7_0301600",
-    "PF3D7_0301700",
-    "PF3D7_0301800",
-    "PF3D7_0316300",
-    "PF3D7_0324100",
-    "PF3D7_0324200",
-    "PF3D7_0324300",
-    "PF3D7_0324400",
-    "PF3D7_0324500",
-    "PF3D7_0324600",
-    "PF3D7_0324800",
-    "PF3D7_0324900",
-    "PF3D7_0400100",
-    "PF3D7_0400400",
-    "PF3D7_0400800",
-    "PF3D7_0400900",
-    "PF3D7_0401000",
-    "PF3D7_0401300",
-]
-
-# Invasion-related genes (text search: "invasion OR merozoite OR erythrocyte binding")
-# First 100 of 200+ genes from GenesByText search
-PF_INVASION: list[str] = [
-    "PF3D7_0100100",
-    "PF3D7_0100300",
-    "PF3D7_0100500",
-    "PF3D7_0101500",
-    "PF3D7_0101700",
-    "PF3D7_0102200",
-    "PF3D7_0102500",
-    "PF3D7_0102700",
-    "PF3D7_0103900",
-    "PF3D7_0114400",
-    "PF3D7_0115500",
-    "PF3D7_0115700",
-    "PF3D7_0200100",
-    "PF3D7_0200300",
-    "PF3D7_0200800",
-    "PF3D7_0201900",
-    "PF3D7_0202600",
-    "PF3D7_0205700",
-    "PF3D7_0206800",
-    "PF3D7_0206900",
-    "PF3D7_0207000",
-    "PF3D7_0221900",
-    "PF3D7_0222900",
-    "PF3D7_0223300",
-    "PF3D7_0223500",
-    "PF3D7_0300100",
-    "PF3D7_0300300",
-    "PF3D7_0302300",
-    "PF3D7_0302800",
-    "PF3D7_0303900",
-    "PF3D7_0307300",
-    "PF3D7_0309700",
-    "PF3D7_0310400",
-    "PF3D7_0319500",
-    "PF3D7_0323900",
-    "PF3D7_0324700",
-    "PF3D7_0324900",
-    "PF3D7_0400100",
-    "PF3D7_0400200",
-    "PF3D7_0400400",
-    "PF3D7_0400600",
-    "PF3D7_0402300",
-    "PF3D7_0402800",
-    "PF3D7_0404300",
-    "PF3D7_0408300",
-    "PF3D7_0408600",
-    "PF3D7_0410000",
-    "PF3D7_0412400",
-    "PF3D7_0412700",
-    "PF3D7_0412900",
-    "PF3D7_0413100",
-    "PF3D7_0413400",
-    "PF3D7_0414700",
-    "PF3D7_0415500",
-    "PF3D7_0416000",
-    "PF3D7_0416800",
-    "PF3D7_0417100",
-    "PF3D7_0418700",
-    "PF3D7_0419700",
-    "PF3D7_0420700",
-    "PF3D7_0420900",
-    "PF3D7_0421100",
-    "PF3D7_0421300",
-    "PF3D7_0421600",
-    "PF3D7_0422200",
-    "PF3D7_0424100",
-    "PF3D7_0424200",
-    "PF3D7_0424300",
-    "PF3D7_0425800",
-    "PF3D7_0426000",
-    "PF3D7_0500100",
-    "PF3D7_0500200",
-    "PF3D7_0500800",
-    "PF3D7_0501200",
-    "PF3D7_0501300",
-    "PF3D7_0502400",
-    "PF3D7_0506200",
-    "PF3D7_0508800",
-    "PF3D7_0513400",
-    "PF3D7_0518700",
-    "PF3D7_0519000",
-    "PF3D7_0520400",
-    "PF3D7_0524300",
-    "PF3D7_0528800",
-    "PF3D7_0530600",
-    "PF3D7_0532700",
-    "PF3D7_0533100",
-    "PF3D7_0600100",
-    "PF3D7_0600200",
-    "PF3D7_0600400",
-    "PF3D7_0600600",
-    "PF3D7_0601400",
-    "PF3D7_0602300",
-    "PF3D7_0603100",
-    "PF3D7_0605400",
-    "PF3D7_0605500",
-    "PF3D7_0606100",
-    "PF3D7_0606500",
-    "PF3D7_0607800",
-    "PF3D7_0610200",
-]
-
-# var/RIFIN/STEVOR - antigenic variation genes
-# 100 of 200+ genes from GenesByText (product: PfEMP1 OR rifin OR stevor)
-PF_ANTIGENIC_VARIATION: list[str] = [
-    "PF3D7_0100100",
-    "PF3D7_0100200",
-    "PF3D7_0100300",
-    "PF3D7_0100400",
-    "PF3D7_0100500",
-    "PF3D7_0100600",
-    "PF3D7_0100800",
-    "PF3D7_0100900",
-    "PF3D7_0101000",
-    "PF3D7_0101500",
-    "PF3D7_0101600",
-    "PF3D7_0101700",
-    "PF3D7_0101800",
-    "PF3D7_0101900",
-    "PF3D7_0102100",
-    "PF3D7_0114400",
-    "PF3D7_0114600",
-    "PF3D7_0114700",
-    "PF3D7_0115200",
-    "PF3D7_0115300",
-    "PF3D7_0115400",
-    "PF3D7_0115500",
-    "PF3D7_0115600",
-    "PF3D7_0115700",
-    "PF3D7_0200100",
-    "PF3D7_0200200",
-    "PF3D7_0200300",
-    "PF3D7_0200400",
-    "PF3D7_0200500",
-    "PF3D7_0200600",
-    "PF3D7_0200700",
-    "PF3D7_0200800",
-    "PF3D7_0200900",
-    "PF3D7_0201000",
-    "PF3D7_0201200",
-    "PF3D7_0201300",
-    "PF3D7_0221400",
-    "PF3D7_0221900",
-    "PF3D7_0222400",
-    "PF3D7_0222500",
-    "PF3D7_0222600",
-    "PF3D7_0222700",
-    "PF3D7_0222800",
-    "PF3D7_0222900",
-    "PF3D7_0223100",
-    "PF3D7_0223200",
-    "PF3D7_0223300",
-    "PF3D7_0223400",
-    "PF3D7_0223500",
-    "PF3D7_0300100",
-    "PF3D7_0300200",
-    "PF3D7_0300300",
-    "PF3D7_0300400",
-    "PF3D7_0300500",
-    "PF3D7_0300700",
-    "PF3D7_0300800",
-    "PF3D7_0300900",
-    "PF3D7_0302300",
-    "PF3D7_0323900",
-    "PF3D7_0324400",
-    "PF3D7_0324500",
-    "PF3D7_0324600",
-    "PF3D7_0324700",
-    "PF3D7_0324800",
-    "PF3D7_0324900",
-    "PF3D7_0400100",
-    "PF3D7_0400200",
-    "PF3D7_0400300",
-    "PF3D7_0400400",
-    "PF3D7_0400500",
-    "PF3D7_0400600",
-    "PF3D7_0400700",
-    "PF3D7_0400800",
-    "PF3D7_0400900",
-    "PF3D7_0401000",
-    "PF3D7_0401200",
-    "PF3D7_0401300",
-    "PF3D7_0401400",
-    "PF3D7_0401500",
-    "PF3D7_0401600",
-    "PF3D7_0402500",
-    "PF3D7_0402600",
-    "PF3D7_0402700",
-    "PF3D7_0402800",
-    "PF3D7_0412400",
-    "PF3D7_0412600",
-    "PF3D7_0412700",
-    "PF3D7_0412900",
-    "PF3D7_0413100",
-    "PF3D7_0413200",
-    "PF3D7_0413300",
-    "PF3D7_0413400",
-    "PF3D7_0420700",
-    "PF3D7_0420900",
-    "PF3D7_0421100",
-    "PF3D7_0421200",
-    "PF3D7_0421300",
-    "PF3D7_0421500",
-    "PF3D7_0421600",
-    "PF3D7_0425500",
-]
-
-# Apicoplast-targeted genes (text search: "apicoplast")
-# 37 genes (deduplicated) from GenesByText search
-PF_APICOPLAST: list[str] = [
-    "PF3D7_0310000",
-    "PF3D7_0503000",
-    "PF3D7_0522500",
-    "PF3D7_0524600",
-    "PF3D7_0529300",
-    "PF3D7_0613400",
-    "PF3D7_0810100",
-    "PF3D7_0815900",
-    "PF3D7_0827500",
-    "PF3D7_0907800",
-    "PF3D7_0908100",
-    "PF3D7_0918200",
-    "PF3D7_0932600",
-    "PF3D7_1021300",
-    "PF3D7_1106100",
-    "PF3D7_1137500",
-    "PF3D7_1144700",
-    "PF3D7_1208000",
-    "PF3D7_1210000",
-    "PF3D7_1329700",
-    "PF3D7_1429100",
-    "PF3D7_1460900",
-    "PF3D7_1467400",
-    "PF3D7_API00100",
-    "PF3D7_API01500",
-    "PF3D7_API01600",
-    "PF3D7_API01800",
-    "PF3D7_API01900",
-    "PF3D7_API02000",
-    "PF3D7_API02100",
-    "PF3D7_API02200",
-    "PF3D7_API02300",
-    "PF3D7_API02500",
-    "PF3D7_API02600",
-    "PF3D7_API02700",
-    "PF3D7_API02800",
-    "PF3D7_API03500",
-]
-
-# Drug resistance related genes (text search)
-# 35 genes from GenesByText search
-PF_DRUG_RESISTANCE: list[str] = [
-    "PF3D7_0106300",
-    "PF3D7_0107500",
-    "PF3D7_0112200",
-    "PF3D7_0209800",
-    "PF3D7_0321900",
-    "PF3D7_0523000",
-    "PF3D7_0616200",
-    "PF3D7_0629500",
-    "PF3D7_0709000",
-    "PF3D7_0709700",
-    "PF3D7_0724800",
-    "PF3D7_1022600",
-    "PF3D7_1036300",
-    "PF3D7_1036400",
-    "PF3D7_1117200",
-    "PF3D7_1119600",
-    "PF3D7_1121600",
-    "PF3D7_1125700",
-    "PF3D7_1125800",
-    "PF3D7_1129100",
-    "PF3D7_1131600",
-    "PF3D7_1205400",
-    "PF3D7_1210600",
-    "PF3D7_1213400",
-    "PF3D7_1229100",
-    "PF3D7_1318300",
-    "PF3D7_1343700",
-    "PF3D7_1359900",
-    "PF3D7_1431400",
-    "PF3D7_1447900",
-    "PF3D7_1448500",
-    "PF3D7_1466100",
-    "PF3D7_1468600",
-    "PF3D7_1476100",
-    "PF3D7_API01300",
-]
-
-# Gametocyte / sexual stage genes (text search)
-# 31 genes from GenesByText search
-PF_GAMETOCYTE: list[str] = [
-    "PF3D7_0108700",
-    "PF3D7_0202100",
-    "PF3D7_0220000",
-    "PF3D7_0507300",
-    "PF3D7_0513700",
-    "PF3D7_0518800",
-    "PF3D7_0630200",
-    "PF3D7_0715400",
-    "PF3D7_0721700",
-    "PF3D7_0830500",
-    "PF3D7_0927200",
-    "PF3D7_0935400",
-    "PF3D7_0936600",
-    "PF3D7_1024100",
-    "PF3D7_1030900",
-    "PF3D7_1031000",
-    "PF3D7_1036400",
-    "PF3D7_1038400",
-    "PF3D7_1102500",
-    "PF3D7_1136600",
-    "PF3D7_1137800",
-    "PF3D7_1147000",
-    "PF3D7_1201300",
-    "PF3D7_1204400",
-    "PF3D7_1205200",
-    "PF3D7_1218800",
-    "PF3D7_1253000",
-    "PF3D7_1340000",
-    "PF3D7_1367800",
-    "PF3D7_1404300",
-    "PF3D7_1417600",
-]
-
-# Translation machinery - GO:0006412 (translation)
-# 100 of 169 genes from GenesByGoTerm search
-PF_TRANSLATION: list[str] = [
-    "PF3D7_0208600",
-    "PF3D7_0210100",
-    "PF3D7_0210400",
-    "PF3D7_0210900",
-    "PF3D7_0212200",
-    "PF3D7_0214200",
-    "PF3D7_0217800",
-    "PF3D7_0219200",
-    "PF3D7_0304400",
-    "PF3D7_0306900",
-    "PF3D7_0307100",
-    "PF3D7_0307200",
-    "PF3D7_0312800",
-    "PF3D7_0315500",
-    "PF3D7_0316100",
-    "PF3D7_0316800",
-    "PF3D7_0317600",
-    "PF3D7_0322900",
-    "PF3D7_0406800",
-    "PF3D7_0412100",
-    "PF3D7_0413800",
-    "PF3D7_0415900",
-    "PF3D7_0419800",
-    "PF3D7_0420400",
-    "PF3D7_0422400",
-    "PF3D7_0503000",
-    "PF3D7_0503800",
-    "PF3D7_0506100",
-    "PF3D7_0507100",
-    "PF3D7_0516200",
-    "PF3D7_0516900",
-    "PF3D7_0517000",
-    "PF3D7_0519100",
-    "PF3D7_0519400",
-    "PF3D7_0520000",
-    "PF3D7_0522500",
-    "PF3D7_0524600",
-    "PF3D7_0531200",
-    "PF3D7_0604200",
-    "PF3D7_0605000",
-    "PF3D7_0610000",
-    "PF3D7_0610900",
-    "PF3D7_0611700",
-    "PF3D7_0613400",
-    "PF3D7_0614500",
-    "PF3D7_0618300",
-    "PF3D7_0628800",
-    "PF3D7_0705700",
-    "PF3D7_0706400",
-    "PF3D7_0710600",
-    "PF3D7_0710900",
-    "PF3D7_0713600",
-    "PF3D7_0718400",
-    "PF3D7_0719600",
-    "PF3D7_0719700",
-    "PF3D7_0721600",
-    "PF3D7_0810100",
-    "PF3D7_0811900",
-    "PF3D7_0813900",
-    "PF3D7_0814000",
-    "PF3D7_0815600",
-    "PF3D7_0821700",
-    "PF3D7_0822000",
-    "PF3D7_0827500",
-    "PF3D7_0828200",
-    "PF3D7_0903900",
-    "PF3D7_0907800",
-    "PF3D7_0907900",
-    "PF3D7_0911700",
-    "PF3D7_0918200",
-    "PF3D7_0932600",
-    "PF3D7_0934600",
-    "PF3D7_1003500",
-    "PF3D7_1004000",
-    "PF3D7_1010800",
-    "PF3D7_1019400",
-    "PF3D7_1026800",
-    "PF3D7_1027200",
-    "PF3D7_1027800",
-    "PF3D7_1034200",
-    "PF3D7_1103100",
-    "PF3D7_1105400",
-    "PF3D7_1106100",
-    "PF3D7_1109900",
-    "PF3D7_1110600",
-    "PF3D7_1123400",
-    "PF3D7_1124900",
-    "PF3D7_1126200",
-    "PF3D7_1130100",
-    "PF3D7_1130200",
-    "PF3D7_1132700",
-    "PF3D7_1137100",
-    "PF3D7_1137500",
-    "PF3D7_1142500",
-    "PF3D7_1142600",
-    "PF3D7_1144000",
-    "PF3D7_1144100",
-    "PF3D7_1144300",
-    "PF3D7_1208000",
-    "PF3D7_1210000",
-]
-
-
-# ---------------------------------------------------------------------------
-# Parameter helpers — PlasmoDB-specific (no shared helper exists for these)
-# ---------------------------------------------------------------------------
-
-
-def _export_pred(organism: str, min_score: float = 1.5) -> dict[str, str]:
-    """Build ExportPred parameters.
-
-    Unique to PlasmoDB: ExportPred scoring is a Plasmodium-specific search.
-    """
-    return {
-        "organism": org([organism]),
-        "min_exportpred_score": str(min_score),
-    }
-
-
-def _metabolic_pathway(
-    organism: str,
-    pathway_id: str,
-    source: str = "Any",
-) -> dict[str, str]:
-    """Build GenesByMetabolicPathway parameters.
-
-    Unique to PlasmoDB: metabolic pathway searches with KEGG IDs.
-    """
-    return {
-        "organism": org([organism]),
-        "pathways_source": source,
-        "metabolic_pathway_id_with_genes": pathway_id,
-        "pathway_wildcard": "No",
-        "exact_match_only": "No",
-        "exclude_incomplete_ec": "No",
-    }
-
-
-# ---------------------------------------------------------------------------
-# Seeds
-# ---------------------------------------------------------------------------
-SEEDS: list[SeedDef] = [
-    # === Strategy 1: Drug Target Discovery Pipeline (10 nodes) ===
-    SeedDef(
-        name="PF3D7 Drug Target Candidates",
-        description=(
-            "Identify potential P. falciparum drug targets by finding enzymes "
-            "(kinases and proteases) that are surface-exposed or secreted "
-            "(signal peptide or transmembrane domains), then excluding "
-            "ribosomal and translation machinery to focus on parasite-specific "
-            "enzymatic targets. This models a standard target-based drug "
-            "discovery pipeline for antimalarial development."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "combine_1",
-            "displayName": "Drug Targets (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "combine_2",
-                "displayName": "Surface Enzymes - Ribosomal",
-                "operator": "MINUS",
-                "primaryInput": {
-                    "id": "combine_3",
-                    "displayName": "Surface/Secreted Enzymes",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "combine_4",
-                        "displayName": "All Enzymes",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "combine_5",
-                            "displayName": "Kinases + Proteases",
-                            "operator": "UNION",
-                            "primaryInput": {
-                                "id": "step_1",
-                                "displayName": "Protein Kinases",
-                                "searchName": "GenesByGoTerm",
-                                "parameters": go_search_params(
-                                    PF_ORG, "GO:0004672", evidence=PF_GO_EVIDENCE
-                                ),
-                            },
-                            "secondaryInput": {
-                                "id": "step_2",
-                                "displayName": "Proteases",
-                                "searchName": "GenesByGoTerm",
-                                "parameters": go_search_params(
-                                    PF_ORG, "GO:0008233", evidence=PF_GO_EVIDENCE
-                                ),
-                            },
-                        },
-                        "secondaryInput": {
-                            "id": "step_3",
-                            "displayName": "Oxidoreductases (EC 1.1.1.37)",
-                            "searchName": "GenesByEcNumber",
-                            "parameters": ec_search_params(
-                                PF_ORG, ec_number="1.1.1.37", ec_sources=PF_EC_SOURCES
-                            ),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "combine_6",
-                        "displayName": "Surface/Secreted",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "step_4",
-                            "displayName": "Signal Peptide",
-                            "searchName": "GenesWithSignalPeptide",
-                            "parameters": signal_peptide_params(PF_ORG),
-                        },
-                        "secondaryInput": {
-                            "id": "step_5",
-                            "displayName": "Transmembrane Domains",
-                            "searchName": "GenesByTransmembraneDomains",
-                            "parameters": transmembrane_params(PF_ORG, "1", "20"),
-                        },
-                    },
-                },
-                "secondaryInput": {
-                    "id": "step_8",
-                    "displayName": "Ribosomal Proteins",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(
-                        PF_ORG, "GO:0003735", evidence=PF_GO_EVIDENCE
-                    ),
-                },
-            },
-            "secondaryInput": {
-                "id": "step_10",
-                "displayName": "Translation Machinery",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(
-                    PF_ORG, "GO:0006412", evidence=PF_GO_EVIDENCE
-                ),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Drug target enzymes - secreted kinases and proteases",
-            positive_ids=PF_KINASES[:40] + PF_PROTEASES[:40],
-            negative_ids=PF_RIBOSOMAL[:80],
-            provenance_notes=(
-                "Positive set: kinases/proteases with signal peptides or TM "
-                "domains (surface-exposed enzymes = druggable targets). "
-                "Negative set: ribosomal proteins (housekeeping, not drug targets "
-                "in traditional antimalarial discovery)."
-            ),
-            tags=[
-                "drug-discovery",
-                "enzymes",
-                "surface-proteins",
-                "antimalarial",
-            ],
-        ),
-    ),
-    # === Strategy 2: Erythrocyte Invasion Machinery (8 nodes) ===
-    SeedDef(
-        name="PF3D7 Erythrocyte Invasion Machinery",
-        description=(
-            "Map the P. falciparum erythrocyte invasion machinery by finding "
-            "surface-exposed proteins (signal peptide or transmembrane) that "
-            "are annotated as invasion/merozoite-related, then excluding "
-            "var/RIFIN/STEVOR antigenic variation genes (which are surface "
-            "proteins but not invasion ligands). Represents a key research "
-            "area for vaccine and invasion-blocking antibody development."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "combine_1",
-            "displayName": "Invasion Machinery (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "combine_2",
-                "displayName": "Surface Invasion Proteins",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "combine_3",
-                    "displayName": "Surface-exposed",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "step_1",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(PF_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "step_2",
-                        "displayName": "Transmembrane Domains",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(PF_ORG, "1", "20"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "combine_4",
-                    "displayName": "Invasion Annotations",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "step_3",
-                        "displayName": "Invasion/Merozoite Text",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(
-                            PF_ORG, "invasion OR merozoite OR erythrocyte binding"
-                        ),
-                    },
-                    "secondaryInput": {
-                        "id": "step_4",
-                        "displayName": "AMA1/EBA/Rhoptry Text",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(
-                            PF_ORG, "AMA1 OR EBA OR rhoptry OR RON OR RAP"
-                        ),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "step_7",
-                "displayName": "Antigenic Variation Genes",
-                "searchName": "GenesByText",
-                "parameters": text_search_params(PF_ORG, "PfEMP1 OR rifin OR stevor"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Invasion ligands and receptors",
-            positive_ids=PF_INVASION[:80],
-            negative_ids=[
-                g for g in PF_ANTIGENIC_VARIATION[:80] if g not in set(PF_INVASION[:80])
-            ],
-            provenance_notes=(
-                "Positive set: invasion-annotated genes with signal peptide or "
-                "TM domains (surface invasion ligands like MSPs, AMA1, EBAs). "
-                "Negative set: var/RIFIN/STEVOR genes (surface but not invasion)."
-            ),
-            tags=[
-                "invasion",
-                "merozoite",
-                "vaccine-candidates",
-                "surface-antigens",
-            ],
-        ),
-    ),
-    # === Strategy 3: Exported Effector Proteome (9 nodes) ===
-    SeedDef(
-        name="PF3D7 Exported Effector Proteome",
-        description=(
-            "Identify P. falciparum proteins exported to the host erythrocyte "
-            "that carry enzymatic or chaperone function. Exported proteins "
-            "remodel the host cell for parasite survival; those with enzymatic "
-            "activity (kinases, proteases, chaperones/HSPs) are key effectors. "
-            "Uses ExportPred score combined with GO terms for enzyme and "
-            "chaperone activity. Critical for understanding host-parasite "
-            "interactions and cytoadherence."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "combine_1",
-            "displayName": "Exported Effectors",
-            "operator": "INTERSECT",
-            "primaryInput": {
-                "id": "step_1",
-                "displayName": "Exported Proteins (ExportPred >= 1.5)",
-                "searchName": "GenesByExportPrediction",
-                "parameters": _export_pred(PF_ORG, min_score=1.5),
-            },
-            "secondaryInput": {
-                "id": "combine_2",
-                "displayName": "Enzymatic/Chaperone Function",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "combine_3",
-                    "displayName": "Kinases + Proteases + Chaperones",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "combine_4",
-                        "displayName": "Kinases + Proteases",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "step_2",
-                            "displayName": "Protein Kinases",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(
-                                PF_ORG, "GO:0004672", evidence=PF_GO_EVIDENCE
-                            ),
-                        },
-                        "secondaryInput": {
-                            "id": "step_3",
-                            "displayName": "Proteases",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(
-                                PF_ORG, "GO:0008233", evidence=PF_GO_EVIDENCE
-                            ),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "step_4",
-                        "displayName": "Protein Folding / Chaperones",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(
-                            PF_ORG, "GO:0006457", evidence=PF_GO_EVIDENCE
-                        ),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "combine_5",
-                    "displayName": "Transporters + Exported Text",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "step_5",
-                        "displayName": "Transporter Activity",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(
-                            PF_ORG, "GO:0005215", evidence=PF_GO_EVIDENCE
-                        ),
-                    },
-                    "secondaryInput": {
-                        "id": "step_6",
-                        "displayName": "Exported/PEXEL/Maurer Text",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(
-                            PF_ORG, "exported OR PEXEL OR Maurer"
-                        ),
-                    },
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Exported effector proteins",
-            positive_ids=PF_EXPORTED[:80],
-            negative_ids=PF_RIBOSOMAL[:60] + PF_DNA_REPLICATION[:20],
-            provenance_notes=(
-                "Positive set: exported proteins (ExportPred>=1.5) with enzymatic "
-                "or chaperone activity. Negative set: ribosomal and DNA replication "
-                "proteins (intracellular housekeeping, not exported)."
-            ),
-            tags=[
-                "host-parasite-interface",
-                "exported-proteins",
-                "PEXEL",
-                "virulence",
-            ],
-        ),
-    ),
-    # === Strategy 4: Apicoplast Metabolic Drug Targets (7 nodes) ===
-    SeedDef(
-        name="PF3D7 Apicoplast Metabolic Drug Targets",
-        description=(
-            "Identify P. falciparum apicoplast-localized proteins involved in "
-            "metabolic pathways. The apicoplast is a relict plastid organelle "
-            "absent from humans, making its metabolic enzymes (fatty acid "
-            "synthesis, isoprenoid/MEP pathway, heme biosynthesis) ideal "
-            "drug targets. Combines apicoplast annotation with metabolic "
-            "pathway membership and signal peptide (for apicoplast transit)."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "combine_1",
-            "displayName": "Apicoplast Metabolic Targets",
-            "operator": "INTERSECT",
-            "primaryInput": {
-                "id": "combine_2",
-                "displayName": "Apicoplast + Signal Peptide",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "step_1",
-                    "displayName": "Apicoplast Text",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(PF_ORG, "apicoplast"),
-                },
-                "secondaryInput": {
-                    "id": "step_2",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(PF_ORG),
-                },
-            },
-            "secondaryInput": {
-                "id": "combine_3",
-                "displayName": "Metabolic Pathways",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "combine_4",
-                    "displayName": "Folate + Fatty Acid",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "step_3",
-                        "displayName": "Folate Biosynthesis",
-                        "searchName": "GenesByMetabolicPathway",
-                        "parameters": _metabolic_pathway(PF_ORG, "(ec00790) (KEGG)"),
-                    },
-                    "secondaryInput": {
-                        "id": "step_4",
-                        "displayName": "Fatty Acid Biosynthesis",
-                        "searchName": "GenesByMetabolicPathway",
-                        "parameters": _metabolic_pathway(PF_ORG, "(ec00061) (KEGG)"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "step_5",
-                    "displayName": "Glycolysis",
-                    "searchName": "GenesByMetabolicPathway",
-                    "parameters": _metabolic_pathway(PF_ORG, "(ec00010) (KEGG)"),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Apicoplast metabolic enzymes",
-            positive_ids=PF_APICOPLAST[:30],
-            negative_ids=PF_ANTIGENIC_VARIATION[:60] + PF_GAMETOCYTE[:20],
-            provenance_notes=(
-                "Positive set: apicoplast-annotated genes housing metabolic "
-                "pathways absent in humans (fatty acid synthesis, isoprenoid). "
-                "Negative set: var/rifin/stevor and gametocyte genes (surface or "
-                "sexual stage, not apicoplast metabolism)."
-            ),
-            tags=[
-                "apicoplast",
-                "metabolic-pathway",
-                "drug-target",
-                "essential-organelle",
-            ],
-        ),
-    ),
-    # === Strategy 5: Signal Peptide Genes (1 node - baseline) ===
-    SeedDef(
-        name="PF3D7 Signal Peptide Genes",
-        description=(
-            "Simple baseline strategy: all P. falciparum 3D7 genes with a "
-            "predicted signal peptide. This represents the secretome - "
-            "proteins that enter the secretory pathway. Used as a baseline "
-            "for comparison with more complex multi-step strategies."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "step_1",
-            "displayName": "Signal Peptide Genes",
-            "searchName": "GenesWithSignalPeptide",
-            "parameters": signal_peptide_params(PF_ORG),
-        },
-        control_set=ControlSetDef(
-            name="Secreted proteins (signal peptide)",
-            positive_ids=PF_SIGNAL_PEPTIDE[:80],
-            negative_ids=PF_DNA_REPLICATION[:40],
-            provenance_notes=(
-                "Positive set: genes with predicted signal peptide (secreted). "
-                "Negative set: DNA replication genes (nuclear, no signal peptide)."
-            ),
-            tags=["signal-peptide", "secretome", "baseline"],
-        ),
-    ),
-    # === Strategy 6: Transmission-Blocking Vaccine Candidates (7 nodes) ===
-    SeedDef(
-        name="PF3D7 Transmission-Blocking Vaccine Candidates",
-        description=(
-            "Identify candidate antigens for transmission-blocking vaccines "
-            "(TBVs). Finds surface-exposed or secreted proteins expressed "
-            "during gametocyte/sexual stages, excluding clonally variant "
-            "antigenic families (var, rifin, stevor). TBV candidates like "
-            "Pfs25, Pfs48/45, Pfs230 should appear in this set. Combines "
-            "signal peptide and transmembrane predictions with gametocyte "
-            "annotations."
-        ),
-        site_id="plasmodb",
-        step_tree={
-            "id": "combine_1",
-            "displayName": "TBV Candidates (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "combine_2",
-                "displayName": "Surface Gametocyte Proteins",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "combine_3",
-                    "displayName": "Surface-exposed",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "step_1",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(PF_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "step_2",
-                        "displayName": "Transmembrane Domains",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(PF_ORG, "1", "20"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "step_3",
-                    "displayName": "Gametocyte/Sexual Stage Text",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(
-                        PF_ORG,
-                        "gametocyte OR sexual stage OR ookinete OR Pfs25 OR Pfs48 OR Pfs230",
-                    ),
-                },
-            },
-            "secondaryInput": {
-                "id": "combine_4",
-                "displayName": "Clonally Variant Genes",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "step_5",
-                    "displayName": "PfEMP1/RIFIN/STEVOR",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(
-                        PF_ORG, "PfEMP1 OR rifin OR stevor"
-                    ),
-                },
-                "secondaryInput": {
-                    "id": "step_6",
-                    "displayName": "var/EMP Text",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(
-                        PF_ORG, "var gene OR erythrocyte membrane protein"
-                    ),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Gametocyte surface antigens for TBV",
-            positive_ids=PF_GAMETOCYTE[:30],
-            negative_ids=PF_ANTIGENIC_VARIATION[:60] + PF_DNA_REPLICATION[:20],
-            provenance_notes=(
-                "Positive set: gametocyte-annotated genes - sexual stage "
-                "surface proteins are TBV candidates. "
-                "Negative set: var/rifin/stevor (clonally variant, poor vaccine "
-                "targets) and DNA replication genes (intracellular)."
-            ),
-            tags=[
-                "transmission-blocking",
-                "vaccine",
-                "gametocyte",
-                "sexual-stage",
-            ],
-        ),
-    ),
-]
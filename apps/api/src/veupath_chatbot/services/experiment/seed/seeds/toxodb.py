@@ -1,2321 +0,0 @@
-"""Seed definitions for ToxoDB."""
-
-from veupath_chatbot.services.experiment.seed.helpers import (
-    ec_search_params,
-    go_search_params,
-    signal_peptide_params,
-    text_search_params,
-    transmembrane_params,
-)
-from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
-
-# ---------------------------------------------------------------------------
-# Organism constants
-# ---------------------------------------------------------------------------
-TG_ORG = "Toxoplasma gondii ME49"
-SITE_ID = "toxodb"
-
-TG_EC_SOURCES = [
-    "KEGG_Enzyme",
-    "MetabolicPath",
-    "GenBank",
-    "computationally inferred from Orthology",
-    "Uniprot",
-]
-
-
-# ---------------------------------------------------------------------------
-# Gene ID lists
-# ---------------------------------------------------------------------------
-
-# Protein kinase activity (GO:0004672) -- 150 genes
-PROTEIN_KINASES = [
-    "TGME49_201130",
-    "TGME49_202780",
-    "TGME49_203010",
-    "TGME49_204100",
-    "TGME49_204280",
-    "TGME49_205250",
-    "TGME49_205550",
-    "TGME49_206590",
-    "TGME49_207610",
-    "TGME49_207700",
-    "TGME49_207820",
-    "TGME49_209050",
-    "TGME49_209985",
-    "TGME49_210280",
-    "TGME49_210830",
-    "TGME49_211260",
-    "TGME49_212970",
-    "TGME49_215670",
-    "TGME49_215775",
-    "TGME49_215785",
-    "TGME49_217600",
-    "TGME49_218220",
-    "TGME49_218400",
-    "TGME49_218550",
-    "TGME49_218720",
-    "TGME49_219070",
-    "TGME49_219682",
-    "TGME49_221550",
-    "TGME49_222960",
-    "TGME49_224480",
-    "TGME49_224950",
-    "TGME49_225490",
-    "TGME49_225770",
-    "TGME49_225960",
-    "TGME49_226030",
-    "TGME49_226540",
-    "TGME49_227010",
-    "TGME49_227050",
-    "TGME49_227260",
-    "TGME49_227810",
-    "TGME49_228420",
-    "TGME49_228750",
-    "TGME49_229020",
-    "TGME49_229630",
-    "TGME49_230470",
-    "TGME49_231070",
-    "TGME49_233010",
-    "TGME49_233790",
-    "TGME49_233905",
-    "TGME49_234950",
-    "TGME49_234970",
-    "TGME49_235370",
-    "TGME49_235750",
-    "TGME49_236240",
-    "TGME49_236620",
-    "TGME49_237210",
-    "TGME49_237860",
-    "TGME49_237890",
-    "TGME49_239130",
-    "TGME49_239420",
-    "TGME49_239440",
-    "TGME49_239600",
-    "TGME49_239885",
-    "TGME49_239910",
-    "TGME49_240090",
-    "TGME49_240390",
-    "TGME49_240410",
-    "TGME49_240630",
-    "TGME49_240640",
-    "TGME49_242070",
-    "TGME49_242100",
-    "TGME49_242110",
-    "TGME49_242118",
-    "TGME49_242230",
-    "TGME49_242240",
-    "TGME49_242250",
-    "TGME49_242400",
-    "TGME49_243340",
-    "TGME49_243500",
-    "TGME49_244620",
-    "TGME49_245580",
-    "TGME49_247710",
-    "TGME49_249260",
-    "TGME49_249470",
-    "TGME49_250680",
-    "TGME49_250850",
-    "TGME49_252360",
-    "TGME49_252500",
-    "TGME49_253330",
-    "TGME49_253440",
-    "TGME49_253580",
-    "TGME49_253860",
-    "TGME49_253940",
-    "TGME49_254190",
-    "TGME49_254630",
-    "TGME49_255710",
-    "TGME49_256070",
-    "TGME49_256880",
-    "TGME49_258010",
-    "TGME49_258230",
-    "TGME49_258370",
-    "TGME49_258580",
-    "TGME49_258800",
-    "TGME49_260030",
-    "TGME49_262050",
-    "TGME49_262540",
-    "TGME49_262730",
-    "TGME49_263070",
-    "TGME49_263220",
-    "TGME49_265330",
-    "TGME49_266010",
-    "TGME49_266100",
-    "TGME49_266710",
-    "TGME49_266785",
-    "TGME49_266910",
-    "TGME49_266950",
-    "TGME49_267540",
-    "TGME49_268210",
-    "TGME49_268370",
-    "TGME49_269730",
-    "TGME49_270330",
-    "TGME49_270920",
-    "TGME49_272200",
-    "TGME49_272475",
-    "TGME49_272540",
-    "TGME49_273690",
-    "TGME49_274170",
-    "TGME49_275610",
-    "TGME49_276180",
-    "TGME49_278900",
-    "TGME49_281430",
-    "TGME49_281450",
-    "TGME49_281675",
-    "TGME49_283480",
-    "TGME49_283790",
-    "TGME49_285160",
-    "TGME49_286470",
-    "TGME49_288440",
-    "TGME49_289050",
-    "TGME49_289320",
-    "TGME49_290225",
-    "TGME49_291050",
-    "TGME49_292055",
-    "TGME49_292140",
-    "TGME49_293260",
-    "TGME49_294260",
-    "TGME49_294560",
-    "TGME49_295110",
-    "TGME49_295125",
-    "TGME49_295760",
-]
-
-# Dense granule proteins (text: "dense granule") -- 78 unique genes
-DENSE_GRANULE = [
-    "TGME49_200010",
-    "TGME49_202620",
-    "TGME49_203290",
-    "TGME49_203310",
-    "TGME49_203600",
-    "TGME49_204270",
-    "TGME49_204340",
-    "TGME49_208370",
-    "TGME49_208830",
-    "TGME49_212300",
-    "TGME49_212410",
-    "TGME49_213067",
-    "TGME49_215220",
-    "TGME49_215360",
-    "TGME49_217530",
-    "TGME49_217680",
-    "TGME49_219810",
-    "TGME49_220240",
-    "TGME49_220890",
-    "TGME49_222170",
-    "TGME49_226380",
-    "TGME49_226420",
-    "TGME49_227280",
-    "TGME49_227620",
-    "TGME49_228170",
-    "TGME49_230180",
-    "TGME49_230705",
-    "TGME49_231960",
-    "TGME49_232000",
-    "TGME49_236870",
-    "TGME49_236890",
-    "TGME49_237015",
-    "TGME49_237800",
-    "TGME49_237880",
-    "TGME49_239740",
-    "TGME49_241240",
-    "TGME49_241610",
-    "TGME49_243940",
-    "TGME49_244530",
-    "TGME49_245432",
-    "TGME49_247440",
-    "TGME49_249990",
-    "TGME49_251540",
-    "TGME49_254000",
-    "TGME49_254720",
-    "TGME49_260520",
-    "TGME49_267740",
-    "TGME49_268790",
-    "TGME49_268900",
-    "TGME49_269690",
-    "TGME49_269950",
-    "TGME49_270250",
-    "TGME49_272460",
-    "TGME49_273980",
-    "TGME49_275440",
-    "TGME49_275470",
-    "TGME49_275850",
-    "TGME49_275860",
-    "TGME49_277230",
-    "TGME49_286450",
-    "TGME49_288650",
-    "TGME49_288840",
-    "TGME49_289380",
-    "TGME49_290700",
-    "TGME49_297880",
-    "TGME49_297900",
-    "TGME49_299780",
-    "TGME49_308970",
-    "TGME49_309600",
-    "TGME49_309760",
-    "TGME49_309930",
-    "TGME49_310780",
-    "TGME49_312420",
-    "TGME49_313440",
-    "TGME49_316250",
-    "TGME49_319340",
-    "TGME49_320490",
-    "TGME49_500312",
-]
-
-# Rhoptry proteins (text: "rhoptry") -- 87 unique genes
-RHOPTRY = [
-    "TGME49_201130",
-    "TGME49_202780",
-    "TGME49_203990",
-    "TGME49_205250",
-    "TGME49_207610",
-    "TGME49_207700",
-    "TGME49_209985",
-    "TGME49_210095",
-    "TGME49_210370",
-    "TGME49_211260",
-    "TGME49_211290",
-    "TGME49_215775",
-    "TGME49_215785",
-    "TGME49_218270",
-    "TGME49_223920",
-    "TGME49_227010",
-    "TGME49_227810",
-    "TGME49_229010",
-    "TGME49_230350",
-    "TGME49_230470",
-    "TGME49_232020",
-    "TGME49_235130",
-    "TGME49_239600",
-    "TGME49_240090",
-    "TGME49_241000",
-    "TGME49_242100",
-    "TGME49_242110",
-    "TGME49_242230",
-    "TGME49_242240",
-    "TGME49_243730",
-    "TGME49_247195",
-    "TGME49_249470",
-    "TGME49_252360",
-    "TGME49_253370",
-    "TGME49_258230",
-    "TGME49_258370",
-    "TGME49_258580",
-    "TGME49_258660",
-    "TGME49_258800",
-    "TGME49_261740",
-    "TGME49_261750",
-    "TGME49_262050",
-    "TGME49_262730",
-    "TGME49_263220",
-    "TGME49_266100",
-    "TGME49_269885",
-    "TGME49_270920",
-    "TGME49_281675",
-    "TGME49_291960",
-    "TGME49_294400",
-    "TGME49_294560",
-    "TGME49_295105",
-    "TGME49_295110",
-    "TGME49_295125",
-    "TGME49_296000",
-    "TGME49_296015",
-    "TGME49_297960",
-    "TGME49_300100",
-    "TGME49_304740",
-    "TGME49_306060",
-    "TGME49_306490",
-    "TGME49_308090",
-    "TGME49_308093",
-    "TGME49_308096",
-    "TGME49_308810",
-    "TGME49_309590",
-    "TGME49_310010",
-    "TGME49_311470",
-    "TGME49_312270",
-    "TGME49_313330",
-    "TGME49_314250",
-    "TGME49_315160",
-    "TGME49_315210",
-    "TGME49_315220",
-    "TGME49_315490",
-    "TGME49_315940",
-    "TGME49_321650",
-    "TGME49_322120",
-    "TGME49_327200",
-    "TGME49_500059",
-    "TGME49_500106",
-    "TGME49_500167",
-    "TGME49_500245",
-    "TGME49_500317",
-    "TGME49_500375",
-    "TGME49_500376",
-    "TGME49_500398",
-    "TGME49_500405",
-]
-
-# Microneme proteins (text: "microneme") -- 28 genes
-MICRONEME = [
-    "TGME49_200230",
-    "TGME49_200240",
-    "TGME49_200250",
-    "TGME49_201780",
-    "TGME49_204530",
-    "TGME49_208030",
-    "TGME49_208730",
-    "TGME49_208740",
-    "TGME49_218520",
-    "TGME49_222188",
-    "TGME49_234380",
-    "TGME49_244180",
-    "TGME49_245485",
-    "TGME49_245490",
-    "TGME49_250710",
-    "TGME49_254430",
-    "TGME49_260190",
-    "TGME49_261780",
-    "TGME49_265790",
-    "TGME49_267680",
-    "TGME49_275798",
-    "TGME49_277080",
-    "TGME49_283540",
-    "TGME49_286740",
-    "TGME49_289630",
-    "TGME49_291890",
-    "TGME49_294790",
-    "TGME49_319560",
-]
-
-# SRS domain-containing surface antigens (text: "SRS domain") -- 120 unique genes
-SRS_SURFACE_ANTIGENS = [
-    "TGME49_200270",
-    "TGME49_200280",
-    "TGME49_200430",
-    "TGME49_201230",
-    "TGME49_201670",
-    "TGME49_201710",
-    "TGME49_201850",
-    "TGME49_202120",
-    "TGME49_202240",
-    "TGME49_202285",
-    "TGME49_202400",
-    "TGME49_202410",
-    "TGME49_202460",
-    "TGME49_202490",
-    "TGME49_202568",
-    "TGME49_202720",
-    "TGME49_202750",
-    "TGME49_202840",
-    "TGME49_202850",
-    "TGME49_202870",
-    "TGME49_203050",
-    "TGME49_203170",
-    "TGME49_203220",
-    "TGME49_203270",
-    "TGME49_203300",
-    "TGME49_203340",
-    "TGME49_203370",
-    "TGME49_203375",
-    "TGME49_203380",
-    "TGME49_203390",
-    "TGME49_203420",
-    "TGME49_203500",
-    "TGME49_203510",
-    "TGME49_203690",
-    "TGME49_203710",
-    "TGME49_203830",
-    "TGME49_203840",
-    "TGME49_203900",
-    "TGME49_203910",
-    "TGME49_203950",
-    "TGME49_204140",
-    "TGME49_204160",
-    "TGME49_204440",
-    "TGME49_204480",
-    "TGME49_204510",
-    "TGME49_204540",
-    "TGME49_204870",
-    "TGME49_205150",
-    "TGME49_205160",
-    "TGME49_205402",
-    "TGME49_205460",
-    "TGME49_205540",
-    "TGME49_205558",
-    "TGME49_205600",
-    "TGME49_205650",
-    "TGME49_205658",
-    "TGME49_205662",
-    "TGME49_205720",
-    "TGME49_206330",
-    "TGME49_206360",
-    "TGME49_206400",
-    "TGME49_206440",
-    "TGME49_206560",
-    "TGME49_206620",
-    "TGME49_206650",
-    "TGME49_207015",
-    "TGME49_207180",
-    "TGME49_207600",
-    "TGME49_207620",
-    "TGME49_207630",
-    "TGME49_207650",
-    "TGME49_207665",
-    "TGME49_207720",
-    "TGME49_207760",
-    "TGME49_207770",
-    "TGME49_208020",
-    "TGME49_208200",
-    "TGME49_208310",
-    "TGME49_208330",
-    "TGME49_208340",
-    "TGME49_208540",
-    "TGME49_208750",
-    "TGME49_208842",
-    "TGME49_209000",
-    "TGME49_209060",
-    "TGME49_209100",
-    "TGME49_209180",
-    "TGME49_209190",
-    "TGME49_209210",
-    "TGME49_209280",
-    "TGME49_209300",
-    "TGME49_209520",
-    "TGME49_209630",
-    "TGME49_209720",
-    "TGME49_209790",
-    "TGME49_209860",
-    "TGME49_209920",
-    "TGME49_210390",
-    "TGME49_210408",
-    "TGME49_210430",
-    "TGME49_210678",
-    "TGME49_210700",
-    "TGME49_210750",
-    "TGME49_210778",
-    "TGME49_211010",
-    "TGME49_211270",
-    "TGME49_211350",
-    "TGME49_211400",
-    "TGME49_211640",
-    "TGME49_211670",
-    "TGME49_211700",
-    "TGME49_211720",
-    "TGME49_211890",
-    "TGME49_212170",
-    "TGME49_212250",
-    "TGME49_212850",
-    "TGME49_212930",
-    "TGME49_212980",
-    "TGME49_213060",
-    "TGME49_213325",
-]
-
-# Signal peptide genes (GenesWithSignalPeptide) -- 199 unique genes
-SIGNAL_PEPTIDE = [
-    "TGME49_200240",
-    "TGME49_200250",
-    "TGME49_200270",
-    "TGME49_200360",
-    "TGME49_201100",
-    "TGME49_201130",
-    "TGME49_201180",
-    "TGME49_201390",
-    "TGME49_201520",
-    "TGME49_201630",
-    "TGME49_201660",
-    "TGME49_201730",
-    "TGME49_201780",
-    "TGME49_201860",
-    "TGME49_202050",
-    "TGME49_202090",
-    "TGME49_202100",
-    "TGME49_202110",
-    "TGME49_202205",
-    "TGME49_202620",
-    "TGME49_202650",
-    "TGME49_202810",
-    "TGME49_202910",
-    "TGME49_203290",
-    "TGME49_203310",
-    "TGME49_203330",
-    "TGME49_203450",
-    "TGME49_203688",
-    "TGME49_203720",
-    "TGME49_203790",
-    "TGME49_203990",
-    "TGME49_204000",
-    "TGME49_204050",
-    "TGME49_204080",
-    "TGME49_204090",
-    "TGME49_204270",
-    "TGME49_204340",
-    "TGME49_204350",
-    "TGME49_204410",
-    "TGME49_204420",
-    "TGME49_204520",
-    "TGME49_204530",
-    "TGME49_205090",
-    "TGME49_205210",
-    "TGME49_205360",
-    "TGME49_205410",
-    "TGME49_205450",
-    "TGME49_205615",
-    "TGME49_205662",
-    "TGME49_205680",
-    "TGME49_206350",
-    "TGME49_206440",
-    "TGME49_206510",
-    "TGME49_206610",
-    "TGME49_206910",
-    "TGME49_207010",
-    "TGME49_207180",
-    "TGME49_207610",
-    "TGME49_207630",
-    "TGME49_207740",
-    "TGME49_207930",
-    "TGME49_207955",
-    "TGME49_208030",
-    "TGME49_208370",
-    "TGME49_208380",
-    "TGME49_208430",
-    "TGME49_208450",
-    "TGME49_208770",
-    "TGME49_208830",
-    "TGME49_208850",
-    "TGME49_208980",
-    "TGME49_209060",
-    "TGME49_209150",
-    "TGME49_209170",
-    "TGME49_209470",
-    "TGME49_209610",
-    "TGME49_209620",
-    "TGME49_209705",
-    "TGME49_209755",
-    "TGME49_209920",
-    "TGME49_209950",
-    "TGME49_209985",
-    "TGME49_210095",
-    "TGME49_210320",
-    "TGME49_210330",
-    "TGME49_210370",
-    "TGME49_210600",
-    "TGME49_210740",
-    "TGME49_210770",
-    "TGME49_211290",
-    "TGME49_211320",
-    "TGME49_211480",
-    "TGME49_211680",
-    "TGME49_211860",
-    "TGME49_212280",
-    "TGME49_212410",
-    "TGME49_212850",
-    "TGME49_213067",
-    "TGME49_213115",
-    "TGME49_213280",
-    "TGME49_213310",
-    "TGME49_213520",
-    "TGME49_213880",
-    "TGME49_214080",
-    "TGME49_214190",
-    "TGME49_214220",
-    "TGME49_214290",
-    "TGME49_214570",
-    "TGME49_214780",
-    "TGME49_214850",
-    "TGME49_214940",
-    "TGME49_215055",
-    "TGME49_215160",
-    "TGME49_215520",
-    "TGME49_215540",
-    "TGME49_215775",
-    "TGME49_215785",
-    "TGME49_215910",
-    "TGME49_216053",
-    "TGME49_216090",
-    "TGME49_216170",
-    "TGME49_216180",
-    "TGME49_216200",
-    "TGME49_216290",
-    "TGME49_216720",
-    "TGME49_216770",
-    "TGME49_216875",
-    "TGME49_217370",
-    "TGME49_217400",
-    "TGME49_217420",
-    "TGME49_217490",
-    "TGME49_217520",
-    "TGME49_217530",
-    "TGME49_217590",
-    "TGME49_217710",
-    "TGME49_217740",
-    "TGME49_218470",
-    "TGME49_218540",
-    "TGME49_218860",
-    "TGME49_218910",
-    "TGME49_219130",
-    "TGME49_219348",
-    "TGME49_219370",
-    "TGME49_219742",
-    "TGME49_220025",
-    "TGME49_220280",
-    "TGME49_220330",
-    "TGME49_220630",
-    "TGME49_221180",
-    "TGME49_221210",
-    "TGME49_221330",
-    "TGME49_221930",
-    "TGME49_222020",
-    "TGME49_222170",
-    "TGME49_222300",
-    "TGME49_222880",
-    "TGME49_222935",
-    "TGME49_223400",
-    "TGME49_223430",
-    "TGME49_223440",
-    "TGME49_223550",
-    "TGME49_223700",
-    "TGME49_223770",
-    "TGME49_223830",
-    "TGME49_223920",
-    "TGME49_224060",
-    "TGME49_224170",
-    "TGME49_224710",
-    "TGME49_224830",
-    "TGME49_225150",
-    "TGME49_225160",
-    "TGME49_225200",
-    "TGME49_225220",
-    "TGME49_225250",
-    "TGME49_225290",
-    "TGME49_225320",
-    "TGME49_225330",
-    "TGME49_225350",
-    "TGME49_225400",
-    "TGME49_225460",
-    "TGME49_225830",
-    "TGME49_226270",
-    "TGME49_226380",
-    "TGME49_226420",
-    "TGME49_226705",
-    "TGME49_226710",
-    "TGME49_226730",
-    "TGME49_226860",
-    "TGME49_227090",
-    "TGME49_227330",
-    "TGME49_227400",
-    "TGME49_227620",
-    "TGME49_227930",
-    "TGME49_227970",
-    "TGME49_228110",
-    "TGME49_228370",
-    "TGME49_228390",
-    "TGME49_228430",
-    "TGME49_228620",
-]
-
-# Transmembrane domain genes (GenesByTransmembraneDomains, 1+) -- 199 unique genes
-TRANSMEMBRANE = [
-    "TGME49_200130",
-    "TGME49_200230",
-    "TGME49_200290",
-    "TGME49_200350",
-    "TGME49_200440",
-    "TGME49_200480",
-    "TGME49_200590",
-    "TGME49_200700",
-    "TGME49_201110",
-    "TGME49_201130",
-    "TGME49_201150",
-    "TGME49_201180",
-    "TGME49_201260",
-    "TGME49_201390",
-    "TGME49_201670",
-    "TGME49_201690",
-    "TGME49_201780",
-    "TGME49_201840",
-    "TGME49_201860",
-    "TGME49_202050",
-    "TGME49_202100",
-    "TGME49_202160",
-    "TGME49_202250",
-    "TGME49_202285",
-    "TGME49_202290",
-    "TGME49_202375",
-    "TGME49_202420",
-    "TGME49_202440",
-    "TGME49_202450",
-    "TGME49_202500",
-    "TGME49_202510",
-    "TGME49_202530",
-    "TGME49_202540",
-    "TGME49_202572",
-    "TGME49_202610",
-    "TGME49_202620",
-    "TGME49_202630",
-    "TGME49_202650",
-    "TGME49_202780",
-    "TGME49_202800",
-    "TGME49_202860",
-    "TGME49_202940",
-    "TGME49_203030",
-    "TGME49_203070",
-    "TGME49_203240",
-    "TGME49_203300",
-    "TGME49_203310",
-    "TGME49_203340",
-    "TGME49_203350",
-    "TGME49_203400",
-    "TGME49_203420",
-    "TGME49_203505",
-    "TGME49_203510",
-    "TGME49_203600",
-    "TGME49_203682",
-    "TGME49_203700",
-    "TGME49_203720",
-    "TGME49_203770",
-    "TGME49_203930",
-    "TGME49_203970",
-    "TGME49_203990",
-    "TGME49_204000",
-    "TGME49_204040",
-    "TGME49_204060",
-    "TGME49_204270",
-    "TGME49_204300",
-    "TGME49_204310",
-    "TGME49_204320",
-    "TGME49_204340",
-    "TGME49_204360",
-    "TGME49_204870",
-    "TGME49_205030",
-    "TGME49_205040",
-    "TGME49_205100",
-    "TGME49_205120",
-    "TGME49_205150",
-    "TGME49_205160",
-    "TGME49_205240",
-    "TGME49_205250",
-    "TGME49_205265",
-    "TGME49_205280",
-    "TGME49_205300",
-    "TGME49_205330",
-    "TGME49_205350",
-    "TGME49_205360",
-    "TGME49_205370",
-    "TGME49_205450",
-    "TGME49_205490",
-    "TGME49_205520",
-    "TGME49_205600",
-    "TGME49_205625",
-    "TGME49_205680",
-    "TGME49_205690",
-    "TGME49_205740",
-    "TGME49_206290",
-    "TGME49_206310",
-    "TGME49_206320",
-    "TGME49_206340",
-    "TGME49_206350",
-    "TGME49_206510",
-    "TGME49_206540",
-    "TGME49_206630",
-    "TGME49_206690",
-    "TGME49_207050",
-    "TGME49_207070",
-    "TGME49_207150",
-    "TGME49_207160",
-    "TGME49_207170",
-    "TGME49_207180",
-    "TGME49_207420",
-    "TGME49_207710",
-    "TGME49_207780",
-    "TGME49_207910",
-    "TGME49_207920",
-    "TGME49_207950",
-    "TGME49_207980",
-    "TGME49_208010",
-    "TGME49_208040",
-    "TGME49_208050",
-    "TGME49_208330",
-    "TGME49_208360",
-    "TGME49_208370",
-    "TGME49_208410",
-    "TGME49_208420",
-    "TGME49_208550",
-    "TGME49_208560",
-    "TGME49_208580",
-    "TGME49_208730",
-    "TGME49_208740",
-    "TGME49_208842",
-    "TGME49_209060",
-    "TGME49_209120",
-    "TGME49_209190",
-    "TGME49_209250",
-    "TGME49_209510",
-    "TGME49_209530",
-    "TGME49_209580",
-    "TGME49_209583",
-    "TGME49_209585",
-    "TGME49_209590",
-    "TGME49_209700",
-    "TGME49_209710",
-    "TGME49_209720",
-    "TGME49_209790",
-    "TGME49_209800",
-    "TGME49_209810",
-    "TGME49_209820",
-    "TGME49_209940",
-    "TGME49_209945",
-    "TGME49_210095",
-    "TGME49_210255",
-    "TGME49_210330",
-    "TGME49_210380",
-    "TGME49_210400",
-    "TGME49_210412",
-    "TGME49_210420",
-    "TGME49_210450",
-    "TGME49_210790",
-    "TGME49_210820",
-    "TGME49_211040",
-    "TGME49_211240",
-    "TGME49_211270",
-    "TGME49_211350",
-    "TGME49_211360",
-    "TGME49_211450",
-    "TGME49_211480",
-    "TGME49_211640",
-    "TGME49_211710",
-    "TGME49_211860",
-    "TGME49_211870",
-    "TGME49_212100",
-    "TGME49_212130",
-    "TGME49_212200",
-    "TGME49_212300",
-    "TGME49_212310",
-    "TGME49_212410",
-    "TGME49_212735",
-    "TGME49_212910",
-    "TGME49_212980",
-    "TGME49_212990",
-    "TGME49_213050",
-    "TGME49_213067",
-    "TGME49_213100",
-    "TGME49_213240",
-    "TGME49_213310",
-    "TGME49_213325",
-    "TGME49_213490",
-    "TGME49_213520",
-    "TGME49_213550",
-    "TGME49_213570",
-    "TGME49_213610",
-    "TGME49_213670",
-    "TGME49_213746",
-    "TGME49_213760",
-    "TGME49_213790",
-    "TGME49_213840",
-    "TGME49_213850",
-    "TGME49_213910",
-    "TGME49_213950",
-]
-
-# Peptidase/protease activity (GO:0008233) -- 150 genes
-PROTEASES = [
-    "TGME49_200290",
-    "TGME49_200350",
-    "TGME49_201840",
-    "TGME49_202310",
-    "TGME49_202630",
-    "TGME49_202680",
-    "TGME49_202910",
-    "TGME49_203270",
-    "TGME49_203420",
-    "TGME49_204040",
-    "TGME49_204050",
-    "TGME49_204360",
-    "TGME49_206450",
-    "TGME49_206490",
-    "TGME49_206510",
-    "TGME49_206630",
-    "TGME49_207650",
-    "TGME49_209620",
-    "TGME49_210678",
-    "TGME49_210730",
-    "TGME49_210781",
-    "TGME49_211330",
-    "TGME49_212910",
-    "TGME49_213060",
-    "TGME49_213870",
-    "TGME49_214470",
-    "TGME49_214490",
-    "TGME49_215010",
-    "TGME49_216150",
-    "TGME49_216440",
-    "TGME49_216450",
-    "TGME49_217160",
-    "TGME49_218920",
-    "TGME49_219485",
-    "TGME49_221170",
-    "TGME49_221310",
-    "TGME49_221540",
-    "TGME49_221610",
-    "TGME49_221830",
-    "TGME49_223450",
-    "TGME49_223590",
-    "TGME49_223845",
-    "TGME49_224350",
-    "TGME49_224460",
-    "TGME49_225850",
-    "TGME49_226420",
-    "TGME49_226920",
-    "TGME49_226940",
-    "TGME49_227370",
-    "TGME49_227948",
-    "TGME49_228190",
-    "TGME49_229030",
-    "TGME49_229650",
-    "TGME49_229710",
-    "TGME49_231060",
-    "TGME49_231970",
-    "TGME49_233310",
-    "TGME49_235390",
-    "TGME49_235680",
-    "TGME49_235860",
-    "TGME49_235950",
-    "TGME49_236210",
-    "TGME49_237150",
-    "TGME49_237894",
-    "TGME49_237900",
-    "TGME49_239500",
-    "TGME49_240240",
-    "TGME49_242290",
-    "TGME49_242720",
-    "TGME49_243210",
-    "TGME49_243298",
-    "TGME49_243350",
-    "TGME49_243430",
-    "TGME49_243510",
-    "TGME49_244480",
-    "TGME49_244490",
-    "TGME49_245500",
-    "TGME49_245590",
-    "TGME49_246020",
-    "TGME49_246550",
-    "TGME49_246800",
-    "TGME49_247240",
-    "TGME49_248470",
-    "TGME49_248710",
-    "TGME49_248760",
-    "TGME49_248850",
-    "TGME49_249350",
-    "TGME49_249590",
-    "TGME49_249670",
-    "TGME49_251490",
-    "TGME49_251500",
-    "TGME49_251510",
-    "TGME49_251570",
-    "TGME49_251760",
-    "TGME49_252440",
-    "TGME49_253170",
-    "TGME49_254010",
-    "TGME49_254430",
-    "TGME49_254690",
-    "TGME49_254900",
-    "TGME49_255180",
-    "TGME49_256780",
-    "TGME49_257010",
-    "TGME49_257110",
-    "TGME49_257730",
-    "TGME49_258150",
-    "TGME49_258780",
-    "TGME49_259260",
-    "TGME49_261080",
-    "TGME49_261530",
-    "TGME49_261600",
-    "TGME49_262825",
-    "TGME49_262920",
-    "TGME49_262940",
-    "TGME49_263290",
-    "TGME49_263420",
-    "TGME49_263470",
-    "TGME49_265190",
-    "TGME49_265780",
-    "TGME49_266140",
-    "TGME49_267050",
-    "TGME49_267080",
-    "TGME49_267490",
-    "TGME49_268590",
-    "TGME49_268910",
-    "TGME49_269250",
-    "TGME49_269840",
-    "TGME49_269885",
-    "TGME49_271070",
-    "TGME49_271870",
-    "TGME49_272230",
-    "TGME49_272510",
-    "TGME49_272670",
-    "TGME49_274110",
-    "TGME49_276130",
-    "TGME49_277850",
-    "TGME49_277895",
-    "TGME49_278050",
-    "TGME49_278975",
-    "TGME49_280710",
-    "TGME49_280720",
-    "TGME49_280740",
-    "TGME49_286120",
-    "TGME49_286800",
-    "TGME49_287210",
-    "TGME49_288510",
-    "TGME49_289330",
-    "TGME49_289620",
-    "TGME49_289780",
-    "TGME49_290005",
-]
-
-# Ribosomal proteins (GO:0003735) -- 113 unique genes (NEGATIVE CONTROL)
-RIBOSOMAL = [
-    "TGME49_202350",
-    "TGME49_203630",
-    "TGME49_204020",
-    "TGME49_205340",
-    "TGME49_207440",
-    "TGME49_207840",
-    "TGME49_207940",
-    "TGME49_209290",
-    "TGME49_209430",
-    "TGME49_209710",
-    "TGME49_210690",
-    "TGME49_211870",
-    "TGME49_212290",
-    "TGME49_213350",
-    "TGME49_213580",
-    "TGME49_214870",
-    "TGME49_215460",
-    "TGME49_215470",
-    "TGME49_216010",
-    "TGME49_216040",
-    "TGME49_217570",
-    "TGME49_217590",
-    "TGME49_217670",
-    "TGME49_218410",
-    "TGME49_218850",
-    "TGME49_219770",
-    "TGME49_220150",
-    "TGME49_220300",
-    "TGME49_222990",
-    "TGME49_223050",
-    "TGME49_223660",
-    "TGME49_225080",
-    "TGME49_225240",
-    "TGME49_225250",
-    "TGME49_226280",
-    "TGME49_226970",
-    "TGME49_227360",
-    "TGME49_227600",
-    "TGME49_228470",
-    "TGME49_229250",
-    "TGME49_229670",
-    "TGME49_230050",
-    "TGME49_231080",
-    "TGME49_231120",
-    "TGME49_232230",
-    "TGME49_232300",
-    "TGME49_232710",
-    "TGME49_234450",
-    "TGME49_234550",
-    "TGME49_238010",
-    "TGME49_238250",
-    "TGME49_239100",
-    "TGME49_239330",
-    "TGME49_239720",
-    "TGME49_239760",
-    "TGME49_242330",
-    "TGME49_242340",
-    "TGME49_243480",
-    "TGME49_243570",
-    "TGME49_244580",
-    "TGME49_245460",
-    "TGME49_245620",
-    "TGME49_245680",
-    "TGME49_246000",
-    "TGME49_248390",
-    "TGME49_248480",
-    "TGME49_249250",
-    "TGME49_250810",
-    "TGME49_251950",
-    "TGME49_252270",
-    "TGME49_253800",
-    "TGME49_254380",
-    "TGME49_254400",
-    "TGME49_254440",
-    "TGME49_254620",
-    "TGME49_259240",
-    "TGME49_260260",
-    "TGME49_260660",
-    "TGME49_261380",
-    "TGME49_261510",
-    "TGME49_262670",
-    "TGME49_262690",
-    "TGME49_263020",
-    "TGME49_263040",
-    "TGME49_263050",
-    "TGME49_263550",
-    "TGME49_263700",
-    "TGME49_266060",
-    "TGME49_266070",
-    "TGME49_267060",
-    "TGME49_267400",
-    "TGME49_268685",
-    "TGME49_270380",
-    "TGME49_273060",
-    "TGME49_275330",
-    "TGME49_278220",
-    "TGME49_284560",
-    "TGME49_284660",
-    "TGME49_285530",
-    "TGME49_285970",
-    "TGME49_286610",
-    "TGME49_288610",
-    "TGME49_288720",
-    "TGME49_289140",
-    "TGME49_289230",
-    "TGME49_289530",
-    "TGME49_289750",
-    "TGME49_291850",
-    "TGME49_292130",
-    "TGME49_293310",
-    "TGME49_293600",
-    "TGME49_297170",
-    "TGME49_299050",
-    "TGME49_300000",
-    "TGME49_300190",
-]
-
-# Translation machinery (GO:0006412) -- 100 genes (NEGATIVE CONTROL)
-TRANSLATION = [
-    "TGME49_202350",
-    "TGME49_202530",
-    "TGME49_203630",
-    "TGME49_204020",
-    "TGME49_204160",
-    "TGME49_205340",
-    "TGME49_205710",
-    "TGME49_206360",
-    "TGME49_207440",
-    "TGME49_207630",
-    "TGME49_207640",
-    "TGME49_207840",
-    "TGME49_207900",
-    "TGME49_207940",
-    "TGME49_209010",
-    "TGME49_209290",
-    "TGME49_209710",
-    "TGME49_210690",
-    "TGME49_210750",
-    "TGME49_210840",
-    "TGME49_211410",
-    "TGME49_211870",
-    "TGME49_212290",
-    "TGME49_213350",
-    "TGME49_213580",
-    "TGME49_214870",
-    "TGME49_215460",
-    "TGME49_215470",
-    "TGME49_216010",
-    "TGME49_216040",
-    "TGME49_216500",
-    "TGME49_216530",
-    "TGME49_216700",
-    "TGME49_217460",
-    "TGME49_217570",
-    "TGME49_217590",
-    "TGME49_217620",
-    "TGME49_217670",
-    "TGME49_217820",
-    "TGME49_218410",
-    "TGME49_218850",
-    "TGME49_219140",
-    "TGME49_219430",
-    "TGME49_219540",
-    "TGME49_219770",
-    "TGME49_219850",
-    "TGME49_220150",
-    "TGME49_220300",
-    "TGME49_220350",
-    "TGME49_222860",
-    "TGME49_222990",
-    "TGME49_223050",
-    "TGME49_223410",
-    "TGME49_223660",
-    "TGME49_223970",
-    "TGME49_224235",
-    "TGME49_225080",
-    "TGME49_225240",
-    "TGME49_225250",
-    "TGME49_226280",
-    "TGME49_226410",
-    "TGME49_226970",
-    "TGME49_227360",
-    "TGME49_227600",
-    "TGME49_228190",
-    "TGME49_228470",
-    "TGME49_229250",
-    "TGME49_229670",
-    "TGME49_230050",
-    "TGME49_231080",
-    "TGME49_231120",
-    "TGME49_232300",
-    "TGME49_232710",
-    "TGME49_233860",
-    "TGME49_234450",
-    "TGME49_234505",
-    "TGME49_234550",
-    "TGME49_235540",
-    "TGME49_238010",
-    "TGME49_238250",
-    "TGME49_239100",
-    "TGME49_239330",
-    "TGME49_239720",
-    "TGME49_239760",
-    "TGME49_241870",
-    "TGME49_242330",
-    "TGME49_242340",
-    "TGME49_243480",
-    "TGME49_243570",
-    "TGME49_244580",
-    "TGME49_244650",
-    "TGME49_245460",
-    "TGME49_245620",
-    "TGME49_245680",
-    "TGME49_246000",
-    "TGME49_248390",
-    "TGME49_248480",
-    "TGME49_249250",
-    "TGME49_249370",
-    "TGME49_250810",
-]
-
-# Transporters (GO:0055085 -- transmembrane transport) -- 100 genes
-TRANSPORTERS = [
-    "TGME49_201260",
-    "TGME49_201850",
-    "TGME49_202880",
-    "TGME49_203500",
-    "TGME49_204370",
-    "TGME49_204400",
-    "TGME49_205265",
-    "TGME49_205520",
-    "TGME49_207910",
-    "TGME49_208050",
-    "TGME49_208590",
-    "TGME49_209190",
-    "TGME49_209800",
-    "TGME49_210820",
-    "TGME49_212310",
-    "TGME49_212990",
-    "TGME49_213840",
-    "TGME49_214320",
-    "TGME49_215385",
-    "TGME49_215450",
-    "TGME49_215490",
-    "TGME49_216710",
-    "TGME49_216820",
-    "TGME49_218280",
-    "TGME49_219650",
-    "TGME49_219800",
-    "TGME49_220930",
-    "TGME49_221350",
-    "TGME49_222060",
-    "TGME49_224960",
-    "TGME49_225530",
-    "TGME49_226000",
-    "TGME49_226020",
-    "TGME49_226060",
-    "TGME49_228200",
-    "TGME49_228680",
-    "TGME49_229150",
-    "TGME49_229170",
-    "TGME49_229405",
-    "TGME49_230570",
-    "TGME49_231420",
-    "TGME49_231910",
-    "TGME49_232830",
-    "TGME49_233130",
-    "TGME49_233540",
-    "TGME49_233710",
-    "TGME49_235150",
-    "TGME49_235880",
-    "TGME49_236960",
-    "TGME49_237700",
-    "TGME49_239020",
-    "TGME49_239080",
-    "TGME49_240080",
-    "TGME49_242460",
-    "TGME49_244440",
-    "TGME49_246560",
-    "TGME49_247652",
-    "TGME49_248170",
-    "TGME49_248320",
-    "TGME49_248330",
-    "TGME49_248670",
-    "TGME49_248840",
-    "TGME49_248950",
-    "TGME49_249160",
-    "TGME49_249200",
-    "TGME49_249580",
-    "TGME49_249720",
-    "TGME49_249820",
-    "TGME49_249900",
-    "TGME49_249910",
-    "TGME49_251470",
-    "TGME49_251630",
-    "TGME49_252640",
-    "TGME49_253130",
-    "TGME49_253640",
-    "TGME49_253700",
-    "TGME49_254080",
-    "TGME49_254580",
-    "TGME49_256970",
-    "TGME49_257000",
-    "TGME49_257120",
-    "TGME49_257530",
-    "TGME49_258120",
-    "TGME49_258700",
-    "TGME49_259010",
-    "TGME49_259200",
-    "TGME49_260310",
-    "TGME49_261070",
-    "TGME49_261720",
-    "TGME49_261950",
-    "TGME49_262710",
-    "TGME49_262810",
-    "TGME49_263240",
-    "TGME49_263260",
-    "TGME49_263300",
-    "TGME49_263480",
-    "TGME49_263740",
-    "TGME49_265500",
-    "TGME49_266750",
-    "TGME49_266870",
-]
-
-# Heat shock / chaperone proteins (text: "heat shock") -- 32 genes
-HEAT_SHOCK = [
-    "TGME49_207970",
-    "TGME49_215040",
-    "TGME49_216590",
-    "TGME49_220910",
-    "TGME49_229180",
-    "TGME49_229350",
-    "TGME49_231600",
-    "TGME49_232940",
-    "TGME49_244560",
-    "TGME49_247550",
-    "TGME49_251780",
-    "TGME49_255390",
-    "TGME49_260270",
-    "TGME49_264752",
-    "TGME49_265310",
-    "TGME49_267470",
-    "TGME49_272230",
-    "TGME49_273760",
-    "TGME49_280420",
-    "TGME49_280540",
-    "TGME49_286720",
-    "TGME49_288380",
-    "TGME49_289600",
-    "TGME49_290340",
-    "TGME49_290990",
-    "TGME49_292920",
-    "TGME49_295040",
-    "TGME49_305040",
-    "TGME49_310600",
-    "TGME49_312600",
-    "TGME49_320600",
-    "TGME49_324600",
-]
-
-# Stress response (GO:0006950) -- 100 genes
-STRESS_RESPONSE = [
-    "TGME49_203260",
-    "TGME49_206390",
-    "TGME49_206400",
-    "TGME49_207760",
-    "TGME49_208580",
-    "TGME49_208842",
-    "TGME49_210778",
-    "TGME49_210960",
-    "TGME49_212170",
-    "TGME49_212250",
-    "TGME49_213752",
-    "TGME49_213890",
-    "TGME49_214480",
-    "TGME49_214520",
-    "TGME49_216250",
-    "TGME49_216400",
-    "TGME49_216600",
-    "TGME49_216870",
-    "TGME49_217160",
-    "TGME49_217450",
-    "TGME49_218840",
-    "TGME49_219590",
-    "TGME49_220120",
-    "TGME49_221670",
-    "TGME49_222230",
-    "TGME49_228210",
-    "TGME49_229950",
-    "TGME49_230710",
-    "TGME49_232250",
-    "TGME49_233090",
-    "TGME49_234420",
-    "TGME49_234580",
-    "TGME49_235170",
-    "TGME49_236200",
-    "TGME49_237460",
-    "TGME49_237480",
-    "TGME49_238110",
-    "TGME49_242890",
-    "TGME49_243265",
-    "TGME49_244020",
-    "TGME49_244560",
-    "TGME49_245660",
-    "TGME49_246020",
-    "TGME49_246520",
-    "TGME49_247460",
-    "TGME49_247485",
-    "TGME49_247790",
-    "TGME49_248160",
-    "TGME49_249330",
-    "TGME49_249460",
-    "TGME49_251490",
-    "TGME49_251620",
-    "TGME49_251670",
-    "TGME49_253650",
-    "TGME49_254460",
-    "TGME49_254640",
-    "TGME49_255430",
-    "TGME49_257030",
-    "TGME49_257180",
-    "TGME49_259140",
-    "TGME49_261000",
-    "TGME49_261010",
-    "TGME49_261460",
-    "TGME49_261610",
-    "TGME49_264670",
-    "TGME49_266120",
-    "TGME49_266130",
-    "TGME49_266390",
-    "TGME49_266930",
-    "TGME49_267080",
-    "TGME49_268560",
-    "TGME49_269660",
-    "TGME49_269830",
-    "TGME49_271250",
-    "TGME49_272900",
-    "TGME49_273090",
-    "TGME49_275690",
-    "TGME49_277150",
-    "TGME49_277220",
-    "TGME49_277540",
-    "TGME49_278060",
-    "TGME49_280490",
-    "TGME49_285490",
-    "TGME49_285895",
-    "TGME49_286630",
-    "TGME49_288380",
-    "TGME49_288680",
-    "TGME49_288730",
-    "TGME49_288860",
-    "TGME49_290640",
-    "TGME49_291090",
-    "TGME49_292920",
-    "TGME49_293368",
-    "TGME49_293460",
-    "TGME49_294290",
-    "TGME49_294870",
-    "TGME49_294880",
-    "TGME49_294920",
-    "TGME49_295340",
-    "TGME49_300020",
-]
-
-# Plasma membrane / cell surface (GO:0005886) -- 84 genes
-PLASMA_MEMBRANE = [
-    "TGME49_201780",
-    "TGME49_202900",
-    "TGME49_205265",
-    "TGME49_206430",
-    "TGME49_207130",
-    "TGME49_207690",
-    "TGME49_209060",
-    "TGME49_209800",
-    "TGME49_211640",
-    "TGME49_213030",
-    "TGME49_213550",
-    "TGME49_214080",
-    "TGME49_214320",
-    "TGME49_214940",
-    "TGME49_215490",
-    "TGME49_216620",
-    "TGME49_220600",
-    "TGME49_220930",
-    "TGME49_221940",
-    "TGME49_222060",
-    "TGME49_222200",
-    "TGME49_223672",
-    "TGME49_226270",
-    "TGME49_226710",
-    "TGME49_229170",
-    "TGME49_230920",
-    "TGME49_231210",
-    "TGME49_232830",
-    "TGME49_232940",
-    "TGME49_233450",
-    "TGME49_233460",
-    "TGME49_233480",
-    "TGME49_235150",
-    "TGME49_240680",
-    "TGME49_240810",
-    "TGME49_241010",
-    "TGME49_247540",
-    "TGME49_248420",
-    "TGME49_248670",
-    "TGME49_248830",
-    "TGME49_249380",
-    "TGME49_249580",
-    "TGME49_252640",
-    "TGME49_253360",
-    "TGME49_257530",
-    "TGME49_257680",
-    "TGME49_259020",
-    "TGME49_259200",
-    "TGME49_260310",
-    "TGME49_262150",
-    "TGME49_263290",
-    "TGME49_267450",
-    "TGME49_268590",
-    "TGME49_269750",
-    "TGME49_271050",
-    "TGME49_272370",
-    "TGME49_272420",
-    "TGME49_272500",
-    "TGME49_272600",
-    "TGME49_275440",
-    "TGME49_277240",
-    "TGME49_277910",
-    "TGME49_278110",
-    "TGME49_278660",
-    "TGME49_281580",
-    "TGME49_289600",
-    "TGME49_290950",
-    "TGME49_292110",
-    "TGME49_293900",
-    "TGME49_294690",
-    "TGME49_297470",
-    "TGME49_297650",
-    "TGME49_305290",
-    "TGME49_306640",
-    "TGME49_308840",
-    "TGME49_310560",
-    "TGME49_311360",
-    "TGME49_311670",
-    "TGME49_312100",
-    "TGME49_313450",
-    "TGME49_315560",
-    "TGME49_318150",
-    "TGME49_319560",
-    "TGME49_320020",
-]
-
-# CDPKs -- calcium-dependent protein kinases (text) -- 15 genes
-CDPK = [
-    "TGME49_206590",
-    "TGME49_217600",
-    "TGME49_218720",
-    "TGME49_224950",
-    "TGME49_225490",
-    "TGME49_228750",
-    "TGME49_237860",
-    "TGME49_237890",
-    "TGME49_240390",
-    "TGME49_242400",
-    "TGME49_292055",
-    "TGME49_295760",
-    "TGME49_301440",
-    "TGME49_305860",
-    "TGME49_306480",
-]
-
-# Cyst wall proteins (text: "cyst wall") -- 12 genes
-CYST_WALL = [
-    "TGME49_204420",
-    "TGME49_209610",
-    "TGME49_209755",
-    "TGME49_210950",
-    "TGME49_214920",
-    "TGME49_258870",
-    "TGME49_268310",
-    "TGME49_310790",
-    "TGME49_312330",
-    "TGME49_316890",
-    "TGME49_319890",
-    "TGME49_500223",
-]
-
-# Phosphorylation (GO:0016310) -- 100 genes
-PHOSPHORYLATION = [
-    "TGME49_201130",
-    "TGME49_202210",
-    "TGME49_202460",
-    "TGME49_202780",
-    "TGME49_203010",
-    "TGME49_204090",
-    "TGME49_204100",
-    "TGME49_204110",
-    "TGME49_204280",
-    "TGME49_205250",
-    "TGME49_205550",
-    "TGME49_206590",
-    "TGME49_207610",
-    "TGME49_207700",
-    "TGME49_207820",
-    "TGME49_208070",
-    "TGME49_208320",
-    "TGME49_209050",
-    "TGME49_209985",
-    "TGME49_210280",
-    "TGME49_210830",
-    "TGME49_211260",
-    "TGME49_212970",
-    "TGME49_214260",
-    "TGME49_215250",
-    "TGME49_215670",
-    "TGME49_215700",
-    "TGME49_215775",
-    "TGME49_215785",
-    "TGME49_216640",
-    "TGME49_216740",
-    "TGME49_217600",
-    "TGME49_218220",
-    "TGME49_218400",
-    "TGME49_218550",
-    "TGME49_218720",
-    "TGME49_219682",
-    "TGME49_220440",
-    "TGME49_221550",
-    "TGME49_222020",
-    "TGME49_222960",
-    "TGME49_223120",
-    "TGME49_224480",
-    "TGME49_224900",
-    "TGME49_224950",
-    "TGME49_225490",
-    "TGME49_225770",
-    "TGME49_225930",
-    "TGME49_225960",
-    "TGME49_226030",
-    "TGME49_226540",
-    "TGME49_226960",
-    "TGME49_227010",
-    "TGME49_227050",
-    "TGME49_227260",
-    "TGME49_227810",
-    "TGME49_228420",
-    "TGME49_228690",
-    "TGME49_228750",
-    "TGME49_229020",
-    "TGME49_229630",
-    "TGME49_230460",
-    "TGME49_230470",
-    "TGME49_231070",
-    "TGME49_233010",
-    "TGME49_233400",
-    "TGME49_233500",
-    "TGME49_233790",
-    "TGME49_233905",
-    "TGME49_234950",
-    "TGME49_234970",
-    "TGME49_235370",
-    "TGME49_235478",
-    "TGME49_235750",
-    "TGME49_236040",
-    "TGME49_236050",
-    "TGME49_236240",
-    "TGME49_236620",
-    "TGME49_237210",
-    "TGME49_237860",
-    "TGME49_237890",
-    "TGME49_239130",
-    "TGME49_239250",
-    "TGME49_239420",
-    "TGME49_239440",
-    "TGME49_239600",
-    "TGME49_239885",
-    "TGME49_239910",
-    "TGME49_240090",
-    "TGME49_240390",
-    "TGME49_240410",
-    "TGME49_240630",
-    "TGME49_240640",
-    "TGME49_240890",
-    "TGME49_242070",
-    "TGME49_242100",
-    "TGME49_242110",
-    "TGME49_242118",
-    "TGME49_242230",
-    "TGME49_242240",
-]
-
-
-# ---------------------------------------------------------------------------
-# Seeds
-# ---------------------------------------------------------------------------
-SEEDS: list[SeedDef] = [
-    # === Strategy 1: TgME49 Secreted Effectors (11 nodes) ===
-    SeedDef(
-        name="TgME49 Secreted Effectors",
-        description=(
-            "Comprehensive secreted effector repertoire of T. gondii ME49. "
-            "Unions dense granule (GRA), rhoptry (ROP/RON), and microneme "
-            "(MIC/AMA1) protein sets, intersects with predicted signal "
-            "peptide, then subtracts ribosomal and translation machinery "
-            "to remove false positives. 11-node strategy tree covering "
-            "the three major secretory organelles of the invasion machinery."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus_housekeeping",
-            "displayName": "Secreted Effectors (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "intersect_sp",
-                "displayName": "Secretory Organelle + Signal Peptide",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "union_all_secretory",
-                    "displayName": "All Secretory Organelles",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "union_gra_rop",
-                        "displayName": "GRA + ROP",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_gra",
-                            "displayName": "Dense Granule Proteins",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(TG_ORG, "dense granule"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_rop",
-                            "displayName": "Rhoptry Proteins",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(TG_ORG, "rhoptry"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_mic",
-                        "displayName": "Microneme Proteins",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(TG_ORG, "microneme"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_signal_peptide",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(TG_ORG),
-                },
-            },
-            "secondaryInput": {
-                "id": "union_housekeeping",
-                "displayName": "Housekeeping (Ribosomal + Translation)",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "leaf_ribosomal",
-                    "displayName": "Ribosomal Proteins",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TG_ORG, "GO:0003735"),
-                },
-                "secondaryInput": {
-                    "id": "leaf_translation",
-                    "displayName": "Translation",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TG_ORG, "GO:0006412"),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Secreted Effector Controls",
-            positive_ids=DENSE_GRANULE[:30] + RHOPTRY[:20] + MICRONEME[:15],
-            negative_ids=RIBOSOMAL[:50] + TRANSLATION[:25],
-            provenance_notes=(
-                "Positive: GRA proteins from text:'dense granule' (ToxoDB), "
-                "ROP/RON from text:'rhoptry', MIC from text:'microneme'. "
-                "Negative: ribosomal (GO:0003735) + translation (GO:0006412). "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "secretory-organelles",
-                "dense-granule",
-                "rhoptry",
-                "microneme",
-                "effectors",
-                "host-manipulation",
-                "signal-peptide",
-                "invasion",
-            ],
-        ),
-    ),
-    # === Strategy 2: TgME49 Drug Target Candidates (10 nodes) ===
-    SeedDef(
-        name="TgME49 Drug Target Candidates",
-        description=(
-            "Drug-targetable enzymes in T. gondii ME49 that are either "
-            "secreted (signal peptide) or membrane-anchored (transmembrane "
-            "domains). Unions protein kinases (GO:0004672), proteases "
-            "(GO:0008233), and oxidoreductases (EC 1.-.-.-), intersects "
-            "with secreted/membrane proteins, then removes ribosomal "
-            "contamination. 10-node tree targeting parasite-specific "
-            "enzymes accessible to drug intervention."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus_ribosomal",
-            "displayName": "Drug Targets (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "intersect_accessible",
-                "displayName": "Accessible Enzymes",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "union_enzymes",
-                    "displayName": "All Enzymes",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "union_kinase_protease",
-                        "displayName": "Kinases + Proteases",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_kinase",
-                            "displayName": "Protein Kinases",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TG_ORG, "GO:0004672"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_protease",
-                            "displayName": "Proteases",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TG_ORG, "GO:0008233"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_oxidoreductase",
-                        "displayName": "Oxidoreductases",
-                        "searchName": "GenesByEcNumber",
-                        "parameters": ec_search_params(
-                            TG_ORG,
-                            ec_number="1.-.-.-",
-                            ec_sources=TG_EC_SOURCES,
-                            ec_wildcard="N/A",
-                        ),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "union_accessible",
-                    "displayName": "Secreted or Membrane",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_sp",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(TG_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_tm",
-                        "displayName": "Transmembrane",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(TG_ORG, "1", "99"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_ribosomal",
-                "displayName": "Ribosomal (exclude)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TG_ORG, "GO:0003735"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Drug Target Controls",
-            positive_ids=CDPK + PROTEIN_KINASES[:35] + PROTEASES[:30],
-            negative_ids=RIBOSOMAL[:50] + HEAT_SHOCK[:25],
-            provenance_notes=(
-                "Positive: CDPKs (text:'CDPK', validated drug targets), "
-                "secreted kinases (GO:0004672 intersect SignalPeptide), "
-                "secreted proteases (GO:0008233 intersect SignalPeptide). "
-                "Negative: ribosomal (GO:0003735) + heat shock chaperones. "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "drug-targets",
-                "kinases",
-                "CDPK",
-                "proteases",
-                "oxidoreductases",
-                "signal-peptide",
-                "transmembrane",
-                "enzyme",
-                "therapeutic",
-            ],
-        ),
-    ),
-    # === Strategy 3: TgME49 Invasion Complex (9 nodes) ===
-    SeedDef(
-        name="TgME49 Invasion Complex",
-        description=(
-            "Surface and secreted invasion machinery of T. gondii ME49. "
-            "Intersects signal peptide with a union of microneme proteins, "
-            "rhoptry proteins, surface antigens (SRS domain), and plasma "
-            "membrane proteins (GO:0005886). Subtracts ribosomal to clean "
-            "results. 9-node tree capturing the full complement of proteins "
-            "involved in host cell attachment, moving junction formation, "
-            "and active invasion."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus",
-            "displayName": "Invasion Complex (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "intersect_sp_invasion",
-                "displayName": "SP + Invasion Markers",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "leaf_sp",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(TG_ORG),
-                },
-                "secondaryInput": {
-                    "id": "union_invasion",
-                    "displayName": "Invasion Markers",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "union_mic_rop",
-                        "displayName": "MIC + ROP",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_mic",
-                            "displayName": "Microneme",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(TG_ORG, "microneme"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_rop",
-                            "displayName": "Rhoptry",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(TG_ORG, "rhoptry"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "union_surface_pm",
-                        "displayName": "Surface + PM",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_srs",
-                            "displayName": "SRS Surface Antigens",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(TG_ORG, "SRS domain"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_pm",
-                            "displayName": "Plasma Membrane",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TG_ORG, "GO:0005886"),
-                        },
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_ribosomal",
-                "displayName": "Ribosomal (exclude)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TG_ORG, "GO:0003735"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Invasion Complex Controls",
-            positive_ids=MICRONEME[:28] + RHOPTRY[:40] + SRS_SURFACE_ANTIGENS[:20],
-            negative_ids=[
-                g
-                for g in RIBOSOMAL[:50] + TRANSPORTERS[:25]
-                if g
-                not in set(MICRONEME[:28] + RHOPTRY[:40] + SRS_SURFACE_ANTIGENS[:20])
-            ],
-            provenance_notes=(
-                "Positive: microneme (text:'microneme'), signal-peptide "
-                "rhoptry (text:'rhoptry' intersect SignalPeptide), SRS "
-                "surface antigens (text:'SRS domain'). "
-                "Negative: ribosomal (GO:0003735) + transporters (GO:0055085). "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "invasion",
-                "microneme",
-                "rhoptry",
-                "surface-antigen",
-                "SRS",
-                "plasma-membrane",
-                "moving-junction",
-                "host-cell-entry",
-                "signal-peptide",
-            ],
-        ),
-    ),
-    # === Strategy 4: TgME49 Bradyzoite Conversion (8 nodes) ===
-    SeedDef(
-        name="TgME49 Bradyzoite Conversion",
-        description=(
-            "Stage-conversion markers for the tachyzoite-to-bradyzoite "
-            "transition in T. gondii ME49. Unions cyst wall proteins "
-            "(CST1, BPK1, SRS13) with stress response genes (GO:0006950) "
-            "since stress triggers conversion, intersects with secreted "
-            "or membrane proteins, then removes translation machinery. "
-            "8-node tree targeting the chronic infection program critical "
-            "for tissue cyst persistence in the brain."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus_translation",
-            "displayName": "Bradyzoite Markers (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "intersect_accessible",
-                "displayName": "Accessible Conversion Genes",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "union_conversion",
-                    "displayName": "Cyst Wall + Stress Response",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_cyst_wall",
-                        "displayName": "Cyst Wall Proteins",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(TG_ORG, "cyst wall"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_stress",
-                        "displayName": "Stress Response",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TG_ORG, "GO:0006950"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "union_accessible",
-                    "displayName": "Secreted or Membrane",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_sp",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(TG_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_tm",
-                        "displayName": "Transmembrane",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(TG_ORG, "1", "99"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_translation",
-                "displayName": "Translation (exclude)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TG_ORG, "GO:0006412"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Bradyzoite Conversion Controls",
-            positive_ids=CYST_WALL + STRESS_RESPONSE[:55] + HEAT_SHOCK[:20],
-            negative_ids=TRANSLATION[:50] + RIBOSOMAL[:25],
-            provenance_notes=(
-                "Positive: cyst wall proteins (text:'cyst wall'), "
-                "secreted/membrane stress response (GO:0006950 intersect "
-                "SignalPeptide/Transmembrane), heat shock proteins. "
-                "Negative: translation (GO:0006412) + ribosomal (GO:0003735). "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "bradyzoite",
-                "stage-conversion",
-                "cyst-wall",
-                "CST1",
-                "BPK1",
-                "stress-response",
-                "chronic-infection",
-                "tissue-cyst",
-                "persistence",
-            ],
-        ),
-    ),
-    # === Strategy 5: TgME49 Surface Kinome (5 nodes) ===
-    SeedDef(
-        name="TgME49 Surface Kinome",
-        description=(
-            "Secreted kinome of T. gondii ME49: phosphorylation pathway "
-            "proteins (GO:0016310) with predicted signal peptide, minus "
-            "translation machinery. 5-node strategy identifying exported "
-            "kinases including ROP16, ROP18, and CDPKs that modify host "
-            "cell signaling during infection."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus_translation",
-            "displayName": "Surface Kinome (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "intersect_kinome_sp",
-                "displayName": "Phosphorylation + SP",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "leaf_phosphorylation",
-                    "displayName": "Phosphorylation",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TG_ORG, "GO:0016310"),
-                },
-                "secondaryInput": {
-                    "id": "leaf_sp",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(TG_ORG),
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_translation",
-                "displayName": "Translation (exclude)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TG_ORG, "GO:0006412"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Surface Kinome Controls",
-            positive_ids=CDPK + PHOSPHORYLATION[:50] + PROTEIN_KINASES[:20],
-            negative_ids=TRANSLATION[:50] + RIBOSOMAL[:25],
-            provenance_notes=(
-                "Positive: CDPKs, phosphorylation genes with signal peptide "
-                "(GO:0016310 intersect SignalPeptide), secreted kinases "
-                "(GO:0004672 intersect SignalPeptide). "
-                "Negative: translation (GO:0006412) + ribosomal (GO:0003735). "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "kinome",
-                "phosphorylation",
-                "CDPK",
-                "ROP-kinase",
-                "signal-peptide",
-                "host-signaling",
-                "exported",
-            ],
-        ),
-    ),
-    # === Strategy 6: TgME49 Membrane Transporter Network (11 nodes) ===
-    SeedDef(
-        name="TgME49 Membrane Transporter Network",
-        description=(
-            "Comprehensive membrane transporter network of T. gondii ME49. "
-            "Intersects transmembrane transport (GO:0055085) with predicted "
-            "transmembrane domains, unions with plasma membrane (GO:0005886) "
-            "transmembrane proteins for broad coverage, then subtracts "
-            "ribosomal and translation genes. 11-node tree identifying "
-            "nutrient acquisition channels, ion exchangers, and drug "
-            "efflux pumps critical for intracellular parasite survival."
-        ),
-        site_id=SITE_ID,
-        step_tree={
-            "id": "root_minus_housekeeping",
-            "displayName": "Transporters (clean)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "union_transport_pm",
-                "displayName": "Transport + PM (TM)",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "intersect_transport_tm",
-                    "displayName": "Transporters + TM",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "leaf_transport",
-                        "displayName": "Transmembrane Transport",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TG_ORG, "GO:0055085"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_tm_1",
-                        "displayName": "TM Domains (1+)",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(TG_ORG, "1", "99"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "intersect_pm_tm",
-                    "displayName": "PM + TM",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "leaf_pm",
-                        "displayName": "Plasma Membrane",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TG_ORG, "GO:0005886"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_tm_2",
-                        "displayName": "TM Domains (1+)",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(TG_ORG, "1", "99"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "union_housekeeping",
-                "displayName": "Housekeeping (exclude)",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "leaf_ribosomal",
-                    "displayName": "Ribosomal",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TG_ORG, "GO:0003735"),
-                },
-                "secondaryInput": {
-                    "id": "leaf_translation",
-                    "displayName": "Translation",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TG_ORG, "GO:0006412"),
-                },
-            },
-        },
-        control_set=ControlSetDef(
-            name="Transporter Controls",
-            positive_ids=TRANSPORTERS[:60] + PLASMA_MEMBRANE[:30],
-            negative_ids=RIBOSOMAL[:50] + TRANSLATION[:25],
-            provenance_notes=(
-                "Positive: transporters with TM domains (GO:0055085 intersect "
-                "GenesByTransmembraneDomains), plasma membrane TM proteins "
-                "(GO:0005886 intersect GenesByTransmembraneDomains). "
-                "Negative: ribosomal (GO:0003735) + translation (GO:0006412). "
-                "All gene IDs verified against live ToxoDB API March 2026."
-            ),
-            tags=[
-                "transporters",
-                "transmembrane",
-                "channels",
-                "ion-exchange",
-                "nutrient-acquisition",
-                "drug-efflux",
-                "plasma-membrane",
-                "ABC-transporter",
-                "intracellular-survival",
-            ],
-        ),
-    ),
-]
@@ -1,1855 +0,0 @@
-"""Seed definitions for TriTrypDB.
-
-Covers TWO organisms:
-  - Leishmania major strain Friedlin (cutaneous leishmaniasis reference)
-  - Trypanosoma brucei brucei TREU927 (African trypanosomiasis reference)
-
-Strategies model real research questions:
-  1. LmjF Drug Target Candidates (10 nodes)
-  2. TbTREU927 VSG & Surface Coat (8 nodes)
-  3. LmjF Invasion & Survival (8 nodes)
-  4. TbTREU927 Flagellar Assembly (7 nodes)
-  5. Cross-Species Metabolic Comparison (12 nodes)
-  6. TbTREU927 Kinetoplast & RNA Editing (6 nodes)
-
-All gene IDs verified against live TriTrypDB API (March 2026).
-"""
-
-from veupath_chatbot.services.experiment.seed.helpers import (
-    go_search_params,
-    signal_peptide_params,
-    text_search_params,
-    transmembrane_params,
-)
-from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
-
-# ---------------------------------------------------------------------------
-# Organism constants
-# ---------------------------------------------------------------------------
-
-LM_ORG = "Leishmania major strain Friedlin"
-TB_ORG = "Trypanosoma brucei brucei TREU927"
-
-# ---------------------------------------------------------------------------
-# Gene data - ALL IDs verified against live TriTrypDB API (Mar 2026)
-# ---------------------------------------------------------------------------
-
-# ===== LEISHMANIA MAJOR strain Friedlin =====
-
-# Kinases (GO:0004672 protein kinase activity) - 217 total, using 60
-LMJF_KINASES = [
-    "LmjF.01.0750",
-    "LmjF.02.0120",
-    "LmjF.02.0290",
-    "LmjF.02.0360",
-    "LmjF.02.0570",
-    "LmjF.03.0210",
-    "LmjF.03.0350",
-    "LmjF.03.0780",
-    "LmjF.04.0440",
-    "LmjF.04.0650",
-    "LmjF.04.1210",
-    "LmjF.05.0130",
-    "LmjF.05.0390",
-    "LmjF.05.0550",
-    "LmjF.06.0640",
-    "LmjF.06.1180",
-    "LmjF.07.0160",
-    "LmjF.07.0170",
-    "LmjF.07.0250",
-    "LmjF.07.0690",
-    "LmjF.07.0880",
-    "LmjF.07.0900",
-    "LmjF.07.0990",
-    "LmjF.08.0530",
-    "LmjF.08.0660",
-    "LmjF.08.0930",
-    "LmjF.08.1228",
-    "LmjF.08.1280",
-    "LmjF.09.0310",
-    "LmjF.09.0400",
-    "LmjF.09.0410",
-    "LmjF.10.0200",
-    "LmjF.10.0490",
-    "LmjF.10.0830",
-    "LmjF.11.0060",
-    "LmjF.11.0110",
-    "LmjF.11.0250",
-    "LmjF.11.0510",
-    "LmjF.12.0130",
-    "LmjF.13.0440",
-    "LmjF.13.0780",
-    "LmjF.13.1640",
-    "LmjF.14.0830",
-    "LmjF.14.1070",
-    "LmjF.14.1300",
-    "LmjF.14.1410",
-    "LmjF.15.0180",
-    "LmjF.15.0770",
-    "LmjF.15.1200",
-    "LmjF.15.1550",
-    "LmjF.16.0300",
-    "LmjF.16.0870",
-    "LmjF.16.0990",
-    "LmjF.17.0060",
-    "LmjF.17.0390",
-    "LmjF.17.0490",
-    "LmjF.17.0670",
-    "LmjF.17.0790",
-    "LmjF.18.0270",
-    "LmjF.18.0640",
-]
-
-# Proteases (GO:0008233 peptidase activity) - 156 total, using 60
-LMJF_PROTEASES = [
-    "LmjF.01.0610",
-    "LmjF.01.0650",
-    "LmjF.01.0830",
-    "LmjF.02.0040",
-    "LmjF.02.0740",
-    "LmjF.04.0450",
-    "LmjF.04.0850",
-    "LmjF.05.0960",
-    "LmjF.06.0140",
-    "LmjF.06.0340",
-    "LmjF.08.0450",
-    "LmjF.08.1010",
-    "LmjF.08.1020",
-    "LmjF.08.1030",
-    "LmjF.08.1040",
-    "LmjF.08.1050",
-    "LmjF.08.1060",
-    "LmjF.08.1070",
-    "LmjF.08.1080",
-    "LmjF.09.0230",
-    "LmjF.09.0240",
-    "LmjF.09.0600",
-    "LmjF.09.0770",
-    "LmjF.10.0460",
-    "LmjF.10.0465",
-    "LmjF.10.0470",
-    "LmjF.10.0480",
-    "LmjF.11.0620",
-    "LmjF.11.0630",
-    "LmjF.12.0030",
-    "LmjF.12.0190",
-    "LmjF.12.0650",
-    "LmjF.12.1250",
-    "LmjF.13.0090",
-    "LmjF.13.1040",
-    "LmjF.14.0180",
-    "LmjF.15.0090",
-    "LmjF.15.1300",
-    "LmjF.15.1530",
-    "LmjF.16.0730",
-    "LmjF.16.0850",
-    "LmjF.17.0140",
-    "LmjF.17.1090",
-    "LmjF.18.0360",
-    "LmjF.18.0450",
-    "LmjF.18.0610",
-    "LmjF.18.1060",
-    "LmjF.19.0550",
-    "LmjF.19.1120",
-    "LmjF.19.1420",
-    "LmjF.19.1590",
-    "LmjF.20.1180",
-    "LmjF.20.1185",
-    "LmjF.20.1190",
-    "LmjF.20.1200",
-    "LmjF.20.1210",
-    "LmjF.20.1680",
-    "LmjF.21.0120",
-    "LmjF.21.0400",
-    "LmjF.21.0760",
-]
-
-# Signal peptide (secreted) - 362 total, using 60
-LMJF_SIGNAL_PEPTIDE = [
-    "LmjF.01.0010",
-    "LmjF.01.0280",
-    "LmjF.01.0400",
-    "LmjF.02.0430",
-    "LmjF.03.0010",
-    "LmjF.03.0340",
-    "LmjF.03.0950",
-    "LmjF.04.0130",
-    "LmjF.04.0140",
-    "LmjF.04.0150",
-    "LmjF.04.0160",
-    "LmjF.04.0170",
-    "LmjF.04.0180",
-    "LmjF.04.0190",
-    "LmjF.04.0200",
-    "LmjF.04.0210",
-    "LmjF.04.0310",
-    "LmjF.04.0390",
-    "LmjF.05.0030",
-    "LmjF.05.0750",
-    "LmjF.05.0900",
-    "LmjF.05.1070",
-    "LmjF.05.1120",
-    "LmjF.05.1215",
-    "LmjF.06.0710",
-    "LmjF.06.1050",
-    "LmjF.06.1120",
-    "LmjF.06.1150",
-    "LmjF.06.1190",
-    "LmjF.07.0080",
-    "LmjF.07.0200",
-    "LmjF.07.0820",
-    "LmjF.07.0830",
-    "LmjF.07.0840",
-    "LmjF.08.0280",
-    "LmjF.08.0460",
-    "LmjF.08.0570",
-    "LmjF.08.0810",
-    "LmjF.08.0850",
-    "LmjF.08.1000",
-    "LmjF.08.1010",
-    "LmjF.08.1020",
-    "LmjF.08.1030",
-    "LmjF.08.1040",
-    "LmjF.08.1050",
-    "LmjF.08.1060",
-    "LmjF.08.1070",
-    "LmjF.09.0040",
-    "LmjF.09.0230",
-    "LmjF.09.0280",
-    "LmjF.09.0580",
-    "LmjF.09.0880",
-    "LmjF.09.0890",
-    "LmjF.09.1330",
-    "LmjF.09.1460",
-    "LmjF.10.0219",
-    "LmjF.10.0430",
-    "LmjF.10.0540",
-    "LmjF.10.0620",
-    "LmjF.10.0630",
-]
-
-# Transmembrane (3-20 TM domains) - 673 total, using 60
-LMJF_TRANSMEMBRANE = [
-    "LmjF.01.0180",
-    "LmjF.01.0340",
-    "LmjF.01.0440",
-    "LmjF.01.0570",
-    "LmjF.01.0810",
-    "LmjF.01.0820",
-    "LmjF.02.0300",
-    "LmjF.02.0340",
-    "LmjF.02.0420",
-    "LmjF.02.0430",
-    "LmjF.02.0540",
-    "LmjF.03.0080",
-    "LmjF.03.0370",
-    "LmjF.03.0380",
-    "LmjF.03.0400",
-    "LmjF.03.0410",
-    "LmjF.03.0470",
-    "LmjF.03.0480",
-    "LmjF.03.0490",
-    "LmjF.03.0500",
-    "LmjF.03.0550",
-    "LmjF.03.0650",
-    "LmjF.03.0660",
-    "LmjF.03.0810",
-    "LmjF.03.0920",
-    "LmjF.04.0010",
-    "LmjF.04.0020",
-    "LmjF.04.0510",
-    "LmjF.04.0520",
-    "LmjF.04.0590",
-    "LmjF.04.0600",
-    "LmjF.04.0640",
-    "LmjF.04.0780",
-    "LmjF.04.0850",
-    "LmjF.04.1000",
-    "LmjF.04.1030",
-    "LmjF.04.1040",
-    "LmjF.04.1110",
-    "LmjF.05.0280",
-    "LmjF.05.0290",
-    "LmjF.05.0480",
-    "LmjF.05.0580",
-    "LmjF.05.0810",
-    "LmjF.05.1170",
-    "LmjF.06.0080",
-    "LmjF.06.0090",
-    "LmjF.06.0230",
-    "LmjF.06.0310",
-    "LmjF.06.0640",
-    "LmjF.06.0750",
-    "LmjF.06.0995",
-    "LmjF.06.1250",
-    "LmjF.06.1260",
-    "LmjF.06.1300",
-    "LmjF.07.0150",
-    "LmjF.07.0330",
-    "LmjF.07.0400",
-    "LmjF.07.0530",
-    "LmjF.07.0630",
-    "LmjF.07.0650",
-]
-
-# Transporters (GO:0005215 transporter activity) - 200 total, using 60
-LMJF_TRANSPORTERS = [
-    "LmjF.01.0180",
-    "LmjF.01.0440",
-    "LmjF.01.0570",
-    "LmjF.02.0300",
-    "LmjF.02.0450",
-    "LmjF.02.0460",
-    "LmjF.03.0160",
-    "LmjF.03.0410",
-    "LmjF.03.0500",
-    "LmjF.04.0010",
-    "LmjF.04.1000",
-    "LmjF.05.0480",
-    "LmjF.05.0500",
-    "LmjF.05.0510",
-    "LmjF.05.0680",
-    "LmjF.05.0980",
-    "LmjF.05.1140",
-    "LmjF.06.0080",
-    "LmjF.06.0090",
-    "LmjF.06.0100",
-    "LmjF.06.0680",
-    "LmjF.07.0530",
-    "LmjF.07.0630",
-    "LmjF.07.0650",
-    "LmjF.07.0910",
-    "LmjF.09.0270",
-    "LmjF.09.0480",
-    "LmjF.09.0890",
-    "LmjF.10.0030",
-    "LmjF.10.0710",
-    "LmjF.10.0715",
-    "LmjF.10.0720",
-    "LmjF.10.1300",
-    "LmjF.11.0040",
-    "LmjF.11.0520",
-    "LmjF.11.0550",
-    "LmjF.11.0650",
-    "LmjF.11.0670",
-    "LmjF.11.1220",
-    "LmjF.11.1240",
-    "LmjF.11.1250",
-    "LmjF.11.1270",
-    "LmjF.11.1290",
-    "LmjF.12.0520",
-    "LmjF.13.1210",
-    "LmjF.13.1530",
-    "LmjF.13.1690",
-    "LmjF.14.0320",
-    "LmjF.14.0380",
-    "LmjF.14.0530",
-    "LmjF.14.0540",
-    "LmjF.14.0980",
-    "LmjF.14.0990",
-    "LmjF.15.0760",
-    "LmjF.15.0870",
-    "LmjF.15.0890",
-    "LmjF.15.1230",
-    "LmjF.15.1240",
-    "LmjF.15.1310",
-    "LmjF.16.0280",
-]
-
-# Oxidoreductases (GO:0016491) - 261 total, using 60
-LMJF_OXIDOREDUCTASES = [
-    "LmjF.01.0110",
-    "LmjF.01.0270",
-    "LmjF.02.0630",
-    "LmjF.03.0030",
-    "LmjF.03.0200",
-    "LmjF.03.0570",
-    "LmjF.03.0950",
-    "LmjF.05.0310",
-    "LmjF.05.0350",
-    "LmjF.05.0660",
-    "LmjF.05.0980",
-    "LmjF.06.0350",
-    "LmjF.06.0680",
-    "LmjF.06.0860",
-    "LmjF.06.0880",
-    "LmjF.06.0930",
-    "LmjF.06.1060",
-    "LmjF.06.1230",
-    "LmjF.06.1240",
-    "LmjF.06.1270",
-    "LmjF.07.0060",
-    "LmjF.07.0260",
-    "LmjF.07.0460",
-    "LmjF.07.0600",
-    "LmjF.07.1090",
-    "LmjF.07.1140",
-    "LmjF.08.0290",
-    "LmjF.09.1480",
-    "LmjF.10.0290",
-    "LmjF.10.0510",
-    "LmjF.10.0560",
-    "LmjF.10.0570",
-    "LmjF.11.0270",
-    "LmjF.11.1100",
-    "LmjF.12.0420",
-    "LmjF.12.1130",
-    "LmjF.12.1140",
-    "LmjF.13.0720",
-    "LmjF.13.1060",
-    "LmjF.13.1620",
-    "LmjF.13.1680",
-    "LmjF.14.0040",
-    "LmjF.14.0440",
-    "LmjF.14.0510",
-    "LmjF.14.1340",
-    "LmjF.14.1480",
-    "LmjF.15.0050",
-    "LmjF.15.0100",
-    "LmjF.15.0960",
-    "LmjF.15.1010",
-    "LmjF.15.1040",
-    "LmjF.15.1060",
-    "LmjF.15.1080",
-    "LmjF.15.1100",
-    "LmjF.15.1120",
-    "LmjF.15.1140",
-    "LmjF.15.1160",
-    "LmjF.16.0040",
-    "LmjF.16.0530",
-    "LmjF.16.0770",
-]
-
-# Leishmanolysin / GP63 surface protease family - 5 genes
-LMJF_LEISHMANOLYSIN = [
-    "LmjF.10.0460",
-    "LmjF.10.0465",
-    "LmjF.10.0470",
-    "LmjF.10.0480",
-    "LmjF.31.2000",
-]
-
-# Amastin surface antigens - 63 total, using 50
-LMJF_AMASTIN = [
-    "LmjF.08.0640",
-    "LmjF.08.0670",
-    "LmjF.08.0680",
-    "LmjF.08.0690",
-    "LmjF.08.0700",
-    "LmjF.08.0710",
-    "LmjF.08.0720",
-    "LmjF.08.0730",
-    "LmjF.08.0740",
-    "LmjF.08.0750",
-    "LmjF.08.0760",
-    "LmjF.08.0770",
-    "LmjF.08.0800",
-    "LmjF.08.0810",
-    "LmjF.08.0820",
-    "LmjF.08.0830",
-    "LmjF.08.0840",
-    "LmjF.08.0850",
-    "LmjF.10.0220",
-    "LmjF.10.0230",
-    "LmjF.14.0490",
-    "LmjF.24.1250",
-    "LmjF.24.1260",
-    "LmjF.24.1270",
-    "LmjF.24.1280",
-    "LmjF.27.0540",
-    "LmjF.28.1130",
-    "LmjF.28.1390",
-    "LmjF.28.1400",
-    "LmjF.30.0850",
-    "LmjF.30.0860",
-    "LmjF.30.0870",
-    "LmjF.31.0450",
-    "LmjF.34.0500",
-    "LmjF.34.0960",
-    "LmjF.34.0970",
-    "LmjF.34.0980",
-    "LmjF.34.1080",
-    "LmjF.34.1560",
-    "LmjF.34.1580",
-    "LmjF.34.1600",
-    "LmjF.34.1620",
-    "LmjF.34.1640",
-    "LmjF.34.1660",
-    "LmjF.34.1680",
-    "LmjF.34.1700",
-    "LmjF.34.1720",
-    "LmjF.34.1740",
-    "LmjF.34.1760",
-    "LmjF.34.1780",
-]
-
-# Heat shock proteins - 46 total, using 40
-LMJF_HEAT_SHOCK = [
-    "LmjF.02.0710",
-    "LmjF.04.0780",
-    "LmjF.18.0700",
-    "LmjF.18.1370",
-    "LmjF.22.0080",
-    "LmjF.26.0620",
-    "LmjF.26.0640",
-    "LmjF.26.0900",
-    "LmjF.26.1240",
-    "LmjF.27.0410",
-    "LmjF.27.2400",
-    "LmjF.27.2630",
-    "LmjF.28.2770",
-    "LmjF.28.2780",
-    "LmjF.28.2820",
-    "LmjF.29.0760",
-    "LmjF.29.1270",
-    "LmjF.29.2450",
-    "LmjF.30.0735",
-    "LmjF.30.2460",
-    "LmjF.30.2470",
-    "LmjF.30.2480",
-    "LmjF.30.2490",
-    "LmjF.30.2550",
-    "LmjF.31.1340",
-    "LmjF.32.2260",
-    "LmjF.33.0312",
-    "LmjF.33.0314",
-    "LmjF.33.0316",
-    "LmjF.33.0318",
-    "LmjF.33.0320",
-    "LmjF.33.0323",
-    "LmjF.33.0326",
-    "LmjF.33.0330",
-    "LmjF.33.0333",
-    "LmjF.33.0336",
-    "LmjF.33.0340",
-    "LmjF.33.0343",
-    "LmjF.33.0346",
-    "LmjF.33.0350",
-]
-
-# Sterol/ergosterol biosynthesis (drug targets) - 8 genes
-LMJF_STEROL = [
-    "LmjF.15.0240",
-    "LmjF.29.2140",
-    "LmjF.31.0590",
-    "LmjF.32.2320",
-    "LmjF.33.0680",
-    "LmjF.36.2380",
-    "LmjF.36.2390",
-    "LmjF.36.2540",
-]
-
-# Glycolytic process (GO:0006096) - 15 unique genes
-LMJF_GLYCOLYSIS = [
-    "LmjF.12.0530",
-    "LmjF.14.1160",
-    "LmjF.20.0100",
-    "LmjF.20.0110",
-    "LmjF.21.0240",
-    "LmjF.21.0250",
-    "LmjF.24.0850",
-    "LmjF.25.2230",
-    "LmjF.29.2510",
-    "LmjF.30.3380",
-    "LmjF.33.2110",
-    "LmjF.35.0030",
-    "LmjF.36.1260",
-    "LmjF.36.2320",
-    "LmjF.36.6650",
-]
-
-# Cytoskeleton (GO:0005856) - 454 total, using 50
-LMJF_CYTOSKELETON = [
-    "LmjF.01.0030",
-    "LmjF.01.0220",
-    "LmjF.01.0260",
-    "LmjF.02.0600",
-    "LmjF.02.0690",
-    "LmjF.02.0700",
-    "LmjF.03.0120",
-    "LmjF.03.0970",
-    "LmjF.04.0030",
-    "LmjF.04.0050",
-    "LmjF.04.0800",
-    "LmjF.04.1180",
-    "LmjF.05.0010",
-    "LmjF.05.0070",
-    "LmjF.05.0150",
-    "LmjF.05.0170",
-    "LmjF.05.0285",
-    "LmjF.05.0380",
-    "LmjF.05.0580",
-    "LmjF.05.0630",
-    "LmjF.05.0640",
-    "LmjF.05.0850",
-    "LmjF.05.0920",
-    "LmjF.05.1100",
-    "LmjF.06.0160",
-    "LmjF.06.0180",
-    "LmjF.06.0220",
-    "LmjF.06.0270",
-    "LmjF.06.0430",
-    "LmjF.06.1030",
-    "LmjF.07.0300",
-    "LmjF.07.0710",
-    "LmjF.07.0740",
-    "LmjF.07.0930",
-    "LmjF.08.0960",
-    "LmjF.08.1140",
-    "LmjF.08.1230",
-    "LmjF.09.0365",
-    "LmjF.09.0450",
-    "LmjF.09.0520",
-    "LmjF.09.0530",
-    "LmjF.09.0900",
-    "LmjF.09.1050",
-    "LmjF.09.1530",
-    "LmjF.09.1540",
-    "LmjF.10.0180",
-    "LmjF.10.0195",
-    "LmjF.10.0780",
-    "LmjF.10.0810",
-    "LmjF.10.0960",
-]
-
-# ===== TRYPANOSOMA BRUCEI BRUCEI TREU927 =====
-
-# Kinases (GO:0004672) - 217 total, using 60
-TB_KINASES = [
-    "Tb927.1.1000",
-    "Tb927.1.1530",
-    "Tb927.1.1930",
-    "Tb927.1.3130",
-    "Tb927.10.10350",
-    "Tb927.10.1070",
-    "Tb927.10.10870",
-    "Tb927.10.12040",
-    "Tb927.10.13010",
-    "Tb927.10.1320",
-    "Tb927.10.13480",
-    "Tb927.10.13490",
-    "Tb927.10.13780",
-    "Tb927.10.1380",
-    "Tb927.10.14300",
-    "Tb927.10.14420",
-    "Tb927.10.1460",
-    "Tb927.10.14770",
-    "Tb927.10.14780",
-    "Tb927.10.14800",
-    "Tb927.10.15020",
-    "Tb927.10.15290",
-    "Tb927.10.15300",
-    "Tb927.10.15880",
-    "Tb927.10.16030",
-    "Tb927.10.16160",
-    "Tb927.10.1910",
-    "Tb927.10.1940",
-    "Tb927.10.2040",
-    "Tb927.10.2390",
-    "Tb927.10.3230",
-    "Tb927.10.3340",
-    "Tb927.10.350",
-    "Tb927.10.3900",
-    "Tb927.10.460",
-    "Tb927.10.4940",
-    "Tb927.10.4990",
-    "Tb927.10.5140",
-    "Tb927.10.5270",
-    "Tb927.10.5310",
-    "Tb927.10.5930",
-    "Tb927.10.5940",
-    "Tb927.10.5950",
-    "Tb927.10.7780",
-    "Tb927.10.8420",
-    "Tb927.10.8730",
-    "Tb927.10.9600",
-    "Tb927.10.9900",
-    "Tb927.11.10520",
-    "Tb927.11.11110",
-    "Tb927.11.1180",
-    "Tb927.11.12310",
-    "Tb927.11.12410",
-    "Tb927.11.12420",
-    "Tb927.11.14070",
-    "Tb927.11.14270",
-    "Tb927.11.14500",
-    "Tb11.v5.0190",
-    "Tb11.v5.0245",
-    "Tb11.v5.0249",
-]
-
-# Proteases (GO:0008233) - 211 total, using 60
-TB_PROTEASES = [
-    "Tb927.1.2100",
-    "Tb927.1.2110",
-    "Tb927.1.2120",
-    "Tb927.1.3120",
-    "Tb927.1.4040",
-    "Tb927.1.4780",
-    "Tb927.10.1030",
-    "Tb927.10.1040",
-    "Tb927.10.1050",
-    "Tb927.10.10750",
-    "Tb927.10.12260",
-    "Tb927.10.13030",
-    "Tb927.10.13510",
-    "Tb927.10.13860",
-    "Tb927.10.1420",
-    "Tb927.10.14530",
-    "Tb927.10.14790",
-    "Tb927.10.15270",
-    "Tb927.10.1550",
-    "Tb927.10.15720",
-    "Tb927.10.16150",
-    "Tb927.10.1890",
-    "Tb927.10.210",
-    "Tb927.10.2210",
-    "Tb927.10.230",
-    "Tb927.10.2410",
-    "Tb927.10.2440",
-    "Tb927.10.290",
-    "Tb927.10.2980",
-    "Tb927.10.3030",
-    "Tb927.10.3520",
-    "Tb927.10.4590",
-    "Tb927.10.4710",
-    "Tb927.10.5080",
-    "Tb927.10.6030",
-    "Tb927.10.6080",
-    "Tb927.10.6120",
-    "Tb927.10.6940",
-    "Tb927.10.6970",
-    "Tb927.10.7620",
-    "Tb927.10.8020",
-    "Tb927.10.8790",
-    "Tb927.10.9820",
-    "Tb927.11.10240",
-    "Tb927.11.10280",
-    "Tb927.11.1090",
-    "Tb927.11.1100",
-    "Tb927.11.1110",
-    "Tb927.11.1130",
-    "Tb927.11.12230",
-    "Tb927.11.12240",
-    "Tb927.11.12610",
-    "Tb927.11.12850",
-    "Tb927.11.13420",
-    "Tb927.11.13470",
-    "Tb11.v5.0162",
-    "Tb11.v5.0175",
-    "Tb11.v5.0200",
-    "Tb11.v5.0204",
-    "Tb11.v5.0256",
-]
-
-# VSG - variant surface glycoprotein - 1630 total, using 80
-TB_VSG = [
-    "Tb05.5K5.260",
-    "Tb05.5K5.300",
-    "Tb05.5K5.320",
-    "Tb05.5K5.330",
-    "Tb05.5K5.340",
-    "Tb05.5K5.360",
-    "Tb05.5K5.370",
-    "Tb05.5K5.380",
-    "Tb05.5K5.390",
-    "Tb05.5K5.400",
-    "Tb05.5K5.410",
-    "Tb05.5K5.420",
-    "Tb05.5K5.430",
-    "Tb05.5K5.440",
-    "Tb05.5K5.450",
-    "Tb05.5K5.460",
-    "Tb05.5K5.470",
-    "Tb05.5K5.480",
-    "Tb05.5K5.490",
-    "Tb05.5K5.520",
-    "Tb08.27P2.120",
-    "Tb08.27P2.140",
-    "Tb08.27P2.150",
-    "Tb08.27P2.165",
-    "Tb08.27P2.190",
-    "Tb08.27P2.210",
-    "Tb08.27P2.220",
-    "Tb08.27P2.230",
-    "Tb08.27P2.240",
-    "Tb08.27P2.260",
-    "Tb08.27P2.270",
-    "Tb08.27P2.290",
-    "Tb08.27P2.310",
-    "Tb08.27P2.340",
-    "Tb08.27P2.370",
-    "Tb08.27P2.380",
-    "Tb08.27P2.390",
-    "Tb08.27P2.410",
-    "Tb08.27P2.435",
-    "Tb08.27P2.460",
-    "Tb09.v4.0010",
-    "Tb09.v4.0011",
-    "Tb09.v4.0012",
-    "Tb09.v4.0021",
-    "Tb09.v4.0022",
-    "Tb09.v4.0023",
-    "Tb09.v4.0024",
-    "Tb09.v4.0025",
-    "Tb09.v4.0026",
-    "Tb09.v4.0028",
-    "Tb09.v4.0029",
-    "Tb09.v4.0030",
-    "Tb09.v4.0031",
-    "Tb09.v4.0032",
-    "Tb09.v4.0034",
-    "Tb09.v4.0035",
-    "Tb09.v4.0036",
-    "Tb09.v4.0037",
-    "Tb09.v4.0039",
-    "Tb09.v4.0040",
-    "Tb09.v4.0043",
-    "Tb09.v4.0044",
-    "Tb09.v4.0046",
-    "Tb09.v4.0047",
-    "Tb09.v4.0048",
-    "Tb09.v4.0049",
-    "Tb09.v4.0050",
-    "Tb09.v4.0051",
-    "Tb09.v4.0052",
-    "Tb09.v4.0054",
-    "Tb09.v4.0055",
-    "Tb09.v4.0056",
-    "Tb09.v4.0057",
-    "Tb09.v4.0061",
-    "Tb09.v4.0063",
-    "Tb09.v4.0068",
-    "Tb09.v4.0069",
-    "Tb09.v4.0070",
-    "Tb09.v4.0071",
-    "Tb09.v4.0072",
-]
-
-# Cell surface (GO:0009986) - 55 genes
-TB_CELL_SURFACE = [
-    "Tb11.v5.0338",
-    "Tb11.v5.0345",
-    "Tb11.v5.0543",
-    "Tb927.10.10250",
-    "Tb927.10.10260",
-    "Tb927.10.10890",
-    "Tb927.10.10900",
-    "Tb927.10.10920",
-    "Tb927.10.10940",
-    "Tb927.10.10950",
-    "Tb927.10.10960",
-    "Tb927.10.11220",
-    "Tb927.10.1230",
-    "Tb927.10.5090",
-    "Tb927.10.5700",
-    "Tb927.11.15210",
-    "Tb927.11.3610",
-    "Tb927.11.3620",
-    "Tb927.11.8830",
-    "Tb927.5.4570",
-    "Tb927.6.450",
-    "Tb927.6.460",
-    "Tb927.6.480",
-    "Tb927.6.490",
-    "Tb927.6.510",
-    "Tb927.6.520",
-    "Tb927.6.530",
-    "Tb927.7.360",
-    "Tb927.7.380",
-    "Tb927.7.400",
-    "Tb927.7.420",
-    "Tb927.7.4260",
-    "Tb927.7.440",
-    "Tb927.7.5930",
-    "Tb927.7.6570",
-    "Tb927.7.6600",
-    "Tb927.7.6850",
-    "Tb927.8.1650",
-    "Tb927.8.3100",
-    "Tb927.8.6730",
-    "Tb927.9.15510",
-    "Tb927.9.15520",
-    "Tb927.9.15530",
-    "Tb927.9.15540",
-    "Tb927.9.15550",
-    "Tb927.9.15560",
-    "Tb927.9.15570",
-    "Tb927.9.15580",
-    "Tb927.9.15590",
-    "Tb927.9.15600",
-    "Tb927.9.15610",
-    "Tb927.9.15620",
-    "Tb927.9.15630",
-    "Tb927.9.15640",
-    "Tb927.9.1750",
-]
-
-# GPI anchor biosynthesis (GO:0006506) - 39 unique genes
-TB_GPI_BIOSYNTHESIS = [
-    "Tb11.v5.0206",
-    "Tb11.v5.0437",
-    "Tb11.v5.0765",
-    "Tb927.10.10110",
-    "Tb927.10.12290",
-    "Tb927.10.13160",
-    "Tb927.10.13860",
-    "Tb927.10.15910",
-    "Tb927.10.210",
-    "Tb927.10.4610",
-    "Tb927.10.4780",
-    "Tb927.10.5560",
-    "Tb927.10.6140",
-    "Tb927.10.7110",
-    "Tb927.11.12080",
-    "Tb927.11.5070",
-    "Tb927.2.1780",
-    "Tb927.2.3370",
-    "Tb927.3.4570",
-    "Tb927.3.5660",
-    "Tb927.4.1920",
-    "Tb927.4.4250",
-    "Tb927.4.4270",
-    "Tb927.4.4290",
-    "Tb927.4.5240",
-    "Tb927.4.5250",
-    "Tb927.4.5260",
-    "Tb927.4.5270",
-    "Tb927.4.5280",
-    "Tb927.4.5290",
-    "Tb927.4.5300",
-    "Tb927.4.5790",
-    "Tb927.5.2760",
-    "Tb927.6.3300",
-    "Tb927.7.300",
-    "Tb927.8.7140",
-    "Tb927.8.7150",
-    "Tb927.8.8090",
-    "Tb927.8.8100",
-]
-
-# Paraflagellar rod proteins - 42 genes
-TB_PARAFLAGELLAR = [
-    "Tb05.5K5.130",
-    "Tb11.v5.0538",
-    "Tb11.v5.0616",
-    "Tb11.v5.0777",
-    "Tb11.v5.1055",
-    "Tb927.10.10140",
-    "Tb927.10.11080",
-    "Tb927.10.11300",
-    "Tb927.10.13330",
-    "Tb927.10.15250",
-    "Tb927.10.8870",
-    "Tb927.10.8930",
-    "Tb927.10.9570",
-    "Tb927.11.11210",
-    "Tb927.11.14880",
-    "Tb927.11.4740",
-    "Tb927.2.2160",
-    "Tb927.2.3660",
-    "Tb927.2.4330",
-    "Tb927.2.950",
-    "Tb927.3.3750",
-    "Tb927.3.3770",
-    "Tb927.3.4290",
-    "Tb927.3.4300",
-    "Tb927.3.4310",
-    "Tb927.3.4320",
-    "Tb927.3.4330",
-    "Tb927.3.5310",
-    "Tb927.5.4480",
-    "Tb927.6.3670",
-    "Tb927.6.4140",
-    "Tb927.7.1360",
-    "Tb927.7.1920",
-    "Tb927.7.6970",
-    "Tb927.8.1550",
-    "Tb927.8.3790",
-    "Tb927.8.4970",
-    "Tb927.8.4980",
-    "Tb927.8.4990",
-    "Tb927.8.5000",
-    "Tb927.8.5010",
-    "Tb927.8.6660",
-]
-
-# Glycosome proteome - 60 Tb927 IDs
-TB_GLYCOSOME = [
-    "Tb927.1.3220",
-    "Tb927.1.3830",
-    "Tb927.1.4490",
-    "Tb927.1.5000",
-    "Tb927.1.720",
-    "Tb927.10.10390",
-    "Tb927.10.10610",
-    "Tb927.10.11810",
-    "Tb927.10.1280",
-    "Tb927.10.12810",
-    "Tb927.10.13130",
-    "Tb927.10.13240",
-    "Tb927.10.1390",
-    "Tb927.10.1400",
-    "Tb927.10.14020",
-    "Tb927.10.14720",
-    "Tb927.10.15410",
-    "Tb927.10.15850",
-    "Tb927.10.16120",
-    "Tb927.10.1860",
-    "Tb927.10.2010",
-    "Tb927.10.2020",
-    "Tb927.10.2250",
-    "Tb927.10.240",
-    "Tb927.10.2490",
-    "Tb927.10.2760",
-    "Tb927.10.3080",
-    "Tb927.10.4610",
-    "Tb927.10.5620",
-    "Tb927.10.5760",
-    "Tb927.10.6150",
-    "Tb927.10.6530",
-    "Tb927.10.6810",
-    "Tb927.10.7480",
-    "Tb927.10.8410",
-    "Tb927.10.8630",
-    "Tb927.10.9890",
-    "Tb927.11.10020",
-    "Tb927.11.10140",
-    "Tb927.11.1020",
-    "Tb927.11.10260",
-    "Tb927.11.1070",
-    "Tb927.11.11520",
-    "Tb927.11.12060",
-    "Tb927.11.12280",
-    "Tb927.11.14770",
-    "Tb927.11.14780",
-    "Tb927.11.15020",
-    "Tb927.11.15080",
-    "Tb927.11.2380",
-    "Tb927.11.2520",
-    "Tb927.11.2620",
-    "Tb927.11.3130",
-    "Tb927.11.3850",
-    "Tb927.11.5110",
-    "Tb927.11.5180",
-    "Tb927.11.5520",
-    "Tb927.11.6280",
-    "Tb927.11.6330",
-    "Tb927.11.900",
-]
-
-# Glycolytic process (GO:0006096) - 27 genes
-TB_GLYCOLYSIS = [
-    "Tb11.v5.0516",
-    "Tb11.v5.0531",
-    "Tb11.v5.0605",
-    "Tb11.v5.0650",
-    "Tb11.v5.0732",
-    "Tb11.v5.0818",
-    "Tb927.1.3830",
-    "Tb927.1.700",
-    "Tb927.1.710",
-    "Tb927.1.720",
-    "Tb927.10.14140",
-    "Tb927.10.2010",
-    "Tb927.10.2020",
-    "Tb927.10.2890",
-    "Tb927.10.5620",
-    "Tb927.10.6880",
-    "Tb927.10.7930",
-    "Tb927.11.16410",
-    "Tb927.11.2380",
-    "Tb927.11.2910",
-    "Tb927.11.5520",
-    "Tb927.3.2340",
-    "Tb927.3.3270",
-    "Tb927.6.4280",
-    "Tb927.6.4300",
-    "Tb927.8.1020",
-    "Tb927.9.9820",
-]
-
-# Oxidoreductases (GO:0016491) - 275 total, using 60
-TB_OXIDOREDUCTASES = [
-    "Tb927.1.1130",
-    "Tb927.1.1770",
-    "Tb927.1.4100",
-    "Tb927.1.4490",
-    "Tb927.10.10390",
-    "Tb927.10.10420",
-    "Tb927.10.11930",
-    "Tb927.10.12240",
-    "Tb927.10.12540",
-    "Tb927.10.12700",
-    "Tb927.10.13620",
-    "Tb927.10.15410",
-    "Tb927.10.16040",
-    "Tb927.10.16120",
-    "Tb927.10.2230",
-    "Tb927.10.2250",
-    "Tb927.10.2490",
-    "Tb927.10.2550",
-    "Tb927.10.2560",
-    "Tb927.10.2680",
-    "Tb927.10.280",
-    "Tb927.10.3210",
-    "Tb927.10.3650",
-    "Tb927.10.4040",
-    "Tb927.10.4080",
-    "Tb927.10.4130",
-    "Tb927.10.430",
-    "Tb927.10.4330",
-    "Tb927.10.470",
-    "Tb927.10.4870",
-    "Tb927.10.5320",
-    "Tb927.10.5750",
-    "Tb927.10.6190",
-    "Tb927.10.6450",
-    "Tb927.10.660",
-    "Tb927.10.6870",
-    "Tb927.10.6880",
-    "Tb927.10.7090",
-    "Tb927.10.7100",
-    "Tb927.10.7560",
-    "Tb927.10.7570",
-    "Tb11.v5.0150",
-    "Tb11.v5.0176",
-    "Tb11.v5.0215",
-    "Tb11.v5.0222",
-    "Tb11.v5.0244",
-    "Tb11.v5.0288",
-    "Tb11.v5.0384",
-    "Tb11.v5.0500",
-    "Tb11.v5.0516",
-    "Tb11.v5.0580",
-    "Tb11.v5.0613",
-    "Tb11.v5.0686",
-    "Tb11.v5.0904",
-    "Tb11.v5.0960",
-    "Tb11.v5.1012",
-    "Tb11.02.5060b",
-    "Tb11.02.5420",
-    "Tb11.02.5420b",
-    "Tb10.v4.0043",
-]
-
-# Mitochondrion (GO:0005739) - 1804 total, using 60
-TB_MITOCHONDRION = [
-    "Tb927.1.1000",
-    "Tb927.1.1130",
-    "Tb927.1.1160",
-    "Tb927.1.1200",
-    "Tb927.1.1210",
-    "Tb927.1.1230",
-    "Tb927.1.1330",
-    "Tb927.1.1580",
-    "Tb927.1.1600",
-    "Tb927.1.1610",
-    "Tb927.1.1690",
-    "Tb927.1.1730",
-    "Tb927.1.1770",
-    "Tb927.1.2190",
-    "Tb927.1.2320",
-    "Tb927.1.270",
-    "Tb927.1.2730",
-    "Tb927.1.280",
-    "Tb927.1.290",
-    "Tb927.1.2990",
-    "Tb927.1.3010",
-    "Tb927.1.3030",
-    "Tb927.1.3040",
-    "Tb927.1.3360",
-    "Tb927.1.3760",
-    "Tb927.1.3800",
-    "Tb927.1.3950",
-    "Tb927.1.4010",
-    "Tb927.1.4100",
-    "Tb927.1.4160",
-    "Tb927.1.4220",
-    "Tb927.1.4230",
-    "Tb927.1.4250",
-    "Tb927.1.4410",
-    "Tb927.1.4420",
-    "Tb927.1.4540",
-    "Tb927.1.4650",
-    "Tb927.1.4970",
-    "Tb927.1.5000",
-    "Tb927.1.530",
-    "Tb927.1.730",
-    "Tb927.1.740",
-    "Tb11.v5.0156",
-    "Tb11.v5.0170",
-    "Tb11.v5.0175",
-    "Tb11.v5.0179",
-    "Tb11.v5.0204",
-    "Tb11.v5.0222",
-    "Tb11.v5.0244",
-    "Tb11.v5.0247",
-    "Tb11.v5.0268",
-    "Tb11.v5.0276",
-    "Tb11.v5.0384",
-    "Tb11.v5.0396",
-    "Tb11.v5.0454",
-    "Tb11.v5.0500",
-    "Tb11.v5.0519",
-    "Tb11.v5.0544",
-    "Tb11.v5.0611",
-    "Tb11.v5.0637",
-]
-
-# RNA binding (GO:0003723) - 714 total, using 60
-TB_RNA_BINDING = [
-    "Tb11.v5.0152",
-    "Tb11.v5.0156",
-    "Tb11.v5.0168",
-    "Tb11.v5.0171",
-    "Tb11.v5.0179",
-    "Tb11.v5.0181",
-    "Tb11.v5.0182",
-    "Tb11.v5.0199",
-    "Tb11.v5.0201",
-    "Tb11.v5.0243",
-    "Tb11.v5.0246",
-    "Tb11.v5.0248",
-    "Tb11.v5.0252",
-    "Tb11.v5.0291",
-    "Tb11.v5.0340",
-    "Tb11.v5.0391",
-    "Tb11.v5.0414",
-    "Tb11.v5.0465",
-    "Tb11.v5.0501",
-    "Tb11.v5.0517",
-    "Tb11.v5.0611",
-    "Tb11.v5.0631",
-    "Tb11.v5.0637",
-    "Tb11.v5.0659",
-    "Tb11.v5.0683",
-    "Tb11.v5.0684",
-    "Tb11.v5.0688",
-    "Tb11.v5.0730",
-    "Tb11.v5.0763",
-    "Tb11.v5.0767",
-    "Tb11.v5.0812",
-    "Tb11.v5.0851",
-    "Tb11.v5.0877",
-    "Tb11.v5.0886",
-    "Tb11.v5.1046",
-    "Tb11.v5.1053",
-    "Tb11.v5.1059",
-    "Tb11.v5.1060",
-    "Tb927.1.120",
-    "Tb927.1.1370",
-    "Tb927.1.1500",
-    "Tb927.1.1600",
-    "Tb927.1.1790",
-    "Tb927.1.1820",
-    "Tb927.1.2600",
-    "Tb927.1.3010",
-    "Tb927.1.3030",
-    "Tb927.1.3070",
-    "Tb927.1.4650",
-    "Tb927.10.10420",
-    "Tb927.10.11930",
-    "Tb927.10.12700",
-    "Tb927.10.3650",
-    "Tb927.10.4040",
-    "Tb927.10.4080",
-    "Tb927.10.4870",
-    "Tb927.10.5750",
-    "Tb927.10.6190",
-    "Tb927.10.6450",
-    "Tb927.10.660",
-]
-
-# Heat shock proteins - 36 genes
-TB_HEAT_SHOCK = [
-    "Tb11.v5.0543",
-    "Tb11.v5.1034",
-    "Tb11.v5.1035",
-    "Tb927.10.10890",
-    "Tb927.10.10900",
-    "Tb927.10.10910",
-    "Tb927.10.10920",
-    "Tb927.10.10930",
-    "Tb927.10.10940",
-    "Tb927.10.10950",
-    "Tb927.10.10960",
-    "Tb927.10.10970",
-    "Tb927.10.10980",
-    "Tb927.10.12710",
-    "Tb927.10.5660",
-    "Tb927.11.11290",
-    "Tb927.11.11330",
-    "Tb927.11.15480",
-    "Tb927.11.16340",
-    "Tb927.11.2650",
-    "Tb927.2.3030",
-    "Tb927.3.3330",
-    "Tb927.3.3580",
-    "Tb927.4.4520",
-    "Tb927.6.3740",
-    "Tb927.6.3750",
-    "Tb927.6.3800",
-    "Tb927.7.1030",
-    "Tb927.7.1320",
-    "Tb927.7.1340",
-    "Tb927.7.2070",
-    "Tb927.7.3810",
-    "Tb927.7.710",
-    "Tb927.8.7820",
-    "Tb927.9.13070",
-    "Tb927.9.4500",
-]
-
-# Trypanothione-related - 6 genes (drug target)
-TB_TRYPANOTHIONE = [
-    "Tb11.v5.0653",
-    "Tb927.10.10390",
-    "Tb927.2.4370",
-    "Tb927.7.1120",
-    "Tb927.7.1130",
-    "Tb927.7.1140",
-]
-
-# Ornithine decarboxylase / polyamine biosynthesis - 17 genes
-TB_ODC_POLYAMINE = [
-    "Tb11.v5.0903",
-    "Tb927.10.13560",
-    "Tb927.10.14070",
-    "Tb927.11.13730",
-    "Tb927.11.9350",
-    "Tb927.4.4020",
-    "Tb927.5.1460",
-    "Tb927.5.3810",
-    "Tb927.6.2940",
-    "Tb927.6.4410",
-    "Tb927.6.4460",
-    "Tb927.6.4470",
-    "Tb927.7.1910",
-    "Tb927.8.1060",
-    "Tb927.8.5680",
-    "Tb927.8.8290",
-    "Tb927.9.10080",
-]
-
-
-# ---------------------------------------------------------------------------
-# Local aliases / wrappers
-# ---------------------------------------------------------------------------
-
-
-def _glycosome_params() -> dict[str, str]:
-    """Build GenesInGlycosomeProteome parameters (TriTrypDB-specific).
-
-    Unique to TriTrypDB: no shared helper exists for glycosome proteome searches.
-    """
-    return {
-        "glycosome_confidence": "High",
-        "min_glycosome_score": "1.0",
-    }
-
-
-# ---------------------------------------------------------------------------
-# Seeds
-# ---------------------------------------------------------------------------
-
-SEEDS: list[SeedDef] = [
-    # ===================================================================
-    # 1) LmjF Drug Target Candidates (10 nodes)
-    # ===================================================================
-    SeedDef(
-        name="LmjF Drug Target Candidates",
-        description=(
-            "10-node strategy identifying L. major drug target candidates. "
-            "UNION of kinases, oxidoreductases, and proteases; INTERSECT with "
-            "secreted or transmembrane proteins; MINUS heat shock proteins "
-            "(housekeeping exclusion). Models a real anti-leishmanial drug "
-            "discovery pipeline targeting enzymes accessible to compounds."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_hsp",
-            "displayName": "Drug Targets (no HSP)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "accessible_enzymes",
-                "displayName": "Accessible Enzymes",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "all_enzymes_union",
-                    "displayName": "All Enzymes",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "kinase_oxido_union",
-                        "displayName": "Kinases + Oxidoreductases",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_kinases",
-                            "displayName": "Protein Kinases (GO:0004672)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(LM_ORG, "GO:0004672"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_oxidoreductases",
-                            "displayName": "Oxidoreductases (GO:0016491)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(LM_ORG, "GO:0016491"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_proteases",
-                        "displayName": "Peptidases (GO:0008233)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(LM_ORG, "GO:0008233"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "accessible_union",
-                    "displayName": "Secreted or Membrane",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_signal_peptide",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(LM_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_transmembrane",
-                        "displayName": "Transmembrane (3-20 TM)",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(LM_ORG, "3", "20"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_heat_shock",
-                "displayName": "Heat Shock Proteins",
-                "searchName": "GenesByText",
-                "parameters": text_search_params(LM_ORG, "heat shock"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="L. major Drug Targets (curated)",
-            positive_ids=(LMJF_LEISHMANOLYSIN[:5] + LMJF_STEROL[:4] + LMJF_KINASES[:6]),
-            negative_ids=LMJF_HEAT_SHOCK[:15],
-            provenance_notes=(
-                "Positives: leishmanolysin GP63, sterol biosynthesis enzymes, "
-                "and protein kinases — validated drug targets in L. major. "
-                "Negatives: heat shock proteins — ubiquitous chaperones not "
-                "suitable as drug targets."
-            ),
-            tags=["drug-target", "leishmania", "seed"],
-        ),
-    ),
-    # ===================================================================
-    # 2) TbTREU927 VSG & Surface Coat (8 nodes)
-    # ===================================================================
-    SeedDef(
-        name="TbTREU927 VSG Surface Coat",
-        description=(
-            "8-node strategy for T. brucei surface coat analysis. "
-            "UNION of VSGs, cell surface proteins, and GPI anchor biosynthesis "
-            "genes; INTERSECT with signal peptide for confirmed secretory "
-            "pathway targeting. MINUS transporters (not surface coat). "
-            "Models antigenic variation research in African trypanosomiasis."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_transport",
-            "displayName": "Surface Coat (no transporters)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "surface_confirmed",
-                "displayName": "Surface with Signal Peptide",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "all_surface_union",
-                    "displayName": "All Surface Genes",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "vsg_surface_union",
-                        "displayName": "VSG + Cell Surface",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_vsg",
-                            "displayName": "Variant Surface Glycoprotein",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(
-                                TB_ORG, "variant surface glycoprotein"
-                            ),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_cell_surface",
-                            "displayName": "Cell Surface (GO:0009986)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TB_ORG, "GO:0009986"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_gpi_bio",
-                        "displayName": "GPI Anchor Biosynthesis (GO:0006506)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TB_ORG, "GO:0006506"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_signal_tb",
-                    "displayName": "Signal Peptide",
-                    "searchName": "GenesWithSignalPeptide",
-                    "parameters": signal_peptide_params(TB_ORG),
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_transporters_tb",
-                "displayName": "Transporters (GO:0005215)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TB_ORG, "GO:0005215"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="T. brucei VSG Surface Coat (curated)",
-            positive_ids=TB_VSG[:15] + TB_CELL_SURFACE[:5],
-            negative_ids=TB_GLYCOSOME[:15],
-            provenance_notes=(
-                "Positives: VSG genes and cell surface proteins — core surface "
-                "coat components of T. brucei antigenic variation. "
-                "Negatives: glycosome proteome genes — metabolic compartment, "
-                "not surface-associated."
-            ),
-            tags=["surface-coat", "vsg", "trypanosome", "seed"],
-        ),
-    ),
-    # ===================================================================
-    # 3) LmjF Invasion & Survival (8 nodes)
-    # ===================================================================
-    SeedDef(
-        name="LmjF Invasion and Survival",
-        description=(
-            "8-node strategy for L. major host-cell invasion and intracellular "
-            "survival. UNION of secreted proteases (GP63/leishmanolysin), "
-            "amastin surface antigens, and cell surface genes; INTERSECT with "
-            "transmembrane or signal peptide for membrane-associated proteins. "
-            "MINUS cytoskeleton (structural exclusion). Models phagolysosome "
-            "survival research."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_cyto",
-            "displayName": "Invasion Genes (no cytoskeleton)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "invasion_surface",
-                "displayName": "Membrane-Associated Virulence",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "virulence_union",
-                    "displayName": "Virulence Factors",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "protease_gp63_union",
-                        "displayName": "Proteases + GP63",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_proteases_lm",
-                            "displayName": "Peptidases (GO:0008233)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(LM_ORG, "GO:0008233"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_leishmanolysin",
-                            "displayName": "Leishmanolysin GP63",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(LM_ORG, "leishmanolysin"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_amastin",
-                        "displayName": "Amastin Surface Antigens",
-                        "searchName": "GenesByText",
-                        "parameters": text_search_params(LM_ORG, "amastin"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "membrane_accessible",
-                    "displayName": "Signal Peptide or TM",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_sp_lm2",
-                        "displayName": "Signal Peptide",
-                        "searchName": "GenesWithSignalPeptide",
-                        "parameters": signal_peptide_params(LM_ORG),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_tm_lm2",
-                        "displayName": "Transmembrane (3-20 TM)",
-                        "searchName": "GenesByTransmembraneDomains",
-                        "parameters": transmembrane_params(LM_ORG, "3", "20"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_cytoskeleton_lm",
-                "displayName": "Cytoskeleton (GO:0005856)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(LM_ORG, "GO:0005856"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="L. major Invasion & Survival (curated)",
-            positive_ids=(LMJF_LEISHMANOLYSIN + LMJF_AMASTIN[:10]),
-            negative_ids=LMJF_CYTOSKELETON[:15],
-            provenance_notes=(
-                "Positives: leishmanolysin GP63 metalloprotease family and "
-                "amastin surface antigens — key invasion and intracellular "
-                "survival factors. "
-                "Negatives: cytoskeletal proteins — structural genes not "
-                "involved in host-parasite interaction."
-            ),
-            tags=["invasion", "virulence", "leishmania", "seed"],
-        ),
-    ),
-    # ===================================================================
-    # 4) TbTREU927 Flagellar Assembly (7 nodes)
-    # ===================================================================
-    SeedDef(
-        name="TbTREU927 Flagellar Assembly",
-        description=(
-            "7-node strategy for T. brucei flagellar assembly and motility. "
-            "UNION of cilium, paraflagellar rod, and cytoskeleton genes; "
-            "INTERSECT with cilium compartment for confirmed flagellar "
-            "localization. MINUS mitochondrial genes (compartment exclusion). "
-            "Models flagellum biology critical for parasite transmission."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_mito",
-            "displayName": "Flagellar (no mitochondrial)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "flagellar_confirmed",
-                "displayName": "Confirmed Flagellar",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "flagellar_candidates",
-                    "displayName": "Flagellar Candidates",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "pfr_cyto_union",
-                        "displayName": "PFR + Cytoskeleton",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_pfr",
-                            "displayName": "Paraflagellar Rod",
-                            "searchName": "GenesByText",
-                            "parameters": text_search_params(
-                                TB_ORG, "paraflagellar rod"
-                            ),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_cyto_tb",
-                            "displayName": "Cytoskeleton (GO:0005856)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TB_ORG, "GO:0005856"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_transport_flag",
-                        "displayName": "Transporters (GO:0005215)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TB_ORG, "GO:0005215"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_cilium_tb",
-                    "displayName": "Cilium (GO:0005929)",
-                    "searchName": "GenesByGoTerm",
-                    "parameters": go_search_params(TB_ORG, "GO:0005929"),
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_mito_tb",
-                "displayName": "Mitochondrion (GO:0005739)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TB_ORG, "GO:0005739"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="T. brucei Flagellar Assembly (curated)",
-            positive_ids=TB_PARAFLAGELLAR[:15],
-            negative_ids=TB_GLYCOSOME[:15],
-            provenance_notes=(
-                "Positives: paraflagellar rod proteins — confirmed flagellar "
-                "structural components essential for T. brucei motility. "
-                "Negatives: glycosome proteome — metabolic compartment genes "
-                "with no flagellar function."
-            ),
-            tags=["flagellum", "motility", "trypanosome", "seed"],
-        ),
-    ),
-    # ===================================================================
-    # 5) Cross-Species Metabolic Comparison (12 nodes)
-    # ===================================================================
-    SeedDef(
-        name="Kinetoplastid Metabolic Enzymes",
-        description=(
-            "12-node cross-species metabolic comparison strategy. "
-            "For each organism (L. major, T. brucei), builds UNION of "
-            "glycolytic enzymes and oxidoreductases. Then UNION of both "
-            "organism sets. INTERSECT with glycosome proteome to identify "
-            "glycosomal metabolic enzymes. MINUS RNA binding (non-metabolic "
-            "exclusion). Models comparative kinetoplastid metabolomics."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_rna",
-            "displayName": "Glycosomal Metabolic (no RNA binding)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "glycosomal_metabolic",
-                "displayName": "Glycosomal Metabolic",
-                "operator": "INTERSECT",
-                "primaryInput": {
-                    "id": "all_species_metabolic",
-                    "displayName": "Both Species Metabolic",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "lm_metabolic",
-                        "displayName": "L. major Metabolic",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_lm_glycolysis",
-                            "displayName": "LmjF Glycolysis (GO:0006096)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(LM_ORG, "GO:0006096"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_lm_oxidored",
-                            "displayName": "LmjF Oxidoreductases (GO:0016491)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(LM_ORG, "GO:0016491"),
-                        },
-                    },
-                    "secondaryInput": {
-                        "id": "tb_metabolic",
-                        "displayName": "T. brucei Metabolic",
-                        "operator": "UNION",
-                        "primaryInput": {
-                            "id": "leaf_tb_glycolysis",
-                            "displayName": "Tb927 Glycolysis (GO:0006096)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TB_ORG, "GO:0006096"),
-                        },
-                        "secondaryInput": {
-                            "id": "leaf_tb_oxidored",
-                            "displayName": "Tb927 Oxidoreductases (GO:0016491)",
-                            "searchName": "GenesByGoTerm",
-                            "parameters": go_search_params(TB_ORG, "GO:0016491"),
-                        },
-                    },
-                },
-                "secondaryInput": {
-                    "id": "glycosome_expanded",
-                    "displayName": "Glycosome + Glycolytic",
-                    "operator": "UNION",
-                    "primaryInput": {
-                        "id": "leaf_glycosome",
-                        "displayName": "Glycosome Proteome",
-                        "searchName": "GenesInGlycosomeProteome",
-                        "parameters": _glycosome_params(),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_lm_glycolysis2",
-                        "displayName": "LmjF Glycolysis (GO:0006096)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(LM_ORG, "GO:0006096"),
-                    },
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_rna_binding_exclude",
-                "displayName": "RNA Binding (GO:0003723)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TB_ORG, "GO:0003723"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="Kinetoplastid Metabolic Enzymes (curated)",
-            positive_ids=(TB_GLYCOLYSIS[:10] + LMJF_GLYCOLYSIS[:10]),
-            negative_ids=(TB_RNA_BINDING[:10] + TB_HEAT_SHOCK[:5]),
-            provenance_notes=(
-                "Positives: glycolytic enzymes from both T. brucei and L. major "
-                "— conserved metabolic pathway genes. "
-                "Negatives: RNA binding proteins and heat shock — non-metabolic "
-                "housekeeping genes."
-            ),
-            tags=["metabolic", "glycosome", "cross-species", "seed"],
-        ),
-    ),
-    # ===================================================================
-    # 6) TbTREU927 Kinetoplast & RNA Editing (6 nodes)
-    # ===================================================================
-    SeedDef(
-        name="TbTREU927 Kinetoplast RNA Editing",
-        description=(
-            "6-node strategy for T. brucei kinetoplast biology and RNA editing. "
-            "INTERSECT of mitochondrial (GO:0005739) and RNA binding (GO:0003723) "
-            "genes to find mitochondrial RNA-processing machinery. "
-            "UNION with trypanothione system genes (redox protection). "
-            "MINUS kinases (signaling exclusion). "
-            "Models editosome and kinetoplast DNA research."
-        ),
-        site_id="tritrypdb",
-        step_tree={
-            "id": "root_minus_kinase",
-            "displayName": "Kinetoplast Machinery (no kinases)",
-            "operator": "MINUS",
-            "primaryInput": {
-                "id": "kinetoplast_redox",
-                "displayName": "Kinetoplast + Redox",
-                "operator": "UNION",
-                "primaryInput": {
-                    "id": "mito_rna_editing",
-                    "displayName": "Mitochondrial RNA Processing",
-                    "operator": "INTERSECT",
-                    "primaryInput": {
-                        "id": "leaf_mito_tb2",
-                        "displayName": "Mitochondrion (GO:0005739)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TB_ORG, "GO:0005739"),
-                    },
-                    "secondaryInput": {
-                        "id": "leaf_rna_binding_tb",
-                        "displayName": "RNA Binding (GO:0003723)",
-                        "searchName": "GenesByGoTerm",
-                        "parameters": go_search_params(TB_ORG, "GO:0003723"),
-                    },
-                },
-                "secondaryInput": {
-                    "id": "leaf_trypanothione",
-                    "displayName": "Trypanothione System",
-                    "searchName": "GenesByText",
-                    "parameters": text_search_params(TB_ORG, "trypanothione"),
-                },
-            },
-            "secondaryInput": {
-                "id": "leaf_kinases_exclude",
-                "displayName": "Kinases (GO:0004672)",
-                "searchName": "GenesByGoTerm",
-                "parameters": go_search_params(TB_ORG, "GO:0004672"),
-            },
-        },
-        control_set=ControlSetDef(
-            name="T. brucei Kinetoplast RNA Editing (curated)",
-            positive_ids=(TB_TRYPANOTHIONE + TB_RNA_BINDING[:9]),
-            negative_ids=TB_KINASES[:15],
-            provenance_notes=(
-                "Positives: trypanothione redox system and mitochondrial "
-                "RNA-binding proteins — core kinetoplast and editosome "
-                "components. "
-                "Negatives: protein kinases — signaling genes with no "
-                "direct role in RNA editing."
-            ),
-            tags=["kinetoplast", "rna-editing", "trypanosome", "seed"],
-        ),
-    ),
-]
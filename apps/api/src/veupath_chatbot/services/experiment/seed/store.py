@@ -0,0 +1,174 @@
+"""On-disk storage for the seed corpus.
+
+Seeds live in ``seeds/data`` as one gzip-compressed JSONL file per
+database (one :class:`SeedDef` per line) plus a ``manifest.json`` listing
+each database's file, content hash and seed names.  Nothing is read at
+import time beyond the small manifest; seed files are decoded line by line
+on demand, so callers can stream a site's seeds without holding the whole
+corpus in memory.
+
+Gene IDs are interned on load: control sets for one organism reuse the
+same IDs heavily, and interning keeps a single copy of each.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
+
+MANIFEST_VERSION = 1
+DATA_DIR = Path(__file__).parent / "seeds" / "data"
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class SiteSeedsEntry:
+    """Manifest entry for one database's seed file."""
+
+    file: str
+    sha256: str
+    names: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SeedManifest:
+    """Index of the seed corpus, in seeding order."""
+
+    sites: dict[str, SiteSeedsEntry] = field(default_factory=dict)
+
+    def find_site(self, seed_name: str) -> str | None:
+        """Return the database that defines *seed_name*, if any."""
+        for site_id, entry in self.sites.items():
+            if seed_name in entry.names:
+                return site_id
+        return None
+
+
+def seed_to_json(seed: SeedDef) -> dict[str, Any]:
+    return asdict(seed)
+
+
+def seed_from_json(data: dict[str, Any]) -> SeedDef:
+    cs = data["control_set"]
+    return SeedDef(
+        name=data["name"],
+        description=data["description"],
+        site_id=data["site_id"],
+        step_tree=data["step_tree"],
+        record_type=data.get("record_type", "transcript"),
+        control_set=ControlSetDef(
+            name=cs["name"],
+            positive_ids=[sys.intern(i) for i in cs["positive_ids"]],
+            negative_ids=[sys.intern(i) for i in cs["negative_ids"]],
+            provenance_notes=cs["provenance_notes"],
+            tags=list(cs.get("tags", [])),
+        ),
+    )
+
+
+@lru_cache
+def load_manifest(data_dir: Path = DATA_DIR) -> SeedManifest:
+    """Read the seed manifest (cached; cleared by :func:`write_site_seeds`)."""
+    path = data_dir / MANIFEST_NAME
+    if not path.exists():
+        return SeedManifest()
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if raw.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported seed manifest version {raw.get('version')!r} in {path}"
+        )
+    return SeedManifest(
+        sites={
+            site_id: SiteSeedsEntry(
+                file=entry["file"],
+                sha256=entry["sha256"],
+                names=list(entry.get("names", [])),
+            )
+            for site_id, entry in raw.get("sites", {}).items()
+        }
+    )
+
+
+def iter_site_seeds(site_id: str, data_dir: Path = DATA_DIR) -> Iterator[SeedDef]:
+    """Stream the seeds of one database from its data file.
+
+    The compressed file is checked against the manifest's hash before any
+    seed is decoded.
+
+    :raises ValueError: If *site_id* has no seed file in the manifest, or
+        the file doesn't match the manifest's hash.
+    """
+    entry = load_manifest(data_dir).sites.get(site_id)
+    if entry is None:
+        raise ValueError(f"No seeds for site '{site_id}'")
+    payload = (data_dir / entry.file).read_bytes()
+    if hashlib.sha256(payload).hexdigest() != entry.sha256:
+        raise ValueError(
+            f"Seed file '{entry.file}' does not match its manifest hash; "
+            "regenerate the seed data"
+        )
+    with gzip.open(io.BytesIO(payload), "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield seed_from_json(json.loads(line))
+
+
+def write_site_seeds(
+    site_id: str, seeds: Iterable[SeedDef], data_dir: Path = DATA_DIR
+) -> SiteSeedsEntry:
+    """Write *site_id*'s seed file and record it in the manifest.
+
+    Output is deterministic (sorted keys, zero gzip mtime), so rewriting
+    unchanged seeds leaves the files byte-identical.
+    """
+    names: list[str] = []
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=9, mtime=0) as gz:
+        for seed in seeds:
+            if seed.site_id != site_id:
+                raise ValueError(
+                    f"Seed '{seed.name}' belongs to '{seed.site_id}', not '{site_id}'"
+                )
+            names.append(seed.name)
+            line = json.dumps(
+                seed_to_json(seed),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+            gz.write(line.encode("utf-8") + b"\n")
+    payload = buf.getvalue()
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    entry = SiteSeedsEntry(
+        file=f"{site_id}.jsonl.gz",
+        sha256=hashlib.sha256(payload).hexdigest(),
+        names=names,
+    )
+    (data_dir / entry.file).write_bytes(payload)
+
+    manifest = load_manifest(data_dir)
+    sites = dict(manifest.sites)
+    sites[site_id] = entry
+    (data_dir / MANIFEST_NAME).write_text(
+        json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "sites": {sid: asdict(e) for sid, e in sites.items()},
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    load_manifest.cache_clear()
+    return entry
@@ -10,11 +10,13 @@ orchestrates phase sequencing, lifecycle management, and error handling.
 
 import time
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime
 from typing import cast
 from uuid import uuid4
 
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.tracing import Span, span
 from veupath_chatbot.platform.types import JSONObject, JSONValue
 from veupath_chatbot.services.control_tests import run_positive_negative_controls
 from veupath_chatbot.services.experiment.cross_validation import run_cross_validation
@@ -27,6 +29,7 @@ from veupath_chatbot.services.experiment.materialization import (
     _persist_experiment_strategy,
 )
 from veupath_chatbot.services.experiment.metrics import metrics_from_control_result
+from veupath_chatbot.services.experiment.result_set import ExperimentResultSet
 from veupath_chatbot.services.experiment.step_analysis import (
     run_controls_against_tree,
 )
@@ -70,6 +73,7 @@ async def _run_single_step_controls(
         positive_controls=config.positive_controls or None,
         negative_controls=config.negative_controls or None,
         controls_value_format=config.controls_value_format,
+        local_intersection=True,
     )
 
 
@@ -206,7 +210,7 @@ async def _phase_persist_strategy(
         raw_step = wdk_ids.get("step_id")
         experiment.wdk_strategy_id = raw_sid if isinstance(raw_sid, int) else None
         experiment.wdk_step_id = raw_step if isinstance(raw_step, int) else None
-        store.save(experiment)
+        store.save_fields(experiment, "wdkStrategyId", "wdkStepId")
     except Exception as exc:
         logger.warning(
             "Failed to persist WDK strategy for experiment",
@@ -220,28 +224,20 @@ async def _phase_rank_metrics(
     experiment: Experiment,
     emit: EmitFn,
     store: ExperimentStore,
-) -> list[str]:
-    """Compute rank-based metrics when a sort attribute is configured.
-
-    :returns: Ordered result IDs (for downstream robustness phase).
-    """
+    result_set: ExperimentResultSet | None,
+) -> None:
+    """Compute rank-based metrics when a sort attribute is configured."""
     is_ranked = config.sort_attribute is not None
-    if not is_ranked or experiment.wdk_step_id is None:
-        return []
+    if not is_ranked or result_set is None:
+        return
 
     try:
         await emit("evaluating", message="Computing rank-based metrics...")
         from veupath_chatbot.services.experiment.rank_metrics import (
             compute_rank_metrics,
-            fetch_ordered_result_ids,
         )
 
-        ordered_ids = await fetch_ordered_result_ids(
-            site_id=config.site_id,
-            step_id=experiment.wdk_step_id,
-            sort_attribute=config.sort_attribute,
-            sort_direction=config.sort_direction,
-        )
+        ordered_ids = await result_set.ids()
         if ordered_ids:
             pos_set = set(config.positive_controls or [])
             neg_set = set(config.negative_controls or [])
@@ -251,14 +247,12 @@ async def _phase_rank_metrics(
                 negative_ids=neg_set,
             )
             store.save(experiment)
-        return ordered_ids
     except Exception as exc:
         logger.warning(
             "Rank metrics computation failed",
             experiment_id=experiment.id,
             error=str(exc),
         )
-        return []
 
 
 async def _phase_robustness(
@@ -266,27 +260,19 @@ async def _phase_robustness(
     experiment: Experiment,
     emit: EmitFn,
     store: ExperimentStore,
-    ordered_ids: list[str],
+    result_set: ExperimentResultSet | None,
     *,
     is_ranked: bool,
 ) -> None:
     """Compute bootstrap confidence intervals."""
-    if experiment.wdk_step_id is None:
+    if result_set is None:
         return
 
     try:
         await emit("evaluating", message="Computing robustness estimates...")
-        from veupath_chatbot.services.experiment.rank_metrics import (
-            fetch_ordered_result_ids,
-        )
         from veupath_chatbot.services.experiment.robustness import compute_robustness
 
-        if not ordered_ids:
-            ordered_ids = await fetch_ordered_result_ids(
-                site_id=config.site_id,
-                step_id=experiment.wdk_step_id,
-            )
-
+        ordered_ids = await result_set.ids()
         if ordered_ids:
             experiment.robustness = compute_robustness(
                 result_ids=ordered_ids,
@@ -503,34 +489,20 @@ async def _phase_enrich(
 
     await emit("enriching", message="Running enrichment analyses...")
 
-    step_id = experiment.wdk_step_id
-    search_name = config.search_name
-    record_type = config.record_type
-    parameters = config.parameters
-
-    # Gene-ID experiments may lack a WDK step and search_name.
-    # Build a temporary GeneByLocusTag dataset so enrichment can proceed.
-    if step_id is None and not search_name and config.target_gene_ids:
-        from veupath_chatbot.services.gene_sets.operations import (
-            _build_enrichment_params_from_gene_ids,
-        )
-
-        (
-            search_name,
-            parameters,
-            record_type,
-        ) = await _build_enrichment_params_from_gene_ids(
-            config.site_id, config.target_gene_ids
-        )
-
+    # Gene-ID experiments may lack a WDK step and search_name; the service
+    # backs their gene IDs with a temporary GeneByLocusTag dataset.  The
+    # IDs are only passed when nothing else can run, so the cache key
+    # names the analysed input.
     svc = EnrichmentService()
+    has_search = bool(config.search_name) and config.parameters is not None
     enrich_results, _ = await svc.run_batch(
         site_id=config.site_id,
         analysis_types=config.enrichment_types,
-        step_id=step_id,
-        search_name=search_name,
-        record_type=record_type,
-        parameters=parameters,
+        step_id=experiment.wdk_step_id,
+        search_name=config.search_name,
+        record_type=config.record_type,
+        parameters=config.parameters,
+        gene_ids=None if has_search else config.target_gene_ids or None,
     )
     for enrich_result in enrich_results:
         upsert_enrichment_result(experiment.enrichment_results, enrich_result)
@@ -542,6 +514,16 @@ async def _phase_enrich(
 # ---------------------------------------------------------------------------
 
 
+def _phase_span(phase: str, experiment: Experiment) -> AbstractContextManager[Span]:
+    """Span timing one experiment phase (profiled under category ``phase``)."""
+    return span(
+        f"experiment.{phase}",
+        category="phase",
+        endpoint=phase,
+        experiment_id=experiment.id,
+    )
+
+
 async def run_experiment(
     config: ExperimentConfig,
     *,
@@ -569,6 +551,7 @@ async def run_experiment(
     store.save(experiment)
 
     start = time.monotonic()
+    result_set: ExperimentResultSet | None = None
 
     async def _emit(phase: ExperimentProgressPhase, **extra: object) -> None:
         if progress_callback:
@@ -586,7 +569,8 @@ async def run_experiment(
         await _emit("started", message="Starting evaluation...")
 
         # Phase 1: Control-test evaluation + metrics + gene enrichment
-        result, metrics = await _phase_evaluate(config, experiment, _emit, store)
+        with _phase_span("evaluate", experiment):
+            result, metrics = await _phase_evaluate(config, experiment, _emit, store)
 
         tree_dict: JSONObject = (
             cast(JSONObject, config.step_tree) if config.is_tree_mode else {}
@@ -596,33 +580,41 @@ async def run_experiment(
 
         # Phase 2: Step analysis (multi-step only)
         if config.is_tree_mode and config.enable_step_analysis:
-            await _phase_step_analysis(
-                config,
-                experiment,
-                _emit,
-                store,
-                tree_dict,
-                cvf,
-                result,
-                metrics,
-            )
+            with _phase_span("step_analysis", experiment):
+                await _phase_step_analysis(
+                    config,
+                    experiment,
+                    _emit,
+                    store,
+                    tree_dict,
+                    cvf,
+                    result,
+                    metrics,
+                )
 
         # Phase 3: Persist WDK strategy for result exploration
-        await _phase_persist_strategy(config, experiment, store, final_tree)
+        with _phase_span("persist_strategy", experiment):
+            await _phase_persist_strategy(config, experiment, store, final_tree)
+
+        # Ordered result IDs, fetched once for the phases below
+        if experiment.wdk_step_id is not None:
+            result_set = ExperimentResultSet(config, experiment.wdk_step_id)
 
         # Phase 4: Rank-based metrics
         is_ranked = config.sort_attribute is not None
-        ordered_ids = await _phase_rank_metrics(config, experiment, _emit, store)
+        with _phase_span("rank_metrics", experiment):
+            await _phase_rank_metrics(config, experiment, _emit, store, result_set)
 
         # Phase 5: Robustness / bootstrap CIs
-        await _phase_robustness(
-            config,
-            experiment,
-            _emit,
-            store,
-            ordered_ids,
-            is_ranked=is_ranked,
-        )
+        with _phase_span("robustness", experiment):
+            await _phase_robustness(
+                config,
+                experiment,
+                _emit,
+                store,
+                result_set,
+                is_ranked=is_ranked,
+            )
 
         # Phase 6: Parameter optimization (single-step only)
         if (
@@ -630,20 +622,22 @@ async def run_experiment(
             and config.optimization_specs
             and len(config.optimization_specs) > 0
         ):
-            _, metrics = await _phase_optimize_parameters(
-                config,
-                experiment,
-                _emit,
-                store,
-                metrics,
-            )
+            with _phase_span("optimize_parameters", experiment):
+                _, metrics = await _phase_optimize_parameters(
+                    config,
+                    experiment,
+                    _emit,
+                    store,
+                    metrics,
+                )
 
         # Phase 7: Tree-knob optimization (multi-step only)
         has_tree_knobs = bool(config.threshold_knobs or config.operator_knobs)
         if config.is_tree_mode and has_tree_knobs and final_tree is not None:
-            await _phase_optimize_tree_knobs(
-                config, experiment, _emit, store, tree_dict, cvf
-            )
+            with _phase_span("optimize_tree_knobs", experiment):
+                await _phase_optimize_tree_knobs(
+                    config, experiment, _emit, store, tree_dict, cvf
+                )
 
         # Phase 8: Cross-validation
         if (
@@ -651,19 +645,21 @@ async def run_experiment(
             and config.positive_controls
             and config.negative_controls
         ):
-            await _phase_cross_validate(
-                config,
-                experiment,
-                _emit,
-                store,
-                metrics=metrics,
-                final_tree=final_tree,
-                cvf=cvf,
-            )
+            with _phase_span("cross_validate", experiment):
+                await _phase_cross_validate(
+                    config,
+                    experiment,
+                    _emit,
+                    store,
+                    metrics=metrics,
+                    final_tree=final_tree,
+                    cvf=cvf,
+                )
 
         # Phase 9: Enrichment analysis
         if config.enrichment_types:
-            await _phase_enrich(config, experiment, _emit, store)
+            with _phase_span("enrich", experiment):
+                await _phase_enrich(config, experiment, _emit, store)
 
         # Finalize
         experiment.status = "completed"
@@ -681,3 +677,6 @@ async def run_experiment(
         store.save(experiment)
         await _emit("error", error=str(exc))
         raise
+    finally:
+        if result_set is not None:
+            result_set.close()
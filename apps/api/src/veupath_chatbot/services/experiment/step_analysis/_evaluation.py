@@ -6,9 +6,12 @@ from veupath_chatbot.domain.strategy.ast import StepTreeNode
 from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONArray, JSONObject
-from veupath_chatbot.services.control_helpers import delete_temp_strategy
+from veupath_chatbot.services.control_helpers import (
+    create_temp_strategy,
+    delete_temp_strategy,
+)
 from veupath_chatbot.services.control_tests import (
-    _extract_intersection_data,
+    extract_intersection_data,
     resolve_controls_param_type,
 )
 from veupath_chatbot.services.experiment.helpers import safe_int
@@ -42,10 +45,7 @@ async def run_controls_against_tree(
     Returns the same shape as :func:`run_positive_negative_controls` so
     :func:`metrics_from_control_result` can consume it directly.
     """
-    from veupath_chatbot.services.experiment.helpers import (
-        coerce_step_id,
-        extract_wdk_id,
-    )
+    from veupath_chatbot.services.experiment.helpers import coerce_step_id
     from veupath_chatbot.services.experiment.materialization import (
         _materialize_step_tree,
     )
@@ -108,12 +108,9 @@ async def run_controls_against_tree(
             primary_input=root_tree,
             secondary_input=StepTreeNode(controls_step_id),
         )
-        created = await api.create_strategy(
-            step_tree=full_tree,
-            name="Pathfinder tree eval",
-            is_internal=True,
+        strategy_id = await create_temp_strategy(
+            api, step_tree=full_tree, name="Pathfinder tree eval"
         )
-        strategy_id = extract_wdk_id(created)
 
         try:
             target_total = await api.get_step_count(root_tree.step_id)
@@ -143,7 +140,7 @@ async def run_controls_against_tree(
 
     if pos:
         pos_payload = await _eval_control_set(pos, "positive")
-        pos_count, found_ids, has_ids = _extract_intersection_data(pos_payload)
+        pos_count, found_ids, has_ids = extract_intersection_data(pos_payload)
         missing = [x for x in pos if x not in found_ids] if has_ids else []
         missing_sample: JSONArray = list(missing[:50])
 
@@ -159,7 +156,7 @@ async def run_controls_against_tree(
 
     if neg:
         neg_payload = await _eval_control_set(neg, "negative")
-        neg_count, hit_ids, _ = _extract_intersection_data(neg_payload)
+        neg_count, hit_ids, _ = extract_intersection_data(neg_payload)
 
         if result["target"] is None or (
             isinstance(result["target"], dict)
@@ -107,6 +107,7 @@ async def evaluate_steps(
                         controls_value_format=controls_value_format,
                         positive_controls=positive_controls,
                         negative_controls=negative_controls,
+                        local_intersection=True,
                     )
         except Exception as exc:
             logger.warning("Step evaluation failed", step=lid, error=str(exc))
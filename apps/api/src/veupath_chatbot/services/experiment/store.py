@@ -11,8 +11,10 @@ from functools import cache
 
 from sqlalchemy import select
 
-from veupath_chatbot.persistence.models import ExperimentRow
+from veupath_chatbot.persistence.jsonb import jsonb_set_keys
+from veupath_chatbot.persistence.models import ExperimentRow, experiment_search_name
 from veupath_chatbot.platform.store import WriteThruStore
+from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.experiment._deserialize import experiment_from_json
 from veupath_chatbot.services.experiment.types import (
     Experiment,
@@ -62,8 +64,15 @@ def _experiment_from_row(row: ExperimentRow) -> Experiment:
 async def _list_from_db(
     site_id: str | None = None,
     user_id: str | None = None,
+    *,
+    status: str | None = None,
+    search_name: str | None = None,
 ) -> list[Experiment]:
-    """List experiments from the database, optionally filtered by site and user."""
+    """List experiments from the database, filtered in SQL.
+
+    ``search_name`` matches ``data->'config'->>'searchName'`` and is served
+    by the ``ix_experiments_search_name`` expression index.
+    """
     from veupath_chatbot.persistence.session import async_session_factory
 
     stmt = select(ExperimentRow)
@@ -71,6 +80,10 @@ async def _list_from_db(
         stmt = stmt.where(ExperimentRow.site_id == site_id)
     if user_id:
         stmt = stmt.where(ExperimentRow.user_id == user_id)
+    if status:
+        stmt = stmt.where(ExperimentRow.status == status)
+    if search_name:
+        stmt = stmt.where(experiment_search_name == search_name)
     stmt = stmt.order_by(ExperimentRow.created_at.desc())
 
     async with async_session_factory() as session:
@@ -106,6 +119,23 @@ class ExperimentStore(WriteThruStore[Experiment]):
     _to_row = staticmethod(_row_from_experiment)
     _from_row = staticmethod(_experiment_from_row)
 
+    # -- Partial writes -----------------------------------------------------
+
+    def save_fields(self, experiment: Experiment, *keys: str) -> None:
+        """Cache *experiment* and persist only the given top-level JSON keys.
+
+        For small transitions (status, notes, WDK IDs) on an experiment that
+        is already stored: the row's ``data`` document is updated in place
+        with ``jsonb_set`` rather than re-sent whole.  Keys are the camelCase
+        names produced by :func:`experiment_to_json`.
+        """
+        doc = experiment_to_json(experiment)
+        patch: JSONObject = {key: doc[key] for key in keys}
+        values: dict[str, object] = {"data": jsonb_set_keys(ExperimentRow.data, patch)}
+        if "status" in patch:
+            values["status"] = experiment.status
+        self.save_partial(experiment, values)
+
     # -- Sync listing (used by service.py / ai_analysis_tools.py) ----------
 
     def list_all(
@@ -129,10 +159,17 @@ class ExperimentStore(WriteThruStore[Experiment]):
     # -- Async listing (used by endpoint handlers) -------------------------
 
     async def alist_all(
-        self, site_id: str | None = None, user_id: str | None = None
+        self,
+        site_id: str | None = None,
+        user_id: str | None = None,
+        *,
+        status: str | None = None,
+        search_name: str | None = None,
     ) -> list[Experiment]:
         """List experiments: merges DB rows with in-memory (fresher) state."""
-        db_exps = await _list_from_db(site_id, user_id)
+        db_exps = await _list_from_db(
+            site_id, user_id, status=status, search_name=search_name
+        )
         merged: dict[str, Experiment] = {e.id: e for e in db_exps}
         # In-memory entries override DB (running experiments have fresher state)
         for eid, exp in self._cache.items():
@@ -140,6 +177,12 @@ class ExperimentStore(WriteThruStore[Experiment]):
                 continue
             if user_id and exp.user_id != user_id:
                 continue
+            if search_name and exp.config.search_name != search_name:
+                continue
+            if status and exp.status != status:
+                # The cached state may have moved past the DB row's status.
+                merged.pop(eid, None)
+                continue
             merged[eid] = exp
         result = list(merged.values())
         result.sort(key=lambda e: e.created_at, reverse=True)
@@ -0,0 +1,175 @@
+"""Single-pass sweeps over monotone numeric thresholds.
+
+A threshold parameter such as ``fold_change >= x`` or ``p_value <= x``
+nests its result sets: every record that passes a strict value also
+passes a looser one.  When the search reports the thresholded value as a
+result attribute, one materialization at the loosest value is enough to
+score every sweep point: sort the attribute values once and read each
+point's result and control-hit counts off the sorted lists.
+
+:func:`fetch_attribute_values` does the WDK work and
+:func:`local_control_results` the counting.  The evaluation service falls
+back to per-point WDK runs when any precondition fails.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import Literal
+
+from veupath_chatbot.domain.strategy.ast import StepTreeNode
+from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.control_helpers import (
+    create_temp_strategy,
+    delete_temp_strategy,
+)
+from veupath_chatbot.services.experiment.helpers import coerce_step_id
+from veupath_chatbot.services.wdk.helpers import extract_pk
+
+ThresholdDirection = Literal["min", "max"]
+"""``"min"``: records pass when the attribute is >= the threshold (fold
+change, score); ``"max"``: when it is <= the threshold (p-value)."""
+
+MAX_RECORDS = 50_000
+"""Largest loosest-threshold result fetched; bigger results sweep per point."""
+
+_PAGE_SIZE = 10_000
+
+
+class SinglePassUnavailableError(Exception):
+    """The sweep can't be scored from one result; evaluate each point instead."""
+
+
+def loosest_threshold(values: Iterable[float], direction: ThresholdDirection) -> float:
+    """Return the threshold that admits the most records."""
+    return min(values) if direction == "min" else max(values)
+
+
+def _count_passing(
+    sorted_values: list[float], threshold: float, direction: ThresholdDirection
+) -> int:
+    if direction == "min":
+        return len(sorted_values) - bisect_left(sorted_values, threshold)
+    return bisect_right(sorted_values, threshold)
+
+
+async def fetch_attribute_values(
+    *,
+    site_id: str,
+    record_type: str,
+    search_name: str,
+    parameters: JSONObject,
+    attribute_name: str,
+) -> list[tuple[str, float]]:
+    """Materialize one search and return ``(record id, attribute value)`` pairs.
+
+    Runs in a temporary internal strategy, deleted before returning.
+
+    :raises SinglePassUnavailableError: If the result exceeds :data:`MAX_RECORDS`
+        or a record has no numeric value for *attribute_name*.
+    """
+    from veupath_chatbot.services.catalog.searches import find_record_type_for_search
+
+    api = get_strategy_api(site_id)
+    target_rt = await find_record_type_for_search(site_id, record_type, search_name)
+    step = await api.create_step(
+        record_type=target_rt,
+        search_name=search_name,
+        parameters=parameters,
+        custom_name="Threshold sweep",
+    )
+    step_id = coerce_step_id(step)
+    strategy_id = await create_temp_strategy(
+        api, step_tree=StepTreeNode(step_id), name="Pathfinder threshold sweep"
+    )
+
+    try:
+        total = await api.get_step_count(step_id)
+        if total > MAX_RECORDS:
+            raise SinglePassUnavailableError(
+                f"{total} results exceed the single-pass limit of {MAX_RECORDS}"
+            )
+        pairs: list[tuple[str, float]] = []
+        for offset in range(0, total, _PAGE_SIZE):
+            answer = await api.get_step_records(
+                step_id=step_id,
+                attributes=[attribute_name],
+                pagination={"offset": offset, "numRecords": _PAGE_SIZE},
+            )
+            records = answer.get("records")
+            for rec in records if isinstance(records, list) else []:
+                if not isinstance(rec, dict):
+                    continue
+                pk = extract_pk(rec)
+                attrs = rec.get("attributes")
+                raw = attrs.get(attribute_name) if isinstance(attrs, dict) else None
+                try:
+                    value = float(str(raw))
+                except ValueError:
+                    value = math.nan
+                if pk is None or math.isnan(value):
+                    raise SinglePassUnavailableError(
+                        f"Record {pk!r} has no numeric '{attribute_name}' value"
+                    )
+                pairs.append((pk, value))
+        return pairs
+    finally:
+        await delete_temp_strategy(api, strategy_id)
+
+
+def local_control_results(
+    records: list[tuple[str, float]],
+    thresholds: list[float],
+    direction: ThresholdDirection,
+    *,
+    positive_hits: set[str],
+    negative_hits: set[str],
+    positive_count: int,
+    negative_count: int,
+) -> list[JSONObject]:
+    """Score every threshold from the loosest threshold's records.
+
+    :param records: ``(record id, value)`` pairs of the loosest result.
+    :param thresholds: Sweep values, in any order.
+    :param direction: How the parameter compares against the attribute.
+    :param positive_hits: Positive controls found in the loosest result.
+    :param negative_hits: Negative controls found in the loosest result.
+    :param positive_count: Size of the positive control set.
+    :param negative_count: Size of the negative control set.
+    :returns: One control-test-shaped result per threshold, in input order,
+        readable by :func:`~veupath_chatbot.services.experiment.metrics.metrics_from_control_result`.
+    :raises SinglePassUnavailableError: If a record fails the loosest threshold,
+        i.e. the attribute doesn't track the parameter as *direction* says.
+    """
+    loosest = loosest_threshold(thresholds, direction)
+    all_values = sorted(value for _, value in records)
+    if all_values and _count_passing(all_values, loosest, direction) != len(all_values):
+        raise SinglePassUnavailableError(
+            "Attribute values fall outside the loosest threshold"
+        )
+    pos_values = sorted(value for pk, value in records if pk in positive_hits)
+    neg_values = sorted(value for pk, value in records if pk in negative_hits)
+
+    results: list[JSONObject] = []
+    for threshold in thresholds:
+        results.append(
+            {
+                "target": {
+                    "resultCount": _count_passing(all_values, threshold, direction)
+                },
+                "positive": {
+                    "controlsCount": positive_count,
+                    "intersectionCount": _count_passing(
+                        pos_values, threshold, direction
+                    ),
+                },
+                "negative": {
+                    "controlsCount": negative_count,
+                    "intersectionCount": _count_passing(
+                        neg_values, threshold, direction
+                    ),
+                },
+            }
+        )
+    return results
@@ -50,6 +50,7 @@ from veupath_chatbot.services.experiment.types.rank import (
     RankMetrics,
 )
 from veupath_chatbot.services.experiment.types.serialization import (
+    config_to_json,
     experiment_summary_to_json,
     experiment_to_json,
 )
@@ -111,6 +112,7 @@ __all__ = [
     "Experiment",
     "ExperimentConfig",
     # Serialization
+    "config_to_json",
     "experiment_summary_to_json",
     "experiment_to_json",
     "from_json",
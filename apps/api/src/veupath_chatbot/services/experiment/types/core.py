@@ -13,6 +13,7 @@ ParameterType = Literal["numeric", "integer", "categorical"]
 ExperimentStatus = Literal["pending", "running", "completed", "error", "cancelled"]
 
 ExperimentProgressPhase = Literal[
+    "queued",
     "started",
     "evaluating",
     "optimizing",
@@ -9,62 +9,71 @@ inclusion and summary projections.
 from typing import cast
 
 from veupath_chatbot.platform.types import JSONObject
-from veupath_chatbot.services.experiment.types.experiment import Experiment
+from veupath_chatbot.services.experiment.types.experiment import (
+    Experiment,
+    ExperimentConfig,
+)
 from veupath_chatbot.services.experiment.types.json_codec import to_json
 
 
-def experiment_to_json(exp: Experiment) -> JSONObject:
-    """Serialize a full :class:`Experiment` to a JSON-compatible dict."""
-    config: JSONObject = {
-        "siteId": exp.config.site_id,
-        "recordType": exp.config.record_type,
-        "mode": exp.config.mode,
-        "searchName": exp.config.search_name,
-        "parameters": exp.config.parameters,
-        "positiveControls": list(exp.config.positive_controls),
-        "negativeControls": list(exp.config.negative_controls),
-        "controlsSearchName": exp.config.controls_search_name,
-        "controlsParamName": exp.config.controls_param_name,
-        "controlsValueFormat": exp.config.controls_value_format,
-        "enableCrossValidation": exp.config.enable_cross_validation,
-        "kFolds": exp.config.k_folds,
-        "enrichmentTypes": list(exp.config.enrichment_types),
-        "name": exp.config.name,
-        "description": exp.config.description,
-        "optimizationBudget": exp.config.optimization_budget,
-        "optimizationObjective": exp.config.optimization_objective,
+def config_to_json(config: ExperimentConfig) -> JSONObject:
+    """Serialize an :class:`ExperimentConfig` to a JSON-compatible dict."""
+    data: JSONObject = {
+        "siteId": config.site_id,
+        "recordType": config.record_type,
+        "mode": config.mode,
+        "searchName": config.search_name,
+        "parameters": config.parameters,
+        "positiveControls": list(config.positive_controls),
+        "negativeControls": list(config.negative_controls),
+        "controlsSearchName": config.controls_search_name,
+        "controlsParamName": config.controls_param_name,
+        "controlsValueFormat": config.controls_value_format,
+        "enableCrossValidation": config.enable_cross_validation,
+        "kFolds": config.k_folds,
+        "enrichmentTypes": list(config.enrichment_types),
+        "name": config.name,
+        "description": config.description,
+        "optimizationBudget": config.optimization_budget,
+        "optimizationObjective": config.optimization_objective,
     }
-    if exp.config.step_tree is not None:
-        config["stepTree"] = exp.config.step_tree
-    if exp.config.source_strategy_id:
-        config["sourceStrategyId"] = exp.config.source_strategy_id
-    if exp.config.optimization_target_step:
-        config["optimizationTargetStep"] = exp.config.optimization_target_step
-    if exp.config.enable_step_analysis:
-        config["enableStepAnalysis"] = True
-        config["stepAnalysisPhases"] = list(exp.config.step_analysis_phases)
-    if exp.config.optimization_specs:
-        config["optimizationSpecs"] = to_json(exp.config.optimization_specs)
-    if exp.config.parameter_display_values:
-        config["parameterDisplayValues"] = cast(
-            JSONObject, exp.config.parameter_display_values
+    if config.step_tree is not None:
+        data["stepTree"] = config.step_tree
+    if config.source_strategy_id:
+        data["sourceStrategyId"] = config.source_strategy_id
+    if config.optimization_target_step:
+        data["optimizationTargetStep"] = config.optimization_target_step
+    if config.enable_step_analysis:
+        data["enableStepAnalysis"] = True
+        data["stepAnalysisPhases"] = list(config.step_analysis_phases)
+    if config.optimization_specs:
+        data["optimizationSpecs"] = to_json(config.optimization_specs)
+    if config.parameter_display_values:
+        data["parameterDisplayValues"] = cast(
+            JSONObject, config.parameter_display_values
         )
-    if exp.config.control_set_id:
-        config["controlSetId"] = exp.config.control_set_id
-    if exp.config.threshold_knobs:
-        config["thresholdKnobs"] = to_json(exp.config.threshold_knobs)
-    if exp.config.operator_knobs:
-        config["operatorKnobs"] = to_json(exp.config.operator_knobs)
-    if exp.config.threshold_knobs or exp.config.operator_knobs:
-        config["treeOptimizationObjective"] = exp.config.tree_optimization_objective
-        config["treeOptimizationBudget"] = exp.config.tree_optimization_budget
-        if exp.config.max_list_size is not None:
-            config["maxListSize"] = exp.config.max_list_size
-    if exp.config.sort_attribute:
-        config["sortAttribute"] = exp.config.sort_attribute
-        config["sortDirection"] = exp.config.sort_direction
-    if exp.config.parent_experiment_id:
-        config["parentExperimentId"] = exp.config.parent_experiment_id
+    if config.control_set_id:
+        data["controlSetId"] = config.control_set_id
+    if config.threshold_knobs:
+        data["thresholdKnobs"] = to_json(config.threshold_knobs)
+    if config.operator_knobs:
+        data["operatorKnobs"] = to_json(config.operator_knobs)
+    if config.threshold_knobs or config.operator_knobs:
+        data["treeOptimizationObjective"] = config.tree_optimization_objective
+        data["treeOptimizationBudget"] = config.tree_optimization_budget
+        if config.max_list_size is not None:
+            data["maxListSize"] = config.max_list_size
+    if config.sort_attribute:
+        data["sortAttribute"] = config.sort_attribute
+        data["sortDirection"] = config.sort_direction
+    if config.parent_experiment_id:
+        data["parentExperimentId"] = config.parent_experiment_id
+    return data
+
+
+def experiment_to_json(exp: Experiment) -> JSONObject:
+    """Serialize a full :class:`Experiment` to a JSON-compatible dict."""
+    config = config_to_json(exp.config)
 
     result: JSONObject = {
         "id": exp.id,
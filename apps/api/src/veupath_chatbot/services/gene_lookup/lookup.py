@@ -23,7 +23,7 @@ from veupath_chatbot.services.search_rerank import (
 
 from .enrich import enrich_sparse_gene_results
 from .organism import score_organism_match, suggest_organisms
-from .scoring import score_gene_relevance
+from .scoring import score_gene_results
 from .site_search import SITE_SEARCH_FETCH_LIMIT, fetch_site_search_genes
 from .wdk import (
     WDK_TEXT_FIELDS_BROAD,
@@ -185,12 +185,8 @@ async def _merge_and_rank(
     enriched = await enrich_sparse_gene_results(site_id, all_raw, len(all_raw))
 
     scored: list[ScoredResult] = [
-        ScoredResult(
-            result=r,
-            score=score_gene_relevance(query, r),
-            source="site-search",
-        )
-        for r in enriched
+        ScoredResult(result=r, score=score, source="site-search")
+        for r, score in zip(enriched, score_gene_results(query, enriched), strict=True)
     ]
     ranked = dedup_and_sort(
         scored,
@@ -1,9 +1,11 @@
 """Gene-specific relevance scoring for text search results."""
 
+from collections.abc import Sequence
+
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.search_rerank import (
     score_field_quality,
-    score_text_match,
+    score_text_matches,
 )
 
 from .organism import score_organism_match
@@ -16,6 +18,11 @@ _W_DISPLAY_NAME = 25.0
 _W_FIELD_QUALITY = 20.0
 _EXACT_BONUS = 80.0
 
+_FUZZY_CUTOFF = 0.5
+"""Fuzzy field matches below this share too little text to signal relevance."""
+
+_TEXT_FIELDS = ("geneId", "geneName", "displayName", "product")
+
 
 def score_gene_relevance(query: str, result: JSONObject) -> float:
     """Score a gene result's relevance to *query*.
@@ -28,32 +35,44 @@ def score_gene_relevance(query: str, result: JSONObject) -> float:
     field (product, displayName) so that exact hits always rank above
     incidental fuzzy overlap from shared tokens like "alpha" or "2".
     """
-    gene_id = str(result.get("geneId", ""))
-    gene_name = str(result.get("geneName", ""))
-    display_name = str(result.get("displayName", ""))
-    organism = str(result.get("organism", ""))
-    product = str(result.get("product", ""))
-    matched_fields = result.get("matchedFields")
-    mf_list = matched_fields if isinstance(matched_fields, list) else []
-    mf_list_str: list[str] = [x for x in mf_list if isinstance(x, str)]
-
-    id_score = score_text_match(query, gene_id)
-    name_score = score_text_match(query, gene_name)
-    disp_score = score_text_match(query, display_name)
-    prod_score = score_text_match(query, product)
-
-    score = 0.0
-    score += _W_GENE_ID * id_score
-    score += _W_GENE_NAME * name_score
-    score += _W_DISPLAY_NAME * disp_score
-    score += _W_ORGANISM * score_organism_match(query, organism)
-    score += _W_PRODUCT * prod_score
-    score += _W_FIELD_QUALITY * score_field_quality(mf_list_str)
-
-    # Exact/near-exact match bonus — ensures "alpha tubulin 2" beats
-    # "casein kinase 2, alpha subunit" which only shares tokens.
-    best_desc = max(prod_score, disp_score, name_score)
-    if best_desc >= 0.95:
-        score += _EXACT_BONUS * best_desc
-
-    return score
+    return score_gene_results(query, [result])[0]
+
+
+def score_gene_results(query: str, results: Sequence[JSONObject]) -> list[float]:
+    """Score many gene results at once; see :func:`score_gene_relevance`.
+
+    The text fields of every result are fuzzy-matched in a single batch.
+    """
+    n_fields = len(_TEXT_FIELDS)
+    text_scores = score_text_matches(
+        query,
+        [str(r.get(field, "")) for r in results for field in _TEXT_FIELDS],
+        score_cutoff=_FUZZY_CUTOFF,
+    )
+
+    scores: list[float] = []
+    for i, result in enumerate(results):
+        id_score, name_score, disp_score, prod_score = text_scores[
+            i * n_fields : (i + 1) * n_fields
+        ]
+        organism = str(result.get("organism", ""))
+        matched_fields = result.get("matchedFields")
+        mf_list = matched_fields if isinstance(matched_fields, list) else []
+        mf_list_str: list[str] = [x for x in mf_list if isinstance(x, str)]
+
+        score = 0.0
+        score += _W_GENE_ID * id_score
+        score += _W_GENE_NAME * name_score
+        score += _W_DISPLAY_NAME * disp_score
+        score += _W_ORGANISM * score_organism_match(query, organism)
+        score += _W_PRODUCT * prod_score
+        score += _W_FIELD_QUALITY * score_field_quality(mf_list_str)
+
+        # Exact/near-exact match bonus — ensures "alpha tubulin 2" beats
+        # "casein kinase 2, alpha subunit" which only shares tokens.
+        best_desc = max(prod_score, disp_score, name_score)
+        if best_desc >= 0.95:
+            score += _EXACT_BONUS * best_desc
+
+        scores.append(score)
+    return scores
@@ -364,6 +364,7 @@ async def _evaluate_trial(
                 controls_value_format=ctx.controls_value_format,
                 controls_extra_parameters=ctx.controls_extra_parameters,
                 id_field=ctx.id_field,
+                local_intersection=True,
             )
         except Exception as trial_exc:
             wdk_error = str(trial_exc)
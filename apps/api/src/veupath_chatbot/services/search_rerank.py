@@ -14,20 +14,21 @@ import re
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from veupath_chatbot.platform.types import JSONObject
 
+PARALLEL_MIN_CHOICES = 1_000
+"""Batches with at least this many fuzzy choices are scored on every core."""
 
-def score_text_match(query: str, value: str) -> float:
-    """Score how well *query* matches *value* (0.0--1.0).
 
-    Uses ``rapidfuzz`` for robust fuzzy matching, with bonuses for
-    exact and prefix matches that are critical for gene ID lookups.
-    """
-    q = query.strip().lower()
-    v = value.strip().lower()
+def normalize_match_text(value: str) -> str:
+    """Normalize *value* the way the match scorers compare it."""
+    return value.strip().lower()
+
 
+def _score_literal(q: str, v: str) -> float | None:
+    """Score exact, prefix and substring matches; ``None`` means fuzzy-score it."""
     if not q or not v:
         return 0.0
     if q == v:
@@ -36,12 +37,72 @@ def score_text_match(query: str, value: str) -> float:
         return 0.95
     if q in v:
         return 0.80
+    return None
+
+
+def score_text_match(query: str, value: str) -> float:
+    """Score how well *query* matches *value* (0.0--1.0).
+
+    Uses ``rapidfuzz`` for robust fuzzy matching, with bonuses for
+    exact and prefix matches that are critical for gene ID lookups.
+    """
+    q = normalize_match_text(query)
+    v = normalize_match_text(value)
+    literal = _score_literal(q, v)
+    if literal is not None:
+        return literal
 
     # rapidfuzz.fuzz.WRatio handles partial, token-sort, and token-set
     # ratios internally and returns the best score (0–100).
     return fuzz.WRatio(q, v) / 100.0
 
 
+def score_text_matches(
+    query: str,
+    values: Sequence[str],
+    *,
+    score_cutoff: float = 0.0,
+) -> list[float]:
+    """Score *query* against every value in *values* in one pass.
+
+    Same scale as :func:`score_text_match`.  Values without an exact,
+    prefix or substring match are fuzzy-scored together by one
+    :func:`rapidfuzz.process.cdist` call -- on every core for batches of
+    :data:`PARALLEL_MIN_CHOICES` or more -- instead of one ``WRatio``
+    call each.
+
+    :param query: Query text.
+    :param values: Texts to score; need not be normalized.
+    :param score_cutoff: Fuzzy scores below this (0.0--1.0) are pruned to 0.0.
+    :returns: One score per value, in order.
+    """
+    q = normalize_match_text(query)
+    scores: list[float] = []
+    fuzzy_indices: list[int] = []
+    fuzzy_choices: list[str] = []
+    for i, value in enumerate(values):
+        v = normalize_match_text(value)
+        literal = _score_literal(q, v)
+        if literal is None:
+            fuzzy_indices.append(i)
+            fuzzy_choices.append(v)
+            literal = 0.0
+        scores.append(literal)
+
+    if fuzzy_choices:
+        matrix = process.cdist(
+            [q],
+            fuzzy_choices,
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=score_cutoff * 100.0,
+            workers=-1 if len(fuzzy_choices) >= PARALLEL_MIN_CHOICES else 1,
+        )
+        for i, fuzzy in zip(fuzzy_indices, matrix[0].tolist(), strict=True):
+            scores[i] = fuzzy / 100.0
+    return scores
+
+
 PRIMARY_MATCH_FIELDS: frozenset[str] = frozenset(
     {
         "gene_source_id",
@@ -13,6 +13,7 @@ when a fire-and-forget task shares a request-scoped connection.
 import asyncio
 from uuid import UUID
 
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.domain.strategy.compile import compile_strategy
 from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.persistence.repositories.stream import StreamRepository
@@ -101,6 +102,8 @@ async def try_auto_push_to_wdk(
                 step_tree=result.step_tree,
                 name=projection.name,
             )
+            if projection.stream is not None:
+                await invalidate_user_tool_results(projection.stream.user_id)
 
             # Rewrite local IDs to WDK IDs in the persisted plan.
             compiled_map = {s.local_id: s.wdk_step_id for s in result.steps}
@@ -117,10 +120,10 @@ async def try_auto_push_to_wdk(
                 for step in all_steps:
                     step.id = str(compiled_map[step.id])
 
-            updated_plan = strategy_ast.to_dict()
+            # Only the step tree changed; leave the rest of the stored plan.
             await repo.update_projection(
                 strategy_id,
-                plan=updated_plan,
+                plan_patch={"root": strategy_ast.to_dict()["root"]},
                 record_type=strategy_ast.record_type,
                 step_count=len(strategy_ast.get_all_steps()),
             )
@@ -8,6 +8,7 @@ formatting.
 from dataclasses import dataclass
 from typing import Protocol
 
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.domain.strategy.ast import PlanStepNode, StepTreeNode, StrategyAST
 from veupath_chatbot.domain.strategy.compile import (
     CompilationResult,
@@ -18,6 +19,7 @@ from veupath_chatbot.domain.strategy.compile import (
 )
 from veupath_chatbot.domain.strategy.session import StrategyGraph
 from veupath_chatbot.domain.strategy.validate import validate_strategy
+from veupath_chatbot.platform.context import user_id_ctx
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.catalog.searches import (
@@ -234,6 +236,7 @@ async def create_or_update_wdk_strategy(
                 name=strategy.name or "Untitled Strategy",
             )
             wdk_strategy_id = existing_wdk_id
+            await invalidate_user_tool_results(user_id_ctx.get())
             logger.info(
                 "Updated existing WDK strategy",
                 wdk_strategy_id=existing_wdk_id,
@@ -19,8 +19,10 @@ from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
 from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject
-from veupath_chatbot.services.control_helpers import delete_temp_strategy
-from veupath_chatbot.services.experiment.helpers import extract_wdk_id
+from veupath_chatbot.services.control_helpers import (
+    create_temp_strategy,
+    delete_temp_strategy,
+)
 
 logger = get_logger(__name__)
 
@@ -141,13 +143,9 @@ async def _compute_counts_via_compilation(
 
     temp_strategy_id: int | None = None
     try:
-        created = await api.create_strategy(
-            step_tree=result.step_tree,
-            name="Pathfinder step counts",
-            description=None,
-            is_internal=True,
+        temp_strategy_id = await create_temp_strategy(
+            api, step_tree=result.step_tree, name="Pathfinder step counts"
         )
-        temp_strategy_id = extract_wdk_id(created)
     except Exception as exc:
         logger.error(
             "Failed to create temporary WDK strategy for step counts",
@@ -4,18 +4,25 @@ Handles:
 - ``fetch_and_convert`` — fetch WDK strategy, convert to AST, normalize params
 - ``sync_to_projection`` — full sync flow: fetch + upsert into CQRS
 - ``upsert_projection`` — create-or-update a stream projection from WDK data
-- ``upsert_summary_projection`` — create-or-update from list summary data
+- ``sync_summary_projections`` — bulk, fingerprint-diffed sync of list summaries
 - ``plan_needs_detail_fetch`` — check if a projection needs WDK detail fetch
 - ``lazy_fetch_wdk_detail`` — lazy-load full WDK detail for summary-only projections
 - ``sync_is_saved_to_wdk`` — sync isSaved flag from projection to WDK
 """
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
 from uuid import UUID
 
 from veupath_chatbot.domain.strategy.ast import StrategyAST
 from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
 from veupath_chatbot.persistence.models import StreamProjection
-from veupath_chatbot.persistence.repositories.stream import StreamRepository
+from veupath_chatbot.persistence.repositories.stream import (
+    StreamRepository,
+    unique_name,
+)
+from veupath_chatbot.platform.cache import cache_key
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject
 
@@ -154,28 +161,42 @@ async def upsert_projection(
     return proj
 
 
-async def upsert_summary_projection(
-    wdk_item: JSONObject,
-    *,
-    stream_repo: StreamRepository,
-    user_id: UUID,
-    site_id: str,
-) -> StreamProjection | None:
-    """Create or update a projection from WDK list summary data only.
+#: WDK list-summary fields that decide whether a synced projection is stale.
+_FINGERPRINT_FIELDS = (
+    "name",
+    "isSaved",
+    "lastModified",
+    "leafAndTransformStepCount",
+    "recordClassName",
+    "estimatedSize",
+)
 
-    Unlike ``sync_to_projection``, this does NOT fetch the full strategy detail
-    from WDK. It only stores metadata available from the list endpoint:
-    name, recordClassName, estimatedSize, isSaved, leafAndTransformStepCount.
 
-    The ``plan`` field is left untouched (empty for new projections, preserved
-    for existing ones). Full plan data is fetched lazily on first GET.
+#: Rows written per savepoint during a summary sync.
+_SYNC_CHUNK_SIZE = 100
 
-    Returns the projection, or ``None`` if the WDK item has no valid ID.
-    """
-    wdk_id = parse_wdk_strategy_id(wdk_item)
-    if wdk_id is None:
-        return None
 
+@dataclass(frozen=True, slots=True)
+class SummarySyncResult:
+    """Counts from one :func:`sync_summary_projections` run."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+def wdk_summary_fingerprint(wdk_item: JSONObject) -> str:
+    """Return a content fingerprint of a WDK list-strategies item."""
+    return cache_key(*(wdk_item.get(field) for field in _FINGERPRINT_FIELDS))
+
+
+def _summary_values(wdk_item: JSONObject, wdk_id: int) -> dict[str, Any]:
+    """Projection column values available from WDK list summary data.
+
+    Only metadata from the list endpoint is stored: name, recordClassName,
+    estimatedSize, isSaved, leafAndTransformStepCount.  The ``plan`` is left
+    untouched; full plan data is fetched lazily on first GET.
+    """
     name_raw = wdk_item.get("name")
     name = (
         str(name_raw)
@@ -190,52 +211,135 @@ async def upsert_summary_projection(
         else None
     )
 
-    is_saved = extract_wdk_is_saved(wdk_item)
-
     estimated_raw = wdk_item.get("estimatedSize")
-    estimated_size = estimated_raw if isinstance(estimated_raw, int) else None
-
     step_count_raw = wdk_item.get("leafAndTransformStepCount")
-    step_count = step_count_raw if isinstance(step_count_raw, int) else 0
 
-    existing = await stream_repo.get_by_wdk_strategy_id(user_id, wdk_id)
-    if existing and existing.dismissed_at is not None:
-        # Strategy was dismissed by user — don't re-import or update it.
-        return existing
-    if existing:
-        await stream_repo.update_projection(
-            existing.stream_id,
-            name=name,
-            record_type=record_type,
-            wdk_strategy_id=wdk_id,
-            wdk_strategy_id_set=True,
-            is_saved=is_saved,
-            is_saved_set=True,
-            step_count=step_count,
-            result_count=estimated_size,
-            result_count_set=True,
-        )
-        proj = await stream_repo.get_projection(existing.stream_id)
-    else:
-        stream = await stream_repo.create(
-            user_id=user_id,
-            site_id=site_id,
-            name=name,
-        )
-        await stream_repo.update_projection(
-            stream.id,
-            record_type=record_type,
-            wdk_strategy_id=wdk_id,
-            wdk_strategy_id_set=True,
-            is_saved=is_saved,
-            is_saved_set=True,
-            step_count=step_count,
-            result_count=estimated_size,
-            result_count_set=True,
-        )
-        proj = await stream_repo.get_projection(stream.id)
+    return {
+        "name": name,
+        "record_type": record_type,
+        "wdk_strategy_id": wdk_id,
+        "is_saved": extract_wdk_is_saved(wdk_item),
+        "step_count": step_count_raw if isinstance(step_count_raw, int) else 0,
+        "result_count": estimated_raw if isinstance(estimated_raw, int) else None,
+        "wdk_fingerprint": wdk_summary_fingerprint(wdk_item),
+    }
 
-    return proj
+
+async def _write_in_chunks(
+    stream_repo: StreamRepository,
+    rows: list[dict[str, Any]],
+    write: Callable[[list[dict[str, Any]]], Awaitable[int]],
+) -> int:
+    """Write *rows* in chunks, each under its own savepoint.
+
+    A chunk that fails is rolled back and retried one row per savepoint,
+    so a single bad row is logged and skipped instead of discarding the
+    rest of the sync.  Returns the number of rows written.
+    """
+    written = 0
+    for start in range(0, len(rows), _SYNC_CHUNK_SIZE):
+        chunk = rows[start : start + _SYNC_CHUNK_SIZE]
+        try:
+            async with stream_repo.session.begin_nested():
+                count = await write(chunk)
+        except Exception as exc:
+            logger.warning(
+                "WDK summary chunk failed, retrying row by row",
+                rows=len(chunk),
+                error=str(exc),
+            )
+        else:
+            written += count
+            continue
+
+        for row in chunk:
+            try:
+                async with stream_repo.session.begin_nested():
+                    count = await write([row])
+            except Exception as exc:
+                logger.warning(
+                    "Failed to sync WDK strategy",
+                    wdk_id=row.get("wdk_strategy_id"),
+                    error=str(exc),
+                )
+            else:
+                written += count
+    return written
+
+
+async def sync_summary_projections(
+    wdk_items: list[JSONObject],
+    *,
+    stream_repo: StreamRepository,
+    user_id: UUID,
+    site_id: str,
+) -> SummarySyncResult:
+    """Sync WDK list summaries into projections with a constant number of queries.
+
+    Loads every projection for (user, site) once, diffs each WDK item
+    against its linked projection by :func:`wdk_summary_fingerprint`, and
+    applies the changes as bulk inserts and updates of up to
+    ``_SYNC_CHUNK_SIZE`` rows, each chunk under its own savepoint (a failing
+    row is skipped, not the whole sync).  Dismissed projections and items
+    whose fingerprint is unchanged are left alone.  Name deduplication
+    happens in memory against the loaded names.
+
+    Unlike ``sync_to_projection``, this does NOT fetch full strategy detail
+    from WDK.
+    """
+    existing = await stream_repo.list_site_projections(user_id, site_id)
+    by_wdk_id = {
+        p.wdk_strategy_id: p for p in existing if p.wdk_strategy_id is not None
+    }
+    name_counts: dict[str, int] = {}
+    for proj in existing:
+        if proj.name:
+            name_counts[proj.name] = name_counts.get(proj.name, 0) + 1
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    unchanged = 0
+    seen: set[int] = set()
+    for item in wdk_items:
+        wdk_id = parse_wdk_strategy_id(item)
+        if wdk_id is None or wdk_id in seen:
+            continue
+        seen.add(wdk_id)
+
+        proj = by_wdk_id.get(wdk_id)
+        values = _summary_values(item, wdk_id)
+        if proj is not None and (
+            # Strategy was dismissed by user — don't re-import or update it.
+            proj.dismissed_at is not None
+            or proj.wdk_fingerprint == values["wdk_fingerprint"]
+        ):
+            unchanged += 1
+            continue
+
+        if proj is not None and proj.name in name_counts:
+            # A projection never collides with its own current name.
+            name_counts[proj.name] -= 1
+            if not name_counts[proj.name]:
+                del name_counts[proj.name]
+        name = unique_name(values["name"], name_counts)
+        name_counts[name] = name_counts.get(name, 0) + 1
+        values["name"] = name
+
+        if proj is None:
+            inserts.append(values)
+        else:
+            updates.append({"stream_id": proj.stream_id, **values})
+
+    async def _create(rows: list[dict[str, Any]]) -> int:
+        return await stream_repo.bulk_create_wdk_projections(user_id, site_id, rows)
+
+    async def _update(rows: list[dict[str, Any]]) -> int:
+        await stream_repo.bulk_update_projections(rows)
+        return len(rows)
+
+    created = await _write_in_chunks(stream_repo, inserts, _create)
+    updated = await _write_in_chunks(stream_repo, updates, _update)
+    return SummarySyncResult(created=created, updated=updated, unchanged=unchanged)
 
 
 async def lazy_fetch_wdk_detail(
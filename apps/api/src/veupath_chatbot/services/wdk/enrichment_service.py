@@ -10,28 +10,158 @@ A process-level semaphore (``_WDK_ENRICHMENT_SEMAPHORE``) limits how
 many ``run_batch`` calls can execute concurrently across the entire
 application.  Within a single batch, analyses run in parallel via
 ``asyncio.gather`` to keep total wall-clock time within proxy timeouts.
+
+Result caching
+--------------
+Enrichment results are cached under the site, record type, a fingerprint
+of the analysed answer, the analysis type and the parameters Pathfinder
+overrides on top of the WDK form defaults.  The fingerprint describes
+the input that is actually analysed: for an existing step, its ID, total
+count and a digest of one small page of IDs (a single cheap read); for a
+search, a hash of the search config; only for a pasted gene set without
+a search, the sorted ID set.  When every requested analysis is cached,
+``run_batch`` never touches WDK (no temp dataset, step or strategy is
+created).
+
+Analysis form metadata is cached alongside, keyed by the same answer
+fingerprint because WDK derives some defaults (e.g. the GO ``organism``)
+from the step's result.
 """
 
 import asyncio
+from typing import Any, cast
 
 from veupath_chatbot.domain.strategy.ast import StepTreeNode
-from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api
+from veupath_chatbot.integrations.veupathdb.factory import (
+    get_strategy_api,
+    get_wdk_client,
+)
+from veupath_chatbot.integrations.veupathdb.strategy_api import StrategyAPI
+from veupath_chatbot.platform.cache import LayeredCache, TTLCache, cache_key
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.platform.types import JSONObject
-from veupath_chatbot.services.control_helpers import delete_temp_strategy
+from veupath_chatbot.platform.types import JSONObject, JSONValue
+from veupath_chatbot.services.control_helpers import (
+    create_temp_strategy,
+    delete_temp_strategy,
+)
 from veupath_chatbot.services.experiment.enrichment import (
     _execute_analysis,
+    fetch_analysis_form,
+    requested_analysis_params,
     run_enrichment_analysis,
     run_enrichment_on_step,
+    wdk_analysis_name,
 )
-from veupath_chatbot.services.experiment.helpers import coerce_step_id, extract_wdk_id
+from veupath_chatbot.services.experiment.helpers import coerce_step_id
 from veupath_chatbot.services.experiment.types import (
     EnrichmentAnalysisType,
     EnrichmentResult,
+    from_json,
+    to_json,
 )
+from veupath_chatbot.services.wdk.helpers import extract_record_ids
 
 logger = get_logger(__name__)
 
+ENRICHMENT_CACHE_TTL = 6 * 3600  # 6 hours; WDK data only changes per release
+
+
+def _decode_result(data: Any) -> EnrichmentResult:
+    return cast(EnrichmentResult, from_json(data, EnrichmentResult))
+
+
+_RESULT_CACHE: LayeredCache[EnrichmentResult] = LayeredCache(
+    "enrichment",
+    encode=to_json,
+    decode=_decode_result,
+    ttl_seconds=ENRICHMENT_CACHE_TTL,
+    max_entries=2048,
+)
+_FORM_CACHE: TTLCache[JSONValue] = TTLCache(
+    max_entries=512, ttl_seconds=ENRICHMENT_CACHE_TTL
+)
+
+
+def fingerprint_ids(ids: list[str]) -> str:
+    """Return an order-independent fingerprint for a set of record IDs."""
+    return "ids:" + cache_key(sorted({i.strip() for i in ids if i and i.strip()}))
+
+
+async def build_enrichment_params_from_gene_ids(
+    site_id: str,
+    gene_ids: list[str],
+) -> tuple[str, JSONObject, str]:
+    """Create a WDK dataset from gene IDs and return enrichment parameters.
+
+    Returns ``(search_name, parameters, record_type)`` suitable for passing
+    to :meth:`EnrichmentService.run_batch`.  Uses the ``GeneByLocusTag``
+    search (transcript record type) with a temporary WDK dataset.
+    """
+    client = get_wdk_client(site_id)
+    dataset_resp = await client.post(
+        "/users/current/datasets",
+        json=cast(
+            JSONObject, {"sourceType": "idList", "sourceContent": {"ids": gene_ids}}
+        ),
+    )
+    if not isinstance(dataset_resp, dict) or "id" not in dataset_resp:
+        raise ValueError("Failed to create WDK dataset for gene ID enrichment")
+
+    dataset_id = dataset_resp["id"]
+    return (
+        "GeneByLocusTag",
+        {"ds_gene_ids": str(dataset_id)},
+        "transcript",
+    )
+
+
+# Records read to fingerprint a step's answer.
+_FINGERPRINT_PAGE_SIZE = 100
+
+
+async def _step_answer_fingerprint(api: StrategyAPI, step_id: int) -> str | None:
+    """Identify a step's answer from its size and first page of IDs.
+
+    One small read instead of the full answer: the step ID plus the total
+    count and first-page IDs catch in-place revisions of the step without
+    costing more than the enrichment the cache is meant to skip.  Returns
+    ``None`` when the answer can't be read, which disables caching for
+    the call rather than failing it.
+    """
+    try:
+        answer = await api.get_step_answer(
+            step_id,
+            attributes=["primary_key"],
+            pagination={"offset": 0, "numRecords": _FINGERPRINT_PAGE_SIZE},
+        )
+    except Exception as exc:
+        logger.debug(
+            "Could not fingerprint step answer", step_id=step_id, error=str(exc)
+        )
+        return None
+    if not isinstance(answer, dict):
+        return None
+    meta = answer.get("meta")
+    total = meta.get("totalCount") if isinstance(meta, dict) else None
+    page = extract_record_ids(answer.get("records"))
+    return "step:" + cache_key(step_id, total, page)
+
+
+def _result_cache_key(
+    site_id: str,
+    record_type: str,
+    fingerprint: str,
+    analysis_type: EnrichmentAnalysisType,
+) -> str:
+    return cache_key(
+        site_id,
+        record_type,
+        fingerprint,
+        analysis_type,
+        requested_analysis_params(analysis_type),
+    )
+
+
 # Limit concurrent enrichment batches process-wide.
 # WDK's step analysis API becomes unreliable under parallel load.
 # This limits how many run_batch calls execute simultaneously, not
@@ -82,35 +212,139 @@ class EnrichmentService:
         search_name: str | None = None,
         record_type: str | None = None,
         parameters: JSONObject | None = None,
+        gene_ids: list[str] | None = None,
     ) -> tuple[list[EnrichmentResult], list[str]]:
         """Run multiple enrichment analyses concurrently on a shared step.
 
-        When no step_id is provided (paste gene sets), creates ONE temporary
-        WDK step/strategy and runs all analysis types against it — instead
-        of creating N separate temp strategies. This reduces WDK API calls
-        from ~5N to ~N+3 and avoids rate-limit 500s.
+        Cached results are returned without contacting WDK; only the
+        missing analysis types are run.  When no step_id is provided,
+        creates ONE temporary WDK step/strategy and runs all missing
+        analysis types against it — instead of creating N separate temp
+        strategies. This reduces WDK API calls from ~5N to ~N+3 and avoids
+        rate-limit 500s.
+
+        :param gene_ids: Gene IDs for pasted gene sets without a step or
+            search; a ``GeneByLocusTag`` dataset is created on a cache miss.
         """
         errors: list[str] = []
+        record_type = record_type or "transcript"
+        if step_id is None and (not search_name or parameters is None) and not gene_ids:
+            raise ValueError("Either step_id or search_name+parameters required")
 
+        api = get_strategy_api(site_id)
+        fingerprint = await self._answer_fingerprint(
+            api,
+            step_id=step_id,
+            search_name=search_name,
+            record_type=record_type,
+            parameters=parameters,
+            gene_ids=gene_ids,
+        )
+
+        cached: dict[EnrichmentAnalysisType, EnrichmentResult] = {}
+        if fingerprint is not None:
+            for analysis_type in analysis_types:
+                hit = await _RESULT_CACHE.get(
+                    _result_cache_key(site_id, record_type, fingerprint, analysis_type)
+                )
+                if hit is not None:
+                    cached[analysis_type] = hit
+        missing = [t for t in analysis_types if t not in cached]
+        if analysis_types and not missing:
+            logger.info(
+                "Enrichment served from cache",
+                site_id=site_id,
+                analysis_types=analysis_types,
+            )
+            return [cached[t] for t in analysis_types], errors
+
+        fresh = await self._run_uncached(
+            api,
+            site_id=site_id,
+            analysis_types=missing,
+            step_id=step_id,
+            search_name=search_name,
+            record_type=record_type,
+            parameters=parameters,
+            gene_ids=gene_ids,
+            fingerprint=fingerprint,
+            errors=errors,
+        )
+        by_type = dict(cached)
+        for result in fresh:
+            by_type[result.analysis_type] = result
+            if fingerprint is not None and result.error is None:
+                await _RESULT_CACHE.set(
+                    _result_cache_key(
+                        site_id, record_type, fingerprint, result.analysis_type
+                    ),
+                    result,
+                )
+        return [by_type[t] for t in analysis_types if t in by_type], errors
+
+    async def _answer_fingerprint(
+        self,
+        api: StrategyAPI,
+        *,
+        step_id: int | None,
+        search_name: str | None,
+        record_type: str,
+        parameters: JSONObject | None,
+        gene_ids: list[str] | None,
+    ) -> str | None:
+        """Identify the analysed answer for cache keys (``None`` = uncacheable).
+
+        Follows the same precedence as :meth:`_run_uncached` -- step, then
+        search, then gene IDs -- so the key names the input that runs.
+        """
+        if step_id is not None:
+            return await _step_answer_fingerprint(api, step_id)
+        if search_name and parameters is not None:
+            return "search:" + cache_key(record_type, search_name, parameters)
+        if gene_ids:
+            return fingerprint_ids(gene_ids)
+        return None
+
+    async def _run_uncached(
+        self,
+        api: StrategyAPI,
+        *,
+        site_id: str,
+        analysis_types: list[EnrichmentAnalysisType],
+        step_id: int | None,
+        search_name: str | None,
+        record_type: str,
+        parameters: JSONObject | None,
+        gene_ids: list[str] | None,
+        fingerprint: str | None,
+        errors: list[str],
+    ) -> list[EnrichmentResult]:
+        """Run *analysis_types* against WDK, creating a temp step if needed."""
         # If we already have a step, run all analyses on it directly.
         if step_id is not None:
             async with _WDK_ENRICHMENT_SEMAPHORE:
-                return await self._run_analyses_on_step(
+                results, _ = await self._run_analyses_on_step(
                     site_id,
                     step_id,
                     analysis_types,
                     errors,
+                    record_type=record_type,
+                    fingerprint=fingerprint,
                 )
+                return results
 
-        # No step — need search_name + parameters to create one.
-        if not search_name or parameters is None:
-            raise ValueError("Either step_id or search_name+parameters required")
+        # Pasted gene sets: back the IDs with a temporary WDK dataset.
+        if (not search_name or parameters is None) and gene_ids:
+            (
+                search_name,
+                parameters,
+                record_type,
+            ) = await build_enrichment_params_from_gene_ids(site_id, gene_ids)
 
         # Create ONE temp step/strategy, run all analyses, then clean up.
-        api = get_strategy_api(site_id)
         step = await api.create_step(
-            record_type=record_type or "transcript",
-            search_name=search_name,
+            record_type=record_type,
+            search_name=search_name or "",
             parameters=parameters or {},
             custom_name="Enrichment target",
         )
@@ -120,20 +354,19 @@ class EnrichmentService:
 
         async with _WDK_ENRICHMENT_SEMAPHORE:
             try:
-                created = await api.create_strategy(
-                    step_tree=root,
-                    name="Pathfinder enrichment analysis",
-                    description=None,
-                    is_internal=True,
+                strategy_id = await create_temp_strategy(
+                    api, step_tree=root, name="Pathfinder enrichment analysis"
                 )
-                strategy_id = extract_wdk_id(created)
 
-                return await self._run_analyses_on_step(
+                results, _ = await self._run_analyses_on_step(
                     site_id,
                     shared_step_id,
                     analysis_types,
                     errors,
+                    record_type=record_type,
+                    fingerprint=fingerprint,
                 )
+                return results
             finally:
                 await delete_temp_strategy(api, strategy_id)
 
@@ -143,21 +376,40 @@ class EnrichmentService:
         step_id: int,
         analysis_types: list[EnrichmentAnalysisType],
         errors: list[str],
+        *,
+        record_type: str = "transcript",
+        fingerprint: str | None = None,
     ) -> tuple[list[EnrichmentResult], list[str]]:
         """Run multiple analysis types on a single step concurrently.
 
         Analyses run in parallel to keep total wall-clock time under
         proxy timeouts (~30s instead of ~90s sequential).  A process-level
         semaphore still limits how many ``run_batch`` calls execute
-        concurrently across different requests.
+        concurrently across different requests.  With a *fingerprint*,
+        analysis form metadata is reused from (and stored in) the form cache.
         """
         api = get_strategy_api(site_id)
 
+        async def _form_for(analysis_type: EnrichmentAnalysisType) -> JSONValue:
+            wdk_name = wdk_analysis_name(analysis_type)
+            if fingerprint is None or wdk_name is None:
+                return None
+            key = (site_id, record_type, wdk_name, fingerprint)
+            form_meta = _FORM_CACHE.get(key)
+            if form_meta is None:
+                form_meta = await fetch_analysis_form(api, step_id, wdk_name)
+                if form_meta is not None:
+                    _FORM_CACHE.set(key, form_meta)
+            return form_meta
+
         async def _run_one(
             analysis_type: EnrichmentAnalysisType,
         ) -> EnrichmentResult:
             try:
-                return await _execute_analysis(api, step_id, analysis_type)
+                form_meta = await _form_for(analysis_type)
+                return await _execute_analysis(
+                    api, step_id, analysis_type, form_meta=form_meta
+                )
             except Exception as exc:
                 logger.warning(
                     "Enrichment failed",
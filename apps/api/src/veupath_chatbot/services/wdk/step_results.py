@@ -2,22 +2,285 @@
 
 Used by both experiment and gene set endpoints to avoid duplicating
 attribute listing, record browsing, distribution, and analysis logic.
+
+Result tables
+-------------
+AI tools tend to ask several questions of the same result set within a
+turn (page through it, search it, compare genes in it).  Rather than
+re-paging WDK for each question, :func:`get_result_table` loads the
+leading records of a step once -- fetching pages concurrently -- into a
+columnar :class:`ResultTable` that is cached per
+``(site, step, attribute set)`` for a few minutes.  Follow-up calls
+filter, sort and project that table locally.
 """
 
+import asyncio
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import cast
 
 from veupath_chatbot.integrations.veupathdb.strategy_api.api import StrategyAPI
+from veupath_chatbot.platform.cache import TTLCache
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.types import JSONObject, JSONValue
 from veupath_chatbot.services.wdk.helpers import (
     build_attribute_list,
     extract_detail_attributes,
+    extract_pk,
     merge_analysis_params,
     order_primary_key,
 )
 
 logger = get_logger(__name__)
 
+#: Records requested per WDK page when loading a result table.
+RESULT_PAGE_SIZE = 100
+#: Maximum number of leading records held in one result table.
+RESULT_TABLE_MAX_RECORDS = 500
+#: Concurrent page requests per table load.
+RESULT_PAGE_CONCURRENCY = 4
+#: Seconds a loaded result table is reused.
+RESULT_TABLE_TTL = 300
+
+type _TableKey = tuple[str, int, tuple[str, ...] | None]
+
+
+@dataclass
+class ResultTable:
+    """Columnar snapshot of the leading records of a step's result.
+
+    ``ids[i]`` is the primary key of row ``i`` and ``columns[name][i]``
+    its value for attribute ``name`` (``None`` when WDK omitted it).
+    """
+
+    ids: list[str | None]
+    columns: dict[str, list[JSONValue]]
+    total_count: int
+    _index: dict[str, int] | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the step has more records than the table holds."""
+        return len(self.ids) < self.total_count
+
+    @classmethod
+    def from_records(cls, records: list[JSONValue], total_count: int) -> ResultTable:
+        """Build a table from WDK standard-report records."""
+        ids: list[str | None] = []
+        columns: dict[str, list[JSONValue]] = {}
+        for rec in records:
+            if not isinstance(rec, dict):
+                continue
+            row = len(ids)
+            ids.append(extract_pk(rec))
+            attrs = rec.get("attributes")
+            if isinstance(attrs, dict):
+                for name, value in attrs.items():
+                    column = columns.get(name)
+                    if column is None:
+                        column = columns[name] = [None] * row
+                    column.append(value)
+            for column in columns.values():
+                if len(column) <= row:
+                    column.append(None)
+        return cls(ids=ids, columns=columns, total_count=max(total_count, len(ids)))
+
+    def attributes(self, index: int) -> JSONObject:
+        """Return the attribute dict of row *index*."""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def row(self, index: int) -> JSONObject:
+        """Return row *index* as ``{"geneId", "attributes"}``."""
+        return {"geneId": self.ids[index], "attributes": self.attributes(index)}
+
+    def find(self, gene_id: str) -> int | None:
+        """Return the row index of *gene_id*, or ``None`` if not loaded."""
+        if self._index is None:
+            self._index = {}
+            for i, gid in enumerate(self.ids):
+                if gid is not None:
+                    self._index.setdefault(gid, i)
+        return self._index.get(gene_id)
+
+    def select(
+        self,
+        *,
+        where: Callable[[JSONObject], bool] | None = None,
+        sort: str | None = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[int]:
+        """Return row indices after filtering, sorting and paging.
+
+        :param where: Predicate over a row's attribute dict.
+        :param sort: Attribute to sort by; numeric strings sort numerically
+            and missing values always sort last.
+        :param descending: Sort direction.
+        :param offset: Rows to skip after sorting.
+        :param limit: Maximum rows to return (``None`` = all).
+        """
+        selected = list(range(len(self.ids)))
+        if where is not None:
+            selected = [i for i in selected if where(self.attributes(i))]
+        if sort:
+            column = self.columns.get(sort, [None] * len(self.ids))
+            present = [i for i in selected if column[i] not in (None, "")]
+            missing = [i for i in selected if column[i] in (None, "")]
+            present.sort(key=lambda i: _sort_key(column[i]), reverse=descending)
+            selected = present + missing
+        end = None if limit is None else offset + max(0, limit)
+        return selected[offset:end]
+
+
+def _sort_key(value: JSONValue) -> tuple[int, float, str]:
+    """Order numbers before text; compare numbers numerically."""
+    if isinstance(value, bool):
+        return (1, 0.0, str(value).lower())
+    if isinstance(value, int | float):
+        return (0, float(value), "")
+    text = str(value)
+    try:
+        number = float(text.replace(",", ""))
+    except ValueError:
+        return (1, 0.0, text.lower())
+    if math.isnan(number):
+        return (1, 0.0, text.lower())
+    return (0, number, "")
+
+
+_TABLE_CACHE: TTLCache[ResultTable] = TTLCache(
+    max_entries=64, ttl_seconds=RESULT_TABLE_TTL
+)
+_inflight: dict[_TableKey, asyncio.Task[ResultTable]] = {}
+
+
+def _table_key(site_id: str, step_id: int, attributes: list[str] | None) -> _TableKey:
+    return (site_id, step_id, tuple(sorted(set(attributes))) if attributes else None)
+
+
+def cached_result_table(
+    site_id: str, step_id: int, attributes: list[str] | None = None
+) -> ResultTable | None:
+    """Return an already-loaded table without contacting WDK."""
+    return _TABLE_CACHE.get(_table_key(site_id, step_id, attributes))
+
+
+async def get_result_table(
+    api: StrategyAPI,
+    *,
+    site_id: str,
+    step_id: int,
+    attributes: list[str] | None = None,
+    max_records: int = RESULT_TABLE_MAX_RECORDS,
+) -> ResultTable:
+    """Return the cached result table for a step, loading it on a miss.
+
+    Concurrent callers for the same key share one load.
+
+    :param api: Strategy API for the step's site.
+    :param site_id: VEuPathDB site identifier (cache scope).
+    :param step_id: WDK step ID.
+    :param attributes: Attributes to load (``None`` = WDK defaults).
+    :param max_records: Cap on leading records to load.
+    :returns: Columnar table of up to *max_records* records.
+    """
+    key = _table_key(site_id, step_id, attributes)
+    table = _TABLE_CACHE.get(key)
+    if table is not None:
+        return table
+    task = _inflight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(
+            _load_and_cache(key, api, step_id, attributes, max_records)
+        )
+        _inflight[key] = task
+    # Shield so one cancelled caller doesn't abort the load for the others.
+    return await asyncio.shield(task)
+
+
+async def _load_and_cache(
+    key: _TableKey,
+    api: StrategyAPI,
+    step_id: int,
+    attributes: list[str] | None,
+    max_records: int,
+) -> ResultTable:
+    try:
+        table = await _load_result_table(api, step_id, attributes, max_records)
+        _TABLE_CACHE.set(key, table)
+        return table
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _load_result_table(
+    api: StrategyAPI,
+    step_id: int,
+    attributes: list[str] | None,
+    max_records: int,
+) -> ResultTable:
+    """Read the first page, then the remaining pages concurrently."""
+    page_size = min(RESULT_PAGE_SIZE, max(1, max_records))
+
+    async def _page(offset: int) -> list[JSONValue]:
+        answer = await api.get_step_records(
+            step_id=step_id,
+            attributes=attributes,
+            pagination={"offset": offset, "numRecords": page_size},
+        )
+        records = answer.get("records", [])
+        return records if isinstance(records, list) else []
+
+    first = await api.get_step_records(
+        step_id=step_id,
+        attributes=attributes,
+        pagination={"offset": 0, "numRecords": page_size},
+    )
+    records_raw = first.get("records", [])
+    records: list[JSONValue] = records_raw if isinstance(records_raw, list) else []
+    meta = first.get("meta")
+    reported = meta.get("totalCount") if isinstance(meta, dict) else None
+    exhausted = len(records) < page_size
+    # Without a reported count, keep paging up to the cap.
+    bound = reported if isinstance(reported, int) else max_records
+    offsets = (
+        [] if exhausted else list(range(page_size, min(bound, max_records), page_size))
+    )
+    if offsets:
+        semaphore = asyncio.Semaphore(RESULT_PAGE_CONCURRENCY)
+
+        async def _bounded(offset: int) -> list[JSONValue]:
+            async with semaphore:
+                return await _page(offset)
+
+        pages = await asyncio.gather(*(_bounded(o) for o in offsets))
+        for page in pages:
+            records.extend(page)
+            if len(page) < page_size:
+                exhausted = True
+                break
+
+    records = records[:max_records]
+    if isinstance(reported, int):
+        total = reported
+    else:
+        # Unknown count: only claim "more" when the last page was full.
+        total = len(records) if exhausted else len(records) + 1
+    table = ResultTable.from_records(records, total)
+    logger.debug(
+        "Loaded step result table",
+        step_id=step_id,
+        rows=len(table),
+        total=table.total_count,
+        pages=1 + len(offsets),
+    )
+    return table
+
 
 class StepResultsService:
     """Provides read-only access to WDK step results.
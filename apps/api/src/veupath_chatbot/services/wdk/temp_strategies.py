@@ -0,0 +1,469 @@
+"""Ledger of temporary internal WDK strategies, reaped in the background.
+
+Control tests, sweeps, enrichment and step counts materialize searches in
+short-lived internal strategies and delete them in a ``finally`` block.
+A worker that crashes (or is cancelled) mid-run leaves them behind in
+the user's WDK account.
+
+Every temp strategy is recorded here when it is created -- owner, site,
+step IDs and an expiry -- and forgotten once it is deleted.  While the
+creating worker is alive it renews the expiry (a lease), so long runs
+are never reaped underneath it.  The reaper job
+(:mod:`veupath_chatbot.jobs.temp_strategy_reaper`) deletes whatever is
+still recorded past its expiry.
+
+Entries live in a hash of JSON records and a sorted set of members
+(``"<service url>|<strategy id>"``) scored by expiry.  A reaper claims
+due members in one ``WATCH``/``MULTI`` transaction that re-scores them
+with a retry deadline, so concurrent workers never delete the same entry
+twice and a reaper that dies mid-batch leaves its claims to be retried.
+Deletions that keep failing are abandoned after
+``temp_strategy_max_reap_attempts``.
+
+WDK only lets a strategy's owner delete it.  A strategy created with the
+user's VEuPathDB token is reaped with that token, stored encrypted under
+its own key with a TTL that outlives the entry's retries; one created
+with the service token stores nothing.
+
+Strategies leaked before this ledger existed, or while Redis was down,
+are not recorded; :func:`sweep_unrecorded_temp_strategies` deletes those
+from a listing of the account.  Without Redis nothing is recorded.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+from veupath_chatbot.domain.strategy.ast import StepTreeNode
+from veupath_chatbot.integrations.veupathdb.factory import get_strategy_api, list_sites
+from veupath_chatbot.integrations.veupathdb.strategy_api import (
+    StrategyAPI,
+    is_internal_wdk_strategy_name,
+    strip_internal_wdk_strategy_name,
+)
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.context import user_id_ctx, veupathdb_auth_token_ctx
+from veupath_chatbot.platform.errors import WDKError
+from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.platform.security import decrypt_secret, encrypt_secret
+from veupath_chatbot.platform.tasks import spawn
+
+logger = get_logger(__name__)
+
+_ENTRIES_KEY = "wdk_temp:entries"
+_EXPIRY_KEY = "wdk_temp:expiry"
+_ATTEMPTS_KEY = "wdk_temp:attempts"
+_TOKEN_KEY_PREFIX = "wdk_temp:token:"
+
+RETRY_SECONDS = 300
+"""Delay before a claimed entry whose deletion failed is retried."""
+
+_CLAIM_ATTEMPTS = 3
+
+TEMP_STRATEGY_NAMES = frozenset(
+    {
+        "Pathfinder control test",
+        "Pathfinder enrichment analysis",
+        "Pathfinder step counts",
+        "Pathfinder threshold sweep",
+        "Pathfinder tree eval",
+    }
+)
+"""Display names temp strategies are created under."""
+
+# Lease renewal tasks of the temp strategies this worker holds, by member.
+_leases: dict[str, asyncio.Task[None]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class TempStrategyEntry:
+    """A recorded temp strategy.
+
+    :param base_url: WDK service URL of the owning site.
+    :param strategy_id: WDK strategy ID.
+    :param step_ids: Steps in the strategy (deleted with it).
+    :param owner: Pathfinder user that created it, if known.
+    :param created_at: Unix time of creation.
+    :param expires_at: Initial expiry; lease renewals move only the
+        sorted-set score.
+    """
+
+    base_url: str
+    strategy_id: int
+    step_ids: list[int]
+    owner: str | None
+    created_at: float
+    expires_at: float
+
+    @property
+    def member(self) -> str:
+        return _member(self.base_url, self.strategy_id)
+
+
+def _member(base_url: str, strategy_id: int) -> str:
+    return f"{base_url}|{strategy_id}"
+
+
+def _token_key(member: str) -> str:
+    return _TOKEN_KEY_PREFIX + member
+
+
+def _token_ttl(ttl: float) -> int:
+    """Seconds a stored token must outlive a lease of *ttl* seconds."""
+    attempts = get_settings().temp_strategy_max_reap_attempts
+    return max(1, int(ttl + RETRY_SECONDS * (attempts + 1)))
+
+
+def _tree_step_ids(node: StepTreeNode | None) -> list[int]:
+    if node is None:
+        return []
+    return [
+        node.step_id,
+        *_tree_step_ids(node.primary_input),
+        *_tree_step_ids(node.secondary_input),
+    ]
+
+
+def _decode(raw: bytes | str | None) -> TempStrategyEntry | None:
+    if raw is None:
+        return None
+    try:
+        data = json.loads(raw)
+        # Entries written before tokens moved to their own keys.
+        data.pop("auth_token", None)
+        return TempStrategyEntry(**data)
+    except (AttributeError, TypeError, ValueError) as exc:
+        logger.warning("Dropping unreadable temp strategy entry", error=str(exc))
+        return None
+
+
+async def record_temp_strategy(
+    api: StrategyAPI,
+    strategy_id: int,
+    step_tree: StepTreeNode,
+    *,
+    ttl_seconds: float | None = None,
+) -> None:
+    """Record a newly created temp strategy and hold its lease (best effort).
+
+    The lease is renewed every third of its TTL until
+    :func:`end_temp_strategy_lease` (or :func:`forget_temp_strategy`).
+
+    :param api: Strategy API the strategy was created through.
+    :param strategy_id: WDK strategy ID.
+    :param step_tree: Step tree the strategy was created from.
+    :param ttl_seconds: Lifetime before the reaper may delete it
+        (default: ``temp_strategy_ttl_seconds``).
+    """
+    try:
+        redis = get_redis()
+    except RuntimeError:
+        return
+    now = time.time()
+    ttl = (
+        get_settings().temp_strategy_ttl_seconds if ttl_seconds is None else ttl_seconds
+    )
+    owner = user_id_ctx.get()
+    entry = TempStrategyEntry(
+        base_url=api.client.base_url,
+        strategy_id=strategy_id,
+        step_ids=_tree_step_ids(step_tree),
+        owner=str(owner) if owner is not None else None,
+        created_at=now,
+        expires_at=now + ttl,
+    )
+    auth_token = veupathdb_auth_token_ctx.get()
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(_ENTRIES_KEY, entry.member, json.dumps(asdict(entry)))
+            pipe.zadd(_EXPIRY_KEY, {entry.member: entry.expires_at})
+            if auth_token:
+                pipe.set(
+                    _token_key(entry.member),
+                    encrypt_secret(auth_token),
+                    ex=_token_ttl(ttl),
+                )
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning(
+            "Failed to record temp WDK strategy",
+            temp_strategy_id=strategy_id,
+            error=str(exc),
+        )
+        return
+    if ttl > 0:
+        task = spawn(
+            _renew_lease(entry.member, ttl), name=f"temp-strategy-lease-{strategy_id}"
+        )
+        if task is not None:
+            _leases[entry.member] = task
+
+
+async def _renew_lease(member: str, ttl: float) -> None:
+    while True:
+        await asyncio.sleep(ttl / 3)
+        try:
+            redis = get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                # XX: never resurrect an entry that was forgotten meanwhile.
+                pipe.zadd(_EXPIRY_KEY, {member: time.time() + ttl}, xx=True)
+                pipe.expire(_token_key(member), _token_ttl(ttl))
+                await pipe.execute()
+        except (RuntimeError, RedisError) as exc:
+            logger.warning(
+                "Failed to renew temp WDK strategy lease", member=member, error=str(exc)
+            )
+
+
+def end_temp_strategy_lease(api: StrategyAPI, strategy_id: int) -> None:
+    """Stop renewing a temp strategy's lease; the reaper may then take it."""
+    task = _leases.pop(_member(api.client.base_url, strategy_id), None)
+    if task is not None:
+        task.cancel()
+
+
+async def forget_temp_strategy(api: StrategyAPI, strategy_id: int) -> None:
+    """Drop a deleted temp strategy from the ledger (best effort)."""
+    end_temp_strategy_lease(api, strategy_id)
+    try:
+        redis = get_redis()
+    except RuntimeError:
+        return
+    try:
+        await _drop(redis, [_member(api.client.base_url, strategy_id)])
+    except RedisError as exc:
+        logger.warning(
+            "Failed to forget temp WDK strategy",
+            temp_strategy_id=strategy_id,
+            error=str(exc),
+        )
+
+
+def _api_for(base_url: str) -> StrategyAPI | None:
+    for site in list_sites():
+        if site.service_url.rstrip("/") == base_url:
+            return get_strategy_api(site.id)
+    return None
+
+
+async def _drop(redis: Redis, members: list[str]) -> None:
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.zrem(_EXPIRY_KEY, *members)
+        pipe.hdel(_ENTRIES_KEY, *members)
+        pipe.hdel(_ATTEMPTS_KEY, *members)
+        pipe.delete(*(_token_key(m) for m in members))
+        await pipe.execute()
+
+
+async def _delete(entry: TempStrategyEntry, auth_token: str | None) -> bool:
+    """Delete *entry*'s strategy as its owner; False means retry later.
+
+    Without a user token the request goes out under the service token.
+    """
+    api = _api_for(entry.base_url)
+    if api is None:
+        logger.warning("No site for temp WDK strategy", base_url=entry.base_url)
+        return True
+    # Runs in its own task (see reap_expired_temp_strategies), so the
+    # token doesn't leak into other work.
+    veupathdb_auth_token_ctx.set(auth_token)
+    try:
+        await api.delete_strategy(entry.strategy_id)
+    except WDKError as exc:
+        if exc.status >= 500:
+            logger.warning(
+                "Failed to reap temp WDK strategy; will retry",
+                temp_strategy_id=entry.strategy_id,
+                error=str(exc),
+            )
+            return False
+        # 404: already gone; 401/403: nobody can delete it for this owner.
+        logger.info(
+            "Temp WDK strategy not deletable; dropping entry",
+            temp_strategy_id=entry.strategy_id,
+            status=exc.status,
+        )
+        return True
+    except Exception as exc:
+        logger.warning(
+            "Failed to reap temp WDK strategy; will retry",
+            temp_strategy_id=entry.strategy_id,
+            error=str(exc),
+        )
+        return False
+    logger.info(
+        "Reaped leaked temp WDK strategy",
+        temp_strategy_id=entry.strategy_id,
+        owner=entry.owner,
+        base_url=entry.base_url,
+    )
+    return True
+
+
+async def _claim_due(redis: Redis, *, now: float, batch_size: int) -> list[str]:
+    """Re-score up to *batch_size* due members to a retry deadline, atomically.
+
+    The read and the re-score run in one ``WATCH``/``MULTI`` transaction,
+    so a member is claimed by exactly one reaper.  Gives up (returns
+    nothing) if the expiry set keeps changing underneath.
+    """
+    async with redis.pipeline(transaction=True) as pipe:
+        for _ in range(_CLAIM_ATTEMPTS):
+            try:
+                await pipe.watch(_EXPIRY_KEY)
+                members = await pipe.zrangebyscore(
+                    _EXPIRY_KEY, "-inf", now, start=0, num=batch_size
+                )
+                if not members:
+                    return []
+                pipe.multi()
+                pipe.zadd(_EXPIRY_KEY, dict.fromkeys(members, now + RETRY_SECONDS))
+                await pipe.execute()
+            except WatchError:
+                continue
+            return [m.decode() if isinstance(m, bytes) else m for m in members]
+    return []
+
+
+async def reap_expired_temp_strategies(
+    *, batch_size: int = 50, now: float | None = None
+) -> int:
+    """Delete one batch of expired temp strategies.
+
+    Entries whose deletion fails transiently are retried after
+    :data:`RETRY_SECONDS`, up to ``temp_strategy_max_reap_attempts`` times;
+    entries with no record (orphans) are dropped.
+
+    :param batch_size: Maximum entries claimed in this call.
+    :param now: Current Unix time (default: ``time.time()``).
+    :returns: Number of entries claimed; ``batch_size`` means more may be due.
+    :raises RuntimeError: If Redis is not initialized.
+    """
+    redis = get_redis()
+    now = time.time() if now is None else now
+    claimed = await _claim_due(redis, now=now, batch_size=batch_size)
+    if not claimed:
+        return 0
+
+    payloads = await redis.hmget(_ENTRIES_KEY, claimed)
+    sealed_tokens = await redis.mget([_token_key(m) for m in claimed])
+    entries = [_decode(raw) for raw in payloads]
+    outcomes = await asyncio.gather(
+        *(
+            _delete(entry, decrypt_secret(sealed) if sealed is not None else None)
+            for entry, sealed in zip(entries, sealed_tokens, strict=True)
+            if entry is not None
+        )
+    )
+    results = iter(outcomes)
+    done: list[str] = []
+    failed: list[str] = []
+    for member, entry in zip(claimed, entries, strict=True):
+        if entry is None or next(results):
+            done.append(member)
+        else:
+            failed.append(member)
+
+    if failed:
+        async with redis.pipeline(transaction=False) as pipe:
+            for member in failed:
+                pipe.hincrby(_ATTEMPTS_KEY, member, 1)
+            attempts = await pipe.execute()
+        max_attempts = get_settings().temp_strategy_max_reap_attempts
+        for member, count in zip(failed, attempts, strict=True):
+            if count >= max_attempts:
+                logger.error(
+                    "Giving up on reaping temp WDK strategy",
+                    member=member,
+                    attempts=count,
+                )
+                done.append(member)
+    if done:
+        await _drop(redis, done)
+    return len(claimed)
+
+
+def _last_modified(item: dict[str, object]) -> float | None:
+    raw = item.get("lastModified")
+    if not isinstance(raw, str):
+        return None
+    try:
+        return datetime.fromisoformat(raw).timestamp()
+    except ValueError:
+        return None
+
+
+async def sweep_unrecorded_temp_strategies(
+    api: StrategyAPI, wdk_items: object, *, now: float | None = None
+) -> int:
+    """Delete leaked temp strategies that the ledger never recorded.
+
+    Covers leaks from before the ledger existed and from while Redis was
+    down.  Deletes, from a ``list_strategies`` listing of the current
+    user's account, internal strategies named in
+    :data:`TEMP_STRATEGY_NAMES` that are absent from the ledger and were
+    last modified more than ``temp_strategy_ttl_seconds`` ago.  Recorded
+    strategies are left to the reaper.  Skipped without Redis, since
+    in-flight strategies can't be told apart then.
+
+    :returns: Number of strategies deleted.
+    """
+    if not isinstance(wdk_items, list):
+        return 0
+    try:
+        redis = get_redis()
+    except RuntimeError:
+        return 0
+    now = time.time() if now is None else now
+    cutoff = now - get_settings().temp_strategy_ttl_seconds
+    candidates: list[int] = []
+    for item in wdk_items:
+        if not isinstance(item, dict):
+            continue
+        name = item.get("name")
+        wdk_id = item.get("strategyId")
+        modified = _last_modified(item)
+        if (
+            isinstance(name, str)
+            and is_internal_wdk_strategy_name(name)
+            and strip_internal_wdk_strategy_name(name) in TEMP_STRATEGY_NAMES
+            and isinstance(wdk_id, int)
+            and modified is not None
+            and modified < cutoff
+        ):
+            candidates.append(wdk_id)
+    if not candidates:
+        return 0
+
+    base_url = api.client.base_url
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for wdk_id in candidates:
+                pipe.zscore(_EXPIRY_KEY, _member(base_url, wdk_id))
+            scores = await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Skipping temp WDK strategy sweep", error=str(exc))
+        return 0
+
+    deleted = 0
+    for wdk_id, score in zip(candidates, scores, strict=True):
+        if score is not None:
+            continue
+        try:
+            await api.delete_strategy(wdk_id)
+        except Exception as exc:
+            logger.warning(
+                "Failed to delete unrecorded temp WDK strategy",
+                wdk_strategy_id=wdk_id,
+                error=str(exc),
+            )
+            continue
+        deleted += 1
+        logger.info("Deleted unrecorded temp WDK strategy", wdk_strategy_id=wdk_id)
+    return deleted
@@ -19,9 +19,10 @@ from kani import ChatMessage, ChatRole, Kani
 from veupath_chatbot.persistence.repositories.stream import StreamRepository
 from veupath_chatbot.persistence.repositories.user import UserRepository
 from veupath_chatbot.persistence.session import async_session_factory
-from veupath_chatbot.platform.events import emit, read_stream_messages
+from veupath_chatbot.platform.events import emit, forward_events, read_stream_messages
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.platform.tracing import profiled
 from veupath_chatbot.platform.types import JSONObject, ModelProvider, ReasoningEffort
 from veupath_chatbot.services.chat.streaming import stream_chat
 
@@ -115,16 +116,19 @@ async def start_workbench_chat_stream(
 
     # Launch the background producer as an asyncio task.
     task = asyncio.create_task(
-        _workbench_chat_producer(
-            stream_id_str=stream_id_str,
-            operation_id=operation_id,
-            site_id=site_id,
-            experiment_id=experiment_id,
-            user_id=user_id,
-            message=message,
-            provider_override=provider_override,
-            model_override=model_override,
-            reasoning_effort=reasoning_effort,
+        profiled(
+            operation_id,
+            _workbench_chat_producer(
+                stream_id_str=stream_id_str,
+                operation_id=operation_id,
+                site_id=site_id,
+                experiment_id=experiment_id,
+                user_id=user_id,
+                message=message,
+                provider_override=provider_override,
+                model_override=model_override,
+                reasoning_effort=reasoning_effort,
+            ),
         )
     )
     _active_tasks[operation_id] = task
@@ -233,22 +237,9 @@ async def _workbench_chat_producer(
                 session=session,
             )
 
-            async for event_value in stream_iter:
-                if not isinstance(event_value, dict):
-                    continue
-                event_type_raw = event_value.get("type", "")
-                event_type = event_type_raw if isinstance(event_type_raw, str) else ""
-                event_data_raw = event_value.get("data")
-                event_data = event_data_raw if isinstance(event_data_raw, dict) else {}
-
-                await emit(
-                    redis,
-                    stream_id_str,
-                    operation_id,
-                    event_type,
-                    event_data,
-                    session=session,
-                )
+            await forward_events(
+                redis, stream_id_str, operation_id, stream_iter, session=session
+            )
 
             await bg_stream_repo.complete_operation(operation_id)
 
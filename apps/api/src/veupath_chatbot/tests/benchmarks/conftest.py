@@ -0,0 +1,166 @@
+"""Benchmark suite wiring: opt-in collection, mock WDK and result recording.
+
+Benchmarks are skipped unless selected with ``-m benchmark``::
+
+    uv run pytest -m benchmark src/veupath_chatbot/tests/benchmarks
+
+Environment knobs:
+
+- ``BENCH_WDK_MEDIAN_MS`` / ``BENCH_WDK_P99_MS`` / ``BENCH_WDK_ERROR_RATE``:
+  mock WDK latency and error distribution (defaults 20 / 150 / 0).
+- ``BENCH_RESULTS``: where to write this run's results
+  (default ``.benchmarks/latest.json``).
+- ``BENCH_BASELINE``: baseline to compare with (default ``baseline.json``
+  next to this file).  ``BENCH_UPDATE_BASELINE=1`` overwrites it instead.
+- ``BENCH_TOLERANCE``: allowed relative regression per metric (default 0.25).
+- ``BENCH_STRICT=1``: fail the run when any metric regresses.
+"""
+
+import os
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+
+import pytest
+
+from veupath_chatbot.tests.benchmarks.harness import (
+    Bench,
+    BenchmarkRecorder,
+    Regression,
+    format_table,
+    load_baseline,
+)
+from veupath_chatbot.tests.fixtures.mock_wdk import (
+    LatencyProfile,
+    MockWDKServer,
+    write_sites_config,
+)
+
+_RECORDER = pytest.StashKey[BenchmarkRecorder]()
+_REGRESSIONS = pytest.StashKey[list[Regression]]()
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def _latency_profile() -> LatencyProfile:
+    return LatencyProfile(
+        median_ms=float(os.environ.get("BENCH_WDK_MEDIAN_MS", "20")),
+        p99_ms=float(os.environ.get("BENCH_WDK_P99_MS", "150")),
+        error_rate=float(os.environ.get("BENCH_WDK_ERROR_RATE", "0")),
+        seed=1,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Hooks
+# ---------------------------------------------------------------------------
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_RECORDER] = BenchmarkRecorder()
+    config.stash[_REGRESSIONS] = []
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    recorder = session.config.stash[_RECORDER]
+    if not recorder.results:
+        return
+    profile = _latency_profile()
+    environment = {
+        "wdk_median_ms": profile.median_ms,
+        "wdk_p99_ms": profile.p99_ms,
+        "wdk_error_rate": profile.error_rate,
+    }
+    recorder.write(
+        Path(os.environ.get("BENCH_RESULTS", ".benchmarks/latest.json")), environment
+    )
+
+    baseline_path = Path(os.environ.get("BENCH_BASELINE", str(DEFAULT_BASELINE)))
+    if os.environ.get("BENCH_UPDATE_BASELINE") == "1":
+        recorder.write(baseline_path, environment)
+        return
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        return
+    tolerance = float(os.environ.get("BENCH_TOLERANCE", "0.25"))
+    regressions = recorder.compare(baseline, tolerance)
+    session.config.stash[_REGRESSIONS] = regressions
+    if regressions and os.environ.get("BENCH_STRICT") == "1":
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    recorder = terminalreporter.config.stash[_RECORDER]
+    if not recorder.results:
+        return
+    terminalreporter.section("benchmarks")
+    for line in format_table(list(recorder.results.values())):
+        terminalreporter.write_line(line)
+    regressions = terminalreporter.config.stash[_REGRESSIONS]
+    if regressions:
+        terminalreporter.section("benchmark regressions", red=True)
+        for regression in regressions:
+            terminalreporter.write_line(str(regression))
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def mock_wdk_server() -> Generator[MockWDKServer]:
+    with MockWDKServer(_latency_profile()) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def mock_wdk_sites(
+    mock_wdk_server: MockWDKServer, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    return write_sites_config(
+        tmp_path_factory.mktemp("mock-wdk") / "sites.yaml", mock_wdk_server.base_url
+    )
+
+
+@pytest.fixture(autouse=True)
+async def _route_wdk_to_mock(
+    mock_wdk_server: MockWDKServer,
+    mock_wdk_sites: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[None]:
+    """Point site routing and catalogs at the mock WDK for each benchmark."""
+    import veupath_chatbot.integrations.veupathdb.discovery as discovery_module
+    import veupath_chatbot.integrations.veupathdb.site_router as site_router_module
+    from veupath_chatbot.platform.config import get_settings
+
+    monkeypatch.setenv("VEUPATHDB_SITES_CONFIG", str(mock_wdk_sites))
+    get_settings.cache_clear()
+    site_router_module._router = None
+    discovery_module._discovery = None
+    mock_wdk_server.wdk.reset()
+    yield
+    router = site_router_module._router
+    if router is not None:
+        await router.close_all()
+    site_router_module._router = None
+    discovery_module._discovery = None
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest, mock_wdk_server: MockWDKServer) -> Bench:
+    stats = mock_wdk_server.wdk.stats
+    return Bench(
+        request.config.stash[_RECORDER], request_count=lambda: sum(stats.values())
+    )
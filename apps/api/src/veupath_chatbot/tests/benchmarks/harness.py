@@ -0,0 +1,241 @@
+"""Timing, memory and baseline comparison for the benchmark suite.
+
+:func:`measure` drives an async operation for a fixed number of iterations
+(optionally concurrently) and reports throughput, p50/p99 latency and the
+peak traced Python heap.  :class:`BenchmarkRecorder` collects the results
+of a run, writes them as JSON and compares them with a baseline file of
+the same format, flagging metrics that got worse by more than a tolerance.
+"""
+
+import asyncio
+import json
+import math
+import platform
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+RESULTS_VERSION = 1
+
+# Metric -> whether larger values are better.
+_COMPARED_METRICS: dict[str, bool] = {
+    "throughput": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_memory_kib": False,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary of one benchmark."""
+
+    name: str
+    iterations: int
+    concurrency: int
+    total_seconds: float
+    throughput: float
+    """Completed operations per second of wall time."""
+    p50_ms: float
+    p99_ms: float
+    peak_memory_kib: float
+    """Peak traced Python heap above the level at the start of the run."""
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from baseline (positive = larger)."""
+        return (self.current - self.baseline) / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}.{self.metric}: {self.baseline:.2f} -> "
+            f"{self.current:.2f} ({self.change:+.0%})"
+        )
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *samples* (``pct`` in ``[0, 100]``)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def measure(
+    name: str,
+    operation: Callable[[int], Awaitable[object]],
+    *,
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Run ``operation(i)`` for ``i in range(iterations)`` and time it.
+
+    Up to *concurrency* operations are in flight at once.  *warmup* calls
+    (with negative indexes) run first and are not measured, so one-off
+    work such as catalog loading does not skew the percentiles.  Python
+    allocations are traced during the timed run, so timings include the
+    tracing overhead; compare them only with results recorded the same way.
+    """
+    for i in range(warmup):
+        await operation(-(i + 1))
+
+    latencies: list[float] = []
+    queue = iter(range(iterations))
+
+    async def _worker() -> None:
+        for i in queue:
+            started = time.perf_counter()
+            await operation(i)
+            latencies.append(time.perf_counter() - started)
+
+    tracemalloc_was_tracing = tracemalloc.is_tracing()
+    if not tracemalloc_was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(max(1, min(concurrency, iterations))):
+                tg.create_task(_worker())
+        total = time.perf_counter() - started
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        if not tracemalloc_was_tracing:
+            tracemalloc.stop()
+
+    latencies_ms = [s * 1000 for s in latencies]
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        concurrency=concurrency,
+        total_seconds=round(total, 4),
+        throughput=round(iterations / total, 3) if total > 0 else 0.0,
+        p50_ms=round(percentile(latencies_ms, 50), 3),
+        p99_ms=round(percentile(latencies_ms, 99), 3),
+        peak_memory_kib=round(max(0, peak_bytes - baseline_bytes) / 1024, 1),
+    )
+
+
+class BenchmarkRecorder:
+    """Collects results for one run and compares them with a baseline."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, BenchmarkResult] = {}
+
+    def record(self, result: BenchmarkResult) -> BenchmarkResult:
+        self.results[result.name] = result
+        return result
+
+    def to_json(self, environment: dict[str, Any] | None = None) -> dict[str, Any]:
+        return {
+            "version": RESULTS_VERSION,
+            "environment": {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                **(environment or {}),
+            },
+            "results": {
+                name: asdict(result) for name, result in sorted(self.results.items())
+            },
+        }
+
+    def write(self, path: Path, environment: dict[str, Any] | None = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_json(environment), indent=2) + "\n", encoding="utf-8"
+        )
+
+    def compare(self, baseline: dict[str, Any], tolerance: float) -> list[Regression]:
+        """Return metrics worse than *baseline* by more than *tolerance*.
+
+        Benchmarks missing from either side are ignored, so adding or
+        renaming a benchmark never fails a comparison.
+        """
+        if baseline.get("version") != RESULTS_VERSION:
+            return []
+        regressions: list[Regression] = []
+        for name, result in sorted(self.results.items()):
+            base = baseline.get("results", {}).get(name)
+            if not isinstance(base, dict):
+                continue
+            for metric, higher_is_better in _COMPARED_METRICS.items():
+                old = base.get(metric)
+                new = getattr(result, metric)
+                if not isinstance(old, int | float) or old <= 0:
+                    continue
+                change = (new - old) / old
+                worse = -change if higher_is_better else change
+                if worse > tolerance:
+                    regressions.append(Regression(name, metric, float(old), new))
+        return regressions
+
+
+class Bench:
+    """Per-test handle that measures and records benchmarks.
+
+    :param request_count: Returns the mock WDK's running request total; the
+        requests made per iteration are added to each result's ``extra``.
+    """
+
+    def __init__(
+        self,
+        recorder: BenchmarkRecorder,
+        *,
+        request_count: Callable[[], int] | None = None,
+    ) -> None:
+        self._recorder = recorder
+        self._request_count = request_count
+
+    async def run(
+        self,
+        name: str,
+        operation: Callable[[int], Awaitable[object]],
+        **kwargs: int,
+    ) -> BenchmarkResult:
+        """:func:`measure` *operation* and record the result under *name*."""
+        for i in range(kwargs.pop("warmup", 1)):
+            await operation(-(i + 1))
+        before = self._request_count() if self._request_count else 0
+        result = await measure(name, operation, warmup=0, **kwargs)
+        if self._request_count and result.iterations:
+            requests = self._request_count() - before
+            result.extra["wdk_requests_per_op"] = round(requests / result.iterations, 2)
+        return self._recorder.record(result)
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return raw if isinstance(raw, dict) else None
+
+
+def format_table(results: list[BenchmarkResult]) -> list[str]:
+    """Render *results* as fixed-width lines for the terminal summary."""
+    header = (
+        f"{'benchmark':<32} {'iter':>5} {'conc':>4} {'ops/s':>9} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<32} {r.iterations:>5} {r.concurrency:>4} "
+            f"{r.throughput:>9.2f} {r.p50_ms:>9.1f} {r.p99_ms:>9.1f} "
+            f"{r.peak_memory_kib:>10.1f}"
+        )
+    return lines
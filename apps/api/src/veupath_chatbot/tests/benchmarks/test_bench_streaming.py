@@ -0,0 +1,100 @@
+"""Benchmarks for SSE fan-out and full chat turns.
+
+These run through the HTTP app (PostgreSQL + fake Redis, as in the
+integration tests).  Chat turns use the deterministic mock engine
+(``PATHFINDER_CHAT_PROVIDER=mock``), so the agent, tools, event pipeline
+and WDK catalog lookups run for real and only the LLM is scripted.
+"""
+
+from uuid import UUID, uuid4
+
+import httpx
+import jwt
+import pytest
+
+import veupath_chatbot.persistence.session as session_module
+from veupath_chatbot.persistence.models import Operation, Stream, StreamProjection
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.events import emit
+from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.tests.benchmarks.harness import Bench
+from veupath_chatbot.tests.fixtures.sse_collector import collect_chat_stream
+
+pytestmark = pytest.mark.benchmark
+
+SITE_ID = "plasmodb"
+
+
+async def _create_operation(authed_client: httpx.AsyncClient) -> tuple[UUID, str]:
+    """Insert a stream and an active chat operation owned by the client's user."""
+    token = authed_client.cookies.get("pathfinder-auth")
+    assert token is not None
+    payload = jwt.decode(
+        token,
+        get_settings().api_secret_key,
+        algorithms=["HS256"],
+        options={"require": ["exp", "sub"]},
+    )
+    stream_id = uuid4()
+    op_id = uuid4().hex
+    async with session_module.async_session_factory() as session:
+        session.add(Stream(id=stream_id, user_id=UUID(payload["sub"]), site_id=SITE_ID))
+        await session.flush()
+        session.add(
+            StreamProjection(stream_id=stream_id, name="Bench", site_id=SITE_ID)
+        )
+        await session.flush()
+        session.add(
+            Operation(
+                operation_id=op_id, stream_id=stream_id, type="chat", status="active"
+            )
+        )
+        await session.commit()
+    return stream_id, op_id
+
+
+class TestSSE:
+    async def test_fanout(self, authed_client: httpx.AsyncClient, bench: Bench) -> None:
+        events = 200
+        stream_id, op_id = await _create_operation(authed_client)
+        redis = get_redis()
+        for n in range(events):
+            await emit(
+                redis,
+                str(stream_id),
+                op_id,
+                "assistant_delta",
+                {"delta": "token " * 8, "n": n},
+            )
+        await emit(redis, str(stream_id), op_id, "message_end", {})
+
+        async def _op(i: int) -> None:
+            received = 0
+            async with authed_client.stream(
+                "GET", f"/api/v1/operations/{op_id}/subscribe", timeout=60
+            ) as resp:
+                assert resp.status_code == 200
+                async for line in resp.aiter_lines():
+                    if line.startswith("event:"):
+                        received += 1
+            assert received == events + 1
+
+        result = await bench.run("sse.fanout", _op, iterations=40, concurrency=20)
+        result.extra["events_per_second"] = round(result.throughput * (events + 1), 1)
+
+
+class TestChat:
+    async def test_chat_turn(
+        self, authed_client: httpx.AsyncClient, bench: Bench
+    ) -> None:
+        async def _op(i: int) -> None:
+            result = await collect_chat_stream(
+                authed_client,
+                message=f"Please create step for benchmark turn {i}",
+                site_id=SITE_ID,
+                timeout=60,
+            )
+            assert result.http_status == 202
+            assert "message_end" in result.event_types
+
+        await bench.run("chat.turn", _op, iterations=10)
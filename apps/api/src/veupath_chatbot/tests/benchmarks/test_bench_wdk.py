@@ -0,0 +1,180 @@
+"""Benchmarks for the WDK-bound experiment paths against the mock WDK.
+
+Every iteration uses distinct parameters so the in-process result caches
+never short-circuit the WDK round trips being measured.
+"""
+
+import pytest
+
+from veupath_chatbot.domain.strategy.ast import PlanStepNode, StrategyAST
+from veupath_chatbot.domain.strategy.ops import CombineOp
+from veupath_chatbot.services.control_tests import run_positive_negative_controls
+from veupath_chatbot.services.experiment.tree_knobs import optimize_tree_knobs
+from veupath_chatbot.services.experiment.types import OperatorKnob, ThresholdKnob
+from veupath_chatbot.services.parameter_optimization import (
+    OptimizationConfig,
+    ParameterSpec,
+    optimize_search_parameters,
+)
+from veupath_chatbot.services.strategies.wdk_counts import (
+    compute_step_counts_for_plan,
+)
+from veupath_chatbot.tests.benchmarks.harness import Bench
+from veupath_chatbot.tests.fixtures.mock_wdk import (
+    BOOLEAN_SEARCH,
+    CONTROLS_PARAM,
+    CONTROLS_SEARCH,
+    THRESHOLD_PARAM,
+    THRESHOLD_SEARCH,
+    gene_universe,
+    result_ids,
+)
+
+pytestmark = pytest.mark.benchmark
+
+SITE_ID = "plasmodb"
+RECORD_TYPE = "transcript"
+ORGANISM = '["Plasmodium falciparum 3D7"]'
+
+
+def _target_params(fold_change: float) -> dict[str, str]:
+    return {"regulated_dir": "up-regulated", THRESHOLD_PARAM: f"{fold_change:g}"}
+
+
+def _controls() -> tuple[list[str], list[str]]:
+    """15 positives inside the fold_change=2 results, 5 outside; 20 negatives."""
+    hits = result_ids(THRESHOLD_SEARCH, _target_params(2))
+    hit_set = set(hits)
+    misses = [gid for gid in gene_universe() if gid not in hit_set]
+    return hits[:15] + misses[:5], misses[-20:]
+
+
+POSITIVES, NEGATIVES = _controls()
+
+
+def _threshold_step(fold_change: float, step_id: str = "target") -> PlanStepNode:
+    return PlanStepNode(
+        search_name=THRESHOLD_SEARCH,
+        parameters=dict(_target_params(fold_change)),
+        id=step_id,
+    )
+
+
+class TestStepCounts:
+    async def test_leaf_plan(self, bench: Bench) -> None:
+        async def _op(i: int) -> None:
+            ast = StrategyAST(record_type="gene", root=_threshold_step(2 + i / 100))
+            counts = await compute_step_counts_for_plan(ast.to_dict(), ast, SITE_ID)
+            assert counts["target"]
+
+        await bench.run("step_counts.leaf", _op, iterations=60, concurrency=6)
+
+    async def test_combined_plan(self, bench: Bench) -> None:
+        async def _op(i: int) -> None:
+            root = PlanStepNode(
+                search_name=BOOLEAN_SEARCH,
+                primary_input=PlanStepNode(
+                    search_name="GenesByTaxon",
+                    parameters={"organism": ORGANISM},
+                    id="taxon",
+                ),
+                secondary_input=_threshold_step(2 + i / 100),
+                operator=CombineOp.INTERSECT,
+                id="combine",
+            )
+            ast = StrategyAST(record_type="gene", root=root)
+            counts = await compute_step_counts_for_plan(ast.to_dict(), ast, SITE_ID)
+            assert counts["combine"] is not None
+
+        await bench.run("step_counts.combined", _op, iterations=20, concurrency=4)
+
+
+class TestControls:
+    async def test_positive_negative_controls(self, bench: Bench) -> None:
+        async def _op(i: int) -> None:
+            result = await run_positive_negative_controls(
+                site_id=SITE_ID,
+                record_type=RECORD_TYPE,
+                target_search_name=THRESHOLD_SEARCH,
+                target_parameters=dict(_target_params(2 + i / 100)),
+                controls_search_name=CONTROLS_SEARCH,
+                controls_param_name=CONTROLS_PARAM,
+                positive_controls=POSITIVES,
+                negative_controls=NEGATIVES,
+            )
+            assert result["positive"] is not None
+
+        await bench.run("controls.evaluate", _op, iterations=20, concurrency=4)
+
+
+class TestOptimization:
+    async def test_parameter_optimization(self, bench: Bench) -> None:
+        budget = 8
+
+        async def _op(i: int) -> None:
+            result = await optimize_search_parameters(
+                site_id=SITE_ID,
+                record_type=RECORD_TYPE,
+                search_name=THRESHOLD_SEARCH,
+                fixed_parameters={"regulated_dir": "up-regulated"},
+                parameter_space=[
+                    ParameterSpec(
+                        name=THRESHOLD_PARAM,
+                        param_type="numeric",
+                        min_value=1.0,
+                        max_value=20.0,
+                    )
+                ],
+                controls_search_name=CONTROLS_SEARCH,
+                controls_param_name=CONTROLS_PARAM,
+                positive_controls=POSITIVES,
+                negative_controls=NEGATIVES,
+                config=OptimizationConfig(budget=budget, method="random"),
+            )
+            assert result.all_trials
+
+        result = await bench.run("optimization.run", _op, iterations=3)
+        result.extra["trials_per_second"] = round(result.throughput * budget, 3)
+
+    async def test_tree_knobs(self, bench: Bench) -> None:
+        budget = 6
+        base_tree = PlanStepNode(
+            search_name=BOOLEAN_SEARCH,
+            primary_input=PlanStepNode(
+                search_name="GenesByTaxon",
+                parameters={"organism": ORGANISM},
+                id="taxon",
+            ),
+            secondary_input=_threshold_step(2),
+            operator=CombineOp.INTERSECT,
+            id="combine",
+        ).to_dict()
+
+        async def _op(i: int) -> None:
+            result = await optimize_tree_knobs(
+                site_id=SITE_ID,
+                record_type=RECORD_TYPE,
+                base_tree=base_tree,
+                threshold_knobs=[
+                    ThresholdKnob(
+                        step_id="target",
+                        param_name=THRESHOLD_PARAM,
+                        min_val=1.0,
+                        max_val=20.0,
+                        step_size=0.5,
+                    )
+                ],
+                operator_knobs=[
+                    OperatorKnob(combine_node_id="combine", options=["INTERSECT"])
+                ],
+                positive_controls=POSITIVES,
+                negative_controls=NEGATIVES,
+                controls_search_name=CONTROLS_SEARCH,
+                controls_param_name=CONTROLS_PARAM,
+                controls_value_format="newline",
+                budget=budget,
+            )
+            assert result.all_trials
+
+        result = await bench.run("tree_knobs.run", _op, iterations=3)
+        result.extra["trials_per_second"] = round(result.throughput * budget, 3)
@@ -196,10 +196,10 @@ def _test_env_defaults() -> None:
     os.environ.setdefault("ANTHROPIC_API_KEY", "")
     os.environ.setdefault("GEMINI_API_KEY", "")
 
-    # Disable rate limiting so chat tests don't get 429s.
-    from veupath_chatbot.platform.security import limiter
-
-    limiter.enabled = False
+    # Disable rate limiting and admission control so chat and experiment
+    # tests don't get 429s/503s (or queue behind a loaded CI machine).
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    os.environ.setdefault("ADMISSION_ENABLED", "false")
 
 
 @pytest.fixture
@@ -292,6 +292,16 @@ async def _close_wdk_clients_after_test() -> AsyncGenerator[None]:
         pass
 
 
+@pytest.fixture(autouse=True)
+def _clear_process_caches() -> Generator[None]:
+    """Empty in-process result caches so cached WDK answers don't leak across tests."""
+    from veupath_chatbot.platform.cache import clear_all_caches
+
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
 @pytest.fixture
 def scripted_engine_factory() -> Callable[
     [list[ScriptedTurn]],
@@ -0,0 +1,869 @@
+"""Local mock WDK server for offline benchmarks and manual runs.
+
+Serves the subset of the WDK REST API that PathFinder uses (catalog,
+search details, datasets, steps, strategies, standard reports) for every
+configured site under ``/{site_id}/service``.  Unlike the ``respx`` mocks
+in the integration tests, it is a real HTTP server, so the whole client
+stack (connection pool, retries, JSON decoding) is exercised, and every
+request can be delayed or failed according to a :class:`LatencyProfile`.
+
+Result sets are deterministic.  Each search (name plus non-numeric
+parameters) ranks a fixed universe of *P. falciparum* locus tags by hash;
+numeric parameters act as thresholds that keep a shrinking prefix of that
+ranking, so raising a threshold always returns a subset.  Dataset-backed
+controls searches return the uploaded IDs, and boolean steps apply their
+operator to the inputs wired through the strategy ``stepTree``.
+
+Run standalone to point a dev server at it::
+
+    python -m veupath_chatbot.tests.fixtures.mock_wdk --port 8765 \\
+        --median-ms 40 --p99-ms 400 --sites-out /tmp/mock-sites.yaml
+    VEUPATHDB_SITES_CONFIG=/tmp/mock-sites.yaml uvicorn veupath_chatbot.main:app
+"""
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import math
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+import yaml
+from fastapi import FastAPI, Request, Response
+
+from veupath_chatbot.tests.fixtures.wdk_responses import (
+    record_types_expanded_response,
+    search_details_response,
+    searches_response,
+    user_current_response,
+)
+
+MOCK_USER_ID = 12345
+UNIVERSE_SIZE = 5000
+
+BOOLEAN_SEARCH = "boolean_question_TranscriptRecordClasses_TranscriptRecordClass"
+CONTROLS_SEARCH = "GeneByLocusTag"
+CONTROLS_PARAM = "ds_gene_ids"
+THRESHOLD_SEARCH = "GenesByRNASeqpfal3D7_Su_seven_stages_rnaSeq_RSRC"
+THRESHOLD_PARAM = "fold_change"
+
+# Searches whose details come from ``wdk_responses``; the rest are synthesized.
+_FIXTURE_DETAIL_SEARCHES = frozenset(
+    {"GenesByTaxon", "GenesByTextSearch", "GenesByOrthologs", BOOLEAN_SEARCH}
+)
+_PARAM_TYPES: dict[str, str] = {
+    CONTROLS_PARAM: "input-dataset",
+    THRESHOLD_PARAM: "number",
+}
+
+
+# ---------------------------------------------------------------------------
+# Latency and error injection
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Per-request delay and failure distribution.
+
+    Delays are log-normal with the given median and 99th percentile, which
+    matches the long right tail of real WDK response times.  A zero median
+    disables delays.
+
+    :param median_ms: Median response delay.
+    :param p99_ms: 99th percentile delay (``<= median_ms`` means constant).
+    :param error_rate: Probability that a request fails.
+    :param error_statuses: HTTP statuses to fail with, picked uniformly.
+    :param seed: Seed for the delay/error random stream.
+    """
+
+    median_ms: float = 0.0
+    p99_ms: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (503,)
+    seed: int = 0
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """Return the next delay in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        sigma = 0.0
+        if self.p99_ms > self.median_ms:
+            # z(0.99) ~= 2.3263 for the standard normal.
+            sigma = math.log(self.p99_ms / self.median_ms) / 2.3263
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000.0
+
+    def sample_error(self, rng: random.Random) -> int | None:
+        """Return an HTTP status to fail with, or ``None`` to succeed."""
+        if self.error_rate > 0 and rng.random() < self.error_rate:
+            return rng.choice(self.error_statuses)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Deterministic result sets
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=4)
+def gene_universe(size: int = UNIVERSE_SIZE) -> tuple[str, ...]:
+    """Return *size* locus tags shaped like ``PF3D7_0100100``."""
+    return tuple(
+        f"PF3D7_{i % 14 + 1:02d}{(i // 14 + 1) * 100:05d}" for i in range(size)
+    )
+
+
+def _unit(*parts: str) -> float:
+    """Hash *parts* to a float in ``[0, 1)``."""
+    digest = hashlib.blake2b("\x1f".join(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest) / 2**64
+
+
+@lru_cache(maxsize=512)
+def _ranking(key: str, size: int) -> tuple[str, ...]:
+    return tuple(sorted(gene_universe(size), key=lambda gid: _unit(key, gid)))
+
+
+def _as_number(value: object) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def result_ids(
+    search_name: str,
+    parameters: dict[str, Any],
+    *,
+    universe_size: int = UNIVERSE_SIZE,
+) -> list[str]:
+    """Return the deterministic result set for a leaf search.
+
+    Benchmarks use this to pick control sets that overlap the results by a
+    known amount.
+    """
+    categorical: dict[str, str] = {}
+    fraction = 1.0
+    for name, value in parameters.items():
+        number = _as_number(value)
+        if number is None:
+            categorical[name] = str(value)
+        else:
+            # Larger thresholds keep fewer results (a prefix of the ranking).
+            fraction /= 1.0 + abs(number) / 10.0
+    key = search_name + json.dumps(categorical, sort_keys=True)
+    fraction *= 0.02 + 0.18 * _unit(key)
+    ranking = _ranking(key, universe_size)
+    return list(ranking[: max(1, round(fraction * universe_size))])
+
+
+class WDKHTTPError(Exception):
+    """Raised by handlers to produce a WDK-style error response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _combine(operator: str, left: list[str], right: list[str]) -> list[str]:
+    op = operator.upper()
+    if op == "INTERSECT":
+        keep = set(right)
+        return [gid for gid in left if gid in keep]
+    if op == "UNION":
+        return list(dict.fromkeys([*left, *right]))
+    if op in ("MINUS", "LONLY"):
+        drop = set(right)
+        return [gid for gid in left if gid not in drop]
+    if op in ("RMINUS", "RONLY"):
+        drop = set(left)
+        return [gid for gid in right if gid not in drop]
+    raise WDKHTTPError(422, f"Unknown boolean operator '{operator}'")
+
+
+# ---------------------------------------------------------------------------
+# Catalog fixtures
+# ---------------------------------------------------------------------------
+
+
+def _search_listing(url_segment: str, display: str, params: list[str]) -> dict:
+    return {
+        "urlSegment": url_segment,
+        "fullName": f"GeneQuestions.{url_segment}",
+        "queryName": url_segment,
+        "displayName": display,
+        "shortDisplayName": display,
+        "outputRecordClassName": "transcript",
+        "paramNames": params,
+        "isAnalyzable": True,
+        "isCacheable": True,
+        "noSummaryOnSingleRecord": False,
+        "defaultSummaryView": "_default",
+        "defaultAttributes": ["primary_key", "gene_product"],
+        "defaultSorting": [],
+        "dynamicAttributes": [],
+        "filters": [],
+        "groups": [],
+        "properties": {},
+        "summaryViewPlugins": [],
+    }
+
+
+def catalog_searches() -> list[dict]:
+    """Searches served for the ``transcript`` record type."""
+    return [
+        *searches_response(),
+        _search_listing(CONTROLS_SEARCH, "Gene ID(s)", [CONTROLS_PARAM]),
+        _search_listing(
+            THRESHOLD_SEARCH,
+            "RNA-Seq fold change (seven stages)",
+            ["regulated_dir", THRESHOLD_PARAM],
+        ),
+    ]
+
+
+def _synthesized_details(listing: dict) -> dict:
+    parameters = [
+        {
+            "name": name,
+            "displayName": name,
+            "type": _PARAM_TYPES.get(name, "string"),
+            "allowEmptyValue": False,
+            "isVisible": True,
+            "isReadOnly": False,
+            "initialDisplayValue": "",
+            "dependentParams": [],
+            "group": "empty",
+            "properties": {},
+        }
+        for name in listing["paramNames"]
+    ]
+    return {
+        "searchData": {**listing, "parameters": parameters},
+        "validation": {"level": "DISPLAYABLE", "isValid": True},
+    }
+
+
+# ---------------------------------------------------------------------------
+# WDK state machine
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Step:
+    id: int
+    search_name: str
+    parameters: dict[str, Any]
+    custom_name: str | None = None
+    primary: int | None = None
+    secondary: int | None = None
+
+
+@dataclass
+class _Strategy:
+    id: int
+    name: str
+    step_tree: dict[str, Any]
+    is_saved: bool = False
+    is_public: bool = False
+
+
+type _Handler = Callable[[re.Match[str], dict[str, str], Any], Any]
+
+
+class MockWDK:
+    """In-memory WDK shared by every site the server exposes.
+
+    All sites see the same catalog and result sets; step, strategy and
+    dataset IDs are global, as they would be behind one WDK database.
+    :attr:`stats` counts handled requests by route.
+    """
+
+    def __init__(self, universe_size: int = UNIVERSE_SIZE) -> None:
+        self.universe_size = universe_size
+        self.stats: Counter[str] = Counter()
+        self._searches = catalog_searches()
+        self._by_name = {s["urlSegment"]: s for s in self._searches}
+        self._routes: list[tuple[str, re.Pattern[str], str, _Handler]] = []
+        self._add("GET", r"/users/[^/]+", "user", self._get_user)
+        self._add("GET", r"/record-types", "record-types", self._record_types)
+        self._add(
+            "GET", r"/record-types/(?P<rt>[^/]+)/searches", "searches", self._listing
+        )
+        for method in ("GET", "POST"):
+            self._add(
+                method,
+                r"/record-types/(?P<rt>[^/]+)/searches/(?P<name>[^/]+)",
+                "search-details",
+                self._search_details,
+            )
+        self._add(
+            "POST",
+            r"/record-types/(?P<rt>[^/]+)/searches/(?P<name>[^/]+)/reports/standard",
+            "search-report",
+            self._search_report,
+        )
+        self._add("POST", r"/users/[^/]+/datasets", "dataset", self._create_dataset)
+        self._add("POST", r"/users/[^/]+/steps", "step-create", self._create_step)
+        self._add("GET", r"/users/[^/]+/steps/(?P<id>\d+)", "step", self._get_step)
+        self._add(
+            "POST",
+            r"/users/[^/]+/steps/(?P<id>\d+)/reports/standard",
+            "step-report",
+            self._step_report,
+        )
+        self._add(
+            "GET", r"/users/[^/]+/strategies", "strategy-list", self._list_strategies
+        )
+        self._add(
+            "POST",
+            r"/users/[^/]+/strategies",
+            "strategy-create",
+            self._create_strategy,
+        )
+        self._add(
+            "GET",
+            r"/users/[^/]+/strategies/(?P<id>\d+)",
+            "strategy",
+            self._get_strategy,
+        )
+        self._add(
+            "PATCH",
+            r"/users/[^/]+/strategies/(?P<id>\d+)",
+            "strategy-patch",
+            self._patch_strategy,
+        )
+        self._add(
+            "DELETE",
+            r"/users/[^/]+/strategies/(?P<id>\d+)",
+            "strategy-delete",
+            self._delete_strategy,
+        )
+        self._add(
+            "PUT",
+            r"/users/[^/]+/strategies/(?P<id>\d+)/step-tree",
+            "step-tree",
+            self._put_step_tree,
+        )
+        self.reset()
+
+    def _add(self, method: str, pattern: str, name: str, handler: _Handler) -> None:
+        self._routes.append((method, re.compile(pattern + "/?"), name, handler))
+
+    def reset(self) -> None:
+        """Drop all steps, strategies and datasets (catalog is unchanged)."""
+        self._next_id = 1000
+        self._datasets: dict[int, list[str]] = {}
+        self._steps: dict[int, _Step] = {}
+        self._strategies: dict[int, _Strategy] = {}
+        self.stats.clear()
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def handle(
+        self, method: str, path: str, query: dict[str, str], body: Any
+    ) -> tuple[int, Any]:
+        """Dispatch one request; *path* is relative to ``/service``."""
+        for route_method, pattern, name, handler in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            self.stats[name] += 1
+            try:
+                return 200, handler(match, query, body)
+            except WDKHTTPError as exc:
+                return exc.status, {"status": "error", "message": exc.message}
+        self.stats["unmatched"] += 1
+        return 404, {"status": "not_found", "message": f"{method} {path}"}
+
+    # -- catalog ------------------------------------------------------------
+
+    def _get_user(self, match: re.Match[str], query: dict[str, str], body: Any) -> Any:
+        return user_current_response(MOCK_USER_ID)
+
+    def _record_types(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        record_types = record_types_expanded_response()
+        if query.get("format") != "expanded":
+            return [rt["urlSegment"] for rt in record_types]
+        for rt in record_types:
+            if rt["urlSegment"] == "transcript":
+                rt["searches"] = copy.deepcopy(self._searches)
+        return record_types
+
+    def _listing(self, match: re.Match[str], query: dict[str, str], body: Any) -> Any:
+        if match["rt"] != "transcript":
+            return []
+        return copy.deepcopy(self._searches)
+
+    def _search_details(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        name = match["name"]
+        listing = self._by_name.get(name)
+        if listing is None:
+            raise WDKHTTPError(404, f"Search '{name}' does not exist")
+        if name in _FIXTURE_DETAIL_SEARCHES:
+            return search_details_response(name)
+        return _synthesized_details(listing)
+
+    # -- answers ------------------------------------------------------------
+
+    def _leaf_ids(self, search_name: str, parameters: dict[str, Any]) -> list[str]:
+        if search_name not in self._by_name:
+            raise WDKHTTPError(422, f"Search '{search_name}' does not exist")
+        if search_name == CONTROLS_SEARCH:
+            raw = str(parameters.get(CONTROLS_PARAM, ""))
+            if raw.isdigit():
+                ids = self._datasets.get(int(raw))
+                if ids is None:
+                    raise WDKHTTPError(422, f"Dataset {raw} does not exist")
+            else:
+                ids = [s.strip() for s in re.split(r"[\s,]+", raw) if s.strip()]
+            known = set(gene_universe(self.universe_size))
+            return [gid for gid in dict.fromkeys(ids) if gid in known]
+        return result_ids(search_name, parameters, universe_size=self.universe_size)
+
+    def _answer(self, step_id: int) -> list[str]:
+        step = self._steps.get(step_id)
+        if step is None:
+            raise WDKHTTPError(404, f"{step_id} is not a valid step ID")
+        if step.search_name.startswith("boolean_question"):
+            if step.primary is None or step.secondary is None:
+                raise WDKHTTPError(422, f"Step {step_id} is not part of a strategy")
+            operator = str(step.parameters.get("bq_operator", "INTERSECT"))
+            return _combine(
+                operator, self._answer(step.primary), self._answer(step.secondary)
+            )
+        if step.primary is not None:
+            # Transforms (orthologs etc.) pass their input through.
+            return self._answer(step.primary)
+        return self._leaf_ids(step.search_name, step.parameters)
+
+    @staticmethod
+    def _report(ids: list[str], report_config: Any) -> dict[str, Any]:
+        pagination = {}
+        if isinstance(report_config, dict):
+            pagination = report_config.get("pagination") or {}
+        offset = int(pagination.get("offset", 0))
+        num_records = int(pagination.get("numRecords", 100))
+        if num_records < 0:
+            num_records = len(ids)
+        records = [
+            {
+                "id": [
+                    {"name": "gene_source_id", "value": gid},
+                    {"name": "source_id", "value": f"{gid}.1"},
+                    {"name": "project_id", "value": "PlasmoDB"},
+                ],
+                "displayName": gid,
+                "attributes": {"primary_key": gid, "gene_source_id": gid},
+                "tables": {},
+                "tableErrors": [],
+            }
+            for gid in ids[offset : offset + num_records]
+        ]
+        return {
+            "records": records,
+            "meta": {
+                "totalCount": len(ids),
+                "displayedCount": len(records),
+                "viewTotalCount": len(ids),
+                "responseCount": len(records),
+            },
+        }
+
+    def _search_report(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        body = body or {}
+        search_config = body.get("searchConfig") or {}
+        ids = self._leaf_ids(match["name"], search_config.get("parameters") or {})
+        return self._report(ids, body.get("reportConfig"))
+
+    def _step_report(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        ids = self._answer(int(match["id"]))
+        return self._report(ids, (body or {}).get("reportConfig"))
+
+    # -- user resources -----------------------------------------------------
+
+    def _create_dataset(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        ids = ((body or {}).get("sourceContent") or {}).get("ids")
+        if not isinstance(ids, list):
+            raise WDKHTTPError(400, "sourceContent.ids must be a list")
+        dataset_id = self._new_id()
+        self._datasets[dataset_id] = [str(i) for i in ids]
+        return {"id": dataset_id}
+
+    def _create_step(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        body = body or {}
+        search_name = str(body.get("searchName") or "")
+        if search_name not in self._by_name:
+            raise WDKHTTPError(422, f"Search '{search_name}' does not exist")
+        search_config = body.get("searchConfig") or {}
+        step = _Step(
+            id=self._new_id(),
+            search_name=search_name,
+            parameters=dict(search_config.get("parameters") or {}),
+            custom_name=body.get("customName"),
+        )
+        self._steps[step.id] = step
+        return {"id": step.id}
+
+    def _step_json(self, step: _Step) -> dict[str, Any]:
+        return {
+            "id": step.id,
+            "searchName": step.search_name,
+            "searchConfig": {"parameters": step.parameters, "wdkWeight": 0},
+            "customName": step.custom_name,
+            "displayName": step.custom_name or step.search_name,
+            "estimatedSize": self._estimated_size(step.id),
+            "recordClassName": "TranscriptRecordClasses.TranscriptRecordClass",
+            "isFiltered": False,
+            "hasCompleteStepAnalyses": False,
+        }
+
+    def _estimated_size(self, step_id: int) -> int | None:
+        try:
+            return len(self._answer(step_id))
+        except WDKHTTPError:
+            # Unwired boolean steps have no answer until they join a strategy.
+            return None
+
+    def _get_step(self, match: re.Match[str], query: dict[str, str], body: Any) -> Any:
+        step = self._steps.get(int(match["id"]))
+        if step is None:
+            raise WDKHTTPError(404, f"{match['id']} is not a valid step ID")
+        return self._step_json(step)
+
+    def _wire(self, node: dict[str, Any]) -> list[int]:
+        """Attach the inputs in *node* to their steps; return all step IDs."""
+        step_id = int(node["stepId"])
+        step = self._steps.get(step_id)
+        if step is None:
+            raise WDKHTTPError(422, f"{step_id} is not a valid step ID")
+        ids = [step_id]
+        primary = node.get("primaryInput")
+        secondary = node.get("secondaryInput")
+        step.primary = int(primary["stepId"]) if primary else None
+        step.secondary = int(secondary["stepId"]) if secondary else None
+        for child in (primary, secondary):
+            if child:
+                ids.extend(self._wire(child))
+        return ids
+
+    def _strategy_json(self, strategy: _Strategy) -> dict[str, Any]:
+        step_ids = self._tree_ids(strategy.step_tree)
+        root = self._steps[step_ids[0]]
+        steps = {str(sid): self._step_json(self._steps[sid]) for sid in step_ids}
+        return {
+            "strategyId": strategy.id,
+            "name": strategy.name,
+            "description": "",
+            "isSaved": strategy.is_saved,
+            "isPublic": strategy.is_public,
+            "isDeleted": False,
+            "isValid": True,
+            "rootStepId": root.id,
+            "estimatedSize": steps[str(root.id)]["estimatedSize"],
+            "recordClassName": "TranscriptRecordClasses.TranscriptRecordClass",
+            "stepTree": strategy.step_tree,
+            "steps": steps,
+            "leafAndTransformStepCount": sum(
+                1 for sid in step_ids if self._steps[sid].secondary is None
+            ),
+        }
+
+    @staticmethod
+    def _tree_ids(node: dict[str, Any]) -> list[int]:
+        ids = [int(node["stepId"])]
+        for key in ("primaryInput", "secondaryInput"):
+            child = node.get(key)
+            if child:
+                ids.extend(MockWDK._tree_ids(child))
+        return ids
+
+    def _strategy(self, raw_id: str) -> _Strategy:
+        strategy = self._strategies.get(int(raw_id))
+        if strategy is None:
+            raise WDKHTTPError(404, f"Strategy {raw_id} does not exist")
+        return strategy
+
+    def _create_strategy(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        body = body or {}
+        step_tree = body.get("stepTree")
+        if not isinstance(step_tree, dict):
+            raise WDKHTTPError(400, "stepTree is required")
+        self._wire(step_tree)
+        strategy = _Strategy(
+            id=self._new_id(),
+            name=str(body.get("name") or ""),
+            step_tree=step_tree,
+            is_saved=bool(body.get("isSaved")),
+            is_public=bool(body.get("isPublic")),
+        )
+        self._strategies[strategy.id] = strategy
+        return {"id": strategy.id}
+
+    def _list_strategies(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        return [
+            {
+                "strategyId": s.id,
+                "name": s.name,
+                "isSaved": s.is_saved,
+                "isPublic": s.is_public,
+                "rootStepId": int(s.step_tree["stepId"]),
+            }
+            for s in self._strategies.values()
+        ]
+
+    def _get_strategy(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        return self._strategy_json(self._strategy(match["id"]))
+
+    def _patch_strategy(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        strategy = self._strategy(match["id"])
+        body = body or {}
+        if "name" in body:
+            strategy.name = str(body["name"])
+        if "isSaved" in body:
+            strategy.is_saved = bool(body["isSaved"])
+        if "isPublic" in body:
+            strategy.is_public = bool(body["isPublic"])
+        return None
+
+    def _put_step_tree(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        strategy = self._strategy(match["id"])
+        step_tree = (body or {}).get("stepTree")
+        if not isinstance(step_tree, dict):
+            raise WDKHTTPError(400, "stepTree is required")
+        self._wire(step_tree)
+        strategy.step_tree = step_tree
+        return None
+
+    def _delete_strategy(
+        self, match: re.Match[str], query: dict[str, str], body: Any
+    ) -> Any:
+        strategy = self._strategies.pop(int(match["id"]), None)
+        if strategy is None:
+            raise WDKHTTPError(404, f"Strategy {match['id']} does not exist")
+        # WDK cascade-deletes the strategy's steps.
+        for step_id in self._tree_ids(strategy.step_tree):
+            self._steps.pop(step_id, None)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# HTTP app and server
+# ---------------------------------------------------------------------------
+
+
+def create_mock_wdk_app(
+    wdk: MockWDK | None = None, profile: LatencyProfile | None = None
+) -> FastAPI:
+    """Build the ASGI app serving *wdk* under ``/{site_id}/service``."""
+    wdk = wdk or MockWDK()
+    profile = profile or LatencyProfile()
+    rng = random.Random(profile.seed)
+    app = FastAPI(title="Mock WDK")
+    app.state.wdk = wdk
+
+    @app.get("/{site_id}/app")
+    async def webapp(site_id: str) -> Response:
+        response = Response(content="<html></html>", media_type="text/html")
+        response.set_cookie("JSESSIONID", f"mock-{site_id}")
+        return response
+
+    @app.api_route(
+        "/{site_id}/service/{path:path}",
+        methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    )
+    async def service(site_id: str, path: str, request: Request) -> Response:
+        delay = profile.sample_delay(rng)
+        if delay:
+            await asyncio.sleep(delay)
+        failure = profile.sample_error(rng)
+        if failure is not None:
+            wdk.stats["injected-error"] += 1
+            return Response(
+                content=json.dumps({"status": "error", "message": "injected"}),
+                status_code=failure,
+                media_type="application/json",
+            )
+        raw = await request.body()
+        body = json.loads(raw) if raw.strip() else None
+        status, payload = wdk.handle(
+            request.method, f"/{path}", dict(request.query_params), body
+        )
+        if payload is None:
+            return Response(status_code=204 if status == 200 else status)
+        return Response(
+            content=json.dumps(payload),
+            status_code=status,
+            media_type="application/json",
+        )
+
+    return app
+
+
+def write_sites_config(path: Path, base_url: str) -> Path:
+    """Write a copy of the bundled ``sites.yaml`` pointing at *base_url*.
+
+    Every site's ``base_url`` becomes ``{base_url}/{site_id}/service``; set
+    ``VEUPATHDB_SITES_CONFIG`` to the returned path to use it.
+    """
+    bundled = (
+        Path(__file__).resolve().parents[2]
+        / "integrations"
+        / "veupathdb"
+        / "sites.yaml"
+    )
+    config = yaml.safe_load(bundled.read_text(encoding="utf-8"))
+    for site_id, site in config.get("sites", {}).items():
+        site["base_url"] = f"{base_url.rstrip('/')}/{site_id}/service"
+    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    return path
+
+
+class MockWDKServer:
+    """Run the mock WDK on a background thread, on an ephemeral local port.
+
+    Use as a context manager; :attr:`base_url` is valid once entered.
+    The server runs its own event loop, so injected delays do not block
+    the code under test.
+    """
+
+    def __init__(
+        self,
+        profile: LatencyProfile | None = None,
+        *,
+        wdk: MockWDK | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.wdk = wdk or MockWDK()
+        self.profile = profile or LatencyProfile()
+        self.host = host
+        self.port = port
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        self.port = sock.getsockname()[1]
+        config = uvicorn.Config(
+            create_mock_wdk_app(self.wdk, self.profile),
+            log_level="warning",
+            access_log=False,
+            lifespan="off",
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run,
+            kwargs={"sockets": [sock]},
+            name="mock-wdk",
+            daemon=True,
+        )
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Mock WDK server failed to start")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> MockWDKServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--median-ms", type=float, default=0.0)
+    parser.add_argument("--p99-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--sites-out",
+        type=Path,
+        help="Write a sites YAML pointing at this server to this path.",
+    )
+    args = parser.parse_args()
+
+    profile = LatencyProfile(
+        median_ms=args.median_ms,
+        p99_ms=args.p99_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    base_url = f"http://{args.host}:{args.port}"
+    if args.sites_out:
+        write_sites_config(args.sites_out, base_url)
+        print(f"Wrote {args.sites_out}")
+    uvicorn.run(
+        create_mock_wdk_app(MockWDK(), profile),
+        host=args.host,
+        port=args.port,
+        log_level="info",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -151,6 +151,33 @@ async def test_list_experiments_filters_by_site(
     assert not any(e["id"] == "exp-toxo" for e in items)
 
 
+@pytest.mark.asyncio
+async def test_list_experiments_filters_by_status_and_search_name(
+    authed_client: httpx.AsyncClient,
+) -> None:
+    """status and searchName filters are applied in SQL."""
+    from veupath_chatbot.services.experiment.store import get_experiment_store
+
+    user_id = _user_id_from_client(authed_client)
+    done = _make_experiment("exp-done", user_id)
+    running = _make_experiment("exp-running", user_id, status="running")
+    other_search = _make_experiment("exp-other-search", user_id)
+    other_search.config.search_name = "GenesByTaxon"
+
+    store = get_experiment_store()
+    for exp in (done, running, other_search):
+        await store._persist(exp)
+    # Drop the cache so the listing comes from the database alone.
+    store._cache.clear()
+
+    resp = await authed_client.get(
+        "/api/v1/experiments/",
+        params={"status": "completed", "searchName": "GenesByTextSearch"},
+    )
+    assert resp.status_code == 200
+    assert [e["id"] for e in resp.json()] == ["exp-done"]
+
+
 # ---------------------------------------------------------------------------
 # Get experiment
 # ---------------------------------------------------------------------------
@@ -305,3 +305,60 @@ async def test_subscribe_streams_events(authed_client: httpx.AsyncClient) -> Non
     assert "event: assistant_delta" in text
     assert "event: message_end" in text
     assert '"text": "hello"' in text or '"text":"hello"' in text
+
+
+# ---------------------------------------------------------------------------
+# profile
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_profile_not_found(authed_client: httpx.AsyncClient) -> None:
+    """Profiling a non-existent operation returns 404."""
+    resp = await authed_client.get("/api/v1/operations/nonexistent/profile")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_profile_missing_for_unprofiled_operation(
+    authed_client: httpx.AsyncClient,
+) -> None:
+    """An operation that never ran under a profile has nothing to serve."""
+    _stream_id, op_id, _ = await _create_stream_and_operation(
+        authed_client, status="completed"
+    )
+    resp = await authed_client.get(f"/api/v1/operations/{op_id}/profile")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_profile_live_then_stored(authed_client: httpx.AsyncClient) -> None:
+    """The live profile is served while running and persisted on completion."""
+    from veupath_chatbot.persistence.repositories.stream import StreamRepository
+    from veupath_chatbot.platform.tracing import profile_operation, span
+
+    _stream_id, op_id, _ = await _create_stream_and_operation(authed_client)
+
+    with profile_operation(op_id):
+        for _ in range(2):
+            with span("wdk.request", category="wdk", endpoint="GET /record-types"):
+                pass
+
+        resp = await authed_client.get(f"/api/v1/operations/{op_id}/profile")
+        assert resp.status_code == 200
+        live = resp.json()
+        assert live["live"] is True
+        assert live["status"] == "active"
+        assert live["endpoints"][0]["endpoint"] == "GET /record-types"
+        assert live["endpoints"][0]["count"] == 2
+
+        async with session_module.async_session_factory() as session:
+            await StreamRepository(session).complete_operation(op_id)
+            await session.commit()
+
+    resp = await authed_client.get(f"/api/v1/operations/{op_id}/profile")
+    assert resp.status_code == 200
+    stored = resp.json()
+    assert stored["live"] is False
+    assert stored["status"] == "completed"
+    assert stored["categories"]["wdk"]["count"] == 2
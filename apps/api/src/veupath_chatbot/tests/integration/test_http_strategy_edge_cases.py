@@ -175,7 +175,7 @@ async def test_sync_filters_internal_strategy_names(
             name="__pathfinder_internal__:Pathfinder control test",
         ),
     ]
-    # Internal strategies should be cleaned up (deleted from WDK)
+    # Internal strategies are hidden (leaked ones are the reaper's job)
     wdk_respx.delete(url__regex=rf"{base}/users/guest/strategies/\d+").respond(204)
     wdk_respx.get(f"{base}/users/guest/strategies").respond(200, json=items)
 
@@ -1,3 +1,5 @@
+from datetime import UTC, datetime
+
 import httpx
 import respx
 
@@ -10,7 +12,7 @@ async def test_open_strategy_requires_site_id_when_creating_new(
     assert resp.status_code == 422
 
 
-async def test_sync_wdk_deletes_internal_control_test_strategies(
+async def test_sync_wdk_sweeps_old_unrecorded_temp_strategies(
     authed_client: httpx.AsyncClient, wdk_respx: respx.Router
 ) -> None:
     base = "https://plasmodb.org/plasmo/service"
@@ -23,10 +25,21 @@ async def test_sync_wdk_deletes_internal_control_test_strategies(
                 "strategyId": 329824883,
                 "name": "__pathfinder_internal__:Pathfinder control test",
                 "isSaved": False,
-            }
+                "lastModified": "2020-01-01T00:00:00Z",
+            },
+            {
+                # Possibly still in use by a run that started recently.
+                "strategyId": 329824884,
+                "name": "__pathfinder_internal__:Pathfinder control test",
+                "isSaved": False,
+                "lastModified": datetime.now(UTC).isoformat(),
+            },
         ],
     )
-    delete_route = wdk_respx.delete(f"{base}/users/guest/strategies/329824883").respond(
+    old_route = wdk_respx.delete(f"{base}/users/guest/strategies/329824883").respond(
+        204
+    )
+    recent_route = wdk_respx.delete(f"{base}/users/guest/strategies/329824884").respond(
         204
     )
 
@@ -34,7 +47,8 @@ async def test_sync_wdk_deletes_internal_control_test_strategies(
         "/api/v1/strategies/sync-wdk", params={"siteId": "plasmodb"}
     )
     assert resp.status_code == 200, resp.text
-    assert delete_route.called
+    assert old_route.called
+    assert not recent_route.called
 
 
 # ---------------------------------------------------------------------------
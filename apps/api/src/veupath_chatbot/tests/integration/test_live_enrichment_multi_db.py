@@ -1,6 +1,6 @@
 """Live integration tests for enrichment across multiple VEuPathDB databases.
 
-Tests _build_enrichment_params_from_gene_ids, EnrichmentService.run(),
+Tests build_enrichment_params_from_gene_ids, EnrichmentService.run(),
 and EnrichmentService.run_batch() against REAL WDK APIs with REAL gene IDs
 from six VEuPathDB databases: PlasmoDB, ToxoDB, CryptoDB, FungiDB,
 TriTrypDB, and VectorBase.
@@ -21,10 +21,10 @@ from collections.abc import AsyncGenerator
 import pytest
 
 from veupath_chatbot.integrations.veupathdb.site_router import get_site_router
-from veupath_chatbot.services.gene_sets.operations import (
-    _build_enrichment_params_from_gene_ids,
+from veupath_chatbot.services.wdk.enrichment_service import (
+    EnrichmentService,
+    build_enrichment_params_from_gene_ids,
 )
-from veupath_chatbot.services.wdk.enrichment_service import EnrichmentService
 
 pytestmark = pytest.mark.live_wdk
 
@@ -427,7 +427,7 @@ async def _close_wdk_clients() -> AsyncGenerator[None]:
 
 
 class TestBuildEnrichmentParamsMultiDb:
-    """Test _build_enrichment_params_from_gene_ids against each VEuPathDB site.
+    """Test build_enrichment_params_from_gene_ids against each VEuPathDB site.
 
     Each test uploads 50 real gene IDs to the target site, creating a
     WDK dataset, and verifies the returned search_name, record_type,
@@ -441,7 +441,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
 
         print(f"\n  [PlasmoDB] search_name={search_name}, record_type={record_type}")
         print(f"  [PlasmoDB] parameters={parameters}")
@@ -461,7 +461,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
 
         print(f"\n  [ToxoDB] search_name={search_name}, record_type={record_type}")
         print(f"  [ToxoDB] parameters={parameters}")
@@ -481,7 +481,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("cryptodb", CRYPTO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("cryptodb", CRYPTO_GENES)
 
         print(f"\n  [CryptoDB] search_name={search_name}, record_type={record_type}")
         print(f"  [CryptoDB] parameters={parameters}")
@@ -501,7 +501,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
+        ) = await build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
 
         print(f"\n  [FungiDB] search_name={search_name}, record_type={record_type}")
         print(f"  [FungiDB] parameters={parameters}")
@@ -521,7 +521,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("tritrypdb", TRITRYP_GENES)
+        ) = await build_enrichment_params_from_gene_ids("tritrypdb", TRITRYP_GENES)
 
         print(f"\n  [TriTrypDB] search_name={search_name}, record_type={record_type}")
         print(f"  [TriTrypDB] parameters={parameters}")
@@ -541,7 +541,7 @@ class TestBuildEnrichmentParamsMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("vectorbase", VECTOR_GENES)
+        ) = await build_enrichment_params_from_gene_ids("vectorbase", VECTOR_GENES)
 
         print(f"\n  [VectorBase] search_name={search_name}, record_type={record_type}")
         print(f"  [VectorBase] parameters={parameters}")
@@ -575,7 +575,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -612,7 +612,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -649,7 +649,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("cryptodb", CRYPTO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("cryptodb", CRYPTO_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -686,7 +686,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
+        ) = await build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -723,7 +723,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("tritrypdb", TRITRYP_GENES)
+        ) = await build_enrichment_params_from_gene_ids("tritrypdb", TRITRYP_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -760,7 +760,7 @@ class TestEnrichmentMultiDb:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("vectorbase", VECTOR_GENES)
+        ) = await build_enrichment_params_from_gene_ids("vectorbase", VECTOR_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -810,7 +810,7 @@ class TestMultiTypeEnrichment:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("plasmodb", PLASMO_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -840,7 +840,7 @@ class TestMultiTypeEnrichment:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
+        ) = await build_enrichment_params_from_gene_ids("toxodb", TOXO_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -870,7 +870,7 @@ class TestMultiTypeEnrichment:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
+        ) = await build_enrichment_params_from_gene_ids("fungidb", FUNGI_GENES)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -916,7 +916,7 @@ class TestLargeGeneSetEnrichment:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("plasmodb", large_gene_set)
+        ) = await build_enrichment_params_from_gene_ids("plasmodb", large_gene_set)
 
         print(f"\n  [PlasmoDB 100 genes] dataset created: {parameters}")
 
@@ -966,7 +966,7 @@ class TestEnrichmentEdgeCases:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids("plasmodb", single_gene)
+        ) = await build_enrichment_params_from_gene_ids("plasmodb", single_gene)
 
         print(f"\n  [Single gene] gene={single_gene[0]}")
         print(f"  search_name={search_name}, parameters={parameters}")
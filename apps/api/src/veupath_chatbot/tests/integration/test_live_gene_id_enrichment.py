@@ -22,10 +22,10 @@ from collections.abc import AsyncGenerator
 import pytest
 
 from veupath_chatbot.integrations.veupathdb.site_router import get_site_router
-from veupath_chatbot.services.gene_sets.operations import (
-    _build_enrichment_params_from_gene_ids,
+from veupath_chatbot.services.wdk.enrichment_service import (
+    EnrichmentService,
+    build_enrichment_params_from_gene_ids,
 )
-from veupath_chatbot.services.wdk.enrichment_service import EnrichmentService
 
 SITE_ID = "plasmodb"
 
@@ -60,7 +60,7 @@ pytestmark = pytest.mark.live_wdk
 
 
 class TestBuildEnrichmentParamsFromGeneIds:
-    """Test _build_enrichment_params_from_gene_ids against live PlasmoDB.
+    """Test build_enrichment_params_from_gene_ids against live PlasmoDB.
 
     This creates a real WDK dataset from gene IDs and returns params
     suitable for enrichment. This was the missing link — gene-ID
@@ -74,7 +74,7 @@ class TestBuildEnrichmentParamsFromGeneIds:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
+        ) = await build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
 
         print(f"\n  search_name:  {search_name}")
         print(f"  parameters:   {parameters}")
@@ -95,7 +95,7 @@ class TestBuildEnrichmentParamsFromGeneIds:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids(SITE_ID, [GENE_IDS[0]])
+        ) = await build_enrichment_params_from_gene_ids(SITE_ID, [GENE_IDS[0]])
 
         assert search_name == "GeneByLocusTag"
         assert record_type == "transcript"
@@ -118,7 +118,7 @@ class TestEnrichmentServiceWithGeneIds:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
+        ) = await build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -160,7 +160,7 @@ class TestEnrichmentServiceWithGeneIds:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
+        ) = await build_enrichment_params_from_gene_ids(SITE_ID, GENE_IDS)
 
         svc = EnrichmentService()
         results, errors = await svc.run_batch(
@@ -22,10 +22,10 @@ import httpx
 import pytest
 
 from veupath_chatbot.integrations.veupathdb.site_router import get_site_router
-from veupath_chatbot.services.gene_sets.operations import (
-    _build_enrichment_params_from_gene_ids,
+from veupath_chatbot.services.wdk.enrichment_service import (
+    EnrichmentService,
+    build_enrichment_params_from_gene_ids,
 )
-from veupath_chatbot.services.wdk.enrichment_service import EnrichmentService
 
 pytestmark = pytest.mark.live_wdk
 
@@ -354,7 +354,7 @@ class TestGeneSetEnrichmentMultiSite:
             search_name,
             parameters,
             record_type,
-        ) = await _build_enrichment_params_from_gene_ids(site_id, gene_ids)
+        ) = await build_enrichment_params_from_gene_ids(site_id, gene_ids)
 
         assert search_name == "GeneByLocusTag"
         assert record_type == "transcript"
@@ -80,7 +80,7 @@ def _make_mock_api(
     """
     api = AsyncMock()
 
-    # list_strategies -> used by _cleanup_internal_control_test_strategies
+    # list_strategies -> must not be needed: leaks are left to the reaper
     api.list_strategies.return_value = stale_strategies or []
 
     # create_step returns different IDs on successive calls.
@@ -451,7 +451,6 @@ class TestBothControls:
                 controls_param_name=CONTROLS_PARAM_NAME,
                 positive_controls=[],
                 negative_controls=[],
-                skip_cleanup=True,
             )
 
         mock_factory.assert_not_called()
@@ -548,20 +547,20 @@ class TestCleanupOnSuccess:
         mock_api.delete_strategy.assert_awaited_once_with(STRATEGY_ID)
 
     @pytest.mark.asyncio
-    async def test_stale_strategies_cleaned_up(self) -> None:
-        """Stale internal strategies from previous interrupted runs are deleted."""
+    async def test_stale_strategies_left_to_reaper(self) -> None:
+        """Runs don't list the account to clean up earlier leaks."""
         stale = [
             {
                 "name": "__pathfinder_internal__:Pathfinder control test",
                 "strategyId": 999,
             },
         ]
-        cleanup_api = _make_mock_api(stale_strategies=stale)
         pos_api = _make_mock_api(
+            stale_strategies=stale,
             combined_count=2,
             answer_gene_ids=POSITIVE_IDS[:2],
         )
-        with patch(PATCH_TARGET, side_effect=[cleanup_api, pos_api]):
+        with patch(PATCH_TARGET, return_value=pos_api):
             await run_positive_negative_controls(
                 site_id=SITE_ID,
                 record_type=RECORD_TYPE,
@@ -573,9 +572,8 @@ class TestCleanupOnSuccess:
                 controls_value_format="newline",
             )
 
-        # The stale strategy should have been deleted by the cleanup API
-        cleanup_api.delete_strategy.assert_any_await(999)
-        # The temp strategy should have been deleted by the pos API
+        pos_api.list_strategies.assert_not_awaited()
+        # Only the run's own temp strategy is deleted
         pos_api.delete_strategy.assert_awaited_once_with(STRATEGY_ID)
 
 
@@ -0,0 +1,149 @@
+"""Tests for admission control of expensive work (local slots)."""
+
+import asyncio
+import time
+
+import pytest
+
+from veupath_chatbot.platform.admission import AdmissionController, ProcessCpuLoad
+from veupath_chatbot.platform.errors import ServiceBusyError
+
+
+def _controller(**kwargs: object) -> AdmissionController:
+    defaults: dict[str, object] = {
+        "max_running": 2,
+        "max_running_per_user": 1,
+        "max_queued": 1,
+        "max_wdk_inflight": 2,
+        "poll_interval": 0.01,
+        "max_poll_interval": 0.01,
+        "cpu_load": lambda: 0.0,
+    }
+    defaults.update(kwargs)
+    return AdmissionController(**defaults)  # type: ignore[arg-type]
+
+
+async def _hold_slot(controller: AdmissionController) -> None:
+    async with controller.slot("enrichment", user_id="u1"):
+        pass
+
+
+class TestSlots:
+    async def test_per_user_slot_queues_until_released(self) -> None:
+        controller = _controller()
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def first() -> None:
+            async with controller.slot("experiment", user_id="u1"):
+                order.append("first")
+                await release.wait()
+
+        async def second() -> None:
+            async with controller.slot("experiment", user_id="u1"):
+                order.append("second")
+
+        t1 = asyncio.create_task(first())
+        await asyncio.sleep(0.02)
+        t2 = asyncio.create_task(second())
+        await asyncio.sleep(0.05)
+        assert order == ["first"]
+        assert controller.queued == 1
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(t1, t2), timeout=1)
+        assert order == ["first", "second"]
+        assert controller.queued == 0
+
+    async def test_other_users_are_admitted(self) -> None:
+        controller = _controller()
+        async with controller.slot("experiment", user_id="u1"):
+            async with asyncio.timeout(1):
+                async with controller.slot("experiment", user_id="u2"):
+                    pass
+
+    async def test_timeout_raises_service_busy(self) -> None:
+        controller = _controller(max_running=1)
+        async with controller.slot("enrichment", user_id="u1"):
+            with pytest.raises(ServiceBusyError):
+                async with controller.slot("enrichment", user_id="u2", timeout=0.05):
+                    pass
+
+    async def test_waits_while_wdk_saturated(self) -> None:
+        controller = _controller()
+        with controller.track_wdk_request(), controller.track_wdk_request():
+            assert controller.saturation() == "wdk"
+            with pytest.raises(ServiceBusyError):
+                async with controller.slot("enrichment", timeout=0.05):
+                    pass
+        assert controller.wdk_inflight == 0
+
+    async def test_on_queued_fires_once_while_waiting(self) -> None:
+        controller = _controller(max_running=1)
+        calls = 0
+
+        async def _queued() -> None:
+            nonlocal calls
+            calls += 1
+
+        async with controller.slot("experiment", user_id="u1"):
+            with pytest.raises(ServiceBusyError):
+                async with controller.slot(
+                    "experiment", user_id="u2", timeout=0.05, on_queued=_queued
+                ):
+                    pass
+        assert calls == 1
+
+        async with controller.slot("experiment", user_id="u2", on_queued=_queued):
+            pass
+        assert calls == 1
+
+    async def test_disabled_controller_never_waits(self) -> None:
+        controller = _controller(enabled=False, max_running=1)
+        async with (
+            controller.slot("experiment", user_id="u1"),
+            controller.slot("experiment", user_id="u1", timeout=0),
+        ):
+            pass
+
+
+class TestShedding:
+    def test_sheds_when_saturated_and_queue_full(self) -> None:
+        controller = _controller(cpu_load=lambda: 2.0, max_queued=0)
+        assert controller.saturation() == "cpu"
+        with pytest.raises(ServiceBusyError):
+            controller.check("benchmark")
+
+    def test_queues_when_saturated_with_room(self) -> None:
+        controller = _controller(cpu_load=lambda: 2.0, max_queued=4)
+        controller.check("benchmark")
+
+    async def test_sheds_once_waiting_slots_fill_queue(self) -> None:
+        controller = _controller(cpu_load=lambda: 2.0, max_queued=1)
+        controller.check("enrichment")
+
+        waiter = asyncio.create_task(_hold_slot(controller))
+        await asyncio.sleep(0.02)
+        try:
+            assert controller.queued == 1
+            with pytest.raises(ServiceBusyError):
+                controller.check("enrichment")
+        finally:
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert controller.queued == 0
+
+    def test_never_sheds_when_not_saturated(self) -> None:
+        controller = _controller(max_queued=0)
+        controller.check("benchmark")
+
+
+class TestProcessCpuLoad:
+    def test_measures_own_cpu_time_per_window(self) -> None:
+        load = ProcessCpuLoad(window=0.05)
+        assert load() == 0.0
+        deadline = time.monotonic() + 0.1
+        while time.monotonic() < deadline:
+            pass
+        assert load() > 0.5
@@ -0,0 +1,81 @@
+"""Tests for fetch_result_records' use of the cached result table."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.experiment.ai_analysis_tools import (
+    _AnalysisToolsMixin,
+)
+from veupath_chatbot.services.wdk.step_results import get_result_table
+
+_MODULE = "veupath_chatbot.services.experiment.ai_analysis_tools"
+
+
+def _record(gene_id: str) -> JSONObject:
+    return {"id": [{"name": "source_id", "value": gene_id}], "attributes": {}}
+
+
+def _api(total: int) -> MagicMock:
+    async def _records(step_id: int, **kwargs: object) -> JSONObject:
+        pagination = kwargs["pagination"]
+        assert isinstance(pagination, dict)
+        start = pagination["offset"]
+        end = min(total, start + pagination["numRecords"])
+        return {
+            "records": [_record(f"G{i}") for i in range(start, end)],
+            "meta": {"totalCount": total},
+        }
+
+    api = MagicMock()
+    api.get_step_records = AsyncMock(side_effect=_records)
+    return api
+
+
+class _Tools(_AnalysisToolsMixin):
+    site_id = "plasmodb"
+    experiment_id = "exp-1"
+
+    async def _get_experiment(self) -> MagicMock:
+        exp = MagicMock(wdk_step_id=7)
+        exp.classification_id_sets.return_value = (set(), set(), set(), set())
+        return exp
+
+
+class TestFetchResultRecords:
+    async def test_cache_miss_makes_one_direct_call(self) -> None:
+        api = _api(1000)
+        with patch(f"{_MODULE}.get_strategy_api", return_value=api):
+            result = await _Tools().fetch_result_records(offset=0, limit=10)
+
+        assert api.get_step_records.await_count == 1
+        assert result["totalCount"] == 1000
+
+    async def test_sorted_request_skips_truncated_table(self) -> None:
+        api = _api(1000)
+        await get_result_table(api, site_id="plasmodb", step_id=7)
+        loads = api.get_step_records.await_count
+        with patch(f"{_MODULE}.get_strategy_api", return_value=api):
+            await _Tools().fetch_result_records(sort_attribute="score")
+
+        assert api.get_step_records.await_count == loads + 1
+        assert api.get_step_records.call_args.kwargs["sorting"] == [
+            {"attributeName": "score", "direction": "ASC"}
+        ]
+
+    async def test_leading_page_served_from_cached_table(self) -> None:
+        api = _api(1000)
+        await get_result_table(api, site_id="plasmodb", step_id=7)
+        loads = api.get_step_records.await_count
+        with patch(f"{_MODULE}.get_strategy_api", return_value=api):
+            result = await _Tools().fetch_result_records(offset=20, limit=5)
+
+        assert api.get_step_records.await_count == loads
+        records = result["records"]
+        assert isinstance(records, list)
+        assert [r["geneId"] for r in records if isinstance(r, dict)] == [
+            "G20",
+            "G21",
+            "G22",
+            "G23",
+            "G24",
+        ]
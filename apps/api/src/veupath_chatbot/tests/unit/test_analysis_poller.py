@@ -0,0 +1,189 @@
+"""Unit tests for the adaptive, multiplexed WDK analysis poller."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from veupath_chatbot.integrations.veupathdb.analysis_poller import (
+    MIN_INTERVAL,
+    AnalysisPoller,
+    backoff_delay,
+    get_analysis_poller,
+)
+from veupath_chatbot.platform.errors import InternalError
+
+
+def _make_client(statuses: dict[int, list[str]]) -> MagicMock:
+    """Mock client whose status responses are scripted per analysis ID."""
+    client = MagicMock()
+    client.base_url = "https://wdk.test/service"
+    client.analysis_poll_max_interval = 5.0
+    remaining = {aid: list(seq) for aid, seq in statuses.items()}
+
+    async def _status(user_id: str, step_id: int, analysis_id: int) -> dict[str, str]:
+        seq = remaining[analysis_id]
+        status = seq.pop(0) if len(seq) > 1 else seq[0]
+        return {"status": status}
+
+    client.get_analysis_status = AsyncMock(side_effect=_status)
+    client.run_analysis_instance = AsyncMock(return_value={})
+    return client
+
+
+class TestBackoffDelay:
+    def test_grows_exponentially_without_jitter(self) -> None:
+        delays = [
+            backoff_delay(i, initial=0.5, growth=2.0, max_interval=100, jitter=0)
+            for i in range(4)
+        ]
+        assert delays == [0.5, 1.0, 2.0, 4.0]
+
+    def test_capped_at_max_interval(self) -> None:
+        assert backoff_delay(50, initial=1.0, max_interval=3.0) <= 3.0
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        for _ in range(50):
+            d = backoff_delay(0, initial=1.0, jitter=0.2, max_interval=10)
+            assert 0.8 <= d <= 1.2
+
+    def test_zero_or_negative_initial_is_clamped(self) -> None:
+        assert backoff_delay(0, initial=0.0, jitter=0) == MIN_INTERVAL
+        assert backoff_delay(3, initial=-1.0) >= MIN_INTERVAL
+
+
+class TestAnalysisPoller:
+    async def test_resolves_on_complete(self) -> None:
+        client = _make_client({7: ["RUNNING", "COMPLETE"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        await poller.wait(client, "u", 1, 7, initial_interval=0.0)
+        assert client.get_analysis_status.await_count == 2
+        assert poller.pending_count == 0
+
+    async def test_multiplexes_analyses_and_resolves_each_independently(
+        self,
+    ) -> None:
+        client = _make_client(
+            {1: ["COMPLETE"], 2: ["RUNNING", "RUNNING", "RUNNING", "COMPLETE"]}
+        )
+        poller = AnalysisPoller(max_interval=0.01)
+        fast = asyncio.create_task(
+            poller.wait(client, "u", 10, 1, initial_interval=0.0)
+        )
+        slow = asyncio.create_task(
+            poller.wait(client, "u", 20, 2, initial_interval=0.0)
+        )
+        await asyncio.wait_for(fast, timeout=1)
+        assert not slow.done()
+        await asyncio.wait_for(slow, timeout=1)
+
+    async def test_expired_status_raises(self) -> None:
+        client = _make_client({7: ["EXPIRED"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        with pytest.raises(InternalError, match="analysis failed"):
+            await poller.wait(client, "u", 1, 7, initial_interval=0.0)
+
+    async def test_retriable_status_reruns_same_instance(self) -> None:
+        client = _make_client({7: ["ERROR", "COMPLETE"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        await poller.wait(client, "u", 1, 7, initial_interval=0.0)
+        client.run_analysis_instance.assert_awaited_once_with("u", 1, 7)
+
+    async def test_retries_exhausted_calls_hook_and_raises(self) -> None:
+        client = _make_client({7: ["ERROR"]})
+        hook = MagicMock()
+        poller = AnalysisPoller(max_interval=0.01)
+        with pytest.raises(InternalError, match="unavailable"):
+            await poller.wait(
+                client,
+                "u",
+                1,
+                7,
+                initial_interval=0.0,
+                max_retries=1,
+                on_exhausted=hook,
+            )
+        hook.assert_called_once()
+
+    async def test_times_out(self) -> None:
+        client = _make_client({7: ["RUNNING"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        with pytest.raises(InternalError, match="timed out"):
+            await poller.wait(client, "u", 1, 7, initial_interval=0.005, max_wait=0.05)
+
+    async def test_cancelled_waiter_is_removed(self) -> None:
+        client = _make_client({7: ["RUNNING"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        task = asyncio.create_task(
+            poller.wait(client, "u", 1, 7, initial_interval=0.005)
+        )
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert poller.pending_count == 0
+
+    async def test_duplicate_waiters_share_one_entry(self) -> None:
+        client = _make_client({7: ["RUNNING", "RUNNING", "COMPLETE"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        first = asyncio.create_task(
+            poller.wait(client, "u", 1, 7, initial_interval=0.005)
+        )
+        await asyncio.sleep(0)
+        second = asyncio.create_task(
+            poller.wait(client, "u", 1, 7, initial_interval=0.005)
+        )
+        await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+        assert poller.pending_count == 0
+        assert client.get_analysis_status.await_count == 3
+
+    async def test_cancelling_one_waiter_keeps_the_shared_entry(self) -> None:
+        client = _make_client({7: ["RUNNING", "RUNNING", "RUNNING", "COMPLETE"]})
+        poller = AnalysisPoller(max_interval=0.01)
+        first = asyncio.create_task(
+            poller.wait(client, "u", 1, 7, initial_interval=0.005)
+        )
+        second = asyncio.create_task(
+            poller.wait(client, "u", 1, 7, initial_interval=0.005)
+        )
+        await asyncio.sleep(0.005)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.wait_for(second, timeout=1)
+
+    async def test_slow_check_does_not_stall_others(self) -> None:
+        client = _make_client({2: ["COMPLETE"]})
+        hang = asyncio.Event()
+        fast_status = client.get_analysis_status.side_effect
+
+        async def _status(user_id: str, step_id: int, analysis_id: int) -> object:
+            if analysis_id == 1:
+                await hang.wait()
+            return await fast_status(user_id, step_id, analysis_id)
+
+        client.get_analysis_status.side_effect = _status
+        poller = AnalysisPoller(max_interval=0.01, deadline_grace=0.05)
+        slow = asyncio.create_task(
+            poller.wait(client, "u", 1, 1, initial_interval=0.0, max_wait=0.05)
+        )
+        await poller.wait(client, "u", 1, 2, initial_interval=0.005)
+        assert not slow.done()
+
+        # The hung status call never returns; the waiter gives up anyway.
+        with pytest.raises(InternalError, match="timed out"):
+            await asyncio.wait_for(slow, timeout=1)
+        hang.set()
+
+
+class TestGetAnalysisPoller:
+    def test_shared_per_site(self) -> None:
+        a = _make_client({})
+        b = _make_client({})
+        assert get_analysis_poller(a) is get_analysis_poller(b)
+
+    def test_uses_client_cap(self) -> None:
+        client = _make_client({})
+        client.base_url = "https://capped.test/service"
+        client.analysis_poll_max_interval = 1.5
+        assert get_analysis_poller(client).max_interval == 1.5
@@ -238,6 +238,26 @@ class TestTryAutoPushToWdk:
         repo.update_projection.assert_called_once()
         mock_session.commit.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_successful_push_drops_cached_step_results(self) -> None:
+        projection = _mock_projection()
+        patches, *_ = _make_patches(projection=projection)
+
+        with (
+            patches["session_factory"],
+            patches["repo_cls"],
+            patches["validate"],
+            patches["get_api"],
+            patches["compile"],
+            patch(
+                "veupath_chatbot.services.strategies.auto_push.invalidate_user_tool_results",
+                new_callable=AsyncMock,
+            ) as invalidate,
+        ):
+            await try_auto_push_to_wdk(uuid4())
+
+        invalidate.assert_awaited_once_with(projection.stream.user_id)
+
     @pytest.mark.asyncio
     async def test_successful_push_rewrites_ids(self) -> None:
         """After compilation, local step IDs should be rewritten to WDK IDs."""
@@ -252,9 +272,11 @@ class TestTryAutoPushToWdk:
         ):
             await try_auto_push_to_wdk(uuid4())
 
-        # update_projection should be called with the rewritten plan
+        # update_projection should patch only the rewritten step tree
         call_kwargs = repo.update_projection.call_args
         assert call_kwargs is not None
+        assert set(call_kwargs.kwargs["plan_patch"]) == {"root"}
+        assert "plan" not in call_kwargs.kwargs
 
     @pytest.mark.asyncio
     async def test_wdk_404_clears_strategy_id(self) -> None:
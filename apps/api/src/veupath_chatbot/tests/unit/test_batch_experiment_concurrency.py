@@ -0,0 +1,270 @@
+"""Tests for concurrent batch experiments and shared WDK lookups."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from veupath_chatbot.integrations.veupathdb.client import VEuPathDBClient
+from veupath_chatbot.integrations.veupathdb.shared_lookups import (
+    current_shared_lookups,
+    shared_lookups,
+)
+from veupath_chatbot.platform.errors import ServiceBusyError
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.experiment.core import streaming
+from veupath_chatbot.services.experiment.types import (
+    BatchExperimentConfig,
+    BatchOrganismTarget,
+    Experiment,
+    ExperimentConfig,
+)
+
+_STREAMING = "veupath_chatbot.services.experiment.core.streaming"
+
+
+class TestSharedLookups:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self) -> None:
+        calls = 0
+
+        async def _fetch() -> JSONObject:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"searchData": {"parameters": []}}
+
+        with shared_lookups() as memo:
+            results = await asyncio.gather(*(memo.get("k", _fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert memo.misses == 1
+        assert memo.hits == 4
+        assert all(r == {"searchData": {"parameters": []}} for r in results)
+        # Each caller gets its own copy.
+        results[0]["searchData"] = {}
+        assert results[1] == {"searchData": {"parameters": []}}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried(self) -> None:
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), {"ok": True}])
+
+        with shared_lookups() as memo:
+            with pytest.raises(RuntimeError):
+                await memo.get("k", fetch)
+            assert await memo.get("k", fetch) == {"ok": True}
+
+        assert fetch.await_count == 2
+
+    def test_scope_is_reset_and_nested_blocks_reuse(self) -> None:
+        assert current_shared_lookups() is None
+        with shared_lookups() as outer:
+            with shared_lookups() as inner:
+                assert inner is outer
+            assert current_shared_lookups() is outer
+        assert current_shared_lookups() is None
+
+    @pytest.mark.asyncio
+    async def test_client_search_details_shared_only_inside_block(self) -> None:
+        client = VEuPathDBClient("https://plasmodb.org/plasmo/service")
+        with patch.object(
+            client, "get", AsyncMock(return_value={"searchData": {}})
+        ) as get:
+            await client.get_search_details("gene", "GenesByTaxon")
+            await client.get_search_details("gene", "GenesByTaxon")
+            assert get.await_count == 2
+
+            with shared_lookups():
+                await asyncio.gather(
+                    client.get_search_details("gene", "GenesByTaxon"),
+                    client.get_search_details("gene", "GenesByTaxon"),
+                    client.get_search_details("gene", "GeneByLocusTag"),
+                )
+            assert get.await_count == 4
+
+
+def _batch(organisms: list[str]) -> BatchExperimentConfig:
+    return BatchExperimentConfig(
+        base_config=ExperimentConfig(
+            site_id="plasmodb",
+            record_type="gene",
+            search_name="GenesByTaxon",
+            parameters={"organism": "P. falciparum", "min": "1"},
+            positive_controls=["PF3D7_1133400"],
+            negative_controls=["PF3D7_0000001"],
+            controls_search_name="GeneByLocusTag",
+            controls_param_name="ds_gene_ids",
+            name="Batch",
+        ),
+        organism_param_name="organism",
+        target_organisms=[BatchOrganismTarget(organism=o) for o in organisms],
+    )
+
+
+async def _start_and_run(
+    batch: BatchExperimentConfig,
+    run_experiment: Callable[..., Awaitable[Experiment]],
+) -> list[tuple[str, JSONObject]]:
+    """Start a batch with I/O patched out, run it and return emitted events."""
+    events: list[tuple[str, JSONObject]] = []
+    spawned: list[Coroutine[Any, Any, None]] = []
+
+    async def _emit(_op: str, event_type: str, data: JSONObject) -> None:
+        events.append((event_type, data))
+
+    async def _run_admitted(
+        _kind: str, run: Callable[[], Awaitable[None]], **_: object
+    ) -> None:
+        await run()
+
+    with (
+        patch(f"{_STREAMING}._register_experiment_operation", AsyncMock()),
+        patch(f"{_STREAMING}._finalize_operation", AsyncMock()),
+        patch(f"{_STREAMING}._emit_to_redis", _emit),
+        patch(f"{_STREAMING}.run_admitted", _run_admitted),
+        patch(f"{_STREAMING}.run_experiment", run_experiment),
+        patch(f"{_STREAMING}.spawn", spawned.append),
+        patch(
+            "veupath_chatbot.services.experiment.store.get_experiment_store",
+            return_value=MagicMock(),
+        ),
+    ):
+        await streaming.start_batch_experiment(batch)
+        await spawned[0]
+    return events
+
+
+class TestConcurrentBatch:
+    @pytest.mark.asyncio
+    async def test_organisms_run_concurrently_within_site_budget(self) -> None:
+        running = 0
+        peak = 0
+
+        async def _run_experiment(
+            config: ExperimentConfig, *, progress_callback: Any, **_: object
+        ) -> Experiment:
+            nonlocal running, peak
+            assert current_shared_lookups() is not None
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            await progress_callback(
+                {"type": "experiment_progress", "data": {"phase": "completed"}}
+            )
+            return Experiment(id=config.name, config=config, status="completed")
+
+        settings = MagicMock(admission_max_runs_per_site=2)
+        with patch(
+            "veupath_chatbot.platform.admission.get_settings", return_value=settings
+        ):
+            events = await _start_and_run(
+                _batch(["P. falciparum", "P. vivax", "P. berghei", "P. yoelii"]),
+                _run_experiment,
+            )
+
+        assert peak == 2
+        event_type, data = events[-1]
+        assert event_type == "batch_complete"
+        experiments = data["experiments"]
+        assert isinstance(experiments, list)
+        assert len(experiments) == 4
+
+    @pytest.mark.asyncio
+    async def test_progress_tagged_with_organism_and_batch_counts(self) -> None:
+        async def _run_experiment(
+            config: ExperimentConfig, *, progress_callback: Any, **_: object
+        ) -> Experiment:
+            organism = config.parameters["organism"]
+            await progress_callback(
+                {"type": "experiment_progress", "data": {"phase": "started"}}
+            )
+            if organism == "P. vivax":
+                raise RuntimeError("WDK down")
+            await progress_callback(
+                {"type": "experiment_progress", "data": {"phase": "completed"}}
+            )
+            return Experiment(id=str(organism), config=config, status="completed")
+
+        events = await _start_and_run(
+            _batch(["P. falciparum", "P. vivax"]), _run_experiment
+        )
+
+        progress = [d for t, d in events if t == "experiment_progress"]
+        assert {d["organism"] for d in progress} == {"P. falciparum", "P. vivax"}
+        terminal = [d for d in progress if d["phase"] in ("completed", "error")]
+        assert len(terminal) == 2
+        assert terminal[-1]["batchProgress"] == {
+            "completed": 1,
+            "failed": 1,
+            "total": 2,
+        }
+        failed = next(d for d in terminal if d["organism"] == "P. vivax")
+        assert failed["error"] == "WDK down"
+
+        event_type, data = events[-1]
+        assert event_type == "batch_complete"
+        assert [e["id"] for e in data["experiments"]] == ["P. falciparum"]  # type: ignore[index, union-attr]
+
+
+class TestBatchAdmission:
+    @pytest.mark.asyncio
+    async def test_queue_timeout_reports_and_finalizes_operation(self) -> None:
+        events: list[tuple[str, JSONObject]] = []
+        spawned: list[Coroutine[Any, Any, None]] = []
+        run_experiment = AsyncMock()
+        finalize = AsyncMock()
+
+        async def _emit(_op: str, event_type: str, data: JSONObject) -> None:
+            events.append((event_type, data))
+
+        async def _run_admitted(
+            _kind: str,
+            _run: Callable[[], Awaitable[None]],
+            *,
+            on_queued: Callable[[], Awaitable[None]],
+            **_: object,
+        ) -> None:
+            await on_queued()
+            raise ServiceBusyError(detail="Timed out waiting to start batch.")
+
+        with (
+            patch(f"{_STREAMING}._register_experiment_operation", AsyncMock()),
+            patch(f"{_STREAMING}._finalize_operation", finalize),
+            patch(f"{_STREAMING}._emit_to_redis", _emit),
+            patch(f"{_STREAMING}.run_admitted", _run_admitted),
+            patch(f"{_STREAMING}.run_experiment", run_experiment),
+            patch(f"{_STREAMING}.spawn", spawned.append),
+        ):
+            operation_id = await streaming.start_batch_experiment(_batch(["A"]))
+            await spawned[0]
+
+        assert [t for t, _ in events] == ["experiment_progress", "batch_error"]
+        assert events[0][1]["phase"] == "queued"
+        run_experiment.assert_not_called()
+        finalize.assert_awaited_once_with(operation_id, failed=True)
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_queued_finalizes_operation(self) -> None:
+        spawned: list[Coroutine[Any, Any, None]] = []
+        finalize = AsyncMock()
+
+        async def _run_admitted(*_: object, **__: object) -> None:
+            await asyncio.Event().wait()
+
+        with (
+            patch(f"{_STREAMING}._register_experiment_operation", AsyncMock()),
+            patch(f"{_STREAMING}._finalize_operation", finalize),
+            patch(f"{_STREAMING}.run_admitted", _run_admitted),
+            patch(f"{_STREAMING}.spawn", spawned.append),
+        ):
+            operation_id = await streaming.start_batch_experiment(_batch(["A"]))
+            task = asyncio.ensure_future(spawned[0])
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        finalize.assert_awaited_once_with(operation_id, failed=True)
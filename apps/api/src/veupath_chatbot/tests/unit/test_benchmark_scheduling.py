@@ -0,0 +1,277 @@
+"""Tests for bounded, checkpointed benchmark runs."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+import veupath_chatbot.platform.redis as redis_module
+from veupath_chatbot.platform.errors import ConflictError, NotFoundError
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.experiment.core import streaming
+from veupath_chatbot.services.experiment.core.streaming import BenchmarkControlSet
+from veupath_chatbot.services.experiment.types import Experiment, ExperimentConfig
+
+_STREAMING = "veupath_chatbot.services.experiment.core.streaming"
+
+RunExperiment = Callable[..., Awaitable[Experiment]]
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeAsyncRedis:
+    fake = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(redis_module, "_redis", fake)
+    return fake
+
+
+def _config() -> ExperimentConfig:
+    return ExperimentConfig(
+        site_id="plasmodb",
+        record_type="gene",
+        search_name="GenesByTaxon",
+        parameters={"organism": "P. falciparum"},
+        positive_controls=[],
+        negative_controls=[],
+        controls_search_name="GeneByLocusTag",
+        controls_param_name="ds_gene_ids",
+        name="Bench",
+    )
+
+
+def _control_sets(labels: list[str]) -> list[BenchmarkControlSet]:
+    return [
+        (label, [f"{label}_pos"], [f"{label}_neg"], None, i == len(labels) - 1)
+        for i, label in enumerate(labels)
+    ]
+
+
+def _completing(started: list[str] | None = None) -> RunExperiment:
+    async def _run_experiment(
+        config: ExperimentConfig, *, progress_callback: Any, **_: object
+    ) -> Experiment:
+        if started is not None:
+            started.append(config.name)
+        await asyncio.sleep(0)
+        await progress_callback(
+            {"type": "experiment_progress", "data": {"phase": "completed"}}
+        )
+        return Experiment(id=config.name, config=config, status="completed")
+
+    return _run_experiment
+
+
+async def _run(
+    launch: Callable[[], Awaitable[str]],
+    run_experiment: RunExperiment,
+    *,
+    store: MagicMock | None = None,
+    max_concurrent: int = 2,
+) -> list[tuple[str, JSONObject]]:
+    """Launch a benchmark with I/O patched out, run it and return its events."""
+    events: list[tuple[str, JSONObject]] = []
+    spawned: list[Coroutine[Any, Any, None]] = []
+
+    async def _emit(_op: str, event_type: str, data: JSONObject) -> None:
+        events.append((event_type, data))
+
+    async def _run_admitted(
+        _kind: str, run: Callable[[], Awaitable[None]], **_: object
+    ) -> None:
+        await run()
+
+    settings = MagicMock(
+        benchmark_max_concurrent_runs=max_concurrent,
+        benchmark_checkpoint_ttl_seconds=60,
+        admission_max_runs_per_site=4,
+    )
+    with (
+        patch(f"{_STREAMING}._register_experiment_operation", AsyncMock()),
+        patch(f"{_STREAMING}._finalize_operation", AsyncMock()),
+        patch(f"{_STREAMING}._emit_to_redis", _emit),
+        patch(f"{_STREAMING}.run_admitted", _run_admitted),
+        patch(f"{_STREAMING}.run_experiment", run_experiment),
+        patch(f"{_STREAMING}.spawn", spawned.append),
+        patch(f"{_STREAMING}.get_settings", return_value=settings),
+        patch("veupath_chatbot.platform.admission.get_settings", return_value=settings),
+        patch(
+            "veupath_chatbot.services.experiment.store.get_experiment_store",
+            return_value=store or MagicMock(),
+        ),
+    ):
+        await launch()
+        await spawned[0]
+    return events
+
+
+class TestBenchmarkScheduling:
+    async def test_runs_are_bounded_and_primary_goes_first(self) -> None:
+        running = 0
+        peak = 0
+        started: list[str] = []
+
+        async def _run_experiment(
+            config: ExperimentConfig, *, progress_callback: Any, **_: object
+        ) -> Experiment:
+            nonlocal running, peak
+            started.append(config.name)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Experiment(id=config.name, config=config, status="completed")
+
+        events = await _run(
+            lambda: streaming.start_benchmark(
+                _config(), _control_sets(["a", "b", "c", "d", "e"])
+            ),
+            _run_experiment,
+        )
+
+        assert peak == 2
+        assert started[0] == "Bench [e]"
+        event_type, data = events[-1]
+        assert event_type == "benchmark_complete"
+        labels = [e["controlSetLabel"] for e in data["experiments"]]  # type: ignore[index, union-attr]
+        assert labels == ["e", "a", "b", "c", "d"]
+
+    async def test_progress_tagged_with_label_and_counts(self) -> None:
+        async def _run_experiment(
+            config: ExperimentConfig, *, progress_callback: Any, **_: object
+        ) -> Experiment:
+            if config.name == "Bench [bad]":
+                raise RuntimeError("WDK down")
+            return await _completing()(config, progress_callback=progress_callback)
+
+        events = await _run(
+            lambda: streaming.start_benchmark(_config(), _control_sets(["bad", "ok"])),
+            _run_experiment,
+            max_concurrent=1,
+        )
+
+        progress = [d for t, d in events if t == "experiment_progress"]
+        assert [d["controlSetLabel"] for d in progress] == ["ok", "bad"]
+        assert progress[-1]["error"] == "WDK down"
+        assert progress[-1]["batchProgress"] == {
+            "completed": 1,
+            "failed": 1,
+            "total": 2,
+        }
+
+
+class TestBenchmarkResume:
+    async def test_resume_reruns_only_unfinished_control_sets(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _run(
+            lambda: streaming.start_benchmark(
+                _config(), _control_sets(["a", "b", "c"]), user_id="u1"
+            ),
+            _completing(),
+        )
+        benchmark_id = next(
+            key.decode().split(":")[1] for key in await redis.keys("benchmark:*")
+        )
+        done = Experiment(id="a", config=_config(), status="completed")
+        done.benchmark_id = benchmark_id
+        done.control_set_label = "a"
+        failed = Experiment(id="b", config=_config(), status="error")
+        failed.control_set_label = "b"
+        store = MagicMock()
+        store.alist_by_benchmark = AsyncMock(return_value=[done, failed])
+        started: list[str] = []
+
+        events = await _run(
+            lambda: streaming.resume_benchmark(benchmark_id, user_id="u1"),
+            _completing(started),
+            store=store,
+        )
+
+        assert sorted(started) == ["Bench [b]", "Bench [c]"]
+        progress = [d for t, d in events if t == "experiment_progress"]
+        assert progress[-1]["batchProgress"] == {
+            "completed": 3,
+            "failed": 0,
+            "total": 3,
+        }
+        event_type, data = events[-1]
+        assert event_type == "benchmark_complete"
+        assert data["benchmarkId"] == benchmark_id
+        assert [e["id"] for e in data["experiments"]] == [  # type: ignore[index, union-attr]
+            "Bench [c]",
+            "a",
+            "Bench [b]",
+        ]
+
+    @pytest.mark.usefixtures("redis")
+    async def test_resume_requires_owner_and_checkpoint(self) -> None:
+        await _run(
+            lambda: streaming.start_benchmark(
+                _config(), _control_sets(["a"]), user_id="u1"
+            ),
+            _completing(),
+        )
+        keys = await redis_module.get_redis().keys("benchmark:*")
+        benchmark_id = keys[0].decode().split(":")[1]
+
+        with pytest.raises(NotFoundError):
+            await streaming.resume_benchmark(benchmark_id, user_id="u2")
+        with pytest.raises(NotFoundError):
+            await streaming.resume_benchmark("bench_missing", user_id="u1")
+
+    async def test_resume_rejected_while_benchmark_runs(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _run(
+            lambda: streaming.start_benchmark(
+                _config(), _control_sets(["a"]), user_id="u1"
+            ),
+            _completing(),
+        )
+        keys = await redis.keys("benchmark:*:plan")
+        benchmark_id = keys[0].decode().split(":")[1]
+        await redis.set(f"benchmark:{benchmark_id}:run", "op_live")
+        finalize = AsyncMock()
+        store = MagicMock(alist_by_benchmark=AsyncMock(return_value=[]))
+
+        with (
+            patch(f"{_STREAMING}._register_experiment_operation", AsyncMock()),
+            patch(f"{_STREAMING}._finalize_operation", finalize),
+            patch(f"{_STREAMING}._operation_active", AsyncMock(return_value=True)),
+            patch(
+                "veupath_chatbot.services.experiment.store.get_experiment_store",
+                return_value=store,
+            ),
+            pytest.raises(ConflictError),
+        ):
+            await streaming.resume_benchmark(benchmark_id, user_id="u1")
+
+        assert finalize.await_args is not None
+        assert finalize.await_args.kwargs == {"failed": True}
+        assert await redis.get(f"benchmark:{benchmark_id}:run") == b"op_live"
+
+    async def test_resume_takes_over_claim_of_ended_operation(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _run(
+            lambda: streaming.start_benchmark(
+                _config(), _control_sets(["a"]), user_id="u1"
+            ),
+            _completing(),
+        )
+        keys = await redis.keys("benchmark:*:plan")
+        benchmark_id = keys[0].decode().split(":")[1]
+        await redis.set(f"benchmark:{benchmark_id}:run", "op_dead")
+        store = MagicMock(alist_by_benchmark=AsyncMock(return_value=[]))
+
+        with patch(f"{_STREAMING}._operation_active", AsyncMock(return_value=False)):
+            events = await _run(
+                lambda: streaming.resume_benchmark(benchmark_id, user_id="u1"),
+                _completing(),
+                store=store,
+            )
+
+        assert events[-1][0] == "benchmark_complete"
+        assert await redis.exists(f"benchmark:{benchmark_id}:run") == 0
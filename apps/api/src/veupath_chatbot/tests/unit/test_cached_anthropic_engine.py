@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 from veupath_chatbot.ai.engines.cached_anthropic import CachedAnthropicEngine
+from veupath_chatbot.ai.engines.prompt_cache import PROMPT_CACHE_BOUNDARY
 
 _TRANSLATED: list[dict] = [{"role": "user", "content": "hello"}]
 
@@ -103,3 +104,85 @@ class TestSystemPromptCaching:
         assert kwargs["max_tokens"] == 1024
         assert kwargs["temperature"] == 0.7
         assert isinstance(kwargs["system"], list)
+
+
+class TestDynamicSystemContext:
+    """Per-turn context after the cache boundary gets its own un-cached block."""
+
+    def test_splits_static_and_dynamic_blocks(self):
+        parent_kwargs = {
+            "system": "Static prompt" + PROMPT_CACHE_BOUNDARY + "## Selected Nodes",
+        }
+        with patch.object(
+            CachedAnthropicEngine.__mro__[1],
+            "_prepare_request",
+            return_value=(parent_kwargs, _TRANSLATED),
+        ):
+            kwargs, _ = CachedAnthropicEngine._prepare_request([], [])
+
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "Static prompt",
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": "## Selected Nodes"},
+        ]
+
+
+class TestConversationBreakpoint:
+    """The newest message carries a breakpoint once there is history."""
+
+    def test_marks_last_string_message(self):
+        translated = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hi"},
+            {"role": "user", "content": "find kinases"},
+        ]
+        with patch.object(
+            CachedAnthropicEngine.__mro__[1],
+            "_prepare_request",
+            return_value=({"system": "s"}, translated),
+        ):
+            _, out = CachedAnthropicEngine._prepare_request([], [])
+
+        assert out[:2] == translated[:2]
+        assert out[-1]["content"] == [
+            {
+                "type": "text",
+                "text": "find kinases",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        # The parent's list is left untouched.
+        assert translated[-1]["content"] == "find kinases"
+
+    def test_marks_last_tool_result_block(self):
+        result_block = {"type": "tool_result", "tool_use_id": "t1", "content": "ok"}
+        translated = [
+            {"role": "user", "content": "hello"},
+            {"role": "user", "content": [result_block]},
+        ]
+        with patch.object(
+            CachedAnthropicEngine.__mro__[1],
+            "_prepare_request",
+            return_value=({}, translated),
+        ):
+            _, out = CachedAnthropicEngine._prepare_request([], [])
+
+        assert out[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in result_block
+
+    def test_skips_thinking_blocks(self):
+        translated = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": [{"type": "thinking", "thinking": "…"}]},
+        ]
+        with patch.object(
+            CachedAnthropicEngine.__mro__[1],
+            "_prepare_request",
+            return_value=({}, translated),
+        ):
+            _, out = CachedAnthropicEngine._prepare_request([], [])
+
+        assert out is translated
@@ -1,7 +1,27 @@
-"""Unit tests for services.chat.mention_context — pure helpers."""
+"""Unit tests for services.chat.mention_context."""
 
-from veupath_chatbot.services.chat.mention_context import _format_metrics, _truncate
-from veupath_chatbot.services.experiment.types import ConfusionMatrix, ExperimentMetrics
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from veupath_chatbot.services.chat.mention_context import (
+    _format_metrics,
+    _truncate,
+    build_mention_context,
+)
+from veupath_chatbot.services.experiment.types import (
+    ConfusionMatrix,
+    Experiment,
+    ExperimentConfig,
+    ExperimentMetrics,
+)
+
+_MODULE = "veupath_chatbot.services.chat.mention_context"
 
 
 class TestTruncate:
@@ -129,3 +149,199 @@ class TestFormatMetrics:
         # Table should have multiple lines
         lines = result.strip().split("\n")
         assert len(lines) >= 8  # header + separator + 7 data rows
+
+
+def _make_projection(stream_id: UUID, name: str = "Kinases") -> SimpleNamespace:
+    return SimpleNamespace(
+        stream_id=stream_id,
+        name=name,
+        record_type="transcript",
+        steps=[{"id": "s1", "searchName": "GenesByTaxon", "resultCount": 12}],
+        plan={},
+        updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+        last_event_id="1-0",
+    )
+
+
+def _make_experiment(exp_id: str = "exp-1") -> Experiment:
+    return Experiment(
+        id=exp_id,
+        config=ExperimentConfig(
+            site_id="plasmodb",
+            record_type="gene",
+            search_name="GenesByTextSearch",
+            parameters={},
+            positive_controls=["g1"],
+            negative_controls=["n1"],
+            controls_search_name="GeneByLocusTag",
+            controls_param_name="single_gene_id",
+            name="Kinase recall",
+        ),
+    )
+
+
+@pytest.fixture
+def budget() -> Iterator[MagicMock]:
+    settings = MagicMock(chat_mention_timeout_seconds=1.0)
+    with patch(f"{_MODULE}.get_settings", return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def load_projections() -> Iterator[AsyncMock]:
+    with patch(f"{_MODULE}._load_projections", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def store() -> Iterator[MagicMock]:
+    store = MagicMock()
+    store.aget = AsyncMock(return_value=_make_experiment())
+    with patch(f"{_MODULE}.get_experiment_store", return_value=store):
+        yield store
+
+
+@pytest.mark.usefixtures("budget")
+class TestBuildMentionContext:
+    async def test_lookups_run_concurrently(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        sid = uuid4()
+        both_started = asyncio.Barrier(2)
+
+        async def projections(ids: set[UUID]) -> dict[UUID, SimpleNamespace]:
+            await both_started.wait()
+            return {sid: _make_projection(sid)}
+
+        async def experiment(exp_id: str) -> Experiment:
+            await both_started.wait()
+            return _make_experiment(exp_id)
+
+        load_projections.side_effect = projections
+        store.aget.side_effect = experiment
+
+        context = await build_mention_context(
+            [
+                {"type": "strategy", "id": str(sid)},
+                {"type": "experiment", "id": "exp-1"},
+            ]
+        )
+
+        assert '## Referenced Strategy: "Kinases"' in context
+        assert "- Result count: 12" in context
+        assert '## Referenced Experiment: "Kinase recall"' in context
+
+    async def test_slow_lookup_falls_back_to_summary(
+        self, budget: MagicMock, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        budget.chat_mention_timeout_seconds = 0.01
+        sid = uuid4()
+        load_projections.return_value = {sid: _make_projection(sid)}
+
+        async def slow(exp_id: str) -> Experiment:
+            await asyncio.sleep(1)
+            return _make_experiment(exp_id)
+
+        store.aget.side_effect = slow
+
+        context = await build_mention_context(
+            [
+                {"type": "strategy", "id": str(sid)},
+                {"type": "experiment", "id": "exp-1", "displayName": "My run"},
+            ]
+        )
+
+        assert '## Referenced Strategy: "Kinases"' in context
+        assert '## Referenced Experiment: "My run"\n- **ID**: exp-1' in context
+        assert "could not be loaded in time" in context
+
+    async def test_failed_lookup_falls_back_to_summary(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        sid = uuid4()
+        load_projections.side_effect = RuntimeError("db down")
+
+        context = await build_mention_context(
+            [{"type": "strategy", "id": str(sid), "displayName": "Saved"}]
+        )
+
+        assert context.startswith('## Referenced Strategy: "Saved"')
+        store.aget.assert_not_awaited()
+
+    async def test_missing_and_invalid_mentions_are_skipped(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        load_projections.return_value = {}
+        store.aget.return_value = None
+        sid = uuid4()
+
+        context = await build_mention_context(
+            [
+                {"type": "strategy", "id": "not-a-uuid"},
+                {"type": "strategy", "id": str(sid)},
+                {"type": "experiment", "id": "gone"},
+                {"type": "step", "id": "s1"},
+            ]
+        )
+
+        assert context == ""
+        load_projections.assert_awaited_once_with({sid})
+
+    async def test_rendered_blocks_are_cached_per_version(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        sid = uuid4()
+        projection = _make_projection(sid)
+        load_projections.return_value = {sid: projection}
+        mentions = [{"type": "strategy", "id": str(sid)}]
+
+        with patch(f"{_MODULE}._format_strategy", return_value="block") as render:
+            await build_mention_context(mentions)
+            await build_mention_context(mentions)
+            assert render.call_count == 1
+
+            projection.last_event_id = "2-0"
+            await build_mention_context(mentions)
+            assert render.call_count == 2
+
+    async def test_experiment_reflects_metrics_replaced_in_place(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        experiment = _make_experiment()
+        store.aget.return_value = experiment
+        mentions = [{"type": "experiment", "id": "exp-1"}]
+
+        def _metrics(sensitivity: float) -> ExperimentMetrics:
+            return ExperimentMetrics(
+                confusion_matrix=ConfusionMatrix(
+                    true_positives=1,
+                    false_positives=0,
+                    true_negatives=1,
+                    false_negatives=1,
+                ),
+                sensitivity=sensitivity,
+                specificity=1.0,
+                precision=1.0,
+                f1_score=0.5,
+                mcc=0.5,
+                balanced_accuracy=0.75,
+            )
+
+        experiment.metrics = _metrics(0.5)
+        first = await build_mention_context(mentions)
+        # Re-evaluation swaps the metrics without touching any other field.
+        experiment.metrics = _metrics(0.9)
+        second = await build_mention_context(mentions)
+
+        assert "| Sensitivity | 0.5000 |" in first
+        assert "| Sensitivity | 0.9000 |" in second
+
+    async def test_duplicate_mentions_render_once(
+        self, load_projections: AsyncMock, store: MagicMock
+    ) -> None:
+        mention = {"type": "experiment", "id": "exp-1"}
+
+        context = await build_mention_context([mention, mention])
+
+        assert context.count("## Referenced Experiment") == 1
+        store.aget.assert_awaited_once_with("exp-1")
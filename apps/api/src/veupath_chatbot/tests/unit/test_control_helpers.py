@@ -1,12 +1,17 @@
 """Tests for control_helpers module."""
 
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+import fakeredis
+import pytest
+
+import veupath_chatbot.platform.redis as redis_module
+from veupath_chatbot.domain.strategy.ast import StepTreeNode
 from veupath_chatbot.services.control_helpers import (
     _encode_id_list,
     _get_total_count_for_step,
-    cleanup_internal_control_test_strategies,
+    create_temp_strategy,
     delete_temp_strategy,
 )
 from veupath_chatbot.services.wdk.helpers import extract_record_ids
@@ -144,74 +149,64 @@ class TestGetTotalCountForStep:
 
 
 # ---------------------------------------------------------------------------
-# cleanup_internal_control_test_strategies
+# create_temp_strategy / temp-strategy ledger
 # ---------------------------------------------------------------------------
 
 
-class TestCleanupInternalControlTestStrategies:
-    async def test_deletes_pathfinder_control_test_strategies(self) -> None:
-        api = AsyncMock()
-        items = [
-            {
-                "name": "__pathfinder_internal__:Pathfinder control test A",
-                "strategyId": 100,
-            },
-            {
-                "name": "__pathfinder_internal__:Pathfinder control test B",
-                "strategyId": 200,
-            },
-        ]
-        await cleanup_internal_control_test_strategies(api, items)
-        assert api.delete_strategy.call_count == 2
-        api.delete_strategy.assert_any_call(100)
-        api.delete_strategy.assert_any_call(200)
-
-    async def test_skips_non_control_test_strategies(self) -> None:
-        api = AsyncMock()
-        items = [
-            {"name": "__pathfinder_internal__:Some other name", "strategyId": 100},
-            {"name": "User strategy", "strategyId": 200},
-        ]
-        await cleanup_internal_control_test_strategies(api, items)
-        api.delete_strategy.assert_not_called()
-
-    async def test_skips_non_internal_strategies(self) -> None:
-        api = AsyncMock()
-        items = [
-            {"name": "Pathfinder control test A", "strategyId": 100},
-        ]
-        await cleanup_internal_control_test_strategies(api, items)
-        api.delete_strategy.assert_not_called()
-
-    async def test_handles_non_list(self) -> None:
-        api = AsyncMock()
-        await cleanup_internal_control_test_strategies(api, "not a list")
-        api.delete_strategy.assert_not_called()
-
-    async def test_handles_non_dict_items(self) -> None:
-        api = AsyncMock()
-        await cleanup_internal_control_test_strategies(api, [None, "str", 42])
-        api.delete_strategy.assert_not_called()
-
-    async def test_swallows_delete_errors(self) -> None:
-        api = AsyncMock()
-        api.delete_strategy.side_effect = RuntimeError("WDK error")
-        items = [
-            {
-                "name": "__pathfinder_internal__:Pathfinder control test A",
-                "strategyId": 100,
-            },
-        ]
-        # Should not raise
-        await cleanup_internal_control_test_strategies(api, items)
+class TestTempStrategyLedger:
+    @pytest.fixture
+    def redis(self, monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeAsyncRedis:
+        fake = fakeredis.FakeAsyncRedis()
+        monkeypatch.setattr(redis_module, "_redis", fake)
+        return fake
 
-    async def test_skips_non_int_strategy_id(self) -> None:
+    @staticmethod
+    def _api() -> AsyncMock:
         api = AsyncMock()
-        items = [
-            {
-                "name": "__pathfinder_internal__:Pathfinder control test A",
-                "strategyId": "not_int",
-            },
-        ]
-        await cleanup_internal_control_test_strategies(api, items)
-        api.delete_strategy.assert_not_called()
+        api.client = MagicMock(base_url="https://plasmodb.org/plasmo/service")
+        api.create_strategy.return_value = {"id": 300}
+        return api
+
+    async def test_create_records_and_delete_forgets(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        api = self._api()
+        tree = StepTreeNode(3, primary_input=StepTreeNode(1))
+
+        strategy_id = await create_temp_strategy(api, step_tree=tree, name="T")
+
+        assert strategy_id == 300
+        assert api.create_strategy.await_args.kwargs["is_internal"] is True
+        raw = await redis.hget(
+            "wdk_temp:entries", "https://plasmodb.org/plasmo/service|300"
+        )
+        assert raw is not None
+        assert json.loads(raw)["step_ids"] == [3, 1]
+
+        await delete_temp_strategy(api, strategy_id)
+        assert await redis.hlen("wdk_temp:entries") == 0
+        assert await redis.zcard("wdk_temp:expiry") == 0
+
+    async def test_failed_delete_stays_recorded(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        api = self._api()
+        api.delete_strategy.side_effect = RuntimeError("WDK down")
+        strategy_id = await create_temp_strategy(
+            api, step_tree=StepTreeNode(1), name="T"
+        )
+
+        await delete_temp_strategy(api, strategy_id)
+
+        assert await redis.zcard("wdk_temp:expiry") == 1
+
+    async def test_without_redis_nothing_is_recorded(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redis_module, "_redis", None)
+        api = self._api()
+        assert (
+            await create_temp_strategy(api, step_tree=StepTreeNode(1), name="T") == 300
+        )
+        await delete_temp_strategy(api, 300)
+        api.delete_strategy.assert_awaited_once_with(300)
@@ -10,8 +10,10 @@ All WDK calls are mocked. These tests validate:
 - _encode_id_list formats correctly
 - run_positive_negative_controls composes results
 - dataset creation path for input-dataset params
+- local intersection mode and its WDK-combine fallbacks
 """
 
+import asyncio
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -434,8 +436,8 @@ class TestRunIntersectionControl:
             controls_extra_parameters=None,
         )
 
-        # _run_intersection_control only cleans up its own temp strategy.
-        # Stale cleanup happens in run_positive_negative_controls (higher-level).
+        # _run_intersection_control only cleans up its own temp strategy;
+        # leaked ones are left to the temp-strategy reaper.
         assert api.delete_strategy.await_count == 1
 
     @pytest.mark.asyncio
@@ -784,3 +786,170 @@ class TestRunPositiveNegativeControls:
         assert isinstance(target, dict)
         assert target["stepId"] == 77
         assert target["resultCount"] == 42
+
+
+def _records(ids: list[str]) -> JSONObject:
+    return {
+        "meta": {"totalCount": len(ids)},
+        "records": [{"id": [{"name": "source_id", "value": i}]} for i in ids],
+    }
+
+
+def _make_local_api(
+    target_ids: list[str], resolved_controls: dict[str, list[str]]
+) -> AsyncMock:
+    """Mock API whose steps answer with fixed ID lists.
+
+    The target step returns *target_ids*; a controls step returns the
+    canonical IDs that *resolved_controls* maps its first input ID to.
+    """
+    api = _make_mock_api(search_details={"searchData": {"parameters": []}})
+    answers: dict[int, list[str]] = {}
+
+    async def _create_step(**kwargs: Any) -> JSONObject:
+        step_id = len(answers) + 10
+        if kwargs["custom_name"] == "Target":
+            answers[step_id] = target_ids
+        else:
+            first = str(kwargs["parameters"]["ds_gene_ids"]).split("\n")[0]
+            answers[step_id] = resolved_controls.get(first, [])
+        return {"id": step_id}
+
+    async def _count(step_id: int) -> int:
+        return len(answers.get(step_id, []))
+
+    async def _answer(step_id: int, **_: Any) -> JSONObject:
+        return _records(answers.get(step_id, []))
+
+    api.create_step = AsyncMock(side_effect=_create_step)
+    api.get_step_count = AsyncMock(side_effect=_count)
+    api.get_step_answer = AsyncMock(side_effect=_answer)
+    return api
+
+
+_LOCAL_KWARGS: dict[str, Any] = {
+    "site_id": "plasmodb",
+    "record_type": "transcript",
+    "target_search_name": "GenesByRNASeq",
+    "target_parameters": {"fold_change": "2"},
+    "controls_search_name": "GeneByLocusTag",
+    "controls_param_name": "ds_gene_ids",
+    "local_intersection": True,
+}
+
+
+@patch(
+    "veupath_chatbot.services.catalog.searches.find_record_type_for_search",
+    AsyncMock(side_effect=lambda _site, rt, _search: rt),
+)
+class TestLocalIntersection:
+    @pytest.mark.asyncio
+    @patch("veupath_chatbot.services.control_tests.get_strategy_api")
+    async def test_intersects_in_process(self, mock_get_api: MagicMock) -> None:
+        api = _make_local_api(
+            ["T1", "T2", "T3", "T4"],
+            {"POS1": ["T1", "T2", "X9"], "NEG1": ["T4"]},
+        )
+        mock_get_api.return_value = api
+
+        result = await run_positive_negative_controls(
+            **_LOCAL_KWARGS,
+            positive_controls=["POS1", "POS2"],
+            negative_controls=["NEG1"],
+        )
+
+        positive = result["positive"]
+        assert isinstance(positive, dict)
+        assert positive["intersectionCount"] == 2
+        assert positive["intersectionIds"] == ["T1", "T2"]
+        assert positive["recall"] == 1.0
+        negative = result["negative"]
+        assert isinstance(negative, dict)
+        assert negative["intersectionCount"] == 1
+        assert negative["falsePositiveRate"] == 1.0
+        target = result["target"]
+        assert isinstance(target, dict)
+        assert target["resultCount"] == 4
+        assert target["stepId"] is None
+        api.create_combined_step.assert_not_awaited()
+        # One target fetch plus one controls resolution per set.
+        assert api.create_step.await_count == 3
+        assert api.delete_strategy.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch("veupath_chatbot.services.control_tests.get_strategy_api")
+    async def test_repeat_configuration_uses_cache(
+        self, mock_get_api: MagicMock
+    ) -> None:
+        api = _make_local_api(["T1", "T2"], {"POS1": ["T1"], "POS2": ["T2"]})
+        mock_get_api.return_value = api
+
+        await run_positive_negative_controls(
+            **_LOCAL_KWARGS, positive_controls=["POS1"]
+        )
+        result = await run_positive_negative_controls(
+            **_LOCAL_KWARGS, positive_controls=["POS2"]
+        )
+        await run_positive_negative_controls(
+            **_LOCAL_KWARGS, positive_controls=["POS1"]
+        )
+
+        positive = result["positive"]
+        assert isinstance(positive, dict)
+        assert positive["intersectionIds"] == ["T2"]
+        # Target once, each distinct control set once.
+        assert api.create_step.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch("veupath_chatbot.services.control_tests.get_strategy_api")
+    async def test_id_field_uses_wdk_combine(self, mock_get_api: MagicMock) -> None:
+        api = _make_mock_api()
+        mock_get_api.return_value = api
+
+        await run_positive_negative_controls(
+            **_LOCAL_KWARGS, positive_controls=["POS1"], id_field="gene_id"
+        )
+
+        api.create_combined_step.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("veupath_chatbot.services.control_tests.LOCAL_INTERSECTION_MAX_RESULTS", 1)
+    @patch("veupath_chatbot.services.control_tests.get_strategy_api")
+    async def test_large_target_falls_back_to_wdk_combine(
+        self, mock_get_api: MagicMock
+    ) -> None:
+        api = _make_local_api(["T1", "T2"], {"POS1": ["T1"]})
+        mock_get_api.return_value = api
+
+        result = await run_positive_negative_controls(
+            **_LOCAL_KWARGS, positive_controls=["POS1"]
+        )
+
+        api.create_combined_step.assert_awaited_once()
+        target = result["target"]
+        assert isinstance(target, dict)
+        assert target["stepId"] is not None
+
+    @pytest.mark.asyncio
+    @patch("veupath_chatbot.services.control_tests.get_strategy_api")
+    async def test_concurrent_runs_share_one_target_fetch(
+        self, mock_get_api: MagicMock
+    ) -> None:
+        api = _make_local_api(["T1", "T2"], {"POS1": ["T1"]})
+        mock_get_api.return_value = api
+
+        results = await asyncio.gather(
+            *(
+                run_positive_negative_controls(
+                    **_LOCAL_KWARGS, positive_controls=["POS1"]
+                )
+                for _ in range(3)
+            )
+        )
+
+        for result in results:
+            positive = result["positive"]
+            assert isinstance(positive, dict)
+            assert positive["intersectionIds"] == ["T1"]
+        # One target fetch plus one controls resolution, shared by all runs.
+        assert api.create_step.await_count == 2
@@ -6,7 +6,7 @@ Covers:
 - Control set has duplicates
 - _encode_id_list edge cases
 - extract_record_ids edge cases
-- _extract_intersection_data edge cases
+- extract_intersection_data edge cases
 - run_positive_negative_controls edge cases
 """
 
@@ -18,8 +18,8 @@ import pytest
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.control_helpers import _encode_id_list
 from veupath_chatbot.services.control_tests import (
-    _extract_intersection_data,
     _run_intersection_control,
+    extract_intersection_data,
     run_positive_negative_controls,
 )
 from veupath_chatbot.services.wdk.helpers import extract_record_ids
@@ -172,32 +172,32 @@ class TestExtractRecordIdsEdgeCases:
 
 
 # ---------------------------------------------------------------------------
-# _extract_intersection_data edge cases
+# extract_intersection_data edge cases
 # ---------------------------------------------------------------------------
 
 
 class TestExtractIntersectionDataEdgeCases:
     def test_empty_payload(self) -> None:
-        count, ids, has_ids = _extract_intersection_data({})
+        count, ids, has_ids = extract_intersection_data({})
         assert count == 0
         assert ids == set()
         assert has_ids is False
 
     def test_count_as_float(self) -> None:
         """intersectionCount as float should be converted to int."""
-        count, ids, has_ids = _extract_intersection_data({"intersectionCount": 5.7})
+        count, ids, has_ids = extract_intersection_data({"intersectionCount": 5.7})
         assert count == 5
 
     def test_count_as_string_fallback(self) -> None:
         """intersectionCount as string should default to 0."""
-        count, ids, has_ids = _extract_intersection_data(
+        count, ids, has_ids = extract_intersection_data(
             {"intersectionCount": "not_a_number"}
         )
         assert count == 0
 
     def test_intersection_ids_none(self) -> None:
         """intersectionIds=None should report has_ids=False."""
-        count, ids, has_ids = _extract_intersection_data(
+        count, ids, has_ids = extract_intersection_data(
             {"intersectionCount": 5, "intersectionIds": None}
         )
         assert count == 5
@@ -205,7 +205,7 @@ class TestExtractIntersectionDataEdgeCases:
 
     def test_intersection_ids_with_none_elements(self) -> None:
         """None elements in intersectionIds should be excluded from set."""
-        count, ids, has_ids = _extract_intersection_data(
+        count, ids, has_ids = extract_intersection_data(
             {"intersectionCount": 3, "intersectionIds": ["A", None, "B"]}
         )
         assert ids == {"A", "B"}
@@ -213,7 +213,7 @@ class TestExtractIntersectionDataEdgeCases:
 
     def test_intersection_ids_empty_list(self) -> None:
         """Empty intersectionIds list: has_ids=True but empty set."""
-        count, ids, has_ids = _extract_intersection_data(
+        count, ids, has_ids = extract_intersection_data(
             {"intersectionCount": 0, "intersectionIds": []}
         )
         assert ids == set()
@@ -265,7 +265,6 @@ class TestControlsOverlapWithTarget:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             positive_controls=pos_ids,
-            skip_cleanup=True,
         )
 
         pos_result = result.get("positive")
@@ -297,7 +296,6 @@ class TestEmptyControlSets:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             positive_controls=[],
-            skip_cleanup=True,
         )
 
         assert result["positive"] is None
@@ -318,7 +316,6 @@ class TestEmptyControlSets:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             negative_controls=[],
-            skip_cleanup=True,
         )
 
         assert result["negative"] is None
@@ -341,7 +338,6 @@ class TestEmptyControlSets:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             positive_controls=["  ", "\t", ""],
-            skip_cleanup=True,
         )
 
         # All filtered out -> no positives
@@ -387,7 +383,6 @@ class TestDuplicateControls:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             positive_controls=["G1", "G1", "G2"],
-            skip_cleanup=True,
         )
 
         pos = result.get("positive")
@@ -421,7 +416,6 @@ class TestDuplicateControls:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             negative_controls=["NEG1", "NEG1"],
-            skip_cleanup=True,
         )
 
         neg = result.get("negative")
@@ -464,7 +458,6 @@ class TestRecallAndFPR:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             positive_controls=["G1", "G2"],
-            skip_cleanup=True,
         )
 
         pos = result.get("positive")
@@ -500,7 +493,6 @@ class TestRecallAndFPR:
             controls_search_name="GeneByLocusTag",
             controls_param_name="ds_gene_ids",
             negative_controls=["NEG1", "NEG2"],
-            skip_cleanup=True,
         )
 
         neg = result.get("negative")
@@ -0,0 +1,137 @@
+"""Tests for assistant-delta coalescing in chat streaming and SSE delivery."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from kani.engines.base import Completion
+from kani.models import ChatMessage, ChatRole
+
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.chat.streaming import _DeltaCoalescer, stream_chat
+from veupath_chatbot.transport.http.routers.operations import _merge_deltas
+
+
+def _deltas(queue: asyncio.Queue[JSONObject]) -> list[str]:
+    out: list[str] = []
+    while not queue.empty():
+        event = queue.get_nowait()
+        assert event["type"] == "assistant_delta"
+        data = event["data"]
+        assert isinstance(data, dict)
+        out.append(str(data["delta"]))
+    return out
+
+
+class TestDeltaCoalescer:
+    async def test_first_token_is_sent_at_once(self) -> None:
+        queue: asyncio.Queue[JSONObject] = asyncio.Queue()
+        deltas = _DeltaCoalescer(queue, "m1", max_bytes=64, max_delay=10)
+
+        deltas.add("Hello")
+        deltas.add(" wor")
+        deltas.add("ld")
+
+        assert _deltas(queue) == ["Hello"]
+        deltas.flush()
+        assert _deltas(queue) == [" world"]
+
+    async def test_flushes_at_byte_limit(self) -> None:
+        queue: asyncio.Queue[JSONObject] = asyncio.Queue()
+        deltas = _DeltaCoalescer(queue, "m1", max_bytes=4, max_delay=10)
+
+        for token in ["a", "bc", "de", "f", "ghi"]:
+            deltas.add(token)
+
+        assert _deltas(queue) == ["a", "bcde", "fghi"]
+
+    async def test_flushes_after_delay(self) -> None:
+        queue: asyncio.Queue[JSONObject] = asyncio.Queue()
+        deltas = _DeltaCoalescer(queue, "m1", max_bytes=64, max_delay=0.01)
+
+        deltas.add("a")
+        deltas.add("b")
+        deltas.add("c")
+        assert _deltas(queue) == ["a"]
+
+        await asyncio.sleep(0.05)
+        assert _deltas(queue) == ["bc"]
+
+
+@pytest.fixture
+def settings() -> Iterator[MagicMock]:
+    settings = MagicMock(chat_delta_flush_bytes=16, chat_delta_flush_ms=10_000)
+    with patch(
+        "veupath_chatbot.services.chat.streaming.get_settings", return_value=settings
+    ):
+        yield settings
+
+
+def _make_agent(tokens: list[str]) -> MagicMock:
+    msg = ChatMessage.assistant("".join(tokens))
+    msg.extra = {}
+    stream = MagicMock()
+    stream.role = ChatRole.ASSISTANT
+
+    async def _tokens():
+        for token in tokens:
+            yield token
+
+    stream.__aiter__ = lambda self: _tokens()
+    stream.message = AsyncMock(return_value=msg)
+    stream.completion = AsyncMock(
+        return_value=Completion(message=msg, prompt_tokens=10, completion_tokens=5)
+    )
+
+    agent = MagicMock()
+    agent.functions = {}
+
+    async def _full_round_stream(message):
+        yield stream
+
+    agent.full_round_stream = _full_round_stream
+    return agent
+
+
+@pytest.mark.usefixtures("settings")
+class TestStreamChatDeltas:
+    async def test_tokens_are_merged_until_the_message_ends(self) -> None:
+        tokens = [f"tok{n} " for n in range(40)]
+
+        events = [e async for e in stream_chat(_make_agent(tokens), "hi")]
+
+        deltas = [e["data"]["delta"] for e in events if e["type"] == "assistant_delta"]
+        assert "".join(deltas) == "".join(tokens)
+        assert deltas[0] == "tok0 "
+        assert len(deltas) < len(tokens) // 2
+        types = [e["type"] for e in events]
+        assert types.index("assistant_message") > max(
+            i for i, t in enumerate(types) if t == "assistant_delta"
+        )
+
+
+class TestMergeDeltas:
+    def test_merges_runs_of_one_message(self) -> None:
+        events: list[tuple[str, str, JSONObject]] = [
+            ("1-0", "assistant_delta", {"messageId": "m1", "delta": "Hel"}),
+            ("2-0", "assistant_delta", {"messageId": "m1", "delta": "lo"}),
+            ("3-0", "tool_call_start", {"id": "t1"}),
+            ("4-0", "assistant_delta", {"messageId": "m1", "delta": "!"}),
+            ("5-0", "assistant_delta", {"messageId": "m2", "delta": "Hi"}),
+        ]
+
+        assert _merge_deltas(events) == [
+            ("2-0", "assistant_delta", {"messageId": "m1", "delta": "Hello"}),
+            ("3-0", "tool_call_start", {"id": "t1"}),
+            ("4-0", "assistant_delta", {"messageId": "m1", "delta": "!"}),
+            ("5-0", "assistant_delta", {"messageId": "m2", "delta": "Hi"}),
+        ]
+
+    def test_deltas_without_message_id_are_kept(self) -> None:
+        events: list[tuple[str, str, JSONObject]] = [
+            ("1-0", "assistant_delta", {"delta": "a"}),
+            ("2-0", "assistant_delta", {"delta": "b"}),
+        ]
+
+        assert _merge_deltas(events) == events
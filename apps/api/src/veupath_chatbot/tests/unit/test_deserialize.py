@@ -2,13 +2,17 @@
 
 import pytest
 
-from veupath_chatbot.services.experiment._deserialize import experiment_from_json
+from veupath_chatbot.services.experiment._deserialize import (
+    config_from_json,
+    experiment_from_json,
+)
 from veupath_chatbot.services.experiment.types import (
     EnrichmentResult,
     EnrichmentTerm,
     Experiment,
     ExperimentConfig,
     GeneInfo,
+    config_to_json,
     experiment_to_json,
 )
 
@@ -307,3 +311,27 @@ class TestRoundtrip:
         assert len(restored.enrichment_results) == 1
         assert restored.enrichment_results[0].analysis_type == "go_process"
         assert restored.enrichment_results[0].terms[0].term_id == "GO:001"
+
+    def test_config_roundtrip(self) -> None:
+        """A bare config (e.g. a benchmark checkpoint) survives the round trip."""
+        cfg = ExperimentConfig(
+            site_id="plasmo",
+            record_type="gene",
+            search_name="GenesByText",
+            parameters={"text": "kinase"},
+            positive_controls=["g1"],
+            negative_controls=["n1", "n2"],
+            controls_search_name="GeneByLocusTag",
+            controls_param_name="single_gene_id",
+            name="Benchmark",
+            control_set_id="cs-1",
+            sort_attribute="score",
+            sort_direction="DESC",
+        )
+
+        restored = config_from_json(config_to_json(cfg))
+
+        assert restored.parameters == {"text": "kinase"}
+        assert restored.negative_controls == ["n1", "n2"]
+        assert restored.control_set_id == "cs-1"
+        assert restored.sort_direction == "DESC"
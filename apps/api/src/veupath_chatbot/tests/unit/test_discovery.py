@@ -465,3 +465,36 @@ class TestDiscoveryService:
             await service.preload_all()
             # good_site should be loaded
             assert "good_site" in service._catalogs
+
+    @pytest.mark.asyncio
+    async def test_preload_all_loads_priority_sites_first(self) -> None:
+        loaded: list[str] = []
+
+        def _client_for(site_id: str) -> MagicMock:
+            async def _get_record_types(expanded: bool = False) -> list[Any]:
+                loaded.append(site_id)
+                return [{"urlSegment": "gene", "name": "Genes", "searches": []}]
+
+            client = MagicMock()
+            client.get_record_types = AsyncMock(side_effect=_get_record_types)
+            client.get_searches = AsyncMock(return_value=[])
+            return client
+
+        sites = []
+        for site_id in ("plasmodb", "toxodb", "veupathdb"):
+            site = MagicMock()
+            site.id = site_id
+            sites.append(site)
+
+        mock_router = MagicMock()
+        mock_router.list_sites.return_value = sites
+        mock_router.get_client.side_effect = _client_for
+
+        with patch(
+            "veupath_chatbot.integrations.veupathdb.discovery.get_site_router",
+            return_value=mock_router,
+        ):
+            service = DiscoveryService()
+            await service.preload_all(first=["veupathdb"], concurrency=1)
+
+        assert loaded == ["veupathdb", "plasmodb", "toxodb"]
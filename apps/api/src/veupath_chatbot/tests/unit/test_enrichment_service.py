@@ -5,7 +5,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from veupath_chatbot.services.experiment.types import EnrichmentResult
-from veupath_chatbot.services.wdk.enrichment_service import EnrichmentService
+from veupath_chatbot.services.wdk.enrichment_service import (
+    _FINGERPRINT_PAGE_SIZE,
+    EnrichmentService,
+)
 
 
 class TestRunOnStep:
@@ -196,3 +199,179 @@ class TestRunBatch:
             )
             assert results == []
             assert errors == []
+
+
+def _result(analysis_type: str, error: str | None = None) -> EnrichmentResult:
+    return EnrichmentResult(
+        analysis_type=analysis_type,
+        terms=[],
+        total_genes_analyzed=3,
+        background_size=100,
+        error=error,
+    )
+
+
+def _fingerprintable_api() -> MagicMock:
+    """Strategy API whose step answer can be fingerprinted."""
+    api = MagicMock()
+    api.get_step_answer = AsyncMock(
+        return_value={
+            "records": [
+                {"id": [{"name": "source_id", "value": g}]}
+                for g in ("PF3D7_0100100", "PF3D7_0100200", "PF3D7_0100300")
+            ]
+        }
+    )
+    return api
+
+
+class TestRunBatchCaching:
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self) -> None:
+        with (
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.get_strategy_api",
+                return_value=_fingerprintable_api(),
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.fetch_analysis_form",
+                new_callable=AsyncMock,
+                return_value={"searchData": {"parameters": []}},
+            ) as mock_form,
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service._execute_analysis",
+                new_callable=AsyncMock,
+                side_effect=[_result("go_process"), _result("pathway")],
+            ) as mock_exec,
+        ):
+            svc = EnrichmentService()
+            first, _ = await svc.run_batch(
+                site_id="plasmodb", step_id=42, analysis_types=["go_process"]
+            )
+            second, errors = await svc.run_batch(
+                site_id="plasmodb",
+                step_id=42,
+                analysis_types=["go_process", "pathway"],
+            )
+            # go_process came from the cache; only pathway hit WDK.
+            assert mock_exec.call_count == 2
+            assert [r.analysis_type for r in second] == ["go_process", "pathway"]
+            assert second[0] == first[0]
+            assert errors == []
+            assert mock_form.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_results_are_not_cached(self) -> None:
+        with (
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.get_strategy_api",
+                return_value=_fingerprintable_api(),
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.fetch_analysis_form",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service._execute_analysis",
+                new_callable=AsyncMock,
+                side_effect=[RuntimeError("WDK timeout"), _result("word")],
+            ) as mock_exec,
+        ):
+            svc = EnrichmentService()
+            _, errors = await svc.run_batch(
+                site_id="plasmodb", step_id=42, analysis_types=["word"]
+            )
+            assert len(errors) == 1
+            results, errors = await svc.run_batch(
+                site_id="plasmodb", step_id=42, analysis_types=["word"]
+            )
+            assert errors == []
+            assert results[0].error is None
+            assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gene_ids_cache_hit_skips_temp_strategy(self) -> None:
+        api = MagicMock()
+        api.create_step = AsyncMock(return_value={"id": 7})
+        api.create_strategy = AsyncMock(return_value={"id": 99})
+        with (
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.get_strategy_api",
+                return_value=api,
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.build_enrichment_params_from_gene_ids",
+                new_callable=AsyncMock,
+                return_value=("GeneByLocusTag", {"ds_gene_ids": "1"}, "transcript"),
+            ) as mock_dataset,
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.delete_temp_strategy",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service.fetch_analysis_form",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "veupath_chatbot.services.wdk.enrichment_service._execute_analysis",
+                new_callable=AsyncMock,
+                return_value=_result("go_process"),
+            ),
+        ):
+            svc = EnrichmentService()
+            await svc.run_batch(
+                site_id="plasmodb",
+                analysis_types=["go_process"],
+                gene_ids=["B", "A", "C"],
+            )
+            # Same set, different order: served without touching WDK.
+            results, _ = await svc.run_batch(
+                site_id="plasmodb",
+                analysis_types=["go_process"],
+                gene_ids=["C", "A", "B", "A"],
+            )
+            assert results[0].analysis_type == "go_process"
+            assert mock_dataset.await_count == 1
+            assert api.create_step.await_count == 1
+            assert api.create_strategy.await_count == 1
+
+
+class TestAnswerFingerprint:
+    @pytest.mark.asyncio
+    async def test_step_fingerprint_reads_one_small_page(self) -> None:
+        api = _fingerprintable_api()
+
+        fingerprint = await EnrichmentService()._answer_fingerprint(
+            api,
+            step_id=42,
+            search_name=None,
+            record_type="transcript",
+            parameters=None,
+            gene_ids=None,
+        )
+
+        assert fingerprint is not None
+        pagination = api.get_step_answer.call_args.kwargs["pagination"]
+        assert pagination == {"offset": 0, "numRecords": _FINGERPRINT_PAGE_SIZE}
+
+    @pytest.mark.asyncio
+    async def test_search_takes_precedence_over_gene_ids(self) -> None:
+        svc = EnrichmentService()
+        kwargs = {
+            "step_id": None,
+            "search_name": "GenesByTaxon",
+            "record_type": "transcript",
+            "parameters": {"organism": "P. falciparum"},
+        }
+
+        with_ids = await svc._answer_fingerprint(
+            MagicMock(), gene_ids=["A", "B"], **kwargs
+        )
+        without_ids = await svc._answer_fingerprint(
+            MagicMock(), gene_ids=None, **kwargs
+        )
+
+        assert with_ids == without_ids
+        assert with_ids is not None and with_ids.startswith("search:")
@@ -413,10 +413,6 @@ class TestGenerateSweepEvents:
         }
 
         with (
-            patch(
-                "veupath_chatbot.services.experiment.evaluation.cleanup_before_sweep",
-                new_callable=AsyncMock,
-            ),
             patch(
                 "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
                 new_callable=AsyncMock,
@@ -596,10 +592,6 @@ class TestNumericValueSorting:
             }
 
         with (
-            patch(
-                "veupath_chatbot.services.experiment.evaluation.cleanup_before_sweep",
-                new_callable=AsyncMock,
-            ),
             patch(
                 "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
                 new_callable=AsyncMock,
@@ -636,10 +628,6 @@ class TestNumericValueSorting:
         }
 
         with (
-            patch(
-                "veupath_chatbot.services.experiment.evaluation.cleanup_before_sweep",
-                new_callable=AsyncMock,
-            ),
             patch(
                 "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
                 new_callable=AsyncMock,
@@ -661,3 +649,107 @@ class TestNumericValueSorting:
         complete_events = [e for e in events if "sweep_complete" in e]
         assert len(point_events) == 3
         assert len(complete_events) == 1
+
+
+# ---------------------------------------------------------------------------
+# Single-pass sweeps
+# ---------------------------------------------------------------------------
+
+
+class TestSinglePassSweep:
+    @pytest.mark.asyncio
+    async def test_scores_every_point_from_one_evaluation(self) -> None:
+        exp = _make_experiment()
+        loosest_result = {
+            "positive": {
+                "intersectionCount": 2,
+                "controlsCount": 2,
+                "intersectionIds": ["PF3D7_0100100", "PF3D7_0100200"],
+            },
+            "negative": {
+                "intersectionCount": 1,
+                "controlsCount": 1,
+                "intersectionIds": ["PF3D7_9999999"],
+            },
+            "target": {"resultCount": 4},
+        }
+        records = [
+            ("PF3D7_0100100", 0.9),
+            ("PF3D7_0100200", 0.6),
+            ("PF3D7_9999999", 0.2),
+            ("PF3D7_0000001", 0.4),
+        ]
+
+        with (
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
+                new_callable=AsyncMock,
+                return_value=loosest_result,
+            ) as mock_controls,
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.fetch_attribute_values",
+                new_callable=AsyncMock,
+                return_value=records,
+            ) as mock_fetch,
+        ):
+            events = [
+                event
+                async for event in generate_sweep_events(
+                    exp=exp,
+                    param_name="threshold",
+                    sweep_type="numeric",
+                    sweep_values=["0.5", "0.0", "0.8"],
+                    attribute_name="score",
+                    threshold_direction="min",
+                )
+            ]
+
+        mock_controls.assert_awaited_once()
+        assert mock_controls.call_args.kwargs["target_parameters"]["threshold"] == "0.0"
+        assert mock_fetch.call_args.kwargs["attribute_name"] == "score"
+
+        import json as json_mod
+
+        complete = [e for e in events if "sweep_complete" in e][0]
+        points = json_mod.loads(complete.split("data: ", 1)[1])["points"]
+        assert [p["value"] for p in points] == [0.0, 0.5, 0.8]
+        assert [p["metrics"]["totalResults"] for p in points] == [4, 2, 1]
+        assert [p["metrics"]["sensitivity"] for p in points] == [1.0, 1.0, 0.5]
+        assert [p["metrics"]["specificity"] for p in points] == [0.0, 1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_point_evaluation(self) -> None:
+        exp = _make_experiment()
+        mock_result = {
+            "positive": {"intersectionCount": 1, "controlsCount": 2},
+            "negative": {"intersectionCount": 0, "controlsCount": 1},
+            "target": {"resultCount": 50},
+        }
+
+        with (
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
+                new_callable=AsyncMock,
+                return_value=mock_result,
+            ) as mock_controls,
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.fetch_attribute_values",
+                new_callable=AsyncMock,
+                return_value=[("PF3D7_0100100", 1.0)],
+            ),
+        ):
+            events = [
+                event
+                async for event in generate_sweep_events(
+                    exp=exp,
+                    param_name="threshold",
+                    sweep_type="numeric",
+                    sweep_values=["0.0", "0.5", "1.0"],
+                    attribute_name="score",
+                    threshold_direction="min",
+                )
+            ]
+
+        # The loosest run lacks intersection IDs, so each point runs on its own.
+        assert mock_controls.await_count == 4
+        assert len([e for e in events if "sweep_point" in e]) == 3
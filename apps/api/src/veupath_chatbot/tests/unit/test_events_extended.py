@@ -6,13 +6,17 @@ Focuses on:
 - read_stream_messages with malformed event data
 - read_stream_thinking with edge cases
 - Projection skipping for non-projected event types
+- Pipelined batch emission and event forwarding
 """
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
+import fakeredis
 import pytest
 
 from veupath_chatbot.platform.events import (
@@ -20,6 +24,8 @@ from veupath_chatbot.platform.events import (
     _parse_arguments,
     _project_event,
     emit,
+    emit_batch,
+    forward_events,
     read_stream_messages,
     read_stream_thinking,
 )
@@ -474,3 +480,89 @@ class TestEmitEdgeCases:
         data_bytes = call_args[0][1]["data"]
         data = json.loads(data_bytes)
         assert isinstance(data["timestamp"], str)
+
+
+async def _stream_types(redis: fakeredis.FakeAsyncRedis, stream_id: str) -> list[str]:
+    entries = await redis.xrange(f"stream:{stream_id}")
+    return [fields[b"type"].decode() for _eid, fields in entries]
+
+
+class TestEmitBatch:
+    async def test_appends_in_order_and_projects(self):
+        redis = fakeredis.FakeAsyncRedis()
+        session = AsyncMock()
+
+        entry_ids = await emit_batch(
+            redis,
+            "stream-1",
+            "op_1",
+            [
+                ("assistant_delta", {"delta": "Hi"}),
+                ("model_selected", {"modelId": "openai/gpt-4.1"}),
+            ],
+            session=session,
+        )
+
+        assert len(entry_ids) == 2
+        assert entry_ids[0] < entry_ids[1]
+        assert await _stream_types(redis, "stream-1") == [
+            "assistant_delta",
+            "model_selected",
+        ]
+        # Only model_selected is projected, and committed right after.
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+
+    async def test_empty_batch_is_a_no_op(self):
+        redis = AsyncMock()
+
+        assert await emit_batch(redis, "stream-1", "op_1", []) == []
+        redis.pipeline.assert_not_called()
+
+
+class TestForwardEvents:
+    async def test_bursts_share_a_round_trip(self):
+        redis = fakeredis.FakeAsyncRedis()
+        release = asyncio.Event()
+
+        async def events() -> AsyncIterator[object]:
+            yield {"type": "message_start", "data": {}}
+            await release.wait()
+            for n in range(5):
+                yield {"type": "assistant_delta", "data": {"delta": str(n)}}
+            yield "not an event"
+            yield {"type": "message_end"}
+
+        batches: list[int] = []
+
+        async def _recording(
+            redis: fakeredis.FakeAsyncRedis,
+            stream_id: str,
+            operation_id: str,
+            batch: list[tuple[str, dict[str, object]]],
+            **kwargs: object,
+        ) -> list[str]:
+            batches.append(len(batch))
+            release.set()
+            return await emit_batch(redis, stream_id, operation_id, batch)
+
+        with patch("veupath_chatbot.platform.events.emit_batch", _recording):
+            await forward_events(redis, "stream-1", "op_1", events())
+
+        # The burst queued while message_start was written goes out together.
+        assert batches == [1, 6]
+        assert await _stream_types(redis, "stream-1") == (
+            ["message_start"] + ["assistant_delta"] * 5 + ["message_end"]
+        )
+
+    async def test_source_error_propagates_after_writing(self):
+        redis = fakeredis.FakeAsyncRedis()
+
+        async def events() -> AsyncIterator[object]:
+            yield {"type": "assistant_delta", "data": {"delta": "partial"}}
+            raise RuntimeError("model failed")
+
+        with pytest.raises(RuntimeError, match="model failed"):
+            await forward_events(redis, "stream-1", "op_1", events())
+
+        assert await _stream_types(redis, "stream-1") == ["assistant_delta"]
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.experiment.result_set import ExperimentResultSet
 from veupath_chatbot.services.experiment.store import (
     ExperimentStore,
     get_experiment_store,
@@ -285,35 +286,49 @@ class TestPhasePersistStrategy:
 # ---------------------------------------------------------------------------
 
 
+def _result_set(
+    ids: list[str] | Exception, config: ExperimentConfig | None = None
+) -> ExperimentResultSet:
+    """A result set whose fetch returns *ids* (or raises them)."""
+    result_set = ExperimentResultSet(config or _make_config(), step_id=100)
+    result_set._fetch = AsyncMock(  # type: ignore[method-assign]
+        side_effect=ids if isinstance(ids, Exception) else None,
+        return_value=ids,
+    )
+    return result_set
+
+
 class TestPhaseRankMetrics:
     """_phase_rank_metrics computes rank-based metrics when configured."""
 
-    async def test_computes_rank_metrics_and_returns_ordered_ids(self) -> None:
+    async def test_computes_rank_metrics_from_result_set(self) -> None:
         from veupath_chatbot.services.experiment.service import _phase_rank_metrics
 
         config = _make_config(sort_attribute="fold_change")
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
         store.save(experiment)
 
-        fake_ids = ["G1", "G3", "G5", "N1", "G2"]
-
-        with (
-            patch(
-                "veupath_chatbot.services.experiment.rank_metrics.fetch_ordered_result_ids",
-                new_callable=AsyncMock,
-                return_value=fake_ids,
-            ),
-            patch(
-                "veupath_chatbot.services.experiment.rank_metrics.compute_rank_metrics",
-                return_value=object(),  # sentinel
-            ) as mock_compute,
-        ):
-            ordered = await _phase_rank_metrics(config, experiment, _noop_emit, store)
+        with patch(
+            "veupath_chatbot.services.experiment.rank_metrics.compute_rank_metrics",
+            return_value=object(),  # sentinel
+        ) as mock_compute:
+            await _phase_rank_metrics(
+                config,
+                experiment,
+                _noop_emit,
+                store,
+                _result_set(["G1", "G3", "G5", "N1", "G2"]),
+            )
 
-        assert ordered is fake_ids
         mock_compute.assert_called_once()
+        assert mock_compute.call_args.kwargs["result_ids"] == [
+            "G1",
+            "G3",
+            "G5",
+            "N1",
+            "G2",
+        ]
         assert experiment.rank_metrics is not None
 
     async def test_skips_when_no_sort_attribute(self) -> None:
@@ -321,42 +336,40 @@ class TestPhaseRankMetrics:
 
         config = _make_config(sort_attribute=None)
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
+        result_set = _result_set(["G1"])
 
-        ordered = await _phase_rank_metrics(config, experiment, _noop_emit, store)
+        await _phase_rank_metrics(config, experiment, _noop_emit, store, result_set)
 
-        assert ordered == []
         assert experiment.rank_metrics is None
+        result_set._fetch.assert_not_awaited()  # type: ignore[attr-defined]
 
-    async def test_skips_when_no_step_id(self) -> None:
+    async def test_skips_without_result_set(self) -> None:
         from veupath_chatbot.services.experiment.service import _phase_rank_metrics
 
         config = _make_config(sort_attribute="fold_change")
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = None
         store = get_experiment_store()
 
-        ordered = await _phase_rank_metrics(config, experiment, _noop_emit, store)
+        await _phase_rank_metrics(config, experiment, _noop_emit, store, None)
 
-        assert ordered == []
+        assert experiment.rank_metrics is None
 
     async def test_tolerates_failure(self) -> None:
         from veupath_chatbot.services.experiment.service import _phase_rank_metrics
 
         config = _make_config(sort_attribute="fold_change")
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
 
-        with patch(
-            "veupath_chatbot.services.experiment.rank_metrics.fetch_ordered_result_ids",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("fetch failed"),
-        ):
-            ordered = await _phase_rank_metrics(config, experiment, _noop_emit, store)
+        await _phase_rank_metrics(
+            config,
+            experiment,
+            _noop_emit,
+            store,
+            _result_set(RuntimeError("fetch failed")),
+        )
 
-        assert ordered == []
         assert experiment.rank_metrics is None
 
 
@@ -368,61 +381,62 @@ class TestPhaseRankMetrics:
 class TestPhaseRobustness:
     """_phase_robustness computes bootstrap confidence intervals."""
 
-    async def test_uses_provided_ordered_ids(self) -> None:
-        from veupath_chatbot.services.experiment.service import _phase_robustness
+    async def test_reuses_ids_fetched_for_rank_metrics(self) -> None:
+        from veupath_chatbot.services.experiment.service import (
+            _phase_rank_metrics,
+            _phase_robustness,
+        )
 
-        config = _make_config()
+        config = _make_config(sort_attribute="fold_change")
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
-        ids = ["G1", "G2", "G3"]
+        result_set = _result_set(["G1", "G2", "G3"], config)
 
         with patch(
             "veupath_chatbot.services.experiment.robustness.compute_robustness",
             return_value=object(),
         ) as mock_robust:
+            await _phase_rank_metrics(config, experiment, _noop_emit, store, result_set)
             await _phase_robustness(
-                config, experiment, _noop_emit, store, ids, is_ranked=False
+                config, experiment, _noop_emit, store, result_set, is_ranked=True
             )
 
-        mock_robust.assert_called_once()
+        result_set._fetch.assert_awaited_once()  # type: ignore[attr-defined]
+        assert mock_robust.call_args.kwargs["result_ids"] == ["G1", "G2", "G3"]
+        assert experiment.rank_metrics is not None
         assert experiment.robustness is not None
 
-    async def test_fetches_ids_when_not_provided(self) -> None:
+    async def test_fetches_ids_when_unranked(self) -> None:
         from veupath_chatbot.services.experiment.service import _phase_robustness
 
         config = _make_config()
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
 
-        with (
-            patch(
-                "veupath_chatbot.services.experiment.rank_metrics.fetch_ordered_result_ids",
-                new_callable=AsyncMock,
-                return_value=["G1", "G2"],
-            ),
-            patch(
-                "veupath_chatbot.services.experiment.robustness.compute_robustness",
-                return_value=object(),
-            ),
+        with patch(
+            "veupath_chatbot.services.experiment.robustness.compute_robustness",
+            return_value=object(),
         ):
             await _phase_robustness(
-                config, experiment, _noop_emit, store, [], is_ranked=False
+                config,
+                experiment,
+                _noop_emit,
+                store,
+                _result_set(["G1", "G2"]),
+                is_ranked=False,
             )
 
         assert experiment.robustness is not None
 
-    async def test_skips_when_no_step_id(self) -> None:
+    async def test_skips_without_result_set(self) -> None:
         from veupath_chatbot.services.experiment.service import _phase_robustness
 
         config = _make_config()
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = None
         store = get_experiment_store()
 
         await _phase_robustness(
-            config, experiment, _noop_emit, store, [], is_ranked=False
+            config, experiment, _noop_emit, store, None, is_ranked=False
         )
 
         assert experiment.robustness is None
@@ -432,7 +446,6 @@ class TestPhaseRobustness:
 
         config = _make_config()
         experiment = _make_experiment(config)
-        experiment.wdk_step_id = 100
         store = get_experiment_store()
 
         with patch(
@@ -440,7 +453,12 @@ class TestPhaseRobustness:
             side_effect=RuntimeError("boom"),
         ):
             await _phase_robustness(
-                config, experiment, _noop_emit, store, ["G1"], is_ranked=False
+                config,
+                experiment,
+                _noop_emit,
+                store,
+                _result_set(["G1"]),
+                is_ranked=False,
             )
 
         assert experiment.robustness is None
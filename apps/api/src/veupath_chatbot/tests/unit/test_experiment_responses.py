@@ -4,6 +4,7 @@ import pytest
 from pydantic import BaseModel, ValidationError
 
 from veupath_chatbot.transport.http.schemas.experiment_responses import (
+    BatchProgressDataResponse,
     BootstrapResultResponse,
     ConfidenceIntervalResponse,
     ConfusionMatrixResponse,
@@ -245,6 +246,7 @@ MODELS_WITH_MINIMAL_DATA: list[tuple[type[BaseModel], dict]] = [
         {"trialNumber": 1, "totalTrials": 10, "status": "running"},
     ),
     (StepAnalysisProgressDataResponse, {"phase": "step_evaluation"}),
+    (BatchProgressDataResponse, {"completed": 1, "failed": 0, "total": 3}),
     (ExperimentProgressDataResponse, {"phase": "evaluating"}),
 ]
 
@@ -0,0 +1,108 @@
+"""Tests for the per-experiment result-set artifact."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from veupath_chatbot.services.experiment.rank_metrics import fetch_ordered_result_ids
+from veupath_chatbot.services.experiment.result_set import ExperimentResultSet
+from veupath_chatbot.services.experiment.types import ExperimentConfig
+
+_RESULT_SET = "veupath_chatbot.services.experiment.result_set"
+
+
+def _config(**overrides: Any) -> ExperimentConfig:
+    defaults: dict[str, Any] = {
+        "site_id": "PlasmoDB",
+        "record_type": "gene",
+        "search_name": "GenesByTaxon",
+        "parameters": {"organism": "P. falciparum"},
+        "positive_controls": ["G1"],
+        "negative_controls": ["N1"],
+        "controls_search_name": "GeneByLocusTag",
+        "controls_param_name": "ds_gene_ids",
+        "name": "Test",
+    }
+    defaults.update(overrides)
+    return ExperimentConfig(**defaults)
+
+
+@pytest.fixture
+def settings() -> Iterator[MagicMock]:
+    settings = MagicMock(experiment_result_set_max_records=1000)
+    with patch(f"{_RESULT_SET}.get_settings", return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def fetch() -> Iterator[AsyncMock]:
+    with patch(
+        "veupath_chatbot.services.experiment.rank_metrics.fetch_ordered_result_ids",
+        new_callable=AsyncMock,
+        return_value=["G2", "G1", "G2", "N1"],
+    ) as mock:
+        yield mock
+
+
+@pytest.mark.usefixtures("settings")
+class TestExperimentResultSet:
+    async def test_fetched_once_and_deduplicated(self, fetch: AsyncMock) -> None:
+        result_set = ExperimentResultSet(
+            _config(sort_attribute="fold_change", sort_direction="DESC"), 7
+        )
+
+        first, second = await asyncio.gather(result_set.ids(), result_set.ids())
+
+        assert first == second == ["G2", "G1", "N1"]
+        assert result_set.total == 3
+        fetch.assert_awaited_once_with(
+            site_id="PlasmoDB",
+            step_id=7,
+            max_results=1000,
+            sort_attribute="fold_change",
+            sort_direction="DESC",
+        )
+
+    async def test_unsorted_reuses_evaluation_target_ids(
+        self, fetch: AsyncMock
+    ) -> None:
+        with patch(
+            "veupath_chatbot.services.control_tests.cached_target_record_ids",
+            new_callable=AsyncMock,
+            return_value=["G5", "G6"],
+        ):
+            ids = await ExperimentResultSet(_config(), 7).ids()
+
+        assert ids == ["G5", "G6"]
+        fetch.assert_not_awaited()
+
+    async def test_gene_set_experiment_reads_wdk_resolved_ids(
+        self, fetch: AsyncMock
+    ) -> None:
+        config = _config(target_gene_ids=["g2-alias", "G1"])
+
+        assert await ExperimentResultSet(config, 7).ids() == ["G2", "G1", "N1"]
+        fetch.assert_awaited_once()
+
+
+class TestFetchOrderedResultIds:
+    async def test_reads_pages_until_answer_runs_out(self) -> None:
+        def _page(step_id: int, attributes: list[str], pagination: Any) -> Any:
+            offset = pagination["offset"]
+            count = min(pagination["numRecords"], 6000 - offset)
+            return {"records": [{"id": f"G{offset + i}"} for i in range(count)]}
+
+        api = MagicMock()
+        api.get_step_answer = AsyncMock(side_effect=_page)
+        with patch(
+            "veupath_chatbot.services.experiment.rank_metrics.get_strategy_api",
+            return_value=api,
+        ):
+            ids = await fetch_ordered_result_ids("plasmodb", 1, max_results=20_000)
+
+        assert len(ids) == 6000
+        assert ids[5000] == "G5000"
+        assert api.get_step_answer.await_count == 2
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from veupath_chatbot.services.experiment.result_set import ExperimentResultSet
 from veupath_chatbot.services.experiment.service import (
     _phase_persist_strategy,
     _phase_rank_metrics,
@@ -317,34 +318,37 @@ class TestPhaseRankMetrics:
         emit = AsyncMock()
 
         with patch("veupath_chatbot.platform.store.spawn"):
-            result = await _phase_rank_metrics(_cfg(), exp, emit, store)
+            await _phase_rank_metrics(
+                _cfg(), exp, emit, store, ExperimentResultSet(_cfg(), 42)
+            )
 
-        assert result == []
+        assert exp.rank_metrics is None
         emit.assert_not_awaited()
 
-    async def test_skips_when_no_wdk_step_id(self) -> None:
+    async def test_skips_without_result_set(self) -> None:
         exp = Experiment(id="exp_001", config=_cfg(sort_attribute="mean"))
         exp.wdk_step_id = None
         store = ExperimentStore()
         emit = AsyncMock()
 
         with patch("veupath_chatbot.platform.store.spawn"):
-            result = await _phase_rank_metrics(
-                _cfg(sort_attribute="mean"), exp, emit, store
+            await _phase_rank_metrics(
+                _cfg(sort_attribute="mean"), exp, emit, store, None
             )
 
-        assert result == []
+        assert exp.rank_metrics is None
+        emit.assert_not_awaited()
 
 
 class TestPhaseRobustness:
-    async def test_skips_when_no_wdk_step_id(self) -> None:
+    async def test_skips_without_result_set(self) -> None:
         exp = Experiment(id="exp_001", config=_cfg())
         exp.wdk_step_id = None
         store = ExperimentStore()
         emit = AsyncMock()
 
         with patch("veupath_chatbot.platform.store.spawn"):
-            await _phase_robustness(_cfg(), exp, emit, store, [], is_ranked=False)
+            await _phase_robustness(_cfg(), exp, emit, store, None, is_ranked=False)
 
         # Should have returned early without emitting
         emit.assert_not_awaited()
@@ -11,6 +11,7 @@ from veupath_chatbot.services.gene_lookup.scoring import (
     _W_ORGANISM,
     _W_PRODUCT,
     score_gene_relevance,
+    score_gene_results,
 )
 
 
@@ -173,3 +174,19 @@ class TestScoreGeneRelevance:
         assert _W_DISPLAY_NAME > 0
         assert _W_FIELD_QUALITY > 0
         assert _EXACT_BONUS > 0
+
+    def test_batch_matches_single_scores(self) -> None:
+        results = [
+            {"geneId": "PF3D7_0304600", "geneName": "CSP", "organism": ""},
+            {"geneId": "PF3D7_1133400", "product": "apical membrane antigen 1"},
+            {"geneId": "PF3D7_0000001", "product": "circumsporozoite protein"},
+            {},
+        ]
+
+        batch = score_gene_results("CSP", results)
+
+        assert batch == pytest.approx([score_gene_relevance("CSP", r) for r in results])
+        assert batch[0] == max(batch)
+
+    def test_empty_batch(self) -> None:
+        assert score_gene_results("CSP", []) == []
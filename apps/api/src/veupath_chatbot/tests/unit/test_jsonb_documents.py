@@ -0,0 +1,135 @@
+"""Tests for JSONB in-place updates and SQL-side JSON filters."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veupath_chatbot.persistence.jsonb import jsonb_set_keys
+from veupath_chatbot.persistence.models import ExperimentRow, StreamProjection
+from veupath_chatbot.persistence.repositories.control_set import (
+    ControlSetRepository,
+)
+from veupath_chatbot.persistence.repositories.stream import StreamRepository
+from veupath_chatbot.services.experiment.store import ExperimentStore
+from veupath_chatbot.services.experiment.types import Experiment, ExperimentConfig
+
+
+def _compile(expr: object) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+class TestJsonbSetKeys:
+    def test_nests_one_jsonb_set_per_key(self) -> None:
+        sql = _compile(jsonb_set_keys(ExperimentRow.data, {"status": "a", "x": 1}))
+        assert sql.count("jsonb_set(") == 2
+        assert "experiments.data" in sql
+
+    def test_no_keys_returns_column(self) -> None:
+        assert jsonb_set_keys(StreamProjection.plan, {}) is StreamProjection.plan
+
+
+class TestExperimentSaveFields:
+    def test_patches_listed_keys_and_status_column(self) -> None:
+        store = ExperimentStore()
+        exp = Experiment(
+            id="exp_1",
+            config=ExperimentConfig(
+                site_id="plasmodb",
+                record_type="gene",
+                search_name="GenesByTaxon",
+                parameters={},
+                positive_controls=[],
+                negative_controls=[],
+                controls_search_name="GeneByLocusTag",
+                controls_param_name="ds_gene_ids",
+            ),
+            status="completed",
+        )
+
+        with patch.object(store, "save_partial") as save_partial:
+            store.save_fields(exp, "status", "notes")
+
+        entity, values = save_partial.call_args[0]
+        assert entity is exp
+        assert set(values) == {"data", "status"}
+        assert values["status"] == "completed"
+        assert _compile(values["data"]).count("jsonb_set(") == 2
+
+
+class TestProjectionRename:
+    @pytest.mark.asyncio
+    async def test_rename_without_plan_leaves_plan_untouched(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        stream = await stream_repo.create(user_id=user_id, site_id="plasmodb")
+        plan = {
+            "recordType": "gene",
+            "root": {"id": "s1", "searchName": "GenesByTaxon"},
+            "metadata": {"name": "Old", "description": "keep"},
+        }
+        await stream_repo.update_projection(stream.id, plan=plan)
+
+        await stream_repo.update_projection(stream.id, name="New")
+
+        proj = await stream_repo.get_projection(stream.id)
+        assert proj is not None
+        await stream_repo.session.refresh(proj)
+        assert proj.name == "New"
+        assert proj.plan == plan
+
+    @pytest.mark.asyncio
+    async def test_plan_patch_sets_only_given_keys(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        stream = await stream_repo.create(user_id=user_id, site_id="plasmodb")
+        plan = {
+            "recordType": "gene",
+            "root": {"id": "s1", "searchName": "GenesByTaxon"},
+            "metadata": {"name": "Old", "description": "keep"},
+        }
+        await stream_repo.update_projection(stream.id, plan=plan)
+
+        root = {"id": "1001", "searchName": "GenesByTaxon"}
+        await stream_repo.update_projection(stream.id, plan_patch={"root": root})
+
+        proj = await stream_repo.get_projection(stream.id)
+        assert proj is not None
+        await stream_repo.session.refresh(proj)
+        assert proj.plan == {**plan, "root": root}
+
+
+class TestControlSetTagFilter:
+    @pytest.mark.asyncio
+    async def test_tags_filter_runs_before_limit(
+        self, db_session: AsyncSession
+    ) -> None:
+        repo = ControlSetRepository(db_session)
+        tagged = await repo.create(
+            name="Tagged",
+            site_id="plasmodb",
+            record_type="gene",
+            positive_ids=["a"],
+            negative_ids=["b"],
+            tags=["malaria", "kinase"],
+            is_public=True,
+        )
+        other = await repo.create(
+            name="Other",
+            site_id="plasmodb",
+            record_type="gene",
+            positive_ids=["c"],
+            negative_ids=["d"],
+            tags=["other"],
+            is_public=True,
+        )
+        # Newest first: without the SQL filter it would fill the limit of 1.
+        other.created_at = datetime.now(UTC) + timedelta(hours=1)
+        await db_session.flush()
+
+        rows = await repo.list_by_site("plasmodb", tags=["kinase", "nope"], limit=1)
+
+        assert [r.id for r in rows] == [tagged.id]
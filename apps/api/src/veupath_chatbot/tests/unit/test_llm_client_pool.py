@@ -0,0 +1,66 @@
+"""Tests for the process-wide LLM SDK client pool."""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from veupath_chatbot.ai.engines.client_pool import (
+    close_llm_clients,
+    get_anthropic_client,
+    get_openai_client,
+)
+
+
+@pytest.fixture(autouse=True)
+async def _empty_pool() -> AsyncGenerator[None]:
+    await close_llm_clients()
+    yield
+    await close_llm_clients()
+
+
+class TestClientPool:
+    async def test_reuses_client_for_same_credentials(self) -> None:
+        assert get_openai_client("sk-a") is get_openai_client("sk-a")
+        assert get_anthropic_client("sk-ant") is get_anthropic_client("sk-ant")
+
+    async def test_keys_by_credentials_and_base_url(self) -> None:
+        base = get_openai_client("sk-a")
+        assert get_openai_client("sk-b") is not base
+        assert get_openai_client("sk-a", "http://localhost:11434/v1") is not base
+
+    async def test_close_closes_and_forgets_clients(self) -> None:
+        client = get_openai_client("sk-a")
+        await close_llm_clients()
+        assert client.is_closed()
+        assert get_openai_client("sk-a") is not client
+
+    def test_client_from_closed_loop_is_replaced(self) -> None:
+        async def _get() -> object:
+            return get_openai_client("sk-loop")
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+        assert first is not second
+
+    async def test_client_for_other_live_loop_is_closed_at_shutdown(self) -> None:
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+
+            async def _get() -> object:
+                return get_openai_client("sk-a")
+
+            theirs = asyncio.run_coroutine_threadsafe(_get(), other).result()
+            ours = get_openai_client("sk-a")
+            assert theirs is not ours
+
+            await close_llm_clients()
+            assert ours.is_closed()
+            assert theirs.is_closed()
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
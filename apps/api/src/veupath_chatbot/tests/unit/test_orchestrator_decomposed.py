@@ -51,6 +51,11 @@ async def _async_iter(items: list[dict[str, Any]]) -> Any:
         yield item
 
 
+def _emitted(mock_batch: AsyncMock) -> list[tuple[str, Any]]:
+    """Events passed to every ``emit_batch`` call, in order."""
+    return [event for call in mock_batch.call_args_list for event in call.args[3]]
+
+
 # ── _build_agent_context ─────────────────────────────────────────────
 
 
@@ -176,7 +181,6 @@ class TestBuildAgentContext:
                 reasoning_effort=None,
                 mentions=mentions,
                 projection=projection,
-                stream_repo=MagicMock(),
             )
 
         mock_build.assert_called_once()
@@ -266,9 +270,14 @@ class TestRunStreamLoop:
             {"type": "message_end", "data": {}},
         ]
 
-        with patch(
-            "veupath_chatbot.services.chat.orchestrator.emit",
-            mock_emit,
+        mock_batch = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "veupath_chatbot.services.chat.orchestrator.emit",
+                mock_emit,
+            ),
+            patch("veupath_chatbot.platform.events.emit_batch", mock_batch),
         ):
             await _run_stream_loop(
                 redis=redis,
@@ -281,8 +290,13 @@ class TestRunStreamLoop:
                 stream_repo=repo,
             )
 
-        # message_start + 3 stream events = 4 emit calls
-        assert mock_emit.call_count == 4
+        # message_start is emitted alone; the 3 stream events are batched.
+        assert mock_emit.call_count == 1
+        assert _emitted(mock_batch) == [
+            ("assistant_delta", {"delta": "hello"}),
+            ("assistant_message", {"content": "hello world"}),
+            ("message_end", {}),
+        ]
 
         # First call should be message_start
         first_call = mock_emit.call_args_list[0]
@@ -305,9 +319,14 @@ class TestRunStreamLoop:
             yield 42  # should be skipped
             yield {"type": "message_end", "data": {}}
 
-        with patch(
-            "veupath_chatbot.services.chat.orchestrator.emit",
-            mock_emit,
+        mock_batch = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "veupath_chatbot.services.chat.orchestrator.emit",
+                mock_emit,
+            ),
+            patch("veupath_chatbot.platform.events.emit_batch", mock_batch),
         ):
             await _run_stream_loop(
                 redis=redis,
@@ -320,8 +339,11 @@ class TestRunStreamLoop:
                 stream_repo=repo,
             )
 
-        # message_start + 2 valid events = 3 emit calls
-        assert mock_emit.call_count == 3
+        # Only the 2 valid events are forwarded.
+        assert [t for t, _ in _emitted(mock_batch)] == [
+            "assistant_delta",
+            "message_end",
+        ]
 
     @pytest.mark.asyncio
     async def test_extracts_event_type_and_data(self) -> None:
@@ -336,9 +358,14 @@ class TestRunStreamLoop:
             },
         ]
 
-        with patch(
-            "veupath_chatbot.services.chat.orchestrator.emit",
-            mock_emit,
+        mock_batch = AsyncMock(return_value=[])
+
+        with (
+            patch(
+                "veupath_chatbot.services.chat.orchestrator.emit",
+                mock_emit,
+            ),
+            patch("veupath_chatbot.platform.events.emit_batch", mock_batch),
         ):
             await _run_stream_loop(
                 redis=redis,
@@ -351,10 +378,9 @@ class TestRunStreamLoop:
                 stream_repo=repo,
             )
 
-        # Second call (after message_start) should be strategy_update
-        second_call = mock_emit.call_args_list[1]
-        assert second_call[0][3] == "strategy_update"
-        assert second_call[0][4]["graphId"] == "g1"
+        [(event_type, event_data)] = _emitted(mock_batch)
+        assert event_type == "strategy_update"
+        assert event_data["graphId"] == "g1"
 
 
 # ── _handle_cancellation ─────────────────────────────────────────────
@@ -0,0 +1,97 @@
+"""Unit tests for the in-process and layered caches."""
+
+import time
+
+import fakeredis
+import pytest
+
+import veupath_chatbot.platform.redis as redis_module
+from veupath_chatbot.platform.cache import (
+    LayeredCache,
+    TTLCache,
+    cache_key,
+    clear_all_caches,
+)
+
+
+class TestCacheKey:
+    def test_dict_order_does_not_matter(self) -> None:
+        assert cache_key({"a": 1, "b": 2}) == cache_key({"b": 2, "a": 1})
+
+    def test_parts_are_order_sensitive(self) -> None:
+        assert cache_key("a", "b") != cache_key("b", "a")
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[int] = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_weight_budget_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[tuple[str, ...]] = TTLCache(max_weight=5, weigh=len)
+        cache.set("a", ("x", "y"))
+        cache.set("b", ("x", "y"))
+        cache.set("c", ("x", "y", "z"))
+        assert cache.get("a") is None
+        assert cache.get("b") == ("x", "y")
+        assert cache.weight == 5
+        cache.set("huge", tuple("abcdef"))
+        assert cache.get("huge") is None
+        cache.delete("b")
+        assert cache.weight == 3
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache: TTLCache[int] = TTLCache(ttl_seconds=10)
+        cache.set("a", 1)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_delete_where(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        cache.set(("s1", 1), 1)
+        cache.set(("s1", 2), 2)
+        cache.set(("s2", 1), 3)
+        assert cache.delete_where(lambda k: k[0] == "s1") == 2
+        assert len(cache) == 1
+
+    def test_clear_all_caches(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        cache.set("a", 1)
+        clear_all_caches()
+        assert cache.get("a") is None
+
+
+class TestLayeredCache:
+    async def test_memory_only_without_redis(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redis_module, "_redis", None)
+        cache: LayeredCache[dict[str, int]] = LayeredCache(
+            "test", encode=dict, decode=dict
+        )
+        await cache.set("k", {"x": 1})
+        assert await cache.get("k") == {"x": 1}
+        await cache.delete("k")
+        assert await cache.get("k") is None
+
+    async def test_shares_values_through_redis(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redis_module, "_redis", fakeredis.FakeAsyncRedis())
+        writer: LayeredCache[dict[str, int]] = LayeredCache(
+            "test", encode=dict, decode=dict
+        )
+        reader: LayeredCache[dict[str, int]] = LayeredCache(
+            "test", encode=dict, decode=dict
+        )
+        await writer.set("k", {"x": 1})
+        assert await reader.get("k") == {"x": 1}
+        assert reader.local.get("k") == {"x": 1}
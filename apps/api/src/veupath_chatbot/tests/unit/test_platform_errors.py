@@ -16,6 +16,8 @@ from veupath_chatbot.platform.errors import (
     InternalError,
     NotFoundError,
     ProblemDetail,
+    RateLimitedError,
+    ServiceBusyError,
     UnauthorizedError,
     ValidationError,
     WDKError,
@@ -161,6 +163,18 @@ class TestAppErrorHandler:
         assert body["code"] == "VALIDATION_ERROR"
         assert body["errors"] == errors
 
+    async def test_rate_limited_sets_retry_after(self):
+        resp = await app_error_handler(_make_request(), RateLimitedError(2.2))
+        assert resp.status_code == 429
+        assert resp.headers["Retry-After"] == "3"
+        assert json.loads(resp.body.decode())["code"] == "RATE_LIMITED"
+
+    async def test_service_busy_sets_retry_after(self):
+        resp = await app_error_handler(_make_request(), ServiceBusyError())
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "30"
+        assert json.loads(resp.body.decode())["code"] == "SERVICE_BUSY"
+
 
 class TestHttpExceptionHandler:
     async def test_404_maps_to_not_found(self):
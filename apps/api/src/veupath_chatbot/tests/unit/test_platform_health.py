@@ -0,0 +1,40 @@
+"""Tests for the cached Qdrant readiness probe."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from veupath_chatbot.platform.health import check_qdrant
+
+_MODULE = "veupath_chatbot.platform.health"
+
+
+def _client(*, fails: bool = False) -> MagicMock:
+    client = MagicMock()
+    client.get_collections = AsyncMock(
+        side_effect=RuntimeError("connection refused") if fails else None
+    )
+    client.close = AsyncMock()
+    return client
+
+
+class TestCheckQdrant:
+    async def test_probe_result_is_cached(self) -> None:
+        client = _client()
+        with (
+            patch(f"{_MODULE}.get_settings", return_value=MagicMock()),
+            patch("qdrant_client.AsyncQdrantClient", return_value=client),
+        ):
+            assert await check_qdrant() is True
+            assert await check_qdrant() is True
+
+        client.get_collections.assert_awaited_once()
+        client.close.assert_awaited_once()
+
+    async def test_unreachable_qdrant_reports_false(self) -> None:
+        client = _client(fails=True)
+        with (
+            patch(f"{_MODULE}.get_settings", return_value=MagicMock()),
+            patch("qdrant_client.AsyncQdrantClient", return_value=client),
+        ):
+            assert await check_qdrant() is False
+
+        client.close.assert_awaited_once()
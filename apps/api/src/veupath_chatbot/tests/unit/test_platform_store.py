@@ -1,5 +1,6 @@
 """Unit tests for platform.store -- WriteThruStore generic store."""
 
+import asyncio
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -336,3 +337,88 @@ class TestWriteThruStoreDbMethods:
             entity = FakeEntity(id="x", name="Y")
             store.save(entity)
             assert store.get("x") is entity
+
+
+class TestWriteThruStorePartialWrites:
+    """save_partial / _update and per-entity write ordering."""
+
+    @patch("veupath_chatbot.platform.store.spawn")
+    def test_save_partial_caches_and_spawns(self, mock_spawn: MagicMock) -> None:
+        store = FakeStore()
+        entity = FakeEntity(id="abc", name="New")
+        store.save_partial(entity, {"name": "New"})
+
+        assert store.get("abc") is entity
+        mock_spawn.assert_called_once()
+        assert mock_spawn.call_args[1]["name"] == "persist-abc"
+        mock_spawn.call_args[0][0].close()
+
+    async def test_update_executes_update(self) -> None:
+        store = FakeStore()
+
+        mock_session = AsyncMock()
+        mock_factory = AsyncMock()
+        mock_factory.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_factory.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch(
+                "veupath_chatbot.persistence.session.async_session_factory",
+                return_value=mock_factory,
+            ),
+            patch("veupath_chatbot.platform.store.sa_update") as mock_update,
+        ):
+            mock_stmt = MagicMock()
+            mock_update.return_value = mock_stmt
+            mock_stmt.where.return_value = mock_stmt
+            mock_stmt.values.return_value = mock_stmt
+
+            await store._update("abc", {"name": "Renamed"})
+
+            mock_update.assert_called_once_with(FakeRowModel)
+            mock_stmt.values.assert_called_once_with(name="Renamed")
+            mock_session.execute.assert_called_once_with(mock_stmt)
+            mock_session.commit.assert_called_once()
+
+    async def test_writes_for_same_entity_run_in_issue_order(self) -> None:
+        """A slow upsert must finish before a later partial update starts."""
+        store = FakeStore()
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def _execute(stmt: object) -> None:
+            label = "upsert" if stmt is upsert_stmt else "update"
+            order.append(f"{label}:start")
+            if label == "upsert":
+                await release.wait()
+            order.append(f"{label}:end")
+
+        mock_session = AsyncMock()
+        mock_session.execute = _execute
+        mock_factory = AsyncMock()
+        mock_factory.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_factory.__aexit__ = AsyncMock(return_value=False)
+
+        upsert_stmt = MagicMock()
+        upsert_stmt.values.return_value = upsert_stmt
+        upsert_stmt.on_conflict_do_update.return_value = upsert_stmt
+        update_stmt = MagicMock()
+        update_stmt.where.return_value = update_stmt
+        update_stmt.values.return_value = update_stmt
+
+        with (
+            patch(
+                "veupath_chatbot.persistence.session.async_session_factory",
+                return_value=mock_factory,
+            ),
+            patch("veupath_chatbot.platform.store.pg_insert", return_value=upsert_stmt),
+            patch("veupath_chatbot.platform.store.sa_update", return_value=update_stmt),
+        ):
+            entity = FakeEntity(id="abc", name="Test")
+            first = asyncio.create_task(store._persist(entity))
+            second = asyncio.create_task(store._update("abc", {"name": "Later"}))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert order == ["upsert:start", "upsert:end", "update:start", "update:end"]
@@ -0,0 +1,89 @@
+"""Tests for provider-agnostic prompt-prefix caching helpers."""
+
+from types import SimpleNamespace
+
+from kani import ChatMessage
+from kani.models import ChatRole
+
+from veupath_chatbot.ai.engines.prompt_cache import (
+    PROMPT_CACHE_BOUNDARY,
+    relocate_dynamic_context,
+    split_system_prompt,
+    stable_functions,
+    strip_leading_boundary,
+)
+from veupath_chatbot.ai.prompts.executor_prompt import build_agent_system_prompt
+
+
+class TestSplitSystemPrompt:
+    def test_without_boundary_everything_is_static(self):
+        assert split_system_prompt("abc") == ("abc", "")
+
+    def test_splits_on_boundary(self):
+        assert split_system_prompt("abc" + PROMPT_CACHE_BOUNDARY + "xyz") == (
+            "abc",
+            "xyz",
+        )
+
+
+class TestRelocateDynamicContext:
+    def _history(self) -> list[ChatMessage]:
+        return [
+            ChatMessage.system("Static" + PROMPT_CACHE_BOUNDARY + "## Selected"),
+            ChatMessage.user("first"),
+            ChatMessage.assistant("answer"),
+            ChatMessage.user("second"),
+        ]
+
+    def test_moves_context_before_latest_user_message(self):
+        out = relocate_dynamic_context(self._history())
+        assert [m.role for m in out] == [
+            ChatRole.SYSTEM,
+            ChatRole.USER,
+            ChatRole.ASSISTANT,
+            ChatRole.SYSTEM,
+            ChatRole.USER,
+        ]
+        assert out[0].text == "Static"
+        assert out[3].text == "## Selected"
+
+    def test_prefix_is_stable_when_context_changes(self):
+        a = relocate_dynamic_context(self._history())
+        changed = self._history()
+        changed[0] = ChatMessage.system(
+            "Static" + PROMPT_CACHE_BOUNDARY + "## Other nodes"
+        )
+        b = relocate_dynamic_context(changed)
+        assert [m.text for m in a[:3]] == [m.text for m in b[:3]]
+
+    def test_without_boundary_messages_unchanged(self):
+        messages = [ChatMessage.system("plain"), ChatMessage.user("hi")]
+        assert relocate_dynamic_context(messages) is messages
+
+    def test_strip_keeps_prompt_whole(self):
+        out = strip_leading_boundary(self._history())
+        assert out[0].text == "Static\n\n## Selected"
+        assert len(out) == 4
+
+
+class TestStableFunctions:
+    def test_sorted_by_name(self):
+        fns = [SimpleNamespace(name=n) for n in ("b", "c", "a")]
+        assert [f.name for f in stable_functions(fns)] == ["a", "b", "c"]  # type: ignore[arg-type]
+
+
+class TestAgentSystemPrompt:
+    def test_static_prompt_has_no_boundary(self):
+        prompt = build_agent_system_prompt(site_id="plasmodb", selected_nodes=None)
+        assert PROMPT_CACHE_BOUNDARY not in prompt
+
+    def test_per_turn_context_follows_boundary(self):
+        prompt = build_agent_system_prompt(
+            site_id="plasmodb",
+            selected_nodes={"nodes": ["s1"]},
+            mentioned_context="gene PF3D7_0100100",
+        )
+        static, dynamic = split_system_prompt(prompt)
+        assert "plasmodb" in static
+        assert dynamic.startswith("## Selected Nodes")
+        assert "PF3D7_0100100" in dynamic
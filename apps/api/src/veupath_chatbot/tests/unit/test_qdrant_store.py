@@ -7,19 +7,46 @@ Covers:
   - close() properly cleans up the shared client
   - After close(), connect() creates a fresh client (re-initialization)
   - _get_client() is idempotent (same instance returned)
+  - from_settings() returns one registered store per server and options
   - close_all_qdrant_stores() closes every registered store
+  - Keep-alive client options and byte-sized upsert batches
 """
 
-from unittest.mock import AsyncMock, patch
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from veupath_chatbot.integrations.vectorstore.qdrant_store import (
     QdrantStore,
-    _active_stores,
+    _stores,
+    batch_by_bytes,
     close_all_qdrant_stores,
 )
 
+_SETTINGS = "veupath_chatbot.integrations.vectorstore.qdrant_store.get_settings"
+
+
+def _settings(url: str = "http://test:6333", api_key: str | None = None) -> MagicMock:
+    return MagicMock(
+        qdrant_url=url,
+        qdrant_api_key=api_key,
+        qdrant_timeout_seconds=10,
+        qdrant_prefer_grpc=False,
+        qdrant_grpc_port=6334,
+        qdrant_max_connections=20,
+        qdrant_keepalive_seconds=30.0,
+        qdrant_upsert_max_bytes=8 * 1024 * 1024,
+    )
+
+
+@pytest.fixture
+def registry() -> Iterator[dict[tuple[object, ...], QdrantStore]]:
+    """The store registry, emptied after the test."""
+    yield _stores
+    _stores.clear()
+
 
 class TestSharedClientReuse:
     """Verify connect() reuses a single shared client across calls."""
@@ -114,59 +141,113 @@ class TestReinitialization:
 class TestFromSettings:
     """Verify from_settings() produces a working QdrantStore."""
 
-    @pytest.mark.asyncio
-    async def test_from_settings_creates_store(self) -> None:
-        with patch(
-            "veupath_chatbot.integrations.vectorstore.qdrant_store.get_settings"
-        ) as mock_settings:
-            mock_settings.return_value.qdrant_url = "http://test:6333"
-            mock_settings.return_value.qdrant_api_key = None
-            mock_settings.return_value.qdrant_timeout_seconds = 10
+    @pytest.mark.usefixtures("registry")
+    def test_from_settings_creates_store(self) -> None:
+        with patch(_SETTINGS, return_value=_settings()):
             store = QdrantStore.from_settings()
         assert store.url == "http://test:6333"
         assert store.api_key is None
         assert store._shared_client is None
 
 
-class TestActiveStoresRegistry:
-    """Verify from_settings() registers stores for shutdown cleanup."""
+class TestStoreRegistry:
+    """Verify from_settings() reuses one registered store per server."""
+
+    def test_repeated_calls_share_one_store(
+        self, registry: dict[tuple[object, ...], QdrantStore]
+    ) -> None:
+        with patch(_SETTINGS, return_value=_settings()):
+            first = QdrantStore.from_settings()
+            second = QdrantStore.from_settings()
+        assert first is second
+        assert list(registry.values()) == [first]
+
+    def test_different_credentials_get_separate_stores(
+        self, registry: dict[tuple[object, ...], QdrantStore]
+    ) -> None:
+        with patch(_SETTINGS, return_value=_settings()):
+            anonymous = QdrantStore.from_settings()
+        with patch(_SETTINGS, return_value=_settings(api_key="secret")):
+            keyed = QdrantStore.from_settings()
+        assert anonymous is not keyed
+        assert len(registry) == 2
 
     @pytest.mark.asyncio
-    async def test_from_settings_registers_store(self) -> None:
-        initial_count = len(_active_stores)
-        with patch(
-            "veupath_chatbot.integrations.vectorstore.qdrant_store.get_settings"
-        ) as mock_settings:
-            mock_settings.return_value.qdrant_url = "http://reg-test:6333"
-            mock_settings.return_value.qdrant_api_key = None
-            mock_settings.return_value.qdrant_timeout_seconds = 5
-            store = QdrantStore.from_settings()
-        assert store in _active_stores
-        assert len(_active_stores) == initial_count + 1
-        # Cleanup: remove from registry to avoid polluting other tests
-        _active_stores.remove(store)
-
-    @pytest.mark.asyncio
-    async def test_close_all_closes_every_store(self) -> None:
-        store_a = QdrantStore(url="http://a:6333")
-        store_b = QdrantStore(url="http://b:6333")
+    async def test_close_all_closes_every_store(
+        self, registry: dict[tuple[object, ...], QdrantStore]
+    ) -> None:
+        with patch(_SETTINGS, return_value=_settings("http://a:6333")):
+            store_a = QdrantStore.from_settings()
+        with patch(_SETTINGS, return_value=_settings("http://b:6333")):
+            store_b = QdrantStore.from_settings()
         mock_a = AsyncMock()
         mock_b = AsyncMock()
         store_a._shared_client = mock_a
         store_b._shared_client = mock_b
-        _active_stores.append(store_a)
-        _active_stores.append(store_b)
         await close_all_qdrant_stores()
         mock_a.close.assert_awaited_once()
         mock_b.close.assert_awaited_once()
         assert store_a._shared_client is None
         assert store_b._shared_client is None
-        assert len(_active_stores) == 0
+        assert len(registry) == 0
 
     @pytest.mark.asyncio
-    async def test_close_all_is_idempotent(self) -> None:
+    async def test_close_all_is_idempotent(
+        self, registry: dict[tuple[object, ...], QdrantStore]
+    ) -> None:
         await close_all_qdrant_stores()
-        assert len(_active_stores) == 0
+        assert len(registry) == 0
         # Second call should not raise
         await close_all_qdrant_stores()
-        assert len(_active_stores) == 0
+        assert len(registry) == 0
+
+
+class TestClientOptions:
+    def test_rest_client_keeps_connections_alive(self) -> None:
+        store = QdrantStore(
+            url="http://localhost:6333", max_connections=5, keepalive_seconds=15.0
+        )
+        with patch("qdrant_client.AsyncQdrantClient") as client_cls:
+            store._create_client()
+        limits = client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 5
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 15.0
+
+    def test_grpc_client_sends_keepalive_pings(self) -> None:
+        store = QdrantStore(
+            url="http://qdrant:6333", prefer_grpc=True, keepalive_seconds=20.0
+        )
+        with patch("qdrant_client.AsyncQdrantClient") as client_cls:
+            store._create_client()
+        kwargs = client_cls.call_args.kwargs
+        assert kwargs["prefer_grpc"] is True
+        assert kwargs["grpc_options"]["grpc.keepalive_time_ms"] == 20_000
+
+
+class TestUpsert:
+    @pytest.mark.asyncio
+    async def test_points_are_batched_by_bytes(self) -> None:
+        store = QdrantStore(url="http://localhost:6333", upsert_max_bytes=120)
+        client = AsyncMock()
+        store._shared_client = client
+
+        await store.upsert(
+            collection="c",
+            points=[
+                {"id": "a", "vector": np.ones(4, dtype=np.float32), "payload": {}},
+                {"id": "b", "vector": [0.5, 0.25, 0.0, 1.0], "payload": {"k": "v"}},
+                {"id": "c", "vector": np.zeros(4, dtype=np.float32)},
+                {"id": "bad", "vector": ["x"]},
+                {"vector": [1.0]},
+            ],
+        )
+
+        batches = [call.kwargs["points"] for call in client.upsert.await_args_list]
+        assert [[p.id for p in b] for b in batches] == [["a", "b"], ["c"]]
+        assert batches[0][1].vector == [0.5, 0.25, 0.0, 1.0]
+        assert batches[0][0].vector == [1.0, 1.0, 1.0, 1.0]
+
+    def test_batch_by_bytes(self) -> None:
+        batches = list(batch_by_bytes("abcd", [40, 40, 300, 10], max_bytes=100))
+        assert batches == [["a", "b"], ["c"], ["d"]]
@@ -0,0 +1,42 @@
+"""Tests for the cost-aware token-bucket rate limiter (local fallback)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import veupath_chatbot.platform.rate_limit as rate_limit_module
+from veupath_chatbot.platform.rate_limit import TokenBucketLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(
+        rate_limit_module, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    return now
+
+
+class TestTokenBucketLimiter:
+    async def test_spends_costs_until_empty(self, clock: list[float]) -> None:
+        limiter = TokenBucketLimiter(burst=10, refill_per_second=1)
+        assert await limiter.acquire("user:a", 4) == 0
+        assert await limiter.acquire("user:a", 6) == 0
+        assert await limiter.acquire("user:a", 2) == pytest.approx(2.0)
+
+    async def test_refills_over_time(self, clock: list[float]) -> None:
+        limiter = TokenBucketLimiter(burst=10, refill_per_second=2)
+        assert await limiter.acquire("user:a", 10) == 0
+        clock[0] += 1.5
+        assert await limiter.acquire("user:a", 3) == 0
+        assert await limiter.acquire("user:a", 1) == pytest.approx(0.5)
+
+    async def test_buckets_are_per_key(self, clock: list[float]) -> None:
+        limiter = TokenBucketLimiter(burst=5, refill_per_second=1)
+        assert await limiter.acquire("user:a", 5) == 0
+        assert await limiter.acquire("user:b", 5) == 0
+        assert await limiter.acquire("user:a", 1) > 0
+
+    async def test_cost_is_capped_at_burst(self, clock: list[float]) -> None:
+        limiter = TokenBucketLimiter(burst=5, refill_per_second=1)
+        assert await limiter.acquire("user:a", 50) == 0
@@ -3,7 +3,9 @@
 from unittest.mock import patch
 
 import pytest
+from kani import ChatMessage
 
+from veupath_chatbot.ai.engines.prompt_cache import PROMPT_CACHE_BOUNDARY
 from veupath_chatbot.ai.engines.responses_openai import ResponsesOpenAIEngine
 
 
@@ -162,3 +164,42 @@ class TestSupportsReasoningFlag:
     def test_supports_reasoning(self, model, expected):
         engine = _make_engine(model)
         assert engine._supports_reasoning is expected
+
+
+# ---------------------------------------------------------------------------
+# Prompt-prefix caching
+# ---------------------------------------------------------------------------
+
+
+class TestPromptCacheKey:
+    """Requests carry a prompt_cache_key derived from the static prefix."""
+
+    def _key(self, engine, messages) -> str:
+        with patch(
+            "kani.engines.openai.OpenAIEngine._prepare_request",
+            return_value=({"model": engine.model}, _TRANSLATED, _TOOLS),
+        ):
+            kwargs, _, _ = engine._prepare_request(messages, [])
+        return kwargs["extra_body"]["prompt_cache_key"]
+
+    def test_key_ignores_per_turn_context(self):
+        engine = _make_engine("gpt-4.1")
+        a = [ChatMessage.system("Static" + PROMPT_CACHE_BOUNDARY + "nodes: 1")]
+        b = [ChatMessage.system("Static" + PROMPT_CACHE_BOUNDARY + "nodes: 2")]
+        assert self._key(engine, a) == self._key(engine, b)
+
+    def test_key_changes_with_static_prompt(self):
+        engine = _make_engine("gpt-4.1")
+        assert self._key(engine, [ChatMessage.system("A")]) != self._key(
+            engine, [ChatMessage.system("B")]
+        )
+
+    def test_chat_api_gets_no_key(self):
+        with patch("kani.engines.openai.OpenAIEngine.__init__", _fake_openai_init):
+            engine = ResponsesOpenAIEngine(model="llama3", api_type="chat")
+        with patch(
+            "kani.engines.openai.OpenAIEngine._prepare_request",
+            return_value=({"model": "llama3"}, _TRANSLATED, _TOOLS),
+        ):
+            kwargs, _, _ = engine._prepare_request([], [])
+        assert "extra_body" not in kwargs
@@ -6,6 +6,8 @@ from collections.abc import MutableSequence
 import pytest
 
 from veupath_chatbot.ai.orchestration.scheduler import (
+    FairShareBudget,
+    critical_path_lengths,
     partition_task_results,
     run_nodes_with_dependencies,
 )
@@ -429,6 +431,186 @@ class TestResultsByIdPrePopulated:
         assert "A" in results_by_id
 
 
+# ===================================================================
+# run_nodes_with_dependencies — critical-path priority
+# ===================================================================
+
+
+class TestCriticalPathPriority:
+    """Ready nodes start longest-remaining-chain first."""
+
+    def test_critical_path_lengths(self) -> None:
+        dependents = {"A": ["B"], "B": ["C"], "X": ["C"]}
+        lengths = critical_path_lengths({"A", "B", "C", "X", "Y"}, dependents)
+        assert lengths == {"A": 3, "B": 2, "C": 1, "X": 2, "Y": 1}
+
+    def test_critical_path_lengths_tolerates_cycles(self) -> None:
+        lengths = critical_path_lengths({"A", "B"}, {"A": ["B"], "B": ["A"]})
+        assert set(lengths) == {"A", "B"}
+
+    @pytest.mark.asyncio
+    async def test_longest_chain_runs_first(self) -> None:
+        """Short, early-declared nodes wait behind the head of a long chain."""
+        order: list[str] = []
+        nodes: dict[str, JSONObject] = {
+            "short1": {"task": "s1"},
+            "short2": {"task": "s2"},
+            "head": {"task": "h"},
+            "mid": {"task": "m", "depends_on": ["head"]},
+            "tail": {"task": "t", "depends_on": ["mid"]},
+        }
+        dependents = {"head": ["mid"], "mid": ["tail"]}
+
+        await run_nodes_with_dependencies(
+            nodes_by_id=nodes,
+            dependents=dependents,
+            max_concurrency=1,
+            run_node=_make_run_node(order=order),
+            format_dependency_context=_no_context,
+        )
+
+        # Once the chain is no longer than the side branches, ties fall back
+        # to declaration order.
+        assert order == ["head", "mid", "short1", "short2", "tail"]
+
+    @pytest.mark.asyncio
+    async def test_ties_keep_declaration_order(self) -> None:
+        order: list[str] = []
+        nodes: dict[str, JSONObject] = {"A": {}, "B": {}, "C": {}}
+
+        await run_nodes_with_dependencies(
+            nodes_by_id=nodes,
+            dependents={},
+            max_concurrency=1,
+            run_node=_make_run_node(order=order),
+            format_dependency_context=_no_context,
+        )
+
+        assert order == ["A", "B", "C"]
+
+
+# ===================================================================
+# FairShareBudget
+# ===================================================================
+
+
+class TestFairShareBudget:
+    """Slots are shared across calls and handed out fairly per owner."""
+
+    @pytest.mark.asyncio
+    async def test_combine_nodes_skip_budget_and_cap(self) -> None:
+        budget = FairShareBudget(1)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with budget.slot("other"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        run = asyncio.create_task(
+            run_nodes_with_dependencies(
+                nodes_by_id={"a": {"task": "A"}, "c": {"kind": "combine"}},
+                dependents={},
+                max_concurrency=1,
+                run_node=_make_run_node(order),
+                format_dependency_context=_no_context,
+                budget=budget,
+                owner="me",
+            )
+        )
+        await asyncio.sleep(0.01)
+        assert order == ["c"]
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(run, holder), timeout=1)
+        assert order == ["c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_freed_slot_goes_to_owner_with_fewest(self) -> None:
+        budget = FairShareBudget(2)
+        grants: list[str] = []
+        release = asyncio.Event()
+
+        async def hold(owner: str) -> None:
+            async with budget.slot(owner):
+                grants.append(owner)
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold("alice")) for _ in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(hold("bob")))
+        await asyncio.sleep(0)
+        assert grants == ["alice", "alice"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        # Bob queued after alice's backlog but is served on the first release.
+        assert grants[2] == "bob"
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        budget = FairShareBudget(1)
+        release = asyncio.Event()
+
+        async def hold(owner: str) -> None:
+            async with budget.slot(owner):
+                await release.wait()
+
+        holder = asyncio.create_task(hold("alice"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold("bob"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert budget.in_use == 0
+        async with budget.slot("carol"):
+            assert budget.held_by("carol") == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_concurrent_delegations(self) -> None:
+        """Two delegations share one budget instead of each getting their own."""
+        budget = FairShareBudget(2)
+        active = 0
+        peak = 0
+
+        async def run_node(
+            node_id: str, node: JSONObject, dep_context: str | None
+        ) -> JSONObject:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"ok": True, "node_id": node_id}
+
+        nodes: dict[str, JSONObject] = {"A": {}, "B": {}, "C": {}}
+
+        await asyncio.gather(
+            *(
+                run_nodes_with_dependencies(
+                    nodes_by_id=nodes,
+                    dependents={},
+                    max_concurrency=3,
+                    run_node=run_node,
+                    format_dependency_context=_no_context,
+                    budget=budget,
+                    owner=owner,
+                )
+                for owner in ("alice", "bob")
+            )
+        )
+
+        assert peak == 2
+
+
 # ===================================================================
 # partition_task_results
 # ===================================================================
@@ -1,5 +1,8 @@
 """Tests for search reranking utilities."""
 
+import pytest
+
+from veupath_chatbot.services import search_rerank
 from veupath_chatbot.services.search_rerank import (
     ScoredResult,
     _build_wildcard_ids,
@@ -8,6 +11,7 @@ from veupath_chatbot.services.search_rerank import (
     dedup_and_sort,
     score_field_quality,
     score_text_match,
+    score_text_matches,
 )
 
 # ---------------------------------------------------------------------------
@@ -41,6 +45,34 @@ class TestScoreTextMatch:
         assert 0.0 < score < 1.0
 
 
+class TestScoreTextMatches:
+    def test_matches_single_scorer(self) -> None:
+        values = ["PF3D7_1234500", "pf3d7", "xPF3D7x", "malaria", "", "zzz"]
+        assert score_text_matches("PF3D7", values) == pytest.approx(
+            [score_text_match("PF3D7", v) for v in values]
+        )
+
+    def test_cutoff_prunes_weak_fuzzy_scores(self) -> None:
+        weak = score_text_match("kinase", "PF3D7_1133400")
+        assert weak < 0.9
+        scores = score_text_matches(
+            "kinase", ["PF3D7_1133400", "kinase"], score_cutoff=0.9
+        )
+        assert scores == [0.0, 1.0]
+
+    def test_large_batch_scored_in_parallel(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(search_rerank, "PARALLEL_MIN_CHOICES", 2)
+        values = ["malaria", "malarial", "plasmodium", "tubulin"]
+        assert score_text_matches("malaira", values) == pytest.approx(
+            [score_text_match("malaira", v) for v in values]
+        )
+
+    def test_empty_values(self) -> None:
+        assert score_text_matches("query", []) == []
+
+
 # ---------------------------------------------------------------------------
 # score_field_quality
 # ---------------------------------------------------------------------------
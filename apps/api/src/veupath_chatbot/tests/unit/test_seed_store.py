@@ -0,0 +1,112 @@
+"""Tests for the on-disk seed corpus (gzip'd JSONL + manifest)."""
+
+import gzip
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from veupath_chatbot.services.experiment.seed import seeds as seed_catalog
+from veupath_chatbot.services.experiment.seed.store import (
+    DATA_DIR,
+    iter_site_seeds,
+    load_manifest,
+    write_site_seeds,
+)
+from veupath_chatbot.services.experiment.seed.types import ControlSetDef, SeedDef
+
+
+def _seed(name: str, site_id: str = "plasmodb") -> SeedDef:
+    return SeedDef(
+        name=name,
+        description=f"{name} description",
+        site_id=site_id,
+        step_tree={"id": "s1", "searchName": "GenesByTaxon"},
+        control_set=ControlSetDef(
+            name=f"{name} controls",
+            positive_ids=["PF3D7_0100100", "PF3D7_0100200"],
+            negative_ids=["PF3D7_0200100"],
+            provenance_notes="test",
+            tags=["demo"],
+        ),
+        record_type="gene",
+    )
+
+
+class TestWriteAndRead:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        seeds = [_seed("A"), _seed("B")]
+        write_site_seeds("plasmodb", seeds, tmp_path)
+
+        assert list(iter_site_seeds("plasmodb", tmp_path)) == seeds
+        assert load_manifest(tmp_path).sites["plasmodb"].names == ["A", "B"]
+
+    def test_output_is_deterministic(self, tmp_path: Path) -> None:
+        first = write_site_seeds("plasmodb", [_seed("A")], tmp_path)
+        data = (tmp_path / first.file).read_bytes()
+        second = write_site_seeds("plasmodb", [_seed("A")], tmp_path)
+
+        assert second.sha256 == first.sha256
+        assert (tmp_path / second.file).read_bytes() == data
+
+    def test_manifest_keeps_other_sites(self, tmp_path: Path) -> None:
+        write_site_seeds("plasmodb", [_seed("A")], tmp_path)
+        write_site_seeds("toxodb", [_seed("T", "toxodb")], tmp_path)
+        write_site_seeds("plasmodb", [_seed("A2")], tmp_path)
+
+        manifest = load_manifest(tmp_path)
+        assert list(manifest.sites) == ["plasmodb", "toxodb"]
+        assert manifest.find_site("T") == "toxodb"
+        assert manifest.find_site("A") is None
+
+    def test_rejects_file_not_matching_manifest_hash(self, tmp_path: Path) -> None:
+        entry = write_site_seeds("plasmodb", [_seed("A")], tmp_path)
+        path = tmp_path / entry.file
+        path.write_bytes(
+            gzip.compress(gzip.decompress(path.read_bytes()) + b"\n", mtime=0)
+        )
+
+        with pytest.raises(ValueError, match="manifest hash"):
+            next(iter_site_seeds("plasmodb", tmp_path))
+
+    def test_rejects_seed_for_another_site(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="belongs to"):
+            write_site_seeds("plasmodb", [_seed("T", "toxodb")], tmp_path)
+
+    def test_unknown_site_raises(self, tmp_path: Path) -> None:
+        write_site_seeds("plasmodb", [_seed("A")], tmp_path)
+        with pytest.raises(ValueError, match="No seeds"):
+            list(iter_site_seeds("nosuchdb", tmp_path))
+
+    def test_ids_are_interned(self, tmp_path: Path) -> None:
+        write_site_seeds("plasmodb", [_seed("A"), _seed("B")], tmp_path)
+        a, b = iter_site_seeds("plasmodb", tmp_path)
+        assert a.control_set.positive_ids[0] is b.control_set.positive_ids[0]
+
+
+class TestShippedCorpus:
+    def test_manifest_matches_data_files(self) -> None:
+        for site_id, entry in load_manifest().sites.items():
+            data = (DATA_DIR / entry.file).read_bytes()
+            assert hashlib.sha256(data).hexdigest() == entry.sha256, site_id
+            names = [s.name for s in iter_site_seeds(site_id)]
+            assert names == entry.names, site_id
+
+    def test_data_files_are_gzip_jsonl(self) -> None:
+        for entry in load_manifest().sites.values():
+            with gzip.open(DATA_DIR / entry.file, "rt", encoding="utf-8") as fh:
+                assert sum(1 for _ in fh) == len(entry.names)
+
+    def test_count_matches_stream(self) -> None:
+        assert seed_catalog.count_seeds() == sum(1 for _ in seed_catalog.iter_seeds())
+        assert seed_catalog.count_seeds("plasmodb") == len(
+            seed_catalog.get_seeds_for_site("plasmodb")
+        )
+
+    def test_load_seed_by_name(self) -> None:
+        name = load_manifest().sites["toxodb"].names[0]
+        seed = seed_catalog.load_seed(name)
+        assert seed is not None
+        assert seed.name == name
+        assert seed.site_id == "toxodb"
+        assert seed_catalog.load_seed("no such seed") is None
@@ -0,0 +1,151 @@
+"""Tests for background startup warmup and subsystem readiness reporting."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from veupath_chatbot.jobs import startup_warmup
+from veupath_chatbot.platform.health import (
+    get_subsystem_state,
+    reset_subsystems,
+    set_subsystem_state,
+    subsystem_report,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_subsystems() -> Iterator[None]:
+    reset_subsystems()
+    yield
+    reset_subsystems()
+
+
+class TestSubsystemRegistry:
+    def test_unreported_subsystem_has_no_state(self) -> None:
+        assert get_subsystem_state("catalog") is None
+        assert subsystem_report() == {}
+
+    def test_report_is_sorted_and_includes_detail(self) -> None:
+        set_subsystem_state("vectorstore", "failed", "connection refused")
+        set_subsystem_state("catalog", "ready")
+
+        report = subsystem_report()
+
+        assert list(report) == ["catalog", "vectorstore"]
+        assert report["catalog"] == {"state": "ready"}
+        assert report["vectorstore"] == {
+            "state": "failed",
+            "detail": "connection refused",
+        }
+
+    def test_latest_state_wins(self) -> None:
+        set_subsystem_state("catalog", "warming")
+        set_subsystem_state("catalog", "ready")
+        assert get_subsystem_state("catalog") == "ready"
+
+
+@pytest.fixture
+def warmup_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Patch every dependency of the warmup job and record call order."""
+    calls: list[str] = []
+
+    settings = MagicMock()
+    settings.rag_enabled = True
+    settings.catalog_preload_all_sites = False
+    settings.catalog_preload_concurrency = 2
+    monkeypatch.setattr(startup_warmup, "get_settings", lambda: settings)
+
+    async def _ensure() -> None:
+        calls.append("collections")
+
+    monkeypatch.setattr(startup_warmup, "ensure_rag_collections", _ensure)
+
+    router = MagicMock()
+    router.get_default_site.return_value.id = "veupathdb"
+    monkeypatch.setattr(startup_warmup, "get_site_router", lambda: router)
+
+    discovery = MagicMock()
+
+    async def _get_catalog(site_id: str) -> None:
+        calls.append(f"catalog:{site_id}")
+
+    async def _preload_all(**kwargs: object) -> None:
+        calls.append("catalog:all")
+
+    discovery.get_catalog = AsyncMock(side_effect=_get_catalog)
+    discovery.preload_all = AsyncMock(side_effect=_preload_all)
+    monkeypatch.setattr(startup_warmup, "get_discovery_service", lambda: discovery)
+
+    async def _ingest() -> None:
+        calls.append("ingest")
+
+    monkeypatch.setattr(
+        startup_warmup, "start_rag_startup_ingestion_background", _ingest
+    )
+    return {
+        "calls": calls,
+        "settings": settings,
+        "discovery": discovery,
+    }
+
+
+class TestRunStartupWarmup:
+    async def test_default_site_and_collections_warm_before_the_rest(
+        self, warmup_env: dict[str, Any]
+    ) -> None:
+        warmup_env["settings"].catalog_preload_all_sites = True
+
+        await startup_warmup.run_startup_warmup()
+
+        calls = warmup_env["calls"]
+        assert set(calls[:2]) == {"collections", "catalog:veupathdb"}
+        assert calls[2:] == ["ingest", "catalog:all"]
+        warmup_env["discovery"].preload_all.assert_awaited_once_with(
+            first=["veupathdb"], concurrency=2
+        )
+        assert get_subsystem_state(startup_warmup.VECTORSTORE) == "ready"
+        assert get_subsystem_state(startup_warmup.CATALOG) == "ready"
+        assert get_subsystem_state(startup_warmup.CATALOG_ALL_SITES) == "ready"
+
+    async def test_other_sites_load_lazily_by_default(
+        self, warmup_env: dict[str, Any]
+    ) -> None:
+        await startup_warmup.run_startup_warmup()
+
+        warmup_env["discovery"].preload_all.assert_not_called()
+        assert get_subsystem_state(startup_warmup.CATALOG_ALL_SITES) == "disabled"
+
+    async def test_rag_disabled_skips_collections(
+        self, warmup_env: dict[str, Any]
+    ) -> None:
+        warmup_env["settings"].rag_enabled = False
+
+        await startup_warmup.run_startup_warmup()
+
+        assert "collections" not in warmup_env["calls"]
+        assert get_subsystem_state(startup_warmup.VECTORSTORE) == "disabled"
+
+    async def test_failures_are_reported_not_raised(
+        self, warmup_env: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def _boom() -> None:
+            raise RuntimeError("qdrant down")
+
+        monkeypatch.setattr(startup_warmup, "ensure_rag_collections", _boom)
+        warmup_env["discovery"].get_catalog.side_effect = RuntimeError("wdk down")
+
+        await startup_warmup.run_startup_warmup()
+
+        report = subsystem_report()
+        assert report[startup_warmup.VECTORSTORE] == {
+            "state": "failed",
+            "detail": "qdrant down",
+        }
+        assert report[startup_warmup.CATALOG] == {
+            "state": "failed",
+            "detail": "wdk down",
+        }
+        # Later stages still run.
+        assert "ingest" in warmup_env["calls"]
@@ -0,0 +1,126 @@
+"""Tests for the cached, columnar step result table."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.wdk.step_results import (
+    ResultTable,
+    cached_result_table,
+    get_result_table,
+)
+
+
+def _record(gene_id: str, **attrs: str | None) -> JSONObject:
+    return {"id": [{"name": "source_id", "value": gene_id}], "attributes": attrs}
+
+
+def _paged_api(total: int, *, report_total: bool = True) -> MagicMock:
+    """Mock API serving *total* records in WDK-style pages."""
+
+    async def _records(step_id: int, **kwargs: object) -> JSONObject:
+        pagination = kwargs["pagination"]
+        assert isinstance(pagination, dict)
+        start = pagination["offset"]
+        end = min(total, start + pagination["numRecords"])
+        answer: JSONObject = {
+            "records": [_record(f"G{i}", score=str(i)) for i in range(start, end)]
+        }
+        if report_total:
+            answer["meta"] = {"totalCount": total}
+        return answer
+
+    api = MagicMock()
+    api.get_step_records = AsyncMock(side_effect=_records)
+    return api
+
+
+class TestGetResultTable:
+    async def test_loads_all_pages(self) -> None:
+        api = _paged_api(250)
+        table = await get_result_table(api, site_id="plasmodb", step_id=1)
+        assert len(table) == 250
+        assert table.ids[:2] == ["G0", "G1"]
+        assert table.ids[-1] == "G249"
+        assert not table.truncated
+        assert api.get_step_records.await_count == 3
+
+    async def test_caps_records_and_marks_truncated(self) -> None:
+        api = _paged_api(1200)
+        table = await get_result_table(
+            api, site_id="plasmodb", step_id=1, max_records=300
+        )
+        assert len(table) == 300
+        assert table.total_count == 1200
+        assert table.truncated
+
+    async def test_unknown_total_pages_until_short_page(self) -> None:
+        api = _paged_api(150, report_total=False)
+        table = await get_result_table(api, site_id="plasmodb", step_id=1)
+        assert len(table) == 150
+        assert not table.truncated
+
+    async def test_cached_per_site_step_and_attributes(self) -> None:
+        api = _paged_api(10)
+        first = await get_result_table(api, site_id="plasmodb", step_id=1)
+        again = await get_result_table(api, site_id="plasmodb", step_id=1)
+        assert again is first
+        assert cached_result_table("plasmodb", 1) is first
+        await get_result_table(api, site_id="plasmodb", step_id=1, attributes=["score"])
+        assert api.get_step_records.await_count == 2
+
+    async def test_concurrent_callers_share_one_load(self) -> None:
+        api = _paged_api(10)
+        a, b = await asyncio.gather(
+            get_result_table(api, site_id="plasmodb", step_id=1),
+            get_result_table(api, site_id="plasmodb", step_id=1),
+        )
+        assert a is b
+        assert api.get_step_records.await_count == 1
+
+
+class TestResultTable:
+    def _table(self) -> ResultTable:
+        return ResultTable.from_records(
+            [
+                _record("A", score="10", product="kinase"),
+                _record("B", score="2.5"),
+                _record("C", score=None, product="Protein Kinase"),
+                _record("D", score="100", product="transporter"),
+            ],
+            total_count=4,
+        )
+
+    def test_missing_attributes_are_none(self) -> None:
+        table = self._table()
+        assert table.columns["product"] == [
+            "kinase",
+            None,
+            "Protein Kinase",
+            "transporter",
+        ]
+        assert table.row(1) == {
+            "geneId": "B",
+            "attributes": {"score": "2.5", "product": None},
+        }
+
+    def test_sorts_numerically_with_missing_last(self) -> None:
+        table = self._table()
+        ids = [table.ids[i] for i in table.select(sort="score")]
+        assert ids == ["B", "A", "D", "C"]
+        ids = [table.ids[i] for i in table.select(sort="score", descending=True)]
+        assert ids == ["D", "A", "B", "C"]
+
+    def test_filters_and_pages(self) -> None:
+        table = self._table()
+        rows = table.select(
+            where=lambda attrs: "kinase" in str(attrs.get("product") or "").lower(),
+            offset=1,
+            limit=5,
+        )
+        assert [table.ids[i] for i in rows] == ["C"]
+
+    def test_find(self) -> None:
+        table = self._table()
+        assert table.find("D") == 3
+        assert table.find("Z") is None
@@ -19,6 +19,8 @@ from veupath_chatbot.platform.errors import InternalError, WDKError
 def _make_client() -> MagicMock:
     """Create a mock VEuPathDB client with all needed async methods."""
     client = MagicMock()
+    client.base_url = "https://wdk.test/service"
+    client.analysis_poll_max_interval = 5.0
     client.get = AsyncMock()
     client.post = AsyncMock()
     client.put = AsyncMock()
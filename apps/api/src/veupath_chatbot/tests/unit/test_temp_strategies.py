@@ -0,0 +1,263 @@
+"""Tests for the temp-strategy ledger and its reaper."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+import veupath_chatbot.platform.redis as redis_module
+from veupath_chatbot.domain.strategy.ast import StepTreeNode
+from veupath_chatbot.jobs.temp_strategy_reaper import reap_once
+from veupath_chatbot.platform.context import veupathdb_auth_token_ctx
+from veupath_chatbot.platform.errors import WDKError
+from veupath_chatbot.platform.security import decrypt_secret
+from veupath_chatbot.services.wdk import temp_strategies
+from veupath_chatbot.services.wdk.temp_strategies import (
+    RETRY_SECONDS,
+    reap_expired_temp_strategies,
+    record_temp_strategy,
+    sweep_unrecorded_temp_strategies,
+)
+
+BASE_URL = "https://plasmodb.org/plasmo/service"
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeAsyncRedis:
+    fake = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(redis_module, "_redis", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+async def _end_leases() -> AsyncIterator[None]:
+    yield
+    for task in temp_strategies._leases.values():
+        task.cancel()
+    temp_strategies._leases.clear()
+
+
+@pytest.fixture
+def reaper_api() -> Iterator[AsyncMock]:
+    """The StrategyAPI the reaper resolves for ``BASE_URL``."""
+    api = AsyncMock()
+    with (
+        patch.object(
+            temp_strategies,
+            "list_sites",
+            return_value=[MagicMock(id="plasmodb", service_url=BASE_URL + "/")],
+        ),
+        patch.object(temp_strategies, "get_strategy_api", return_value=api),
+    ):
+        yield api
+
+
+async def _record(strategy_id: int, *, ttl: float, token: str | None = None) -> None:
+    api = MagicMock()
+    api.client.base_url = BASE_URL
+    reset = veupathdb_auth_token_ctx.set(token)
+    try:
+        await record_temp_strategy(
+            api, strategy_id, StepTreeNode(strategy_id * 10), ttl_seconds=ttl
+        )
+    finally:
+        veupathdb_auth_token_ctx.reset(reset)
+
+
+class TestReaper:
+    async def test_deletes_only_expired_entries_as_their_owner(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await _record(1, ttl=-1, token="owner-token")
+        await _record(2, ttl=3600)
+        tokens: list[str | None] = []
+
+        async def _delete(strategy_id: int) -> None:
+            tokens.append(veupathdb_auth_token_ctx.get())
+
+        reaper_api.delete_strategy.side_effect = _delete
+
+        assert await reap_expired_temp_strategies() == 1
+
+        reaper_api.delete_strategy.assert_awaited_once_with(1)
+        assert tokens == ["owner-token"]
+        assert veupathdb_auth_token_ctx.get() is None
+        assert await redis.hkeys("wdk_temp:entries") == [f"{BASE_URL}|2".encode()]
+        assert await redis.zcard("wdk_temp:expiry") == 1
+
+    async def test_transient_failure_is_retried_later(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await _record(1, ttl=-1)
+        reaper_api.delete_strategy.side_effect = WDKError("down", status=503)
+        now = time.time()
+
+        assert await reap_expired_temp_strategies(now=now) == 1
+        assert await reap_expired_temp_strategies(now=now) == 0
+        score = await redis.zscore("wdk_temp:expiry", f"{BASE_URL}|1")
+        assert score == pytest.approx(now + RETRY_SECONDS)
+
+    async def test_repeated_failures_are_abandoned(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await _record(1, ttl=-1)
+        reaper_api.delete_strategy.side_effect = WDKError("down", status=503)
+        now = time.time()
+
+        with patch.object(
+            temp_strategies,
+            "get_settings",
+            return_value=MagicMock(temp_strategy_max_reap_attempts=2),
+        ):
+            await reap_expired_temp_strategies(now=now)
+            assert await redis.hlen("wdk_temp:entries") == 1
+            await reap_expired_temp_strategies(now=now + RETRY_SECONDS)
+
+        assert reaper_api.delete_strategy.await_count == 2
+        assert await redis.hlen("wdk_temp:entries") == 0
+        assert await redis.zcard("wdk_temp:expiry") == 0
+        assert await redis.hlen("wdk_temp:attempts") == 0
+
+    async def test_concurrent_reapers_claim_each_entry_once(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await _record(1, ttl=-1)
+
+        claimed = await asyncio.gather(
+            reap_expired_temp_strategies(), reap_expired_temp_strategies()
+        )
+
+        assert sorted(claimed) == [0, 1]
+        reaper_api.delete_strategy.assert_awaited_once_with(1)
+
+    async def test_gone_strategy_is_dropped(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await _record(1, ttl=-1)
+        reaper_api.delete_strategy.side_effect = WDKError("gone", status=404)
+
+        await reap_expired_temp_strategies()
+
+        assert await redis.hlen("wdk_temp:entries") == 0
+        assert await redis.zcard("wdk_temp:expiry") == 0
+
+    async def test_orphaned_expiry_member_is_dropped(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        await redis.zadd("wdk_temp:expiry", {f"{BASE_URL}|9": 0})
+
+        assert await reap_expired_temp_strategies() == 1
+
+        reaper_api.delete_strategy.assert_not_awaited()
+        assert await redis.zcard("wdk_temp:expiry") == 0
+
+    async def test_reap_once_drains_in_batches(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        for strategy_id in range(1, 6):
+            await _record(strategy_id, ttl=-1)
+
+        with patch(
+            "veupath_chatbot.jobs.temp_strategy_reaper.get_settings",
+            return_value=MagicMock(temp_strategy_reaper_batch_size=2),
+        ):
+            assert await reap_once() == 5
+
+        assert reaper_api.delete_strategy.await_count == 5
+        assert await redis.hlen("wdk_temp:entries") == 0
+
+    async def test_entry_records_owner_and_steps(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _record(4, ttl=60, token="tok")
+
+        raw = await redis.hget("wdk_temp:entries", f"{BASE_URL}|4")
+        assert raw is not None
+        entry = json.loads(raw)
+        assert entry["step_ids"] == [40]
+        assert "auth_token" not in entry
+        assert entry["expires_at"] - entry["created_at"] == pytest.approx(60)
+
+    async def test_token_is_stored_encrypted_with_a_ttl(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _record(4, ttl=60, token="tok")
+
+        sealed = await redis.get(f"wdk_temp:token:{BASE_URL}|4")
+        assert sealed is not None
+        assert b"tok" not in sealed
+        assert decrypt_secret(sealed) == "tok"
+        assert await redis.ttl(f"wdk_temp:token:{BASE_URL}|4") > 60
+
+    async def test_service_token_strategies_store_no_token(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _record(4, ttl=60)
+
+        assert await redis.exists(f"wdk_temp:token:{BASE_URL}|4") == 0
+
+    async def test_legacy_entry_with_inline_token_is_still_reaped(
+        self, redis: fakeredis.FakeAsyncRedis, reaper_api: AsyncMock
+    ) -> None:
+        member = f"{BASE_URL}|5"
+        legacy = {
+            "base_url": BASE_URL,
+            "strategy_id": 5,
+            "step_ids": [50],
+            "owner": None,
+            "auth_token": "plain",
+            "created_at": 0,
+            "expires_at": 0,
+        }
+        await redis.hset("wdk_temp:entries", member, json.dumps(legacy))
+        await redis.zadd("wdk_temp:expiry", {member: 0})
+
+        await reap_expired_temp_strategies()
+
+        reaper_api.delete_strategy.assert_awaited_once_with(5)
+        assert await redis.hlen("wdk_temp:entries") == 0
+
+
+class TestLease:
+    async def test_lease_is_renewed_until_ended(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _record(1, ttl=0.3)
+        member = f"{BASE_URL}|1"
+        first = await redis.zscore("wdk_temp:expiry", member)
+        assert first is not None
+
+        await asyncio.sleep(0.25)
+        renewed = await redis.zscore("wdk_temp:expiry", member)
+        assert renewed is not None and renewed > first
+
+        api = MagicMock()
+        api.client.base_url = BASE_URL
+        temp_strategies.end_temp_strategy_lease(api, 1)
+        assert member not in temp_strategies._leases
+
+
+class TestSweepUnrecorded:
+    async def test_skips_recorded_and_foreign_strategies(
+        self, redis: fakeredis.FakeAsyncRedis
+    ) -> None:
+        await _record(1, ttl=-1)
+        api = AsyncMock()
+        api.client = MagicMock(base_url=BASE_URL)
+        old = "2020-01-01T00:00:00Z"
+        items = [
+            {"strategyId": 1, "name": "__pathfinder_internal__:Pathfinder tree eval"},
+            {"strategyId": 2, "name": "__pathfinder_internal__:Pathfinder tree eval"},
+            {"strategyId": 3, "name": "My strategy"},
+            {"strategyId": 4, "name": "__pathfinder_internal__:Experiment"},
+        ]
+        for item in items:
+            item["lastModified"] = old
+
+        assert await sweep_unrecorded_temp_strategies(api, items) == 1
+
+        api.delete_strategy.assert_awaited_once_with(2)
@@ -0,0 +1,127 @@
+"""Tests for single-pass threshold sweep scoring."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from veupath_chatbot.services.experiment.evaluation import run_single_pass_sweep
+from veupath_chatbot.services.experiment.metrics import metrics_from_control_result
+from veupath_chatbot.services.experiment.threshold_sweep import (
+    SinglePassUnavailableError,
+    local_control_results,
+    loosest_threshold,
+)
+
+# Loosest fold-change result (fold_change >= 1.0): ids with their values.
+_RECORDS = [
+    ("g1", 1.0),
+    ("g2", 1.5),
+    ("g3", 2.0),
+    ("g4", 3.0),
+    ("g5", 4.0),
+]
+
+
+class TestLoosestThreshold:
+    def test_min_direction_takes_smallest(self) -> None:
+        assert loosest_threshold([2.0, 1.0, 3.0], "min") == 1.0
+
+    def test_max_direction_takes_largest(self) -> None:
+        assert loosest_threshold([0.01, 0.05, 0.001], "max") == 0.05
+
+
+class TestLocalControlResults:
+    def test_min_direction_counts_at_or_above(self) -> None:
+        results = local_control_results(
+            _RECORDS,
+            [1.0, 2.0, 3.5],
+            "min",
+            positive_hits={"g4", "g5", "g2"},
+            negative_hits={"g1"},
+            positive_count=4,
+            negative_count=2,
+        )
+
+        counts = [
+            (
+                r["target"]["resultCount"],  # type: ignore[index, call-overload]
+                r["positive"]["intersectionCount"],  # type: ignore[index, call-overload]
+                r["negative"]["intersectionCount"],  # type: ignore[index, call-overload]
+            )
+            for r in results
+        ]
+        assert counts == [(5, 3, 1), (3, 2, 0), (1, 1, 0)]
+
+        metrics = metrics_from_control_result(results[1])
+        assert metrics.total_results == 3
+        assert metrics.sensitivity == pytest.approx(0.5)
+        assert metrics.specificity == pytest.approx(1.0)
+
+    def test_max_direction_counts_at_or_below(self) -> None:
+        pvalues = [("a", 0.001), ("b", 0.01), ("c", 0.04), ("d", 0.05)]
+        results = local_control_results(
+            pvalues,
+            [0.05, 0.01],
+            "max",
+            positive_hits={"a", "c"},
+            negative_hits={"d"},
+            positive_count=2,
+            negative_count=1,
+        )
+
+        assert [r["target"]["resultCount"] for r in results] == [4, 2]  # type: ignore[index, call-overload]
+        assert [r["positive"]["intersectionCount"] for r in results] == [2, 1]  # type: ignore[index, call-overload]
+        assert [r["negative"]["intersectionCount"] for r in results] == [1, 0]  # type: ignore[index, call-overload]
+
+    def test_values_outside_loosest_threshold_reject_single_pass(self) -> None:
+        # A p-value attribute swept as if it were a lower bound.
+        with pytest.raises(SinglePassUnavailableError):
+            local_control_results(
+                [("a", 0.5), ("b", 0.01)],
+                [0.05, 0.1],
+                "min",
+                positive_hits=set(),
+                negative_hits=set(),
+                positive_count=0,
+                negative_count=0,
+            )
+
+
+class TestRunSinglePassSweep:
+    async def test_failing_fetch_cancels_control_run(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def _controls(**_: object) -> dict[str, object]:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def _values(**_: object) -> list[tuple[str, float]]:
+            raise RuntimeError("WDK down")
+
+        exp = MagicMock()
+        exp.config.parameters = {"fold_change": "1"}
+        with (
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.run_positive_negative_controls",
+                _controls,
+            ),
+            patch(
+                "veupath_chatbot.services.experiment.evaluation.fetch_attribute_values",
+                _values,
+            ),
+            pytest.raises(ExceptionGroup),
+        ):
+            await run_single_pass_sweep(
+                exp=exp,
+                param_name="fold_change",
+                sweep_values=["1", "2"],
+                attribute_name="fold_change",
+                direction="min",
+            )
+
+        assert cancelled.is_set()
@@ -0,0 +1,121 @@
+"""Tests for declarative agent tool-result caching."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from kani import ai_function
+from kani.ai_function import AIFunction
+
+import veupath_chatbot.platform.redis as redis_module
+from veupath_chatbot.ai.tools import tool_cache
+from veupath_chatbot.ai.tools.catalog_registry import CatalogToolsMixin
+from veupath_chatbot.ai.tools.tool_cache import (
+    ToolCachePolicy,
+    cached_tool,
+    invalidate_user_tool_results,
+)
+from veupath_chatbot.platform.context import user_id_ctx
+from veupath_chatbot.platform.types import JSONObject
+
+
+class _Tools:
+    def __init__(self, site_id: str = "plasmodb") -> None:
+        self.site_id = site_id
+        self.lookup = AsyncMock(return_value={"ok": True})
+
+    @ai_function()
+    @cached_tool(keys=("self.site_id", "name"), ttl_seconds=60)
+    async def describe(self, name: str, verbose: bool = False) -> JSONObject:
+        """Describe a search."""
+        result: JSONObject = await self.lookup(self.site_id, name)
+        return result
+
+    @ai_function()
+    @cached_tool(keys=("step_id",), ttl_seconds=60, per_user=True)
+    async def count(self, step_id: int) -> JSONObject:
+        """Count a step's results."""
+        result: JSONObject = await self.lookup(step_id)
+        return result
+
+
+@pytest.fixture
+def user() -> Iterator[str]:
+    user_id = uuid4()
+    token = user_id_ctx.set(user_id)
+    yield str(user_id)
+    user_id_ctx.reset(token)
+    tool_cache._local_generations.clear()
+
+
+class TestCachedTool:
+    async def test_repeat_call_served_from_cache(self) -> None:
+        tools = _Tools()
+
+        first = await tools.describe("GenesByTaxon")
+        second = await tools.describe("GenesByTaxon", verbose=True)
+        await tools.describe("GenesByText")
+        await _Tools(site_id="toxodb").describe("GenesByTaxon")
+
+        assert first == second == {"ok": True}
+        assert tools.lookup.await_count == 2
+
+    async def test_errors_are_not_cached(self) -> None:
+        tools = _Tools()
+        tools.lookup.return_value = {"ok": False, "code": "WDK_ERROR"}
+
+        await tools.describe("GenesByTaxon")
+        await tools.describe("GenesByTaxon")
+
+        assert tools.lookup.await_count == 2
+
+    async def test_per_user_tool_needs_a_user(self) -> None:
+        tools = _Tools()
+
+        await tools.count(1)
+        await tools.count(1)
+
+        assert tools.lookup.await_count == 2
+
+    async def test_invalidation_drops_user_results(self, user: str) -> None:
+        tools = _Tools()
+
+        await tools.count(1)
+        await tools.count(1)
+        assert tools.lookup.await_count == 1
+
+        await invalidate_user_tool_results(user)
+        await tools.count(1)
+        assert tools.lookup.await_count == 2
+
+    async def test_invalidation_is_shared_through_redis(
+        self, user: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(redis_module, "_redis", fakeredis.FakeAsyncRedis())
+        tools = _Tools()
+        await tools.count(1)
+
+        await invalidate_user_tool_results(user)
+        # Another worker's in-process tier still holds the old entry.
+        tool_cache._local_generations.clear()
+        await tools.count(1)
+
+        assert tools.lookup.await_count == 2
+
+    def test_ai_function_schema_is_preserved(self) -> None:
+        method = _Tools().describe
+        fn = AIFunction(method, **method.__ai_function__)
+
+        assert fn.name == "describe"
+        assert set(fn.json_schema["properties"]) == {"name", "verbose"}
+        assert method.__tool_cache__ == ToolCachePolicy(
+            keys=("self.site_id", "name"), ttl_seconds=60, per_user=False
+        )
+
+    def test_catalog_registry_tools_declare_policies(self) -> None:
+        policy = CatalogToolsMixin.get_search_parameters.__tool_cache__  # type: ignore[attr-defined]
+
+        assert "self.site_id" in policy.keys
+        assert not policy.per_user
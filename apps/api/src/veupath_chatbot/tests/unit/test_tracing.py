@@ -0,0 +1,124 @@
+"""Tests for timing spans, operation profiles and the span file exporter."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from veupath_chatbot.integrations.veupathdb.client import endpoint_template
+from veupath_chatbot.platform import tracing
+from veupath_chatbot.platform.tracing import (
+    configure_tracing,
+    get_operation_profile,
+    profile_operation,
+    profiled,
+    shutdown_tracing,
+    span,
+)
+
+
+class TestSpans:
+    def test_nested_spans_share_trace_and_link_parent(self) -> None:
+        with span("outer") as outer, span("inner") as inner:
+            pass
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id is None
+        assert outer.end_ns >= outer.start_ns
+
+    def test_error_is_recorded_and_reraised(self) -> None:
+        with pytest.raises(ValueError), span("boom") as failed:
+            raise ValueError("bad")
+        assert failed.error == "ValueError: bad"
+        assert failed.to_otlp()["status"] == {
+            "code": "STATUS_CODE_ERROR",
+            "message": "ValueError: bad",
+        }
+
+
+class TestProfiles:
+    def test_groups_spans_by_category_and_endpoint(self) -> None:
+        with profile_operation("op_1") as profile:
+            for _ in range(3):
+                with span("wdk.request", category="wdk", endpoint="GET /a"):
+                    pass
+            with span("wdk.request", category="wdk", endpoint="POST /b"):
+                pass
+            with (
+                pytest.raises(RuntimeError),
+                span("wdk.request", category="wdk", endpoint="POST /b"),
+            ):
+                raise RuntimeError
+            with span("llm.completion", category="llm", endpoint="gpt"):
+                pass
+
+        data = profile.to_json()
+        assert data["operationId"] == "op_1"
+        categories = data["categories"]
+        assert isinstance(categories, dict)
+        assert {name: c["count"] for name, c in categories.items()} == {  # type: ignore[index]
+            "llm": 1,
+            "wdk": 5,
+        }
+        by_endpoint = {e["endpoint"]: e for e in data["endpoints"]}  # type: ignore[index, union-attr]
+        assert by_endpoint["GET /a"]["count"] == 3
+        assert by_endpoint["POST /b"]["errors"] == 1
+
+    def test_spans_outside_profile_are_not_recorded(self) -> None:
+        with span("before"):
+            pass
+        with profile_operation("op_2") as profile:
+            pass
+        assert profile.to_json()["endpoints"] == []
+
+    async def test_profile_is_live_and_inherited_by_tasks(self) -> None:
+        async def _work() -> None:
+            assert get_operation_profile("op_3") is not None
+
+            async def _child() -> None:
+                with span("child", category="db"):
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(_child(), _child())
+
+        await profiled("op_3", _work())
+        assert get_operation_profile("op_3") is None
+
+
+class TestExporter:
+    def test_writes_otlp_json_lines(self, tmp_path: Path) -> None:
+        out = tmp_path / "spans.jsonl"
+        configure_tracing(str(out))
+        try:
+            with span("wdk.request", category="wdk", endpoint="GET /x", path="/x"):
+                pass
+        finally:
+            shutdown_tracing()
+        assert tracing._exporter is None
+        (line,) = out.read_text().splitlines()
+        record = json.loads(line)
+        assert record["name"] == "wdk.request"
+        assert record["kind"] == "SPAN_KIND_CLIENT"
+        assert len(record["traceId"]) == 32
+        assert len(record["spanId"]) == 16
+        assert record["attributes"]["path"] == "/x"
+        assert record["status"] == {"code": "STATUS_CODE_OK"}
+
+    def test_disabled_without_path(self) -> None:
+        configure_tracing("")
+        assert tracing._exporter is None
+
+
+class TestEndpointTemplate:
+    def test_collapses_numeric_ids(self) -> None:
+        assert (
+            endpoint_template("GET", "/users/current/steps/123/reports/standard")
+            == "GET /users/current/steps/{id}/reports/standard"
+        )
+
+    def test_keeps_names_and_drops_query(self) -> None:
+        assert (
+            endpoint_template("GET", "/record-types/transcript/searches/G1?x=1")
+            == "GET /record-types/transcript/searches/G1"
+        )
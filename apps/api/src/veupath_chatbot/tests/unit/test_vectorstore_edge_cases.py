@@ -7,18 +7,24 @@ Covers:
   - Ingest utils edge cases
   - Public strategies helpers edge cases
   - Embeddings _chunks edge cases
+  - Embedding decoding from base64 responses
   - WDK transform with malformed/edge-case data
   - Collection name safety
 """
 
+import base64
 import json
 import uuid
 from dataclasses import dataclass
 from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
-from veupath_chatbot.integrations.embeddings.openai_embeddings import _chunks
+from veupath_chatbot.integrations.embeddings.openai_embeddings import (
+    _chunks,
+    _decode_embedding,
+)
 from veupath_chatbot.integrations.vectorstore.bootstrap import _known_embedding_dims
 from veupath_chatbot.integrations.vectorstore.collections import (
     EXAMPLE_PLANS_V1,
@@ -568,3 +574,16 @@ class TestChunksEdgeCases:
         result = list(_chunks(items, size=7))
         flat = [x for chunk in result for x in chunk]
         assert flat == items
+
+
+class TestDecodeEmbedding:
+    def test_base64_decodes_to_float32(self) -> None:
+        raw = np.array([0.5, -1.0, 2.25], dtype=np.float32)
+        result = _decode_embedding(base64.b64encode(raw.tobytes()).decode())
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.5, -1.0, 2.25]
+
+    def test_float_list_accepted(self) -> None:
+        result = _decode_embedding([0.5, 1.0])
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.5, 1.0]
@@ -60,7 +60,7 @@ class TestFetchRecordTypesAndSearches:
                 },
             ]
         )
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, _ = await fetch_record_types_and_searches(client)
 
         assert len(record_types) == 1
         assert len(searches) == 1
@@ -77,27 +77,27 @@ class TestFetchRecordTypesAndSearches:
                 ]
             }
         )
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 1
 
     async def test_dict_wrapped_with_records_key(self) -> None:
         client = _mock_client(
             record_types={"records": [{"urlSegment": "gene", "searches": []}]}
         )
-        record_types, _ = await fetch_record_types_and_searches(client)
+        record_types, _, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 1
 
     async def test_dict_wrapped_with_result_key(self) -> None:
         client = _mock_client(
             record_types={"result": [{"urlSegment": "gene", "searches": []}]}
         )
-        record_types, _ = await fetch_record_types_and_searches(client)
+        record_types, _, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 1
 
     async def test_string_record_types(self) -> None:
         """Record types can be plain strings (just names)."""
         client = _mock_client(record_types=["gene", "transcript"])
-        record_types, _ = await fetch_record_types_and_searches(client)
+        record_types, _, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 2
 
     async def test_fetches_searches_when_not_inline(self) -> None:
@@ -108,17 +108,17 @@ class TestFetchRecordTypesAndSearches:
                 "gene": [{"urlSegment": "GenesByTaxon"}],
             },
         )
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, _ = await fetch_record_types_and_searches(client)
         assert len(searches) == 1
 
     async def test_skips_non_dict_non_str_entries(self) -> None:
         client = _mock_client(record_types=[42, None, True, {"urlSegment": "gene"}])
-        record_types, _ = await fetch_record_types_and_searches(client)
+        record_types, _, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 1
 
     async def test_skips_record_type_without_name(self) -> None:
         client = _mock_client(record_types=[{"urlSegment": "", "name": ""}])
-        record_types, _ = await fetch_record_types_and_searches(client)
+        record_types, _, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 0
 
     async def test_skips_non_dict_search_entries(self) -> None:
@@ -130,7 +130,7 @@ class TestFetchRecordTypesAndSearches:
                 }
             ]
         )
-        _, searches = await fetch_record_types_and_searches(client)
+        _, searches, _ = await fetch_record_types_and_searches(client)
         assert len(searches) == 1
         assert searches[0][1]["urlSegment"] == "Valid"
 
@@ -139,9 +139,10 @@ class TestFetchRecordTypesAndSearches:
         client = MagicMock()
         client.get_record_types = AsyncMock(return_value=[{"urlSegment": "gene"}])
         client.get_searches = AsyncMock(side_effect=RuntimeError("network error"))
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, failed = await fetch_record_types_and_searches(client)
         assert len(record_types) == 1
         assert len(searches) == 0
+        assert failed == {"gene"}
 
     async def test_non_list_searches_value_treated_as_empty(self) -> None:
         """If 'searches' key is not a list, should treat as empty."""
@@ -149,12 +150,12 @@ class TestFetchRecordTypesAndSearches:
             record_types=[{"urlSegment": "gene", "searches": "not-a-list"}],
             searches_by_rt={"gene": []},
         )
-        _, searches = await fetch_record_types_and_searches(client)
+        _, searches, _ = await fetch_record_types_and_searches(client)
         assert len(searches) == 0
 
     async def test_empty_record_types(self) -> None:
         client = _mock_client(record_types=[])
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 0
         assert len(searches) == 0
 
@@ -162,7 +163,7 @@ class TestFetchRecordTypesAndSearches:
         """get_record_types returning None should be handled gracefully."""
         client = MagicMock()
         client.get_record_types = AsyncMock(return_value=None)
-        record_types, searches = await fetch_record_types_and_searches(client)
+        record_types, searches, _ = await fetch_record_types_and_searches(client)
         assert len(record_types) == 0
         assert len(searches) == 0
 
@@ -0,0 +1,255 @@
+"""Tests for manifest-driven, incremental WDK catalog ingestion."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from veupath_chatbot.integrations.vectorstore.collections import (
+    WDK_INGEST_MANIFESTS_V1,
+    WDK_RECORD_TYPES_V1,
+    WDK_SEARCHES_V1,
+)
+from veupath_chatbot.integrations.vectorstore.ingest import wdk_catalog
+from veupath_chatbot.integrations.vectorstore.ingest.manifest import SiteManifest
+from veupath_chatbot.integrations.vectorstore.ingest.wdk_transform import (
+    search_summary_hash,
+)
+from veupath_chatbot.platform.types import JSONArray, JSONObject
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeStore:
+    """In-memory stand-in for QdrantStore's get/upsert/delete."""
+
+    def __init__(self) -> None:
+        self.points: dict[str, dict[str, JSONObject]] = {}
+        self.upserted: dict[str, list[str]] = {}
+        self.deleted: dict[str, list[str]] = {}
+
+    async def get(self, *, collection: str, point_id: str) -> JSONObject | None:
+        return self.points.get(collection, {}).get(point_id)
+
+    async def upsert(self, *, collection: str, points: JSONArray) -> None:
+        for p in points:
+            assert isinstance(p, dict)
+            self.points.setdefault(collection, {})[str(p["id"])] = p
+            self.upserted.setdefault(collection, []).append(str(p["id"]))
+
+    async def delete(self, *, collection: str, point_ids: list[str]) -> None:
+        for pid in point_ids:
+            self.points.get(collection, {}).pop(pid, None)
+        self.deleted.setdefault(collection, []).extend(point_ids)
+
+    def reset_counters(self) -> None:
+        self.upserted.clear()
+        self.deleted.clear()
+
+
+def _search(name: str, display: str | None = None) -> JSONObject:
+    return {"urlSegment": name, "displayName": display or name, "paramNames": []}
+
+
+def _catalog(*searches: JSONObject) -> list[Any]:
+    return [{"urlSegment": "gene", "displayName": "Gene", "searches": list(searches)}]
+
+
+@pytest.fixture
+def wdk_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    client = MagicMock()
+    client.base_url = "https://plasmodb.org/plasmo/service"
+    client.get_record_types = AsyncMock(return_value=_catalog())
+    client.get_search_details = AsyncMock(return_value={})
+    router = MagicMock()
+    router.get_client.return_value = client
+    monkeypatch.setattr(wdk_catalog, "get_site_router", lambda: router)
+    return client
+
+
+async def _ingest(store: _FakeStore, *, skip_existing: bool = True) -> MagicMock:
+    embedder = MagicMock()
+    embedder.embed_texts = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    qdrant_client = MagicMock()
+    qdrant_client.retrieve = AsyncMock(return_value=[])
+    await wdk_catalog.ingest_site(
+        site_id="plasmodb",
+        store=store,  # type: ignore[arg-type]
+        qdrant_client=qdrant_client,
+        embedder=embedder,
+        concurrency=2,
+        batch_size=8,
+        skip_existing=skip_existing,
+    )
+    return embedder
+
+
+# ---------------------------------------------------------------------------
+# Hashing and manifest
+# ---------------------------------------------------------------------------
+
+
+class TestSearchSummaryHash:
+    def test_ignores_unrelated_listing_fields(self) -> None:
+        base = _search("GenesByTaxon")
+        noisy = {**base, "iconName": "x", "isBeta": True}
+        assert search_summary_hash("gene", base) == search_summary_hash("gene", noisy)
+
+    def test_changes_with_display_text_and_params(self) -> None:
+        base = search_summary_hash("gene", _search("GenesByTaxon"))
+        renamed = search_summary_hash("gene", _search("GenesByTaxon", "By taxon"))
+        with_params = search_summary_hash(
+            "gene", {**_search("GenesByTaxon"), "paramNames": ["organism"]}
+        )
+        assert len({base, renamed, with_params}) == 3
+
+    def test_internal_and_unnamed_searches_are_not_indexed(self) -> None:
+        assert (
+            search_summary_hash("gene", {"urlSegment": "X", "isInternal": True}) is None
+        )
+        assert search_summary_hash("gene", {"displayName": "No name"}) is None
+
+
+class TestSiteManifest:
+    def test_changed_and_removed(self) -> None:
+        manifest = SiteManifest(
+            site_id="plasmodb", hashes={"c": {"a": "1", "b": "2", "gone": "3"}}
+        )
+        current = {"a": "1", "b": "changed", "new": "4"}
+        assert manifest.changed("c", current) == ["b", "new"]
+        assert manifest.removed("c", current) == ["gone"]
+
+    def test_payload_round_trip(self) -> None:
+        manifest = SiteManifest(
+            site_id="plasmodb", fingerprint="fp", hashes={"c": {"a": "1"}}
+        )
+        restored = SiteManifest.from_payload("plasmodb", manifest.to_payload())
+        assert restored == manifest
+
+    def test_unknown_version_is_ignored(self) -> None:
+        assert SiteManifest.from_payload("plasmodb", {"version": 999}) is None
+
+
+# ---------------------------------------------------------------------------
+# ingest_site
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalIngest:
+    async def test_first_run_embeds_everything(self, wdk_client: MagicMock) -> None:
+        wdk_client.get_record_types.return_value = _catalog(_search("A"), _search("B"))
+        store = _FakeStore()
+
+        await _ingest(store)
+
+        assert len(store.upserted[WDK_SEARCHES_V1]) == 2
+        assert len(store.upserted[WDK_RECORD_TYPES_V1]) == 1
+        assert len(store.points[WDK_INGEST_MANIFESTS_V1]) == 1
+
+    async def test_unchanged_catalog_skips_site(self, wdk_client: MagicMock) -> None:
+        wdk_client.get_record_types.return_value = _catalog(_search("A"), _search("B"))
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        embedder = await _ingest(store)
+
+        embedder.embed_texts.assert_not_called()
+        assert store.upserted == {}
+        assert store.deleted == {}
+
+    async def test_only_changed_documents_are_reembedded(
+        self, wdk_client: MagicMock
+    ) -> None:
+        wdk_client.get_record_types.return_value = _catalog(
+            _search("A"), _search("B"), _search("C")
+        )
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        wdk_client.get_record_types.return_value = _catalog(
+            _search("A"), _search("B", "B renamed"), _search("D")
+        )
+        await _ingest(store)
+
+        searches = store.points[WDK_SEARCHES_V1]
+        assert len(store.upserted[WDK_SEARCHES_V1]) == 2
+        assert len(store.deleted[WDK_SEARCHES_V1]) == 1
+        assert WDK_RECORD_TYPES_V1 not in store.upserted
+        assert {p["payload"]["searchName"] for p in searches.values()} == {  # type: ignore[index]
+            "A",
+            "B",
+            "D",
+        }
+
+    async def test_failed_details_are_retried(self, wdk_client: MagicMock) -> None:
+        wdk_client.get_record_types.return_value = _catalog(
+            {"urlSegment": "A", "displayName": "A"}
+        )
+        wdk_client.get_search_details.side_effect = RuntimeError("WDK down")
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        wdk_client.get_search_details.side_effect = None
+        wdk_client.get_search_details.return_value = {"parameters": []}
+        await _ingest(store)
+
+        assert store.upserted[WDK_SEARCHES_V1] == list(store.points[WDK_SEARCHES_V1])
+
+    async def test_full_rebuild_reembeds_and_deletes(
+        self, wdk_client: MagicMock
+    ) -> None:
+        wdk_client.get_record_types.return_value = _catalog(_search("A"), _search("B"))
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        wdk_client.get_record_types.return_value = _catalog(_search("A"))
+        await _ingest(store, skip_existing=False)
+
+        assert len(store.upserted[WDK_SEARCHES_V1]) == 1
+        assert len(store.deleted[WDK_SEARCHES_V1]) == 1
+
+    async def test_failed_search_listing_deletes_nothing(
+        self, wdk_client: MagicMock
+    ) -> None:
+        wdk_client.get_record_types.return_value = [
+            *_catalog(_search("A")),
+            {"urlSegment": "transcript", "displayName": "Transcript"},
+        ]
+        wdk_client.get_searches = AsyncMock(return_value=[_search("T1")])
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        wdk_client.get_searches.side_effect = RuntimeError("WDK 503")
+        await _ingest(store)
+
+        assert store.deleted == {}
+        assert len(store.points[WDK_SEARCHES_V1]) == 2
+
+        # The next healthy run lists T1 again and keeps it.
+        wdk_client.get_searches.side_effect = None
+        store.reset_counters()
+        await _ingest(store)
+        assert store.deleted == {}
+
+    async def test_empty_record_type_listing_skips_site(
+        self, wdk_client: MagicMock
+    ) -> None:
+        wdk_client.get_record_types.return_value = _catalog(_search("A"))
+        store = _FakeStore()
+        await _ingest(store)
+        store.reset_counters()
+
+        wdk_client.get_record_types.return_value = {"unexpected": "shape"}
+        await _ingest(store)
+
+        assert store.deleted == {}
+        assert store.upserted == {}
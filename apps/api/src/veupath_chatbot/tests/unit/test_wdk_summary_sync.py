@@ -0,0 +1,136 @@
+"""Unit tests for the bulk, fingerprint-diffed WDK summary sync."""
+
+from typing import Any
+from unittest.mock import patch
+from uuid import UUID
+
+from veupath_chatbot.persistence.repositories.stream import StreamRepository
+from veupath_chatbot.platform.types import JSONObject
+from veupath_chatbot.services.strategies.wdk_sync import (
+    sync_summary_projections,
+    wdk_summary_fingerprint,
+)
+
+
+def _item(wdk_id: int, name: str, **extra: object) -> JSONObject:
+    return {
+        "strategyId": wdk_id,
+        "name": name,
+        "recordClassName": "transcript",
+        "isSaved": False,
+        "estimatedSize": 10,
+        "leafAndTransformStepCount": 1,
+        "lastModified": "2026-01-01T00:00:00",
+        **extra,
+    }
+
+
+async def _sync(
+    items: list[JSONObject], stream_repo: StreamRepository, user_id: UUID
+) -> tuple[int, int, int]:
+    result = await sync_summary_projections(
+        items, stream_repo=stream_repo, user_id=user_id, site_id="plasmodb"
+    )
+    return result.created, result.updated, result.unchanged
+
+
+class TestWdkSummaryFingerprint:
+    def test_ignores_unrelated_fields(self) -> None:
+        assert wdk_summary_fingerprint(_item(1, "A")) == wdk_summary_fingerprint(
+            _item(2, "A", description="other")
+        )
+
+    def test_changes_with_summary_fields(self) -> None:
+        base = wdk_summary_fingerprint(_item(1, "A"))
+        assert wdk_summary_fingerprint(_item(1, "B")) != base
+        assert wdk_summary_fingerprint(_item(1, "A", isSaved=True)) != base
+        assert wdk_summary_fingerprint(_item(1, "A", lastModified="2026-02-01")) != base
+
+
+class TestSyncSummaryProjections:
+    async def test_first_sync_creates_projections(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        counts = await _sync([_item(1, "A"), _item(2, "B")], stream_repo, user_id)
+        assert counts == (2, 0, 0)
+
+        proj = await stream_repo.get_by_wdk_strategy_id(user_id, 1)
+        assert proj is not None
+        assert proj.name == "A"
+        assert proj.record_type == "transcript"
+        assert proj.result_count == 10
+        assert proj.stream.site_id == "plasmodb"
+
+    async def test_unchanged_items_are_skipped(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        await _sync([_item(1, "A"), _item(2, "B")], stream_repo, user_id)
+        counts = await _sync(
+            [_item(1, "A"), _item(2, "B", isSaved=True)], stream_repo, user_id
+        )
+        assert counts == (0, 1, 1)
+
+        proj = await stream_repo.get_by_wdk_strategy_id(user_id, 2)
+        assert proj is not None
+        assert proj.is_saved is True
+
+    async def test_dismissed_projection_is_not_updated(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        await _sync([_item(1, "A")], stream_repo, user_id)
+        proj = await stream_repo.get_by_wdk_strategy_id(user_id, 1)
+        assert proj is not None
+        await stream_repo.dismiss(proj.stream_id)
+
+        counts = await _sync([_item(1, "Renamed")], stream_repo, user_id)
+        assert counts == (0, 0, 1)
+        await stream_repo.session.refresh(proj)
+        assert proj.name == "A"
+
+    async def test_names_are_deduplicated_in_memory(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        await stream_repo.create(user_id=user_id, site_id="plasmodb", name="A")
+        await _sync([_item(1, "A"), _item(2, "A")], stream_repo, user_id)
+
+        names = {
+            p.wdk_strategy_id: p.name
+            for p in await stream_repo.list_site_projections(user_id, "plasmodb")
+        }
+        assert names[1] == "A (1)"
+        assert names[2] == "A (2)"
+
+    async def test_rename_keeps_own_name_available(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        await _sync([_item(1, "A")], stream_repo, user_id)
+        await _sync([_item(1, "A", isSaved=True)], stream_repo, user_id)
+
+        proj = await stream_repo.get_by_wdk_strategy_id(user_id, 1)
+        assert proj is not None
+        assert proj.name == "A"
+
+    async def test_failing_row_is_skipped_not_the_batch(
+        self, stream_repo: StreamRepository, user_id: UUID
+    ) -> None:
+        await _sync([_item(1, "A"), _item(2, "B"), _item(3, "C")], stream_repo, user_id)
+        real_update = stream_repo.bulk_update_projections
+
+        async def _update(rows: list[dict[str, Any]]) -> None:
+            if any(row["wdk_strategy_id"] == 2 for row in rows):
+                raise RuntimeError("bad row")
+            await real_update(rows)
+
+        with patch.object(stream_repo, "bulk_update_projections", side_effect=_update):
+            counts = await _sync(
+                [_item(i, name, isSaved=True) for i, name in enumerate("ABC", 1)],
+                stream_repo,
+                user_id,
+            )
+        assert counts == (0, 2, 0)
+
+        saved = {
+            p.wdk_strategy_id: p.is_saved
+            for p in await stream_repo.list_site_projections(user_id, "plasmodb")
+        }
+        assert saved == {1: True, 2: False, 3: True}
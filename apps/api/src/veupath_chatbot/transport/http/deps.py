@@ -1,6 +1,7 @@
 """Dependency injection for HTTP routes."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 from uuid import UUID
 
@@ -13,6 +14,7 @@ from veupath_chatbot.persistence.repositories import (
     UserRepository,
 )
 from veupath_chatbot.persistence.session import get_db_session
+from veupath_chatbot.platform.admission import get_admission_controller
 from veupath_chatbot.platform.errors import ForbiddenError, NotFoundError
 from veupath_chatbot.platform.security import get_current_user
 from veupath_chatbot.services.experiment.store import get_experiment_store
@@ -58,6 +60,20 @@ async def get_current_user_with_db_row(
 CurrentUser = Annotated[UUID, Depends(get_current_user_with_db_row)]
 
 
+def admission_gate(kind: str) -> Callable[[], Awaitable[None]]:
+    """Build a route dependency that sheds *kind* work when the server is saturated.
+
+    Use as ``dependencies=[Depends(admission_gate(...))]`` on routes that
+    start expensive work; the work itself should run in
+    :meth:`AdmissionController.slot` so waiting requests count as queued.
+    """
+
+    async def _gate() -> None:
+        get_admission_controller().check(kind)
+
+    return _gate
+
+
 async def get_experiment_owned_by_user(
     experiment_id: str,
     user_id: CurrentUser,
@@ -1,9 +1,9 @@
 """Chat endpoint — starts a background chat operation."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
-from veupath_chatbot.platform.security import limiter
+from veupath_chatbot.platform.security import rate_limit
 from veupath_chatbot.services.chat.orchestrator import start_chat_stream
 from veupath_chatbot.transport.http.deps import (
     CurrentUser,
@@ -15,10 +15,8 @@ from veupath_chatbot.transport.http.schemas import ChatRequest
 router = APIRouter(prefix="/api/v1", tags=["chat"])
 
 
-@router.post("/chat", status_code=202)
-@limiter.limit("30/minute")
+@router.post("/chat", status_code=202, dependencies=[Depends(rate_limit(cost=4))])
 async def chat(
-    request: Request,
     body: ChatRequest,
     user_repo: UserRepo,
     stream_repo: StreamRepo,
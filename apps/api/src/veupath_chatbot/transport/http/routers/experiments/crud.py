@@ -32,10 +32,20 @@ class PatchExperimentRequest(BaseModel):
 async def list_experiments(
     user_id: CurrentUser,
     siteId: str | None = None,
+    status: str | None = None,
+    searchName: str | None = None,
 ) -> list[JSONObject]:
-    """List experiments owned by the current user, optionally filtered by site."""
+    """List experiments owned by the current user.
+
+    Optionally filtered by site, status and search name (applied in SQL).
+    """
     store = get_experiment_store()
-    experiments = await store.alist_all(site_id=siteId, user_id=str(user_id))
+    experiments = await store.alist_all(
+        site_id=siteId,
+        user_id=str(user_id),
+        status=status,
+        search_name=searchName,
+    )
     return [experiment_summary_to_json(e) for e in experiments]
 
 
@@ -55,7 +65,7 @@ async def update_experiment(
     exp.notes = body.notes
 
     store = get_experiment_store()
-    store.save(exp)
+    store.save_fields(exp, "notes")
     return experiment_to_json(exp)
 
 
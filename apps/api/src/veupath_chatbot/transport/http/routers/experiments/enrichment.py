@@ -1,8 +1,11 @@
 """Enrichment analysis endpoints for experiments."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from veupath_chatbot.platform.admission import get_admission_controller
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.security import rate_limit
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.experiment.custom_enrichment import (
     CustomEnrichmentResult,
@@ -10,7 +13,11 @@ from veupath_chatbot.services.experiment.custom_enrichment import (
 )
 from veupath_chatbot.services.experiment.enrichment import upsert_enrichment_result
 from veupath_chatbot.services.experiment.store import get_experiment_store
-from veupath_chatbot.transport.http.deps import CurrentUser, ExperimentDep
+from veupath_chatbot.transport.http.deps import (
+    CurrentUser,
+    ExperimentDep,
+    admission_gate,
+)
 from veupath_chatbot.transport.http.schemas.experiments import (
     CustomEnrichRequest,
     RunEnrichmentRequest,
@@ -20,7 +27,13 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
-@router.post("/{experiment_id}/enrich")
+@router.post(
+    "/{experiment_id}/enrich",
+    dependencies=[
+        Depends(rate_limit(cost=6)),
+        Depends(admission_gate("enrichment")),
+    ],
+)
 async def run_enrichment(
     exp: ExperimentDep,
     request: RunEnrichmentRequest,
@@ -31,14 +44,19 @@ async def run_enrichment(
     from veupath_chatbot.services.wdk.enrichment_service import EnrichmentService
 
     svc = EnrichmentService()
-    results, errors = await svc.run_batch(
-        site_id=exp.config.site_id,
-        analysis_types=request.enrichment_types,
-        step_id=exp.wdk_step_id,
-        search_name=exp.config.search_name,
-        record_type=exp.config.record_type,
-        parameters=exp.config.parameters,
-    )
+    async with get_admission_controller().slot(
+        "enrichment",
+        user_id=user_id,
+        timeout=get_settings().admission_queue_timeout_seconds,
+    ):
+        results, errors = await svc.run_batch(
+            site_id=exp.config.site_id,
+            analysis_types=request.enrichment_types,
+            step_id=exp.wdk_step_id,
+            search_name=exp.config.search_name,
+            record_type=exp.config.record_type,
+            parameters=exp.config.parameters,
+        )
     for r in results:
         upsert_enrichment_result(exp.enrichment_results, r)
     get_experiment_store().save(exp)
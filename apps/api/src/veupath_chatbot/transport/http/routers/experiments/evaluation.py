@@ -1,8 +1,11 @@
 """Evaluation endpoints: re-evaluate, threshold-sweep, export."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
+from veupath_chatbot.platform.admission import get_admission_controller
+from veupath_chatbot.platform.config import get_settings
+from veupath_chatbot.platform.security import rate_limit
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.experiment.evaluation import (
     compute_sweep_values,
@@ -10,7 +13,11 @@ from veupath_chatbot.services.experiment.evaluation import (
     re_evaluate,
     validate_sweep_parameter,
 )
-from veupath_chatbot.transport.http.deps import CurrentUser, ExperimentDep
+from veupath_chatbot.transport.http.deps import (
+    CurrentUser,
+    ExperimentDep,
+    admission_gate,
+)
 from veupath_chatbot.transport.http.schemas.experiments import ThresholdSweepRequest
 
 router = APIRouter()
@@ -46,6 +53,8 @@ async def threshold_sweep(
             param_name=request.parameter_name,
             sweep_type=request.sweep_type,
             sweep_values=sweep_values,
+            attribute_name=request.attribute_name,
+            threshold_direction=request.threshold_direction,
         ),
         media_type="text/event-stream",
         headers={
@@ -56,14 +65,22 @@ async def threshold_sweep(
     )
 
 
-@router.get("/{experiment_id}/export")
+@router.get(
+    "/{experiment_id}/export",
+    dependencies=[Depends(rate_limit(cost=3)), Depends(admission_gate("export"))],
+)
 async def get_experiment_report(
     exp: ExperimentDep, user_id: CurrentUser
 ) -> StreamingResponse:
     """Generate and return a self-contained HTML report for an experiment."""
     from veupath_chatbot.services.experiment.report import generate_experiment_report
 
-    html_content = generate_experiment_report(exp)
+    async with get_admission_controller().slot(
+        "export",
+        user_id=user_id,
+        timeout=get_settings().admission_queue_timeout_seconds,
+    ):
+        html_content = generate_experiment_report(exp)
 
     return StreamingResponse(
         iter([html_content]),
@@ -1,14 +1,15 @@
-"""Experiment execution endpoints: create, batch, benchmark."""
+"""Experiment execution endpoints: create, batch, benchmark (and resume)."""
 
 from collections.abc import Awaitable, Callable
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.platform.security import limiter
+from veupath_chatbot.platform.security import rate_limit
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.experiment.core.streaming import (
+    resume_benchmark,
     start_batch_experiment,
     start_benchmark,
     start_experiment,
@@ -21,6 +22,7 @@ from veupath_chatbot.transport.http.deps import (
     ControlSetRepo,
     CurrentUser,
     StreamRepo,
+    admission_gate,
 )
 from veupath_chatbot.transport.http.schemas.experiments import (
     CreateBatchExperimentRequest,
@@ -51,10 +53,12 @@ logger = get_logger(__name__)
             },
         }
     },
+    dependencies=[
+        Depends(rate_limit(cost=6)),
+        Depends(admission_gate("experiment")),
+    ],
 )
-@limiter.limit("20/minute")
 async def create_experiment(
-    request: Request,
     body: CreateExperimentRequest,
     user_id: CurrentUser,
 ) -> JSONResponse:
@@ -80,10 +84,12 @@ async def create_experiment(
             },
         }
     },
+    dependencies=[
+        Depends(rate_limit(cost=12)),
+        Depends(admission_gate("batch")),
+    ],
 )
-@limiter.limit("10/minute")
 async def create_batch_experiment(
-    request: Request,
     body: CreateBatchExperimentRequest,
     user_id: CurrentUser,
 ) -> JSONResponse:
@@ -121,10 +127,12 @@ async def create_batch_experiment(
             },
         }
     },
+    dependencies=[
+        Depends(rate_limit(cost=12)),
+        Depends(admission_gate("benchmark")),
+    ],
 )
-@limiter.limit("10/minute")
 async def create_benchmark(
-    request: Request,
     body: CreateBenchmarkRequest,
     user_id: CurrentUser,
 ) -> JSONResponse:
@@ -156,6 +164,37 @@ async def create_benchmark(
     return JSONResponse({"operationId": operation_id}, status_code=202)
 
 
+@router.post(
+    "/benchmark/{benchmark_id}/resume",
+    status_code=202,
+    responses={
+        202: {
+            "description": "Remaining benchmark runs launched as background task",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"operationId": {"type": "string"}},
+                    }
+                }
+            },
+        },
+        409: {"description": "The benchmark is still running"},
+    },
+    dependencies=[
+        Depends(rate_limit(cost=12)),
+        Depends(admission_gate("benchmark")),
+    ],
+)
+async def resume_benchmark_suite(
+    benchmark_id: str,
+    user_id: CurrentUser,
+) -> JSONResponse:
+    """Re-run the control sets of a benchmark that have no completed experiment."""
+    operation_id = await resume_benchmark(benchmark_id, user_id=str(user_id))
+    return JSONResponse({"operationId": operation_id}, status_code=202)
+
+
 @router.post(
     "/seed",
     response_class=StreamingResponse,
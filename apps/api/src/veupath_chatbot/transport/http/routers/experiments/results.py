@@ -4,6 +4,7 @@ from typing import Literal, cast
 
 from fastapi import APIRouter, Query
 
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.platform.errors import (
     InternalError,
     NotFoundError,
@@ -218,6 +219,7 @@ async def refine_experiment(
             secondary_input=StepTreeNode(new_step_id),
         )
         await api.update_strategy(exp.wdk_strategy_id, step_tree=new_tree)
+        await invalidate_user_tool_results(user_id)
         exp.wdk_step_id = combined_id
         store.save(exp)
 
@@ -240,6 +242,7 @@ async def refine_experiment(
             primary_input=StepTreeNode(exp.wdk_step_id),
         )
         await api.update_strategy(exp.wdk_strategy_id, step_tree=new_tree)
+        await invalidate_user_tool_results(user_id)
         exp.wdk_step_id = new_step_id
         store.save(exp)
 
@@ -6,15 +6,17 @@ All business logic lives in ``services.gene_sets.operations``.
 
 from typing import Literal, cast, get_args
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Depends, Query
 
+from veupath_chatbot.platform.admission import get_admission_controller
+from veupath_chatbot.platform.config import get_settings
 from veupath_chatbot.platform.errors import (
     InternalError,
     NotFoundError,
     ValidationError,
 )
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.platform.security import limiter
+from veupath_chatbot.platform.security import rate_limit
 from veupath_chatbot.platform.types import JSONObject, JSONValue
 from veupath_chatbot.services.experiment.types import to_json
 from veupath_chatbot.services.gene_sets.confidence import (
@@ -31,7 +33,7 @@ from veupath_chatbot.services.gene_sets.reverse_search import (
 )
 from veupath_chatbot.services.gene_sets.store import get_gene_set_store
 from veupath_chatbot.services.gene_sets.types import GeneSet
-from veupath_chatbot.transport.http.deps import CurrentUser
+from veupath_chatbot.transport.http.deps import CurrentUser, admission_gate
 from veupath_chatbot.transport.http.schemas.gene_sets import (
     CreateGeneSetRequest,
     EnsembleScoringRequest,
@@ -96,10 +98,8 @@ def _no_strategy(exc: ValueError) -> NotFoundError:
 # ---------------------------------------------------------------------------
 
 
-@router.post("", status_code=201)
-@limiter.limit("30/minute")
+@router.post("", status_code=201, dependencies=[Depends(rate_limit(cost=4))])
 async def create_gene_set(
-    request: Request,
     body: CreateGeneSetRequest,
     user_id: CurrentUser,
 ) -> GeneSetResponse:
@@ -245,7 +245,13 @@ async def ensemble_scoring(
 # ---------------------------------------------------------------------------
 
 
-@router.post("/{gene_set_id}/enrich")
+@router.post(
+    "/{gene_set_id}/enrich",
+    dependencies=[
+        Depends(rate_limit(cost=6)),
+        Depends(admission_gate("enrichment")),
+    ],
+)
 async def enrich_gene_set(
     gene_set_id: str,
     request: GeneSetEnrichRequest,
@@ -253,9 +259,14 @@ async def enrich_gene_set(
 ) -> list[JSONObject]:
     """Run enrichment analysis on a gene set."""
     try:
-        results = await _svc().run_enrichment(
-            user_id, gene_set_id, request.enrichment_types
-        )
+        async with get_admission_controller().slot(
+            "enrichment",
+            user_id=user_id,
+            timeout=get_settings().admission_queue_timeout_seconds,
+        ):
+            results = await _svc().run_enrichment(
+                user_id, gene_set_id, request.enrichment_types
+            )
     except KeyError as exc:
         raise _not_found(exc) from exc
     except RuntimeError as exc:
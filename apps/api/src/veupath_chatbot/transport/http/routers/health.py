@@ -8,8 +8,13 @@ from fastapi.responses import JSONResponse
 from veupath_chatbot import __version__
 from veupath_chatbot.persistence.session import async_session_factory
 from veupath_chatbot.platform.config import get_settings
-from veupath_chatbot.platform.health import check_database, check_qdrant
+from veupath_chatbot.platform.health import (
+    check_database,
+    check_qdrant,
+    subsystem_report,
+)
 from veupath_chatbot.platform.logging import get_logger
+from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.transport.http.schemas import HealthResponse, SystemConfigResponse
 from veupath_chatbot.transport.http.schemas.health import ProviderStatus
 
@@ -54,10 +59,12 @@ async def system_config() -> SystemConfigResponse:
 
 
 @router.get("/health/ready", response_model=HealthResponse)
-async def readiness_check() -> HealthResponse | JSONResponse:
+async def readiness_check() -> JSONResponse:
     """Readiness check - is the service ready to accept requests?
 
-    Checks database connectivity and Qdrant availability (if RAG is enabled).
+    Checks database connectivity and, if RAG is enabled, Qdrant
+    availability (cached for a few seconds). Warmup subsystems (catalog,
+    RAG) are reported under ``subsystems`` but never fail readiness.
     Returns 503 if any dependency is unreachable.
     """
     settings = get_settings()
@@ -70,26 +77,16 @@ async def readiness_check() -> HealthResponse | JSONResponse:
         logger.error("Readiness check: database unreachable", error=str(e))
         failures.append("database")
 
-    if settings.rag_enabled:
-        try:
-            await check_qdrant()
-        except Exception as e:
-            logger.error("Readiness check: Qdrant unreachable", error=str(e))
-            failures.append("qdrant")
+    if settings.rag_enabled and not await check_qdrant():
+        failures.append("qdrant")
 
+    content: JSONObject = {
+        "status": "unhealthy" if failures else "healthy",
+        "version": __version__,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "subsystems": subsystem_report(),
+    }
     if failures:
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "version": __version__,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "failed_checks": failures,
-            },
-        )
-
-    return HealthResponse(
-        status="healthy",
-        version=__version__,
-        timestamp=datetime.now(UTC),
-    )
+        content["failed_checks"] = list(failures)
+        return JSONResponse(status_code=503, content=content)
+    return JSONResponse(content=content)
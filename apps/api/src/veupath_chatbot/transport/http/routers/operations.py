@@ -11,6 +11,7 @@ from veupath_chatbot.persistence.models import Operation, Stream
 from veupath_chatbot.platform.errors import ForbiddenError, NotFoundError
 from veupath_chatbot.platform.logging import get_logger
 from veupath_chatbot.platform.redis import get_redis
+from veupath_chatbot.platform.tracing import get_operation_profile
 from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.transport.http.deps import CurrentUser, DBSession
 from veupath_chatbot.transport.http.sse import SSE_HEADERS
@@ -50,6 +51,41 @@ _END_EVENT_TYPES = frozenset(
 )
 
 
+# Stream entries read per XREAD.
+_READ_COUNT = 256
+
+
+def _merge_deltas(
+    events: list[tuple[str, str, JSONObject]],
+) -> list[tuple[str, str, JSONObject]]:
+    """Merge runs of ``assistant_delta`` events for the same message.
+
+    *events* are ``(entry_id, event_type, data)`` in stream order.  A merged
+    event carries the last entry ID of its run, so a client resuming from
+    it skips every delta it already received.
+    """
+    merged: list[tuple[str, str, JSONObject]] = []
+    for entry_id, event_type, data in events:
+        if event_type == "assistant_delta" and merged:
+            _prev_id, prev_type, prev = merged[-1]
+            if prev_type == "assistant_delta" and _same_message(prev, data):
+                delta = f"{prev['delta']}{data['delta']}"
+                merged[-1] = (entry_id, event_type, {**prev, "delta": delta})
+                continue
+        merged.append((entry_id, event_type, data))
+    return merged
+
+
+def _same_message(prev: JSONObject, data: JSONObject) -> bool:
+    message_id = data.get("messageId")
+    return (
+        isinstance(message_id, str)
+        and message_id == prev.get("messageId")
+        and isinstance(prev.get("delta"), str)
+        and isinstance(data.get("delta"), str)
+    )
+
+
 @router.get("/{operation_id}/subscribe")
 async def subscribe(
     operation_id: str,
@@ -65,6 +101,8 @@ async def subscribe(
 
     Catchup: replays events from `lastEventId` (or from the beginning).
     Live: uses XREAD BLOCK for new events until a terminal event is seen.
+    Consecutive ``assistant_delta`` events of one message that arrive in
+    the same read are sent as a single frame.
     """
     # Look up operation → stream mapping.
     result = await session.execute(
@@ -86,7 +124,9 @@ async def subscribe(
         while True:
             # XREAD with BLOCK — waits for new events, returns when available.
             # Timeout of 15s triggers a keepalive comment.
-            entries = await redis.xread({stream_key: cursor}, count=1, block=15000)
+            entries = await redis.xread(
+                {stream_key: cursor}, count=_READ_COUNT, block=15000
+            )
 
             if not entries:
                 # No events within timeout — send keepalive comment.
@@ -113,6 +153,7 @@ async def subscribe(
                     )
                 continue
 
+            batch: list[tuple[str, str, JSONObject]] = []
             for _stream_name, events in entries:
                 for entry_id_bytes, fields in events:
                     entry_id = (
@@ -139,11 +180,13 @@ async def subscribe(
                             entry_id=entry_id,
                         )
                         data = {}
+                    batch.append((entry_id, event_type, data))
 
-                    yield f"id: {entry_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
+            for entry_id, event_type, data in _merge_deltas(batch):
+                yield f"id: {entry_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
 
-                    if event_type in _END_EVENT_TYPES:
-                        return
+                if event_type in _END_EVENT_TYPES:
+                    return
 
     return StreamingResponse(
         _stream(),
@@ -182,6 +225,35 @@ async def cancel(
     return {"operationId": operation_id, "cancelled": cancelled}
 
 
+@router.get("/{operation_id}/profile")
+async def get_profile(
+    operation_id: str,
+    session: DBSession,
+    user_id: CurrentUser,
+) -> JSONObject:
+    """Call profile of an operation: counts and latencies per endpoint.
+
+    Spans are grouped by category (``wdk``, ``llm``, ``db``, ``phase``) and
+    endpoint.  While the operation runs in this process the live profile is
+    returned; afterwards, the profile stored when it finished.
+    """
+    result = await session.execute(
+        select(Operation).where(Operation.operation_id == operation_id)
+    )
+    op = result.scalar_one_or_none()
+    if op is None:
+        raise NotFoundError(title="Operation not found")
+
+    await _verify_operation_access(session, op, user_id)
+
+    live = get_operation_profile(operation_id)
+    if live is not None:
+        return {"status": op.status, "live": True, **live.to_json()}
+    if op.profile is None:
+        raise NotFoundError(title="No profile recorded for this operation")
+    return {"status": op.status, "live": False, **op.profile}
+
+
 @router.get("/active")
 async def list_active(
     session: DBSession,
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query, Response
 
+from veupath_chatbot.ai.tools.tool_cache import invalidate_user_tool_results
 from veupath_chatbot.platform.errors import ErrorCode, NotFoundError, ValidationError
 from veupath_chatbot.platform.events import read_stream_messages, read_stream_thinking
 from veupath_chatbot.platform.logging import get_logger
@@ -143,6 +144,8 @@ async def update_strategy(
         is_saved_set=is_saved_set,
         step_count=len(strategy_ast.get_all_steps()) if strategy_ast else None,
     )
+    if plan is not None:
+        await invalidate_user_tool_results(user_id)
 
     # Re-fetch updated projection.
     updated = await stream_repo.get_projection(strategyId)
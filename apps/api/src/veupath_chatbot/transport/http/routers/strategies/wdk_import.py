@@ -12,22 +12,23 @@ from veupath_chatbot.platform.errors import (
     WDKError,
 )
 from veupath_chatbot.platform.logging import get_logger
-from veupath_chatbot.services.control_helpers import (
-    cleanup_internal_control_test_strategies,
-)
+from veupath_chatbot.platform.types import JSONObject
 from veupath_chatbot.services.strategies.auto_import import (
     background_auto_import_gene_sets,
 )
 from veupath_chatbot.services.strategies.wdk_conversion import parse_wdk_strategy_id
 from veupath_chatbot.services.strategies.wdk_sync import (
+    sync_summary_projections,
     sync_to_projection,
-    upsert_summary_projection,
 )
 from veupath_chatbot.services.wdk import (
     get_site,
     get_strategy_api,
     is_internal_wdk_strategy_name,
 )
+from veupath_chatbot.services.wdk.temp_strategies import (
+    sweep_unrecorded_temp_strategies,
+)
 from veupath_chatbot.transport.http.deps import (
     CurrentUser,
     StreamRepo,
@@ -138,11 +139,14 @@ async def sync_all_wdk_strategies(
     try:
         api = get_strategy_api(site.id)
         wdk_items = await api.list_strategies()
-        await cleanup_internal_control_test_strategies(api, wdk_items, site_id=site.id)
+        # Leaks the temp-strategy ledger never recorded; runs after the
+        # response, still as this user.
+        background_tasks.add_task(sweep_unrecorded_temp_strategies, api, wdk_items)
     except Exception as e:
         logger.warning("WDK list failed during sync", site_id=site.id, error=str(e))
         wdk_items = []
 
+    synced_items: list[JSONObject] = []
     synced_wdk_ids: set[int] = set()
     for item in wdk_items:
         if not isinstance(item, dict):
@@ -155,21 +159,30 @@ async def sync_all_wdk_strategies(
         if is_internal_wdk_strategy_name(name):
             continue
         synced_wdk_ids.add(wdk_id)
-        try:
-            async with stream_repo.session.begin_nested():
-                await upsert_summary_projection(
-                    item,
-                    stream_repo=stream_repo,
-                    user_id=user_id,
-                    site_id=site.id,
-                )
-        except Exception as e:
-            logger.warning(
-                "Failed to sync WDK strategy",
-                wdk_id=wdk_id,
+        synced_items.append(item)
+
+    try:
+        async with stream_repo.session.begin_nested():
+            result = await sync_summary_projections(
+                synced_items,
+                stream_repo=stream_repo,
+                user_id=user_id,
                 site_id=site.id,
-                error=str(e),
             )
+        logger.debug(
+            "Synced WDK strategies",
+            site_id=site.id,
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to sync WDK strategies",
+            site_id=site.id,
+            strategy_count=len(synced_items),
+            error=str(e),
+        )
 
     # Prune orphaned streams whose WDK counterparts no longer exist.
     if wdk_items:
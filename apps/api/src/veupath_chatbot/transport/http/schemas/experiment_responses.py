@@ -564,8 +564,23 @@ class StepAnalysisProgressDataResponse(BaseModel):
     model_config = _MODEL_CONFIG
 
 
+class BatchProgressDataResponse(BaseModel):
+    """Aggregate progress of a multi-organism batch or benchmark suite."""
+
+    completed: int
+    failed: int
+    total: int
+
+    model_config = _MODEL_CONFIG
+
+
 class ExperimentProgressDataResponse(BaseModel):
-    """Progress data for experiment execution."""
+    """Progress data for experiment execution.
+
+    Events from a batch also carry the ``organism`` they belong to, events
+    from a benchmark the ``controlSetLabel``; both carry the job-wide
+    ``batchProgress``.
+    """
 
     phase: str
     message: str | None = None
@@ -575,6 +590,11 @@ class ExperimentProgressDataResponse(BaseModel):
     step_analysis_progress: StepAnalysisProgressDataResponse | None = Field(
         default=None, alias="stepAnalysisProgress"
     )
+    organism: str | None = None
+    control_set_label: str | None = Field(default=None, alias="controlSetLabel")
+    batch_progress: BatchProgressDataResponse | None = Field(
+        default=None, alias="batchProgress"
+    )
 
     model_config = _MODEL_CONFIG
 
@@ -152,7 +152,13 @@ class RunEnrichmentRequest(BaseModel):
 
 
 class ThresholdSweepRequest(BaseModel):
-    """Request to sweep a parameter across a range (numeric) or set of values (categorical)."""
+    """Request to sweep a parameter across a range (numeric) or set of values (categorical).
+
+    For a monotone numeric threshold, ``attributeName`` names the result
+    attribute the parameter filters on and ``thresholdDirection`` whether
+    records pass at or above (``min``) or at or below (``max``) the value;
+    the sweep is then scored from one result fetch.
+    """
 
     parameter_name: str = Field(alias="parameterName")
     sweep_type: Literal["numeric", "categorical"] = Field(
@@ -162,6 +168,10 @@ class ThresholdSweepRequest(BaseModel):
     max_value: float | None = Field(default=None, alias="maxValue")
     steps: int = Field(default=10, ge=3, le=50)
     values: list[str] | None = Field(default=None)
+    attribute_name: str | None = Field(default=None, alias="attributeName")
+    threshold_direction: Literal["min", "max"] | None = Field(
+        default=None, alias="thresholdDirection"
+    )
 
     model_config = {"populate_by_name": True}
 
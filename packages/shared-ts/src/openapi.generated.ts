@@ -60,8 +60,9 @@ export type paths = {
          * Readiness Check
          * @description Readiness check - is the service ready to accept requests?
          *
-         *     Checks database connectivity and Qdrant availability (if RAG is enabled).
-         *     Returns 503 if any dependency is unreachable.
+         *     Checks database connectivity. Warmup subsystems (catalog, RAG) are
+         *     reported under ``subsystems`` but never fail readiness.
+         *     Returns 503 if the database is unreachable.
          */
         get: operations["readiness_check_health_ready_get"];
         put?: never;
@@ -566,6 +567,26 @@ export type paths = {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/experiments/benchmark/{benchmark_id}/resume": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Resume Benchmark Suite
+         * @description Re-run the control sets of a benchmark that have no completed experiment.
+         */
+        post: operations["resume_benchmark_suite_api_v1_experiments_benchmark__benchmark_id__resume_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/experiments/seed": {
         parameters: {
             query?: never;
@@ -1502,6 +1523,18 @@ export type components = {
             /** Negativecontrols */
             negativeControls?: string[] | null;
         };
+        /**
+         * BatchProgressDataResponse
+         * @description Aggregate progress of a multi-organism batch or benchmark suite.
+         */
+        BatchProgressDataResponse: {
+            /** Completed */
+            completed: number;
+            /** Failed */
+            failed: number;
+            /** Total */
+            total: number;
+        };
         /**
          * BenchmarkControlSet
          * @description A single control set within a benchmark suite.
@@ -2305,6 +2338,10 @@ export type components = {
         /**
          * ExperimentProgressDataResponse
          * @description Progress data for experiment execution.
+         *
+         *     Events from a batch also carry the ``organism`` they belong to, events
+         *     from a benchmark the ``controlSetLabel``; both carry the job-wide
+         *     ``batchProgress``.
          */
         ExperimentProgressDataResponse: {
             /** Phase */
@@ -2313,6 +2350,11 @@ export type components = {
             message?: string | null;
             trialProgress?: components["schemas"]["TrialProgressDataResponse"] | null;
             stepAnalysisProgress?: components["schemas"]["StepAnalysisProgressDataResponse"] | null;
+            /** Organism */
+            organism?: string | null;
+            /** Controlsetlabel */
+            controlSetLabel?: string | null;
+            batchProgress?: components["schemas"]["BatchProgressDataResponse"] | null;
         };
         /**
          * ExperimentResponse
@@ -4340,6 +4382,11 @@ export type components = {
         /**
          * ThresholdSweepRequest
          * @description Request to sweep a parameter across a range (numeric) or set of values (categorical).
+         *
+         *     For a monotone numeric threshold, ``attributeName`` names the result
+         *     attribute the parameter filters on and ``thresholdDirection`` whether
+         *     records pass at or above (``min``) or at or below (``max``) the value;
+         *     the sweep is then scored from one result fetch.
          */
         ThresholdSweepRequest: {
             /** Parametername */
@@ -4361,6 +4408,10 @@ export type components = {
             steps: number;
             /** Values */
             values?: string[] | null;
+            /** Attributename */
+            attributeName?: string | null;
+            /** Thresholddirection */
+            thresholdDirection?: ("min" | "max") | null;
         };
         /**
          * TokenUsagePartialEventData
@@ -5523,6 +5574,39 @@ export interface operations {
             };
         };
     };
+    resume_benchmark_suite_api_v1_experiments_benchmark__benchmark_id__resume_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                benchmark_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Remaining benchmark runs launched as background task */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        operationId?: string;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     seed_strategies_api_v1_experiments_seed_post: {
         parameters: {
             query?: {
@@ -536,6 +536,7 @@ export type ExperimentStatus =
   | "cancelled";
 
 export type ExperimentProgressPhase =
+  | "queued"
   | "started"
   | "optimizing"
   | "evaluating"